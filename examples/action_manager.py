@@ -1,3 +1,4 @@
+import math
 from random import shuffle
 
 import numpy as np
@@ -8,6 +9,10 @@ from napari._qt.widgets.qt_viewer_buttons import QtViewerPushButton
 from napari.components import ViewerModel
 from napari.utils.action_manager import action_manager
 
+# the rotation angle is constant, so build the matrix once
+_c, _s = math.cos(math.pi / 4), math.sin(math.pi / 4)
+R45 = np.array([[_c, -_s], [_s, _c]])
+
 
 def rotate45(viewer: napari.Viewer):
     """
@@ -23,12 +28,8 @@ def rotate45(viewer: napari.Viewer):
     The `viewer` parameter needs to be named `viewer`, the action manager will
     infer that we need an instance of viewer.
     """
-    angle = np.pi / 4
-    from numpy import cos, sin
-
-    r = np.array([[cos(angle), -sin(angle)], [sin(angle), cos(angle)]])
     layer = viewer.layers[0]
-    layer.rotate = layer.rotate @ r
+    layer.rotate = layer.rotate @ R45
 
 
 # create the viewer with an image
@@ -20,13 +20,17 @@ pos = np.zeros((n, 2, 2), dtype=np.float32)
 phi_space = np.linspace(0, 4 * np.pi, n)
 radius_space = np.linspace(0, 100, n)
 
+# compute the trigonometric terms once and reuse them for every column
+x = radius_space * np.cos(phi_space)
+y = radius_space * np.sin(phi_space)
+
 # assign x-y position
-pos[:, 0, 0] = radius_space * np.cos(phi_space) + 300
-pos[:, 0, 1] = radius_space * np.sin(phi_space) + 256
+pos[:, 0, 0] = x + 300
+pos[:, 0, 1] = y + 256
 
 # assign x-y projection
-pos[:, 1, 0] = 2 * radius_space * np.cos(phi_space)
-pos[:, 1, 1] = 2 * radius_space * np.sin(phi_space)
+pos[:, 1, 0] = 2 * x
+pos[:, 1, 1] = 2 * y
 
 # make the angle property, range 0-2pi
 angle = np.mod(phi_space, 2 * np.pi)
@@ -27,13 +27,17 @@ pos = np.zeros((n, 2, 2), dtype=np.float32)
 phi_space = np.linspace(0, 4 * np.pi, n)
 radius_space = np.linspace(0, 20, n)
 
+# compute the trigonometric terms once and reuse them for every column
+x = radius_space * np.cos(phi_space)
+y = radius_space * np.sin(phi_space)
+
 # assign x-y position
-pos[:, 0, 0] = radius_space * np.cos(phi_space) + 64
-pos[:, 0, 1] = radius_space * np.sin(phi_space) + 64
+pos[:, 0, 0] = x + 64
+pos[:, 0, 1] = y + 64
 
 # assign x-y projection
-pos[:, 1, 0] = 2 * radius_space * np.cos(phi_space)
-pos[:, 1, 1] = 2 * radius_space * np.sin(phi_space)
+pos[:, 1, 0] = 2 * x
+pos[:, 1, 1] = 2 * y
 
 planes = np.round(np.linspace(0, 128, n)).astype(int)
 planes = np.concatenate(
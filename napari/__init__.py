@@ -1,3 +1,9 @@
+import os
+
+# set before any of the imports below, since sparse reads this variable
+# when it is first imported
+os.environ.setdefault('SPARSE_AUTO_DENSIFY', '1')
+
 try:
     from ._version import version as __version__
 except ImportError:
@@ -39,11 +45,6 @@ del _magicgui
 del stats
 
 
-import os
-
-os.environ.setdefault('SPARSE_AUTO_DENSIFY', '1')
-
-
 __all__ = [
     'Viewer',
     'save_layers',
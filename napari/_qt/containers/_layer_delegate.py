@@ -39,7 +39,6 @@ from typing import TYPE_CHECKING
 
 from qtpy import QtCore
 from qtpy.QtCore import QSize, Qt
-from qtpy.QtGui import QPixmap
 from qtpy.QtWidgets import QStyledItemDelegate
 
 from ..qt_resources import QColoredSVGIcon
@@ -111,7 +110,9 @@ class LayerDelegate(QStyledItemDelegate):
         thumb_rect.setWidth(h)
         thumb_rect.setHeight(h)
         image = index.data(ThumbnailRole)
-        painter.drawPixmap(thumb_rect, QPixmap.fromImage(image))
+        # draw the QImage directly; converting it to a QPixmap first would
+        # allocate and copy a new pixmap on every repaint of the item
+        painter.drawImage(thumb_rect, image)
 
     def createEditor(
         self,
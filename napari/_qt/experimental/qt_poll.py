@@ -124,7 +124,7 @@ class IntervalTimer:
     @property
     def elapsed_ms(self) -> float:
         """The elapsed time since the last call to this property."""
-        now = time.time()
+        now = time.perf_counter()
         elapsed_seconds = 0 if self._last is None else now - self._last
         self._last = now
         return elapsed_seconds * 1000
@@ -55,9 +55,13 @@ class QtBaseImageControls(QtLayerControls):
         comboBox = QtColormapComboBox(self)
         comboBox.setObjectName("colormapComboBox")
         comboBox._allitems = set(self.layer.colormaps)
+        # map colormap names to combobox indices, to avoid a linear
+        # findData search on every colormap change
+        self._colormap_index = {}
 
         for name, cm in AVAILABLE_COLORMAPS.items():
             if name in self.layer.colormaps:
+                self._colormap_index[name] = comboBox.count()
                 comboBox.addItem(cm._display_name, name)
 
         comboBox.activated[str].connect(self.changeColor)
@@ -137,19 +141,27 @@ class QtBaseImageControls(QtLayerControls):
         event : napari.utils.event.Event, optional
             The napari event that triggered this method, by default None.
         """
-        with qt_signals_blocked(self.contrastLimitsSlider):
-            self.contrastLimitsSlider.setRange(
-                self.layer.contrast_limits_range
-            )
-            self.contrastLimitsSlider.setValues(self.layer.contrast_limits)
+        # both properties return a fresh list on each access, so read them
+        # once and share the values between the inline and popup sliders
+        clims = self.layer.contrast_limits
+        clim_range = self.layer.contrast_limits_range
+        # skip the slider repaint when it already shows these values, e.g.
+        # when the change came from dragging the slider itself
+        slider = self.contrastLimitsSlider
+        if (
+            tuple(clim_range) != slider.range()
+            or tuple(clims) != slider.values()
+        ):
+            with qt_signals_blocked(slider):
+                slider.setRange(clim_range)
+                slider.setValues(clims)
 
         # clim_popup will throw an AttributeError if not yet created
         # and a RuntimeError if it has already been cleaned up.
         # we only want to update the slider if it's active
         with suppress(AttributeError, RuntimeError):
-            self.clim_pop.slider.setRange(self.layer.contrast_limits_range)
+            self.clim_pop.slider.setRange(clim_range)
             with qt_signals_blocked(self.clim_pop.slider):
-                clims = self.layer.contrast_limits
                 self.clim_pop.slider.setValues(clims)
                 self.clim_pop._on_values_change(clims)
 
@@ -166,10 +178,11 @@ class QtBaseImageControls(QtLayerControls):
             cm = AVAILABLE_COLORMAPS.get(name)
             if cm:
                 self.colormapComboBox._allitems.add(name)
+                self._colormap_index[name] = self.colormapComboBox.count()
                 self.colormapComboBox.addItem(cm._display_name, name)
 
         if name != self.colormapComboBox.currentData():
-            index = self.colormapComboBox.findData(name)
+            index = self._colormap_index.get(name, -1)
             self.colormapComboBox.setCurrentIndex(index)
 
         # Note that QImage expects the image width followed by height
@@ -201,8 +214,11 @@ class QtBaseImageControls(QtLayerControls):
         event : napari.utils.event.Event, optional
             The napari event that triggered this method, by default None.
         """
+        value = int(self.layer.gamma * 100)
+        if self.gammaSlider.value() == value:
+            return
         with qt_signals_blocked(self.gammaSlider):
-            self.gammaSlider.setValue(int(self.layer.gamma * 100))
+            self.gammaSlider.setValue(value)
 
     def closeEvent(self, event):
         self.deleteLater()
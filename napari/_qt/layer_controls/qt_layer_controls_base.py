@@ -56,9 +56,13 @@ class QtLayerControls(QFrame):
         self._on_opacity_change()
 
         blend_comboBox = QComboBox(self)
+        # map blending values to combobox indices, to avoid a linear
+        # findData search on every blending change
+        self._blend_index = {}
         for index, (data, text) in enumerate(BLENDING_TRANSLATIONS.items()):
             data = data.value
             blend_comboBox.addItem(text, data)
+            self._blend_index[data] = index
             if data == self.layer.blending:
                 blend_comboBox.setCurrentIndex(index)
 
@@ -95,8 +99,11 @@ class QtLayerControls(QFrame):
         event : napari.utils.event.Event, optional
             The napari event that triggered this method, by default None.
         """
+        value = int(self.layer.opacity * 100)
+        if self.opacitySlider.value() == value:
+            return
         with self.layer.events.opacity.blocker():
-            self.opacitySlider.setValue(int(self.layer.opacity * 100))
+            self.opacitySlider.setValue(value)
 
     def _on_blending_change(self, event=None):
         """Receive layer model blending mode change event and update slider.
@@ -106,10 +113,11 @@ class QtLayerControls(QFrame):
         event : napari.utils.event.Event, optional
             The napari event that triggered this method, by default None.
         """
+        index = self._blend_index.get(self.layer.blending, -1)
+        if self.blendComboBox.currentIndex() == index:
+            return
         with self.layer.events.blending.blocker():
-            self.blendComboBox.setCurrentIndex(
-                self.blendComboBox.findData(self.layer.blending)
-            )
+            self.blendComboBox.setCurrentIndex(index)
 
     def close(self):
         """Disconnect events when widget is closing."""
@@ -1,6 +1,6 @@
 import numpy as np
 from qtpy.QtCore import Qt
-from qtpy.QtWidgets import QComboBox, QDoubleSpinBox, QLabel
+from qtpy.QtWidgets import QComboBox, QDoubleSpinBox, QLabel, QStackedWidget
 
 from ...layers.utils._color_manager_constants import ColorMode
 from ...utils.translations import trans
@@ -8,6 +8,10 @@ from ..utils import qt_signals_blocked
 from ..widgets.qt_color_swatch import QColorSwatchEdit
 from .qt_layer_controls_base import QtLayerControls
 
+# the edge color mode dropdown items, and their indices in the dropdown
+_COLOR_MODES = tuple(mode.value for mode in ColorMode)
+_COLOR_MODE_INDEX = {mode: index for index, mode in enumerate(ColorMode)}
+
 
 class QtVectorsControls(QtLayerControls):
     """Qt view and controls for the napari Vectors layer.
@@ -27,8 +31,9 @@ class QtVectorsControls(QtLayerControls):
         Dropdown widget to select display color for vectors.
     color_mode_comboBox : qtpy.QtWidgets.QComboBox
         Dropdown widget to select edge_color_mode for the vectors.
-    color_prop_box : qtpy.QtWidgets.QComboBox
+    color_prop_box : qtpy.QtWidgets.QComboBox or None
         Dropdown widget to select _edge_color_property for the vectors.
+        Only created once the edge color mode is 'cycle' or 'colormap'.
     edge_prop_label : qtpy.QtWidgets.QLabel
         Label for color_prop_box
     grid_layout : qtpy.QtWidgets.QGridLayout
@@ -52,12 +57,9 @@ class QtVectorsControls(QtLayerControls):
         )
         self.layer.events.edge_color.connect(self._on_edge_color_change)
 
-        # dropdown to select the property for mapping edge_color
-        color_properties = self._get_property_values()
-        color_prop_box = QComboBox(self)
-        color_prop_box.activated[str].connect(self.change_edge_color_property)
-        color_prop_box.addItems(color_properties)
-        self.color_prop_box = color_prop_box
+        # dropdown to select the property for mapping edge_color, only built
+        # once a colormap or cycle edge color mode is used
+        self.color_prop_box = None
         self.edge_prop_label = QLabel(trans._('edge property:'))
 
         # vector direct color mode adjustment and widget
@@ -69,12 +71,19 @@ class QtVectorsControls(QtLayerControls):
         )
         self.edgeColorEdit.color_changed.connect(self.change_edge_color_direct)
         self.edge_color_label = QLabel(trans._('edge color:'))
+
+        # the direct color and property widgets are mutually exclusive, so
+        # they share a row and are switched without relayouting the grid
+        self._color_label_stack = QStackedWidget(self)
+        self._color_label_stack.addWidget(self.edge_color_label)
+        self._color_label_stack.addWidget(self.edge_prop_label)
+        self._color_stack = QStackedWidget(self)
+        self._color_stack.addWidget(self.edgeColorEdit)
         self._on_edge_color_change()
 
         # dropdown to select the edge color mode
         colorModeComboBox = QComboBox(self)
-        color_modes = [e.value for e in ColorMode]
-        colorModeComboBox.addItems(color_modes)
+        colorModeComboBox.addItems(_COLOR_MODES)
         colorModeComboBox.activated[str].connect(self.change_edge_color_mode)
         self.color_mode_comboBox = colorModeComboBox
         self._on_edge_color_mode_change()
@@ -107,11 +116,9 @@ class QtVectorsControls(QtLayerControls):
         self.grid_layout.addWidget(self.blendComboBox, 3, 1, 1, 2)
         self.grid_layout.addWidget(QLabel(trans._('edge color mode:')), 4, 0)
         self.grid_layout.addWidget(self.color_mode_comboBox, 4, 1, 1, 2)
-        self.grid_layout.addWidget(self.edge_color_label, 5, 0)
-        self.grid_layout.addWidget(self.edgeColorEdit, 5, 1, 1, 2)
-        self.grid_layout.addWidget(self.edge_prop_label, 6, 0)
-        self.grid_layout.addWidget(self.color_prop_box, 6, 1, 1, 2)
-        self.grid_layout.setRowStretch(7, 1)
+        self.grid_layout.addWidget(self._color_label_stack, 5, 0)
+        self.grid_layout.addWidget(self._color_stack, 5, 1, 1, 2)
+        self.grid_layout.setRowStretch(6, 1)
         self.grid_layout.setColumnStretch(1, 1)
         self.grid_layout.setSpacing(4)
 
@@ -199,33 +206,33 @@ class QtVectorsControls(QtLayerControls):
             The new edge_color mode the GUI needs to be updated for.
             Should be: 'direct', 'cycle', 'colormap'
         """
-        if mode in ('cycle', 'colormap'):
-            self.edgeColorEdit.setHidden(True)
-            self.edge_color_label.setHidden(True)
-            self.color_prop_box.setHidden(False)
-            self.edge_prop_label.setHidden(False)
-
-        elif mode == 'direct':
-            self.edgeColorEdit.setHidden(False)
-            self.edge_color_label.setHidden(False)
-            self.color_prop_box.setHidden(True)
-            self.edge_prop_label.setHidden(True)
+        index = 0 if mode == 'direct' else 1
+        if index and self.color_prop_box is None:
+            self._build_color_prop_box()
+        self._color_label_stack.setCurrentIndex(index)
+        self._color_stack.setCurrentIndex(index)
+
+    def _build_color_prop_box(self):
+        """Create the dropdown to select the property edge_color maps to."""
+        color_prop_box = QComboBox(self)
+        color_prop_box.activated[str].connect(self.change_edge_color_property)
+        color_prop_box.addItems(self._get_property_values())
+        self.color_prop_box = color_prop_box
+        self._color_stack.addWidget(color_prop_box)
 
     def _get_property_values(self):
         """Get the current property values from the Vectors layer
 
         Returns
         -------
-        property_values : np.ndarray
-            array of all of the union of the property names (keys)
+        property_values : list of str
+            sorted union of the property names (keys)
             in Vectors.properties and Vectors._property_choices
 
         """
-        property_choices = [*self.layer._property_choices]
-        properties = [*self.layer.properties]
-        property_values = np.union1d(property_choices, properties)
-
-        return property_values
+        return sorted(
+            set(self.layer._property_choices).union(self.layer.properties)
+        )
 
     def _on_length_change(self, event=None):
         """Change length of vectors.
@@ -259,9 +266,7 @@ class QtVectorsControls(QtLayerControls):
         """
         with qt_signals_blocked(self.color_mode_comboBox):
             mode = self.layer._edge.color_mode
-            index = self.color_mode_comboBox.findText(
-                mode, Qt.MatchFixedString
-            )
+            index = _COLOR_MODE_INDEX.get(ColorMode(mode), -1)
             self.color_mode_comboBox.setCurrentIndex(index)
 
             self._update_edge_color_gui(mode)
@@ -281,6 +286,8 @@ class QtVectorsControls(QtLayerControls):
             ColorMode.CYCLE,
             ColorMode.COLORMAP,
         ):
+            if self.color_prop_box is None:
+                self._build_color_prop_box()
             with qt_signals_blocked(self.color_prop_box):
                 prop = self.layer._edge.color_properties.name
                 index = self.color_prop_box.findText(prop, Qt.MatchFixedString)
@@ -69,7 +69,7 @@ class QtPerformance(QWidget):
     timer_label : QLabel
         We write the current "uptime" into this label.
     timer : QTimer
-        To update our window every UPDATE_MS.
+        To update our window every UPDATE_MS while it is visible.
     """
 
     # We log events slower than some threshold (in milliseconds).
@@ -97,7 +97,7 @@ class QtPerformance(QWidget):
         layout = QVBoxLayout()
 
         # For our "uptime" timer.
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
 
         # Label for our progress bar.
         bar_label = QLabel(trans._("Draw Time:"))
@@ -139,11 +139,21 @@ class QtPerformance(QWidget):
 
         self.setLayout(layout)
 
-        # Update us with a timer.
+        # Update us with a timer. The timer only runs while we are visible,
+        # see showEvent() and hideEvent().
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.update)
         self.timer.setInterval(self.UPDATE_MS)
+
+    def showEvent(self, event):
+        """Start updating when the widget is shown."""
         self.timer.start()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        """Stop updating while the widget is hidden."""
+        self.timer.stop()
+        super().hideEvent(event)
 
     def _change_thresh(self, text):
         """Threshold combo box change."""
@@ -174,7 +184,7 @@ class QtPerformance(QWidget):
     def update(self):
         """Update our label and progress bar and log any new slow events."""
         # Update our timer label.
-        elapsed = time.time() - self.start_time
+        elapsed = time.perf_counter() - self.start_time
         self.timer_label.setText(
             trans._("Uptime: {elapsed:.2f}", elapsed=elapsed)
         )
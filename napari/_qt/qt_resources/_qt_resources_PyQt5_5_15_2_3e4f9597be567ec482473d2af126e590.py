@@ -0,0 +1,15618 @@
+# -*- coding: utf-8 -*-
+
+# Resource object code
+#
+# Created by: The Resource Compiler for qtpy (Qt v5.15.2)
+#
+# WARNING! All changes made in this file will be lost!
+
+from qtpy import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x01\xc4\
+\x3c\
+\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\x31\
+\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\x72\x5f\x31\x22\x20\x0a\
+\x20\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x0a\x20\x20\x20\x20\x78\x6d\x6c\x6e\
+\x73\x3a\x78\x6c\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\
+\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\
+\x78\x6c\x69\x6e\x6b\x22\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\
+\x30\x20\x30\x20\x31\x32\x20\x31\x36\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\
+\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x20\x20\x20\
+\x20\x3c\x67\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x31\x32\x20\x35\x6c\x2d\x38\x20\x38\
+\x2d\x34\x2d\x34\x20\x31\x2e\x35\x2d\x31\x2e\x35\x4c\x34\x20\x31\
+\x30\x6c\x36\x2e\x35\x2d\x36\x2e\x35\x4c\x31\x32\x20\x35\x7a\x22\
+\x2f\x3e\x0a\x20\x20\x20\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\
+\x67\x3e\x0a\
+\x00\x00\x02\x9e\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x38\
+\x30\x2e\x36\x32\x6d\x6d\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\
+\x31\x38\x30\x2e\x36\x32\x6d\x6d\x22\x20\x76\x69\x65\x77\x42\x6f\
+\x78\x3d\x22\x30\x20\x30\x20\x35\x31\x32\x20\x35\x31\x32\x22\x3e\
+\x3c\x73\x74\x79\x6c\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\
+\x74\x2f\x63\x73\x73\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\
+\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\
+\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\
+\x20\x31\x3b\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\
+\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\
+\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\
+\x20\x31\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\
+\x6c\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\
+\x20\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\
+\x31\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\
+\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\
+\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\
+\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x20\x20\x3c\x74\x69\x74\
+\x6c\x65\x3e\x41\x72\x74\x62\x6f\x61\x72\x64\x20\x31\x3c\x2f\x74\
+\x69\x74\x6c\x65\x3e\x0a\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\
+\x22\x4d\x34\x32\x34\x2e\x39\x34\x2c\x32\x37\x31\x2e\x33\x36\x61\
+\x33\x35\x2e\x33\x34\x2c\x33\x35\x2e\x33\x34\x2c\x30\x2c\x30\x2c\
+\x30\x2c\x30\x2d\x35\x30\x4c\x33\x30\x37\x2e\x31\x35\x2c\x31\x30\
+\x33\x2e\x36\x61\x33\x35\x2e\x33\x32\x2c\x33\x35\x2e\x33\x32\x2c\
+\x30\x2c\x30\x2c\x30\x2d\x35\x30\x2c\x30\x4c\x36\x38\x2e\x37\x32\
+\x2c\x32\x39\x32\x2e\x30\x36\x61\x33\x35\x2e\x33\x33\x2c\x33\x35\
+\x2e\x33\x33\x2c\x30\x2c\x30\x2c\x30\x2c\x30\x2c\x35\x30\x6c\x37\
+\x30\x2e\x36\x37\x2c\x37\x30\x2e\x36\x37\x61\x33\x35\x2e\x33\x34\
+\x2c\x33\x35\x2e\x33\x34\x2c\x30\x2c\x30\x2c\x30\x2c\x32\x35\x2c\
+\x31\x30\x2e\x33\x35\x48\x34\x32\x36\x2e\x34\x36\x61\x38\x2e\x38\
+\x33\x2c\x38\x2e\x38\x33\x2c\x30\x2c\x30\x2c\x30\x2c\x38\x2e\x38\
+\x33\x2d\x38\x2e\x38\x33\x56\x33\x39\x38\x2e\x31\x37\x63\x30\x2d\
+\x34\x2e\x38\x38\x2d\x34\x2d\x35\x2e\x38\x39\x2d\x38\x2e\x38\x33\
+\x2d\x35\x2e\x38\x39\x48\x33\x30\x32\x2e\x36\x39\x4c\x34\x32\x34\
+\x2e\x39\x34\x2c\x32\x37\x31\x2e\x33\x36\x5a\x4d\x32\x30\x35\x2e\
+\x31\x2c\x31\x39\x38\x2e\x37\x35\x2c\x33\x32\x37\x2e\x32\x39\x2c\
+\x33\x32\x33\x2e\x38\x31\x6c\x2d\x36\x38\x2e\x34\x37\x2c\x36\x38\
+\x2e\x34\x37\x48\x31\x35\x39\x2e\x36\x39\x4c\x38\x39\x2c\x33\x31\
+\x34\x2e\x38\x33\x2c\x32\x30\x35\x2e\x31\x2c\x31\x39\x38\x2e\x37\
+\x35\x5a\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x03\x7b\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\
+\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x35\
+\x30\x2e\x35\x2c\x37\x37\x2e\x33\x43\x32\x36\x2e\x37\x2c\x37\x37\
+\x2e\x33\x2c\x38\x2e\x31\x2c\x35\x32\x2e\x31\x2c\x37\x2e\x33\x2c\
+\x35\x31\x4c\x36\x2c\x34\x39\x2e\x32\x6c\x31\x2e\x33\x2d\x31\x2e\
+\x38\x43\x38\x2e\x31\x2c\x34\x36\x2e\x33\x2c\x32\x36\x2e\x37\x2c\
+\x32\x31\x2c\x35\x30\x2e\x35\x2c\x32\x31\x73\x34\x32\x2e\x34\x2c\
+\x32\x35\x2e\x33\x2c\x34\x33\x2e\x32\x2c\x32\x36\x2e\x33\x6c\x31\
+\x2e\x33\x2c\x31\x2e\x38\x4c\x39\x33\x2e\x37\x2c\x35\x31\x0a\x09\
+\x43\x39\x32\x2e\x39\x2c\x35\x32\x2e\x31\x2c\x37\x34\x2e\x33\x2c\
+\x37\x37\x2e\x33\x2c\x35\x30\x2e\x35\x2c\x37\x37\x2e\x33\x7a\x20\
+\x4d\x31\x33\x2e\x38\x2c\x34\x39\x2e\x32\x63\x34\x2e\x36\x2c\x35\
+\x2e\x36\x2c\x31\x39\x2e\x35\x2c\x32\x31\x2e\x39\x2c\x33\x36\x2e\
+\x37\x2c\x32\x31\x2e\x39\x73\x33\x32\x2e\x31\x2d\x31\x36\x2e\x34\
+\x2c\x33\x36\x2e\x37\x2d\x32\x31\x2e\x39\x63\x2d\x34\x2e\x36\x2d\
+\x35\x2e\x36\x2d\x31\x39\x2e\x35\x2d\x32\x31\x2e\x39\x2d\x33\x36\
+\x2e\x37\x2d\x32\x31\x2e\x39\x0a\x09\x43\x33\x33\x2e\x33\x2c\x32\
+\x37\x2e\x32\x2c\x31\x38\x2e\x34\x2c\x34\x33\x2e\x36\x2c\x31\x33\
+\x2e\x38\x2c\x34\x39\x2e\x32\x7a\x22\x2f\x3e\x0a\x3c\x63\x69\x72\
+\x63\x6c\x65\x20\x63\x78\x3d\x22\x35\x30\x2e\x35\x22\x20\x63\x79\
+\x3d\x22\x34\x39\x2e\x32\x22\x20\x72\x3d\x22\x31\x37\x2e\x33\x22\
+\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x02\xb8\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\
+\x30\x20\x30\x20\x35\x31\x32\x20\x35\x31\x32\x22\x3e\x3c\x73\x74\
+\x79\x6c\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\
+\x73\x73\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\
+\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\
+\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\
+\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\
+\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\
+\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\
+\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\
+\x73\x74\x79\x6c\x65\x3e\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\
+\x32\x35\x36\x20\x38\x43\x31\x31\x39\x2e\x30\x34\x33\x20\x38\x20\
+\x38\x20\x31\x31\x39\x2e\x30\x38\x33\x20\x38\x20\x32\x35\x36\x63\
+\x30\x20\x31\x33\x36\x2e\x39\x39\x37\x20\x31\x31\x31\x2e\x30\x34\
+\x33\x20\x32\x34\x38\x20\x32\x34\x38\x20\x32\x34\x38\x73\x32\x34\
+\x38\x2d\x31\x31\x31\x2e\x30\x30\x33\x20\x32\x34\x38\x2d\x32\x34\
+\x38\x43\x35\x30\x34\x20\x31\x31\x39\x2e\x30\x38\x33\x20\x33\x39\
+\x32\x2e\x39\x35\x37\x20\x38\x20\x32\x35\x36\x20\x38\x7a\x6d\x30\
+\x20\x31\x31\x30\x63\x32\x33\x2e\x31\x39\x36\x20\x30\x20\x34\x32\
+\x20\x31\x38\x2e\x38\x30\x34\x20\x34\x32\x20\x34\x32\x73\x2d\x31\
+\x38\x2e\x38\x30\x34\x20\x34\x32\x2d\x34\x32\x20\x34\x32\x2d\x34\
+\x32\x2d\x31\x38\x2e\x38\x30\x34\x2d\x34\x32\x2d\x34\x32\x20\x31\
+\x38\x2e\x38\x30\x34\x2d\x34\x32\x20\x34\x32\x2d\x34\x32\x7a\x6d\
+\x35\x36\x20\x32\x35\x34\x63\x30\x20\x36\x2e\x36\x32\x37\x2d\x35\
+\x2e\x33\x37\x33\x20\x31\x32\x2d\x31\x32\x20\x31\x32\x68\x2d\x38\
+\x38\x63\x2d\x36\x2e\x36\x32\x37\x20\x30\x2d\x31\x32\x2d\x35\x2e\
+\x33\x37\x33\x2d\x31\x32\x2d\x31\x32\x76\x2d\x32\x34\x63\x30\x2d\
+\x36\x2e\x36\x32\x37\x20\x35\x2e\x33\x37\x33\x2d\x31\x32\x20\x31\
+\x32\x2d\x31\x32\x68\x31\x32\x76\x2d\x36\x34\x68\x2d\x31\x32\x63\
+\x2d\x36\x2e\x36\x32\x37\x20\x30\x2d\x31\x32\x2d\x35\x2e\x33\x37\
+\x33\x2d\x31\x32\x2d\x31\x32\x76\x2d\x32\x34\x63\x30\x2d\x36\x2e\
+\x36\x32\x37\x20\x35\x2e\x33\x37\x33\x2d\x31\x32\x20\x31\x32\x2d\
+\x31\x32\x68\x36\x34\x63\x36\x2e\x36\x32\x37\x20\x30\x20\x31\x32\
+\x20\x35\x2e\x33\x37\x33\x20\x31\x32\x20\x31\x32\x76\x31\x30\x30\
+\x68\x31\x32\x63\x36\x2e\x36\x32\x37\x20\x30\x20\x31\x32\x20\x35\
+\x2e\x33\x37\x33\x20\x31\x32\x20\x31\x32\x76\x32\x34\x7a\x22\x2f\
+\x3e\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x02\xe9\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\
+\x30\x20\x30\x20\x35\x37\x36\x20\x35\x31\x32\x22\x3e\x3c\x73\x74\
+\x79\x6c\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\
+\x73\x73\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x35\x35\x2c\x20\x31\x38\x2c\x20\x33\x31\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x35\x35\x2c\x20\x31\x38\x2c\x20\x33\x31\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\
+\x72\x67\x62\x28\x32\x35\x35\x2c\x20\x31\x38\x2c\x20\x33\x31\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\x7d\
+\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\
+\x28\x32\x35\x35\x2c\x20\x31\x38\x2c\x20\x33\x31\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\x7d\x0a\x3c\x2f\
+\x73\x74\x79\x6c\x65\x3e\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\
+\x35\x36\x39\x2e\x35\x31\x37\x20\x34\x34\x30\x2e\x30\x31\x33\x43\
+\x35\x38\x37\x2e\x39\x37\x35\x20\x34\x37\x32\x2e\x30\x30\x37\x20\
+\x35\x36\x34\x2e\x38\x30\x36\x20\x35\x31\x32\x20\x35\x32\x37\x2e\
+\x39\x34\x20\x35\x31\x32\x48\x34\x38\x2e\x30\x35\x34\x63\x2d\x33\
+\x36\x2e\x39\x33\x37\x20\x30\x2d\x35\x39\x2e\x39\x39\x39\x2d\x34\
+\x30\x2e\x30\x35\x35\x2d\x34\x31\x2e\x35\x37\x37\x2d\x37\x31\x2e\
+\x39\x38\x37\x4c\x32\x34\x36\x2e\x34\x32\x33\x20\x32\x33\x2e\x39\
+\x38\x35\x63\x31\x38\x2e\x34\x36\x37\x2d\x33\x32\x2e\x30\x30\x39\
+\x20\x36\x34\x2e\x37\x32\x2d\x33\x31\x2e\x39\x35\x31\x20\x38\x33\
+\x2e\x31\x35\x34\x20\x30\x6c\x32\x33\x39\x2e\x39\x34\x20\x34\x31\
+\x36\x2e\x30\x32\x38\x7a\x4d\x32\x38\x38\x20\x33\x35\x34\x63\x2d\
+\x32\x35\x2e\x34\x30\x35\x20\x30\x2d\x34\x36\x20\x32\x30\x2e\x35\
+\x39\x35\x2d\x34\x36\x20\x34\x36\x73\x32\x30\x2e\x35\x39\x35\x20\
+\x34\x36\x20\x34\x36\x20\x34\x36\x20\x34\x36\x2d\x32\x30\x2e\x35\
+\x39\x35\x20\x34\x36\x2d\x34\x36\x2d\x32\x30\x2e\x35\x39\x35\x2d\
+\x34\x36\x2d\x34\x36\x2d\x34\x36\x7a\x6d\x2d\x34\x33\x2e\x36\x37\
+\x33\x2d\x31\x36\x35\x2e\x33\x34\x36\x6c\x37\x2e\x34\x31\x38\x20\
+\x31\x33\x36\x63\x2e\x33\x34\x37\x20\x36\x2e\x33\x36\x34\x20\x35\
+\x2e\x36\x30\x39\x20\x31\x31\x2e\x33\x34\x36\x20\x31\x31\x2e\x39\
+\x38\x32\x20\x31\x31\x2e\x33\x34\x36\x68\x34\x38\x2e\x35\x34\x36\
+\x63\x36\x2e\x33\x37\x33\x20\x30\x20\x31\x31\x2e\x36\x33\x35\x2d\
+\x34\x2e\x39\x38\x32\x20\x31\x31\x2e\x39\x38\x32\x2d\x31\x31\x2e\
+\x33\x34\x36\x6c\x37\x2e\x34\x31\x38\x2d\x31\x33\x36\x63\x2e\x33\
+\x37\x35\x2d\x36\x2e\x38\x37\x34\x2d\x35\x2e\x30\x39\x38\x2d\x31\
+\x32\x2e\x36\x35\x34\x2d\x31\x31\x2e\x39\x38\x32\x2d\x31\x32\x2e\
+\x36\x35\x34\x68\x2d\x36\x33\x2e\x33\x38\x33\x63\x2d\x36\x2e\x38\
+\x38\x34\x20\x30\x2d\x31\x32\x2e\x33\x35\x36\x20\x35\x2e\x37\x38\
+\x2d\x31\x31\x2e\x39\x38\x31\x20\x31\x32\x2e\x36\x35\x34\x7a\x22\
+\x2f\x3e\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x03\x2c\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\
+\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x72\x65\
+\x63\x74\x20\x78\x3d\x22\x34\x35\x22\x20\x79\x3d\x22\x32\x31\x2e\
+\x33\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\
+\x74\x72\x69\x78\x28\x30\x2e\x37\x31\x31\x32\x20\x2d\x30\x2e\x37\
+\x30\x32\x39\x20\x30\x2e\x37\x30\x32\x39\x20\x30\x2e\x37\x31\x31\
+\x32\x20\x2d\x32\x31\x2e\x36\x37\x39\x31\x20\x35\x30\x2e\x30\x32\
+\x34\x29\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x22\x20\x68\
+\x65\x69\x67\x68\x74\x3d\x22\x36\x30\x2e\x32\x22\x2f\x3e\x0a\x3c\
+\x72\x65\x63\x74\x20\x78\x3d\x22\x31\x39\x2e\x39\x22\x20\x79\x3d\
+\x22\x34\x36\x2e\x34\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\
+\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\x30\x2e\x37\x31\x31\x33\x20\
+\x2d\x30\x2e\x37\x30\x32\x39\x20\x30\x2e\x37\x30\x32\x39\x20\x30\
+\x2e\x37\x31\x31\x33\x20\x2d\x32\x31\x2e\x37\x32\x38\x34\x20\x34\
+\x39\x2e\x39\x39\x38\x38\x29\x22\x20\x77\x69\x64\x74\x68\x3d\x22\
+\x36\x30\x2e\x32\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\
+\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x01\xa9\
+\x3c\
+\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\x31\
+\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\x72\x5f\x31\x22\x20\x0a\
+\x20\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x0a\x20\x20\x20\x20\x78\x6d\x6c\x6e\
+\x73\x3a\x78\x6c\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\
+\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\
+\x78\x6c\x69\x6e\x6b\x22\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\
+\x30\x20\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x3e\x3c\x73\x74\
+\x79\x6c\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\
+\x73\x73\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\
+\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\
+\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\
+\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\
+\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\
+\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\
+\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\
+\x73\x74\x79\x6c\x65\x3e\x0a\x20\x20\x20\x20\x3c\x67\x3e\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\
+\x78\x3d\x22\x35\x30\x22\x20\x63\x79\x3d\x22\x35\x30\x22\x20\x72\
+\x3d\x22\x35\x30\x22\x2f\x3e\x0a\x20\x20\x20\x20\x3c\x2f\x67\x3e\
+\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x03\x83\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x36\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\
+\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x67\x3e\
+\x0a\x09\x3c\x67\x20\x69\x64\x3d\x22\x72\x65\x70\x6c\x79\x22\x3e\
+\x0a\x09\x09\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x36\x38\x2e\
+\x38\x2c\x31\x35\x2e\x37\x6c\x33\x2e\x34\x2d\x38\x2e\x38\x6c\x2d\
+\x32\x31\x2e\x34\x2c\x39\x2e\x36\x6c\x39\x2e\x36\x2c\x32\x31\x2e\
+\x34\x6c\x33\x2e\x35\x2d\x39\x2e\x31\x63\x31\x31\x2e\x31\x2c\x34\
+\x2e\x32\x2c\x31\x37\x2e\x34\x2c\x31\x30\x2e\x37\x2c\x32\x30\x2c\
+\x32\x30\x2e\x36\x43\x38\x35\x2e\x39\x2c\x33\x37\x2e\x34\x2c\x38\
+\x33\x2e\x35\x2c\x32\x33\x2e\x38\x2c\x36\x38\x2e\x38\x2c\x31\x35\
+\x2e\x37\x7a\x22\x2f\x3e\x0a\x09\x3c\x2f\x67\x3e\x0a\x3c\x2f\x67\
+\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x35\x32\x2c\x39\
+\x31\x2e\x39\x48\x31\x37\x2e\x35\x63\x2d\x34\x2e\x39\x2c\x30\x2d\
+\x38\x2e\x37\x2d\x33\x2e\x38\x2d\x38\x2e\x37\x2d\x38\x2e\x37\x56\
+\x34\x38\x2e\x36\x63\x30\x2d\x34\x2e\x39\x2c\x33\x2e\x38\x2d\x38\
+\x2e\x37\x2c\x38\x2e\x37\x2d\x38\x2e\x37\x68\x33\x34\x2e\x34\x63\
+\x34\x2e\x39\x2c\x30\x2c\x38\x2e\x37\x2c\x33\x2e\x38\x2c\x38\x2e\
+\x37\x2c\x38\x2e\x37\x76\x33\x34\x2e\x34\x0a\x09\x43\x36\x30\x2e\
+\x37\x2c\x38\x38\x2c\x35\x36\x2e\x39\x2c\x39\x31\x2e\x39\x2c\x35\
+\x32\x2c\x39\x31\x2e\x39\x7a\x20\x4d\x31\x39\x2e\x33\x2c\x38\x31\
+\x2e\x33\x68\x33\x30\x2e\x39\x56\x35\x30\x2e\x34\x48\x31\x39\x2e\
+\x33\x56\x38\x31\x2e\x33\x7a\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\
+\x3e\x0a\
+\x00\x00\x03\x7b\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x36\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\
+\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x67\x3e\x0a\x09\x3c\x67\x20\x69\x64\x3d\
+\x22\x72\x65\x70\x6c\x79\x22\x3e\x0a\x09\x09\x3c\x70\x61\x74\x68\
+\x20\x64\x3d\x22\x4d\x36\x38\x2e\x38\x2c\x31\x35\x2e\x37\x6c\x33\
+\x2e\x34\x2d\x38\x2e\x38\x6c\x2d\x32\x31\x2e\x34\x2c\x39\x2e\x36\
+\x6c\x39\x2e\x36\x2c\x32\x31\x2e\x34\x6c\x33\x2e\x35\x2d\x39\x2e\
+\x31\x63\x31\x31\x2e\x31\x2c\x34\x2e\x32\x2c\x31\x37\x2e\x34\x2c\
+\x31\x30\x2e\x37\x2c\x32\x30\x2c\x32\x30\x2e\x36\x43\x38\x35\x2e\
+\x39\x2c\x33\x37\x2e\x34\x2c\x38\x33\x2e\x35\x2c\x32\x33\x2e\x38\
+\x2c\x36\x38\x2e\x38\x2c\x31\x35\x2e\x37\x7a\x22\x2f\x3e\x0a\x09\
+\x3c\x2f\x67\x3e\x0a\x3c\x2f\x67\x3e\x0a\x3c\x70\x61\x74\x68\x20\
+\x64\x3d\x22\x4d\x35\x32\x2c\x39\x31\x2e\x39\x48\x31\x37\x2e\x35\
+\x63\x2d\x34\x2e\x39\x2c\x30\x2d\x38\x2e\x37\x2d\x33\x2e\x38\x2d\
+\x38\x2e\x37\x2d\x38\x2e\x37\x56\x34\x38\x2e\x36\x63\x30\x2d\x34\
+\x2e\x39\x2c\x33\x2e\x38\x2d\x38\x2e\x37\x2c\x38\x2e\x37\x2d\x38\
+\x2e\x37\x68\x33\x34\x2e\x34\x63\x34\x2e\x39\x2c\x30\x2c\x38\x2e\
+\x37\x2c\x33\x2e\x38\x2c\x38\x2e\x37\x2c\x38\x2e\x37\x76\x33\x34\
+\x2e\x34\x0a\x09\x43\x36\x30\x2e\x37\x2c\x38\x38\x2c\x35\x36\x2e\
+\x39\x2c\x39\x31\x2e\x39\x2c\x35\x32\x2c\x39\x31\x2e\x39\x7a\x20\
+\x4d\x31\x39\x2e\x33\x2c\x38\x31\x2e\x33\x68\x33\x30\x2e\x39\x56\
+\x35\x30\x2e\x34\x48\x31\x39\x2e\x33\x56\x38\x31\x2e\x33\x7a\x22\
+\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x02\xe9\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x32\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x37\x37\x2e\x36\x20\x39\x34\x2e\x38\x22\x20\x73\x74\
+\x79\x6c\x65\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\
+\x67\x72\x6f\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\
+\x37\x37\x2e\x36\x20\x39\x34\x2e\x38\x3b\x22\x20\x78\x6d\x6c\x3a\
+\x73\x70\x61\x63\x65\x3d\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\
+\x3e\x3c\x73\x74\x79\x6c\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\
+\x78\x74\x2f\x63\x73\x73\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\
+\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\
+\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\
+\x3a\x20\x31\x3b\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\
+\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\
+\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\
+\x3a\x20\x31\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\
+\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\
+\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\
+\x20\x31\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\
+\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x6f\x6c\x79\
+\x67\x6f\x6e\x20\x70\x6f\x69\x6e\x74\x73\x3d\x22\x30\x2e\x35\x2c\
+\x34\x37\x2e\x34\x20\x35\x38\x2e\x37\x2c\x39\x34\x2e\x38\x20\x35\
+\x38\x2e\x37\x2c\x30\x20\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\
+\x78\x3d\x22\x35\x38\x2e\x36\x22\x20\x79\x3d\x22\x33\x31\x2e\x32\
+\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\x74\
+\x72\x69\x78\x28\x2d\x31\x20\x2d\x31\x2e\x32\x32\x34\x36\x34\x37\
+\x65\x2d\x31\x36\x20\x31\x2e\x32\x32\x34\x36\x34\x37\x65\x2d\x31\
+\x36\x20\x2d\x31\x20\x32\x33\x36\x2e\x31\x36\x38\x37\x20\x39\x34\
+\x2e\x38\x29\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x31\x39\x22\
+\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x33\x32\x2e\x34\x22\x2f\x3e\
+\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x03\x8b\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x32\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\
+\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x35\x31\x2e\x34\x2c\x32\x37\x2e\x39\
+\x63\x31\x2e\x39\x2c\x30\x2c\x33\x2e\x38\x2c\x30\x2e\x38\x2c\x35\
+\x2c\x32\x2e\x34\x6c\x32\x38\x2e\x32\x2c\x33\x35\x2e\x31\x63\x32\
+\x2e\x32\x2c\x32\x2e\x38\x2c\x31\x2e\x38\x2c\x36\x2e\x39\x2d\x31\
+\x2c\x39\x2e\x31\x63\x2d\x32\x2e\x38\x2c\x32\x2e\x32\x2d\x36\x2e\
+\x39\x2c\x31\x2e\x38\x2d\x39\x2e\x31\x2d\x31\x4c\x34\x36\x2e\x33\
+\x2c\x33\x38\x2e\x34\x63\x2d\x32\x2e\x32\x2d\x32\x2e\x38\x2d\x31\
+\x2e\x38\x2d\x36\x2e\x39\x2c\x31\x2d\x39\x2e\x31\x0a\x09\x43\x34\
+\x38\x2e\x35\x2c\x32\x38\x2e\x33\x2c\x35\x30\x2c\x32\x37\x2e\x39\
+\x2c\x35\x31\x2e\x34\x2c\x32\x37\x2e\x39\x7a\x22\x2f\x3e\x0a\x3c\
+\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x35\x31\x2e\x34\x2c\x32\x37\
+\x2e\x39\x63\x31\x2e\x34\x2c\x30\x2c\x32\x2e\x39\x2c\x30\x2e\x35\
+\x2c\x34\x2c\x31\x2e\x34\x63\x32\x2e\x38\x2c\x32\x2e\x32\x2c\x33\
+\x2e\x32\x2c\x36\x2e\x33\x2c\x31\x2c\x39\x2e\x31\x4c\x32\x38\x2e\
+\x32\x2c\x37\x33\x2e\x35\x63\x2d\x32\x2e\x32\x2c\x32\x2e\x38\x2d\
+\x36\x2e\x33\x2c\x33\x2e\x32\x2d\x39\x2e\x31\x2c\x31\x63\x2d\x32\
+\x2e\x38\x2d\x32\x2e\x32\x2d\x33\x2e\x32\x2d\x36\x2e\x33\x2d\x31\
+\x2d\x39\x2e\x31\x6c\x32\x38\x2e\x32\x2d\x33\x35\x2e\x31\x0a\x09\
+\x43\x34\x37\x2e\x36\x2c\x32\x38\x2e\x37\x2c\x34\x39\x2e\x35\x2c\
+\x32\x37\x2e\x39\x2c\x35\x31\x2e\x34\x2c\x32\x37\x2e\x39\x7a\x22\
+\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x02\xfd\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x36\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\
+\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x37\x34\x2e\x37\x2c\x38\x36\x2e\x39\
+\x48\x32\x36\x2e\x34\x63\x2d\x36\x2e\x39\x2c\x30\x2d\x31\x32\x2e\
+\x32\x2d\x35\x2e\x34\x2d\x31\x32\x2e\x32\x2d\x31\x32\x2e\x32\x56\
+\x32\x36\x2e\x34\x63\x30\x2d\x36\x2e\x39\x2c\x35\x2e\x34\x2d\x31\
+\x32\x2e\x32\x2c\x31\x32\x2e\x32\x2d\x31\x32\x2e\x32\x68\x34\x38\
+\x2e\x31\x63\x36\x2e\x39\x2c\x30\x2c\x31\x32\x2e\x32\x2c\x35\x2e\
+\x34\x2c\x31\x32\x2e\x32\x2c\x31\x32\x2e\x32\x76\x34\x38\x2e\x31\
+\x0a\x09\x43\x38\x36\x2e\x39\x2c\x38\x31\x2e\x35\x2c\x38\x31\x2e\
+\x35\x2c\x38\x36\x2e\x39\x2c\x37\x34\x2e\x37\x2c\x38\x36\x2e\x39\
+\x7a\x20\x4d\x32\x38\x2e\x39\x2c\x37\x32\x2e\x31\x68\x34\x33\x2e\
+\x32\x56\x32\x38\x2e\x39\x48\x32\x38\x2e\x39\x56\x37\x32\x2e\x31\
+\x7a\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x01\xbc\
+\x3c\
+\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\x31\
+\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\x72\x5f\x31\x22\x20\x0a\
+\x20\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x0a\x20\x20\x20\x20\x78\x6d\x6c\x6e\
+\x73\x3a\x78\x6c\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\
+\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\
+\x78\x6c\x69\x6e\x6b\x22\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\
+\x30\x20\x30\x20\x31\x32\x20\x31\x36\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\
+\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x20\x20\x20\x20\x3c\x67\x3e\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\
+\x32\x20\x35\x6c\x2d\x38\x20\x38\x2d\x34\x2d\x34\x20\x31\x2e\x35\
+\x2d\x31\x2e\x35\x4c\x34\x20\x31\x30\x6c\x36\x2e\x35\x2d\x36\x2e\
+\x35\x4c\x31\x32\x20\x35\x7a\x22\x2f\x3e\x0a\x20\x20\x20\x20\x3c\
+\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x08\x1b\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x36\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x32\x30\x30\x20\x32\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x32\x30\x30\x20\
+\x32\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x33\x39\x2c\x20\x32\x33\x35\x2c\x20\x32\x33\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x33\x39\x2c\x20\x32\x33\x35\x2c\x20\x32\x33\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x32\x33\x39\x2c\x20\x32\x33\x35\x2c\x20\x32\x33\x33\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\
+\x33\x39\x2c\x20\x32\x33\x35\x2c\x20\x32\x33\x33\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x6d\x20\
+\x30\x2c\x30\x20\x63\x20\x2d\x31\x2e\x32\x30\x33\x30\x37\x38\x35\
+\x2c\x36\x33\x2e\x31\x31\x35\x32\x32\x33\x20\x30\x2c\x32\x30\x30\
+\x20\x30\x2c\x32\x30\x30\x20\x7a\x20\x6d\x20\x36\x37\x2e\x32\x30\
+\x38\x39\x38\x34\x2c\x32\x38\x2e\x36\x36\x34\x30\x36\x32\x20\x63\
+\x20\x2d\x32\x2e\x39\x34\x30\x36\x2c\x30\x2e\x30\x32\x37\x32\x20\
+\x2d\x36\x2e\x31\x38\x37\x38\x37\x31\x2c\x30\x2e\x32\x36\x38\x32\
+\x31\x37\x20\x2d\x37\x2e\x36\x30\x37\x34\x32\x32\x2c\x30\x2e\x36\
+\x34\x32\x35\x37\x39\x20\x2d\x38\x2e\x31\x38\x38\x37\x37\x37\x2c\
+\x32\x2e\x31\x35\x39\x35\x33\x31\x20\x2d\x31\x37\x2e\x37\x39\x39\
+\x38\x39\x36\x2c\x31\x30\x2e\x32\x39\x30\x36\x32\x34\x20\x2d\x32\
+\x32\x2e\x32\x30\x31\x31\x37\x31\x2c\x31\x38\x2e\x37\x38\x31\x32\
+\x35\x20\x2d\x32\x2e\x35\x30\x39\x31\x32\x31\x2c\x34\x2e\x38\x34\
+\x30\x34\x31\x38\x20\x2d\x35\x2e\x33\x37\x36\x33\x33\x36\x2c\x31\
+\x32\x2e\x38\x34\x37\x39\x34\x37\x20\x2d\x36\x2e\x34\x39\x34\x31\
+\x34\x31\x2c\x31\x38\x2e\x31\x34\x32\x35\x37\x38\x20\x2d\x30\x2e\
+\x35\x32\x30\x36\x34\x38\x2c\x32\x2e\x34\x36\x36\x31\x33\x20\x2d\
+\x30\x2e\x36\x31\x32\x34\x31\x33\x2c\x33\x2e\x34\x38\x37\x38\x36\
+\x33\x20\x2d\x30\x2e\x36\x31\x39\x31\x34\x31\x2c\x36\x2e\x38\x34\
+\x31\x37\x39\x37\x20\x2d\x30\x2e\x30\x30\x36\x38\x2c\x33\x2e\x33\
+\x31\x30\x38\x35\x31\x20\x30\x2e\x30\x37\x32\x39\x39\x2c\x34\x2e\
+\x32\x37\x31\x31\x38\x38\x20\x30\x2e\x35\x30\x31\x39\x35\x33\x2c\
+\x35\x2e\x39\x38\x30\x34\x36\x38\x20\x31\x2e\x35\x38\x34\x36\x33\
+\x2c\x36\x2e\x33\x31\x34\x32\x32\x33\x20\x35\x2e\x32\x31\x35\x38\
+\x33\x31\x2c\x31\x31\x2e\x38\x31\x36\x39\x34\x37\x20\x31\x31\x2e\
+\x37\x33\x30\x34\x36\x39\x2c\x31\x37\x2e\x37\x37\x35\x33\x39\x31\
+\x20\x31\x2e\x31\x37\x31\x37\x39\x34\x2c\x31\x2e\x30\x37\x31\x37\
+\x34\x39\x20\x34\x2e\x33\x32\x32\x37\x31\x34\x2c\x33\x2e\x37\x38\
+\x35\x37\x30\x35\x20\x37\x2e\x30\x30\x31\x39\x35\x33\x2c\x36\x2e\
+\x30\x33\x31\x32\x35\x35\x20\x39\x2e\x35\x32\x39\x30\x31\x33\x2c\
+\x37\x2e\x39\x38\x36\x35\x20\x31\x32\x2e\x36\x35\x38\x33\x38\x36\
+\x2c\x31\x31\x2e\x38\x31\x33\x31\x34\x20\x31\x37\x2e\x31\x38\x31\
+\x36\x34\x31\x2c\x32\x31\x2e\x30\x31\x37\x35\x37\x20\x32\x2e\x35\
+\x36\x32\x34\x39\x37\x2c\x35\x2e\x32\x31\x34\x34\x20\x34\x2e\x34\
+\x34\x36\x31\x2c\x39\x2e\x39\x32\x32\x33\x33\x20\x37\x2e\x31\x39\
+\x33\x33\x35\x39\x2c\x31\x37\x2e\x39\x37\x38\x35\x32\x20\x31\x2e\
+\x31\x30\x39\x35\x2c\x33\x2e\x32\x35\x33\x35\x20\x32\x2e\x35\x30\
+\x39\x31\x39\x37\x2c\x36\x2e\x39\x35\x38\x34\x39\x20\x33\x2e\x31\
+\x31\x31\x33\x32\x38\x2c\x38\x2e\x32\x33\x34\x33\x37\x20\x35\x2e\
+\x31\x37\x30\x38\x38\x32\x2c\x31\x30\x2e\x39\x35\x36\x37\x37\x20\
+\x31\x35\x2e\x34\x37\x39\x35\x34\x39\x2c\x32\x30\x2e\x37\x34\x38\
+\x39\x36\x20\x32\x34\x2e\x36\x32\x34\x39\x39\x38\x2c\x32\x33\x2e\
+\x33\x39\x30\x36\x33\x20\x31\x2e\x37\x30\x34\x31\x36\x2c\x30\x2e\
+\x34\x39\x32\x32\x34\x20\x35\x2e\x34\x31\x35\x39\x32\x2c\x31\x2e\
+\x31\x30\x39\x33\x39\x20\x38\x2e\x34\x36\x32\x38\x39\x2c\x31\x2e\
+\x34\x30\x38\x32\x20\x30\x2e\x35\x31\x30\x35\x39\x2c\x30\x2e\x30\
+\x35\x30\x31\x20\x33\x2e\x38\x30\x30\x34\x33\x2c\x30\x2e\x30\x35\
+\x37\x39\x20\x37\x2e\x33\x31\x30\x35\x35\x2c\x30\x2e\x30\x31\x35\
+\x36\x20\x34\x2e\x37\x36\x39\x39\x33\x2c\x2d\x30\x2e\x30\x35\x37\
+\x37\x20\x37\x2e\x32\x36\x39\x32\x36\x2c\x2d\x30\x2e\x31\x39\x37\
+\x39\x32\x20\x39\x2e\x38\x39\x36\x34\x38\x2c\x2d\x30\x2e\x35\x35\
+\x32\x37\x34\x20\x31\x30\x2e\x36\x37\x33\x36\x33\x2c\x2d\x31\x2e\
+\x34\x34\x31\x34\x39\x20\x31\x39\x2e\x34\x32\x34\x37\x35\x2c\x2d\
+\x34\x2e\x34\x32\x36\x30\x37\x20\x32\x36\x2e\x30\x32\x33\x34\x34\
+\x2c\x2d\x38\x2e\x38\x37\x36\x39\x35\x20\x35\x2e\x34\x32\x30\x32\
+\x39\x2c\x2d\x33\x2e\x36\x35\x36\x30\x34\x20\x31\x30\x2e\x39\x34\
+\x31\x30\x34\x2c\x2d\x38\x2e\x32\x35\x30\x36\x35\x20\x31\x33\x2e\
+\x37\x35\x2c\x2d\x31\x31\x2e\x34\x34\x31\x34\x31\x20\x37\x2e\x34\
+\x37\x37\x31\x2c\x2d\x38\x2e\x34\x39\x33\x33\x20\x39\x2e\x36\x36\
+\x37\x30\x31\x2c\x2d\x31\x37\x2e\x37\x33\x38\x38\x32\x20\x37\x2e\
+\x39\x38\x38\x32\x38\x2c\x2d\x33\x33\x2e\x37\x32\x30\x37\x20\x2d\
+\x31\x2e\x30\x32\x31\x32\x38\x2c\x2d\x39\x2e\x37\x32\x32\x38\x32\
+\x20\x2d\x33\x2e\x33\x37\x32\x32\x36\x2c\x2d\x31\x36\x2e\x30\x34\
+\x33\x38\x20\x2d\x37\x2e\x34\x35\x31\x31\x37\x2c\x2d\x32\x30\x2e\
+\x30\x32\x39\x33\x20\x2d\x31\x2e\x36\x37\x34\x37\x39\x2c\x2d\x31\
+\x2e\x36\x33\x36\x34\x31\x39\x20\x2d\x32\x2e\x31\x37\x39\x39\x32\
+\x2c\x2d\x32\x2e\x30\x32\x33\x35\x35\x39\x20\x2d\x33\x2e\x37\x39\
+\x31\x30\x31\x2c\x2d\x32\x2e\x39\x31\x30\x31\x35\x33\x20\x2d\x34\
+\x2e\x31\x36\x39\x38\x37\x2c\x2d\x32\x2e\x32\x39\x34\x36\x35\x37\
+\x20\x2d\x39\x2e\x38\x36\x34\x36\x36\x2c\x2d\x32\x2e\x38\x33\x35\
+\x36\x30\x31\x20\x2d\x32\x31\x2e\x33\x35\x31\x35\x37\x2c\x2d\x32\
+\x2e\x30\x32\x35\x33\x39\x31\x20\x2d\x31\x31\x2e\x37\x39\x36\x31\
+\x31\x2c\x30\x2e\x38\x33\x32\x30\x31\x38\x20\x2d\x31\x38\x2e\x30\
+\x39\x36\x33\x35\x2c\x30\x2e\x32\x34\x39\x31\x34\x37\x20\x2d\x32\
+\x36\x2e\x32\x32\x34\x36\x31\x2c\x2d\x32\x2e\x34\x32\x37\x37\x33\
+\x34\x20\x43\x20\x31\x30\x34\x2e\x35\x30\x38\x30\x37\x2c\x38\x39\
+\x2e\x30\x35\x34\x32\x36\x36\x20\x39\x37\x2e\x31\x34\x39\x30\x30\
+\x33\x2c\x38\x31\x2e\x39\x39\x37\x39\x39\x39\x20\x39\x34\x2e\x39\
+\x30\x36\x32\x35\x2c\x37\x32\x2e\x34\x35\x37\x30\x33\x31\x20\x39\
+\x34\x2e\x36\x35\x35\x39\x33\x32\x2c\x37\x31\x2e\x33\x39\x32\x39\
+\x35\x38\x20\x39\x34\x2e\x31\x32\x35\x36\x35\x37\x2c\x36\x37\x2e\
+\x39\x36\x33\x37\x39\x38\x20\x39\x33\x2e\x37\x32\x38\x35\x31\x36\
+\x2c\x36\x34\x2e\x38\x33\x37\x38\x39\x31\x20\x39\x31\x2e\x32\x39\
+\x39\x34\x38\x39\x2c\x34\x35\x2e\x37\x31\x39\x37\x31\x37\x20\x38\
+\x39\x2e\x34\x39\x36\x38\x33\x2c\x33\x39\x2e\x32\x35\x33\x37\x37\
+\x35\x20\x38\x35\x2e\x35\x30\x33\x39\x30\x36\x2c\x33\x35\x2e\x33\
+\x32\x38\x31\x32\x35\x20\x38\x32\x2e\x31\x30\x33\x36\x31\x36\x2c\
+\x33\x31\x2e\x39\x38\x35\x31\x32\x39\x20\x37\x37\x2e\x30\x36\x35\
+\x32\x33\x32\x2c\x32\x39\x2e\x36\x32\x31\x31\x38\x20\x37\x31\x2e\
+\x37\x31\x30\x39\x33\x38\x2c\x32\x38\x2e\x38\x36\x31\x33\x32\x38\
+\x20\x63\x20\x2d\x31\x2e\x30\x38\x33\x30\x35\x39\x2c\x2d\x30\x2e\
+\x31\x35\x33\x37\x20\x2d\x32\x2e\x37\x33\x37\x35\x39\x33\x2c\x2d\
+\x30\x2e\x32\x31\x33\x35\x38\x35\x20\x2d\x34\x2e\x35\x30\x31\x39\
+\x35\x34\x2c\x2d\x30\x2e\x31\x39\x37\x32\x36\x36\x20\x7a\x22\x20\
+\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x03\x8d\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\
+\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x35\x31\x2e\x33\x2c\x37\x35\x2e\x39\
+\x63\x2d\x31\x2e\x39\x2c\x30\x2d\x33\x2e\x38\x2d\x30\x2e\x38\x2d\
+\x35\x2d\x32\x2e\x34\x4c\x31\x38\x2e\x31\x2c\x33\x38\x2e\x34\x63\
+\x2d\x32\x2e\x32\x2d\x32\x2e\x38\x2d\x31\x2e\x38\x2d\x36\x2e\x39\
+\x2c\x31\x2d\x39\x2e\x31\x63\x32\x2e\x38\x2d\x32\x2e\x32\x2c\x36\
+\x2e\x39\x2d\x31\x2e\x38\x2c\x39\x2e\x31\x2c\x31\x6c\x32\x38\x2e\
+\x32\x2c\x33\x35\x2e\x31\x63\x32\x2e\x32\x2c\x32\x2e\x38\x2c\x31\
+\x2e\x38\x2c\x36\x2e\x39\x2d\x31\x2c\x39\x2e\x31\x0a\x09\x43\x35\
+\x34\x2e\x32\x2c\x37\x35\x2e\x35\x2c\x35\x32\x2e\x37\x2c\x37\x35\
+\x2e\x39\x2c\x35\x31\x2e\x33\x2c\x37\x35\x2e\x39\x7a\x22\x2f\x3e\
+\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x35\x31\x2e\x33\x2c\
+\x37\x35\x2e\x39\x63\x2d\x31\x2e\x34\x2c\x30\x2d\x32\x2e\x39\x2d\
+\x30\x2e\x35\x2d\x34\x2d\x31\x2e\x34\x63\x2d\x32\x2e\x38\x2d\x32\
+\x2e\x32\x2d\x33\x2e\x32\x2d\x36\x2e\x33\x2d\x31\x2d\x39\x2e\x31\
+\x6c\x32\x38\x2e\x32\x2d\x33\x35\x2e\x31\x63\x32\x2e\x32\x2d\x32\
+\x2e\x38\x2c\x36\x2e\x33\x2d\x33\x2e\x32\x2c\x39\x2e\x31\x2d\x31\
+\x63\x32\x2e\x38\x2c\x32\x2e\x32\x2c\x33\x2e\x32\x2c\x36\x2e\x33\
+\x2c\x31\x2c\x39\x2e\x31\x4c\x35\x36\x2e\x34\x2c\x37\x33\x2e\x35\
+\x0a\x09\x43\x35\x35\x2e\x31\x2c\x37\x35\x2e\x31\x2c\x35\x33\x2e\
+\x32\x2c\x37\x35\x2e\x39\x2c\x35\x31\x2e\x33\x2c\x37\x35\x2e\x39\
+\x7a\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x02\xc0\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\
+\x30\x20\x30\x20\x35\x31\x32\x20\x35\x31\x32\x22\x3e\x3c\x73\x74\
+\x79\x6c\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\
+\x73\x73\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\
+\x6c\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\
+\x20\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\
+\x30\x2e\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\
+\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\
+\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\
+\x20\x30\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\
+\x6c\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\
+\x20\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\
+\x30\x2e\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x3c\x70\
+\x61\x74\x68\x20\x64\x3d\x22\x4d\x32\x35\x36\x20\x38\x43\x31\x31\
+\x39\x2e\x30\x34\x33\x20\x38\x20\x38\x20\x31\x31\x39\x2e\x30\x38\
+\x33\x20\x38\x20\x32\x35\x36\x63\x30\x20\x31\x33\x36\x2e\x39\x39\
+\x37\x20\x31\x31\x31\x2e\x30\x34\x33\x20\x32\x34\x38\x20\x32\x34\
+\x38\x20\x32\x34\x38\x73\x32\x34\x38\x2d\x31\x31\x31\x2e\x30\x30\
+\x33\x20\x32\x34\x38\x2d\x32\x34\x38\x43\x35\x30\x34\x20\x31\x31\
+\x39\x2e\x30\x38\x33\x20\x33\x39\x32\x2e\x39\x35\x37\x20\x38\x20\
+\x32\x35\x36\x20\x38\x7a\x6d\x30\x20\x31\x31\x30\x63\x32\x33\x2e\
+\x31\x39\x36\x20\x30\x20\x34\x32\x20\x31\x38\x2e\x38\x30\x34\x20\
+\x34\x32\x20\x34\x32\x73\x2d\x31\x38\x2e\x38\x30\x34\x20\x34\x32\
+\x2d\x34\x32\x20\x34\x32\x2d\x34\x32\x2d\x31\x38\x2e\x38\x30\x34\
+\x2d\x34\x32\x2d\x34\x32\x20\x31\x38\x2e\x38\x30\x34\x2d\x34\x32\
+\x20\x34\x32\x2d\x34\x32\x7a\x6d\x35\x36\x20\x32\x35\x34\x63\x30\
+\x20\x36\x2e\x36\x32\x37\x2d\x35\x2e\x33\x37\x33\x20\x31\x32\x2d\
+\x31\x32\x20\x31\x32\x68\x2d\x38\x38\x63\x2d\x36\x2e\x36\x32\x37\
+\x20\x30\x2d\x31\x32\x2d\x35\x2e\x33\x37\x33\x2d\x31\x32\x2d\x31\
+\x32\x76\x2d\x32\x34\x63\x30\x2d\x36\x2e\x36\x32\x37\x20\x35\x2e\
+\x33\x37\x33\x2d\x31\x32\x20\x31\x32\x2d\x31\x32\x68\x31\x32\x76\
+\x2d\x36\x34\x68\x2d\x31\x32\x63\x2d\x36\x2e\x36\x32\x37\x20\x30\
+\x2d\x31\x32\x2d\x35\x2e\x33\x37\x33\x2d\x31\x32\x2d\x31\x32\x76\
+\x2d\x32\x34\x63\x30\x2d\x36\x2e\x36\x32\x37\x20\x35\x2e\x33\x37\
+\x33\x2d\x31\x32\x20\x31\x32\x2d\x31\x32\x68\x36\x34\x63\x36\x2e\
+\x36\x32\x37\x20\x30\x20\x31\x32\x20\x35\x2e\x33\x37\x33\x20\x31\
+\x32\x20\x31\x32\x76\x31\x30\x30\x68\x31\x32\x63\x36\x2e\x36\x32\
+\x37\x20\x30\x20\x31\x32\x20\x35\x2e\x33\x37\x33\x20\x31\x32\x20\
+\x31\x32\x76\x32\x34\x7a\x22\x2f\x3e\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x04\x29\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x34\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\
+\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x34\
+\x32\x2e\x31\x2c\x35\x31\x6c\x2d\x32\x39\x2d\x32\x33\x2e\x32\x63\
+\x2d\x32\x2e\x33\x2d\x31\x2e\x38\x2d\x32\x2e\x36\x2d\x35\x2e\x32\
+\x2d\x30\x2e\x38\x2d\x37\x2e\x35\x63\x31\x2e\x38\x2d\x32\x2e\x33\
+\x2c\x35\x2e\x32\x2d\x32\x2e\x36\x2c\x37\x2e\x35\x2d\x30\x2e\x38\
+\x6c\x32\x38\x2e\x39\x2c\x32\x33\x2e\x32\x63\x32\x2e\x33\x2c\x31\
+\x2e\x38\x2c\x32\x2e\x36\x2c\x35\x2e\x32\x2c\x30\x2e\x38\x2c\x37\
+\x2e\x35\x63\x2d\x31\x2c\x31\x2e\x33\x2d\x32\x2e\x36\x2c\x32\x2d\
+\x34\x2e\x31\x2c\x32\x0a\x09\x43\x34\x34\x2e\x33\x2c\x35\x32\x2e\
+\x32\x2c\x34\x33\x2e\x31\x2c\x35\x31\x2e\x38\x2c\x34\x32\x2e\x31\
+\x2c\x35\x31\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\
+\x22\x4d\x31\x32\x2e\x34\x2c\x37\x33\x2e\x34\x63\x2d\x31\x2e\x38\
+\x2d\x32\x2e\x33\x2d\x31\x2e\x35\x2d\x35\x2e\x37\x2c\x30\x2e\x38\
+\x2d\x37\x2e\x35\x6c\x32\x38\x2e\x39\x2d\x32\x33\x2e\x32\x63\x32\
+\x2e\x33\x2d\x31\x2e\x38\x2c\x35\x2e\x37\x2d\x31\x2e\x35\x2c\x37\
+\x2e\x35\x2c\x30\x2e\x38\x73\x31\x2e\x35\x2c\x35\x2e\x37\x2d\x30\
+\x2e\x38\x2c\x37\x2e\x35\x6c\x2d\x32\x39\x2c\x32\x33\x2e\x33\x63\
+\x2d\x30\x2e\x39\x2c\x30\x2e\x37\x2d\x32\x2e\x31\x2c\x31\x2e\x32\
+\x2d\x33\x2e\x33\x2c\x31\x2e\x32\x0a\x09\x43\x31\x34\x2e\x39\x2c\
+\x37\x35\x2e\x35\x2c\x31\x33\x2e\x35\x2c\x37\x34\x2e\x38\x2c\x31\
+\x32\x2e\x34\x2c\x37\x33\x2e\x34\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x34\x31\x2e\x34\x2c\x37\x35\x2e\x33\
+\x63\x30\x2d\x32\x2e\x39\x2c\x32\x2e\x33\x2d\x35\x2e\x34\x2c\x35\
+\x2e\x33\x2d\x35\x2e\x34\x6c\x33\x37\x2e\x31\x2d\x30\x2e\x35\x63\
+\x32\x2e\x39\x2c\x30\x2c\x35\x2e\x34\x2c\x32\x2e\x33\x2c\x35\x2e\
+\x34\x2c\x35\x2e\x33\x63\x30\x2c\x32\x2e\x39\x2d\x32\x2e\x33\x2c\
+\x35\x2e\x34\x2d\x35\x2e\x33\x2c\x35\x2e\x34\x6c\x2d\x33\x37\x2e\
+\x32\x2c\x30\x2e\x35\x63\x2d\x31\x2e\x32\x2c\x30\x2d\x32\x2e\x34\
+\x2d\x30\x2e\x34\x2d\x33\x2e\x33\x2d\x31\x2e\x31\x0a\x09\x43\x34\
+\x32\x2e\x32\x2c\x37\x38\x2e\x35\x2c\x34\x31\x2e\x34\x2c\x37\x37\
+\x2e\x31\x2c\x34\x31\x2e\x34\x2c\x37\x35\x2e\x33\x7a\x22\x2f\x3e\
+\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x03\x91\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\
+\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\
+\x22\x35\x39\x2e\x36\x22\x20\x63\x79\x3d\x22\x34\x32\x2e\x37\x22\
+\x20\x72\x3d\x22\x34\x2e\x39\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\
+\x20\x64\x3d\x22\x4d\x34\x31\x2e\x31\x2c\x38\x34\x2e\x32\x63\x2d\
+\x31\x2c\x30\x2d\x32\x2d\x30\x2e\x34\x2d\x32\x2e\x37\x2d\x31\x2e\
+\x33\x6c\x2d\x32\x32\x2d\x32\x36\x2e\x37\x63\x2d\x31\x2e\x32\x2d\
+\x31\x2e\x35\x2d\x31\x2d\x33\x2e\x37\x2c\x30\x2e\x35\x2d\x34\x2e\
+\x39\x6c\x33\x31\x2e\x39\x2d\x32\x36\x2e\x34\x63\x30\x2e\x36\x2d\
+\x30\x2e\x35\x2c\x31\x2e\x34\x2d\x30\x2e\x38\x2c\x32\x2e\x32\x2d\
+\x30\x2e\x38\x63\x30\x2c\x30\x2c\x30\x2c\x30\x2c\x30\x2c\x30\x6c\
+\x32\x37\x2e\x31\x2c\x30\x2e\x31\x0a\x09\x63\x31\x2c\x30\x2c\x32\
+\x2c\x30\x2e\x35\x2c\x32\x2e\x37\x2c\x31\x2e\x33\x63\x30\x2e\x37\
+\x2c\x30\x2e\x38\x2c\x30\x2e\x39\x2c\x31\x2e\x39\x2c\x30\x2e\x37\
+\x2c\x32\x2e\x39\x4c\x37\x36\x2e\x35\x2c\x35\x35\x63\x2d\x30\x2e\
+\x32\x2c\x30\x2e\x38\x2d\x30\x2e\x36\x2c\x31\x2e\x35\x2d\x31\x2e\
+\x32\x2c\x32\x4c\x34\x33\x2e\x33\x2c\x38\x33\x2e\x34\x43\x34\x32\
+\x2e\x37\x2c\x38\x33\x2e\x39\x2c\x34\x31\x2e\x39\x2c\x38\x34\x2e\
+\x32\x2c\x34\x31\x2e\x31\x2c\x38\x34\x2e\x32\x7a\x20\x4d\x32\x34\
+\x2c\x35\x34\x2e\x35\x0a\x09\x6c\x31\x37\x2e\x36\x2c\x32\x31\x2e\
+\x33\x6c\x32\x38\x2e\x33\x2d\x32\x33\x2e\x33\x6c\x34\x2d\x32\x31\
+\x2e\x32\x6c\x2d\x32\x31\x2e\x36\x2d\x30\x2e\x31\x4c\x32\x34\x2c\
+\x35\x34\x2e\x35\x7a\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\
+\x00\x00\x03\x28\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\x69\
+\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\
+\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\x6b\
+\x22\x20\x66\x6f\x63\x75\x73\x61\x62\x6c\x65\x3d\x22\x66\x61\x6c\
+\x73\x65\x22\x20\x70\x72\x65\x73\x65\x72\x76\x65\x41\x73\x70\x65\
+\x63\x74\x52\x61\x74\x69\x6f\x3d\x22\x78\x4d\x69\x64\x59\x4d\x69\
+\x64\x20\x6d\x65\x65\x74\x22\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\
+\x22\x30\x20\x30\x20\x31\x34\x20\x31\x36\x22\x3e\x3c\x73\x74\x79\
+\x6c\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\
+\x73\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\
+\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\
+\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\
+\x3b\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\
+\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\
+\x6c\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\
+\x20\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\
+\x30\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\
+\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x21\
+\x2d\x2d\x46\x72\x6f\x6d\x20\x47\x69\x74\x48\x75\x62\x27\x73\x20\
+\x4f\x63\x74\x6f\x69\x63\x6f\x6e\x73\x2d\x2d\x3e\x0a\x3c\x21\x2d\
+\x2d\x65\x78\x74\x72\x61\x20\x6c\x69\x6e\x65\x2d\x2d\x3e\x0a\x3c\
+\x21\x2d\x2d\x65\x78\x74\x72\x61\x20\x6c\x69\x6e\x65\x32\x2d\x2d\
+\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x32\x20\x31\x33\
+\x68\x34\x76\x31\x48\x32\x76\x2d\x31\x7a\x6d\x35\x2d\x36\x48\x32\
+\x76\x31\x68\x35\x56\x37\x7a\x6d\x32\x20\x33\x56\x38\x6c\x2d\x33\
+\x20\x33\x6c\x33\x20\x33\x76\x2d\x32\x68\x35\x76\x2d\x32\x48\x39\
+\x7a\x4d\x34\x2e\x35\x20\x39\x48\x32\x76\x31\x68\x32\x2e\x35\x56\
+\x39\x7a\x4d\x32\x20\x31\x32\x68\x32\x2e\x35\x76\x2d\x31\x48\x32\
+\x76\x31\x7a\x6d\x39\x20\x31\x68\x31\x76\x32\x63\x2d\x2e\x30\x32\
+\x2e\x32\x38\x2d\x2e\x31\x31\x2e\x35\x32\x2d\x2e\x33\x2e\x37\x63\
+\x2d\x2e\x31\x39\x2e\x31\x38\x2d\x2e\x34\x32\x2e\x32\x38\x2d\x2e\
+\x37\x2e\x33\x48\x31\x63\x2d\x2e\x35\x35\x20\x30\x2d\x31\x2d\x2e\
+\x34\x35\x2d\x31\x2d\x31\x56\x34\x63\x30\x2d\x2e\x35\x35\x2e\x34\
+\x35\x2d\x31\x20\x31\x2d\x31\x68\x33\x63\x30\x2d\x31\x2e\x31\x31\
+\x2e\x38\x39\x2d\x32\x20\x32\x2d\x32\x63\x31\x2e\x31\x31\x20\x30\
+\x20\x32\x20\x2e\x38\x39\x20\x32\x20\x32\x68\x33\x63\x2e\x35\x35\
+\x20\x30\x20\x31\x20\x2e\x34\x35\x20\x31\x20\x31\x76\x35\x68\x2d\
+\x31\x56\x36\x48\x31\x76\x39\x68\x31\x30\x76\x2d\x32\x7a\x4d\x32\
+\x20\x35\x68\x38\x63\x30\x2d\x2e\x35\x35\x2d\x2e\x34\x35\x2d\x31\
+\x2d\x31\x2d\x31\x48\x38\x63\x2d\x2e\x35\x35\x20\x30\x2d\x31\x2d\
+\x2e\x34\x35\x2d\x31\x2d\x31\x73\x2d\x2e\x34\x35\x2d\x31\x2d\x31\
+\x2d\x31\x73\x2d\x31\x20\x2e\x34\x35\x2d\x31\x20\x31\x73\x2d\x2e\
+\x34\x35\x20\x31\x2d\x31\x20\x31\x48\x33\x63\x2d\x2e\x35\x35\x20\
+\x30\x2d\x31\x20\x2e\x34\x35\x2d\x31\x20\x31\x7a\x22\x20\x2f\x3e\
+\x0a\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x04\x74\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x36\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\
+\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x67\x3e\x0a\x09\x3c\x70\x61\x74\x68\x20\
+\x64\x3d\x22\x4d\x35\x37\x2e\x33\x2c\x38\x34\x2e\x37\x68\x2d\x33\
+\x32\x63\x2d\x34\x2e\x36\x2c\x30\x2d\x38\x2e\x32\x2d\x33\x2e\x36\
+\x2d\x38\x2e\x32\x2d\x38\x2e\x32\x76\x2d\x33\x32\x63\x30\x2d\x34\
+\x2e\x36\x2c\x33\x2e\x36\x2d\x38\x2e\x32\x2c\x38\x2e\x32\x2d\x38\
+\x2e\x32\x68\x33\x32\x63\x34\x2e\x36\x2c\x30\x2c\x38\x2e\x32\x2c\
+\x33\x2e\x36\x2c\x38\x2e\x32\x2c\x38\x2e\x32\x76\x33\x32\x0a\x09\
+\x09\x43\x36\x35\x2e\x34\x2c\x38\x31\x2e\x32\x2c\x36\x31\x2e\x39\
+\x2c\x38\x34\x2e\x37\x2c\x35\x37\x2e\x33\x2c\x38\x34\x2e\x37\x7a\
+\x20\x4d\x32\x36\x2e\x39\x2c\x37\x34\x2e\x39\x68\x32\x38\x2e\x37\
+\x56\x34\x36\x2e\x32\x48\x32\x36\x2e\x39\x56\x37\x34\x2e\x39\x7a\
+\x22\x2f\x3e\x0a\x09\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x37\
+\x34\x2e\x37\x2c\x36\x33\x2e\x36\x68\x2d\x33\x32\x63\x2d\x34\x2e\
+\x36\x2c\x30\x2d\x38\x2e\x32\x2d\x33\x2e\x36\x2d\x38\x2e\x32\x2d\
+\x38\x2e\x32\x76\x2d\x33\x32\x63\x30\x2d\x34\x2e\x36\x2c\x33\x2e\
+\x36\x2d\x38\x2e\x32\x2c\x38\x2e\x32\x2d\x38\x2e\x32\x68\x33\x32\
+\x63\x34\x2e\x36\x2c\x30\x2c\x38\x2e\x32\x2c\x33\x2e\x36\x2c\x38\
+\x2e\x32\x2c\x38\x2e\x32\x76\x33\x32\x0a\x09\x09\x43\x38\x32\x2e\
+\x39\x2c\x36\x30\x2c\x37\x39\x2e\x33\x2c\x36\x33\x2e\x36\x2c\x37\
+\x34\x2e\x37\x2c\x36\x33\x2e\x36\x7a\x20\x4d\x34\x34\x2e\x33\x2c\
+\x35\x33\x2e\x38\x68\x32\x38\x2e\x37\x56\x32\x35\x2e\x31\x48\x34\
+\x34\x2e\x33\x56\x35\x33\x2e\x38\x7a\x22\x2f\x3e\x0a\x09\x3c\x70\
+\x61\x74\x68\x20\x64\x3d\x22\x4d\x38\x31\x2e\x31\x2c\x36\x30\x2e\
+\x36\x4c\x36\x32\x2e\x37\x2c\x38\x32\x2e\x37\x6c\x2d\x36\x2e\x39\
+\x2d\x36\x2e\x39\x6c\x31\x33\x2e\x38\x2d\x31\x35\x2e\x33\x6c\x35\
+\x2d\x33\x2e\x35\x22\x2f\x3e\x0a\x09\x3c\x70\x61\x74\x68\x20\x64\
+\x3d\x22\x4d\x38\x32\x2c\x32\x36\x2e\x38\x4c\x36\x31\x2e\x39\x2c\
+\x34\x36\x2e\x39\x6c\x2d\x36\x2e\x39\x2d\x37\x6c\x32\x30\x2e\x34\
+\x2d\x32\x30\x2e\x34\x6c\x30\x2c\x30\x22\x2f\x3e\x0a\x09\x3c\x70\
+\x61\x74\x68\x20\x64\x3d\x22\x4d\x34\x34\x2e\x37\x2c\x36\x30\x2e\
+\x36\x4c\x32\x34\x2e\x38\x2c\x38\x33\x2e\x31\x6c\x2d\x36\x2e\x39\
+\x2d\x36\x2e\x39\x6c\x31\x38\x2e\x38\x2d\x32\x32\x2e\x32\x68\x31\
+\x2e\x36\x22\x2f\x3e\x0a\x09\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\
+\x4d\x31\x39\x2c\x33\x39\x2e\x34\x4c\x33\x36\x2c\x31\x38\x2e\x37\
+\x6c\x31\x30\x2e\x33\x2c\x33\x4c\x32\x39\x2e\x32\x2c\x34\x32\x6c\
+\x30\x2c\x30\x22\x2f\x3e\x0a\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\
+\x67\x3e\x0a\
+\x00\x00\x03\x66\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x38\
+\x30\x2e\x36\x32\x6d\x6d\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\
+\x31\x38\x30\x2e\x36\x32\x6d\x6d\x22\x20\x76\x69\x65\x77\x42\x6f\
+\x78\x3d\x22\x30\x20\x30\x20\x35\x31\x32\x20\x35\x31\x32\x22\x3e\
+\x3c\x73\x74\x79\x6c\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\
+\x74\x2f\x63\x73\x73\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\
+\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\
+\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\
+\x20\x31\x3b\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\
+\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\
+\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\
+\x20\x31\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\
+\x6c\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\
+\x20\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\
+\x31\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\
+\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\
+\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\
+\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x20\x20\x3c\x74\x69\x74\
+\x6c\x65\x3e\x41\x72\x74\x62\x6f\x61\x72\x64\x20\x31\x3c\x2f\x74\
+\x69\x74\x6c\x65\x3e\x0a\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\
+\x22\x4d\x33\x39\x34\x2e\x35\x36\x2c\x32\x39\x38\x2e\x34\x34\x73\
+\x2d\x33\x38\x2e\x34\x35\x2c\x35\x35\x2e\x36\x36\x2d\x33\x38\x2e\
+\x34\x35\x2c\x37\x36\x2e\x38\x39\x61\x33\x38\x2e\x34\x35\x2c\x33\
+\x38\x2e\x34\x35\x2c\x30\x2c\x31\x2c\x30\x2c\x37\x36\x2e\x38\x39\
+\x2c\x30\x43\x34\x33\x33\x2c\x33\x35\x34\x2e\x31\x2c\x33\x39\x34\
+\x2e\x35\x36\x2c\x32\x39\x38\x2e\x34\x34\x2c\x33\x39\x34\x2e\x35\
+\x36\x2c\x32\x39\x38\x2e\x34\x34\x5a\x6d\x2d\x35\x2e\x36\x33\x2d\
+\x36\x31\x2e\x38\x33\x4c\x32\x36\x34\x2e\x31\x37\x2c\x31\x31\x31\
+\x2e\x38\x35\x61\x31\x39\x2e\x32\x32\x2c\x31\x39\x2e\x32\x32\x2c\
+\x30\x2c\x30\x2c\x30\x2d\x32\x37\x2e\x31\x38\x2c\x30\x6c\x2d\x34\
+\x39\x2c\x34\x39\x2d\x35\x31\x2e\x37\x37\x2d\x35\x31\x2e\x37\x37\
+\x61\x39\x2e\x36\x2c\x39\x2e\x36\x2c\x30\x2c\x30\x2c\x30\x2d\x31\
+\x33\x2e\x35\x38\x2c\x30\x4c\x31\x30\x39\x2c\x31\x32\x32\x2e\x36\
+\x37\x61\x39\x2e\x36\x31\x2c\x39\x2e\x36\x31\x2c\x30\x2c\x30\x2c\
+\x30\x2c\x30\x2c\x31\x33\x2e\x35\x39\x4c\x31\x36\x30\x2e\x38\x31\
+\x2c\x31\x38\x38\x2c\x31\x30\x33\x2e\x38\x39\x2c\x32\x34\x35\x61\
+\x35\x37\x2e\x36\x35\x2c\x35\x37\x2e\x36\x35\x2c\x30\x2c\x30\x2c\
+\x30\x2c\x30\x2c\x38\x31\x2e\x35\x34\x6c\x37\x30\x2e\x34\x2c\x37\
+\x30\x2e\x34\x61\x35\x37\x2e\x36\x35\x2c\x35\x37\x2e\x36\x35\x2c\
+\x30\x2c\x30\x2c\x30\x2c\x38\x31\x2e\x35\x34\x2c\x30\x6c\x31\x33\
+\x33\x2e\x30\x39\x2d\x31\x33\x33\x2e\x31\x41\x31\x39\x2e\x32\x32\
+\x2c\x31\x39\x2e\x32\x32\x2c\x30\x2c\x30\x2c\x30\x2c\x33\x38\x38\
+\x2e\x39\x33\x2c\x32\x33\x36\x2e\x36\x31\x5a\x6d\x2d\x36\x39\x2e\
+\x38\x31\x2c\x34\x32\x2e\x36\x33\x48\x31\x32\x36\x2e\x36\x61\x31\
+\x38\x2e\x37\x34\x2c\x31\x38\x2e\x37\x34\x2c\x30\x2c\x30\x2c\x31\
+\x2c\x34\x2e\x34\x37\x2d\x37\x2e\x31\x31\x6c\x37\x2e\x39\x2d\x37\
+\x2e\x39\x2c\x34\x39\x2d\x34\x39\x2c\x33\x35\x2e\x32\x2c\x33\x35\
+\x2e\x32\x61\x31\x39\x2e\x32\x32\x2c\x31\x39\x2e\x32\x32\x2c\x30\
+\x2c\x30\x2c\x30\x2c\x32\x37\x2e\x31\x38\x2d\x32\x37\x2e\x31\x37\
+\x4c\x32\x31\x35\x2e\x31\x36\x2c\x31\x38\x38\x6c\x33\x35\x2e\x34\
+\x32\x2d\x33\x35\x2e\x34\x32\x2c\x39\x37\x2e\x35\x37\x2c\x39\x37\
+\x2e\x35\x38\x2d\x32\x39\x2c\x32\x39\x5a\x22\x2f\x3e\x0a\x3c\x2f\
+\x73\x76\x67\x3e\x0a\
+\x00\x00\x06\x43\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\
+\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x35\x30\x2c\x33\x30\x63\x2d\x34\x2e\
+\x37\x2c\x30\x2d\x38\x2e\x36\x2d\x33\x2e\x39\x2d\x38\x2e\x36\x2d\
+\x38\x2e\x36\x73\x33\x2e\x39\x2d\x38\x2e\x36\x2c\x38\x2e\x36\x2d\
+\x38\x2e\x36\x73\x38\x2e\x36\x2c\x33\x2e\x39\x2c\x38\x2e\x36\x2c\
+\x38\x2e\x36\x53\x35\x34\x2e\x37\x2c\x33\x30\x2c\x35\x30\x2c\x33\
+\x30\x7a\x20\x4d\x35\x30\x2c\x31\x38\x2e\x34\x63\x2d\x31\x2e\x37\
+\x2c\x30\x2d\x33\x2c\x31\x2e\x33\x2d\x33\x2c\x33\x73\x31\x2e\x33\
+\x2c\x33\x2c\x33\x2c\x33\x0a\x09\x73\x33\x2d\x31\x2e\x33\x2c\x33\
+\x2d\x33\x53\x35\x31\x2e\x37\x2c\x31\x38\x2e\x34\x2c\x35\x30\x2c\
+\x31\x38\x2e\x34\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\
+\x3d\x22\x4d\x37\x37\x2e\x38\x2c\x35\x38\x2e\x39\x63\x2d\x34\x2e\
+\x37\x2c\x30\x2d\x38\x2e\x36\x2d\x33\x2e\x39\x2d\x38\x2e\x36\x2d\
+\x38\x2e\x36\x73\x33\x2e\x39\x2d\x38\x2e\x36\x2c\x38\x2e\x36\x2d\
+\x38\x2e\x36\x73\x38\x2e\x36\x2c\x33\x2e\x39\x2c\x38\x2e\x36\x2c\
+\x38\x2e\x36\x53\x38\x32\x2e\x35\x2c\x35\x38\x2e\x39\x2c\x37\x37\
+\x2e\x38\x2c\x35\x38\x2e\x39\x7a\x20\x4d\x37\x37\x2e\x38\x2c\x34\
+\x37\x2e\x33\x63\x2d\x31\x2e\x37\x2c\x30\x2d\x33\x2c\x31\x2e\x33\
+\x2d\x33\x2c\x33\x0a\x09\x73\x31\x2e\x33\x2c\x33\x2c\x33\x2c\x33\
+\x73\x33\x2d\x31\x2e\x33\x2c\x33\x2d\x33\x53\x37\x39\x2e\x35\x2c\
+\x34\x37\x2e\x33\x2c\x37\x37\x2e\x38\x2c\x34\x37\x2e\x33\x7a\x22\
+\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x35\x30\x2c\
+\x38\x35\x2e\x36\x63\x2d\x34\x2e\x37\x2c\x30\x2d\x38\x2e\x36\x2d\
+\x33\x2e\x39\x2d\x38\x2e\x36\x2d\x38\x2e\x36\x73\x33\x2e\x39\x2d\
+\x38\x2e\x36\x2c\x38\x2e\x36\x2d\x38\x2e\x36\x73\x38\x2e\x36\x2c\
+\x33\x2e\x39\x2c\x38\x2e\x36\x2c\x38\x2e\x36\x53\x35\x34\x2e\x37\
+\x2c\x38\x35\x2e\x36\x2c\x35\x30\x2c\x38\x35\x2e\x36\x7a\x20\x4d\
+\x35\x30\x2c\x37\x34\x63\x2d\x31\x2e\x37\x2c\x30\x2d\x33\x2c\x31\
+\x2e\x33\x2d\x33\x2c\x33\x73\x31\x2e\x33\x2c\x33\x2c\x33\x2c\x33\
+\x0a\x09\x73\x33\x2d\x31\x2e\x33\x2c\x33\x2d\x33\x53\x35\x31\x2e\
+\x37\x2c\x37\x34\x2c\x35\x30\x2c\x37\x34\x7a\x22\x2f\x3e\x0a\x3c\
+\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x32\x32\x2e\x32\x2c\x35\x38\
+\x2e\x36\x63\x2d\x34\x2e\x37\x2c\x30\x2d\x38\x2e\x36\x2d\x33\x2e\
+\x39\x2d\x38\x2e\x36\x2d\x38\x2e\x36\x73\x33\x2e\x39\x2d\x38\x2e\
+\x36\x2c\x38\x2e\x36\x2d\x38\x2e\x36\x73\x38\x2e\x36\x2c\x33\x2e\
+\x39\x2c\x38\x2e\x36\x2c\x38\x2e\x36\x53\x32\x36\x2e\x39\x2c\x35\
+\x38\x2e\x36\x2c\x32\x32\x2e\x32\x2c\x35\x38\x2e\x36\x7a\x20\x4d\
+\x32\x32\x2e\x32\x2c\x34\x37\x63\x2d\x31\x2e\x37\x2c\x30\x2d\x33\
+\x2c\x31\x2e\x33\x2d\x33\x2c\x33\x0a\x09\x73\x31\x2e\x33\x2c\x33\
+\x2c\x33\x2c\x33\x73\x33\x2d\x31\x2e\x33\x2c\x33\x2d\x33\x53\x32\
+\x33\x2e\x39\x2c\x34\x37\x2c\x32\x32\x2e\x32\x2c\x34\x37\x7a\x22\
+\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x32\x36\x2e\
+\x34\x2c\x34\x34\x2e\x35\x4c\x32\x31\x2c\x34\x33\x2e\x35\x63\x32\
+\x2e\x32\x2d\x31\x31\x2e\x32\x2c\x31\x30\x2e\x37\x2d\x32\x30\x2e\
+\x32\x2c\x32\x31\x2e\x37\x2d\x32\x33\x6c\x31\x2e\x34\x2c\x35\x2e\
+\x34\x43\x33\x35\x2e\x31\x2c\x32\x38\x2e\x32\x2c\x32\x38\x2e\x32\
+\x2c\x33\x35\x2e\x35\x2c\x32\x36\x2e\x34\x2c\x34\x34\x2e\x35\x7a\
+\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x34\x33\
+\x2e\x36\x2c\x37\x38\x63\x2d\x31\x31\x2e\x35\x2d\x32\x2e\x35\x2d\
+\x32\x30\x2e\x37\x2d\x31\x32\x2d\x32\x32\x2e\x38\x2d\x32\x33\x2e\
+\x36\x6c\x35\x2e\x35\x2d\x31\x63\x31\x2e\x37\x2c\x39\x2e\x34\x2c\
+\x39\x2e\x31\x2c\x31\x37\x2e\x31\x2c\x31\x38\x2e\x34\x2c\x31\x39\
+\x2e\x32\x4c\x34\x33\x2e\x36\x2c\x37\x38\x7a\x22\x2f\x3e\x0a\x3c\
+\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x35\x36\x2e\x36\x2c\x37\x38\
+\x6c\x2d\x31\x2e\x33\x2d\x35\x2e\x35\x63\x39\x2e\x33\x2d\x32\x2e\
+\x32\x2c\x31\x36\x2e\x34\x2d\x39\x2e\x36\x2c\x31\x38\x2e\x32\x2d\
+\x31\x38\x2e\x39\x6c\x35\x2e\x35\x2c\x31\x2e\x31\x43\x37\x36\x2e\
+\x38\x2c\x36\x36\x2e\x32\x2c\x36\x38\x2c\x37\x35\x2e\x34\x2c\x35\
+\x36\x2e\x36\x2c\x37\x38\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\
+\x20\x64\x3d\x22\x4d\x37\x33\x2e\x39\x2c\x34\x36\x2e\x36\x63\x2d\
+\x31\x2e\x31\x2d\x39\x2e\x38\x2d\x37\x2e\x39\x2d\x31\x37\x2e\x39\
+\x2d\x31\x37\x2e\x34\x2d\x32\x30\x2e\x35\x6c\x31\x2e\x35\x2d\x35\
+\x2e\x34\x43\x36\x39\x2e\x38\x2c\x32\x34\x2c\x37\x38\x2e\x32\x2c\
+\x33\x33\x2e\x39\x2c\x37\x39\x2e\x35\x2c\x34\x36\x4c\x37\x33\x2e\
+\x39\x2c\x34\x36\x2e\x36\x7a\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\
+\x3e\x0a\
+\x00\x00\x02\x6d\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x30\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\
+\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x70\x6f\
+\x69\x6e\x74\x73\x3d\x22\x35\x30\x2c\x37\x39\x2e\x31\x20\x39\x37\
+\x2e\x34\x2c\x32\x30\x2e\x39\x20\x32\x2e\x36\x2c\x32\x30\x2e\x39\
+\x20\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x03\xa9\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\
+\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x67\x20\x69\x64\x3d\x22\x4f\x75\x74\x6c\
+\x69\x6e\x65\x22\x3e\x0a\x09\x3c\x67\x3e\x0a\x09\x09\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x32\x36\x2e\x35\x2c\x37\x34\x2e\x32\
+\x63\x30\x2c\x33\x2e\x37\x2c\x33\x2c\x36\x2e\x38\x2c\x36\x2e\x38\
+\x2c\x36\x2e\x38\x68\x33\x33\x2e\x38\x63\x33\x2e\x37\x2c\x30\x2c\
+\x36\x2e\x38\x2d\x33\x2c\x36\x2e\x38\x2d\x36\x2e\x38\x56\x33\x33\
+\x2e\x37\x48\x32\x36\x2e\x35\x56\x37\x34\x2e\x32\x7a\x20\x4d\x33\
+\x33\x2e\x33\x2c\x34\x30\x2e\x34\x68\x33\x33\x2e\x38\x76\x33\x33\
+\x2e\x38\x48\x33\x33\x2e\x33\x56\x34\x30\x2e\x34\x7a\x22\x2f\x3e\
+\x0a\x09\x09\x3c\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x70\x6f\x69\x6e\
+\x74\x73\x3d\x22\x36\x30\x2e\x33\x2c\x32\x33\x2e\x35\x20\x36\x30\
+\x2e\x33\x2c\x31\x36\x2e\x38\x20\x34\x30\x2e\x31\x2c\x31\x36\x2e\
+\x38\x20\x34\x30\x2e\x31\x2c\x32\x33\x2e\x35\x20\x31\x39\x2e\x38\
+\x2c\x32\x33\x2e\x35\x20\x31\x39\x2e\x38\x2c\x33\x30\x2e\x33\x20\
+\x38\x30\x2e\x36\x2c\x33\x30\x2e\x33\x20\x38\x30\x2e\x36\x2c\x32\
+\x33\x2e\x35\x20\x09\x09\x22\x2f\x3e\x0a\x09\x09\x3c\x72\x65\x63\
+\x74\x20\x78\x3d\x22\x34\x30\x2e\x31\x22\x20\x79\x3d\x22\x34\x37\
+\x2e\x32\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x36\x2e\x38\x22\x20\
+\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x30\x2e\x33\x22\x2f\x3e\x0a\
+\x09\x09\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x35\x33\x2e\x36\x22\
+\x20\x79\x3d\x22\x34\x37\x2e\x32\x22\x20\x77\x69\x64\x74\x68\x3d\
+\x22\x36\x2e\x38\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x30\
+\x2e\x33\x22\x2f\x3e\x0a\x09\x3c\x2f\x67\x3e\x0a\x3c\x2f\x67\x3e\
+\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x02\x82\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\
+\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x6f\
+\x6c\x79\x67\x6f\x6e\x20\x70\x6f\x69\x6e\x74\x73\x3d\x22\x32\x32\
+\x2e\x38\x2c\x36\x35\x2e\x38\x20\x32\x39\x2e\x39\x2c\x31\x38\x2e\
+\x31\x20\x38\x35\x2e\x37\x2c\x36\x37\x2e\x34\x20\x35\x31\x2e\x39\
+\x2c\x37\x39\x2e\x35\x20\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\
+\x0a\
+\x00\x00\x02\x75\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x34\x2e\x30\x2e\x30\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\
+\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x6f\
+\x6c\x79\x67\x6f\x6e\x20\x70\x6f\x69\x6e\x74\x73\x3d\x22\x35\x30\
+\x2c\x37\x39\x2e\x31\x20\x39\x37\x2e\x34\x2c\x32\x30\x2e\x39\x20\
+\x32\x2e\x36\x2c\x32\x30\x2e\x39\x20\x22\x2f\x3e\x0a\x3c\x2f\x73\
+\x76\x67\x3e\x0a\
+\x00\x00\x03\x83\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\
+\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x35\x30\x2e\x35\x2c\x37\x37\x2e\x33\
+\x43\x32\x36\x2e\x37\x2c\x37\x37\x2e\x33\x2c\x38\x2e\x31\x2c\x35\
+\x32\x2e\x31\x2c\x37\x2e\x33\x2c\x35\x31\x4c\x36\x2c\x34\x39\x2e\
+\x32\x6c\x31\x2e\x33\x2d\x31\x2e\x38\x43\x38\x2e\x31\x2c\x34\x36\
+\x2e\x33\x2c\x32\x36\x2e\x37\x2c\x32\x31\x2c\x35\x30\x2e\x35\x2c\
+\x32\x31\x73\x34\x32\x2e\x34\x2c\x32\x35\x2e\x33\x2c\x34\x33\x2e\
+\x32\x2c\x32\x36\x2e\x33\x6c\x31\x2e\x33\x2c\x31\x2e\x38\x4c\x39\
+\x33\x2e\x37\x2c\x35\x31\x0a\x09\x43\x39\x32\x2e\x39\x2c\x35\x32\
+\x2e\x31\x2c\x37\x34\x2e\x33\x2c\x37\x37\x2e\x33\x2c\x35\x30\x2e\
+\x35\x2c\x37\x37\x2e\x33\x7a\x20\x4d\x31\x33\x2e\x38\x2c\x34\x39\
+\x2e\x32\x63\x34\x2e\x36\x2c\x35\x2e\x36\x2c\x31\x39\x2e\x35\x2c\
+\x32\x31\x2e\x39\x2c\x33\x36\x2e\x37\x2c\x32\x31\x2e\x39\x73\x33\
+\x32\x2e\x31\x2d\x31\x36\x2e\x34\x2c\x33\x36\x2e\x37\x2d\x32\x31\
+\x2e\x39\x63\x2d\x34\x2e\x36\x2d\x35\x2e\x36\x2d\x31\x39\x2e\x35\
+\x2d\x32\x31\x2e\x39\x2d\x33\x36\x2e\x37\x2d\x32\x31\x2e\x39\x0a\
+\x09\x43\x33\x33\x2e\x33\x2c\x32\x37\x2e\x32\x2c\x31\x38\x2e\x34\
+\x2c\x34\x33\x2e\x36\x2c\x31\x33\x2e\x38\x2c\x34\x39\x2e\x32\x7a\
+\x22\x2f\x3e\x0a\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\
+\x35\x30\x2e\x35\x22\x20\x63\x79\x3d\x22\x34\x39\x2e\x32\x22\x20\
+\x72\x3d\x22\x31\x37\x2e\x33\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\
+\x3e\x0a\
+\x00\x00\x03\x8f\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\
+\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x67\x20\x69\x64\x3d\x22\x4f\x75\x74\x6c\
+\x69\x6e\x65\x22\x3e\x0a\x09\x3c\x67\x3e\x0a\x09\x09\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x34\x37\x2e\x32\x2c\x38\x36\x2e\x39\
+\x63\x2d\x31\x2e\x34\x2c\x30\x2d\x32\x2e\x37\x2d\x30\x2e\x39\x2d\
+\x33\x2e\x33\x2d\x32\x2e\x32\x6c\x2d\x32\x35\x2d\x36\x30\x2e\x36\
+\x63\x2d\x30\x2e\x36\x2d\x31\x2e\x33\x2d\x30\x2e\x32\x2d\x32\x2e\
+\x39\x2c\x30\x2e\x38\x2d\x33\x2e\x39\x73\x32\x2e\x35\x2d\x31\x2e\
+\x33\x2c\x33\x2e\x39\x2d\x30\x2e\x38\x6c\x36\x30\x2e\x36\x2c\x32\
+\x35\x63\x31\x2e\x34\x2c\x30\x2e\x36\x2c\x32\x2e\x33\x2c\x32\x2c\
+\x32\x2e\x32\x2c\x33\x2e\x36\x0a\x09\x09\x09\x63\x2d\x30\x2e\x31\
+\x2c\x31\x2e\x35\x2d\x31\x2e\x32\x2c\x32\x2e\x38\x2d\x32\x2e\x37\
+\x2c\x33\x2e\x32\x6c\x2d\x32\x36\x2e\x34\x2c\x36\x2e\x36\x6c\x2d\
+\x36\x2e\x36\x2c\x32\x36\x2e\x34\x63\x2d\x30\x2e\x34\x2c\x31\x2e\
+\x35\x2d\x31\x2e\x37\x2c\x32\x2e\x36\x2d\x33\x2e\x32\x2c\x32\x2e\
+\x37\x43\x34\x37\x2e\x33\x2c\x38\x36\x2e\x39\x2c\x34\x37\x2e\x32\
+\x2c\x38\x36\x2e\x39\x2c\x34\x37\x2e\x32\x2c\x38\x36\x2e\x39\x7a\
+\x20\x4d\x32\x38\x2e\x37\x2c\x32\x39\x2e\x33\x4c\x34\x36\x2e\x33\
+\x2c\x37\x32\x0a\x09\x09\x09\x6c\x34\x2e\x35\x2d\x31\x38\x63\x30\
+\x2e\x33\x2d\x31\x2e\x33\x2c\x31\x2e\x33\x2d\x32\x2e\x33\x2c\x32\
+\x2e\x36\x2d\x32\x2e\x36\x6c\x31\x38\x2d\x34\x2e\x35\x4c\x32\x38\
+\x2e\x37\x2c\x32\x39\x2e\x33\x7a\x22\x2f\x3e\x0a\x09\x3c\x2f\x67\
+\x3e\x0a\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x05\x58\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\
+\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x37\
+\x38\x2e\x39\x2c\x38\x32\x2e\x37\x63\x2d\x34\x2e\x37\x2c\x30\x2d\
+\x38\x2e\x36\x2d\x33\x2e\x39\x2d\x38\x2e\x36\x2d\x38\x2e\x36\x73\
+\x33\x2e\x39\x2d\x38\x2e\x36\x2c\x38\x2e\x36\x2d\x38\x2e\x36\x73\
+\x38\x2e\x36\x2c\x33\x2e\x39\x2c\x38\x2e\x36\x2c\x38\x2e\x36\x53\
+\x38\x33\x2e\x36\x2c\x38\x32\x2e\x37\x2c\x37\x38\x2e\x39\x2c\x38\
+\x32\x2e\x37\x7a\x20\x4d\x37\x38\x2e\x39\x2c\x37\x31\x2e\x31\x63\
+\x2d\x31\x2e\x37\x2c\x30\x2d\x33\x2c\x31\x2e\x33\x2d\x33\x2c\x33\
+\x0a\x09\x73\x31\x2e\x33\x2c\x33\x2c\x33\x2c\x33\x73\x33\x2d\x31\
+\x2e\x33\x2c\x33\x2d\x33\x53\x38\x30\x2e\x36\x2c\x37\x31\x2e\x31\
+\x2c\x37\x38\x2e\x39\x2c\x37\x31\x2e\x31\x7a\x22\x2f\x3e\x0a\x3c\
+\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x34\x39\x2e\x31\x2c\x33\x31\
+\x63\x2d\x34\x2e\x37\x2c\x30\x2d\x38\x2e\x36\x2d\x33\x2e\x39\x2d\
+\x38\x2e\x36\x2d\x38\x2e\x36\x73\x33\x2e\x39\x2d\x38\x2e\x36\x2c\
+\x38\x2e\x36\x2d\x38\x2e\x36\x63\x34\x2e\x37\x2c\x30\x2c\x38\x2e\
+\x36\x2c\x33\x2e\x39\x2c\x38\x2e\x36\x2c\x38\x2e\x36\x53\x35\x33\
+\x2e\x38\x2c\x33\x31\x2c\x34\x39\x2e\x31\x2c\x33\x31\x7a\x20\x4d\
+\x34\x39\x2e\x31\x2c\x31\x39\x2e\x34\x63\x2d\x31\x2e\x37\x2c\x30\
+\x2d\x33\x2c\x31\x2e\x33\x2d\x33\x2c\x33\x0a\x09\x73\x31\x2e\x33\
+\x2c\x33\x2c\x33\x2c\x33\x73\x33\x2d\x31\x2e\x33\x2c\x33\x2d\x33\
+\x53\x35\x30\x2e\x38\x2c\x31\x39\x2e\x34\x2c\x34\x39\x2e\x31\x2c\
+\x31\x39\x2e\x34\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\
+\x3d\x22\x4d\x31\x39\x2e\x37\x2c\x38\x32\x2e\x37\x63\x2d\x34\x2e\
+\x37\x2c\x30\x2d\x38\x2e\x36\x2d\x33\x2e\x39\x2d\x38\x2e\x36\x2d\
+\x38\x2e\x36\x73\x33\x2e\x39\x2d\x38\x2e\x36\x2c\x38\x2e\x36\x2d\
+\x38\x2e\x36\x73\x38\x2e\x36\x2c\x33\x2e\x39\x2c\x38\x2e\x36\x2c\
+\x38\x2e\x36\x53\x32\x34\x2e\x34\x2c\x38\x32\x2e\x37\x2c\x31\x39\
+\x2e\x37\x2c\x38\x32\x2e\x37\x7a\x20\x4d\x31\x39\x2e\x37\x2c\x37\
+\x31\x2e\x31\x63\x2d\x31\x2e\x37\x2c\x30\x2d\x33\x2c\x31\x2e\x33\
+\x2d\x33\x2c\x33\x0a\x09\x73\x31\x2e\x33\x2c\x33\x2c\x33\x2c\x33\
+\x73\x33\x2d\x31\x2e\x33\x2c\x33\x2d\x33\x53\x32\x31\x2e\x34\x2c\
+\x37\x31\x2e\x31\x2c\x31\x39\x2e\x37\x2c\x37\x31\x2e\x31\x7a\x22\
+\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x32\x36\x2e\x37\
+\x22\x20\x79\x3d\x22\x37\x31\x2e\x33\x22\x20\x77\x69\x64\x74\x68\
+\x3d\x22\x34\x35\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x35\x2e\
+\x36\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x31\x31\
+\x2e\x34\x22\x20\x79\x3d\x22\x34\x34\x2e\x35\x22\x20\x74\x72\x61\
+\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\x30\
+\x2e\x34\x39\x39\x35\x20\x2d\x30\x2e\x38\x36\x36\x33\x20\x30\x2e\
+\x38\x36\x36\x33\x20\x30\x2e\x34\x39\x39\x35\x20\x2d\x32\x33\x2e\
+\x35\x38\x34\x34\x20\x35\x33\x2e\x37\x37\x37\x29\x22\x20\x77\x69\
+\x64\x74\x68\x3d\x22\x34\x36\x2e\x36\x22\x20\x68\x65\x69\x67\x68\
+\x74\x3d\x22\x35\x2e\x36\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\
+\x78\x3d\x22\x36\x31\x2e\x31\x22\x20\x79\x3d\x22\x32\x34\x2e\x32\
+\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\x74\
+\x72\x69\x78\x28\x30\x2e\x38\x36\x36\x38\x20\x2d\x30\x2e\x34\x39\
+\x38\x36\x20\x30\x2e\x34\x39\x38\x36\x20\x30\x2e\x38\x36\x36\x38\
+\x20\x2d\x31\x35\x2e\x34\x33\x30\x33\x20\x33\x38\x2e\x32\x33\x31\
+\x31\x29\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x35\x2e\x36\x22\x20\
+\x68\x65\x69\x67\x68\x74\x3d\x22\x34\x37\x2e\x35\x22\x2f\x3e\x0a\
+\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x05\x60\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\
+\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x37\x38\x2e\x39\x2c\x38\x32\x2e\x37\
+\x63\x2d\x34\x2e\x37\x2c\x30\x2d\x38\x2e\x36\x2d\x33\x2e\x39\x2d\
+\x38\x2e\x36\x2d\x38\x2e\x36\x73\x33\x2e\x39\x2d\x38\x2e\x36\x2c\
+\x38\x2e\x36\x2d\x38\x2e\x36\x73\x38\x2e\x36\x2c\x33\x2e\x39\x2c\
+\x38\x2e\x36\x2c\x38\x2e\x36\x53\x38\x33\x2e\x36\x2c\x38\x32\x2e\
+\x37\x2c\x37\x38\x2e\x39\x2c\x38\x32\x2e\x37\x7a\x20\x4d\x37\x38\
+\x2e\x39\x2c\x37\x31\x2e\x31\x63\x2d\x31\x2e\x37\x2c\x30\x2d\x33\
+\x2c\x31\x2e\x33\x2d\x33\x2c\x33\x0a\x09\x73\x31\x2e\x33\x2c\x33\
+\x2c\x33\x2c\x33\x73\x33\x2d\x31\x2e\x33\x2c\x33\x2d\x33\x53\x38\
+\x30\x2e\x36\x2c\x37\x31\x2e\x31\x2c\x37\x38\x2e\x39\x2c\x37\x31\
+\x2e\x31\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\
+\x4d\x34\x39\x2e\x31\x2c\x33\x31\x63\x2d\x34\x2e\x37\x2c\x30\x2d\
+\x38\x2e\x36\x2d\x33\x2e\x39\x2d\x38\x2e\x36\x2d\x38\x2e\x36\x73\
+\x33\x2e\x39\x2d\x38\x2e\x36\x2c\x38\x2e\x36\x2d\x38\x2e\x36\x63\
+\x34\x2e\x37\x2c\x30\x2c\x38\x2e\x36\x2c\x33\x2e\x39\x2c\x38\x2e\
+\x36\x2c\x38\x2e\x36\x53\x35\x33\x2e\x38\x2c\x33\x31\x2c\x34\x39\
+\x2e\x31\x2c\x33\x31\x7a\x20\x4d\x34\x39\x2e\x31\x2c\x31\x39\x2e\
+\x34\x63\x2d\x31\x2e\x37\x2c\x30\x2d\x33\x2c\x31\x2e\x33\x2d\x33\
+\x2c\x33\x0a\x09\x73\x31\x2e\x33\x2c\x33\x2c\x33\x2c\x33\x73\x33\
+\x2d\x31\x2e\x33\x2c\x33\x2d\x33\x53\x35\x30\x2e\x38\x2c\x31\x39\
+\x2e\x34\x2c\x34\x39\x2e\x31\x2c\x31\x39\x2e\x34\x7a\x22\x2f\x3e\
+\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x39\x2e\x37\x2c\
+\x38\x32\x2e\x37\x63\x2d\x34\x2e\x37\x2c\x30\x2d\x38\x2e\x36\x2d\
+\x33\x2e\x39\x2d\x38\x2e\x36\x2d\x38\x2e\x36\x73\x33\x2e\x39\x2d\
+\x38\x2e\x36\x2c\x38\x2e\x36\x2d\x38\x2e\x36\x73\x38\x2e\x36\x2c\
+\x33\x2e\x39\x2c\x38\x2e\x36\x2c\x38\x2e\x36\x53\x32\x34\x2e\x34\
+\x2c\x38\x32\x2e\x37\x2c\x31\x39\x2e\x37\x2c\x38\x32\x2e\x37\x7a\
+\x20\x4d\x31\x39\x2e\x37\x2c\x37\x31\x2e\x31\x63\x2d\x31\x2e\x37\
+\x2c\x30\x2d\x33\x2c\x31\x2e\x33\x2d\x33\x2c\x33\x0a\x09\x73\x31\
+\x2e\x33\x2c\x33\x2c\x33\x2c\x33\x73\x33\x2d\x31\x2e\x33\x2c\x33\
+\x2d\x33\x53\x32\x31\x2e\x34\x2c\x37\x31\x2e\x31\x2c\x31\x39\x2e\
+\x37\x2c\x37\x31\x2e\x31\x7a\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\
+\x20\x78\x3d\x22\x32\x36\x2e\x37\x22\x20\x79\x3d\x22\x37\x31\x2e\
+\x33\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x34\x35\x22\x20\x68\x65\
+\x69\x67\x68\x74\x3d\x22\x35\x2e\x36\x22\x2f\x3e\x0a\x3c\x72\x65\
+\x63\x74\x20\x78\x3d\x22\x31\x31\x2e\x34\x22\x20\x79\x3d\x22\x34\
+\x34\x2e\x35\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\
+\x6d\x61\x74\x72\x69\x78\x28\x30\x2e\x34\x39\x39\x35\x20\x2d\x30\
+\x2e\x38\x36\x36\x33\x20\x30\x2e\x38\x36\x36\x33\x20\x30\x2e\x34\
+\x39\x39\x35\x20\x2d\x32\x33\x2e\x35\x38\x34\x34\x20\x35\x33\x2e\
+\x37\x37\x37\x29\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x34\x36\x2e\
+\x36\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x35\x2e\x36\x22\x2f\
+\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x36\x31\x2e\x31\x22\
+\x20\x79\x3d\x22\x32\x34\x2e\x32\x22\x20\x74\x72\x61\x6e\x73\x66\
+\x6f\x72\x6d\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\x30\x2e\x38\x36\
+\x36\x38\x20\x2d\x30\x2e\x34\x39\x38\x36\x20\x30\x2e\x34\x39\x38\
+\x36\x20\x30\x2e\x38\x36\x36\x38\x20\x2d\x31\x35\x2e\x34\x33\x30\
+\x33\x20\x33\x38\x2e\x32\x33\x31\x31\x29\x22\x20\x77\x69\x64\x74\
+\x68\x3d\x22\x35\x2e\x36\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\
+\x34\x37\x2e\x35\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x09\xdb\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\
+\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x67\x20\
+\x69\x64\x3d\x22\x4c\x61\x79\x65\x72\x5f\x31\x37\x22\x3e\x0a\x09\
+\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x34\x38\x2e\x34\x2c\x33\
+\x34\x2e\x39\x63\x31\x2e\x34\x2d\x31\x2e\x34\x2c\x33\x2e\x38\x2d\
+\x31\x2e\x34\x2c\x35\x2e\x32\x2c\x30\x6c\x31\x2e\x31\x2c\x31\x2e\
+\x31\x6c\x31\x30\x2e\x34\x2d\x31\x30\x2e\x33\x63\x32\x2e\x39\x2d\
+\x32\x2e\x39\x2c\x37\x2e\x36\x2d\x32\x2e\x39\x2c\x31\x30\x2e\x35\
+\x2c\x30\x63\x32\x2e\x39\x2c\x32\x2e\x39\x2c\x32\x2e\x39\x2c\x37\
+\x2e\x36\x2c\x30\x2c\x31\x30\x2e\x35\x4c\x36\x35\x2e\x32\x2c\x34\
+\x36\x2e\x35\x6c\x31\x2e\x31\x2c\x31\x2e\x31\x0a\x09\x09\x63\x31\
+\x2e\x34\x2c\x31\x2e\x34\x2c\x31\x2e\x34\x2c\x33\x2e\x38\x2c\x30\
+\x2c\x35\x2e\x32\x63\x2d\x31\x2e\x34\x2c\x31\x2e\x34\x2d\x33\x2e\
+\x38\x2c\x31\x2e\x34\x2d\x35\x2e\x32\x2c\x30\x4c\x34\x38\x2e\x34\
+\x2c\x34\x30\x2e\x32\x43\x34\x36\x2e\x39\x2c\x33\x38\x2e\x37\x2c\
+\x34\x36\x2e\x39\x2c\x33\x36\x2e\x34\x2c\x34\x38\x2e\x34\x2c\x33\
+\x34\x2e\x39\x7a\x22\x2f\x3e\x0a\x09\x3c\x70\x6f\x6c\x79\x67\x6f\
+\x6e\x20\x70\x6f\x69\x6e\x74\x73\x3d\x22\x34\x37\x2e\x34\x2c\x36\
+\x34\x2e\x33\x20\x33\x36\x2e\x32\x2c\x37\x35\x2e\x34\x20\x32\x35\
+\x2e\x38\x2c\x37\x35\x2e\x34\x20\x32\x35\x2e\x38\x2c\x36\x35\x20\
+\x32\x36\x2e\x35\x2c\x36\x34\x2e\x33\x20\x32\x36\x2e\x35\x2c\x36\
+\x34\x2e\x33\x20\x09\x22\x2f\x3e\x0a\x09\x3c\x70\x61\x74\x68\x20\
+\x64\x3d\x22\x4d\x37\x36\x2e\x38\x2c\x33\x37\x2e\x34\x63\x31\x2e\
+\x38\x2d\x31\x2e\x38\x2c\x32\x2e\x38\x2d\x34\x2e\x32\x2c\x32\x2e\
+\x37\x2d\x36\x2e\x35\x63\x30\x2d\x32\x2e\x34\x2d\x30\x2e\x39\x2d\
+\x34\x2e\x37\x2d\x32\x2e\x37\x2d\x36\x2e\x35\x6c\x30\x2c\x30\x63\
+\x30\x2c\x30\x2c\x30\x2c\x30\x2c\x30\x2c\x30\x63\x30\x2c\x30\x2c\
+\x30\x2c\x30\x2c\x30\x2c\x30\x6c\x30\x2c\x30\x63\x2d\x31\x2e\x38\
+\x2d\x31\x2e\x38\x2d\x34\x2e\x32\x2d\x32\x2e\x37\x2d\x36\x2e\x35\
+\x2d\x32\x2e\x37\x0a\x09\x09\x63\x2d\x32\x2e\x34\x2c\x30\x2d\x34\
+\x2e\x37\x2c\x30\x2e\x39\x2d\x36\x2e\x35\x2c\x32\x2e\x37\x6c\x30\
+\x2c\x30\x6c\x2d\x39\x2e\x31\x2c\x39\x2e\x31\x63\x2d\x31\x2d\x30\
+\x2e\x39\x2d\x32\x2e\x34\x2d\x31\x2e\x34\x2d\x33\x2e\x37\x2d\x31\
+\x2e\x34\x63\x2d\x31\x2e\x34\x2c\x30\x2d\x32\x2e\x38\x2c\x30\x2e\
+\x35\x2d\x33\x2e\x39\x2c\x31\x2e\x36\x63\x2d\x31\x2e\x31\x2c\x31\
+\x2e\x31\x2d\x31\x2e\x36\x2c\x32\x2e\x35\x2d\x31\x2e\x36\x2c\x33\
+\x2e\x39\x0a\x09\x09\x63\x30\x2c\x31\x2e\x33\x2c\x30\x2e\x35\x2c\
+\x32\x2e\x36\x2c\x31\x2e\x34\x2c\x33\x2e\x37\x4c\x32\x35\x2e\x32\
+\x2c\x36\x32\x2e\x39\x63\x30\x2c\x30\x2d\x30\x2e\x31\x2c\x30\x2d\
+\x30\x2e\x31\x2c\x30\x2e\x31\x6c\x30\x2c\x30\x6c\x2d\x30\x2e\x37\
+\x2c\x30\x2e\x37\x43\x32\x34\x2e\x31\x2c\x36\x34\x2c\x32\x34\x2c\
+\x36\x34\x2e\x35\x2c\x32\x34\x2c\x36\x35\x76\x39\x2e\x37\x6c\x2d\
+\x33\x2e\x32\x2c\x33\x2e\x32\x63\x2d\x30\x2e\x37\x2c\x30\x2e\x37\
+\x2d\x30\x2e\x37\x2c\x31\x2e\x39\x2c\x30\x2c\x32\x2e\x36\x0a\x09\
+\x09\x63\x30\x2e\x37\x2c\x30\x2e\x37\x2c\x31\x2e\x39\x2c\x30\x2e\
+\x37\x2c\x32\x2e\x36\x2c\x30\x6c\x33\x2e\x31\x2d\x33\x2e\x31\x6c\
+\x39\x2e\x37\x2c\x30\x63\x30\x2e\x35\x2c\x30\x2c\x31\x2d\x30\x2e\
+\x32\x2c\x31\x2e\x33\x2d\x30\x2e\x35\x6c\x31\x31\x2e\x32\x2d\x31\
+\x31\x2e\x31\x4c\x36\x30\x2c\x35\x34\x2e\x33\x63\x31\x2c\x30\x2e\
+\x39\x2c\x32\x2e\x34\x2c\x31\x2e\x34\x2c\x33\x2e\x37\x2c\x31\x2e\
+\x34\x63\x31\x2e\x34\x2c\x30\x2c\x32\x2e\x38\x2d\x30\x2e\x35\x2c\
+\x33\x2e\x39\x2d\x31\x2e\x36\x0a\x09\x09\x63\x31\x2e\x31\x2d\x31\
+\x2e\x31\x2c\x31\x2e\x36\x2d\x32\x2e\x35\x2c\x31\x2e\x36\x2d\x33\
+\x2e\x39\x63\x30\x2d\x31\x2e\x33\x2d\x30\x2e\x35\x2d\x32\x2e\x36\
+\x2d\x31\x2e\x34\x2d\x33\x2e\x37\x4c\x37\x36\x2e\x38\x2c\x33\x37\
+\x2e\x34\x4c\x37\x36\x2e\x38\x2c\x33\x37\x2e\x34\x7a\x20\x4d\x34\
+\x36\x2e\x31\x2c\x36\x33\x4c\x33\x35\x2e\x35\x2c\x37\x33\x2e\x35\
+\x6c\x2d\x37\x2e\x38\x2c\x30\x76\x2d\x37\x2e\x39\x6c\x30\x2e\x31\
+\x2d\x30\x2e\x31\x63\x30\x2c\x30\x2c\x30\x2e\x31\x2c\x30\x2c\x30\
+\x2e\x31\x2d\x30\x2e\x31\x0a\x09\x09\x4c\x34\x39\x2e\x33\x2c\x34\
+\x34\x6c\x37\x2e\x39\x2c\x37\x2e\x39\x4c\x34\x36\x2e\x31\x2c\x36\
+\x33\x7a\x20\x4d\x37\x34\x2e\x32\x2c\x33\x34\x2e\x38\x4c\x37\x34\
+\x2e\x32\x2c\x33\x34\x2e\x38\x4c\x36\x33\x2e\x39\x2c\x34\x35\x2e\
+\x32\x63\x2d\x30\x2e\x37\x2c\x30\x2e\x37\x2d\x30\x2e\x37\x2c\x31\
+\x2e\x39\x2c\x30\x2c\x32\x2e\x36\x63\x30\x2e\x32\x2c\x30\x2e\x32\
+\x2c\x30\x2e\x34\x2c\x30\x2e\x33\x2c\x30\x2e\x37\x2c\x30\x2e\x34\
+\x0a\x09\x09\x63\x30\x2e\x31\x2c\x30\x2e\x32\x2c\x30\x2e\x32\x2c\
+\x30\x2e\x35\x2c\x30\x2e\x34\x2c\x30\x2e\x37\x63\x30\x2e\x34\x2c\
+\x30\x2e\x34\x2c\x30\x2e\x35\x2c\x30\x2e\x38\x2c\x30\x2e\x35\x2c\
+\x31\x2e\x33\x63\x30\x2c\x30\x2e\x35\x2d\x30\x2e\x32\x2c\x30\x2e\
+\x39\x2d\x30\x2e\x35\x2c\x31\x2e\x33\x63\x2d\x30\x2e\x34\x2c\x30\
+\x2e\x34\x2d\x30\x2e\x38\x2c\x30\x2e\x35\x2d\x31\x2e\x33\x2c\x30\
+\x2e\x35\x63\x2d\x30\x2e\x35\x2c\x30\x2d\x30\x2e\x39\x2d\x30\x2e\
+\x32\x2d\x31\x2e\x33\x2d\x30\x2e\x35\x0a\x09\x09\x4c\x34\x39\x2e\
+\x37\x2c\x33\x38\x2e\x39\x63\x2d\x30\x2e\x34\x2d\x30\x2e\x34\x2d\
+\x30\x2e\x35\x2d\x30\x2e\x38\x2d\x30\x2e\x35\x2d\x31\x2e\x33\x63\
+\x30\x2d\x30\x2e\x35\x2c\x30\x2e\x32\x2d\x30\x2e\x39\x2c\x30\x2e\
+\x35\x2d\x31\x2e\x33\x63\x30\x2e\x34\x2d\x30\x2e\x34\x2c\x30\x2e\
+\x38\x2d\x30\x2e\x35\x2c\x31\x2e\x33\x2d\x30\x2e\x35\x63\x30\x2e\
+\x35\x2c\x30\x2c\x30\x2e\x39\x2c\x30\x2e\x32\x2c\x31\x2e\x33\x2c\
+\x30\x2e\x35\x0a\x09\x09\x63\x30\x2e\x32\x2c\x30\x2e\x32\x2c\x30\
+\x2e\x34\x2c\x30\x2e\x33\x2c\x30\x2e\x37\x2c\x30\x2e\x34\x63\x30\
+\x2e\x31\x2c\x30\x2e\x32\x2c\x30\x2e\x32\x2c\x30\x2e\x35\x2c\x30\
+\x2e\x34\x2c\x30\x2e\x37\x63\x30\x2e\x37\x2c\x30\x2e\x37\x2c\x31\
+\x2e\x39\x2c\x30\x2e\x37\x2c\x32\x2e\x36\x2c\x30\x4c\x36\x36\x2e\
+\x34\x2c\x32\x37\x6c\x30\x2c\x30\x63\x31\x2e\x31\x2d\x31\x2e\x31\
+\x2c\x32\x2e\x35\x2d\x31\x2e\x36\x2c\x33\x2e\x39\x2d\x31\x2e\x36\
+\x0a\x09\x09\x63\x31\x2e\x34\x2c\x30\x2c\x32\x2e\x38\x2c\x30\x2e\
+\x35\x2c\x33\x2e\x39\x2c\x31\x2e\x36\x6c\x30\x2c\x30\x63\x31\x2e\
+\x31\x2c\x31\x2e\x31\x2c\x31\x2e\x36\x2c\x32\x2e\x35\x2c\x31\x2e\
+\x36\x2c\x33\x2e\x39\x43\x37\x35\x2e\x39\x2c\x33\x32\x2e\x33\x2c\
+\x37\x35\x2e\x33\x2c\x33\x33\x2e\x37\x2c\x37\x34\x2e\x32\x2c\x33\
+\x34\x2e\x38\x7a\x22\x2f\x3e\x0a\x09\x3c\x70\x61\x74\x68\x20\x64\
+\x3d\x22\x4d\x36\x31\x2e\x38\x2c\x34\x35\x2e\x37\x6c\x32\x2e\x31\
+\x2c\x32\x2e\x31\x6c\x31\x2e\x31\x2c\x31\x2e\x31\x63\x30\x2e\x37\
+\x2c\x30\x2e\x37\x2c\x31\x2e\x39\x2c\x30\x2e\x37\x2c\x32\x2e\x36\
+\x2c\x30\x63\x30\x2e\x37\x2d\x30\x2e\x37\x2c\x30\x2e\x37\x2d\x31\
+\x2e\x39\x2c\x30\x2d\x32\x2e\x36\x6c\x2d\x31\x2e\x31\x2d\x31\x2e\
+\x31\x6c\x2d\x32\x2e\x31\x2d\x32\x2e\x31\x63\x2d\x30\x2e\x37\x2d\
+\x30\x2e\x37\x2d\x31\x2e\x39\x2d\x30\x2e\x37\x2d\x32\x2e\x36\x2c\
+\x30\x0a\x09\x09\x43\x36\x31\x2e\x31\x2c\x34\x33\x2e\x38\x2c\x36\
+\x31\x2e\x31\x2c\x34\x35\x2c\x36\x31\x2e\x38\x2c\x34\x35\x2e\x37\
+\x4c\x36\x31\x2e\x38\x2c\x34\x35\x2e\x37\x7a\x22\x2f\x3e\x0a\x09\
+\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x35\x32\x2e\x33\x2c\x33\
+\x36\x2e\x32\x6c\x31\x2e\x31\x2c\x31\x2e\x31\x6c\x32\x2e\x31\x2c\
+\x32\x2e\x31\x63\x30\x2e\x37\x2c\x30\x2e\x37\x2c\x31\x2e\x39\x2c\
+\x30\x2e\x37\x2c\x32\x2e\x36\x2c\x30\x63\x30\x2e\x37\x2d\x30\x2e\
+\x37\x2c\x30\x2e\x37\x2d\x31\x2e\x39\x2c\x30\x2d\x32\x2e\x36\x4c\
+\x35\x36\x2c\x33\x34\x2e\x37\x6c\x2d\x31\x2e\x31\x2d\x31\x2e\x31\
+\x63\x2d\x30\x2e\x37\x2d\x30\x2e\x37\x2d\x31\x2e\x39\x2d\x30\x2e\
+\x37\x2d\x32\x2e\x36\x2c\x30\x0a\x09\x09\x43\x35\x31\x2e\x36\x2c\
+\x33\x34\x2e\x33\x2c\x35\x31\x2e\x36\x2c\x33\x35\x2e\x35\x2c\x35\
+\x32\x2e\x33\x2c\x33\x36\x2e\x32\x4c\x35\x32\x2e\x33\x2c\x33\x36\
+\x2e\x32\x7a\x22\x2f\x3e\x0a\x09\x3c\x70\x61\x74\x68\x20\x64\x3d\
+\x22\x4d\x32\x36\x2e\x35\x2c\x36\x36\x2e\x31\x4c\x32\x36\x2e\x35\
+\x2c\x36\x36\x2e\x31\x68\x32\x30\x2e\x39\x63\x31\x2c\x30\x2c\x31\
+\x2e\x39\x2d\x30\x2e\x38\x2c\x31\x2e\x39\x2d\x31\x2e\x39\x63\x30\
+\x2d\x31\x2d\x30\x2e\x38\x2d\x31\x2e\x39\x2d\x31\x2e\x39\x2d\x31\
+\x2e\x39\x48\x32\x36\x2e\x35\x68\x30\x63\x2d\x31\x2c\x30\x2d\x31\
+\x2e\x39\x2c\x30\x2e\x38\x2d\x31\x2e\x39\x2c\x31\x2e\x39\x0a\x09\
+\x09\x43\x32\x34\x2e\x36\x2c\x36\x35\x2e\x33\x2c\x32\x35\x2e\x35\
+\x2c\x36\x36\x2e\x31\x2c\x32\x36\x2e\x35\x2c\x36\x36\x2e\x31\x4c\
+\x32\x36\x2e\x35\x2c\x36\x36\x2e\x31\x7a\x22\x2f\x3e\x0a\x3c\x2f\
+\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x03\xd0\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\
+\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x33\
+\x32\x2e\x34\x2c\x35\x33\x2e\x35\x48\x32\x33\x63\x2d\x32\x2e\x38\
+\x2c\x30\x2d\x35\x2d\x32\x2e\x32\x2d\x35\x2d\x35\x56\x32\x33\x63\
+\x30\x2d\x32\x2e\x38\x2c\x32\x2e\x32\x2d\x35\x2c\x35\x2d\x35\x68\
+\x32\x35\x2e\x35\x63\x32\x2e\x38\x2c\x30\x2c\x35\x2c\x32\x2e\x32\
+\x2c\x35\x2c\x35\x76\x31\x30\x2e\x33\x68\x2d\x36\x56\x32\x34\x48\
+\x32\x34\x76\x32\x33\x2e\x35\x68\x38\x2e\x34\x56\x35\x33\x2e\x35\
+\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x37\
+\x35\x2e\x37\x2c\x38\x31\x2e\x33\x48\x35\x30\x2e\x31\x63\x2d\x32\
+\x2e\x38\x2c\x30\x2d\x35\x2d\x32\x2e\x32\x2d\x35\x2d\x35\x56\x36\
+\x35\x2e\x32\x68\x36\x76\x31\x30\x2e\x31\x68\x32\x33\x2e\x36\x56\
+\x35\x31\x2e\x38\x68\x2d\x39\x2e\x35\x76\x2d\x36\x68\x31\x30\x2e\
+\x35\x63\x32\x2e\x38\x2c\x30\x2c\x35\x2c\x32\x2e\x32\x2c\x35\x2c\
+\x35\x76\x32\x35\x2e\x35\x43\x38\x30\x2e\x37\x2c\x37\x39\x2e\x31\
+\x2c\x37\x38\x2e\x35\x2c\x38\x31\x2e\x33\x2c\x37\x35\x2e\x37\x2c\
+\x38\x31\x2e\x33\x7a\x0a\x09\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\
+\x20\x64\x3d\x22\x4d\x36\x31\x2e\x38\x2c\x36\x37\x2e\x34\x48\x33\
+\x36\x2e\x33\x63\x2d\x32\x2e\x38\x2c\x30\x2d\x35\x2d\x32\x2e\x32\
+\x2d\x35\x2d\x35\x56\x33\x36\x2e\x39\x63\x30\x2d\x32\x2e\x38\x2c\
+\x32\x2e\x32\x2d\x35\x2c\x35\x2d\x35\x68\x32\x35\x2e\x35\x63\x32\
+\x2e\x38\x2c\x30\x2c\x35\x2c\x32\x2e\x32\x2c\x35\x2c\x35\x76\x32\
+\x35\x2e\x35\x43\x36\x36\x2e\x38\x2c\x36\x35\x2e\x32\x2c\x36\x34\
+\x2e\x36\x2c\x36\x37\x2e\x34\x2c\x36\x31\x2e\x38\x2c\x36\x37\x2e\
+\x34\x7a\x0a\x09\x20\x4d\x33\x37\x2e\x33\x2c\x36\x31\x2e\x34\x68\
+\x32\x33\x2e\x35\x56\x33\x37\x2e\x39\x48\x33\x37\x2e\x33\x56\x36\
+\x31\x2e\x34\x7a\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x02\x6d\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x34\x2e\x30\x2e\x30\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\
+\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x70\x6f\
+\x69\x6e\x74\x73\x3d\x22\x35\x30\x2c\x37\x39\x2e\x31\x20\x39\x37\
+\x2e\x34\x2c\x32\x30\x2e\x39\x20\x32\x2e\x36\x2c\x32\x30\x2e\x39\
+\x20\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x04\x53\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\
+\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x67\x20\x69\x64\x3d\x22\x53\x6f\x6c\x69\
+\x64\x22\x3e\x0a\x09\x3c\x67\x3e\x0a\x09\x09\x3c\x70\x6f\x6c\x79\
+\x67\x6f\x6e\x20\x70\x6f\x69\x6e\x74\x73\x3d\x22\x37\x30\x2e\x37\
+\x2c\x33\x36\x2e\x35\x20\x38\x35\x2e\x33\x2c\x33\x36\x2e\x35\x20\
+\x38\x35\x2e\x33\x2c\x32\x39\x2e\x32\x20\x37\x30\x2e\x37\x2c\x32\
+\x39\x2e\x32\x20\x36\x33\x2e\x35\x2c\x32\x39\x2e\x32\x20\x34\x38\
+\x2e\x39\x2c\x32\x39\x2e\x32\x20\x34\x38\x2e\x39\x2c\x33\x36\x2e\
+\x35\x20\x36\x33\x2e\x35\x2c\x33\x36\x2e\x35\x20\x09\x09\x22\x2f\
+\x3e\x0a\x09\x3c\x2f\x67\x3e\x0a\x3c\x2f\x67\x3e\x0a\x3c\x67\x20\
+\x69\x64\x3d\x22\x4f\x75\x74\x6c\x69\x6e\x65\x22\x3e\x0a\x09\x3c\
+\x67\x3e\x0a\x09\x09\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x33\
+\x35\x2e\x34\x2c\x38\x35\x2e\x39\x63\x2d\x30\x2e\x39\x2c\x30\x2d\
+\x31\x2e\x38\x2d\x30\x2e\x36\x2d\x32\x2e\x32\x2d\x31\x2e\x35\x4c\
+\x31\x36\x2e\x38\x2c\x34\x34\x2e\x35\x63\x2d\x30\x2e\x34\x2d\x30\
+\x2e\x39\x2d\x30\x2e\x32\x2d\x31\x2e\x39\x2c\x30\x2e\x35\x2d\x32\
+\x2e\x36\x63\x30\x2e\x37\x2d\x30\x2e\x37\x2c\x31\x2e\x37\x2d\x30\
+\x2e\x39\x2c\x32\x2e\x36\x2d\x30\x2e\x35\x6c\x33\x39\x2e\x39\x2c\
+\x31\x36\x2e\x34\x0a\x09\x09\x09\x63\x30\x2e\x39\x2c\x30\x2e\x34\
+\x2c\x31\x2e\x35\x2c\x31\x2e\x33\x2c\x31\x2e\x34\x2c\x32\x2e\x33\
+\x73\x2d\x30\x2e\x38\x2c\x31\x2e\x39\x2d\x31\x2e\x38\x2c\x32\x2e\
+\x31\x4c\x34\x32\x2c\x36\x36\x2e\x36\x4c\x33\x37\x2e\x36\x2c\x38\
+\x34\x63\x2d\x30\x2e\x32\x2c\x31\x2d\x31\x2e\x31\x2c\x31\x2e\x37\
+\x2d\x32\x2e\x31\x2c\x31\x2e\x38\x43\x33\x35\x2e\x35\x2c\x38\x35\
+\x2e\x39\x2c\x33\x35\x2e\x35\x2c\x38\x35\x2e\x39\x2c\x33\x35\x2e\
+\x34\x2c\x38\x35\x2e\x39\x7a\x20\x4d\x32\x33\x2e\x33\x2c\x34\x37\
+\x2e\x39\x0a\x09\x09\x09\x4c\x33\x34\x2e\x39\x2c\x37\x36\x6c\x33\
+\x2d\x31\x31\x2e\x39\x63\x30\x2e\x32\x2d\x30\x2e\x38\x2c\x30\x2e\
+\x39\x2d\x31\x2e\x35\x2c\x31\x2e\x37\x2d\x31\x2e\x37\x6c\x31\x31\
+\x2e\x39\x2d\x33\x4c\x32\x33\x2e\x33\x2c\x34\x37\x2e\x39\x7a\x22\
+\x2f\x3e\x0a\x09\x3c\x2f\x67\x3e\x0a\x3c\x2f\x67\x3e\x0a\x3c\x70\
+\x6f\x6c\x79\x67\x6f\x6e\x20\x70\x6f\x69\x6e\x74\x73\x3d\x22\x32\
+\x31\x2e\x37\x2c\x34\x36\x2e\x36\x20\x33\x34\x2e\x35\x2c\x37\x38\
+\x2e\x33\x20\x33\x39\x2e\x33\x2c\x36\x35\x2e\x37\x20\x35\x33\x2e\
+\x39\x2c\x35\x39\x2e\x35\x20\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\
+\x3e\x0a\
+\x00\x00\x03\xc5\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x36\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\
+\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x38\x34\x2e\x39\x2c\x34\x35\x2e\x33\
+\x6c\x2d\x36\x2e\x38\x2d\x36\x2e\x38\x56\x32\x31\x2e\x39\x63\x30\
+\x2d\x32\x2e\x36\x2d\x32\x2e\x31\x2d\x34\x2e\x37\x2d\x34\x2e\x37\
+\x2d\x34\x2e\x37\x68\x2d\x34\x2e\x37\x63\x2d\x32\x2e\x36\x2c\x30\
+\x2d\x34\x2e\x37\x2c\x32\x2e\x31\x2d\x34\x2e\x37\x2c\x34\x2e\x37\
+\x76\x32\x2e\x36\x6c\x2d\x39\x2e\x34\x2d\x39\x2e\x34\x63\x2d\x31\
+\x2e\x33\x2d\x31\x2e\x32\x2d\x32\x2e\x35\x2d\x32\x2e\x36\x2d\x34\
+\x2e\x37\x2d\x32\x2e\x36\x0a\x09\x73\x2d\x33\x2e\x34\x2c\x31\x2e\
+\x34\x2d\x34\x2e\x37\x2c\x32\x2e\x36\x4c\x31\x35\x2e\x31\x2c\x34\
+\x35\x2e\x33\x63\x2d\x31\x2e\x35\x2c\x31\x2e\x35\x2d\x32\x2e\x36\
+\x2c\x32\x2e\x36\x2d\x32\x2e\x36\x2c\x34\x2e\x37\x63\x30\x2c\x32\
+\x2e\x36\x2c\x32\x2c\x34\x2e\x37\x2c\x34\x2e\x37\x2c\x34\x2e\x37\
+\x68\x34\x2e\x37\x76\x32\x38\x2e\x31\x63\x30\x2c\x32\x2e\x36\x2c\
+\x32\x2e\x31\x2c\x34\x2e\x37\x2c\x34\x2e\x37\x2c\x34\x2e\x37\x68\
+\x31\x34\x2e\x31\x56\x36\x34\x2e\x31\x0a\x09\x63\x30\x2d\x32\x2e\
+\x36\x2c\x32\x2e\x31\x2d\x34\x2e\x37\x2c\x34\x2e\x37\x2d\x34\x2e\
+\x37\x68\x39\x2e\x34\x63\x32\x2e\x36\x2c\x30\x2c\x34\x2e\x37\x2c\
+\x32\x2e\x31\x2c\x34\x2e\x37\x2c\x34\x2e\x37\x76\x32\x33\x2e\x34\
+\x68\x31\x34\x2e\x31\x63\x32\x2e\x36\x2c\x30\x2c\x34\x2e\x37\x2d\
+\x32\x2e\x31\x2c\x34\x2e\x37\x2d\x34\x2e\x37\x56\x35\x34\x2e\x37\
+\x68\x34\x2e\x37\x63\x32\x2e\x37\x2c\x30\x2c\x34\x2e\x37\x2d\x32\
+\x2c\x34\x2e\x37\x2d\x34\x2e\x37\x0a\x09\x43\x38\x37\x2e\x35\x2c\
+\x34\x37\x2e\x39\x2c\x38\x36\x2e\x34\x2c\x34\x36\x2e\x38\x2c\x38\
+\x34\x2e\x39\x2c\x34\x35\x2e\x33\x7a\x22\x2f\x3e\x0a\x3c\x2f\x73\
+\x76\x67\x3e\x0a\
+\x00\x00\x06\xb6\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x36\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\
+\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x67\x3e\x0a\x09\x3c\x70\x61\x74\x68\x20\
+\x64\x3d\x22\x4d\x33\x34\x2e\x36\x2c\x31\x36\x2e\x35\x6c\x2d\x31\
+\x32\x2e\x33\x2d\x35\x2e\x31\x63\x2d\x30\x2e\x33\x2d\x30\x2e\x31\
+\x2d\x30\x2e\x36\x2d\x30\x2e\x32\x2d\x30\x2e\x39\x2c\x30\x63\x2d\
+\x30\x2e\x33\x2c\x30\x2e\x31\x2d\x30\x2e\x35\x2c\x30\x2e\x33\x2d\
+\x30\x2e\x36\x2c\x30\x2e\x36\x73\x2d\x30\x2e\x32\x2c\x30\x2e\x36\
+\x2c\x30\x2c\x30\x2e\x39\x6c\x31\x2e\x38\x2c\x34\x2e\x33\x6c\x2d\
+\x33\x2e\x38\x2c\x31\x2e\x35\x0a\x09\x09\x63\x2d\x38\x2c\x33\x2e\
+\x33\x2d\x31\x32\x2e\x31\x2c\x37\x2e\x37\x2d\x31\x32\x2c\x31\x33\
+\x63\x30\x2c\x31\x2e\x38\x2c\x30\x2e\x35\x2c\x33\x2e\x38\x2c\x31\
+\x2e\x35\x2c\x36\x63\x30\x2e\x38\x2c\x31\x2e\x39\x2c\x32\x2e\x35\
+\x2c\x34\x2e\x32\x2c\x35\x2e\x34\x2c\x36\x2e\x38\x63\x30\x2e\x31\
+\x2c\x30\x2e\x31\x2c\x30\x2e\x32\x2c\x30\x2e\x32\x2c\x30\x2e\x33\
+\x2c\x30\x2e\x34\x63\x30\x2e\x31\x2c\x30\x2e\x31\x2c\x30\x2e\x33\
+\x2c\x30\x2e\x33\x2c\x30\x2e\x34\x2c\x30\x2e\x34\x0a\x09\x09\x63\
+\x30\x2e\x31\x2c\x30\x2e\x31\x2c\x30\x2e\x33\x2c\x30\x2e\x33\x2c\
+\x30\x2e\x34\x2c\x30\x2e\x33\x63\x30\x2e\x32\x2c\x30\x2e\x32\x2c\
+\x30\x2e\x34\x2c\x30\x2e\x32\x2c\x30\x2e\x36\x2c\x30\x2e\x31\x63\
+\x30\x2e\x32\x2c\x30\x2c\x30\x2e\x33\x2d\x30\x2e\x32\x2c\x30\x2e\
+\x34\x2d\x30\x2e\x33\x63\x30\x2d\x30\x2e\x32\x2c\x30\x2d\x30\x2e\
+\x34\x2d\x30\x2e\x31\x2d\x30\x2e\x35\x73\x2d\x30\x2e\x31\x2d\x30\
+\x2e\x32\x2d\x30\x2e\x32\x2d\x30\x2e\x34\x0a\x09\x09\x63\x2d\x30\
+\x2e\x31\x2d\x30\x2e\x32\x2d\x30\x2e\x32\x2d\x30\x2e\x33\x2d\x30\
+\x2e\x32\x2d\x30\x2e\x34\x63\x2d\x30\x2e\x34\x2d\x30\x2e\x37\x2d\
+\x30\x2e\x37\x2d\x31\x2e\x34\x2d\x31\x2d\x32\x63\x2d\x30\x2e\x35\
+\x2d\x31\x2e\x31\x2d\x30\x2e\x38\x2d\x32\x2e\x32\x2d\x31\x2d\x33\
+\x2e\x32\x73\x2d\x30\x2e\x32\x2d\x31\x2e\x39\x2d\x30\x2e\x31\x2d\
+\x32\x2e\x37\x63\x30\x2d\x30\x2e\x38\x2c\x30\x2e\x33\x2d\x31\x2e\
+\x36\x2c\x30\x2e\x36\x2d\x32\x2e\x33\x0a\x09\x09\x63\x30\x2e\x34\
+\x2d\x30\x2e\x37\x2c\x30\x2e\x38\x2d\x31\x2e\x34\x2c\x31\x2e\x33\
+\x2d\x32\x63\x30\x2e\x35\x2d\x30\x2e\x36\x2c\x31\x2e\x32\x2d\x31\
+\x2e\x31\x2c\x32\x2d\x31\x2e\x37\x63\x30\x2e\x38\x2d\x30\x2e\x35\
+\x2c\x31\x2e\x36\x2d\x31\x2c\x32\x2e\x34\x2d\x31\x2e\x35\x63\x30\
+\x2e\x38\x2d\x30\x2e\x34\x2c\x31\x2e\x38\x2d\x30\x2e\x38\x2c\x32\
+\x2e\x39\x2d\x31\x2e\x33\x6c\x33\x2e\x38\x2d\x31\x2e\x35\x6c\x31\
+\x2e\x38\x2c\x34\x2e\x33\x0a\x09\x09\x63\x30\x2e\x31\x2c\x30\x2e\
+\x33\x2c\x30\x2e\x33\x2c\x30\x2e\x35\x2c\x30\x2e\x36\x2c\x30\x2e\
+\x36\x63\x30\x2e\x33\x2c\x30\x2e\x31\x2c\x30\x2e\x36\x2c\x30\x2e\
+\x32\x2c\x30\x2e\x39\x2c\x30\x63\x30\x2e\x33\x2d\x30\x2e\x31\x2c\
+\x30\x2e\x35\x2d\x30\x2e\x33\x2c\x30\x2e\x36\x2d\x30\x2e\x36\x6c\
+\x35\x2e\x31\x2d\x31\x32\x2e\x33\x63\x30\x2e\x31\x2d\x30\x2e\x33\
+\x2c\x30\x2e\x32\x2d\x30\x2e\x36\x2c\x30\x2d\x30\x2e\x39\x0a\x09\
+\x09\x43\x33\x35\x2e\x32\x2c\x31\x36\x2e\x38\x2c\x33\x35\x2c\x31\
+\x36\x2e\x36\x2c\x33\x34\x2e\x36\x2c\x31\x36\x2e\x35\x7a\x22\x2f\
+\x3e\x0a\x3c\x2f\x67\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\
+\x4d\x36\x30\x2e\x31\x2c\x38\x38\x2e\x36\x6c\x32\x35\x2e\x34\x2d\
+\x31\x33\x2e\x38\x56\x34\x39\x2e\x35\x6c\x2d\x32\x35\x2e\x34\x2c\
+\x39\x2e\x32\x56\x38\x38\x2e\x36\x7a\x20\x4d\x35\x37\x2e\x36\x2c\
+\x35\x34\x2e\x33\x6c\x32\x37\x2e\x37\x2d\x31\x30\x2e\x31\x4c\x35\
+\x37\x2e\x36\x2c\x33\x34\x2e\x32\x4c\x32\x39\x2e\x39\x2c\x34\x34\
+\x2e\x32\x4c\x35\x37\x2e\x36\x2c\x35\x34\x2e\x33\x7a\x20\x4d\x39\
+\x30\x2e\x35\x2c\x34\x34\x2e\x33\x76\x33\x30\x2e\x34\x0a\x09\x63\
+\x30\x2c\x30\x2e\x39\x2d\x30\x2e\x32\x2c\x31\x2e\x38\x2d\x30\x2e\
+\x37\x2c\x32\x2e\x36\x63\x2d\x30\x2e\x35\x2c\x30\x2e\x38\x2d\x31\
+\x2e\x31\x2c\x31\x2e\x34\x2d\x31\x2e\x39\x2c\x31\x2e\x39\x4c\x36\
+\x30\x2c\x39\x34\x2e\x34\x63\x2d\x30\x2e\x37\x2c\x30\x2e\x34\x2d\
+\x31\x2e\x35\x2c\x30\x2e\x36\x2d\x32\x2e\x34\x2c\x30\x2e\x36\x63\
+\x2d\x30\x2e\x39\x2c\x30\x2d\x31\x2e\x37\x2d\x30\x2e\x32\x2d\x32\
+\x2e\x34\x2d\x30\x2e\x36\x4c\x32\x37\x2e\x33\x2c\x37\x39\x2e\x32\
+\x0a\x09\x63\x2d\x30\x2e\x38\x2d\x30\x2e\x34\x2d\x31\x2e\x35\x2d\
+\x31\x2e\x31\x2d\x31\x2e\x39\x2d\x31\x2e\x39\x63\x2d\x30\x2e\x35\
+\x2d\x30\x2e\x38\x2d\x30\x2e\x37\x2d\x31\x2e\x37\x2d\x30\x2e\x37\
+\x2d\x32\x2e\x36\x56\x34\x34\x2e\x33\x63\x30\x2d\x31\x2e\x31\x2c\
+\x30\x2e\x33\x2d\x32\x2c\x30\x2e\x39\x2d\x32\x2e\x39\x73\x31\x2e\
+\x34\x2d\x31\x2e\x35\x2c\x32\x2e\x34\x2d\x31\x2e\x39\x6c\x32\x37\
+\x2e\x39\x2d\x31\x30\x2e\x31\x63\x30\x2e\x36\x2d\x30\x2e\x32\x2c\
+\x31\x2e\x32\x2d\x30\x2e\x33\x2c\x31\x2e\x37\x2d\x30\x2e\x33\x0a\
+\x09\x63\x30\x2e\x36\x2c\x30\x2c\x31\x2e\x32\x2c\x30\x2e\x31\x2c\
+\x31\x2e\x37\x2c\x30\x2e\x33\x6c\x32\x37\x2e\x39\x2c\x31\x30\x2e\
+\x31\x63\x31\x2c\x30\x2e\x34\x2c\x31\x2e\x38\x2c\x31\x2c\x32\x2e\
+\x34\x2c\x31\x2e\x39\x53\x39\x30\x2e\x35\x2c\x34\x33\x2e\x32\x2c\
+\x39\x30\x2e\x35\x2c\x34\x34\x2e\x33\x7a\x22\x2f\x3e\x0a\x3c\x2f\
+\x73\x76\x67\x3e\x0a\
+\x00\x00\x03\x1f\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\
+\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\
+\x22\x35\x38\x2e\x31\x22\x20\x63\x79\x3d\x22\x32\x33\x2e\x35\x22\
+\x20\x72\x3d\x22\x36\x2e\x39\x22\x2f\x3e\x0a\x3c\x63\x69\x72\x63\
+\x6c\x65\x20\x63\x78\x3d\x22\x35\x35\x2e\x38\x22\x20\x63\x79\x3d\
+\x22\x35\x32\x2e\x35\x22\x20\x72\x3d\x22\x36\x2e\x39\x22\x2f\x3e\
+\x0a\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x33\x30\x22\
+\x20\x63\x79\x3d\x22\x33\x39\x2e\x38\x22\x20\x72\x3d\x22\x36\x2e\
+\x39\x22\x2f\x3e\x0a\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\
+\x22\x32\x33\x2e\x31\x22\x20\x63\x79\x3d\x22\x36\x32\x2e\x36\x22\
+\x20\x72\x3d\x22\x36\x2e\x39\x22\x2f\x3e\x0a\x3c\x63\x69\x72\x63\
+\x6c\x65\x20\x63\x78\x3d\x22\x35\x35\x2e\x38\x22\x20\x63\x79\x3d\
+\x22\x37\x37\x2e\x36\x22\x20\x72\x3d\x22\x36\x2e\x39\x22\x2f\x3e\
+\x0a\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x37\x37\x2e\
+\x32\x22\x20\x63\x79\x3d\x22\x34\x36\x2e\x37\x22\x20\x72\x3d\x22\
+\x36\x2e\x39\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x03\xe9\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\
+\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x67\x20\x69\x64\x3d\x22\x53\x6f\x6c\x69\
+\x64\x22\x3e\x0a\x09\x3c\x67\x3e\x0a\x09\x09\x3c\x70\x61\x74\x68\
+\x20\x63\x6c\x61\x73\x73\x3d\x22\x73\x74\x30\x22\x20\x64\x3d\x22\
+\x4d\x35\x30\x2c\x31\x33\x2e\x36\x63\x2d\x32\x30\x2c\x30\x2d\x33\
+\x36\x2e\x33\x2c\x31\x36\x2e\x33\x2d\x33\x36\x2e\x33\x2c\x33\x36\
+\x2e\x33\x63\x30\x2c\x32\x30\x2c\x31\x36\x2e\x33\x2c\x33\x36\x2e\
+\x33\x2c\x33\x36\x2e\x33\x2c\x33\x36\x2e\x33\x43\x37\x30\x2c\x38\
+\x36\x2e\x33\x2c\x38\x36\x2e\x33\x2c\x37\x30\x2c\x38\x36\x2e\x33\
+\x2c\x35\x30\x0a\x09\x09\x09\x43\x38\x36\x2e\x33\x2c\x32\x39\x2e\
+\x39\x2c\x37\x30\x2c\x31\x33\x2e\x36\x2c\x35\x30\x2c\x31\x33\x2e\
+\x36\x7a\x20\x4d\x35\x30\x2c\x37\x39\x63\x2d\x31\x36\x2c\x30\x2d\
+\x32\x39\x2e\x31\x2d\x31\x33\x2d\x32\x39\x2e\x31\x2d\x32\x39\x2e\
+\x31\x63\x30\x2d\x31\x36\x2c\x31\x33\x2d\x32\x39\x2e\x31\x2c\x32\
+\x39\x2e\x31\x2d\x32\x39\x2e\x31\x43\x36\x36\x2c\x32\x30\x2e\x39\
+\x2c\x37\x39\x2c\x33\x33\x2e\x39\x2c\x37\x39\x2c\x35\x30\x43\x37\
+\x39\x2c\x36\x36\x2c\x36\x36\x2c\x37\x39\x2c\x35\x30\x2c\x37\x39\
+\x7a\x22\x2f\x3e\x0a\x09\x09\x3c\x70\x6f\x6c\x79\x67\x6f\x6e\x20\
+\x63\x6c\x61\x73\x73\x3d\x22\x73\x74\x30\x22\x20\x70\x6f\x69\x6e\
+\x74\x73\x3d\x22\x35\x33\x2e\x36\x2c\x33\x31\x2e\x38\x20\x34\x36\
+\x2e\x33\x2c\x33\x31\x2e\x38\x20\x34\x36\x2e\x33\x2c\x34\x36\x2e\
+\x33\x20\x33\x31\x2e\x38\x2c\x34\x36\x2e\x33\x20\x33\x31\x2e\x38\
+\x2c\x35\x33\x2e\x36\x20\x34\x36\x2e\x33\x2c\x35\x33\x2e\x36\x20\
+\x34\x36\x2e\x33\x2c\x36\x38\x2e\x31\x20\x35\x33\x2e\x36\x2c\x36\
+\x38\x2e\x31\x20\x35\x33\x2e\x36\x2c\x35\x33\x2e\x36\x20\x0a\x09\
+\x09\x09\x36\x38\x2e\x31\x2c\x35\x33\x2e\x36\x20\x36\x38\x2e\x31\
+\x2c\x34\x36\x2e\x33\x20\x35\x33\x2e\x36\x2c\x34\x36\x2e\x33\x20\
+\x09\x09\x22\x2f\x3e\x0a\x09\x3c\x2f\x67\x3e\x0a\x3c\x2f\x67\x3e\
+\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x03\x24\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\
+\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x34\x35\
+\x22\x20\x79\x3d\x22\x32\x31\x2e\x33\x22\x20\x74\x72\x61\x6e\x73\
+\x66\x6f\x72\x6d\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\x30\x2e\x37\
+\x31\x31\x32\x20\x2d\x30\x2e\x37\x30\x32\x39\x20\x30\x2e\x37\x30\
+\x32\x39\x20\x30\x2e\x37\x31\x31\x32\x20\x2d\x32\x31\x2e\x36\x37\
+\x39\x31\x20\x35\x30\x2e\x30\x32\x34\x29\x22\x20\x77\x69\x64\x74\
+\x68\x3d\x22\x31\x30\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x36\
+\x30\x2e\x32\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\
+\x31\x39\x2e\x39\x22\x20\x79\x3d\x22\x34\x36\x2e\x34\x22\x20\x74\
+\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\x74\x72\x69\x78\
+\x28\x30\x2e\x37\x31\x31\x33\x20\x2d\x30\x2e\x37\x30\x32\x39\x20\
+\x30\x2e\x37\x30\x32\x39\x20\x30\x2e\x37\x31\x31\x33\x20\x2d\x32\
+\x31\x2e\x37\x32\x38\x34\x20\x34\x39\x2e\x39\x39\x38\x38\x29\x22\
+\x20\x77\x69\x64\x74\x68\x3d\x22\x36\x30\x2e\x32\x22\x20\x68\x65\
+\x69\x67\x68\x74\x3d\x22\x31\x30\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\
+\x67\x3e\x0a\
+\x00\x00\x04\x01\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\
+\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x36\x36\x2e\x37\x2c\x35\x34\x2e\x34\
+\x68\x2d\x36\x56\x33\x37\x2e\x39\x48\x34\x35\x2e\x34\x76\x2d\x36\
+\x68\x31\x36\x2e\x33\x63\x32\x2e\x38\x2c\x30\x2c\x35\x2c\x32\x2e\
+\x32\x2c\x35\x2c\x35\x56\x35\x34\x2e\x34\x7a\x22\x2f\x3e\x0a\x3c\
+\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x35\x33\x2e\x34\x2c\x36\x37\
+\x2e\x34\x48\x33\x36\x2e\x33\x63\x2d\x32\x2e\x38\x2c\x30\x2d\x35\
+\x2d\x32\x2e\x32\x2d\x35\x2d\x35\x56\x34\x35\x2e\x31\x68\x36\x76\
+\x31\x36\x2e\x33\x68\x31\x36\x2e\x31\x56\x36\x37\x2e\x34\x7a\x22\
+\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x34\x32\x2e\
+\x35\x2c\x34\x37\x2e\x36\x48\x32\x32\x2e\x39\x63\x2d\x32\x2e\x38\
+\x2c\x30\x2d\x35\x2d\x32\x2e\x32\x2d\x35\x2d\x35\x56\x32\x33\x63\
+\x30\x2d\x32\x2e\x38\x2c\x32\x2e\x32\x2d\x35\x2c\x35\x2d\x35\x68\
+\x31\x39\x2e\x36\x63\x32\x2e\x38\x2c\x30\x2c\x35\x2c\x32\x2e\x32\
+\x2c\x35\x2c\x35\x76\x31\x39\x2e\x36\x43\x34\x37\x2e\x35\x2c\x34\
+\x35\x2e\x34\x2c\x34\x35\x2e\x33\x2c\x34\x37\x2e\x36\x2c\x34\x32\
+\x2e\x35\x2c\x34\x37\x2e\x36\x7a\x20\x4d\x32\x33\x2e\x39\x2c\x34\
+\x31\x2e\x36\x0a\x09\x68\x31\x37\x2e\x36\x56\x32\x34\x48\x32\x33\
+\x2e\x39\x56\x34\x31\x2e\x36\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\x74\
+\x68\x20\x64\x3d\x22\x4d\x37\x35\x2e\x37\x2c\x38\x31\x2e\x33\x48\
+\x35\x36\x2e\x31\x63\x2d\x32\x2e\x38\x2c\x30\x2d\x35\x2d\x32\x2e\
+\x32\x2d\x35\x2d\x35\x56\x35\x36\x2e\x38\x63\x30\x2d\x32\x2e\x38\
+\x2c\x32\x2e\x32\x2d\x35\x2c\x35\x2d\x35\x68\x31\x39\x2e\x36\x63\
+\x32\x2e\x38\x2c\x30\x2c\x35\x2c\x32\x2e\x32\x2c\x35\x2c\x35\x76\
+\x31\x39\x2e\x36\x43\x38\x30\x2e\x37\x2c\x37\x39\x2e\x31\x2c\x37\
+\x38\x2e\x35\x2c\x38\x31\x2e\x33\x2c\x37\x35\x2e\x37\x2c\x38\x31\
+\x2e\x33\x7a\x0a\x09\x20\x4d\x35\x37\x2e\x31\x2c\x37\x35\x2e\x33\
+\x68\x31\x37\x2e\x36\x56\x35\x37\x2e\x38\x48\x35\x37\x2e\x31\x56\
+\x37\x35\x2e\x33\x7a\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\
+\x00\x00\x06\x56\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x36\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\
+\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x31\x33\
+\x2e\x31\x22\x20\x79\x3d\x22\x32\x33\x2e\x31\x22\x20\x74\x72\x61\
+\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\x30\
+\x2e\x37\x30\x37\x31\x20\x2d\x30\x2e\x37\x30\x37\x31\x20\x30\x2e\
+\x37\x30\x37\x31\x20\x30\x2e\x37\x30\x37\x31\x20\x2d\x31\x30\x2e\
+\x30\x35\x34\x36\x20\x32\x36\x2e\x30\x35\x38\x31\x29\x22\x20\x77\
+\x69\x64\x74\x68\x3d\x22\x32\x36\x2e\x37\x22\x20\x68\x65\x69\x67\
+\x68\x74\x3d\x22\x34\x2e\x31\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\
+\x20\x78\x3d\x22\x33\x33\x2e\x39\x22\x20\x79\x3d\x22\x32\x33\x2e\
+\x31\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\
+\x74\x72\x69\x78\x28\x30\x2e\x38\x34\x37\x31\x20\x2d\x30\x2e\x35\
+\x33\x31\x35\x20\x30\x2e\x35\x33\x31\x35\x20\x30\x2e\x38\x34\x37\
+\x31\x20\x2d\x36\x2e\x31\x35\x33\x36\x20\x32\x38\x2e\x39\x34\x36\
+\x31\x29\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x36\x2e\x37\x22\
+\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x34\x2e\x31\x22\x2f\x3e\x0a\
+\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x35\x36\x2e\x37\x22\x20\x79\
+\x3d\x22\x32\x33\x2e\x31\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\
+\x6d\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\x30\x2e\x39\x33\x34\x35\
+\x20\x2d\x30\x2e\x33\x35\x36\x20\x30\x2e\x33\x35\x36\x20\x30\x2e\
+\x39\x33\x34\x35\x20\x2d\x34\x2e\x33\x37\x32\x33\x20\x32\x36\x2e\
+\x35\x37\x35\x32\x29\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x36\
+\x2e\x37\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x34\x2e\x31\x22\
+\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x31\x33\x2e\x31\
+\x22\x20\x79\x3d\x22\x34\x37\x2e\x33\x22\x20\x74\x72\x61\x6e\x73\
+\x66\x6f\x72\x6d\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\x30\x2e\x37\
+\x30\x37\x31\x20\x2d\x30\x2e\x37\x30\x37\x31\x20\x30\x2e\x37\x30\
+\x37\x31\x20\x30\x2e\x37\x30\x37\x31\x20\x2d\x32\x37\x2e\x31\x35\
+\x34\x36\x20\x33\x33\x2e\x31\x34\x31\x32\x29\x22\x20\x77\x69\x64\
+\x74\x68\x3d\x22\x32\x36\x2e\x37\x22\x20\x68\x65\x69\x67\x68\x74\
+\x3d\x22\x34\x2e\x31\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\
+\x3d\x22\x33\x33\x2e\x39\x22\x20\x79\x3d\x22\x34\x37\x2e\x33\x22\
+\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\x74\x72\
+\x69\x78\x28\x30\x2e\x38\x32\x30\x39\x20\x2d\x30\x2e\x35\x37\x31\
+\x31\x20\x30\x2e\x35\x37\x31\x31\x20\x30\x2e\x38\x32\x30\x39\x20\
+\x2d\x31\x39\x2e\x37\x32\x35\x20\x33\x35\x2e\x38\x30\x38\x34\x29\
+\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x36\x2e\x37\x22\x20\x68\
+\x65\x69\x67\x68\x74\x3d\x22\x34\x2e\x31\x22\x2f\x3e\x0a\x3c\x72\
+\x65\x63\x74\x20\x78\x3d\x22\x35\x36\x2e\x37\x22\x20\x79\x3d\x22\
+\x34\x37\x2e\x33\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\
+\x22\x6d\x61\x74\x72\x69\x78\x28\x30\x2e\x39\x36\x38\x39\x20\x2d\
+\x30\x2e\x32\x34\x37\x36\x20\x30\x2e\x32\x34\x37\x36\x20\x30\x2e\
+\x39\x36\x38\x39\x20\x2d\x31\x30\x2e\x30\x33\x37\x38\x20\x31\x38\
+\x2e\x38\x36\x38\x36\x29\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\
+\x36\x2e\x37\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x34\x2e\x31\
+\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x31\x33\x2e\
+\x31\x22\x20\x79\x3d\x22\x37\x34\x22\x20\x74\x72\x61\x6e\x73\x66\
+\x6f\x72\x6d\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\x30\x2e\x38\x32\
+\x30\x39\x20\x2d\x30\x2e\x35\x37\x31\x31\x20\x30\x2e\x35\x37\x31\
+\x31\x20\x30\x2e\x38\x32\x30\x39\x20\x2d\x33\x38\x2e\x37\x30\x37\
+\x31\x20\x32\x38\x2e\x37\x31\x37\x39\x29\x22\x20\x77\x69\x64\x74\
+\x68\x3d\x22\x32\x36\x2e\x37\x22\x20\x68\x65\x69\x67\x68\x74\x3d\
+\x22\x34\x2e\x31\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\
+\x22\x33\x33\x2e\x39\x22\x20\x79\x3d\x22\x37\x34\x22\x20\x74\x72\
+\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\
+\x30\x2e\x38\x34\x37\x31\x20\x2d\x30\x2e\x35\x33\x31\x35\x20\x30\
+\x2e\x35\x33\x31\x35\x20\x30\x2e\x38\x34\x37\x31\x20\x2d\x33\x33\
+\x2e\x32\x30\x35\x31\x20\x33\x36\x2e\x37\x32\x39\x39\x29\x22\x20\
+\x77\x69\x64\x74\x68\x3d\x22\x32\x36\x2e\x37\x22\x20\x68\x65\x69\
+\x67\x68\x74\x3d\x22\x34\x2e\x31\x22\x2f\x3e\x0a\x3c\x72\x65\x63\
+\x74\x20\x78\x3d\x22\x35\x36\x2e\x37\x22\x20\x79\x3d\x22\x37\x34\
+\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\x74\
+\x72\x69\x78\x28\x30\x2e\x39\x39\x34\x36\x20\x2d\x30\x2e\x31\x30\
+\x33\x35\x20\x30\x2e\x31\x30\x33\x35\x20\x30\x2e\x39\x39\x34\x36\
+\x20\x2d\x37\x2e\x34\x39\x39\x35\x20\x37\x2e\x36\x35\x37\x39\x29\
+\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x36\x2e\x37\x22\x20\x68\
+\x65\x69\x67\x68\x74\x3d\x22\x34\x2e\x31\x22\x2f\x3e\x0a\x3c\x2f\
+\x73\x76\x67\x3e\x0a\
+\x00\x00\x08\x23\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x36\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x32\x30\x30\x20\x32\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x32\x30\x30\x20\
+\x32\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x33\x39\x2c\x20\x32\x33\x35\x2c\x20\x32\x33\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x33\x39\x2c\x20\x32\x33\x35\x2c\x20\x32\
+\x33\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x32\x33\x39\x2c\x20\x32\x33\x35\x2c\x20\
+\x32\x33\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x33\x39\x2c\x20\x32\x33\x35\x2c\x20\x32\
+\x33\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x6d\x20\x30\x2c\x30\x20\x63\x20\x2d\x31\
+\x2e\x32\x30\x33\x30\x37\x38\x35\x2c\x36\x33\x2e\x31\x31\x35\x32\
+\x32\x33\x20\x30\x2c\x32\x30\x30\x20\x30\x2c\x32\x30\x30\x20\x7a\
+\x20\x6d\x20\x36\x37\x2e\x32\x30\x38\x39\x38\x34\x2c\x32\x38\x2e\
+\x36\x36\x34\x30\x36\x32\x20\x63\x20\x2d\x32\x2e\x39\x34\x30\x36\
+\x2c\x30\x2e\x30\x32\x37\x32\x20\x2d\x36\x2e\x31\x38\x37\x38\x37\
+\x31\x2c\x30\x2e\x32\x36\x38\x32\x31\x37\x20\x2d\x37\x2e\x36\x30\
+\x37\x34\x32\x32\x2c\x30\x2e\x36\x34\x32\x35\x37\x39\x20\x2d\x38\
+\x2e\x31\x38\x38\x37\x37\x37\x2c\x32\x2e\x31\x35\x39\x35\x33\x31\
+\x20\x2d\x31\x37\x2e\x37\x39\x39\x38\x39\x36\x2c\x31\x30\x2e\x32\
+\x39\x30\x36\x32\x34\x20\x2d\x32\x32\x2e\x32\x30\x31\x31\x37\x31\
+\x2c\x31\x38\x2e\x37\x38\x31\x32\x35\x20\x2d\x32\x2e\x35\x30\x39\
+\x31\x32\x31\x2c\x34\x2e\x38\x34\x30\x34\x31\x38\x20\x2d\x35\x2e\
+\x33\x37\x36\x33\x33\x36\x2c\x31\x32\x2e\x38\x34\x37\x39\x34\x37\
+\x20\x2d\x36\x2e\x34\x39\x34\x31\x34\x31\x2c\x31\x38\x2e\x31\x34\
+\x32\x35\x37\x38\x20\x2d\x30\x2e\x35\x32\x30\x36\x34\x38\x2c\x32\
+\x2e\x34\x36\x36\x31\x33\x20\x2d\x30\x2e\x36\x31\x32\x34\x31\x33\
+\x2c\x33\x2e\x34\x38\x37\x38\x36\x33\x20\x2d\x30\x2e\x36\x31\x39\
+\x31\x34\x31\x2c\x36\x2e\x38\x34\x31\x37\x39\x37\x20\x2d\x30\x2e\
+\x30\x30\x36\x38\x2c\x33\x2e\x33\x31\x30\x38\x35\x31\x20\x30\x2e\
+\x30\x37\x32\x39\x39\x2c\x34\x2e\x32\x37\x31\x31\x38\x38\x20\x30\
+\x2e\x35\x30\x31\x39\x35\x33\x2c\x35\x2e\x39\x38\x30\x34\x36\x38\
+\x20\x31\x2e\x35\x38\x34\x36\x33\x2c\x36\x2e\x33\x31\x34\x32\x32\
+\x33\x20\x35\x2e\x32\x31\x35\x38\x33\x31\x2c\x31\x31\x2e\x38\x31\
+\x36\x39\x34\x37\x20\x31\x31\x2e\x37\x33\x30\x34\x36\x39\x2c\x31\
+\x37\x2e\x37\x37\x35\x33\x39\x31\x20\x31\x2e\x31\x37\x31\x37\x39\
+\x34\x2c\x31\x2e\x30\x37\x31\x37\x34\x39\x20\x34\x2e\x33\x32\x32\
+\x37\x31\x34\x2c\x33\x2e\x37\x38\x35\x37\x30\x35\x20\x37\x2e\x30\
+\x30\x31\x39\x35\x33\x2c\x36\x2e\x30\x33\x31\x32\x35\x35\x20\x39\
+\x2e\x35\x32\x39\x30\x31\x33\x2c\x37\x2e\x39\x38\x36\x35\x20\x31\
+\x32\x2e\x36\x35\x38\x33\x38\x36\x2c\x31\x31\x2e\x38\x31\x33\x31\
+\x34\x20\x31\x37\x2e\x31\x38\x31\x36\x34\x31\x2c\x32\x31\x2e\x30\
+\x31\x37\x35\x37\x20\x32\x2e\x35\x36\x32\x34\x39\x37\x2c\x35\x2e\
+\x32\x31\x34\x34\x20\x34\x2e\x34\x34\x36\x31\x2c\x39\x2e\x39\x32\
+\x32\x33\x33\x20\x37\x2e\x31\x39\x33\x33\x35\x39\x2c\x31\x37\x2e\
+\x39\x37\x38\x35\x32\x20\x31\x2e\x31\x30\x39\x35\x2c\x33\x2e\x32\
+\x35\x33\x35\x20\x32\x2e\x35\x30\x39\x31\x39\x37\x2c\x36\x2e\x39\
+\x35\x38\x34\x39\x20\x33\x2e\x31\x31\x31\x33\x32\x38\x2c\x38\x2e\
+\x32\x33\x34\x33\x37\x20\x35\x2e\x31\x37\x30\x38\x38\x32\x2c\x31\
+\x30\x2e\x39\x35\x36\x37\x37\x20\x31\x35\x2e\x34\x37\x39\x35\x34\
+\x39\x2c\x32\x30\x2e\x37\x34\x38\x39\x36\x20\x32\x34\x2e\x36\x32\
+\x34\x39\x39\x38\x2c\x32\x33\x2e\x33\x39\x30\x36\x33\x20\x31\x2e\
+\x37\x30\x34\x31\x36\x2c\x30\x2e\x34\x39\x32\x32\x34\x20\x35\x2e\
+\x34\x31\x35\x39\x32\x2c\x31\x2e\x31\x30\x39\x33\x39\x20\x38\x2e\
+\x34\x36\x32\x38\x39\x2c\x31\x2e\x34\x30\x38\x32\x20\x30\x2e\x35\
+\x31\x30\x35\x39\x2c\x30\x2e\x30\x35\x30\x31\x20\x33\x2e\x38\x30\
+\x30\x34\x33\x2c\x30\x2e\x30\x35\x37\x39\x20\x37\x2e\x33\x31\x30\
+\x35\x35\x2c\x30\x2e\x30\x31\x35\x36\x20\x34\x2e\x37\x36\x39\x39\
+\x33\x2c\x2d\x30\x2e\x30\x35\x37\x37\x20\x37\x2e\x32\x36\x39\x32\
+\x36\x2c\x2d\x30\x2e\x31\x39\x37\x39\x32\x20\x39\x2e\x38\x39\x36\
+\x34\x38\x2c\x2d\x30\x2e\x35\x35\x32\x37\x34\x20\x31\x30\x2e\x36\
+\x37\x33\x36\x33\x2c\x2d\x31\x2e\x34\x34\x31\x34\x39\x20\x31\x39\
+\x2e\x34\x32\x34\x37\x35\x2c\x2d\x34\x2e\x34\x32\x36\x30\x37\x20\
+\x32\x36\x2e\x30\x32\x33\x34\x34\x2c\x2d\x38\x2e\x38\x37\x36\x39\
+\x35\x20\x35\x2e\x34\x32\x30\x32\x39\x2c\x2d\x33\x2e\x36\x35\x36\
+\x30\x34\x20\x31\x30\x2e\x39\x34\x31\x30\x34\x2c\x2d\x38\x2e\x32\
+\x35\x30\x36\x35\x20\x31\x33\x2e\x37\x35\x2c\x2d\x31\x31\x2e\x34\
+\x34\x31\x34\x31\x20\x37\x2e\x34\x37\x37\x31\x2c\x2d\x38\x2e\x34\
+\x39\x33\x33\x20\x39\x2e\x36\x36\x37\x30\x31\x2c\x2d\x31\x37\x2e\
+\x37\x33\x38\x38\x32\x20\x37\x2e\x39\x38\x38\x32\x38\x2c\x2d\x33\
+\x33\x2e\x37\x32\x30\x37\x20\x2d\x31\x2e\x30\x32\x31\x32\x38\x2c\
+\x2d\x39\x2e\x37\x32\x32\x38\x32\x20\x2d\x33\x2e\x33\x37\x32\x32\
+\x36\x2c\x2d\x31\x36\x2e\x30\x34\x33\x38\x20\x2d\x37\x2e\x34\x35\
+\x31\x31\x37\x2c\x2d\x32\x30\x2e\x30\x32\x39\x33\x20\x2d\x31\x2e\
+\x36\x37\x34\x37\x39\x2c\x2d\x31\x2e\x36\x33\x36\x34\x31\x39\x20\
+\x2d\x32\x2e\x31\x37\x39\x39\x32\x2c\x2d\x32\x2e\x30\x32\x33\x35\
+\x35\x39\x20\x2d\x33\x2e\x37\x39\x31\x30\x31\x2c\x2d\x32\x2e\x39\
+\x31\x30\x31\x35\x33\x20\x2d\x34\x2e\x31\x36\x39\x38\x37\x2c\x2d\
+\x32\x2e\x32\x39\x34\x36\x35\x37\x20\x2d\x39\x2e\x38\x36\x34\x36\
+\x36\x2c\x2d\x32\x2e\x38\x33\x35\x36\x30\x31\x20\x2d\x32\x31\x2e\
+\x33\x35\x31\x35\x37\x2c\x2d\x32\x2e\x30\x32\x35\x33\x39\x31\x20\
+\x2d\x31\x31\x2e\x37\x39\x36\x31\x31\x2c\x30\x2e\x38\x33\x32\x30\
+\x31\x38\x20\x2d\x31\x38\x2e\x30\x39\x36\x33\x35\x2c\x30\x2e\x32\
+\x34\x39\x31\x34\x37\x20\x2d\x32\x36\x2e\x32\x32\x34\x36\x31\x2c\
+\x2d\x32\x2e\x34\x32\x37\x37\x33\x34\x20\x43\x20\x31\x30\x34\x2e\
+\x35\x30\x38\x30\x37\x2c\x38\x39\x2e\x30\x35\x34\x32\x36\x36\x20\
+\x39\x37\x2e\x31\x34\x39\x30\x30\x33\x2c\x38\x31\x2e\x39\x39\x37\
+\x39\x39\x39\x20\x39\x34\x2e\x39\x30\x36\x32\x35\x2c\x37\x32\x2e\
+\x34\x35\x37\x30\x33\x31\x20\x39\x34\x2e\x36\x35\x35\x39\x33\x32\
+\x2c\x37\x31\x2e\x33\x39\x32\x39\x35\x38\x20\x39\x34\x2e\x31\x32\
+\x35\x36\x35\x37\x2c\x36\x37\x2e\x39\x36\x33\x37\x39\x38\x20\x39\
+\x33\x2e\x37\x32\x38\x35\x31\x36\x2c\x36\x34\x2e\x38\x33\x37\x38\
+\x39\x31\x20\x39\x31\x2e\x32\x39\x39\x34\x38\x39\x2c\x34\x35\x2e\
+\x37\x31\x39\x37\x31\x37\x20\x38\x39\x2e\x34\x39\x36\x38\x33\x2c\
+\x33\x39\x2e\x32\x35\x33\x37\x37\x35\x20\x38\x35\x2e\x35\x30\x33\
+\x39\x30\x36\x2c\x33\x35\x2e\x33\x32\x38\x31\x32\x35\x20\x38\x32\
+\x2e\x31\x30\x33\x36\x31\x36\x2c\x33\x31\x2e\x39\x38\x35\x31\x32\
+\x39\x20\x37\x37\x2e\x30\x36\x35\x32\x33\x32\x2c\x32\x39\x2e\x36\
+\x32\x31\x31\x38\x20\x37\x31\x2e\x37\x31\x30\x39\x33\x38\x2c\x32\
+\x38\x2e\x38\x36\x31\x33\x32\x38\x20\x63\x20\x2d\x31\x2e\x30\x38\
+\x33\x30\x35\x39\x2c\x2d\x30\x2e\x31\x35\x33\x37\x20\x2d\x32\x2e\
+\x37\x33\x37\x35\x39\x33\x2c\x2d\x30\x2e\x32\x31\x33\x35\x38\x35\
+\x20\x2d\x34\x2e\x35\x30\x31\x39\x35\x34\x2c\x2d\x30\x2e\x31\x39\
+\x37\x32\x36\x36\x20\x7a\x22\x20\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\
+\x3e\x0a\
+\x00\x00\x02\x9d\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x32\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\
+\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x70\x6f\
+\x69\x6e\x74\x73\x3d\x22\x37\x32\x2c\x35\x30\x20\x31\x33\x2e\x38\
+\x2c\x32\x2e\x36\x20\x31\x33\x2e\x38\x2c\x39\x37\x2e\x34\x20\x22\
+\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x37\x31\x22\x20\
+\x79\x3d\x22\x32\x2e\x36\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\
+\x32\x2e\x35\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x39\x34\x2e\
+\x38\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x03\x7f\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x32\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\
+\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x38\
+\x32\x2e\x31\x2c\x38\x39\x2e\x36\x48\x33\x34\x2e\x35\x63\x2d\x35\
+\x2e\x32\x2c\x30\x2d\x39\x2e\x33\x2d\x33\x2e\x39\x2d\x39\x2e\x33\
+\x2d\x38\x2e\x39\x76\x2d\x37\x2e\x33\x68\x31\x31\x2e\x32\x76\x35\
+\x2e\x35\x68\x34\x33\x2e\x39\x56\x33\x37\x2e\x32\x68\x2d\x35\x2e\
+\x36\x56\x32\x36\x2e\x35\x68\x37\x2e\x35\x63\x35\x2e\x32\x2c\x30\
+\x2c\x39\x2e\x33\x2c\x33\x2e\x39\x2c\x39\x2e\x33\x2c\x38\x2e\x39\
+\x76\x34\x35\x2e\x33\x0a\x09\x43\x39\x31\x2e\x34\x2c\x38\x35\x2e\
+\x37\x2c\x38\x37\x2e\x33\x2c\x38\x39\x2e\x36\x2c\x38\x32\x2e\x31\
+\x2c\x38\x39\x2e\x36\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\
+\x64\x3d\x22\x4d\x36\x35\x2e\x33\x2c\x37\x33\x2e\x35\x48\x31\x37\
+\x2e\x39\x63\x2d\x35\x2e\x32\x2c\x30\x2d\x39\x2e\x33\x2d\x33\x2e\
+\x39\x2d\x39\x2e\x33\x2d\x38\x2e\x39\x56\x31\x39\x2e\x33\x63\x30\
+\x2d\x35\x2c\x34\x2e\x31\x2d\x38\x2e\x39\x2c\x39\x2e\x33\x2d\x38\
+\x2e\x39\x68\x34\x37\x2e\x35\x63\x35\x2e\x32\x2c\x30\x2c\x39\x2e\
+\x33\x2c\x33\x2e\x39\x2c\x39\x2e\x33\x2c\x38\x2e\x39\x76\x34\x35\
+\x2e\x33\x0a\x09\x43\x37\x34\x2e\x37\x2c\x36\x39\x2e\x36\x2c\x37\
+\x30\x2e\x36\x2c\x37\x33\x2e\x35\x2c\x36\x35\x2e\x33\x2c\x37\x33\
+\x2e\x35\x7a\x20\x4d\x31\x39\x2e\x38\x2c\x36\x32\x2e\x38\x68\x34\
+\x33\x2e\x37\x56\x32\x31\x2e\x31\x48\x31\x39\x2e\x38\x56\x36\x32\
+\x2e\x38\x7a\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x02\x7a\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\
+\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x70\x6f\
+\x69\x6e\x74\x73\x3d\x22\x32\x32\x2e\x38\x2c\x36\x35\x2e\x38\x20\
+\x32\x39\x2e\x39\x2c\x31\x38\x2e\x31\x20\x38\x35\x2e\x37\x2c\x36\
+\x37\x2e\x34\x20\x35\x31\x2e\x39\x2c\x37\x39\x2e\x35\x20\x22\x2f\
+\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x03\x8d\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\
+\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x33\x31\x2e\x38\x2c\x35\x36\x2e\x34\
+\x63\x2d\x31\x2e\x39\x2c\x30\x2d\x33\x2e\x38\x2d\x30\x2e\x38\x2d\
+\x35\x2d\x32\x2e\x34\x63\x2d\x32\x2e\x32\x2d\x32\x2e\x38\x2d\x31\
+\x2e\x38\x2d\x36\x2e\x39\x2c\x31\x2d\x39\x2e\x31\x6c\x33\x35\x2e\
+\x31\x2d\x32\x38\x2e\x32\x63\x32\x2e\x38\x2d\x32\x2e\x32\x2c\x36\
+\x2e\x39\x2d\x31\x2e\x38\x2c\x39\x2e\x31\x2c\x31\x63\x32\x2e\x32\
+\x2c\x32\x2e\x38\x2c\x31\x2e\x38\x2c\x36\x2e\x39\x2d\x31\x2c\x39\
+\x2e\x31\x4c\x33\x35\x2e\x38\x2c\x35\x34\x2e\x39\x0a\x09\x43\x33\
+\x34\x2e\x36\x2c\x35\x35\x2e\x39\x2c\x33\x33\x2e\x32\x2c\x35\x36\
+\x2e\x34\x2c\x33\x31\x2e\x38\x2c\x35\x36\x2e\x34\x7a\x22\x2f\x3e\
+\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x36\x36\x2e\x39\x2c\
+\x38\x34\x2e\x36\x63\x2d\x31\x2e\x34\x2c\x30\x2d\x32\x2e\x39\x2d\
+\x30\x2e\x35\x2d\x34\x2d\x31\x2e\x34\x4c\x32\x37\x2e\x37\x2c\x35\
+\x34\x2e\x39\x63\x2d\x32\x2e\x38\x2d\x32\x2e\x32\x2d\x33\x2e\x32\
+\x2d\x36\x2e\x33\x2d\x31\x2d\x39\x2e\x31\x63\x32\x2e\x32\x2d\x32\
+\x2e\x38\x2c\x36\x2e\x33\x2d\x33\x2e\x32\x2c\x39\x2e\x31\x2d\x31\
+\x6c\x33\x35\x2e\x31\x2c\x32\x38\x2e\x32\x63\x32\x2e\x38\x2c\x32\
+\x2e\x32\x2c\x33\x2e\x32\x2c\x36\x2e\x33\x2c\x31\x2c\x39\x2e\x31\
+\x0a\x09\x43\x37\x30\x2e\x36\x2c\x38\x33\x2e\x38\x2c\x36\x38\x2e\
+\x38\x2c\x38\x34\x2e\x36\x2c\x36\x36\x2e\x39\x2c\x38\x34\x2e\x36\
+\x7a\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x04\x12\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x31\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\
+\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x72\x65\
+\x63\x74\x20\x78\x3d\x22\x31\x33\x22\x20\x79\x3d\x22\x31\x32\x22\
+\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\x2e\x38\x22\x20\x68\x65\
+\x69\x67\x68\x74\x3d\x22\x31\x36\x2e\x38\x22\x2f\x3e\x0a\x3c\x72\
+\x65\x63\x74\x20\x78\x3d\x22\x34\x31\x2e\x37\x22\x20\x79\x3d\x22\
+\x31\x32\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\x2e\x38\x22\
+\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x2e\x38\x22\x2f\x3e\
+\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x37\x30\x2e\x34\x22\x20\
+\x79\x3d\x22\x31\x32\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\
+\x2e\x38\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x2e\x38\
+\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x31\x33\x22\
+\x20\x79\x3d\x22\x34\x31\x2e\x35\x22\x20\x77\x69\x64\x74\x68\x3d\
+\x22\x31\x36\x2e\x38\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\
+\x36\x2e\x38\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\
+\x34\x31\x2e\x37\x22\x20\x79\x3d\x22\x34\x31\x2e\x35\x22\x20\x77\
+\x69\x64\x74\x68\x3d\x22\x31\x36\x2e\x38\x22\x20\x68\x65\x69\x67\
+\x68\x74\x3d\x22\x31\x36\x2e\x38\x22\x2f\x3e\x0a\x3c\x72\x65\x63\
+\x74\x20\x78\x3d\x22\x37\x30\x2e\x34\x22\x20\x79\x3d\x22\x34\x31\
+\x2e\x35\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\x2e\x38\x22\
+\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x2e\x38\x22\x2f\x3e\
+\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x31\x32\x2e\x39\x22\x20\
+\x79\x3d\x22\x37\x31\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\
+\x2e\x38\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x2e\x38\
+\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x34\x31\x2e\
+\x36\x22\x20\x79\x3d\x22\x37\x31\x22\x20\x77\x69\x64\x74\x68\x3d\
+\x22\x31\x36\x2e\x38\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\
+\x36\x2e\x38\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\
+\x37\x30\x2e\x33\x22\x20\x79\x3d\x22\x37\x31\x22\x20\x77\x69\x64\
+\x74\x68\x3d\x22\x31\x36\x2e\x38\x22\x20\x68\x65\x69\x67\x68\x74\
+\x3d\x22\x31\x36\x2e\x38\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\
+\x0a\
+\x00\x00\x02\x75\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x36\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\
+\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x6f\
+\x6c\x79\x67\x6f\x6e\x20\x70\x6f\x69\x6e\x74\x73\x3d\x22\x37\x39\
+\x2e\x31\x2c\x35\x30\x20\x32\x30\x2e\x39\x2c\x32\x2e\x36\x20\x32\
+\x30\x2e\x39\x2c\x39\x37\x2e\x34\x20\x22\x2f\x3e\x0a\x3c\x2f\x73\
+\x76\x67\x3e\x0a\
+\x00\x00\x03\x99\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\
+\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x63\x69\
+\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x35\x39\x2e\x36\x22\x20\x63\
+\x79\x3d\x22\x34\x32\x2e\x37\x22\x20\x72\x3d\x22\x34\x2e\x39\x22\
+\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x34\x31\x2e\
+\x31\x2c\x38\x34\x2e\x32\x63\x2d\x31\x2c\x30\x2d\x32\x2d\x30\x2e\
+\x34\x2d\x32\x2e\x37\x2d\x31\x2e\x33\x6c\x2d\x32\x32\x2d\x32\x36\
+\x2e\x37\x63\x2d\x31\x2e\x32\x2d\x31\x2e\x35\x2d\x31\x2d\x33\x2e\
+\x37\x2c\x30\x2e\x35\x2d\x34\x2e\x39\x6c\x33\x31\x2e\x39\x2d\x32\
+\x36\x2e\x34\x63\x30\x2e\x36\x2d\x30\x2e\x35\x2c\x31\x2e\x34\x2d\
+\x30\x2e\x38\x2c\x32\x2e\x32\x2d\x30\x2e\x38\x63\x30\x2c\x30\x2c\
+\x30\x2c\x30\x2c\x30\x2c\x30\x6c\x32\x37\x2e\x31\x2c\x30\x2e\x31\
+\x0a\x09\x63\x31\x2c\x30\x2c\x32\x2c\x30\x2e\x35\x2c\x32\x2e\x37\
+\x2c\x31\x2e\x33\x63\x30\x2e\x37\x2c\x30\x2e\x38\x2c\x30\x2e\x39\
+\x2c\x31\x2e\x39\x2c\x30\x2e\x37\x2c\x32\x2e\x39\x4c\x37\x36\x2e\
+\x35\x2c\x35\x35\x63\x2d\x30\x2e\x32\x2c\x30\x2e\x38\x2d\x30\x2e\
+\x36\x2c\x31\x2e\x35\x2d\x31\x2e\x32\x2c\x32\x4c\x34\x33\x2e\x33\
+\x2c\x38\x33\x2e\x34\x43\x34\x32\x2e\x37\x2c\x38\x33\x2e\x39\x2c\
+\x34\x31\x2e\x39\x2c\x38\x34\x2e\x32\x2c\x34\x31\x2e\x31\x2c\x38\
+\x34\x2e\x32\x7a\x20\x4d\x32\x34\x2c\x35\x34\x2e\x35\x0a\x09\x6c\
+\x31\x37\x2e\x36\x2c\x32\x31\x2e\x33\x6c\x32\x38\x2e\x33\x2d\x32\
+\x33\x2e\x33\x6c\x34\x2d\x32\x31\x2e\x32\x6c\x2d\x32\x31\x2e\x36\
+\x2d\x30\x2e\x31\x4c\x32\x34\x2c\x35\x34\x2e\x35\x7a\x22\x2f\x3e\
+\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x02\x79\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\
+\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x72\x65\
+\x63\x74\x20\x78\x3d\x22\x33\x2e\x34\x22\x20\x79\x3d\x22\x34\x30\
+\x2e\x36\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x32\x2e\x39\x22\
+\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x38\x2e\x36\x22\x2f\x3e\
+\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x04\x05\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\
+\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x33\
+\x30\x2e\x32\x2c\x37\x37\x2e\x37\x63\x2d\x34\x2e\x37\x2c\x30\x2d\
+\x38\x2e\x36\x2d\x33\x2e\x39\x2d\x38\x2e\x36\x2d\x38\x2e\x36\x73\
+\x33\x2e\x39\x2d\x38\x2e\x36\x2c\x38\x2e\x36\x2d\x38\x2e\x36\x73\
+\x38\x2e\x36\x2c\x33\x2e\x39\x2c\x38\x2e\x36\x2c\x38\x2e\x36\x53\
+\x33\x34\x2e\x39\x2c\x37\x37\x2e\x37\x2c\x33\x30\x2e\x32\x2c\x37\
+\x37\x2e\x37\x7a\x20\x4d\x33\x30\x2e\x32\x2c\x36\x36\x2e\x31\x63\
+\x2d\x31\x2e\x37\x2c\x30\x2d\x33\x2c\x31\x2e\x33\x2d\x33\x2c\x33\
+\x0a\x09\x73\x31\x2e\x33\x2c\x33\x2c\x33\x2c\x33\x73\x33\x2d\x31\
+\x2e\x33\x2c\x33\x2d\x33\x53\x33\x31\x2e\x39\x2c\x36\x36\x2e\x31\
+\x2c\x33\x30\x2e\x32\x2c\x36\x36\x2e\x31\x7a\x22\x2f\x3e\x0a\x3c\
+\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x37\x30\x2e\x31\x2c\x33\x37\
+\x2e\x38\x63\x2d\x34\x2e\x37\x2c\x30\x2d\x38\x2e\x36\x2d\x33\x2e\
+\x39\x2d\x38\x2e\x36\x2d\x38\x2e\x36\x73\x33\x2e\x39\x2d\x38\x2e\
+\x36\x2c\x38\x2e\x36\x2d\x38\x2e\x36\x73\x38\x2e\x36\x2c\x33\x2e\
+\x39\x2c\x38\x2e\x36\x2c\x38\x2e\x36\x53\x37\x34\x2e\x38\x2c\x33\
+\x37\x2e\x38\x2c\x37\x30\x2e\x31\x2c\x33\x37\x2e\x38\x7a\x20\x4d\
+\x37\x30\x2e\x31\x2c\x32\x36\x2e\x32\x63\x2d\x31\x2e\x37\x2c\x30\
+\x2d\x33\x2c\x31\x2e\x33\x2d\x33\x2c\x33\x0a\x09\x73\x31\x2e\x33\
+\x2c\x33\x2c\x33\x2c\x33\x73\x33\x2d\x31\x2e\x33\x2c\x33\x2d\x33\
+\x53\x37\x31\x2e\x38\x2c\x32\x36\x2e\x32\x2c\x37\x30\x2e\x31\x2c\
+\x32\x36\x2e\x32\x7a\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\
+\x3d\x22\x32\x38\x22\x20\x79\x3d\x22\x34\x36\x2e\x37\x22\x20\x74\
+\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\x74\x72\x69\x78\
+\x28\x30\x2e\x37\x30\x32\x37\x20\x2d\x30\x2e\x37\x31\x31\x35\x20\
+\x30\x2e\x37\x31\x31\x35\x20\x30\x2e\x37\x30\x32\x37\x20\x2d\x32\
+\x30\x2e\x31\x38\x34\x33\x20\x35\x30\x2e\x35\x39\x32\x38\x29\x22\
+\x20\x77\x69\x64\x74\x68\x3d\x22\x34\x34\x2e\x38\x22\x20\x68\x65\
+\x69\x67\x68\x74\x3d\x22\x35\x2e\x36\x22\x2f\x3e\x0a\x3c\x2f\x73\
+\x76\x67\x3e\x0a\
+\x00\x00\x02\x7a\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x36\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\
+\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x72\x65\
+\x63\x74\x20\x78\x3d\x22\x32\x32\x2e\x32\x22\x20\x79\x3d\x22\x32\
+\x32\x2e\x32\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x35\x35\x2e\x35\
+\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x35\x35\x2e\x35\x22\x2f\
+\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x02\x6d\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x36\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\
+\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x70\x6f\
+\x69\x6e\x74\x73\x3d\x22\x37\x39\x2e\x31\x2c\x35\x30\x20\x32\x30\
+\x2e\x39\x2c\x32\x2e\x36\x20\x32\x30\x2e\x39\x2c\x39\x37\x2e\x34\
+\x20\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x03\xbd\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x36\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\
+\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x38\
+\x34\x2e\x39\x2c\x34\x35\x2e\x33\x6c\x2d\x36\x2e\x38\x2d\x36\x2e\
+\x38\x56\x32\x31\x2e\x39\x63\x30\x2d\x32\x2e\x36\x2d\x32\x2e\x31\
+\x2d\x34\x2e\x37\x2d\x34\x2e\x37\x2d\x34\x2e\x37\x68\x2d\x34\x2e\
+\x37\x63\x2d\x32\x2e\x36\x2c\x30\x2d\x34\x2e\x37\x2c\x32\x2e\x31\
+\x2d\x34\x2e\x37\x2c\x34\x2e\x37\x76\x32\x2e\x36\x6c\x2d\x39\x2e\
+\x34\x2d\x39\x2e\x34\x63\x2d\x31\x2e\x33\x2d\x31\x2e\x32\x2d\x32\
+\x2e\x35\x2d\x32\x2e\x36\x2d\x34\x2e\x37\x2d\x32\x2e\x36\x0a\x09\
+\x73\x2d\x33\x2e\x34\x2c\x31\x2e\x34\x2d\x34\x2e\x37\x2c\x32\x2e\
+\x36\x4c\x31\x35\x2e\x31\x2c\x34\x35\x2e\x33\x63\x2d\x31\x2e\x35\
+\x2c\x31\x2e\x35\x2d\x32\x2e\x36\x2c\x32\x2e\x36\x2d\x32\x2e\x36\
+\x2c\x34\x2e\x37\x63\x30\x2c\x32\x2e\x36\x2c\x32\x2c\x34\x2e\x37\
+\x2c\x34\x2e\x37\x2c\x34\x2e\x37\x68\x34\x2e\x37\x76\x32\x38\x2e\
+\x31\x63\x30\x2c\x32\x2e\x36\x2c\x32\x2e\x31\x2c\x34\x2e\x37\x2c\
+\x34\x2e\x37\x2c\x34\x2e\x37\x68\x31\x34\x2e\x31\x56\x36\x34\x2e\
+\x31\x0a\x09\x63\x30\x2d\x32\x2e\x36\x2c\x32\x2e\x31\x2d\x34\x2e\
+\x37\x2c\x34\x2e\x37\x2d\x34\x2e\x37\x68\x39\x2e\x34\x63\x32\x2e\
+\x36\x2c\x30\x2c\x34\x2e\x37\x2c\x32\x2e\x31\x2c\x34\x2e\x37\x2c\
+\x34\x2e\x37\x76\x32\x33\x2e\x34\x68\x31\x34\x2e\x31\x63\x32\x2e\
+\x36\x2c\x30\x2c\x34\x2e\x37\x2d\x32\x2e\x31\x2c\x34\x2e\x37\x2d\
+\x34\x2e\x37\x56\x35\x34\x2e\x37\x68\x34\x2e\x37\x63\x32\x2e\x37\
+\x2c\x30\x2c\x34\x2e\x37\x2d\x32\x2c\x34\x2e\x37\x2d\x34\x2e\x37\
+\x0a\x09\x43\x38\x37\x2e\x35\x2c\x34\x37\x2e\x39\x2c\x38\x36\x2e\
+\x34\x2c\x34\x36\x2e\x38\x2c\x38\x34\x2e\x39\x2c\x34\x35\x2e\x33\
+\x7a\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x03\x87\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x32\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\
+\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x38\x32\x2e\x31\x2c\x38\x39\x2e\x36\
+\x48\x33\x34\x2e\x35\x63\x2d\x35\x2e\x32\x2c\x30\x2d\x39\x2e\x33\
+\x2d\x33\x2e\x39\x2d\x39\x2e\x33\x2d\x38\x2e\x39\x76\x2d\x37\x2e\
+\x33\x68\x31\x31\x2e\x32\x76\x35\x2e\x35\x68\x34\x33\x2e\x39\x56\
+\x33\x37\x2e\x32\x68\x2d\x35\x2e\x36\x56\x32\x36\x2e\x35\x68\x37\
+\x2e\x35\x63\x35\x2e\x32\x2c\x30\x2c\x39\x2e\x33\x2c\x33\x2e\x39\
+\x2c\x39\x2e\x33\x2c\x38\x2e\x39\x76\x34\x35\x2e\x33\x0a\x09\x43\
+\x39\x31\x2e\x34\x2c\x38\x35\x2e\x37\x2c\x38\x37\x2e\x33\x2c\x38\
+\x39\x2e\x36\x2c\x38\x32\x2e\x31\x2c\x38\x39\x2e\x36\x7a\x22\x2f\
+\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x36\x35\x2e\x33\
+\x2c\x37\x33\x2e\x35\x48\x31\x37\x2e\x39\x63\x2d\x35\x2e\x32\x2c\
+\x30\x2d\x39\x2e\x33\x2d\x33\x2e\x39\x2d\x39\x2e\x33\x2d\x38\x2e\
+\x39\x56\x31\x39\x2e\x33\x63\x30\x2d\x35\x2c\x34\x2e\x31\x2d\x38\
+\x2e\x39\x2c\x39\x2e\x33\x2d\x38\x2e\x39\x68\x34\x37\x2e\x35\x63\
+\x35\x2e\x32\x2c\x30\x2c\x39\x2e\x33\x2c\x33\x2e\x39\x2c\x39\x2e\
+\x33\x2c\x38\x2e\x39\x76\x34\x35\x2e\x33\x0a\x09\x43\x37\x34\x2e\
+\x37\x2c\x36\x39\x2e\x36\x2c\x37\x30\x2e\x36\x2c\x37\x33\x2e\x35\
+\x2c\x36\x35\x2e\x33\x2c\x37\x33\x2e\x35\x7a\x20\x4d\x31\x39\x2e\
+\x38\x2c\x36\x32\x2e\x38\x68\x34\x33\x2e\x37\x56\x32\x31\x2e\x31\
+\x48\x31\x39\x2e\x38\x56\x36\x32\x2e\x38\x7a\x22\x2f\x3e\x0a\x3c\
+\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x03\xe0\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x38\
+\x30\x2e\x36\x32\x6d\x6d\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\
+\x31\x38\x30\x2e\x36\x32\x6d\x6d\x22\x20\x76\x69\x65\x77\x42\x6f\
+\x78\x3d\x22\x30\x20\x30\x20\x35\x31\x32\x20\x35\x31\x32\x22\x3e\
+\x3c\x73\x74\x79\x6c\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\
+\x74\x2f\x63\x73\x73\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\
+\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\
+\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\
+\x20\x30\x2e\x35\x3b\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\
+\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\
+\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\
+\x79\x3a\x20\x30\x2e\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\
+\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\
+\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\
+\x74\x79\x3a\x20\x30\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\
+\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\
+\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\
+\x79\x3a\x20\x30\x2e\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\
+\x3e\x0a\x20\x20\x3c\x74\x69\x74\x6c\x65\x3e\x41\x72\x74\x62\x6f\
+\x61\x72\x64\x20\x31\x3c\x2f\x74\x69\x74\x6c\x65\x3e\x0a\x20\x20\
+\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x34\x35\x30\x2e\x31\x38\
+\x2c\x33\x33\x35\x2e\x39\x34\x61\x31\x38\x2e\x36\x31\x2c\x31\x38\
+\x2e\x36\x31\x2c\x30\x2c\x30\x2c\x31\x2c\x30\x2c\x32\x36\x2e\x33\
+\x34\x6c\x2d\x36\x32\x2e\x30\x37\x2c\x36\x32\x2e\x30\x36\x63\x2d\
+\x31\x31\x2e\x36\x35\x2c\x31\x31\x2e\x36\x35\x2d\x33\x31\x2e\x37\
+\x39\x2c\x33\x2e\x34\x38\x2d\x33\x31\x2e\x37\x39\x2d\x31\x33\x2e\
+\x31\x37\x76\x2d\x33\x31\x48\x33\x31\x30\x2e\x37\x31\x61\x39\x2e\
+\x32\x39\x2c\x39\x2e\x32\x39\x2c\x30\x2c\x30\x2c\x31\x2d\x36\x2e\
+\x38\x31\x2d\x33\x6c\x2d\x35\x34\x2e\x37\x35\x2d\x35\x38\x2e\x36\
+\x36\x2c\x34\x31\x2e\x33\x38\x2d\x34\x34\x2e\x33\x34\x2c\x34\x31\
+\x2c\x34\x33\x2e\x38\x38\x68\x32\x34\x2e\x38\x33\x76\x2d\x33\x31\
+\x63\x30\x2d\x31\x36\x2e\x36\x33\x2c\x32\x30\x2e\x31\x33\x2d\x32\
+\x34\x2e\x38\x33\x2c\x33\x31\x2e\x37\x39\x2d\x31\x33\x2e\x31\x37\
+\x5a\x6d\x2d\x33\x38\x32\x2e\x35\x31\x2d\x31\x34\x32\x68\x36\x35\
+\x2e\x31\x38\x6c\x34\x31\x2c\x34\x33\x2e\x38\x38\x2c\x34\x31\x2e\
+\x33\x38\x2d\x34\x34\x2e\x33\x34\x2d\x35\x34\x2e\x37\x35\x2d\x35\
+\x38\x2e\x36\x36\x61\x39\x2e\x32\x39\x2c\x39\x2e\x32\x39\x2c\x30\
+\x2c\x30\x2c\x30\x2d\x36\x2e\x38\x2d\x33\x68\x2d\x38\x36\x61\x39\
+\x2e\x33\x31\x2c\x39\x2e\x33\x31\x2c\x30\x2c\x30\x2c\x30\x2d\x39\
+\x2e\x33\x31\x2c\x39\x2e\x33\x31\x76\x34\x33\x2e\x34\x35\x41\x39\
+\x2e\x33\x31\x2c\x39\x2e\x33\x31\x2c\x30\x2c\x30\x2c\x30\x2c\x36\
+\x37\x2e\x36\x37\x2c\x31\x39\x33\x2e\x39\x33\x5a\x6d\x32\x38\x38\
+\x2e\x36\x35\x2c\x30\x76\x33\x31\x63\x30\x2c\x31\x36\x2e\x36\x35\
+\x2c\x32\x30\x2e\x31\x34\x2c\x32\x34\x2e\x38\x31\x2c\x33\x31\x2e\
+\x37\x39\x2c\x31\x33\x2e\x31\x37\x6c\x36\x32\x2e\x30\x37\x2d\x36\
+\x32\x2e\x30\x36\x61\x31\x38\x2e\x36\x31\x2c\x31\x38\x2e\x36\x31\
+\x2c\x30\x2c\x30\x2c\x30\x2c\x30\x2d\x32\x36\x2e\x33\x34\x4c\x33\
+\x38\x38\x2e\x31\x31\x2c\x38\x37\x2e\x36\x36\x43\x33\x37\x36\x2e\
+\x34\x35\x2c\x37\x36\x2c\x33\x35\x36\x2e\x33\x32\x2c\x38\x34\x2e\
+\x32\x2c\x33\x35\x36\x2e\x33\x32\x2c\x31\x30\x30\x2e\x38\x33\x76\
+\x33\x31\x48\x33\x31\x30\x2e\x37\x31\x61\x39\x2e\x32\x39\x2c\x39\
+\x2e\x32\x39\x2c\x30\x2c\x30\x2c\x30\x2d\x36\x2e\x38\x31\x2c\x33\
+\x6c\x2d\x31\x37\x31\x2c\x31\x38\x33\x2e\x32\x36\x48\x36\x37\x2e\
+\x36\x37\x61\x39\x2e\x33\x31\x2c\x39\x2e\x33\x31\x2c\x30\x2c\x30\
+\x2c\x30\x2d\x39\x2e\x33\x31\x2c\x39\x2e\x33\x32\x76\x34\x33\x2e\
+\x34\x35\x61\x39\x2e\x33\x31\x2c\x39\x2e\x33\x31\x2c\x30\x2c\x30\
+\x2c\x30\x2c\x39\x2e\x33\x31\x2c\x39\x2e\x33\x31\x68\x38\x36\x61\
+\x39\x2e\x32\x39\x2c\x39\x2e\x32\x39\x2c\x30\x2c\x30\x2c\x30\x2c\
+\x36\x2e\x38\x2d\x33\x4c\x33\x33\x31\x2e\x34\x39\x2c\x31\x39\x33\
+\x2e\x39\x33\x5a\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x04\x31\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x34\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\
+\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x34\x32\x2e\x31\x2c\x35\x31\x6c\x2d\
+\x32\x39\x2d\x32\x33\x2e\x32\x63\x2d\x32\x2e\x33\x2d\x31\x2e\x38\
+\x2d\x32\x2e\x36\x2d\x35\x2e\x32\x2d\x30\x2e\x38\x2d\x37\x2e\x35\
+\x63\x31\x2e\x38\x2d\x32\x2e\x33\x2c\x35\x2e\x32\x2d\x32\x2e\x36\
+\x2c\x37\x2e\x35\x2d\x30\x2e\x38\x6c\x32\x38\x2e\x39\x2c\x32\x33\
+\x2e\x32\x63\x32\x2e\x33\x2c\x31\x2e\x38\x2c\x32\x2e\x36\x2c\x35\
+\x2e\x32\x2c\x30\x2e\x38\x2c\x37\x2e\x35\x63\x2d\x31\x2c\x31\x2e\
+\x33\x2d\x32\x2e\x36\x2c\x32\x2d\x34\x2e\x31\x2c\x32\x0a\x09\x43\
+\x34\x34\x2e\x33\x2c\x35\x32\x2e\x32\x2c\x34\x33\x2e\x31\x2c\x35\
+\x31\x2e\x38\x2c\x34\x32\x2e\x31\x2c\x35\x31\x7a\x22\x2f\x3e\x0a\
+\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x32\x2e\x34\x2c\x37\
+\x33\x2e\x34\x63\x2d\x31\x2e\x38\x2d\x32\x2e\x33\x2d\x31\x2e\x35\
+\x2d\x35\x2e\x37\x2c\x30\x2e\x38\x2d\x37\x2e\x35\x6c\x32\x38\x2e\
+\x39\x2d\x32\x33\x2e\x32\x63\x32\x2e\x33\x2d\x31\x2e\x38\x2c\x35\
+\x2e\x37\x2d\x31\x2e\x35\x2c\x37\x2e\x35\x2c\x30\x2e\x38\x73\x31\
+\x2e\x35\x2c\x35\x2e\x37\x2d\x30\x2e\x38\x2c\x37\x2e\x35\x6c\x2d\
+\x32\x39\x2c\x32\x33\x2e\x33\x63\x2d\x30\x2e\x39\x2c\x30\x2e\x37\
+\x2d\x32\x2e\x31\x2c\x31\x2e\x32\x2d\x33\x2e\x33\x2c\x31\x2e\x32\
+\x0a\x09\x43\x31\x34\x2e\x39\x2c\x37\x35\x2e\x35\x2c\x31\x33\x2e\
+\x35\x2c\x37\x34\x2e\x38\x2c\x31\x32\x2e\x34\x2c\x37\x33\x2e\x34\
+\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x34\
+\x31\x2e\x34\x2c\x37\x35\x2e\x33\x63\x30\x2d\x32\x2e\x39\x2c\x32\
+\x2e\x33\x2d\x35\x2e\x34\x2c\x35\x2e\x33\x2d\x35\x2e\x34\x6c\x33\
+\x37\x2e\x31\x2d\x30\x2e\x35\x63\x32\x2e\x39\x2c\x30\x2c\x35\x2e\
+\x34\x2c\x32\x2e\x33\x2c\x35\x2e\x34\x2c\x35\x2e\x33\x63\x30\x2c\
+\x32\x2e\x39\x2d\x32\x2e\x33\x2c\x35\x2e\x34\x2d\x35\x2e\x33\x2c\
+\x35\x2e\x34\x6c\x2d\x33\x37\x2e\x32\x2c\x30\x2e\x35\x63\x2d\x31\
+\x2e\x32\x2c\x30\x2d\x32\x2e\x34\x2d\x30\x2e\x34\x2d\x33\x2e\x33\
+\x2d\x31\x2e\x31\x0a\x09\x43\x34\x32\x2e\x32\x2c\x37\x38\x2e\x35\
+\x2c\x34\x31\x2e\x34\x2c\x37\x37\x2e\x31\x2c\x34\x31\x2e\x34\x2c\
+\x37\x35\x2e\x33\x7a\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\
+\x00\x00\x02\xa6\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x38\
+\x30\x2e\x36\x32\x6d\x6d\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\
+\x31\x38\x30\x2e\x36\x32\x6d\x6d\x22\x20\x76\x69\x65\x77\x42\x6f\
+\x78\x3d\x22\x30\x20\x30\x20\x35\x31\x32\x20\x35\x31\x32\x22\x3e\
+\x3c\x73\x74\x79\x6c\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\
+\x74\x2f\x63\x73\x73\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\
+\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\
+\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\
+\x20\x30\x2e\x35\x3b\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\
+\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\
+\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\
+\x79\x3a\x20\x30\x2e\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\
+\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\
+\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\
+\x74\x79\x3a\x20\x30\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\
+\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\
+\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\
+\x79\x3a\x20\x30\x2e\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\
+\x3e\x0a\x20\x20\x3c\x74\x69\x74\x6c\x65\x3e\x41\x72\x74\x62\x6f\
+\x61\x72\x64\x20\x31\x3c\x2f\x74\x69\x74\x6c\x65\x3e\x0a\x20\x20\
+\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x34\x32\x34\x2e\x39\x34\
+\x2c\x32\x37\x31\x2e\x33\x36\x61\x33\x35\x2e\x33\x34\x2c\x33\x35\
+\x2e\x33\x34\x2c\x30\x2c\x30\x2c\x30\x2c\x30\x2d\x35\x30\x4c\x33\
+\x30\x37\x2e\x31\x35\x2c\x31\x30\x33\x2e\x36\x61\x33\x35\x2e\x33\
+\x32\x2c\x33\x35\x2e\x33\x32\x2c\x30\x2c\x30\x2c\x30\x2d\x35\x30\
+\x2c\x30\x4c\x36\x38\x2e\x37\x32\x2c\x32\x39\x32\x2e\x30\x36\x61\
+\x33\x35\x2e\x33\x33\x2c\x33\x35\x2e\x33\x33\x2c\x30\x2c\x30\x2c\
+\x30\x2c\x30\x2c\x35\x30\x6c\x37\x30\x2e\x36\x37\x2c\x37\x30\x2e\
+\x36\x37\x61\x33\x35\x2e\x33\x34\x2c\x33\x35\x2e\x33\x34\x2c\x30\
+\x2c\x30\x2c\x30\x2c\x32\x35\x2c\x31\x30\x2e\x33\x35\x48\x34\x32\
+\x36\x2e\x34\x36\x61\x38\x2e\x38\x33\x2c\x38\x2e\x38\x33\x2c\x30\
+\x2c\x30\x2c\x30\x2c\x38\x2e\x38\x33\x2d\x38\x2e\x38\x33\x56\x33\
+\x39\x38\x2e\x31\x37\x63\x30\x2d\x34\x2e\x38\x38\x2d\x34\x2d\x35\
+\x2e\x38\x39\x2d\x38\x2e\x38\x33\x2d\x35\x2e\x38\x39\x48\x33\x30\
+\x32\x2e\x36\x39\x4c\x34\x32\x34\x2e\x39\x34\x2c\x32\x37\x31\x2e\
+\x33\x36\x5a\x4d\x32\x30\x35\x2e\x31\x2c\x31\x39\x38\x2e\x37\x35\
+\x2c\x33\x32\x37\x2e\x32\x39\x2c\x33\x32\x33\x2e\x38\x31\x6c\x2d\
+\x36\x38\x2e\x34\x37\x2c\x36\x38\x2e\x34\x37\x48\x31\x35\x39\x2e\
+\x36\x39\x4c\x38\x39\x2c\x33\x31\x34\x2e\x38\x33\x2c\x32\x30\x35\
+\x2e\x31\x2c\x31\x39\x38\x2e\x37\x35\x5a\x22\x2f\x3e\x0a\x3c\x2f\
+\x73\x76\x67\x3e\x0a\
+\x00\x00\x04\x89\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\
+\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x67\x20\
+\x69\x64\x3d\x22\x53\x6f\x6c\x69\x64\x22\x3e\x0a\x09\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x37\x39\x2e\x34\x2c\x33\x30\x2e\x31\
+\x63\x30\x2d\x32\x2e\x34\x2d\x30\x2e\x39\x2d\x34\x2e\x36\x2d\x32\
+\x2e\x36\x2d\x36\x2e\x33\x63\x2d\x33\x2e\x34\x2d\x33\x2e\x34\x2d\
+\x39\x2e\x32\x2d\x33\x2e\x34\x2d\x31\x32\x2e\x36\x2c\x30\x4c\x33\
+\x33\x2e\x39\x2c\x35\x34\x2e\x32\x63\x2d\x32\x2e\x38\x2c\x30\x2e\
+\x32\x2d\x35\x2e\x35\x2c\x31\x2e\x33\x2d\x37\x2e\x35\x2c\x33\x2e\
+\x33\x63\x2d\x34\x2e\x32\x2c\x34\x2e\x32\x2d\x34\x2c\x37\x2e\x37\
+\x2d\x33\x2e\x39\x2c\x31\x30\x2e\x36\x0a\x09\x09\x63\x30\x2e\x31\
+\x2c\x32\x2e\x34\x2c\x30\x2e\x32\x2c\x34\x2e\x32\x2d\x32\x2e\x37\
+\x2c\x37\x2e\x32\x6c\x2d\x34\x2e\x33\x2c\x34\x2e\x33\x63\x35\x2e\
+\x34\x2c\x30\x2e\x37\x2c\x36\x2e\x37\x2c\x31\x2c\x39\x2e\x36\x2c\
+\x31\x6c\x30\x2c\x30\x63\x34\x2e\x34\x2c\x30\x2c\x31\x32\x2e\x37\
+\x2d\x30\x2e\x38\x2c\x31\x38\x2e\x31\x2d\x36\x2e\x32\x63\x32\x2e\
+\x31\x2d\x32\x2e\x31\x2c\x33\x2e\x32\x2d\x34\x2e\x37\x2c\x33\x2e\
+\x34\x2d\x37\x2e\x36\x6c\x33\x30\x2e\x32\x2d\x33\x30\x2e\x32\x0a\
+\x09\x09\x43\x37\x38\x2e\x35\x2c\x33\x34\x2e\x37\x2c\x37\x39\x2e\
+\x34\x2c\x33\x32\x2e\x35\x2c\x37\x39\x2e\x34\x2c\x33\x30\x2e\x31\
+\x7a\x20\x4d\x33\x39\x2c\x37\x30\x63\x2d\x33\x2e\x31\x2c\x33\x2e\
+\x31\x2d\x37\x2e\x39\x2c\x34\x2e\x31\x2d\x31\x31\x2e\x35\x2c\x34\
+\x2e\x33\x63\x31\x2e\x31\x2d\x32\x2e\x36\x2c\x31\x2d\x34\x2e\x38\
+\x2c\x30\x2e\x39\x2d\x36\x2e\x37\x63\x2d\x30\x2e\x33\x2d\x35\x2e\
+\x32\x2c\x33\x2e\x32\x2d\x37\x2e\x38\x2c\x36\x2e\x34\x2d\x37\x2e\
+\x38\x0a\x09\x09\x63\x31\x2e\x36\x2c\x30\x2c\x33\x2e\x31\x2c\x30\
+\x2e\x36\x2c\x34\x2e\x32\x2c\x31\x2e\x37\x43\x34\x31\x2e\x33\x2c\
+\x36\x34\x2c\x34\x31\x2e\x33\x2c\x36\x37\x2e\x37\x2c\x33\x39\x2c\
+\x37\x30\x7a\x20\x4d\x37\x32\x2e\x36\x2c\x33\x32\x2e\x32\x4c\x34\
+\x35\x2c\x35\x39\x2e\x38\x63\x2d\x30\x2e\x35\x2d\x30\x2e\x39\x2d\
+\x31\x2e\x31\x2d\x31\x2e\x37\x2d\x31\x2e\x38\x2d\x32\x2e\x34\x73\
+\x2d\x31\x2e\x36\x2d\x31\x2e\x33\x2d\x32\x2e\x34\x2d\x31\x2e\x38\
+\x4c\x36\x38\x2e\x34\x2c\x32\x38\x0a\x09\x09\x63\x31\x2e\x31\x2d\
+\x31\x2e\x31\x2c\x33\x2e\x31\x2d\x31\x2e\x31\x2c\x34\x2e\x32\x2c\
+\x30\x63\x30\x2e\x36\x2c\x30\x2e\x36\x2c\x30\x2e\x39\x2c\x31\x2e\
+\x33\x2c\x30\x2e\x39\x2c\x32\x2e\x31\x43\x37\x33\x2e\x35\x2c\x33\
+\x30\x2e\x39\x2c\x37\x33\x2e\x32\x2c\x33\x31\x2e\x37\x2c\x37\x32\
+\x2e\x36\x2c\x33\x32\x2e\x32\x7a\x22\x2f\x3e\x0a\x3c\x2f\x67\x3e\
+\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x02\xa5\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x32\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\
+\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x6f\
+\x6c\x79\x67\x6f\x6e\x20\x70\x6f\x69\x6e\x74\x73\x3d\x22\x37\x32\
+\x2c\x35\x30\x20\x31\x33\x2e\x38\x2c\x32\x2e\x36\x20\x31\x33\x2e\
+\x38\x2c\x39\x37\x2e\x34\x20\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\
+\x20\x78\x3d\x22\x37\x31\x22\x20\x79\x3d\x22\x32\x2e\x36\x22\x20\
+\x77\x69\x64\x74\x68\x3d\x22\x31\x32\x2e\x35\x22\x20\x68\x65\x69\
+\x67\x68\x74\x3d\x22\x39\x34\x2e\x38\x22\x2f\x3e\x0a\x3c\x2f\x73\
+\x76\x67\x3e\x0a\
+\x00\x00\x05\xd9\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\
+\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x67\x20\
+\x69\x64\x3d\x22\x53\x6f\x6c\x69\x64\x5f\x31\x5f\x22\x3e\x0a\x09\
+\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x37\x32\x2e\x39\x2c\x36\
+\x31\x2e\x31\x56\x33\x37\x2e\x33\x63\x33\x2e\x33\x2d\x31\x2e\x32\
+\x2c\x35\x2e\x37\x2d\x34\x2e\x33\x2c\x35\x2e\x37\x2d\x38\x63\x30\
+\x2d\x34\x2e\x37\x2d\x33\x2e\x38\x2d\x38\x2e\x35\x2d\x38\x2e\x35\
+\x2d\x38\x2e\x35\x63\x2d\x33\x2e\x37\x2c\x30\x2d\x36\x2e\x38\x2c\
+\x32\x2e\x34\x2d\x38\x2c\x35\x2e\x37\x48\x33\x38\x2e\x32\x63\x2d\
+\x31\x2e\x32\x2d\x33\x2e\x33\x2d\x34\x2e\x33\x2d\x35\x2e\x37\x2d\
+\x38\x2d\x35\x2e\x37\x0a\x09\x09\x63\x2d\x34\x2e\x37\x2c\x30\x2d\
+\x38\x2e\x35\x2c\x33\x2e\x38\x2d\x38\x2e\x35\x2c\x38\x2e\x35\x63\
+\x30\x2c\x33\x2e\x37\x2c\x32\x2e\x34\x2c\x36\x2e\x38\x2c\x35\x2e\
+\x37\x2c\x38\x76\x32\x33\x2e\x38\x63\x2d\x33\x2e\x33\x2c\x31\x2e\
+\x32\x2d\x35\x2e\x37\x2c\x34\x2e\x33\x2d\x35\x2e\x37\x2c\x38\x63\
+\x30\x2c\x34\x2e\x37\x2c\x33\x2e\x38\x2c\x38\x2e\x35\x2c\x38\x2e\
+\x35\x2c\x38\x2e\x35\x63\x33\x2e\x37\x2c\x30\x2c\x36\x2e\x38\x2d\
+\x32\x2e\x34\x2c\x38\x2d\x35\x2e\x37\x48\x36\x32\x0a\x09\x09\x63\
+\x31\x2e\x32\x2c\x33\x2e\x33\x2c\x34\x2e\x33\x2c\x35\x2e\x37\x2c\
+\x38\x2c\x35\x2e\x37\x63\x34\x2e\x37\x2c\x30\x2c\x38\x2e\x35\x2d\
+\x33\x2e\x38\x2c\x38\x2e\x35\x2d\x38\x2e\x35\x43\x37\x38\x2e\x36\
+\x2c\x36\x35\x2e\x34\x2c\x37\x36\x2e\x32\x2c\x36\x32\x2e\x32\x2c\
+\x37\x32\x2e\x39\x2c\x36\x31\x2e\x31\x7a\x20\x4d\x37\x30\x2e\x31\
+\x2c\x32\x36\x2e\x34\x63\x31\x2e\x36\x2c\x30\x2c\x32\x2e\x38\x2c\
+\x31\x2e\x33\x2c\x32\x2e\x38\x2c\x32\x2e\x38\x0a\x09\x09\x63\x30\
+\x2c\x31\x2e\x36\x2d\x31\x2e\x33\x2c\x32\x2e\x38\x2d\x32\x2e\x38\
+\x2c\x32\x2e\x38\x63\x2d\x31\x2e\x36\x2c\x30\x2d\x32\x2e\x38\x2d\
+\x31\x2e\x33\x2d\x32\x2e\x38\x2d\x32\x2e\x38\x43\x36\x37\x2e\x32\
+\x2c\x32\x37\x2e\x37\x2c\x36\x38\x2e\x35\x2c\x32\x36\x2e\x34\x2c\
+\x37\x30\x2e\x31\x2c\x32\x36\x2e\x34\x7a\x20\x4d\x33\x30\x2e\x32\
+\x2c\x32\x36\x2e\x34\x63\x31\x2e\x36\x2c\x30\x2c\x32\x2e\x38\x2c\
+\x31\x2e\x33\x2c\x32\x2e\x38\x2c\x32\x2e\x38\x0a\x09\x09\x63\x30\
+\x2c\x31\x2e\x36\x2d\x31\x2e\x33\x2c\x32\x2e\x38\x2d\x32\x2e\x38\
+\x2c\x32\x2e\x38\x63\x2d\x31\x2e\x36\x2c\x30\x2d\x32\x2e\x38\x2d\
+\x31\x2e\x33\x2d\x32\x2e\x38\x2d\x32\x2e\x38\x43\x32\x37\x2e\x34\
+\x2c\x32\x37\x2e\x37\x2c\x32\x38\x2e\x37\x2c\x32\x36\x2e\x34\x2c\
+\x33\x30\x2e\x32\x2c\x32\x36\x2e\x34\x7a\x20\x4d\x33\x30\x2e\x32\
+\x2c\x37\x31\x2e\x39\x63\x2d\x31\x2e\x36\x2c\x30\x2d\x32\x2e\x38\
+\x2d\x31\x2e\x33\x2d\x32\x2e\x38\x2d\x32\x2e\x38\x0a\x09\x09\x63\
+\x30\x2d\x31\x2e\x36\x2c\x31\x2e\x33\x2d\x32\x2e\x38\x2c\x32\x2e\
+\x38\x2d\x32\x2e\x38\x63\x31\x2e\x36\x2c\x30\x2c\x32\x2e\x38\x2c\
+\x31\x2e\x33\x2c\x32\x2e\x38\x2c\x32\x2e\x38\x43\x33\x33\x2e\x31\
+\x2c\x37\x30\x2e\x36\x2c\x33\x31\x2e\x38\x2c\x37\x31\x2e\x39\x2c\
+\x33\x30\x2e\x32\x2c\x37\x31\x2e\x39\x7a\x20\x4d\x36\x32\x2e\x31\
+\x2c\x36\x36\x2e\x32\x48\x33\x38\x2e\x32\x63\x2d\x30\x2e\x39\x2d\
+\x32\x2e\x34\x2d\x32\x2e\x38\x2d\x34\x2e\x33\x2d\x35\x2e\x32\x2d\
+\x35\x2e\x32\x56\x33\x37\x2e\x33\x0a\x09\x09\x63\x32\x2e\x34\x2d\
+\x30\x2e\x39\x2c\x34\x2e\x33\x2d\x32\x2e\x38\x2c\x35\x2e\x32\x2d\
+\x35\x2e\x32\x48\x36\x32\x63\x30\x2e\x39\x2c\x32\x2e\x34\x2c\x32\
+\x2e\x38\x2c\x34\x2e\x33\x2c\x35\x2e\x32\x2c\x35\x2e\x32\x76\x32\
+\x33\x2e\x38\x43\x36\x34\x2e\x38\x2c\x36\x31\x2e\x39\x2c\x36\x32\
+\x2e\x39\x2c\x36\x33\x2e\x38\x2c\x36\x32\x2e\x31\x2c\x36\x36\x2e\
+\x32\x7a\x20\x4d\x37\x30\x2e\x31\x2c\x37\x31\x2e\x39\x63\x2d\x31\
+\x2e\x36\x2c\x30\x2d\x32\x2e\x38\x2d\x31\x2e\x33\x2d\x32\x2e\x38\
+\x2d\x32\x2e\x38\x0a\x09\x09\x63\x30\x2d\x31\x2e\x36\x2c\x31\x2e\
+\x33\x2d\x32\x2e\x38\x2c\x32\x2e\x38\x2d\x32\x2e\x38\x63\x31\x2e\
+\x36\x2c\x30\x2c\x32\x2e\x38\x2c\x31\x2e\x33\x2c\x32\x2e\x38\x2c\
+\x32\x2e\x38\x53\x37\x31\x2e\x36\x2c\x37\x31\x2e\x39\x2c\x37\x30\
+\x2e\x31\x2c\x37\x31\x2e\x39\x7a\x22\x2f\x3e\x0a\x3c\x2f\x67\x3e\
+\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x02\x75\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x30\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\
+\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x6f\
+\x6c\x79\x67\x6f\x6e\x20\x70\x6f\x69\x6e\x74\x73\x3d\x22\x35\x30\
+\x2c\x37\x39\x2e\x31\x20\x39\x37\x2e\x34\x2c\x32\x30\x2e\x39\x20\
+\x32\x2e\x36\x2c\x32\x30\x2e\x39\x20\x22\x2f\x3e\x0a\x3c\x2f\x73\
+\x76\x67\x3e\x0a\
+\x00\x00\x06\xbe\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x36\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\
+\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x67\x3e\
+\x0a\x09\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x33\x34\x2e\x36\
+\x2c\x31\x36\x2e\x35\x6c\x2d\x31\x32\x2e\x33\x2d\x35\x2e\x31\x63\
+\x2d\x30\x2e\x33\x2d\x30\x2e\x31\x2d\x30\x2e\x36\x2d\x30\x2e\x32\
+\x2d\x30\x2e\x39\x2c\x30\x63\x2d\x30\x2e\x33\x2c\x30\x2e\x31\x2d\
+\x30\x2e\x35\x2c\x30\x2e\x33\x2d\x30\x2e\x36\x2c\x30\x2e\x36\x73\
+\x2d\x30\x2e\x32\x2c\x30\x2e\x36\x2c\x30\x2c\x30\x2e\x39\x6c\x31\
+\x2e\x38\x2c\x34\x2e\x33\x6c\x2d\x33\x2e\x38\x2c\x31\x2e\x35\x0a\
+\x09\x09\x63\x2d\x38\x2c\x33\x2e\x33\x2d\x31\x32\x2e\x31\x2c\x37\
+\x2e\x37\x2d\x31\x32\x2c\x31\x33\x63\x30\x2c\x31\x2e\x38\x2c\x30\
+\x2e\x35\x2c\x33\x2e\x38\x2c\x31\x2e\x35\x2c\x36\x63\x30\x2e\x38\
+\x2c\x31\x2e\x39\x2c\x32\x2e\x35\x2c\x34\x2e\x32\x2c\x35\x2e\x34\
+\x2c\x36\x2e\x38\x63\x30\x2e\x31\x2c\x30\x2e\x31\x2c\x30\x2e\x32\
+\x2c\x30\x2e\x32\x2c\x30\x2e\x33\x2c\x30\x2e\x34\x63\x30\x2e\x31\
+\x2c\x30\x2e\x31\x2c\x30\x2e\x33\x2c\x30\x2e\x33\x2c\x30\x2e\x34\
+\x2c\x30\x2e\x34\x0a\x09\x09\x63\x30\x2e\x31\x2c\x30\x2e\x31\x2c\
+\x30\x2e\x33\x2c\x30\x2e\x33\x2c\x30\x2e\x34\x2c\x30\x2e\x33\x63\
+\x30\x2e\x32\x2c\x30\x2e\x32\x2c\x30\x2e\x34\x2c\x30\x2e\x32\x2c\
+\x30\x2e\x36\x2c\x30\x2e\x31\x63\x30\x2e\x32\x2c\x30\x2c\x30\x2e\
+\x33\x2d\x30\x2e\x32\x2c\x30\x2e\x34\x2d\x30\x2e\x33\x63\x30\x2d\
+\x30\x2e\x32\x2c\x30\x2d\x30\x2e\x34\x2d\x30\x2e\x31\x2d\x30\x2e\
+\x35\x73\x2d\x30\x2e\x31\x2d\x30\x2e\x32\x2d\x30\x2e\x32\x2d\x30\
+\x2e\x34\x0a\x09\x09\x63\x2d\x30\x2e\x31\x2d\x30\x2e\x32\x2d\x30\
+\x2e\x32\x2d\x30\x2e\x33\x2d\x30\x2e\x32\x2d\x30\x2e\x34\x63\x2d\
+\x30\x2e\x34\x2d\x30\x2e\x37\x2d\x30\x2e\x37\x2d\x31\x2e\x34\x2d\
+\x31\x2d\x32\x63\x2d\x30\x2e\x35\x2d\x31\x2e\x31\x2d\x30\x2e\x38\
+\x2d\x32\x2e\x32\x2d\x31\x2d\x33\x2e\x32\x73\x2d\x30\x2e\x32\x2d\
+\x31\x2e\x39\x2d\x30\x2e\x31\x2d\x32\x2e\x37\x63\x30\x2d\x30\x2e\
+\x38\x2c\x30\x2e\x33\x2d\x31\x2e\x36\x2c\x30\x2e\x36\x2d\x32\x2e\
+\x33\x0a\x09\x09\x63\x30\x2e\x34\x2d\x30\x2e\x37\x2c\x30\x2e\x38\
+\x2d\x31\x2e\x34\x2c\x31\x2e\x33\x2d\x32\x63\x30\x2e\x35\x2d\x30\
+\x2e\x36\x2c\x31\x2e\x32\x2d\x31\x2e\x31\x2c\x32\x2d\x31\x2e\x37\
+\x63\x30\x2e\x38\x2d\x30\x2e\x35\x2c\x31\x2e\x36\x2d\x31\x2c\x32\
+\x2e\x34\x2d\x31\x2e\x35\x63\x30\x2e\x38\x2d\x30\x2e\x34\x2c\x31\
+\x2e\x38\x2d\x30\x2e\x38\x2c\x32\x2e\x39\x2d\x31\x2e\x33\x6c\x33\
+\x2e\x38\x2d\x31\x2e\x35\x6c\x31\x2e\x38\x2c\x34\x2e\x33\x0a\x09\
+\x09\x63\x30\x2e\x31\x2c\x30\x2e\x33\x2c\x30\x2e\x33\x2c\x30\x2e\
+\x35\x2c\x30\x2e\x36\x2c\x30\x2e\x36\x63\x30\x2e\x33\x2c\x30\x2e\
+\x31\x2c\x30\x2e\x36\x2c\x30\x2e\x32\x2c\x30\x2e\x39\x2c\x30\x63\
+\x30\x2e\x33\x2d\x30\x2e\x31\x2c\x30\x2e\x35\x2d\x30\x2e\x33\x2c\
+\x30\x2e\x36\x2d\x30\x2e\x36\x6c\x35\x2e\x31\x2d\x31\x32\x2e\x33\
+\x63\x30\x2e\x31\x2d\x30\x2e\x33\x2c\x30\x2e\x32\x2d\x30\x2e\x36\
+\x2c\x30\x2d\x30\x2e\x39\x0a\x09\x09\x43\x33\x35\x2e\x32\x2c\x31\
+\x36\x2e\x38\x2c\x33\x35\x2c\x31\x36\x2e\x36\x2c\x33\x34\x2e\x36\
+\x2c\x31\x36\x2e\x35\x7a\x22\x2f\x3e\x0a\x3c\x2f\x67\x3e\x0a\x3c\
+\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x36\x30\x2e\x31\x2c\x38\x38\
+\x2e\x36\x6c\x32\x35\x2e\x34\x2d\x31\x33\x2e\x38\x56\x34\x39\x2e\
+\x35\x6c\x2d\x32\x35\x2e\x34\x2c\x39\x2e\x32\x56\x38\x38\x2e\x36\
+\x7a\x20\x4d\x35\x37\x2e\x36\x2c\x35\x34\x2e\x33\x6c\x32\x37\x2e\
+\x37\x2d\x31\x30\x2e\x31\x4c\x35\x37\x2e\x36\x2c\x33\x34\x2e\x32\
+\x4c\x32\x39\x2e\x39\x2c\x34\x34\x2e\x32\x4c\x35\x37\x2e\x36\x2c\
+\x35\x34\x2e\x33\x7a\x20\x4d\x39\x30\x2e\x35\x2c\x34\x34\x2e\x33\
+\x76\x33\x30\x2e\x34\x0a\x09\x63\x30\x2c\x30\x2e\x39\x2d\x30\x2e\
+\x32\x2c\x31\x2e\x38\x2d\x30\x2e\x37\x2c\x32\x2e\x36\x63\x2d\x30\
+\x2e\x35\x2c\x30\x2e\x38\x2d\x31\x2e\x31\x2c\x31\x2e\x34\x2d\x31\
+\x2e\x39\x2c\x31\x2e\x39\x4c\x36\x30\x2c\x39\x34\x2e\x34\x63\x2d\
+\x30\x2e\x37\x2c\x30\x2e\x34\x2d\x31\x2e\x35\x2c\x30\x2e\x36\x2d\
+\x32\x2e\x34\x2c\x30\x2e\x36\x63\x2d\x30\x2e\x39\x2c\x30\x2d\x31\
+\x2e\x37\x2d\x30\x2e\x32\x2d\x32\x2e\x34\x2d\x30\x2e\x36\x4c\x32\
+\x37\x2e\x33\x2c\x37\x39\x2e\x32\x0a\x09\x63\x2d\x30\x2e\x38\x2d\
+\x30\x2e\x34\x2d\x31\x2e\x35\x2d\x31\x2e\x31\x2d\x31\x2e\x39\x2d\
+\x31\x2e\x39\x63\x2d\x30\x2e\x35\x2d\x30\x2e\x38\x2d\x30\x2e\x37\
+\x2d\x31\x2e\x37\x2d\x30\x2e\x37\x2d\x32\x2e\x36\x56\x34\x34\x2e\
+\x33\x63\x30\x2d\x31\x2e\x31\x2c\x30\x2e\x33\x2d\x32\x2c\x30\x2e\
+\x39\x2d\x32\x2e\x39\x73\x31\x2e\x34\x2d\x31\x2e\x35\x2c\x32\x2e\
+\x34\x2d\x31\x2e\x39\x6c\x32\x37\x2e\x39\x2d\x31\x30\x2e\x31\x63\
+\x30\x2e\x36\x2d\x30\x2e\x32\x2c\x31\x2e\x32\x2d\x30\x2e\x33\x2c\
+\x31\x2e\x37\x2d\x30\x2e\x33\x0a\x09\x63\x30\x2e\x36\x2c\x30\x2c\
+\x31\x2e\x32\x2c\x30\x2e\x31\x2c\x31\x2e\x37\x2c\x30\x2e\x33\x6c\
+\x32\x37\x2e\x39\x2c\x31\x30\x2e\x31\x63\x31\x2c\x30\x2e\x34\x2c\
+\x31\x2e\x38\x2c\x31\x2c\x32\x2e\x34\x2c\x31\x2e\x39\x53\x39\x30\
+\x2e\x35\x2c\x34\x33\x2e\x32\x2c\x39\x30\x2e\x35\x2c\x34\x34\x2e\
+\x33\x7a\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x02\x6d\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x34\x2e\x30\x2e\x30\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\
+\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x70\x6f\
+\x69\x6e\x74\x73\x3d\x22\x35\x30\x2c\x32\x30\x2e\x39\x20\x32\x2e\
+\x36\x2c\x37\x39\x2e\x31\x20\x39\x37\x2e\x34\x2c\x37\x39\x2e\x31\
+\x20\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x02\xf5\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x36\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\
+\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x37\
+\x34\x2e\x37\x2c\x38\x36\x2e\x39\x48\x32\x36\x2e\x34\x63\x2d\x36\
+\x2e\x39\x2c\x30\x2d\x31\x32\x2e\x32\x2d\x35\x2e\x34\x2d\x31\x32\
+\x2e\x32\x2d\x31\x32\x2e\x32\x56\x32\x36\x2e\x34\x63\x30\x2d\x36\
+\x2e\x39\x2c\x35\x2e\x34\x2d\x31\x32\x2e\x32\x2c\x31\x32\x2e\x32\
+\x2d\x31\x32\x2e\x32\x68\x34\x38\x2e\x31\x63\x36\x2e\x39\x2c\x30\
+\x2c\x31\x32\x2e\x32\x2c\x35\x2e\x34\x2c\x31\x32\x2e\x32\x2c\x31\
+\x32\x2e\x32\x76\x34\x38\x2e\x31\x0a\x09\x43\x38\x36\x2e\x39\x2c\
+\x38\x31\x2e\x35\x2c\x38\x31\x2e\x35\x2c\x38\x36\x2e\x39\x2c\x37\
+\x34\x2e\x37\x2c\x38\x36\x2e\x39\x7a\x20\x4d\x32\x38\x2e\x39\x2c\
+\x37\x32\x2e\x31\x68\x34\x33\x2e\x32\x56\x32\x38\x2e\x39\x48\x32\
+\x38\x2e\x39\x56\x37\x32\x2e\x31\x7a\x22\x2f\x3e\x0a\x3c\x2f\x73\
+\x76\x67\x3e\x0a\
+\x00\x00\x04\x0d\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\
+\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x33\x30\x2e\x32\x2c\x37\x37\x2e\x37\
+\x63\x2d\x34\x2e\x37\x2c\x30\x2d\x38\x2e\x36\x2d\x33\x2e\x39\x2d\
+\x38\x2e\x36\x2d\x38\x2e\x36\x73\x33\x2e\x39\x2d\x38\x2e\x36\x2c\
+\x38\x2e\x36\x2d\x38\x2e\x36\x73\x38\x2e\x36\x2c\x33\x2e\x39\x2c\
+\x38\x2e\x36\x2c\x38\x2e\x36\x53\x33\x34\x2e\x39\x2c\x37\x37\x2e\
+\x37\x2c\x33\x30\x2e\x32\x2c\x37\x37\x2e\x37\x7a\x20\x4d\x33\x30\
+\x2e\x32\x2c\x36\x36\x2e\x31\x63\x2d\x31\x2e\x37\x2c\x30\x2d\x33\
+\x2c\x31\x2e\x33\x2d\x33\x2c\x33\x0a\x09\x73\x31\x2e\x33\x2c\x33\
+\x2c\x33\x2c\x33\x73\x33\x2d\x31\x2e\x33\x2c\x33\x2d\x33\x53\x33\
+\x31\x2e\x39\x2c\x36\x36\x2e\x31\x2c\x33\x30\x2e\x32\x2c\x36\x36\
+\x2e\x31\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\
+\x4d\x37\x30\x2e\x31\x2c\x33\x37\x2e\x38\x63\x2d\x34\x2e\x37\x2c\
+\x30\x2d\x38\x2e\x36\x2d\x33\x2e\x39\x2d\x38\x2e\x36\x2d\x38\x2e\
+\x36\x73\x33\x2e\x39\x2d\x38\x2e\x36\x2c\x38\x2e\x36\x2d\x38\x2e\
+\x36\x73\x38\x2e\x36\x2c\x33\x2e\x39\x2c\x38\x2e\x36\x2c\x38\x2e\
+\x36\x53\x37\x34\x2e\x38\x2c\x33\x37\x2e\x38\x2c\x37\x30\x2e\x31\
+\x2c\x33\x37\x2e\x38\x7a\x20\x4d\x37\x30\x2e\x31\x2c\x32\x36\x2e\
+\x32\x63\x2d\x31\x2e\x37\x2c\x30\x2d\x33\x2c\x31\x2e\x33\x2d\x33\
+\x2c\x33\x0a\x09\x73\x31\x2e\x33\x2c\x33\x2c\x33\x2c\x33\x73\x33\
+\x2d\x31\x2e\x33\x2c\x33\x2d\x33\x53\x37\x31\x2e\x38\x2c\x32\x36\
+\x2e\x32\x2c\x37\x30\x2e\x31\x2c\x32\x36\x2e\x32\x7a\x22\x2f\x3e\
+\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x32\x38\x22\x20\x79\x3d\
+\x22\x34\x36\x2e\x37\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\
+\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\x30\x2e\x37\x30\x32\x37\x20\
+\x2d\x30\x2e\x37\x31\x31\x35\x20\x30\x2e\x37\x31\x31\x35\x20\x30\
+\x2e\x37\x30\x32\x37\x20\x2d\x32\x30\x2e\x31\x38\x34\x33\x20\x35\
+\x30\x2e\x35\x39\x32\x38\x29\x22\x20\x77\x69\x64\x74\x68\x3d\x22\
+\x34\x34\x2e\x38\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x35\x2e\
+\x36\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x03\xb4\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\
+\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x34\
+\x31\x2e\x35\x2c\x36\x37\x2e\x36\x63\x2d\x31\x34\x2e\x34\x2c\x30\
+\x2d\x32\x36\x2e\x31\x2d\x31\x31\x2e\x37\x2d\x32\x36\x2e\x31\x2d\
+\x32\x36\x2e\x31\x73\x31\x31\x2e\x37\x2d\x32\x36\x2e\x31\x2c\x32\
+\x36\x2e\x31\x2d\x32\x36\x2e\x31\x73\x32\x36\x2e\x31\x2c\x31\x31\
+\x2e\x37\x2c\x32\x36\x2e\x31\x2c\x32\x36\x2e\x31\x53\x35\x35\x2e\
+\x39\x2c\x36\x37\x2e\x36\x2c\x34\x31\x2e\x35\x2c\x36\x37\x2e\x36\
+\x7a\x20\x4d\x34\x31\x2e\x35\x2c\x32\x32\x2e\x34\x0a\x09\x43\x33\
+\x31\x2c\x32\x32\x2e\x34\x2c\x32\x32\x2e\x34\x2c\x33\x31\x2c\x32\
+\x32\x2e\x34\x2c\x34\x31\x2e\x35\x63\x30\x2c\x31\x30\x2e\x35\x2c\
+\x38\x2e\x36\x2c\x31\x39\x2e\x31\x2c\x31\x39\x2e\x31\x2c\x31\x39\
+\x2e\x31\x63\x31\x30\x2e\x35\x2c\x30\x2c\x31\x39\x2e\x31\x2d\x38\
+\x2e\x36\x2c\x31\x39\x2e\x31\x2d\x31\x39\x2e\x31\x43\x36\x30\x2e\
+\x36\x2c\x33\x31\x2c\x35\x32\x2c\x32\x32\x2e\x34\x2c\x34\x31\x2e\
+\x35\x2c\x32\x32\x2e\x34\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\
+\x20\x64\x3d\x22\x4d\x38\x34\x2e\x34\x2c\x37\x39\x2e\x38\x4c\x36\
+\x34\x2e\x32\x2c\x36\x30\x2e\x36\x63\x2d\x31\x2e\x34\x2c\x31\x2e\
+\x37\x2d\x33\x2e\x31\x2c\x33\x2e\x32\x2d\x34\x2e\x38\x2c\x34\x2e\
+\x36\x6c\x32\x30\x2e\x35\x2c\x31\x39\x2e\x34\x63\x30\x2e\x36\x2c\
+\x30\x2e\x36\x2c\x31\x2e\x35\x2c\x30\x2e\x39\x2c\x32\x2e\x33\x2c\
+\x30\x2e\x39\x63\x30\x2e\x39\x2c\x30\x2c\x31\x2e\x38\x2d\x30\x2e\
+\x33\x2c\x32\x2e\x34\x2d\x31\x0a\x09\x43\x38\x35\x2e\x38\x2c\x38\
+\x33\x2e\x32\x2c\x38\x35\x2e\x37\x2c\x38\x31\x2e\x31\x2c\x38\x34\
+\x2e\x34\x2c\x37\x39\x2e\x38\x7a\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\
+\x67\x3e\x0a\
+\x00\x00\x02\xb4\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x36\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\
+\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x70\x6f\
+\x69\x6e\x74\x73\x3d\x22\x36\x37\x2e\x33\x2c\x37\x33\x2e\x36\x20\
+\x35\x30\x2e\x36\x2c\x36\x34\x2e\x37\x20\x33\x33\x2e\x37\x2c\x37\
+\x33\x2e\x34\x20\x33\x37\x2c\x35\x34\x2e\x38\x20\x32\x33\x2e\x35\
+\x2c\x34\x31\x2e\x35\x20\x34\x32\x2e\x33\x2c\x33\x38\x2e\x38\x20\
+\x35\x30\x2e\x38\x2c\x32\x31\x2e\x39\x20\x35\x39\x2e\x31\x2c\x33\
+\x38\x2e\x39\x20\x37\x37\x2e\x38\x2c\x34\x31\x2e\x37\x20\x36\x34\
+\x2e\x32\x2c\x35\x34\x2e\x39\x20\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\
+\x67\x3e\x0a\
+\x00\x00\x06\x3b\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\
+\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x35\
+\x30\x2c\x33\x30\x63\x2d\x34\x2e\x37\x2c\x30\x2d\x38\x2e\x36\x2d\
+\x33\x2e\x39\x2d\x38\x2e\x36\x2d\x38\x2e\x36\x73\x33\x2e\x39\x2d\
+\x38\x2e\x36\x2c\x38\x2e\x36\x2d\x38\x2e\x36\x73\x38\x2e\x36\x2c\
+\x33\x2e\x39\x2c\x38\x2e\x36\x2c\x38\x2e\x36\x53\x35\x34\x2e\x37\
+\x2c\x33\x30\x2c\x35\x30\x2c\x33\x30\x7a\x20\x4d\x35\x30\x2c\x31\
+\x38\x2e\x34\x63\x2d\x31\x2e\x37\x2c\x30\x2d\x33\x2c\x31\x2e\x33\
+\x2d\x33\x2c\x33\x73\x31\x2e\x33\x2c\x33\x2c\x33\x2c\x33\x0a\x09\
+\x73\x33\x2d\x31\x2e\x33\x2c\x33\x2d\x33\x53\x35\x31\x2e\x37\x2c\
+\x31\x38\x2e\x34\x2c\x35\x30\x2c\x31\x38\x2e\x34\x7a\x22\x2f\x3e\
+\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x37\x37\x2e\x38\x2c\
+\x35\x38\x2e\x39\x63\x2d\x34\x2e\x37\x2c\x30\x2d\x38\x2e\x36\x2d\
+\x33\x2e\x39\x2d\x38\x2e\x36\x2d\x38\x2e\x36\x73\x33\x2e\x39\x2d\
+\x38\x2e\x36\x2c\x38\x2e\x36\x2d\x38\x2e\x36\x73\x38\x2e\x36\x2c\
+\x33\x2e\x39\x2c\x38\x2e\x36\x2c\x38\x2e\x36\x53\x38\x32\x2e\x35\
+\x2c\x35\x38\x2e\x39\x2c\x37\x37\x2e\x38\x2c\x35\x38\x2e\x39\x7a\
+\x20\x4d\x37\x37\x2e\x38\x2c\x34\x37\x2e\x33\x63\x2d\x31\x2e\x37\
+\x2c\x30\x2d\x33\x2c\x31\x2e\x33\x2d\x33\x2c\x33\x0a\x09\x73\x31\
+\x2e\x33\x2c\x33\x2c\x33\x2c\x33\x73\x33\x2d\x31\x2e\x33\x2c\x33\
+\x2d\x33\x53\x37\x39\x2e\x35\x2c\x34\x37\x2e\x33\x2c\x37\x37\x2e\
+\x38\x2c\x34\x37\x2e\x33\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\
+\x20\x64\x3d\x22\x4d\x35\x30\x2c\x38\x35\x2e\x36\x63\x2d\x34\x2e\
+\x37\x2c\x30\x2d\x38\x2e\x36\x2d\x33\x2e\x39\x2d\x38\x2e\x36\x2d\
+\x38\x2e\x36\x73\x33\x2e\x39\x2d\x38\x2e\x36\x2c\x38\x2e\x36\x2d\
+\x38\x2e\x36\x73\x38\x2e\x36\x2c\x33\x2e\x39\x2c\x38\x2e\x36\x2c\
+\x38\x2e\x36\x53\x35\x34\x2e\x37\x2c\x38\x35\x2e\x36\x2c\x35\x30\
+\x2c\x38\x35\x2e\x36\x7a\x20\x4d\x35\x30\x2c\x37\x34\x63\x2d\x31\
+\x2e\x37\x2c\x30\x2d\x33\x2c\x31\x2e\x33\x2d\x33\x2c\x33\x73\x31\
+\x2e\x33\x2c\x33\x2c\x33\x2c\x33\x0a\x09\x73\x33\x2d\x31\x2e\x33\
+\x2c\x33\x2d\x33\x53\x35\x31\x2e\x37\x2c\x37\x34\x2c\x35\x30\x2c\
+\x37\x34\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\
+\x4d\x32\x32\x2e\x32\x2c\x35\x38\x2e\x36\x63\x2d\x34\x2e\x37\x2c\
+\x30\x2d\x38\x2e\x36\x2d\x33\x2e\x39\x2d\x38\x2e\x36\x2d\x38\x2e\
+\x36\x73\x33\x2e\x39\x2d\x38\x2e\x36\x2c\x38\x2e\x36\x2d\x38\x2e\
+\x36\x73\x38\x2e\x36\x2c\x33\x2e\x39\x2c\x38\x2e\x36\x2c\x38\x2e\
+\x36\x53\x32\x36\x2e\x39\x2c\x35\x38\x2e\x36\x2c\x32\x32\x2e\x32\
+\x2c\x35\x38\x2e\x36\x7a\x20\x4d\x32\x32\x2e\x32\x2c\x34\x37\x63\
+\x2d\x31\x2e\x37\x2c\x30\x2d\x33\x2c\x31\x2e\x33\x2d\x33\x2c\x33\
+\x0a\x09\x73\x31\x2e\x33\x2c\x33\x2c\x33\x2c\x33\x73\x33\x2d\x31\
+\x2e\x33\x2c\x33\x2d\x33\x53\x32\x33\x2e\x39\x2c\x34\x37\x2c\x32\
+\x32\x2e\x32\x2c\x34\x37\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\
+\x20\x64\x3d\x22\x4d\x32\x36\x2e\x34\x2c\x34\x34\x2e\x35\x4c\x32\
+\x31\x2c\x34\x33\x2e\x35\x63\x32\x2e\x32\x2d\x31\x31\x2e\x32\x2c\
+\x31\x30\x2e\x37\x2d\x32\x30\x2e\x32\x2c\x32\x31\x2e\x37\x2d\x32\
+\x33\x6c\x31\x2e\x34\x2c\x35\x2e\x34\x43\x33\x35\x2e\x31\x2c\x32\
+\x38\x2e\x32\x2c\x32\x38\x2e\x32\x2c\x33\x35\x2e\x35\x2c\x32\x36\
+\x2e\x34\x2c\x34\x34\x2e\x35\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\x74\
+\x68\x20\x64\x3d\x22\x4d\x34\x33\x2e\x36\x2c\x37\x38\x63\x2d\x31\
+\x31\x2e\x35\x2d\x32\x2e\x35\x2d\x32\x30\x2e\x37\x2d\x31\x32\x2d\
+\x32\x32\x2e\x38\x2d\x32\x33\x2e\x36\x6c\x35\x2e\x35\x2d\x31\x63\
+\x31\x2e\x37\x2c\x39\x2e\x34\x2c\x39\x2e\x31\x2c\x31\x37\x2e\x31\
+\x2c\x31\x38\x2e\x34\x2c\x31\x39\x2e\x32\x4c\x34\x33\x2e\x36\x2c\
+\x37\x38\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\
+\x4d\x35\x36\x2e\x36\x2c\x37\x38\x6c\x2d\x31\x2e\x33\x2d\x35\x2e\
+\x35\x63\x39\x2e\x33\x2d\x32\x2e\x32\x2c\x31\x36\x2e\x34\x2d\x39\
+\x2e\x36\x2c\x31\x38\x2e\x32\x2d\x31\x38\x2e\x39\x6c\x35\x2e\x35\
+\x2c\x31\x2e\x31\x43\x37\x36\x2e\x38\x2c\x36\x36\x2e\x32\x2c\x36\
+\x38\x2c\x37\x35\x2e\x34\x2c\x35\x36\x2e\x36\x2c\x37\x38\x7a\x22\
+\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x37\x33\x2e\
+\x39\x2c\x34\x36\x2e\x36\x63\x2d\x31\x2e\x31\x2d\x39\x2e\x38\x2d\
+\x37\x2e\x39\x2d\x31\x37\x2e\x39\x2d\x31\x37\x2e\x34\x2d\x32\x30\
+\x2e\x35\x6c\x31\x2e\x35\x2d\x35\x2e\x34\x43\x36\x39\x2e\x38\x2c\
+\x32\x34\x2c\x37\x38\x2e\x32\x2c\x33\x33\x2e\x39\x2c\x37\x39\x2e\
+\x35\x2c\x34\x36\x4c\x37\x33\x2e\x39\x2c\x34\x36\x2e\x36\x7a\x22\
+\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x02\xbc\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x36\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\
+\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x6f\
+\x6c\x79\x67\x6f\x6e\x20\x70\x6f\x69\x6e\x74\x73\x3d\x22\x36\x37\
+\x2e\x33\x2c\x37\x33\x2e\x36\x20\x35\x30\x2e\x36\x2c\x36\x34\x2e\
+\x37\x20\x33\x33\x2e\x37\x2c\x37\x33\x2e\x34\x20\x33\x37\x2c\x35\
+\x34\x2e\x38\x20\x32\x33\x2e\x35\x2c\x34\x31\x2e\x35\x20\x34\x32\
+\x2e\x33\x2c\x33\x38\x2e\x38\x20\x35\x30\x2e\x38\x2c\x32\x31\x2e\
+\x39\x20\x35\x39\x2e\x31\x2c\x33\x38\x2e\x39\x20\x37\x37\x2e\x38\
+\x2c\x34\x31\x2e\x37\x20\x36\x34\x2e\x32\x2c\x35\x34\x2e\x39\x20\
+\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x06\x3f\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\
+\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x35\x38\x2e\x38\x2c\x38\x32\x2e\x36\
+\x63\x2d\x34\x2e\x37\x2c\x30\x2d\x38\x2e\x36\x2d\x33\x2e\x39\x2d\
+\x38\x2e\x36\x2d\x38\x2e\x36\x73\x33\x2e\x39\x2d\x38\x2e\x36\x2c\
+\x38\x2e\x36\x2d\x38\x2e\x36\x73\x38\x2e\x36\x2c\x33\x2e\x39\x2c\
+\x38\x2e\x36\x2c\x38\x2e\x36\x53\x36\x33\x2e\x35\x2c\x38\x32\x2e\
+\x36\x2c\x35\x38\x2e\x38\x2c\x38\x32\x2e\x36\x7a\x20\x4d\x35\x38\
+\x2e\x38\x2c\x37\x31\x63\x2d\x31\x2e\x37\x2c\x30\x2d\x33\x2c\x31\
+\x2e\x33\x2d\x33\x2c\x33\x0a\x09\x73\x31\x2e\x33\x2c\x33\x2c\x33\
+\x2c\x33\x73\x33\x2d\x31\x2e\x33\x2c\x33\x2d\x33\x53\x36\x30\x2e\
+\x35\x2c\x37\x31\x2c\x35\x38\x2e\x38\x2c\x37\x31\x7a\x22\x2f\x3e\
+\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x33\x39\x2e\x35\x2c\
+\x33\x39\x2e\x38\x63\x2d\x34\x2e\x37\x2c\x30\x2d\x38\x2e\x36\x2d\
+\x33\x2e\x39\x2d\x38\x2e\x36\x2d\x38\x2e\x36\x73\x33\x2e\x39\x2d\
+\x38\x2e\x36\x2c\x38\x2e\x36\x2d\x38\x2e\x36\x73\x38\x2e\x36\x2c\
+\x33\x2e\x39\x2c\x38\x2e\x36\x2c\x38\x2e\x36\x53\x34\x34\x2e\x32\
+\x2c\x33\x39\x2e\x38\x2c\x33\x39\x2e\x35\x2c\x33\x39\x2e\x38\x7a\
+\x20\x4d\x33\x39\x2e\x35\x2c\x32\x38\x2e\x32\x63\x2d\x31\x2e\x37\
+\x2c\x30\x2d\x33\x2c\x31\x2e\x33\x2d\x33\x2c\x33\x0a\x09\x73\x31\
+\x2e\x33\x2c\x33\x2c\x33\x2c\x33\x73\x33\x2d\x31\x2e\x33\x2c\x33\
+\x2d\x33\x53\x34\x31\x2e\x32\x2c\x32\x38\x2e\x32\x2c\x33\x39\x2e\
+\x35\x2c\x32\x38\x2e\x32\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\
+\x20\x64\x3d\x22\x4d\x31\x39\x2e\x32\x2c\x38\x32\x2e\x36\x63\x2d\
+\x34\x2e\x37\x2c\x30\x2d\x38\x2e\x36\x2d\x33\x2e\x39\x2d\x38\x2e\
+\x36\x2d\x38\x2e\x36\x73\x33\x2e\x39\x2d\x38\x2e\x36\x2c\x38\x2e\
+\x36\x2d\x38\x2e\x36\x73\x38\x2e\x36\x2c\x33\x2e\x39\x2c\x38\x2e\
+\x36\x2c\x38\x2e\x36\x53\x32\x33\x2e\x39\x2c\x38\x32\x2e\x36\x2c\
+\x31\x39\x2e\x32\x2c\x38\x32\x2e\x36\x7a\x20\x4d\x31\x39\x2e\x32\
+\x2c\x37\x31\x63\x2d\x31\x2e\x37\x2c\x30\x2d\x33\x2c\x31\x2e\x33\
+\x2d\x33\x2c\x33\x0a\x09\x73\x31\x2e\x33\x2c\x33\x2c\x33\x2c\x33\
+\x73\x33\x2d\x31\x2e\x33\x2c\x33\x2d\x33\x53\x32\x30\x2e\x39\x2c\
+\x37\x31\x2c\x31\x39\x2e\x32\x2c\x37\x31\x7a\x22\x2f\x3e\x0a\x3c\
+\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x38\x33\x2e\x31\x2c\x33\x39\
+\x2e\x38\x63\x2d\x34\x2e\x37\x2c\x30\x2d\x38\x2e\x36\x2d\x33\x2e\
+\x39\x2d\x38\x2e\x36\x2d\x38\x2e\x36\x73\x33\x2e\x39\x2d\x38\x2e\
+\x36\x2c\x38\x2e\x36\x2d\x38\x2e\x36\x73\x38\x2e\x36\x2c\x33\x2e\
+\x39\x2c\x38\x2e\x36\x2c\x38\x2e\x36\x53\x38\x37\x2e\x38\x2c\x33\
+\x39\x2e\x38\x2c\x38\x33\x2e\x31\x2c\x33\x39\x2e\x38\x7a\x20\x4d\
+\x38\x33\x2e\x31\x2c\x32\x38\x2e\x32\x63\x2d\x31\x2e\x37\x2c\x30\
+\x2d\x33\x2c\x31\x2e\x33\x2d\x33\x2c\x33\x0a\x09\x73\x31\x2e\x33\
+\x2c\x33\x2c\x33\x2c\x33\x73\x33\x2d\x31\x2e\x33\x2c\x33\x2d\x33\
+\x53\x38\x34\x2e\x38\x2c\x32\x38\x2e\x32\x2c\x38\x33\x2e\x31\x2c\
+\x32\x38\x2e\x32\x7a\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\
+\x3d\x22\x35\x31\x2e\x31\x22\x20\x79\x3d\x22\x34\x39\x2e\x32\x22\
+\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\x74\x72\
+\x69\x78\x28\x30\x2e\x35\x33\x35\x35\x20\x2d\x30\x2e\x38\x34\x34\
+\x35\x20\x30\x2e\x38\x34\x34\x35\x20\x30\x2e\x35\x33\x35\x35\x20\
+\x2d\x31\x31\x2e\x32\x31\x39\x20\x38\x33\x2e\x35\x30\x32\x39\x29\
+\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x33\x38\x2e\x35\x22\x20\x68\
+\x65\x69\x67\x68\x74\x3d\x22\x35\x2e\x35\x22\x2f\x3e\x0a\x3c\x72\
+\x65\x63\x74\x20\x78\x3d\x22\x34\x36\x2e\x34\x22\x20\x79\x3d\x22\
+\x33\x35\x2e\x33\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\
+\x22\x6d\x61\x74\x72\x69\x78\x28\x30\x2e\x39\x30\x30\x31\x20\x2d\
+\x30\x2e\x34\x33\x35\x36\x20\x30\x2e\x34\x33\x35\x36\x20\x30\x2e\
+\x39\x30\x30\x31\x20\x2d\x31\x38\x2e\x30\x30\x35\x39\x20\x32\x36\
+\x2e\x36\x36\x36\x29\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x35\x2e\
+\x35\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x33\x34\x2e\x37\x22\
+\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x31\x30\x22\x20\
+\x79\x3d\x22\x35\x31\x2e\x33\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\
+\x72\x6d\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\x30\x2e\x34\x36\x31\
+\x35\x20\x2d\x30\x2e\x38\x38\x37\x32\x20\x30\x2e\x38\x38\x37\x32\
+\x20\x30\x2e\x34\x36\x31\x35\x20\x2d\x33\x32\x2e\x31\x30\x30\x36\
+\x20\x35\x35\x2e\x31\x31\x38\x38\x29\x22\x20\x77\x69\x64\x74\x68\
+\x3d\x22\x33\x38\x2e\x38\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\
+\x35\x2e\x35\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x02\xed\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\
+\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x67\x20\x69\x64\x3d\x22\x53\x6f\x6c\x69\
+\x64\x22\x3e\x0a\x09\x3c\x67\x3e\x0a\x09\x09\x3c\x70\x6f\x6c\x79\
+\x67\x6f\x6e\x20\x70\x6f\x69\x6e\x74\x73\x3d\x22\x35\x39\x2e\x31\
+\x2c\x33\x2e\x34\x20\x34\x30\x2e\x36\x2c\x33\x2e\x34\x20\x34\x30\
+\x2e\x36\x2c\x34\x30\x2e\x36\x20\x33\x2e\x34\x2c\x34\x30\x2e\x36\
+\x20\x33\x2e\x34\x2c\x35\x39\x2e\x31\x20\x34\x30\x2e\x36\x2c\x35\
+\x39\x2e\x31\x20\x34\x30\x2e\x36\x2c\x39\x36\x2e\x33\x20\x35\x39\
+\x2e\x31\x2c\x39\x36\x2e\x33\x20\x35\x39\x2e\x31\x2c\x35\x39\x2e\
+\x31\x20\x39\x36\x2e\x33\x2c\x35\x39\x2e\x31\x20\x39\x36\x2e\x33\
+\x2c\x34\x30\x2e\x36\x20\x0a\x09\x09\x09\x35\x39\x2e\x31\x2c\x34\
+\x30\x2e\x36\x20\x09\x09\x22\x2f\x3e\x0a\x09\x3c\x2f\x67\x3e\x0a\
+\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x03\x83\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x32\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\
+\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x35\
+\x31\x2e\x34\x2c\x32\x37\x2e\x39\x63\x31\x2e\x39\x2c\x30\x2c\x33\
+\x2e\x38\x2c\x30\x2e\x38\x2c\x35\x2c\x32\x2e\x34\x6c\x32\x38\x2e\
+\x32\x2c\x33\x35\x2e\x31\x63\x32\x2e\x32\x2c\x32\x2e\x38\x2c\x31\
+\x2e\x38\x2c\x36\x2e\x39\x2d\x31\x2c\x39\x2e\x31\x63\x2d\x32\x2e\
+\x38\x2c\x32\x2e\x32\x2d\x36\x2e\x39\x2c\x31\x2e\x38\x2d\x39\x2e\
+\x31\x2d\x31\x4c\x34\x36\x2e\x33\x2c\x33\x38\x2e\x34\x63\x2d\x32\
+\x2e\x32\x2d\x32\x2e\x38\x2d\x31\x2e\x38\x2d\x36\x2e\x39\x2c\x31\
+\x2d\x39\x2e\x31\x0a\x09\x43\x34\x38\x2e\x35\x2c\x32\x38\x2e\x33\
+\x2c\x35\x30\x2c\x32\x37\x2e\x39\x2c\x35\x31\x2e\x34\x2c\x32\x37\
+\x2e\x39\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\
+\x4d\x35\x31\x2e\x34\x2c\x32\x37\x2e\x39\x63\x31\x2e\x34\x2c\x30\
+\x2c\x32\x2e\x39\x2c\x30\x2e\x35\x2c\x34\x2c\x31\x2e\x34\x63\x32\
+\x2e\x38\x2c\x32\x2e\x32\x2c\x33\x2e\x32\x2c\x36\x2e\x33\x2c\x31\
+\x2c\x39\x2e\x31\x4c\x32\x38\x2e\x32\x2c\x37\x33\x2e\x35\x63\x2d\
+\x32\x2e\x32\x2c\x32\x2e\x38\x2d\x36\x2e\x33\x2c\x33\x2e\x32\x2d\
+\x39\x2e\x31\x2c\x31\x63\x2d\x32\x2e\x38\x2d\x32\x2e\x32\x2d\x33\
+\x2e\x32\x2d\x36\x2e\x33\x2d\x31\x2d\x39\x2e\x31\x6c\x32\x38\x2e\
+\x32\x2d\x33\x35\x2e\x31\x0a\x09\x43\x34\x37\x2e\x36\x2c\x32\x38\
+\x2e\x37\x2c\x34\x39\x2e\x35\x2c\x32\x37\x2e\x39\x2c\x35\x31\x2e\
+\x34\x2c\x32\x37\x2e\x39\x7a\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\
+\x3e\x0a\
+\x00\x00\x03\xf9\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\
+\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x36\
+\x36\x2e\x37\x2c\x35\x34\x2e\x34\x68\x2d\x36\x56\x33\x37\x2e\x39\
+\x48\x34\x35\x2e\x34\x76\x2d\x36\x68\x31\x36\x2e\x33\x63\x32\x2e\
+\x38\x2c\x30\x2c\x35\x2c\x32\x2e\x32\x2c\x35\x2c\x35\x56\x35\x34\
+\x2e\x34\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\
+\x4d\x35\x33\x2e\x34\x2c\x36\x37\x2e\x34\x48\x33\x36\x2e\x33\x63\
+\x2d\x32\x2e\x38\x2c\x30\x2d\x35\x2d\x32\x2e\x32\x2d\x35\x2d\x35\
+\x56\x34\x35\x2e\x31\x68\x36\x76\x31\x36\x2e\x33\x68\x31\x36\x2e\
+\x31\x56\x36\x37\x2e\x34\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\
+\x20\x64\x3d\x22\x4d\x34\x32\x2e\x35\x2c\x34\x37\x2e\x36\x48\x32\
+\x32\x2e\x39\x63\x2d\x32\x2e\x38\x2c\x30\x2d\x35\x2d\x32\x2e\x32\
+\x2d\x35\x2d\x35\x56\x32\x33\x63\x30\x2d\x32\x2e\x38\x2c\x32\x2e\
+\x32\x2d\x35\x2c\x35\x2d\x35\x68\x31\x39\x2e\x36\x63\x32\x2e\x38\
+\x2c\x30\x2c\x35\x2c\x32\x2e\x32\x2c\x35\x2c\x35\x76\x31\x39\x2e\
+\x36\x43\x34\x37\x2e\x35\x2c\x34\x35\x2e\x34\x2c\x34\x35\x2e\x33\
+\x2c\x34\x37\x2e\x36\x2c\x34\x32\x2e\x35\x2c\x34\x37\x2e\x36\x7a\
+\x20\x4d\x32\x33\x2e\x39\x2c\x34\x31\x2e\x36\x0a\x09\x68\x31\x37\
+\x2e\x36\x56\x32\x34\x48\x32\x33\x2e\x39\x56\x34\x31\x2e\x36\x7a\
+\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x37\x35\
+\x2e\x37\x2c\x38\x31\x2e\x33\x48\x35\x36\x2e\x31\x63\x2d\x32\x2e\
+\x38\x2c\x30\x2d\x35\x2d\x32\x2e\x32\x2d\x35\x2d\x35\x56\x35\x36\
+\x2e\x38\x63\x30\x2d\x32\x2e\x38\x2c\x32\x2e\x32\x2d\x35\x2c\x35\
+\x2d\x35\x68\x31\x39\x2e\x36\x63\x32\x2e\x38\x2c\x30\x2c\x35\x2c\
+\x32\x2e\x32\x2c\x35\x2c\x35\x76\x31\x39\x2e\x36\x43\x38\x30\x2e\
+\x37\x2c\x37\x39\x2e\x31\x2c\x37\x38\x2e\x35\x2c\x38\x31\x2e\x33\
+\x2c\x37\x35\x2e\x37\x2c\x38\x31\x2e\x33\x7a\x0a\x09\x20\x4d\x35\
+\x37\x2e\x31\x2c\x37\x35\x2e\x33\x68\x31\x37\x2e\x36\x56\x35\x37\
+\x2e\x38\x48\x35\x37\x2e\x31\x56\x37\x35\x2e\x33\x7a\x22\x2f\x3e\
+\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x04\x7b\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x32\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x34\x34\x30\x20\x34\x34\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x34\x34\x30\x20\
+\x34\x34\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\
+\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x33\x37\x33\x2e\x31\x2c\x33\x34\x34\
+\x2e\x34\x56\x32\x37\x33\x63\x2d\x33\x31\x2d\x32\x37\x2e\x34\x2d\
+\x35\x30\x2e\x33\x2d\x34\x34\x2e\x35\x2d\x35\x38\x2d\x35\x31\x2e\
+\x33\x63\x2d\x37\x2e\x35\x2d\x36\x2e\x36\x2d\x31\x38\x2e\x31\x2d\
+\x36\x2d\x32\x34\x2e\x39\x2c\x31\x2e\x34\x63\x2d\x31\x33\x2e\x33\
+\x2c\x31\x34\x2e\x34\x2d\x34\x37\x2c\x35\x31\x2e\x31\x2d\x36\x31\
+\x2e\x37\x2c\x36\x37\x2e\x31\x0a\x09\x63\x2d\x32\x2e\x36\x2c\x32\
+\x2e\x38\x2d\x36\x2e\x37\x2c\x33\x2d\x39\x2e\x35\x2c\x30\x2e\x33\
+\x63\x2d\x37\x2d\x36\x2e\x38\x2d\x31\x37\x2e\x34\x2d\x31\x36\x2e\
+\x39\x2d\x32\x32\x2e\x39\x2d\x32\x32\x2e\x33\x63\x2d\x36\x2e\x38\
+\x2d\x36\x2e\x36\x2d\x31\x37\x2d\x36\x2e\x34\x2d\x32\x33\x2e\x35\
+\x2c\x30\x2e\x36\x63\x2d\x31\x30\x2e\x34\x2c\x31\x31\x2e\x31\x2d\
+\x33\x36\x2e\x33\x2c\x33\x38\x2e\x38\x2d\x37\x37\x2e\x39\x2c\x38\
+\x33\x2e\x31\x4c\x33\x37\x33\x2e\x31\x2c\x33\x34\x34\x2e\x34\x7a\
+\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x33\x35\
+\x38\x2e\x34\x2c\x37\x37\x2e\x38\x48\x38\x31\x2e\x36\x63\x2d\x31\
+\x37\x2c\x30\x2d\x33\x30\x2e\x38\x2c\x31\x33\x2e\x38\x2d\x33\x30\
+\x2e\x38\x2c\x33\x30\x2e\x38\x76\x32\x32\x32\x2e\x39\x63\x30\x2c\
+\x31\x37\x2c\x31\x33\x2e\x38\x2c\x33\x30\x2e\x38\x2c\x33\x30\x2e\
+\x38\x2c\x33\x30\x2e\x38\x68\x32\x37\x36\x2e\x39\x63\x31\x37\x2c\
+\x30\x2c\x33\x30\x2e\x38\x2d\x31\x33\x2e\x38\x2c\x33\x30\x2e\x38\
+\x2d\x33\x30\x2e\x38\x56\x31\x30\x38\x2e\x36\x0a\x09\x43\x33\x38\
+\x39\x2e\x32\x2c\x39\x31\x2e\x36\x2c\x33\x37\x35\x2e\x35\x2c\x37\
+\x37\x2e\x38\x2c\x33\x35\x38\x2e\x34\x2c\x37\x37\x2e\x38\x7a\x20\
+\x4d\x33\x36\x35\x2e\x36\x2c\x33\x32\x31\x2e\x32\x63\x30\x2c\x31\
+\x31\x2e\x31\x2d\x39\x2c\x32\x30\x2e\x31\x2d\x32\x30\x2e\x31\x2c\
+\x32\x30\x2e\x31\x48\x39\x34\x2e\x38\x63\x2d\x31\x31\x2e\x31\x2c\
+\x30\x2d\x32\x30\x2e\x31\x2d\x39\x2d\x32\x30\x2e\x31\x2d\x32\x30\
+\x2e\x31\x76\x2d\x32\x30\x32\x0a\x09\x63\x30\x2d\x31\x31\x2e\x31\
+\x2c\x39\x2d\x32\x30\x2e\x31\x2c\x32\x30\x2e\x31\x2d\x32\x30\x2e\
+\x31\x68\x32\x35\x30\x2e\x37\x63\x31\x31\x2e\x31\x2c\x30\x2c\x32\
+\x30\x2e\x31\x2c\x39\x2c\x32\x30\x2e\x31\x2c\x32\x30\x2e\x31\x56\
+\x33\x32\x31\x2e\x32\x7a\x22\x2f\x3e\x0a\x3c\x63\x69\x72\x63\x6c\
+\x65\x20\x63\x78\x3d\x22\x31\x35\x37\x2e\x31\x22\x20\x63\x79\x3d\
+\x22\x31\x36\x34\x2e\x32\x22\x20\x72\x3d\x22\x33\x30\x2e\x34\x22\
+\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x03\x6e\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x38\
+\x30\x2e\x36\x32\x6d\x6d\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\
+\x31\x38\x30\x2e\x36\x32\x6d\x6d\x22\x20\x76\x69\x65\x77\x42\x6f\
+\x78\x3d\x22\x30\x20\x30\x20\x35\x31\x32\x20\x35\x31\x32\x22\x3e\
+\x3c\x73\x74\x79\x6c\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\
+\x74\x2f\x63\x73\x73\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\
+\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\
+\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\
+\x20\x30\x2e\x35\x3b\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\
+\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\
+\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\
+\x79\x3a\x20\x30\x2e\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\
+\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\
+\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\
+\x74\x79\x3a\x20\x30\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\
+\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\
+\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\
+\x79\x3a\x20\x30\x2e\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\
+\x3e\x0a\x20\x20\x3c\x74\x69\x74\x6c\x65\x3e\x41\x72\x74\x62\x6f\
+\x61\x72\x64\x20\x31\x3c\x2f\x74\x69\x74\x6c\x65\x3e\x0a\x20\x20\
+\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x33\x39\x34\x2e\x35\x36\
+\x2c\x32\x39\x38\x2e\x34\x34\x73\x2d\x33\x38\x2e\x34\x35\x2c\x35\
+\x35\x2e\x36\x36\x2d\x33\x38\x2e\x34\x35\x2c\x37\x36\x2e\x38\x39\
+\x61\x33\x38\x2e\x34\x35\x2c\x33\x38\x2e\x34\x35\x2c\x30\x2c\x31\
+\x2c\x30\x2c\x37\x36\x2e\x38\x39\x2c\x30\x43\x34\x33\x33\x2c\x33\
+\x35\x34\x2e\x31\x2c\x33\x39\x34\x2e\x35\x36\x2c\x32\x39\x38\x2e\
+\x34\x34\x2c\x33\x39\x34\x2e\x35\x36\x2c\x32\x39\x38\x2e\x34\x34\
+\x5a\x6d\x2d\x35\x2e\x36\x33\x2d\x36\x31\x2e\x38\x33\x4c\x32\x36\
+\x34\x2e\x31\x37\x2c\x31\x31\x31\x2e\x38\x35\x61\x31\x39\x2e\x32\
+\x32\x2c\x31\x39\x2e\x32\x32\x2c\x30\x2c\x30\x2c\x30\x2d\x32\x37\
+\x2e\x31\x38\x2c\x30\x6c\x2d\x34\x39\x2c\x34\x39\x2d\x35\x31\x2e\
+\x37\x37\x2d\x35\x31\x2e\x37\x37\x61\x39\x2e\x36\x2c\x39\x2e\x36\
+\x2c\x30\x2c\x30\x2c\x30\x2d\x31\x33\x2e\x35\x38\x2c\x30\x4c\x31\
+\x30\x39\x2c\x31\x32\x32\x2e\x36\x37\x61\x39\x2e\x36\x31\x2c\x39\
+\x2e\x36\x31\x2c\x30\x2c\x30\x2c\x30\x2c\x30\x2c\x31\x33\x2e\x35\
+\x39\x4c\x31\x36\x30\x2e\x38\x31\x2c\x31\x38\x38\x2c\x31\x30\x33\
+\x2e\x38\x39\x2c\x32\x34\x35\x61\x35\x37\x2e\x36\x35\x2c\x35\x37\
+\x2e\x36\x35\x2c\x30\x2c\x30\x2c\x30\x2c\x30\x2c\x38\x31\x2e\x35\
+\x34\x6c\x37\x30\x2e\x34\x2c\x37\x30\x2e\x34\x61\x35\x37\x2e\x36\
+\x35\x2c\x35\x37\x2e\x36\x35\x2c\x30\x2c\x30\x2c\x30\x2c\x38\x31\
+\x2e\x35\x34\x2c\x30\x6c\x31\x33\x33\x2e\x30\x39\x2d\x31\x33\x33\
+\x2e\x31\x41\x31\x39\x2e\x32\x32\x2c\x31\x39\x2e\x32\x32\x2c\x30\
+\x2c\x30\x2c\x30\x2c\x33\x38\x38\x2e\x39\x33\x2c\x32\x33\x36\x2e\
+\x36\x31\x5a\x6d\x2d\x36\x39\x2e\x38\x31\x2c\x34\x32\x2e\x36\x33\
+\x48\x31\x32\x36\x2e\x36\x61\x31\x38\x2e\x37\x34\x2c\x31\x38\x2e\
+\x37\x34\x2c\x30\x2c\x30\x2c\x31\x2c\x34\x2e\x34\x37\x2d\x37\x2e\
+\x31\x31\x6c\x37\x2e\x39\x2d\x37\x2e\x39\x2c\x34\x39\x2d\x34\x39\
+\x2c\x33\x35\x2e\x32\x2c\x33\x35\x2e\x32\x61\x31\x39\x2e\x32\x32\
+\x2c\x31\x39\x2e\x32\x32\x2c\x30\x2c\x30\x2c\x30\x2c\x32\x37\x2e\
+\x31\x38\x2d\x32\x37\x2e\x31\x37\x4c\x32\x31\x35\x2e\x31\x36\x2c\
+\x31\x38\x38\x6c\x33\x35\x2e\x34\x32\x2d\x33\x35\x2e\x34\x32\x2c\
+\x39\x37\x2e\x35\x37\x2c\x39\x37\x2e\x35\x38\x2d\x32\x39\x2c\x32\
+\x39\x5a\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x02\xf5\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\
+\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x67\x20\
+\x69\x64\x3d\x22\x53\x6f\x6c\x69\x64\x22\x3e\x0a\x09\x3c\x67\x3e\
+\x0a\x09\x09\x3c\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x70\x6f\x69\x6e\
+\x74\x73\x3d\x22\x35\x39\x2e\x31\x2c\x33\x2e\x34\x20\x34\x30\x2e\
+\x36\x2c\x33\x2e\x34\x20\x34\x30\x2e\x36\x2c\x34\x30\x2e\x36\x20\
+\x33\x2e\x34\x2c\x34\x30\x2e\x36\x20\x33\x2e\x34\x2c\x35\x39\x2e\
+\x31\x20\x34\x30\x2e\x36\x2c\x35\x39\x2e\x31\x20\x34\x30\x2e\x36\
+\x2c\x39\x36\x2e\x33\x20\x35\x39\x2e\x31\x2c\x39\x36\x2e\x33\x20\
+\x35\x39\x2e\x31\x2c\x35\x39\x2e\x31\x20\x39\x36\x2e\x33\x2c\x35\
+\x39\x2e\x31\x20\x39\x36\x2e\x33\x2c\x34\x30\x2e\x36\x20\x0a\x09\
+\x09\x09\x35\x39\x2e\x31\x2c\x34\x30\x2e\x36\x20\x09\x09\x22\x2f\
+\x3e\x0a\x09\x3c\x2f\x67\x3e\x0a\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\
+\x76\x67\x3e\x0a\
+\x00\x00\x03\x27\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\
+\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x63\x69\
+\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x35\x38\x2e\x31\x22\x20\x63\
+\x79\x3d\x22\x32\x33\x2e\x35\x22\x20\x72\x3d\x22\x36\x2e\x39\x22\
+\x2f\x3e\x0a\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x35\
+\x35\x2e\x38\x22\x20\x63\x79\x3d\x22\x35\x32\x2e\x35\x22\x20\x72\
+\x3d\x22\x36\x2e\x39\x22\x2f\x3e\x0a\x3c\x63\x69\x72\x63\x6c\x65\
+\x20\x63\x78\x3d\x22\x33\x30\x22\x20\x63\x79\x3d\x22\x33\x39\x2e\
+\x38\x22\x20\x72\x3d\x22\x36\x2e\x39\x22\x2f\x3e\x0a\x3c\x63\x69\
+\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x32\x33\x2e\x31\x22\x20\x63\
+\x79\x3d\x22\x36\x32\x2e\x36\x22\x20\x72\x3d\x22\x36\x2e\x39\x22\
+\x2f\x3e\x0a\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x35\
+\x35\x2e\x38\x22\x20\x63\x79\x3d\x22\x37\x37\x2e\x36\x22\x20\x72\
+\x3d\x22\x36\x2e\x39\x22\x2f\x3e\x0a\x3c\x63\x69\x72\x63\x6c\x65\
+\x20\x63\x78\x3d\x22\x37\x37\x2e\x32\x22\x20\x63\x79\x3d\x22\x34\
+\x36\x2e\x37\x22\x20\x72\x3d\x22\x36\x2e\x39\x22\x2f\x3e\x0a\x3c\
+\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x02\xf1\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x32\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x37\x37\x2e\x36\x20\x39\x34\x2e\x38\x22\x20\x73\x74\
+\x79\x6c\x65\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\
+\x67\x72\x6f\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\
+\x37\x37\x2e\x36\x20\x39\x34\x2e\x38\x3b\x22\x20\x78\x6d\x6c\x3a\
+\x73\x70\x61\x63\x65\x3d\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\
+\x3e\x3c\x73\x74\x79\x6c\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\
+\x78\x74\x2f\x63\x73\x73\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\
+\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\
+\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\
+\x3a\x20\x30\x2e\x35\x3b\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\
+\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\
+\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\
+\x74\x79\x3a\x20\x30\x2e\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\
+\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\
+\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\
+\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\
+\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\
+\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\
+\x74\x79\x3a\x20\x30\x2e\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\
+\x65\x3e\x0a\x3c\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x70\x6f\x69\x6e\
+\x74\x73\x3d\x22\x30\x2e\x35\x2c\x34\x37\x2e\x34\x20\x35\x38\x2e\
+\x37\x2c\x39\x34\x2e\x38\x20\x35\x38\x2e\x37\x2c\x30\x20\x22\x2f\
+\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x35\x38\x2e\x36\x22\
+\x20\x79\x3d\x22\x33\x31\x2e\x32\x22\x20\x74\x72\x61\x6e\x73\x66\
+\x6f\x72\x6d\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\x2d\x31\x20\x2d\
+\x31\x2e\x32\x32\x34\x36\x34\x37\x65\x2d\x31\x36\x20\x31\x2e\x32\
+\x32\x34\x36\x34\x37\x65\x2d\x31\x36\x20\x2d\x31\x20\x32\x33\x36\
+\x2e\x31\x36\x38\x37\x20\x39\x34\x2e\x38\x29\x22\x20\x77\x69\x64\
+\x74\x68\x3d\x22\x31\x31\x39\x22\x20\x68\x65\x69\x67\x68\x74\x3d\
+\x22\x33\x32\x2e\x34\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\
+\x00\x00\x02\xea\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x32\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\
+\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x6f\
+\x6c\x79\x67\x6f\x6e\x20\x70\x6f\x69\x6e\x74\x73\x3d\x22\x32\x35\
+\x2e\x34\x2c\x35\x30\x20\x38\x33\x2e\x36\x2c\x39\x37\x2e\x34\x20\
+\x38\x33\x2e\x36\x2c\x32\x2e\x36\x20\x22\x2f\x3e\x0a\x3c\x72\x65\
+\x63\x74\x20\x78\x3d\x22\x31\x33\x2e\x38\x22\x20\x79\x3d\x22\x32\
+\x2e\x36\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\
+\x61\x74\x72\x69\x78\x28\x2d\x31\x20\x2d\x31\x2e\x32\x32\x34\x36\
+\x34\x37\x65\x2d\x31\x36\x20\x31\x2e\x32\x32\x34\x36\x34\x37\x65\
+\x2d\x31\x36\x20\x2d\x31\x20\x34\x30\x2e\x31\x38\x32\x36\x20\x31\
+\x30\x30\x29\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x32\x2e\x35\
+\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x39\x34\x2e\x38\x22\x2f\
+\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x03\xd8\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x38\
+\x30\x2e\x36\x32\x6d\x6d\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\
+\x31\x38\x30\x2e\x36\x32\x6d\x6d\x22\x20\x76\x69\x65\x77\x42\x6f\
+\x78\x3d\x22\x30\x20\x30\x20\x35\x31\x32\x20\x35\x31\x32\x22\x3e\
+\x3c\x73\x74\x79\x6c\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\
+\x74\x2f\x63\x73\x73\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\
+\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\
+\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\
+\x20\x31\x3b\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\
+\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\
+\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\
+\x20\x31\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\
+\x6c\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\
+\x20\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\
+\x31\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\
+\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\
+\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\
+\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x20\x20\x3c\x74\x69\x74\
+\x6c\x65\x3e\x41\x72\x74\x62\x6f\x61\x72\x64\x20\x31\x3c\x2f\x74\
+\x69\x74\x6c\x65\x3e\x0a\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\
+\x22\x4d\x34\x35\x30\x2e\x31\x38\x2c\x33\x33\x35\x2e\x39\x34\x61\
+\x31\x38\x2e\x36\x31\x2c\x31\x38\x2e\x36\x31\x2c\x30\x2c\x30\x2c\
+\x31\x2c\x30\x2c\x32\x36\x2e\x33\x34\x6c\x2d\x36\x32\x2e\x30\x37\
+\x2c\x36\x32\x2e\x30\x36\x63\x2d\x31\x31\x2e\x36\x35\x2c\x31\x31\
+\x2e\x36\x35\x2d\x33\x31\x2e\x37\x39\x2c\x33\x2e\x34\x38\x2d\x33\
+\x31\x2e\x37\x39\x2d\x31\x33\x2e\x31\x37\x76\x2d\x33\x31\x48\x33\
+\x31\x30\x2e\x37\x31\x61\x39\x2e\x32\x39\x2c\x39\x2e\x32\x39\x2c\
+\x30\x2c\x30\x2c\x31\x2d\x36\x2e\x38\x31\x2d\x33\x6c\x2d\x35\x34\
+\x2e\x37\x35\x2d\x35\x38\x2e\x36\x36\x2c\x34\x31\x2e\x33\x38\x2d\
+\x34\x34\x2e\x33\x34\x2c\x34\x31\x2c\x34\x33\x2e\x38\x38\x68\x32\
+\x34\x2e\x38\x33\x76\x2d\x33\x31\x63\x30\x2d\x31\x36\x2e\x36\x33\
+\x2c\x32\x30\x2e\x31\x33\x2d\x32\x34\x2e\x38\x33\x2c\x33\x31\x2e\
+\x37\x39\x2d\x31\x33\x2e\x31\x37\x5a\x6d\x2d\x33\x38\x32\x2e\x35\
+\x31\x2d\x31\x34\x32\x68\x36\x35\x2e\x31\x38\x6c\x34\x31\x2c\x34\
+\x33\x2e\x38\x38\x2c\x34\x31\x2e\x33\x38\x2d\x34\x34\x2e\x33\x34\
+\x2d\x35\x34\x2e\x37\x35\x2d\x35\x38\x2e\x36\x36\x61\x39\x2e\x32\
+\x39\x2c\x39\x2e\x32\x39\x2c\x30\x2c\x30\x2c\x30\x2d\x36\x2e\x38\
+\x2d\x33\x68\x2d\x38\x36\x61\x39\x2e\x33\x31\x2c\x39\x2e\x33\x31\
+\x2c\x30\x2c\x30\x2c\x30\x2d\x39\x2e\x33\x31\x2c\x39\x2e\x33\x31\
+\x76\x34\x33\x2e\x34\x35\x41\x39\x2e\x33\x31\x2c\x39\x2e\x33\x31\
+\x2c\x30\x2c\x30\x2c\x30\x2c\x36\x37\x2e\x36\x37\x2c\x31\x39\x33\
+\x2e\x39\x33\x5a\x6d\x32\x38\x38\x2e\x36\x35\x2c\x30\x76\x33\x31\
+\x63\x30\x2c\x31\x36\x2e\x36\x35\x2c\x32\x30\x2e\x31\x34\x2c\x32\
+\x34\x2e\x38\x31\x2c\x33\x31\x2e\x37\x39\x2c\x31\x33\x2e\x31\x37\
+\x6c\x36\x32\x2e\x30\x37\x2d\x36\x32\x2e\x30\x36\x61\x31\x38\x2e\
+\x36\x31\x2c\x31\x38\x2e\x36\x31\x2c\x30\x2c\x30\x2c\x30\x2c\x30\
+\x2d\x32\x36\x2e\x33\x34\x4c\x33\x38\x38\x2e\x31\x31\x2c\x38\x37\
+\x2e\x36\x36\x43\x33\x37\x36\x2e\x34\x35\x2c\x37\x36\x2c\x33\x35\
+\x36\x2e\x33\x32\x2c\x38\x34\x2e\x32\x2c\x33\x35\x36\x2e\x33\x32\
+\x2c\x31\x30\x30\x2e\x38\x33\x76\x33\x31\x48\x33\x31\x30\x2e\x37\
+\x31\x61\x39\x2e\x32\x39\x2c\x39\x2e\x32\x39\x2c\x30\x2c\x30\x2c\
+\x30\x2d\x36\x2e\x38\x31\x2c\x33\x6c\x2d\x31\x37\x31\x2c\x31\x38\
+\x33\x2e\x32\x36\x48\x36\x37\x2e\x36\x37\x61\x39\x2e\x33\x31\x2c\
+\x39\x2e\x33\x31\x2c\x30\x2c\x30\x2c\x30\x2d\x39\x2e\x33\x31\x2c\
+\x39\x2e\x33\x32\x76\x34\x33\x2e\x34\x35\x61\x39\x2e\x33\x31\x2c\
+\x39\x2e\x33\x31\x2c\x30\x2c\x30\x2c\x30\x2c\x39\x2e\x33\x31\x2c\
+\x39\x2e\x33\x31\x68\x38\x36\x61\x39\x2e\x32\x39\x2c\x39\x2e\x32\
+\x39\x2c\x30\x2c\x30\x2c\x30\x2c\x36\x2e\x38\x2d\x33\x4c\x33\x33\
+\x31\x2e\x34\x39\x2c\x31\x39\x33\x2e\x39\x33\x5a\x22\x2f\x3e\x0a\
+\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x03\xf1\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\
+\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x67\x20\
+\x69\x64\x3d\x22\x53\x6f\x6c\x69\x64\x22\x3e\x0a\x09\x3c\x67\x3e\
+\x0a\x09\x09\x3c\x70\x61\x74\x68\x20\x63\x6c\x61\x73\x73\x3d\x22\
+\x73\x74\x30\x22\x20\x64\x3d\x22\x4d\x35\x30\x2c\x31\x33\x2e\x36\
+\x63\x2d\x32\x30\x2c\x30\x2d\x33\x36\x2e\x33\x2c\x31\x36\x2e\x33\
+\x2d\x33\x36\x2e\x33\x2c\x33\x36\x2e\x33\x63\x30\x2c\x32\x30\x2c\
+\x31\x36\x2e\x33\x2c\x33\x36\x2e\x33\x2c\x33\x36\x2e\x33\x2c\x33\
+\x36\x2e\x33\x43\x37\x30\x2c\x38\x36\x2e\x33\x2c\x38\x36\x2e\x33\
+\x2c\x37\x30\x2c\x38\x36\x2e\x33\x2c\x35\x30\x0a\x09\x09\x09\x43\
+\x38\x36\x2e\x33\x2c\x32\x39\x2e\x39\x2c\x37\x30\x2c\x31\x33\x2e\
+\x36\x2c\x35\x30\x2c\x31\x33\x2e\x36\x7a\x20\x4d\x35\x30\x2c\x37\
+\x39\x63\x2d\x31\x36\x2c\x30\x2d\x32\x39\x2e\x31\x2d\x31\x33\x2d\
+\x32\x39\x2e\x31\x2d\x32\x39\x2e\x31\x63\x30\x2d\x31\x36\x2c\x31\
+\x33\x2d\x32\x39\x2e\x31\x2c\x32\x39\x2e\x31\x2d\x32\x39\x2e\x31\
+\x43\x36\x36\x2c\x32\x30\x2e\x39\x2c\x37\x39\x2c\x33\x33\x2e\x39\
+\x2c\x37\x39\x2c\x35\x30\x43\x37\x39\x2c\x36\x36\x2c\x36\x36\x2c\
+\x37\x39\x2c\x35\x30\x2c\x37\x39\x7a\x22\x2f\x3e\x0a\x09\x09\x3c\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x63\x6c\x61\x73\x73\x3d\x22\x73\
+\x74\x30\x22\x20\x70\x6f\x69\x6e\x74\x73\x3d\x22\x35\x33\x2e\x36\
+\x2c\x33\x31\x2e\x38\x20\x34\x36\x2e\x33\x2c\x33\x31\x2e\x38\x20\
+\x34\x36\x2e\x33\x2c\x34\x36\x2e\x33\x20\x33\x31\x2e\x38\x2c\x34\
+\x36\x2e\x33\x20\x33\x31\x2e\x38\x2c\x35\x33\x2e\x36\x20\x34\x36\
+\x2e\x33\x2c\x35\x33\x2e\x36\x20\x34\x36\x2e\x33\x2c\x36\x38\x2e\
+\x31\x20\x35\x33\x2e\x36\x2c\x36\x38\x2e\x31\x20\x35\x33\x2e\x36\
+\x2c\x35\x33\x2e\x36\x20\x0a\x09\x09\x09\x36\x38\x2e\x31\x2c\x35\
+\x33\x2e\x36\x20\x36\x38\x2e\x31\x2c\x34\x36\x2e\x33\x20\x35\x33\
+\x2e\x36\x2c\x34\x36\x2e\x33\x20\x09\x09\x22\x2f\x3e\x0a\x09\x3c\
+\x2f\x67\x3e\x0a\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\
+\x00\x00\x03\x85\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\
+\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x33\
+\x31\x2e\x38\x2c\x35\x36\x2e\x34\x63\x2d\x31\x2e\x39\x2c\x30\x2d\
+\x33\x2e\x38\x2d\x30\x2e\x38\x2d\x35\x2d\x32\x2e\x34\x63\x2d\x32\
+\x2e\x32\x2d\x32\x2e\x38\x2d\x31\x2e\x38\x2d\x36\x2e\x39\x2c\x31\
+\x2d\x39\x2e\x31\x6c\x33\x35\x2e\x31\x2d\x32\x38\x2e\x32\x63\x32\
+\x2e\x38\x2d\x32\x2e\x32\x2c\x36\x2e\x39\x2d\x31\x2e\x38\x2c\x39\
+\x2e\x31\x2c\x31\x63\x32\x2e\x32\x2c\x32\x2e\x38\x2c\x31\x2e\x38\
+\x2c\x36\x2e\x39\x2d\x31\x2c\x39\x2e\x31\x4c\x33\x35\x2e\x38\x2c\
+\x35\x34\x2e\x39\x0a\x09\x43\x33\x34\x2e\x36\x2c\x35\x35\x2e\x39\
+\x2c\x33\x33\x2e\x32\x2c\x35\x36\x2e\x34\x2c\x33\x31\x2e\x38\x2c\
+\x35\x36\x2e\x34\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\
+\x3d\x22\x4d\x36\x36\x2e\x39\x2c\x38\x34\x2e\x36\x63\x2d\x31\x2e\
+\x34\x2c\x30\x2d\x32\x2e\x39\x2d\x30\x2e\x35\x2d\x34\x2d\x31\x2e\
+\x34\x4c\x32\x37\x2e\x37\x2c\x35\x34\x2e\x39\x63\x2d\x32\x2e\x38\
+\x2d\x32\x2e\x32\x2d\x33\x2e\x32\x2d\x36\x2e\x33\x2d\x31\x2d\x39\
+\x2e\x31\x63\x32\x2e\x32\x2d\x32\x2e\x38\x2c\x36\x2e\x33\x2d\x33\
+\x2e\x32\x2c\x39\x2e\x31\x2d\x31\x6c\x33\x35\x2e\x31\x2c\x32\x38\
+\x2e\x32\x63\x32\x2e\x38\x2c\x32\x2e\x32\x2c\x33\x2e\x32\x2c\x36\
+\x2e\x33\x2c\x31\x2c\x39\x2e\x31\x0a\x09\x43\x37\x30\x2e\x36\x2c\
+\x38\x33\x2e\x38\x2c\x36\x38\x2e\x38\x2c\x38\x34\x2e\x36\x2c\x36\
+\x36\x2e\x39\x2c\x38\x34\x2e\x36\x7a\x22\x2f\x3e\x0a\x3c\x2f\x73\
+\x76\x67\x3e\x0a\
+\x00\x00\x03\xed\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\
+\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x35\
+\x30\x2e\x35\x2c\x37\x37\x2e\x33\x43\x32\x36\x2e\x37\x2c\x37\x37\
+\x2e\x33\x2c\x38\x2e\x31\x2c\x35\x32\x2e\x31\x2c\x37\x2e\x33\x2c\
+\x35\x31\x4c\x36\x2c\x34\x39\x2e\x32\x6c\x31\x2e\x33\x2d\x31\x2e\
+\x38\x43\x38\x2e\x31\x2c\x34\x36\x2e\x33\x2c\x32\x36\x2e\x37\x2c\
+\x32\x31\x2c\x35\x30\x2e\x35\x2c\x32\x31\x73\x34\x32\x2e\x34\x2c\
+\x32\x35\x2e\x33\x2c\x34\x33\x2e\x32\x2c\x32\x36\x2e\x33\x6c\x31\
+\x2e\x33\x2c\x31\x2e\x38\x4c\x39\x33\x2e\x37\x2c\x35\x31\x0a\x09\
+\x43\x39\x32\x2e\x39\x2c\x35\x32\x2e\x31\x2c\x37\x34\x2e\x33\x2c\
+\x37\x37\x2e\x33\x2c\x35\x30\x2e\x35\x2c\x37\x37\x2e\x33\x7a\x20\
+\x4d\x31\x33\x2e\x38\x2c\x34\x39\x2e\x32\x63\x34\x2e\x36\x2c\x35\
+\x2e\x36\x2c\x31\x39\x2e\x35\x2c\x32\x31\x2e\x39\x2c\x33\x36\x2e\
+\x37\x2c\x32\x31\x2e\x39\x73\x33\x32\x2e\x31\x2d\x31\x36\x2e\x34\
+\x2c\x33\x36\x2e\x37\x2d\x32\x31\x2e\x39\x63\x2d\x34\x2e\x36\x2d\
+\x35\x2e\x36\x2d\x31\x39\x2e\x35\x2d\x32\x31\x2e\x39\x2d\x33\x36\
+\x2e\x37\x2d\x32\x31\x2e\x39\x0a\x09\x43\x33\x33\x2e\x33\x2c\x32\
+\x37\x2e\x32\x2c\x31\x38\x2e\x34\x2c\x34\x33\x2e\x36\x2c\x31\x33\
+\x2e\x38\x2c\x34\x39\x2e\x32\x7a\x22\x2f\x3e\x0a\x3c\x63\x69\x72\
+\x63\x6c\x65\x20\x63\x78\x3d\x22\x35\x30\x2e\x35\x22\x20\x63\x79\
+\x3d\x22\x34\x39\x2e\x32\x22\x20\x72\x3d\x22\x31\x37\x2e\x33\x22\
+\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x31\x2e\x31\x22\
+\x20\x79\x3d\x22\x34\x34\x2e\x36\x22\x20\x74\x72\x61\x6e\x73\x66\
+\x6f\x72\x6d\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\x30\x2e\x38\x31\
+\x38\x38\x20\x2d\x30\x2e\x35\x37\x34\x31\x20\x30\x2e\x35\x37\x34\
+\x31\x20\x30\x2e\x38\x31\x38\x38\x20\x2d\x31\x39\x2e\x31\x32\x39\
+\x31\x20\x33\x37\x2e\x36\x39\x38\x29\x22\x20\x77\x69\x64\x74\x68\
+\x3d\x22\x39\x38\x2e\x31\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\
+\x39\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x02\xb1\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x32\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x37\x37\x2e\x36\x20\x39\x34\x2e\x38\x22\x20\x73\x74\
+\x79\x6c\x65\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\
+\x67\x72\x6f\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\
+\x37\x37\x2e\x36\x20\x39\x34\x2e\x38\x3b\x22\x20\x78\x6d\x6c\x3a\
+\x73\x70\x61\x63\x65\x3d\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\
+\x3e\x3c\x73\x74\x79\x6c\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\
+\x78\x74\x2f\x63\x73\x73\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\
+\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\
+\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\
+\x3a\x20\x30\x2e\x35\x3b\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\
+\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\
+\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\
+\x74\x79\x3a\x20\x30\x2e\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\
+\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\
+\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\
+\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\
+\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\
+\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\
+\x74\x79\x3a\x20\x30\x2e\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\
+\x65\x3e\x0a\x3c\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x70\x6f\x69\x6e\
+\x74\x73\x3d\x22\x31\x37\x37\x2e\x36\x2c\x34\x37\x2e\x34\x20\x31\
+\x31\x39\x2e\x34\x2c\x30\x20\x31\x31\x39\x2e\x34\x2c\x39\x34\x2e\
+\x38\x20\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x30\
+\x2e\x35\x22\x20\x79\x3d\x22\x33\x31\x2e\x32\x22\x20\x77\x69\x64\
+\x74\x68\x3d\x22\x31\x31\x39\x22\x20\x68\x65\x69\x67\x68\x74\x3d\
+\x22\x33\x32\x2e\x34\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\
+\x00\x00\x02\x75\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x36\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\
+\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x6f\
+\x6c\x79\x67\x6f\x6e\x20\x70\x6f\x69\x6e\x74\x73\x3d\x22\x32\x30\
+\x2e\x39\x2c\x35\x30\x20\x37\x39\x2e\x31\x2c\x39\x37\x2e\x34\x20\
+\x37\x39\x2e\x31\x2c\x32\x2e\x36\x20\x22\x2f\x3e\x0a\x3c\x2f\x73\
+\x76\x67\x3e\x0a\
+\x00\x00\x03\xb1\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\
+\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x67\x20\
+\x69\x64\x3d\x22\x4f\x75\x74\x6c\x69\x6e\x65\x22\x3e\x0a\x09\x3c\
+\x67\x3e\x0a\x09\x09\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x32\
+\x36\x2e\x35\x2c\x37\x34\x2e\x32\x63\x30\x2c\x33\x2e\x37\x2c\x33\
+\x2c\x36\x2e\x38\x2c\x36\x2e\x38\x2c\x36\x2e\x38\x68\x33\x33\x2e\
+\x38\x63\x33\x2e\x37\x2c\x30\x2c\x36\x2e\x38\x2d\x33\x2c\x36\x2e\
+\x38\x2d\x36\x2e\x38\x56\x33\x33\x2e\x37\x48\x32\x36\x2e\x35\x56\
+\x37\x34\x2e\x32\x7a\x20\x4d\x33\x33\x2e\x33\x2c\x34\x30\x2e\x34\
+\x68\x33\x33\x2e\x38\x76\x33\x33\x2e\x38\x48\x33\x33\x2e\x33\x56\
+\x34\x30\x2e\x34\x7a\x22\x2f\x3e\x0a\x09\x09\x3c\x70\x6f\x6c\x79\
+\x67\x6f\x6e\x20\x70\x6f\x69\x6e\x74\x73\x3d\x22\x36\x30\x2e\x33\
+\x2c\x32\x33\x2e\x35\x20\x36\x30\x2e\x33\x2c\x31\x36\x2e\x38\x20\
+\x34\x30\x2e\x31\x2c\x31\x36\x2e\x38\x20\x34\x30\x2e\x31\x2c\x32\
+\x33\x2e\x35\x20\x31\x39\x2e\x38\x2c\x32\x33\x2e\x35\x20\x31\x39\
+\x2e\x38\x2c\x33\x30\x2e\x33\x20\x38\x30\x2e\x36\x2c\x33\x30\x2e\
+\x33\x20\x38\x30\x2e\x36\x2c\x32\x33\x2e\x35\x20\x09\x09\x22\x2f\
+\x3e\x0a\x09\x09\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x34\x30\x2e\
+\x31\x22\x20\x79\x3d\x22\x34\x37\x2e\x32\x22\x20\x77\x69\x64\x74\
+\x68\x3d\x22\x36\x2e\x38\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\
+\x32\x30\x2e\x33\x22\x2f\x3e\x0a\x09\x09\x3c\x72\x65\x63\x74\x20\
+\x78\x3d\x22\x35\x33\x2e\x36\x22\x20\x79\x3d\x22\x34\x37\x2e\x32\
+\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x36\x2e\x38\x22\x20\x68\x65\
+\x69\x67\x68\x74\x3d\x22\x32\x30\x2e\x33\x22\x2f\x3e\x0a\x09\x3c\
+\x2f\x67\x3e\x0a\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\
+\x00\x00\x02\xe1\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\
+\x30\x20\x30\x20\x35\x37\x36\x20\x35\x31\x32\x22\x3e\x3c\x73\x74\
+\x79\x6c\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\
+\x73\x73\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x35\x35\x2c\x20\x31\x38\x2c\x20\x33\x31\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x35\x35\x2c\x20\x31\x38\x2c\x20\x33\x31\x29\x3b\
+\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x63\x69\
+\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\
+\x32\x35\x35\x2c\x20\x31\x38\x2c\x20\x33\x31\x29\x3b\x20\x6f\x70\
+\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\x65\x63\x74\x20\
+\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\x35\x35\x2c\x20\
+\x31\x38\x2c\x20\x33\x31\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\
+\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x3c\x70\
+\x61\x74\x68\x20\x64\x3d\x22\x4d\x35\x36\x39\x2e\x35\x31\x37\x20\
+\x34\x34\x30\x2e\x30\x31\x33\x43\x35\x38\x37\x2e\x39\x37\x35\x20\
+\x34\x37\x32\x2e\x30\x30\x37\x20\x35\x36\x34\x2e\x38\x30\x36\x20\
+\x35\x31\x32\x20\x35\x32\x37\x2e\x39\x34\x20\x35\x31\x32\x48\x34\
+\x38\x2e\x30\x35\x34\x63\x2d\x33\x36\x2e\x39\x33\x37\x20\x30\x2d\
+\x35\x39\x2e\x39\x39\x39\x2d\x34\x30\x2e\x30\x35\x35\x2d\x34\x31\
+\x2e\x35\x37\x37\x2d\x37\x31\x2e\x39\x38\x37\x4c\x32\x34\x36\x2e\
+\x34\x32\x33\x20\x32\x33\x2e\x39\x38\x35\x63\x31\x38\x2e\x34\x36\
+\x37\x2d\x33\x32\x2e\x30\x30\x39\x20\x36\x34\x2e\x37\x32\x2d\x33\
+\x31\x2e\x39\x35\x31\x20\x38\x33\x2e\x31\x35\x34\x20\x30\x6c\x32\
+\x33\x39\x2e\x39\x34\x20\x34\x31\x36\x2e\x30\x32\x38\x7a\x4d\x32\
+\x38\x38\x20\x33\x35\x34\x63\x2d\x32\x35\x2e\x34\x30\x35\x20\x30\
+\x2d\x34\x36\x20\x32\x30\x2e\x35\x39\x35\x2d\x34\x36\x20\x34\x36\
+\x73\x32\x30\x2e\x35\x39\x35\x20\x34\x36\x20\x34\x36\x20\x34\x36\
+\x20\x34\x36\x2d\x32\x30\x2e\x35\x39\x35\x20\x34\x36\x2d\x34\x36\
+\x2d\x32\x30\x2e\x35\x39\x35\x2d\x34\x36\x2d\x34\x36\x2d\x34\x36\
+\x7a\x6d\x2d\x34\x33\x2e\x36\x37\x33\x2d\x31\x36\x35\x2e\x33\x34\
+\x36\x6c\x37\x2e\x34\x31\x38\x20\x31\x33\x36\x63\x2e\x33\x34\x37\
+\x20\x36\x2e\x33\x36\x34\x20\x35\x2e\x36\x30\x39\x20\x31\x31\x2e\
+\x33\x34\x36\x20\x31\x31\x2e\x39\x38\x32\x20\x31\x31\x2e\x33\x34\
+\x36\x68\x34\x38\x2e\x35\x34\x36\x63\x36\x2e\x33\x37\x33\x20\x30\
+\x20\x31\x31\x2e\x36\x33\x35\x2d\x34\x2e\x39\x38\x32\x20\x31\x31\
+\x2e\x39\x38\x32\x2d\x31\x31\x2e\x33\x34\x36\x6c\x37\x2e\x34\x31\
+\x38\x2d\x31\x33\x36\x63\x2e\x33\x37\x35\x2d\x36\x2e\x38\x37\x34\
+\x2d\x35\x2e\x30\x39\x38\x2d\x31\x32\x2e\x36\x35\x34\x2d\x31\x31\
+\x2e\x39\x38\x32\x2d\x31\x32\x2e\x36\x35\x34\x68\x2d\x36\x33\x2e\
+\x33\x38\x33\x63\x2d\x36\x2e\x38\x38\x34\x20\x30\x2d\x31\x32\x2e\
+\x33\x35\x36\x20\x35\x2e\x37\x38\x2d\x31\x31\x2e\x39\x38\x31\x20\
+\x31\x32\x2e\x36\x35\x34\x7a\x22\x2f\x3e\x3c\x2f\x73\x76\x67\x3e\
+\
+\x00\x00\x06\x5e\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x36\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\
+\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x72\x65\
+\x63\x74\x20\x78\x3d\x22\x31\x33\x2e\x31\x22\x20\x79\x3d\x22\x32\
+\x33\x2e\x31\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\
+\x6d\x61\x74\x72\x69\x78\x28\x30\x2e\x37\x30\x37\x31\x20\x2d\x30\
+\x2e\x37\x30\x37\x31\x20\x30\x2e\x37\x30\x37\x31\x20\x30\x2e\x37\
+\x30\x37\x31\x20\x2d\x31\x30\x2e\x30\x35\x34\x36\x20\x32\x36\x2e\
+\x30\x35\x38\x31\x29\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x36\
+\x2e\x37\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x34\x2e\x31\x22\
+\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x33\x33\x2e\x39\
+\x22\x20\x79\x3d\x22\x32\x33\x2e\x31\x22\x20\x74\x72\x61\x6e\x73\
+\x66\x6f\x72\x6d\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\x30\x2e\x38\
+\x34\x37\x31\x20\x2d\x30\x2e\x35\x33\x31\x35\x20\x30\x2e\x35\x33\
+\x31\x35\x20\x30\x2e\x38\x34\x37\x31\x20\x2d\x36\x2e\x31\x35\x33\
+\x36\x20\x32\x38\x2e\x39\x34\x36\x31\x29\x22\x20\x77\x69\x64\x74\
+\x68\x3d\x22\x32\x36\x2e\x37\x22\x20\x68\x65\x69\x67\x68\x74\x3d\
+\x22\x34\x2e\x31\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\
+\x22\x35\x36\x2e\x37\x22\x20\x79\x3d\x22\x32\x33\x2e\x31\x22\x20\
+\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\x74\x72\x69\
+\x78\x28\x30\x2e\x39\x33\x34\x35\x20\x2d\x30\x2e\x33\x35\x36\x20\
+\x30\x2e\x33\x35\x36\x20\x30\x2e\x39\x33\x34\x35\x20\x2d\x34\x2e\
+\x33\x37\x32\x33\x20\x32\x36\x2e\x35\x37\x35\x32\x29\x22\x20\x77\
+\x69\x64\x74\x68\x3d\x22\x32\x36\x2e\x37\x22\x20\x68\x65\x69\x67\
+\x68\x74\x3d\x22\x34\x2e\x31\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\
+\x20\x78\x3d\x22\x31\x33\x2e\x31\x22\x20\x79\x3d\x22\x34\x37\x2e\
+\x33\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\
+\x74\x72\x69\x78\x28\x30\x2e\x37\x30\x37\x31\x20\x2d\x30\x2e\x37\
+\x30\x37\x31\x20\x30\x2e\x37\x30\x37\x31\x20\x30\x2e\x37\x30\x37\
+\x31\x20\x2d\x32\x37\x2e\x31\x35\x34\x36\x20\x33\x33\x2e\x31\x34\
+\x31\x32\x29\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x36\x2e\x37\
+\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x34\x2e\x31\x22\x2f\x3e\
+\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x33\x33\x2e\x39\x22\x20\
+\x79\x3d\x22\x34\x37\x2e\x33\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\
+\x72\x6d\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\x30\x2e\x38\x32\x30\
+\x39\x20\x2d\x30\x2e\x35\x37\x31\x31\x20\x30\x2e\x35\x37\x31\x31\
+\x20\x30\x2e\x38\x32\x30\x39\x20\x2d\x31\x39\x2e\x37\x32\x35\x20\
+\x33\x35\x2e\x38\x30\x38\x34\x29\x22\x20\x77\x69\x64\x74\x68\x3d\
+\x22\x32\x36\x2e\x37\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x34\
+\x2e\x31\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x35\
+\x36\x2e\x37\x22\x20\x79\x3d\x22\x34\x37\x2e\x33\x22\x20\x74\x72\
+\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\
+\x30\x2e\x39\x36\x38\x39\x20\x2d\x30\x2e\x32\x34\x37\x36\x20\x30\
+\x2e\x32\x34\x37\x36\x20\x30\x2e\x39\x36\x38\x39\x20\x2d\x31\x30\
+\x2e\x30\x33\x37\x38\x20\x31\x38\x2e\x38\x36\x38\x36\x29\x22\x20\
+\x77\x69\x64\x74\x68\x3d\x22\x32\x36\x2e\x37\x22\x20\x68\x65\x69\
+\x67\x68\x74\x3d\x22\x34\x2e\x31\x22\x2f\x3e\x0a\x3c\x72\x65\x63\
+\x74\x20\x78\x3d\x22\x31\x33\x2e\x31\x22\x20\x79\x3d\x22\x37\x34\
+\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\x74\
+\x72\x69\x78\x28\x30\x2e\x38\x32\x30\x39\x20\x2d\x30\x2e\x35\x37\
+\x31\x31\x20\x30\x2e\x35\x37\x31\x31\x20\x30\x2e\x38\x32\x30\x39\
+\x20\x2d\x33\x38\x2e\x37\x30\x37\x31\x20\x32\x38\x2e\x37\x31\x37\
+\x39\x29\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x36\x2e\x37\x22\
+\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x34\x2e\x31\x22\x2f\x3e\x0a\
+\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x33\x33\x2e\x39\x22\x20\x79\
+\x3d\x22\x37\x34\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\
+\x22\x6d\x61\x74\x72\x69\x78\x28\x30\x2e\x38\x34\x37\x31\x20\x2d\
+\x30\x2e\x35\x33\x31\x35\x20\x30\x2e\x35\x33\x31\x35\x20\x30\x2e\
+\x38\x34\x37\x31\x20\x2d\x33\x33\x2e\x32\x30\x35\x31\x20\x33\x36\
+\x2e\x37\x32\x39\x39\x29\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\
+\x36\x2e\x37\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x34\x2e\x31\
+\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x35\x36\x2e\
+\x37\x22\x20\x79\x3d\x22\x37\x34\x22\x20\x74\x72\x61\x6e\x73\x66\
+\x6f\x72\x6d\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\x30\x2e\x39\x39\
+\x34\x36\x20\x2d\x30\x2e\x31\x30\x33\x35\x20\x30\x2e\x31\x30\x33\
+\x35\x20\x30\x2e\x39\x39\x34\x36\x20\x2d\x37\x2e\x34\x39\x39\x35\
+\x20\x37\x2e\x36\x35\x37\x39\x29\x22\x20\x77\x69\x64\x74\x68\x3d\
+\x22\x32\x36\x2e\x37\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x34\
+\x2e\x31\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x03\xbc\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\
+\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x34\x31\x2e\x35\x2c\x36\x37\x2e\x36\
+\x63\x2d\x31\x34\x2e\x34\x2c\x30\x2d\x32\x36\x2e\x31\x2d\x31\x31\
+\x2e\x37\x2d\x32\x36\x2e\x31\x2d\x32\x36\x2e\x31\x73\x31\x31\x2e\
+\x37\x2d\x32\x36\x2e\x31\x2c\x32\x36\x2e\x31\x2d\x32\x36\x2e\x31\
+\x73\x32\x36\x2e\x31\x2c\x31\x31\x2e\x37\x2c\x32\x36\x2e\x31\x2c\
+\x32\x36\x2e\x31\x53\x35\x35\x2e\x39\x2c\x36\x37\x2e\x36\x2c\x34\
+\x31\x2e\x35\x2c\x36\x37\x2e\x36\x7a\x20\x4d\x34\x31\x2e\x35\x2c\
+\x32\x32\x2e\x34\x0a\x09\x43\x33\x31\x2c\x32\x32\x2e\x34\x2c\x32\
+\x32\x2e\x34\x2c\x33\x31\x2c\x32\x32\x2e\x34\x2c\x34\x31\x2e\x35\
+\x63\x30\x2c\x31\x30\x2e\x35\x2c\x38\x2e\x36\x2c\x31\x39\x2e\x31\
+\x2c\x31\x39\x2e\x31\x2c\x31\x39\x2e\x31\x63\x31\x30\x2e\x35\x2c\
+\x30\x2c\x31\x39\x2e\x31\x2d\x38\x2e\x36\x2c\x31\x39\x2e\x31\x2d\
+\x31\x39\x2e\x31\x43\x36\x30\x2e\x36\x2c\x33\x31\x2c\x35\x32\x2c\
+\x32\x32\x2e\x34\x2c\x34\x31\x2e\x35\x2c\x32\x32\x2e\x34\x7a\x22\
+\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x38\x34\x2e\
+\x34\x2c\x37\x39\x2e\x38\x4c\x36\x34\x2e\x32\x2c\x36\x30\x2e\x36\
+\x63\x2d\x31\x2e\x34\x2c\x31\x2e\x37\x2d\x33\x2e\x31\x2c\x33\x2e\
+\x32\x2d\x34\x2e\x38\x2c\x34\x2e\x36\x6c\x32\x30\x2e\x35\x2c\x31\
+\x39\x2e\x34\x63\x30\x2e\x36\x2c\x30\x2e\x36\x2c\x31\x2e\x35\x2c\
+\x30\x2e\x39\x2c\x32\x2e\x33\x2c\x30\x2e\x39\x63\x30\x2e\x39\x2c\
+\x30\x2c\x31\x2e\x38\x2d\x30\x2e\x33\x2c\x32\x2e\x34\x2d\x31\x0a\
+\x09\x43\x38\x35\x2e\x38\x2c\x38\x33\x2e\x32\x2c\x38\x35\x2e\x37\
+\x2c\x38\x31\x2e\x31\x2c\x38\x34\x2e\x34\x2c\x37\x39\x2e\x38\x7a\
+\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x04\x7c\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x36\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\
+\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x67\x3e\
+\x0a\x09\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x35\x37\x2e\x33\
+\x2c\x38\x34\x2e\x37\x68\x2d\x33\x32\x63\x2d\x34\x2e\x36\x2c\x30\
+\x2d\x38\x2e\x32\x2d\x33\x2e\x36\x2d\x38\x2e\x32\x2d\x38\x2e\x32\
+\x76\x2d\x33\x32\x63\x30\x2d\x34\x2e\x36\x2c\x33\x2e\x36\x2d\x38\
+\x2e\x32\x2c\x38\x2e\x32\x2d\x38\x2e\x32\x68\x33\x32\x63\x34\x2e\
+\x36\x2c\x30\x2c\x38\x2e\x32\x2c\x33\x2e\x36\x2c\x38\x2e\x32\x2c\
+\x38\x2e\x32\x76\x33\x32\x0a\x09\x09\x43\x36\x35\x2e\x34\x2c\x38\
+\x31\x2e\x32\x2c\x36\x31\x2e\x39\x2c\x38\x34\x2e\x37\x2c\x35\x37\
+\x2e\x33\x2c\x38\x34\x2e\x37\x7a\x20\x4d\x32\x36\x2e\x39\x2c\x37\
+\x34\x2e\x39\x68\x32\x38\x2e\x37\x56\x34\x36\x2e\x32\x48\x32\x36\
+\x2e\x39\x56\x37\x34\x2e\x39\x7a\x22\x2f\x3e\x0a\x09\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x37\x34\x2e\x37\x2c\x36\x33\x2e\x36\
+\x68\x2d\x33\x32\x63\x2d\x34\x2e\x36\x2c\x30\x2d\x38\x2e\x32\x2d\
+\x33\x2e\x36\x2d\x38\x2e\x32\x2d\x38\x2e\x32\x76\x2d\x33\x32\x63\
+\x30\x2d\x34\x2e\x36\x2c\x33\x2e\x36\x2d\x38\x2e\x32\x2c\x38\x2e\
+\x32\x2d\x38\x2e\x32\x68\x33\x32\x63\x34\x2e\x36\x2c\x30\x2c\x38\
+\x2e\x32\x2c\x33\x2e\x36\x2c\x38\x2e\x32\x2c\x38\x2e\x32\x76\x33\
+\x32\x0a\x09\x09\x43\x38\x32\x2e\x39\x2c\x36\x30\x2c\x37\x39\x2e\
+\x33\x2c\x36\x33\x2e\x36\x2c\x37\x34\x2e\x37\x2c\x36\x33\x2e\x36\
+\x7a\x20\x4d\x34\x34\x2e\x33\x2c\x35\x33\x2e\x38\x68\x32\x38\x2e\
+\x37\x56\x32\x35\x2e\x31\x48\x34\x34\x2e\x33\x56\x35\x33\x2e\x38\
+\x7a\x22\x2f\x3e\x0a\x09\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\
+\x38\x31\x2e\x31\x2c\x36\x30\x2e\x36\x4c\x36\x32\x2e\x37\x2c\x38\
+\x32\x2e\x37\x6c\x2d\x36\x2e\x39\x2d\x36\x2e\x39\x6c\x31\x33\x2e\
+\x38\x2d\x31\x35\x2e\x33\x6c\x35\x2d\x33\x2e\x35\x22\x2f\x3e\x0a\
+\x09\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x38\x32\x2c\x32\x36\
+\x2e\x38\x4c\x36\x31\x2e\x39\x2c\x34\x36\x2e\x39\x6c\x2d\x36\x2e\
+\x39\x2d\x37\x6c\x32\x30\x2e\x34\x2d\x32\x30\x2e\x34\x6c\x30\x2c\
+\x30\x22\x2f\x3e\x0a\x09\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\
+\x34\x34\x2e\x37\x2c\x36\x30\x2e\x36\x4c\x32\x34\x2e\x38\x2c\x38\
+\x33\x2e\x31\x6c\x2d\x36\x2e\x39\x2d\x36\x2e\x39\x6c\x31\x38\x2e\
+\x38\x2d\x32\x32\x2e\x32\x68\x31\x2e\x36\x22\x2f\x3e\x0a\x09\x3c\
+\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x39\x2c\x33\x39\x2e\x34\
+\x4c\x33\x36\x2c\x31\x38\x2e\x37\x6c\x31\x30\x2e\x33\x2c\x33\x4c\
+\x32\x39\x2e\x32\x2c\x34\x32\x6c\x30\x2c\x30\x22\x2f\x3e\x0a\x3c\
+\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x09\xd3\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\
+\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x67\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x37\x22\x3e\x0a\x09\x3c\x70\x61\x74\x68\x20\x64\x3d\
+\x22\x4d\x34\x38\x2e\x34\x2c\x33\x34\x2e\x39\x63\x31\x2e\x34\x2d\
+\x31\x2e\x34\x2c\x33\x2e\x38\x2d\x31\x2e\x34\x2c\x35\x2e\x32\x2c\
+\x30\x6c\x31\x2e\x31\x2c\x31\x2e\x31\x6c\x31\x30\x2e\x34\x2d\x31\
+\x30\x2e\x33\x63\x32\x2e\x39\x2d\x32\x2e\x39\x2c\x37\x2e\x36\x2d\
+\x32\x2e\x39\x2c\x31\x30\x2e\x35\x2c\x30\x63\x32\x2e\x39\x2c\x32\
+\x2e\x39\x2c\x32\x2e\x39\x2c\x37\x2e\x36\x2c\x30\x2c\x31\x30\x2e\
+\x35\x4c\x36\x35\x2e\x32\x2c\x34\x36\x2e\x35\x6c\x31\x2e\x31\x2c\
+\x31\x2e\x31\x0a\x09\x09\x63\x31\x2e\x34\x2c\x31\x2e\x34\x2c\x31\
+\x2e\x34\x2c\x33\x2e\x38\x2c\x30\x2c\x35\x2e\x32\x63\x2d\x31\x2e\
+\x34\x2c\x31\x2e\x34\x2d\x33\x2e\x38\x2c\x31\x2e\x34\x2d\x35\x2e\
+\x32\x2c\x30\x4c\x34\x38\x2e\x34\x2c\x34\x30\x2e\x32\x43\x34\x36\
+\x2e\x39\x2c\x33\x38\x2e\x37\x2c\x34\x36\x2e\x39\x2c\x33\x36\x2e\
+\x34\x2c\x34\x38\x2e\x34\x2c\x33\x34\x2e\x39\x7a\x22\x2f\x3e\x0a\
+\x09\x3c\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x70\x6f\x69\x6e\x74\x73\
+\x3d\x22\x34\x37\x2e\x34\x2c\x36\x34\x2e\x33\x20\x33\x36\x2e\x32\
+\x2c\x37\x35\x2e\x34\x20\x32\x35\x2e\x38\x2c\x37\x35\x2e\x34\x20\
+\x32\x35\x2e\x38\x2c\x36\x35\x20\x32\x36\x2e\x35\x2c\x36\x34\x2e\
+\x33\x20\x32\x36\x2e\x35\x2c\x36\x34\x2e\x33\x20\x09\x22\x2f\x3e\
+\x0a\x09\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x37\x36\x2e\x38\
+\x2c\x33\x37\x2e\x34\x63\x31\x2e\x38\x2d\x31\x2e\x38\x2c\x32\x2e\
+\x38\x2d\x34\x2e\x32\x2c\x32\x2e\x37\x2d\x36\x2e\x35\x63\x30\x2d\
+\x32\x2e\x34\x2d\x30\x2e\x39\x2d\x34\x2e\x37\x2d\x32\x2e\x37\x2d\
+\x36\x2e\x35\x6c\x30\x2c\x30\x63\x30\x2c\x30\x2c\x30\x2c\x30\x2c\
+\x30\x2c\x30\x63\x30\x2c\x30\x2c\x30\x2c\x30\x2c\x30\x2c\x30\x6c\
+\x30\x2c\x30\x63\x2d\x31\x2e\x38\x2d\x31\x2e\x38\x2d\x34\x2e\x32\
+\x2d\x32\x2e\x37\x2d\x36\x2e\x35\x2d\x32\x2e\x37\x0a\x09\x09\x63\
+\x2d\x32\x2e\x34\x2c\x30\x2d\x34\x2e\x37\x2c\x30\x2e\x39\x2d\x36\
+\x2e\x35\x2c\x32\x2e\x37\x6c\x30\x2c\x30\x6c\x2d\x39\x2e\x31\x2c\
+\x39\x2e\x31\x63\x2d\x31\x2d\x30\x2e\x39\x2d\x32\x2e\x34\x2d\x31\
+\x2e\x34\x2d\x33\x2e\x37\x2d\x31\x2e\x34\x63\x2d\x31\x2e\x34\x2c\
+\x30\x2d\x32\x2e\x38\x2c\x30\x2e\x35\x2d\x33\x2e\x39\x2c\x31\x2e\
+\x36\x63\x2d\x31\x2e\x31\x2c\x31\x2e\x31\x2d\x31\x2e\x36\x2c\x32\
+\x2e\x35\x2d\x31\x2e\x36\x2c\x33\x2e\x39\x0a\x09\x09\x63\x30\x2c\
+\x31\x2e\x33\x2c\x30\x2e\x35\x2c\x32\x2e\x36\x2c\x31\x2e\x34\x2c\
+\x33\x2e\x37\x4c\x32\x35\x2e\x32\x2c\x36\x32\x2e\x39\x63\x30\x2c\
+\x30\x2d\x30\x2e\x31\x2c\x30\x2d\x30\x2e\x31\x2c\x30\x2e\x31\x6c\
+\x30\x2c\x30\x6c\x2d\x30\x2e\x37\x2c\x30\x2e\x37\x43\x32\x34\x2e\
+\x31\x2c\x36\x34\x2c\x32\x34\x2c\x36\x34\x2e\x35\x2c\x32\x34\x2c\
+\x36\x35\x76\x39\x2e\x37\x6c\x2d\x33\x2e\x32\x2c\x33\x2e\x32\x63\
+\x2d\x30\x2e\x37\x2c\x30\x2e\x37\x2d\x30\x2e\x37\x2c\x31\x2e\x39\
+\x2c\x30\x2c\x32\x2e\x36\x0a\x09\x09\x63\x30\x2e\x37\x2c\x30\x2e\
+\x37\x2c\x31\x2e\x39\x2c\x30\x2e\x37\x2c\x32\x2e\x36\x2c\x30\x6c\
+\x33\x2e\x31\x2d\x33\x2e\x31\x6c\x39\x2e\x37\x2c\x30\x63\x30\x2e\
+\x35\x2c\x30\x2c\x31\x2d\x30\x2e\x32\x2c\x31\x2e\x33\x2d\x30\x2e\
+\x35\x6c\x31\x31\x2e\x32\x2d\x31\x31\x2e\x31\x4c\x36\x30\x2c\x35\
+\x34\x2e\x33\x63\x31\x2c\x30\x2e\x39\x2c\x32\x2e\x34\x2c\x31\x2e\
+\x34\x2c\x33\x2e\x37\x2c\x31\x2e\x34\x63\x31\x2e\x34\x2c\x30\x2c\
+\x32\x2e\x38\x2d\x30\x2e\x35\x2c\x33\x2e\x39\x2d\x31\x2e\x36\x0a\
+\x09\x09\x63\x31\x2e\x31\x2d\x31\x2e\x31\x2c\x31\x2e\x36\x2d\x32\
+\x2e\x35\x2c\x31\x2e\x36\x2d\x33\x2e\x39\x63\x30\x2d\x31\x2e\x33\
+\x2d\x30\x2e\x35\x2d\x32\x2e\x36\x2d\x31\x2e\x34\x2d\x33\x2e\x37\
+\x4c\x37\x36\x2e\x38\x2c\x33\x37\x2e\x34\x4c\x37\x36\x2e\x38\x2c\
+\x33\x37\x2e\x34\x7a\x20\x4d\x34\x36\x2e\x31\x2c\x36\x33\x4c\x33\
+\x35\x2e\x35\x2c\x37\x33\x2e\x35\x6c\x2d\x37\x2e\x38\x2c\x30\x76\
+\x2d\x37\x2e\x39\x6c\x30\x2e\x31\x2d\x30\x2e\x31\x63\x30\x2c\x30\
+\x2c\x30\x2e\x31\x2c\x30\x2c\x30\x2e\x31\x2d\x30\x2e\x31\x0a\x09\
+\x09\x4c\x34\x39\x2e\x33\x2c\x34\x34\x6c\x37\x2e\x39\x2c\x37\x2e\
+\x39\x4c\x34\x36\x2e\x31\x2c\x36\x33\x7a\x20\x4d\x37\x34\x2e\x32\
+\x2c\x33\x34\x2e\x38\x4c\x37\x34\x2e\x32\x2c\x33\x34\x2e\x38\x4c\
+\x36\x33\x2e\x39\x2c\x34\x35\x2e\x32\x63\x2d\x30\x2e\x37\x2c\x30\
+\x2e\x37\x2d\x30\x2e\x37\x2c\x31\x2e\x39\x2c\x30\x2c\x32\x2e\x36\
+\x63\x30\x2e\x32\x2c\x30\x2e\x32\x2c\x30\x2e\x34\x2c\x30\x2e\x33\
+\x2c\x30\x2e\x37\x2c\x30\x2e\x34\x0a\x09\x09\x63\x30\x2e\x31\x2c\
+\x30\x2e\x32\x2c\x30\x2e\x32\x2c\x30\x2e\x35\x2c\x30\x2e\x34\x2c\
+\x30\x2e\x37\x63\x30\x2e\x34\x2c\x30\x2e\x34\x2c\x30\x2e\x35\x2c\
+\x30\x2e\x38\x2c\x30\x2e\x35\x2c\x31\x2e\x33\x63\x30\x2c\x30\x2e\
+\x35\x2d\x30\x2e\x32\x2c\x30\x2e\x39\x2d\x30\x2e\x35\x2c\x31\x2e\
+\x33\x63\x2d\x30\x2e\x34\x2c\x30\x2e\x34\x2d\x30\x2e\x38\x2c\x30\
+\x2e\x35\x2d\x31\x2e\x33\x2c\x30\x2e\x35\x63\x2d\x30\x2e\x35\x2c\
+\x30\x2d\x30\x2e\x39\x2d\x30\x2e\x32\x2d\x31\x2e\x33\x2d\x30\x2e\
+\x35\x0a\x09\x09\x4c\x34\x39\x2e\x37\x2c\x33\x38\x2e\x39\x63\x2d\
+\x30\x2e\x34\x2d\x30\x2e\x34\x2d\x30\x2e\x35\x2d\x30\x2e\x38\x2d\
+\x30\x2e\x35\x2d\x31\x2e\x33\x63\x30\x2d\x30\x2e\x35\x2c\x30\x2e\
+\x32\x2d\x30\x2e\x39\x2c\x30\x2e\x35\x2d\x31\x2e\x33\x63\x30\x2e\
+\x34\x2d\x30\x2e\x34\x2c\x30\x2e\x38\x2d\x30\x2e\x35\x2c\x31\x2e\
+\x33\x2d\x30\x2e\x35\x63\x30\x2e\x35\x2c\x30\x2c\x30\x2e\x39\x2c\
+\x30\x2e\x32\x2c\x31\x2e\x33\x2c\x30\x2e\x35\x0a\x09\x09\x63\x30\
+\x2e\x32\x2c\x30\x2e\x32\x2c\x30\x2e\x34\x2c\x30\x2e\x33\x2c\x30\
+\x2e\x37\x2c\x30\x2e\x34\x63\x30\x2e\x31\x2c\x30\x2e\x32\x2c\x30\
+\x2e\x32\x2c\x30\x2e\x35\x2c\x30\x2e\x34\x2c\x30\x2e\x37\x63\x30\
+\x2e\x37\x2c\x30\x2e\x37\x2c\x31\x2e\x39\x2c\x30\x2e\x37\x2c\x32\
+\x2e\x36\x2c\x30\x4c\x36\x36\x2e\x34\x2c\x32\x37\x6c\x30\x2c\x30\
+\x63\x31\x2e\x31\x2d\x31\x2e\x31\x2c\x32\x2e\x35\x2d\x31\x2e\x36\
+\x2c\x33\x2e\x39\x2d\x31\x2e\x36\x0a\x09\x09\x63\x31\x2e\x34\x2c\
+\x30\x2c\x32\x2e\x38\x2c\x30\x2e\x35\x2c\x33\x2e\x39\x2c\x31\x2e\
+\x36\x6c\x30\x2c\x30\x63\x31\x2e\x31\x2c\x31\x2e\x31\x2c\x31\x2e\
+\x36\x2c\x32\x2e\x35\x2c\x31\x2e\x36\x2c\x33\x2e\x39\x43\x37\x35\
+\x2e\x39\x2c\x33\x32\x2e\x33\x2c\x37\x35\x2e\x33\x2c\x33\x33\x2e\
+\x37\x2c\x37\x34\x2e\x32\x2c\x33\x34\x2e\x38\x7a\x22\x2f\x3e\x0a\
+\x09\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x36\x31\x2e\x38\x2c\
+\x34\x35\x2e\x37\x6c\x32\x2e\x31\x2c\x32\x2e\x31\x6c\x31\x2e\x31\
+\x2c\x31\x2e\x31\x63\x30\x2e\x37\x2c\x30\x2e\x37\x2c\x31\x2e\x39\
+\x2c\x30\x2e\x37\x2c\x32\x2e\x36\x2c\x30\x63\x30\x2e\x37\x2d\x30\
+\x2e\x37\x2c\x30\x2e\x37\x2d\x31\x2e\x39\x2c\x30\x2d\x32\x2e\x36\
+\x6c\x2d\x31\x2e\x31\x2d\x31\x2e\x31\x6c\x2d\x32\x2e\x31\x2d\x32\
+\x2e\x31\x63\x2d\x30\x2e\x37\x2d\x30\x2e\x37\x2d\x31\x2e\x39\x2d\
+\x30\x2e\x37\x2d\x32\x2e\x36\x2c\x30\x0a\x09\x09\x43\x36\x31\x2e\
+\x31\x2c\x34\x33\x2e\x38\x2c\x36\x31\x2e\x31\x2c\x34\x35\x2c\x36\
+\x31\x2e\x38\x2c\x34\x35\x2e\x37\x4c\x36\x31\x2e\x38\x2c\x34\x35\
+\x2e\x37\x7a\x22\x2f\x3e\x0a\x09\x3c\x70\x61\x74\x68\x20\x64\x3d\
+\x22\x4d\x35\x32\x2e\x33\x2c\x33\x36\x2e\x32\x6c\x31\x2e\x31\x2c\
+\x31\x2e\x31\x6c\x32\x2e\x31\x2c\x32\x2e\x31\x63\x30\x2e\x37\x2c\
+\x30\x2e\x37\x2c\x31\x2e\x39\x2c\x30\x2e\x37\x2c\x32\x2e\x36\x2c\
+\x30\x63\x30\x2e\x37\x2d\x30\x2e\x37\x2c\x30\x2e\x37\x2d\x31\x2e\
+\x39\x2c\x30\x2d\x32\x2e\x36\x4c\x35\x36\x2c\x33\x34\x2e\x37\x6c\
+\x2d\x31\x2e\x31\x2d\x31\x2e\x31\x63\x2d\x30\x2e\x37\x2d\x30\x2e\
+\x37\x2d\x31\x2e\x39\x2d\x30\x2e\x37\x2d\x32\x2e\x36\x2c\x30\x0a\
+\x09\x09\x43\x35\x31\x2e\x36\x2c\x33\x34\x2e\x33\x2c\x35\x31\x2e\
+\x36\x2c\x33\x35\x2e\x35\x2c\x35\x32\x2e\x33\x2c\x33\x36\x2e\x32\
+\x4c\x35\x32\x2e\x33\x2c\x33\x36\x2e\x32\x7a\x22\x2f\x3e\x0a\x09\
+\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x32\x36\x2e\x35\x2c\x36\
+\x36\x2e\x31\x4c\x32\x36\x2e\x35\x2c\x36\x36\x2e\x31\x68\x32\x30\
+\x2e\x39\x63\x31\x2c\x30\x2c\x31\x2e\x39\x2d\x30\x2e\x38\x2c\x31\
+\x2e\x39\x2d\x31\x2e\x39\x63\x30\x2d\x31\x2d\x30\x2e\x38\x2d\x31\
+\x2e\x39\x2d\x31\x2e\x39\x2d\x31\x2e\x39\x48\x32\x36\x2e\x35\x68\
+\x30\x63\x2d\x31\x2c\x30\x2d\x31\x2e\x39\x2c\x30\x2e\x38\x2d\x31\
+\x2e\x39\x2c\x31\x2e\x39\x0a\x09\x09\x43\x32\x34\x2e\x36\x2c\x36\
+\x35\x2e\x33\x2c\x32\x35\x2e\x35\x2c\x36\x36\x2e\x31\x2c\x32\x36\
+\x2e\x35\x2c\x36\x36\x2e\x31\x4c\x32\x36\x2e\x35\x2c\x36\x36\x2e\
+\x31\x7a\x22\x2f\x3e\x0a\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\
+\x3e\x0a\
+\x00\x00\x04\x7b\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\
+\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x67\x20\x69\x64\x3d\x22\x53\x6f\x6c\x69\
+\x64\x22\x3e\x0a\x09\x3c\x67\x3e\x0a\x09\x09\x3c\x70\x6f\x6c\x79\
+\x67\x6f\x6e\x20\x70\x6f\x69\x6e\x74\x73\x3d\x22\x37\x30\x2e\x37\
+\x2c\x31\x34\x2e\x37\x20\x36\x33\x2e\x35\x2c\x31\x34\x2e\x37\x20\
+\x36\x33\x2e\x35\x2c\x32\x39\x2e\x32\x20\x34\x38\x2e\x39\x2c\x32\
+\x39\x2e\x32\x20\x34\x38\x2e\x39\x2c\x33\x36\x2e\x35\x20\x36\x33\
+\x2e\x35\x2c\x33\x36\x2e\x35\x20\x36\x33\x2e\x35\x2c\x35\x31\x20\
+\x37\x30\x2e\x37\x2c\x35\x31\x20\x37\x30\x2e\x37\x2c\x33\x36\x2e\
+\x35\x20\x38\x35\x2e\x33\x2c\x33\x36\x2e\x35\x20\x38\x35\x2e\x33\
+\x2c\x32\x39\x2e\x32\x20\x0a\x09\x09\x09\x37\x30\x2e\x37\x2c\x32\
+\x39\x2e\x32\x20\x09\x09\x22\x2f\x3e\x0a\x09\x3c\x2f\x67\x3e\x0a\
+\x3c\x2f\x67\x3e\x0a\x3c\x67\x20\x69\x64\x3d\x22\x4f\x75\x74\x6c\
+\x69\x6e\x65\x22\x3e\x0a\x09\x3c\x67\x3e\x0a\x09\x09\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x33\x35\x2e\x34\x2c\x38\x35\x2e\x39\
+\x63\x2d\x30\x2e\x39\x2c\x30\x2d\x31\x2e\x38\x2d\x30\x2e\x36\x2d\
+\x32\x2e\x32\x2d\x31\x2e\x35\x4c\x31\x36\x2e\x38\x2c\x34\x34\x2e\
+\x35\x63\x2d\x30\x2e\x34\x2d\x30\x2e\x39\x2d\x30\x2e\x32\x2d\x31\
+\x2e\x39\x2c\x30\x2e\x35\x2d\x32\x2e\x36\x63\x30\x2e\x37\x2d\x30\
+\x2e\x37\x2c\x31\x2e\x37\x2d\x30\x2e\x39\x2c\x32\x2e\x36\x2d\x30\
+\x2e\x35\x6c\x33\x39\x2e\x39\x2c\x31\x36\x2e\x34\x0a\x09\x09\x09\
+\x63\x30\x2e\x39\x2c\x30\x2e\x34\x2c\x31\x2e\x35\x2c\x31\x2e\x33\
+\x2c\x31\x2e\x34\x2c\x32\x2e\x33\x73\x2d\x30\x2e\x38\x2c\x31\x2e\
+\x39\x2d\x31\x2e\x38\x2c\x32\x2e\x31\x4c\x34\x32\x2c\x36\x36\x2e\
+\x36\x4c\x33\x37\x2e\x36\x2c\x38\x34\x63\x2d\x30\x2e\x32\x2c\x31\
+\x2d\x31\x2e\x31\x2c\x31\x2e\x37\x2d\x32\x2e\x31\x2c\x31\x2e\x38\
+\x43\x33\x35\x2e\x35\x2c\x38\x35\x2e\x39\x2c\x33\x35\x2e\x35\x2c\
+\x38\x35\x2e\x39\x2c\x33\x35\x2e\x34\x2c\x38\x35\x2e\x39\x7a\x20\
+\x4d\x32\x33\x2e\x33\x2c\x34\x37\x2e\x39\x0a\x09\x09\x09\x4c\x33\
+\x34\x2e\x39\x2c\x37\x36\x6c\x33\x2d\x31\x31\x2e\x39\x63\x30\x2e\
+\x32\x2d\x30\x2e\x38\x2c\x30\x2e\x39\x2d\x31\x2e\x35\x2c\x31\x2e\
+\x37\x2d\x31\x2e\x37\x6c\x31\x31\x2e\x39\x2d\x33\x4c\x32\x33\x2e\
+\x33\x2c\x34\x37\x2e\x39\x7a\x22\x2f\x3e\x0a\x09\x3c\x2f\x67\x3e\
+\x0a\x3c\x2f\x67\x3e\x0a\x3c\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x70\
+\x6f\x69\x6e\x74\x73\x3d\x22\x32\x31\x2e\x37\x2c\x34\x36\x2e\x36\
+\x20\x33\x34\x2e\x35\x2c\x37\x38\x2e\x33\x20\x33\x39\x2e\x33\x2c\
+\x36\x35\x2e\x37\x20\x35\x33\x2e\x39\x2c\x35\x39\x2e\x35\x20\x22\
+\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x03\xd2\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\
+\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x67\x20\
+\x69\x64\x3d\x22\x4f\x75\x74\x6c\x69\x6e\x65\x22\x3e\x0a\x09\x3c\
+\x67\x3e\x0a\x09\x09\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x34\
+\x37\x2e\x32\x2c\x38\x36\x2e\x39\x63\x2d\x31\x2e\x34\x2c\x30\x2d\
+\x32\x2e\x37\x2d\x30\x2e\x39\x2d\x33\x2e\x33\x2d\x32\x2e\x32\x6c\
+\x2d\x32\x35\x2d\x36\x30\x2e\x36\x63\x2d\x30\x2e\x36\x2d\x31\x2e\
+\x33\x2d\x30\x2e\x32\x2d\x32\x2e\x39\x2c\x30\x2e\x38\x2d\x33\x2e\
+\x39\x73\x32\x2e\x35\x2d\x31\x2e\x33\x2c\x33\x2e\x39\x2d\x30\x2e\
+\x38\x6c\x36\x30\x2e\x36\x2c\x32\x35\x63\x31\x2e\x34\x2c\x30\x2e\
+\x36\x2c\x32\x2e\x33\x2c\x32\x2c\x32\x2e\x32\x2c\x33\x2e\x36\x0a\
+\x09\x09\x09\x63\x2d\x30\x2e\x31\x2c\x31\x2e\x35\x2d\x31\x2e\x32\
+\x2c\x32\x2e\x38\x2d\x32\x2e\x37\x2c\x33\x2e\x32\x6c\x2d\x32\x36\
+\x2e\x34\x2c\x36\x2e\x36\x6c\x2d\x36\x2e\x36\x2c\x32\x36\x2e\x34\
+\x63\x2d\x30\x2e\x34\x2c\x31\x2e\x35\x2d\x31\x2e\x37\x2c\x32\x2e\
+\x36\x2d\x33\x2e\x32\x2c\x32\x2e\x37\x43\x34\x37\x2e\x33\x2c\x38\
+\x36\x2e\x39\x2c\x34\x37\x2e\x32\x2c\x38\x36\x2e\x39\x2c\x34\x37\
+\x2e\x32\x2c\x38\x36\x2e\x39\x7a\x20\x4d\x32\x38\x2e\x37\x2c\x32\
+\x39\x2e\x33\x4c\x34\x36\x2e\x33\x2c\x37\x32\x0a\x09\x09\x09\x6c\
+\x34\x2e\x35\x2d\x31\x38\x63\x30\x2e\x33\x2d\x31\x2e\x33\x2c\x31\
+\x2e\x33\x2d\x32\x2e\x33\x2c\x32\x2e\x36\x2d\x32\x2e\x36\x6c\x31\
+\x38\x2d\x34\x2e\x35\x4c\x32\x38\x2e\x37\x2c\x32\x39\x2e\x33\x7a\
+\x22\x2f\x3e\x0a\x09\x3c\x2f\x67\x3e\x0a\x3c\x2f\x67\x3e\x0a\x3c\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x70\x6f\x69\x6e\x74\x73\x3d\x22\
+\x32\x36\x2e\x33\x2c\x32\x37\x2e\x32\x20\x34\x35\x2e\x37\x2c\x37\
+\x35\x2e\x34\x20\x35\x33\x2c\x35\x36\x2e\x32\x20\x37\x35\x2e\x32\
+\x2c\x34\x36\x2e\x38\x20\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\
+\x0a\
+\x00\x00\x03\x20\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\x69\
+\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\
+\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\x6b\
+\x22\x20\x66\x6f\x63\x75\x73\x61\x62\x6c\x65\x3d\x22\x66\x61\x6c\
+\x73\x65\x22\x20\x70\x72\x65\x73\x65\x72\x76\x65\x41\x73\x70\x65\
+\x63\x74\x52\x61\x74\x69\x6f\x3d\x22\x78\x4d\x69\x64\x59\x4d\x69\
+\x64\x20\x6d\x65\x65\x74\x22\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\
+\x22\x30\x20\x30\x20\x31\x34\x20\x31\x36\x22\x3e\x3c\x73\x74\x79\
+\x6c\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\
+\x73\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\
+\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\
+\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\
+\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\
+\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\
+\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\
+\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\
+\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\
+\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\
+\x74\x79\x6c\x65\x3e\x0a\x3c\x21\x2d\x2d\x46\x72\x6f\x6d\x20\x47\
+\x69\x74\x48\x75\x62\x27\x73\x20\x4f\x63\x74\x6f\x69\x63\x6f\x6e\
+\x73\x2d\x2d\x3e\x0a\x3c\x21\x2d\x2d\x65\x78\x74\x72\x61\x20\x6c\
+\x69\x6e\x65\x2d\x2d\x3e\x0a\x3c\x21\x2d\x2d\x65\x78\x74\x72\x61\
+\x20\x6c\x69\x6e\x65\x32\x2d\x2d\x3e\x0a\x3c\x70\x61\x74\x68\x20\
+\x64\x3d\x22\x4d\x32\x20\x31\x33\x68\x34\x76\x31\x48\x32\x76\x2d\
+\x31\x7a\x6d\x35\x2d\x36\x48\x32\x76\x31\x68\x35\x56\x37\x7a\x6d\
+\x32\x20\x33\x56\x38\x6c\x2d\x33\x20\x33\x6c\x33\x20\x33\x76\x2d\
+\x32\x68\x35\x76\x2d\x32\x48\x39\x7a\x4d\x34\x2e\x35\x20\x39\x48\
+\x32\x76\x31\x68\x32\x2e\x35\x56\x39\x7a\x4d\x32\x20\x31\x32\x68\
+\x32\x2e\x35\x76\x2d\x31\x48\x32\x76\x31\x7a\x6d\x39\x20\x31\x68\
+\x31\x76\x32\x63\x2d\x2e\x30\x32\x2e\x32\x38\x2d\x2e\x31\x31\x2e\
+\x35\x32\x2d\x2e\x33\x2e\x37\x63\x2d\x2e\x31\x39\x2e\x31\x38\x2d\
+\x2e\x34\x32\x2e\x32\x38\x2d\x2e\x37\x2e\x33\x48\x31\x63\x2d\x2e\
+\x35\x35\x20\x30\x2d\x31\x2d\x2e\x34\x35\x2d\x31\x2d\x31\x56\x34\
+\x63\x30\x2d\x2e\x35\x35\x2e\x34\x35\x2d\x31\x20\x31\x2d\x31\x68\
+\x33\x63\x30\x2d\x31\x2e\x31\x31\x2e\x38\x39\x2d\x32\x20\x32\x2d\
+\x32\x63\x31\x2e\x31\x31\x20\x30\x20\x32\x20\x2e\x38\x39\x20\x32\
+\x20\x32\x68\x33\x63\x2e\x35\x35\x20\x30\x20\x31\x20\x2e\x34\x35\
+\x20\x31\x20\x31\x76\x35\x68\x2d\x31\x56\x36\x48\x31\x76\x39\x68\
+\x31\x30\x76\x2d\x32\x7a\x4d\x32\x20\x35\x68\x38\x63\x30\x2d\x2e\
+\x35\x35\x2d\x2e\x34\x35\x2d\x31\x2d\x31\x2d\x31\x48\x38\x63\x2d\
+\x2e\x35\x35\x20\x30\x2d\x31\x2d\x2e\x34\x35\x2d\x31\x2d\x31\x73\
+\x2d\x2e\x34\x35\x2d\x31\x2d\x31\x2d\x31\x73\x2d\x31\x20\x2e\x34\
+\x35\x2d\x31\x20\x31\x73\x2d\x2e\x34\x35\x20\x31\x2d\x31\x20\x31\
+\x48\x33\x63\x2d\x2e\x35\x35\x20\x30\x2d\x31\x20\x2e\x34\x35\x2d\
+\x31\x20\x31\x7a\x22\x20\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x03\x85\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\
+\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x35\
+\x31\x2e\x33\x2c\x37\x35\x2e\x39\x63\x2d\x31\x2e\x39\x2c\x30\x2d\
+\x33\x2e\x38\x2d\x30\x2e\x38\x2d\x35\x2d\x32\x2e\x34\x4c\x31\x38\
+\x2e\x31\x2c\x33\x38\x2e\x34\x63\x2d\x32\x2e\x32\x2d\x32\x2e\x38\
+\x2d\x31\x2e\x38\x2d\x36\x2e\x39\x2c\x31\x2d\x39\x2e\x31\x63\x32\
+\x2e\x38\x2d\x32\x2e\x32\x2c\x36\x2e\x39\x2d\x31\x2e\x38\x2c\x39\
+\x2e\x31\x2c\x31\x6c\x32\x38\x2e\x32\x2c\x33\x35\x2e\x31\x63\x32\
+\x2e\x32\x2c\x32\x2e\x38\x2c\x31\x2e\x38\x2c\x36\x2e\x39\x2d\x31\
+\x2c\x39\x2e\x31\x0a\x09\x43\x35\x34\x2e\x32\x2c\x37\x35\x2e\x35\
+\x2c\x35\x32\x2e\x37\x2c\x37\x35\x2e\x39\x2c\x35\x31\x2e\x33\x2c\
+\x37\x35\x2e\x39\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\
+\x3d\x22\x4d\x35\x31\x2e\x33\x2c\x37\x35\x2e\x39\x63\x2d\x31\x2e\
+\x34\x2c\x30\x2d\x32\x2e\x39\x2d\x30\x2e\x35\x2d\x34\x2d\x31\x2e\
+\x34\x63\x2d\x32\x2e\x38\x2d\x32\x2e\x32\x2d\x33\x2e\x32\x2d\x36\
+\x2e\x33\x2d\x31\x2d\x39\x2e\x31\x6c\x32\x38\x2e\x32\x2d\x33\x35\
+\x2e\x31\x63\x32\x2e\x32\x2d\x32\x2e\x38\x2c\x36\x2e\x33\x2d\x33\
+\x2e\x32\x2c\x39\x2e\x31\x2d\x31\x63\x32\x2e\x38\x2c\x32\x2e\x32\
+\x2c\x33\x2e\x32\x2c\x36\x2e\x33\x2c\x31\x2c\x39\x2e\x31\x4c\x35\
+\x36\x2e\x34\x2c\x37\x33\x2e\x35\x0a\x09\x43\x35\x35\x2e\x31\x2c\
+\x37\x35\x2e\x31\x2c\x35\x33\x2e\x32\x2c\x37\x35\x2e\x39\x2c\x35\
+\x31\x2e\x33\x2c\x37\x35\x2e\x39\x7a\x22\x2f\x3e\x0a\x3c\x2f\x73\
+\x76\x67\x3e\x0a\
+\x00\x00\x03\xf5\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\
+\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x35\x30\x2e\x35\x2c\x37\x37\x2e\x33\
+\x43\x32\x36\x2e\x37\x2c\x37\x37\x2e\x33\x2c\x38\x2e\x31\x2c\x35\
+\x32\x2e\x31\x2c\x37\x2e\x33\x2c\x35\x31\x4c\x36\x2c\x34\x39\x2e\
+\x32\x6c\x31\x2e\x33\x2d\x31\x2e\x38\x43\x38\x2e\x31\x2c\x34\x36\
+\x2e\x33\x2c\x32\x36\x2e\x37\x2c\x32\x31\x2c\x35\x30\x2e\x35\x2c\
+\x32\x31\x73\x34\x32\x2e\x34\x2c\x32\x35\x2e\x33\x2c\x34\x33\x2e\
+\x32\x2c\x32\x36\x2e\x33\x6c\x31\x2e\x33\x2c\x31\x2e\x38\x4c\x39\
+\x33\x2e\x37\x2c\x35\x31\x0a\x09\x43\x39\x32\x2e\x39\x2c\x35\x32\
+\x2e\x31\x2c\x37\x34\x2e\x33\x2c\x37\x37\x2e\x33\x2c\x35\x30\x2e\
+\x35\x2c\x37\x37\x2e\x33\x7a\x20\x4d\x31\x33\x2e\x38\x2c\x34\x39\
+\x2e\x32\x63\x34\x2e\x36\x2c\x35\x2e\x36\x2c\x31\x39\x2e\x35\x2c\
+\x32\x31\x2e\x39\x2c\x33\x36\x2e\x37\x2c\x32\x31\x2e\x39\x73\x33\
+\x32\x2e\x31\x2d\x31\x36\x2e\x34\x2c\x33\x36\x2e\x37\x2d\x32\x31\
+\x2e\x39\x63\x2d\x34\x2e\x36\x2d\x35\x2e\x36\x2d\x31\x39\x2e\x35\
+\x2d\x32\x31\x2e\x39\x2d\x33\x36\x2e\x37\x2d\x32\x31\x2e\x39\x0a\
+\x09\x43\x33\x33\x2e\x33\x2c\x32\x37\x2e\x32\x2c\x31\x38\x2e\x34\
+\x2c\x34\x33\x2e\x36\x2c\x31\x33\x2e\x38\x2c\x34\x39\x2e\x32\x7a\
+\x22\x2f\x3e\x0a\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\
+\x35\x30\x2e\x35\x22\x20\x63\x79\x3d\x22\x34\x39\x2e\x32\x22\x20\
+\x72\x3d\x22\x31\x37\x2e\x33\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\
+\x20\x78\x3d\x22\x31\x2e\x31\x22\x20\x79\x3d\x22\x34\x34\x2e\x36\
+\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\x74\
+\x72\x69\x78\x28\x30\x2e\x38\x31\x38\x38\x20\x2d\x30\x2e\x35\x37\
+\x34\x31\x20\x30\x2e\x35\x37\x34\x31\x20\x30\x2e\x38\x31\x38\x38\
+\x20\x2d\x31\x39\x2e\x31\x32\x39\x31\x20\x33\x37\x2e\x36\x39\x38\
+\x29\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x38\x2e\x31\x22\x20\
+\x68\x65\x69\x67\x68\x74\x3d\x22\x39\x22\x2f\x3e\x0a\x3c\x2f\x73\
+\x76\x67\x3e\x0a\
+\x00\x00\x02\x72\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x36\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\
+\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x32\x32\
+\x2e\x32\x22\x20\x79\x3d\x22\x32\x32\x2e\x32\x22\x20\x77\x69\x64\
+\x74\x68\x3d\x22\x35\x35\x2e\x35\x22\x20\x68\x65\x69\x67\x68\x74\
+\x3d\x22\x35\x35\x2e\x35\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\
+\x0a\
+\x00\x00\x06\x37\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\
+\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x35\
+\x38\x2e\x38\x2c\x38\x32\x2e\x36\x63\x2d\x34\x2e\x37\x2c\x30\x2d\
+\x38\x2e\x36\x2d\x33\x2e\x39\x2d\x38\x2e\x36\x2d\x38\x2e\x36\x73\
+\x33\x2e\x39\x2d\x38\x2e\x36\x2c\x38\x2e\x36\x2d\x38\x2e\x36\x73\
+\x38\x2e\x36\x2c\x33\x2e\x39\x2c\x38\x2e\x36\x2c\x38\x2e\x36\x53\
+\x36\x33\x2e\x35\x2c\x38\x32\x2e\x36\x2c\x35\x38\x2e\x38\x2c\x38\
+\x32\x2e\x36\x7a\x20\x4d\x35\x38\x2e\x38\x2c\x37\x31\x63\x2d\x31\
+\x2e\x37\x2c\x30\x2d\x33\x2c\x31\x2e\x33\x2d\x33\x2c\x33\x0a\x09\
+\x73\x31\x2e\x33\x2c\x33\x2c\x33\x2c\x33\x73\x33\x2d\x31\x2e\x33\
+\x2c\x33\x2d\x33\x53\x36\x30\x2e\x35\x2c\x37\x31\x2c\x35\x38\x2e\
+\x38\x2c\x37\x31\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\
+\x3d\x22\x4d\x33\x39\x2e\x35\x2c\x33\x39\x2e\x38\x63\x2d\x34\x2e\
+\x37\x2c\x30\x2d\x38\x2e\x36\x2d\x33\x2e\x39\x2d\x38\x2e\x36\x2d\
+\x38\x2e\x36\x73\x33\x2e\x39\x2d\x38\x2e\x36\x2c\x38\x2e\x36\x2d\
+\x38\x2e\x36\x73\x38\x2e\x36\x2c\x33\x2e\x39\x2c\x38\x2e\x36\x2c\
+\x38\x2e\x36\x53\x34\x34\x2e\x32\x2c\x33\x39\x2e\x38\x2c\x33\x39\
+\x2e\x35\x2c\x33\x39\x2e\x38\x7a\x20\x4d\x33\x39\x2e\x35\x2c\x32\
+\x38\x2e\x32\x63\x2d\x31\x2e\x37\x2c\x30\x2d\x33\x2c\x31\x2e\x33\
+\x2d\x33\x2c\x33\x0a\x09\x73\x31\x2e\x33\x2c\x33\x2c\x33\x2c\x33\
+\x73\x33\x2d\x31\x2e\x33\x2c\x33\x2d\x33\x53\x34\x31\x2e\x32\x2c\
+\x32\x38\x2e\x32\x2c\x33\x39\x2e\x35\x2c\x32\x38\x2e\x32\x7a\x22\
+\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x39\x2e\
+\x32\x2c\x38\x32\x2e\x36\x63\x2d\x34\x2e\x37\x2c\x30\x2d\x38\x2e\
+\x36\x2d\x33\x2e\x39\x2d\x38\x2e\x36\x2d\x38\x2e\x36\x73\x33\x2e\
+\x39\x2d\x38\x2e\x36\x2c\x38\x2e\x36\x2d\x38\x2e\x36\x73\x38\x2e\
+\x36\x2c\x33\x2e\x39\x2c\x38\x2e\x36\x2c\x38\x2e\x36\x53\x32\x33\
+\x2e\x39\x2c\x38\x32\x2e\x36\x2c\x31\x39\x2e\x32\x2c\x38\x32\x2e\
+\x36\x7a\x20\x4d\x31\x39\x2e\x32\x2c\x37\x31\x63\x2d\x31\x2e\x37\
+\x2c\x30\x2d\x33\x2c\x31\x2e\x33\x2d\x33\x2c\x33\x0a\x09\x73\x31\
+\x2e\x33\x2c\x33\x2c\x33\x2c\x33\x73\x33\x2d\x31\x2e\x33\x2c\x33\
+\x2d\x33\x53\x32\x30\x2e\x39\x2c\x37\x31\x2c\x31\x39\x2e\x32\x2c\
+\x37\x31\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\
+\x4d\x38\x33\x2e\x31\x2c\x33\x39\x2e\x38\x63\x2d\x34\x2e\x37\x2c\
+\x30\x2d\x38\x2e\x36\x2d\x33\x2e\x39\x2d\x38\x2e\x36\x2d\x38\x2e\
+\x36\x73\x33\x2e\x39\x2d\x38\x2e\x36\x2c\x38\x2e\x36\x2d\x38\x2e\
+\x36\x73\x38\x2e\x36\x2c\x33\x2e\x39\x2c\x38\x2e\x36\x2c\x38\x2e\
+\x36\x53\x38\x37\x2e\x38\x2c\x33\x39\x2e\x38\x2c\x38\x33\x2e\x31\
+\x2c\x33\x39\x2e\x38\x7a\x20\x4d\x38\x33\x2e\x31\x2c\x32\x38\x2e\
+\x32\x63\x2d\x31\x2e\x37\x2c\x30\x2d\x33\x2c\x31\x2e\x33\x2d\x33\
+\x2c\x33\x0a\x09\x73\x31\x2e\x33\x2c\x33\x2c\x33\x2c\x33\x73\x33\
+\x2d\x31\x2e\x33\x2c\x33\x2d\x33\x53\x38\x34\x2e\x38\x2c\x32\x38\
+\x2e\x32\x2c\x38\x33\x2e\x31\x2c\x32\x38\x2e\x32\x7a\x22\x2f\x3e\
+\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x35\x31\x2e\x31\x22\x20\
+\x79\x3d\x22\x34\x39\x2e\x32\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\
+\x72\x6d\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\x30\x2e\x35\x33\x35\
+\x35\x20\x2d\x30\x2e\x38\x34\x34\x35\x20\x30\x2e\x38\x34\x34\x35\
+\x20\x30\x2e\x35\x33\x35\x35\x20\x2d\x31\x31\x2e\x32\x31\x39\x20\
+\x38\x33\x2e\x35\x30\x32\x39\x29\x22\x20\x77\x69\x64\x74\x68\x3d\
+\x22\x33\x38\x2e\x35\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x35\
+\x2e\x35\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x34\
+\x36\x2e\x34\x22\x20\x79\x3d\x22\x33\x35\x2e\x33\x22\x20\x74\x72\
+\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\
+\x30\x2e\x39\x30\x30\x31\x20\x2d\x30\x2e\x34\x33\x35\x36\x20\x30\
+\x2e\x34\x33\x35\x36\x20\x30\x2e\x39\x30\x30\x31\x20\x2d\x31\x38\
+\x2e\x30\x30\x35\x39\x20\x32\x36\x2e\x36\x36\x36\x29\x22\x20\x77\
+\x69\x64\x74\x68\x3d\x22\x35\x2e\x35\x22\x20\x68\x65\x69\x67\x68\
+\x74\x3d\x22\x33\x34\x2e\x37\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\
+\x20\x78\x3d\x22\x31\x30\x22\x20\x79\x3d\x22\x35\x31\x2e\x33\x22\
+\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\x74\x72\
+\x69\x78\x28\x30\x2e\x34\x36\x31\x35\x20\x2d\x30\x2e\x38\x38\x37\
+\x32\x20\x30\x2e\x38\x38\x37\x32\x20\x30\x2e\x34\x36\x31\x35\x20\
+\x2d\x33\x32\x2e\x31\x30\x30\x36\x20\x35\x35\x2e\x31\x31\x38\x38\
+\x29\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x33\x38\x2e\x38\x22\x20\
+\x68\x65\x69\x67\x68\x74\x3d\x22\x35\x2e\x35\x22\x2f\x3e\x0a\x3c\
+\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x04\x83\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\
+\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x67\x20\
+\x69\x64\x3d\x22\x53\x6f\x6c\x69\x64\x22\x3e\x0a\x09\x3c\x67\x3e\
+\x0a\x09\x09\x3c\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x70\x6f\x69\x6e\
+\x74\x73\x3d\x22\x37\x30\x2e\x37\x2c\x31\x34\x2e\x37\x20\x36\x33\
+\x2e\x35\x2c\x31\x34\x2e\x37\x20\x36\x33\x2e\x35\x2c\x32\x39\x2e\
+\x32\x20\x34\x38\x2e\x39\x2c\x32\x39\x2e\x32\x20\x34\x38\x2e\x39\
+\x2c\x33\x36\x2e\x35\x20\x36\x33\x2e\x35\x2c\x33\x36\x2e\x35\x20\
+\x36\x33\x2e\x35\x2c\x35\x31\x20\x37\x30\x2e\x37\x2c\x35\x31\x20\
+\x37\x30\x2e\x37\x2c\x33\x36\x2e\x35\x20\x38\x35\x2e\x33\x2c\x33\
+\x36\x2e\x35\x20\x38\x35\x2e\x33\x2c\x32\x39\x2e\x32\x20\x0a\x09\
+\x09\x09\x37\x30\x2e\x37\x2c\x32\x39\x2e\x32\x20\x09\x09\x22\x2f\
+\x3e\x0a\x09\x3c\x2f\x67\x3e\x0a\x3c\x2f\x67\x3e\x0a\x3c\x67\x20\
+\x69\x64\x3d\x22\x4f\x75\x74\x6c\x69\x6e\x65\x22\x3e\x0a\x09\x3c\
+\x67\x3e\x0a\x09\x09\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x33\
+\x35\x2e\x34\x2c\x38\x35\x2e\x39\x63\x2d\x30\x2e\x39\x2c\x30\x2d\
+\x31\x2e\x38\x2d\x30\x2e\x36\x2d\x32\x2e\x32\x2d\x31\x2e\x35\x4c\
+\x31\x36\x2e\x38\x2c\x34\x34\x2e\x35\x63\x2d\x30\x2e\x34\x2d\x30\
+\x2e\x39\x2d\x30\x2e\x32\x2d\x31\x2e\x39\x2c\x30\x2e\x35\x2d\x32\
+\x2e\x36\x63\x30\x2e\x37\x2d\x30\x2e\x37\x2c\x31\x2e\x37\x2d\x30\
+\x2e\x39\x2c\x32\x2e\x36\x2d\x30\x2e\x35\x6c\x33\x39\x2e\x39\x2c\
+\x31\x36\x2e\x34\x0a\x09\x09\x09\x63\x30\x2e\x39\x2c\x30\x2e\x34\
+\x2c\x31\x2e\x35\x2c\x31\x2e\x33\x2c\x31\x2e\x34\x2c\x32\x2e\x33\
+\x73\x2d\x30\x2e\x38\x2c\x31\x2e\x39\x2d\x31\x2e\x38\x2c\x32\x2e\
+\x31\x4c\x34\x32\x2c\x36\x36\x2e\x36\x4c\x33\x37\x2e\x36\x2c\x38\
+\x34\x63\x2d\x30\x2e\x32\x2c\x31\x2d\x31\x2e\x31\x2c\x31\x2e\x37\
+\x2d\x32\x2e\x31\x2c\x31\x2e\x38\x43\x33\x35\x2e\x35\x2c\x38\x35\
+\x2e\x39\x2c\x33\x35\x2e\x35\x2c\x38\x35\x2e\x39\x2c\x33\x35\x2e\
+\x34\x2c\x38\x35\x2e\x39\x7a\x20\x4d\x32\x33\x2e\x33\x2c\x34\x37\
+\x2e\x39\x0a\x09\x09\x09\x4c\x33\x34\x2e\x39\x2c\x37\x36\x6c\x33\
+\x2d\x31\x31\x2e\x39\x63\x30\x2e\x32\x2d\x30\x2e\x38\x2c\x30\x2e\
+\x39\x2d\x31\x2e\x35\x2c\x31\x2e\x37\x2d\x31\x2e\x37\x6c\x31\x31\
+\x2e\x39\x2d\x33\x4c\x32\x33\x2e\x33\x2c\x34\x37\x2e\x39\x7a\x22\
+\x2f\x3e\x0a\x09\x3c\x2f\x67\x3e\x0a\x3c\x2f\x67\x3e\x0a\x3c\x70\
+\x6f\x6c\x79\x67\x6f\x6e\x20\x70\x6f\x69\x6e\x74\x73\x3d\x22\x32\
+\x31\x2e\x37\x2c\x34\x36\x2e\x36\x20\x33\x34\x2e\x35\x2c\x37\x38\
+\x2e\x33\x20\x33\x39\x2e\x33\x2c\x36\x35\x2e\x37\x20\x35\x33\x2e\
+\x39\x2c\x35\x39\x2e\x35\x20\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\
+\x3e\x0a\
+\x00\x00\x02\x6d\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x36\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\
+\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x70\x6f\
+\x69\x6e\x74\x73\x3d\x22\x32\x30\x2e\x39\x2c\x35\x30\x20\x37\x39\
+\x2e\x31\x2c\x39\x37\x2e\x34\x20\x37\x39\x2e\x31\x2c\x32\x2e\x36\
+\x20\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x04\x81\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\
+\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x67\x20\x69\x64\x3d\x22\x53\x6f\x6c\x69\
+\x64\x22\x3e\x0a\x09\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x37\
+\x39\x2e\x34\x2c\x33\x30\x2e\x31\x63\x30\x2d\x32\x2e\x34\x2d\x30\
+\x2e\x39\x2d\x34\x2e\x36\x2d\x32\x2e\x36\x2d\x36\x2e\x33\x63\x2d\
+\x33\x2e\x34\x2d\x33\x2e\x34\x2d\x39\x2e\x32\x2d\x33\x2e\x34\x2d\
+\x31\x32\x2e\x36\x2c\x30\x4c\x33\x33\x2e\x39\x2c\x35\x34\x2e\x32\
+\x63\x2d\x32\x2e\x38\x2c\x30\x2e\x32\x2d\x35\x2e\x35\x2c\x31\x2e\
+\x33\x2d\x37\x2e\x35\x2c\x33\x2e\x33\x63\x2d\x34\x2e\x32\x2c\x34\
+\x2e\x32\x2d\x34\x2c\x37\x2e\x37\x2d\x33\x2e\x39\x2c\x31\x30\x2e\
+\x36\x0a\x09\x09\x63\x30\x2e\x31\x2c\x32\x2e\x34\x2c\x30\x2e\x32\
+\x2c\x34\x2e\x32\x2d\x32\x2e\x37\x2c\x37\x2e\x32\x6c\x2d\x34\x2e\
+\x33\x2c\x34\x2e\x33\x63\x35\x2e\x34\x2c\x30\x2e\x37\x2c\x36\x2e\
+\x37\x2c\x31\x2c\x39\x2e\x36\x2c\x31\x6c\x30\x2c\x30\x63\x34\x2e\
+\x34\x2c\x30\x2c\x31\x32\x2e\x37\x2d\x30\x2e\x38\x2c\x31\x38\x2e\
+\x31\x2d\x36\x2e\x32\x63\x32\x2e\x31\x2d\x32\x2e\x31\x2c\x33\x2e\
+\x32\x2d\x34\x2e\x37\x2c\x33\x2e\x34\x2d\x37\x2e\x36\x6c\x33\x30\
+\x2e\x32\x2d\x33\x30\x2e\x32\x0a\x09\x09\x43\x37\x38\x2e\x35\x2c\
+\x33\x34\x2e\x37\x2c\x37\x39\x2e\x34\x2c\x33\x32\x2e\x35\x2c\x37\
+\x39\x2e\x34\x2c\x33\x30\x2e\x31\x7a\x20\x4d\x33\x39\x2c\x37\x30\
+\x63\x2d\x33\x2e\x31\x2c\x33\x2e\x31\x2d\x37\x2e\x39\x2c\x34\x2e\
+\x31\x2d\x31\x31\x2e\x35\x2c\x34\x2e\x33\x63\x31\x2e\x31\x2d\x32\
+\x2e\x36\x2c\x31\x2d\x34\x2e\x38\x2c\x30\x2e\x39\x2d\x36\x2e\x37\
+\x63\x2d\x30\x2e\x33\x2d\x35\x2e\x32\x2c\x33\x2e\x32\x2d\x37\x2e\
+\x38\x2c\x36\x2e\x34\x2d\x37\x2e\x38\x0a\x09\x09\x63\x31\x2e\x36\
+\x2c\x30\x2c\x33\x2e\x31\x2c\x30\x2e\x36\x2c\x34\x2e\x32\x2c\x31\
+\x2e\x37\x43\x34\x31\x2e\x33\x2c\x36\x34\x2c\x34\x31\x2e\x33\x2c\
+\x36\x37\x2e\x37\x2c\x33\x39\x2c\x37\x30\x7a\x20\x4d\x37\x32\x2e\
+\x36\x2c\x33\x32\x2e\x32\x4c\x34\x35\x2c\x35\x39\x2e\x38\x63\x2d\
+\x30\x2e\x35\x2d\x30\x2e\x39\x2d\x31\x2e\x31\x2d\x31\x2e\x37\x2d\
+\x31\x2e\x38\x2d\x32\x2e\x34\x73\x2d\x31\x2e\x36\x2d\x31\x2e\x33\
+\x2d\x32\x2e\x34\x2d\x31\x2e\x38\x4c\x36\x38\x2e\x34\x2c\x32\x38\
+\x0a\x09\x09\x63\x31\x2e\x31\x2d\x31\x2e\x31\x2c\x33\x2e\x31\x2d\
+\x31\x2e\x31\x2c\x34\x2e\x32\x2c\x30\x63\x30\x2e\x36\x2c\x30\x2e\
+\x36\x2c\x30\x2e\x39\x2c\x31\x2e\x33\x2c\x30\x2e\x39\x2c\x32\x2e\
+\x31\x43\x37\x33\x2e\x35\x2c\x33\x30\x2e\x39\x2c\x37\x33\x2e\x32\
+\x2c\x33\x31\x2e\x37\x2c\x37\x32\x2e\x36\x2c\x33\x32\x2e\x32\x7a\
+\x22\x2f\x3e\x0a\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\
+\x00\x00\x04\x0a\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x31\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\
+\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x31\x33\
+\x22\x20\x79\x3d\x22\x31\x32\x22\x20\x77\x69\x64\x74\x68\x3d\x22\
+\x31\x36\x2e\x38\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x36\
+\x2e\x38\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x34\
+\x31\x2e\x37\x22\x20\x79\x3d\x22\x31\x32\x22\x20\x77\x69\x64\x74\
+\x68\x3d\x22\x31\x36\x2e\x38\x22\x20\x68\x65\x69\x67\x68\x74\x3d\
+\x22\x31\x36\x2e\x38\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\
+\x3d\x22\x37\x30\x2e\x34\x22\x20\x79\x3d\x22\x31\x32\x22\x20\x77\
+\x69\x64\x74\x68\x3d\x22\x31\x36\x2e\x38\x22\x20\x68\x65\x69\x67\
+\x68\x74\x3d\x22\x31\x36\x2e\x38\x22\x2f\x3e\x0a\x3c\x72\x65\x63\
+\x74\x20\x78\x3d\x22\x31\x33\x22\x20\x79\x3d\x22\x34\x31\x2e\x35\
+\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\x2e\x38\x22\x20\x68\
+\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x2e\x38\x22\x2f\x3e\x0a\x3c\
+\x72\x65\x63\x74\x20\x78\x3d\x22\x34\x31\x2e\x37\x22\x20\x79\x3d\
+\x22\x34\x31\x2e\x35\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\
+\x2e\x38\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x2e\x38\
+\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x37\x30\x2e\
+\x34\x22\x20\x79\x3d\x22\x34\x31\x2e\x35\x22\x20\x77\x69\x64\x74\
+\x68\x3d\x22\x31\x36\x2e\x38\x22\x20\x68\x65\x69\x67\x68\x74\x3d\
+\x22\x31\x36\x2e\x38\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\
+\x3d\x22\x31\x32\x2e\x39\x22\x20\x79\x3d\x22\x37\x31\x22\x20\x77\
+\x69\x64\x74\x68\x3d\x22\x31\x36\x2e\x38\x22\x20\x68\x65\x69\x67\
+\x68\x74\x3d\x22\x31\x36\x2e\x38\x22\x2f\x3e\x0a\x3c\x72\x65\x63\
+\x74\x20\x78\x3d\x22\x34\x31\x2e\x36\x22\x20\x79\x3d\x22\x37\x31\
+\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\x2e\x38\x22\x20\x68\
+\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x2e\x38\x22\x2f\x3e\x0a\x3c\
+\x72\x65\x63\x74\x20\x78\x3d\x22\x37\x30\x2e\x33\x22\x20\x79\x3d\
+\x22\x37\x31\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\x2e\x38\
+\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x2e\x38\x22\x2f\
+\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x02\xe2\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x32\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\
+\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x70\x6f\
+\x69\x6e\x74\x73\x3d\x22\x32\x35\x2e\x34\x2c\x35\x30\x20\x38\x33\
+\x2e\x36\x2c\x39\x37\x2e\x34\x20\x38\x33\x2e\x36\x2c\x32\x2e\x36\
+\x20\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x31\x33\
+\x2e\x38\x22\x20\x79\x3d\x22\x32\x2e\x36\x22\x20\x74\x72\x61\x6e\
+\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\x2d\x31\
+\x20\x2d\x31\x2e\x32\x32\x34\x36\x34\x37\x65\x2d\x31\x36\x20\x31\
+\x2e\x32\x32\x34\x36\x34\x37\x65\x2d\x31\x36\x20\x2d\x31\x20\x34\
+\x30\x2e\x31\x38\x32\x36\x20\x31\x30\x30\x29\x22\x20\x77\x69\x64\
+\x74\x68\x3d\x22\x31\x32\x2e\x35\x22\x20\x68\x65\x69\x67\x68\x74\
+\x3d\x22\x39\x34\x2e\x38\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\
+\x0a\
+\x00\x00\x02\x75\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x34\x2e\x30\x2e\x30\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\
+\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x6f\
+\x6c\x79\x67\x6f\x6e\x20\x70\x6f\x69\x6e\x74\x73\x3d\x22\x35\x30\
+\x2c\x32\x30\x2e\x39\x20\x32\x2e\x36\x2c\x37\x39\x2e\x31\x20\x39\
+\x37\x2e\x34\x2c\x37\x39\x2e\x31\x20\x22\x2f\x3e\x0a\x3c\x2f\x73\
+\x76\x67\x3e\x0a\
+\x00\x00\x04\x5b\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\
+\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x67\x20\
+\x69\x64\x3d\x22\x53\x6f\x6c\x69\x64\x22\x3e\x0a\x09\x3c\x67\x3e\
+\x0a\x09\x09\x3c\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x70\x6f\x69\x6e\
+\x74\x73\x3d\x22\x37\x30\x2e\x37\x2c\x33\x36\x2e\x35\x20\x38\x35\
+\x2e\x33\x2c\x33\x36\x2e\x35\x20\x38\x35\x2e\x33\x2c\x32\x39\x2e\
+\x32\x20\x37\x30\x2e\x37\x2c\x32\x39\x2e\x32\x20\x36\x33\x2e\x35\
+\x2c\x32\x39\x2e\x32\x20\x34\x38\x2e\x39\x2c\x32\x39\x2e\x32\x20\
+\x34\x38\x2e\x39\x2c\x33\x36\x2e\x35\x20\x36\x33\x2e\x35\x2c\x33\
+\x36\x2e\x35\x20\x09\x09\x22\x2f\x3e\x0a\x09\x3c\x2f\x67\x3e\x0a\
+\x3c\x2f\x67\x3e\x0a\x3c\x67\x20\x69\x64\x3d\x22\x4f\x75\x74\x6c\
+\x69\x6e\x65\x22\x3e\x0a\x09\x3c\x67\x3e\x0a\x09\x09\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x33\x35\x2e\x34\x2c\x38\x35\x2e\x39\
+\x63\x2d\x30\x2e\x39\x2c\x30\x2d\x31\x2e\x38\x2d\x30\x2e\x36\x2d\
+\x32\x2e\x32\x2d\x31\x2e\x35\x4c\x31\x36\x2e\x38\x2c\x34\x34\x2e\
+\x35\x63\x2d\x30\x2e\x34\x2d\x30\x2e\x39\x2d\x30\x2e\x32\x2d\x31\
+\x2e\x39\x2c\x30\x2e\x35\x2d\x32\x2e\x36\x63\x30\x2e\x37\x2d\x30\
+\x2e\x37\x2c\x31\x2e\x37\x2d\x30\x2e\x39\x2c\x32\x2e\x36\x2d\x30\
+\x2e\x35\x6c\x33\x39\x2e\x39\x2c\x31\x36\x2e\x34\x0a\x09\x09\x09\
+\x63\x30\x2e\x39\x2c\x30\x2e\x34\x2c\x31\x2e\x35\x2c\x31\x2e\x33\
+\x2c\x31\x2e\x34\x2c\x32\x2e\x33\x73\x2d\x30\x2e\x38\x2c\x31\x2e\
+\x39\x2d\x31\x2e\x38\x2c\x32\x2e\x31\x4c\x34\x32\x2c\x36\x36\x2e\
+\x36\x4c\x33\x37\x2e\x36\x2c\x38\x34\x63\x2d\x30\x2e\x32\x2c\x31\
+\x2d\x31\x2e\x31\x2c\x31\x2e\x37\x2d\x32\x2e\x31\x2c\x31\x2e\x38\
+\x43\x33\x35\x2e\x35\x2c\x38\x35\x2e\x39\x2c\x33\x35\x2e\x35\x2c\
+\x38\x35\x2e\x39\x2c\x33\x35\x2e\x34\x2c\x38\x35\x2e\x39\x7a\x20\
+\x4d\x32\x33\x2e\x33\x2c\x34\x37\x2e\x39\x0a\x09\x09\x09\x4c\x33\
+\x34\x2e\x39\x2c\x37\x36\x6c\x33\x2d\x31\x31\x2e\x39\x63\x30\x2e\
+\x32\x2d\x30\x2e\x38\x2c\x30\x2e\x39\x2d\x31\x2e\x35\x2c\x31\x2e\
+\x37\x2d\x31\x2e\x37\x6c\x31\x31\x2e\x39\x2d\x33\x4c\x32\x33\x2e\
+\x33\x2c\x34\x37\x2e\x39\x7a\x22\x2f\x3e\x0a\x09\x3c\x2f\x67\x3e\
+\x0a\x3c\x2f\x67\x3e\x0a\x3c\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x70\
+\x6f\x69\x6e\x74\x73\x3d\x22\x32\x31\x2e\x37\x2c\x34\x36\x2e\x36\
+\x20\x33\x34\x2e\x35\x2c\x37\x38\x2e\x33\x20\x33\x39\x2e\x33\x2c\
+\x36\x35\x2e\x37\x20\x35\x33\x2e\x39\x2c\x35\x39\x2e\x35\x20\x22\
+\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x03\xd8\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\
+\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x33\x32\x2e\x34\x2c\x35\x33\x2e\x35\
+\x48\x32\x33\x63\x2d\x32\x2e\x38\x2c\x30\x2d\x35\x2d\x32\x2e\x32\
+\x2d\x35\x2d\x35\x56\x32\x33\x63\x30\x2d\x32\x2e\x38\x2c\x32\x2e\
+\x32\x2d\x35\x2c\x35\x2d\x35\x68\x32\x35\x2e\x35\x63\x32\x2e\x38\
+\x2c\x30\x2c\x35\x2c\x32\x2e\x32\x2c\x35\x2c\x35\x76\x31\x30\x2e\
+\x33\x68\x2d\x36\x56\x32\x34\x48\x32\x34\x76\x32\x33\x2e\x35\x68\
+\x38\x2e\x34\x56\x35\x33\x2e\x35\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x37\x35\x2e\x37\x2c\x38\x31\x2e\x33\
+\x48\x35\x30\x2e\x31\x63\x2d\x32\x2e\x38\x2c\x30\x2d\x35\x2d\x32\
+\x2e\x32\x2d\x35\x2d\x35\x56\x36\x35\x2e\x32\x68\x36\x76\x31\x30\
+\x2e\x31\x68\x32\x33\x2e\x36\x56\x35\x31\x2e\x38\x68\x2d\x39\x2e\
+\x35\x76\x2d\x36\x68\x31\x30\x2e\x35\x63\x32\x2e\x38\x2c\x30\x2c\
+\x35\x2c\x32\x2e\x32\x2c\x35\x2c\x35\x76\x32\x35\x2e\x35\x43\x38\
+\x30\x2e\x37\x2c\x37\x39\x2e\x31\x2c\x37\x38\x2e\x35\x2c\x38\x31\
+\x2e\x33\x2c\x37\x35\x2e\x37\x2c\x38\x31\x2e\x33\x7a\x0a\x09\x22\
+\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x36\x31\x2e\
+\x38\x2c\x36\x37\x2e\x34\x48\x33\x36\x2e\x33\x63\x2d\x32\x2e\x38\
+\x2c\x30\x2d\x35\x2d\x32\x2e\x32\x2d\x35\x2d\x35\x56\x33\x36\x2e\
+\x39\x63\x30\x2d\x32\x2e\x38\x2c\x32\x2e\x32\x2d\x35\x2c\x35\x2d\
+\x35\x68\x32\x35\x2e\x35\x63\x32\x2e\x38\x2c\x30\x2c\x35\x2c\x32\
+\x2e\x32\x2c\x35\x2c\x35\x76\x32\x35\x2e\x35\x43\x36\x36\x2e\x38\
+\x2c\x36\x35\x2e\x32\x2c\x36\x34\x2e\x36\x2c\x36\x37\x2e\x34\x2c\
+\x36\x31\x2e\x38\x2c\x36\x37\x2e\x34\x7a\x0a\x09\x20\x4d\x33\x37\
+\x2e\x33\x2c\x36\x31\x2e\x34\x68\x32\x33\x2e\x35\x56\x33\x37\x2e\
+\x39\x48\x33\x37\x2e\x33\x56\x36\x31\x2e\x34\x7a\x22\x2f\x3e\x0a\
+\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x03\xca\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\
+\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x67\x20\x69\x64\x3d\x22\x4f\x75\x74\x6c\
+\x69\x6e\x65\x22\x3e\x0a\x09\x3c\x67\x3e\x0a\x09\x09\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x34\x37\x2e\x32\x2c\x38\x36\x2e\x39\
+\x63\x2d\x31\x2e\x34\x2c\x30\x2d\x32\x2e\x37\x2d\x30\x2e\x39\x2d\
+\x33\x2e\x33\x2d\x32\x2e\x32\x6c\x2d\x32\x35\x2d\x36\x30\x2e\x36\
+\x63\x2d\x30\x2e\x36\x2d\x31\x2e\x33\x2d\x30\x2e\x32\x2d\x32\x2e\
+\x39\x2c\x30\x2e\x38\x2d\x33\x2e\x39\x73\x32\x2e\x35\x2d\x31\x2e\
+\x33\x2c\x33\x2e\x39\x2d\x30\x2e\x38\x6c\x36\x30\x2e\x36\x2c\x32\
+\x35\x63\x31\x2e\x34\x2c\x30\x2e\x36\x2c\x32\x2e\x33\x2c\x32\x2c\
+\x32\x2e\x32\x2c\x33\x2e\x36\x0a\x09\x09\x09\x63\x2d\x30\x2e\x31\
+\x2c\x31\x2e\x35\x2d\x31\x2e\x32\x2c\x32\x2e\x38\x2d\x32\x2e\x37\
+\x2c\x33\x2e\x32\x6c\x2d\x32\x36\x2e\x34\x2c\x36\x2e\x36\x6c\x2d\
+\x36\x2e\x36\x2c\x32\x36\x2e\x34\x63\x2d\x30\x2e\x34\x2c\x31\x2e\
+\x35\x2d\x31\x2e\x37\x2c\x32\x2e\x36\x2d\x33\x2e\x32\x2c\x32\x2e\
+\x37\x43\x34\x37\x2e\x33\x2c\x38\x36\x2e\x39\x2c\x34\x37\x2e\x32\
+\x2c\x38\x36\x2e\x39\x2c\x34\x37\x2e\x32\x2c\x38\x36\x2e\x39\x7a\
+\x20\x4d\x32\x38\x2e\x37\x2c\x32\x39\x2e\x33\x4c\x34\x36\x2e\x33\
+\x2c\x37\x32\x0a\x09\x09\x09\x6c\x34\x2e\x35\x2d\x31\x38\x63\x30\
+\x2e\x33\x2d\x31\x2e\x33\x2c\x31\x2e\x33\x2d\x32\x2e\x33\x2c\x32\
+\x2e\x36\x2d\x32\x2e\x36\x6c\x31\x38\x2d\x34\x2e\x35\x4c\x32\x38\
+\x2e\x37\x2c\x32\x39\x2e\x33\x7a\x22\x2f\x3e\x0a\x09\x3c\x2f\x67\
+\x3e\x0a\x3c\x2f\x67\x3e\x0a\x3c\x70\x6f\x6c\x79\x67\x6f\x6e\x20\
+\x70\x6f\x69\x6e\x74\x73\x3d\x22\x32\x36\x2e\x33\x2c\x32\x37\x2e\
+\x32\x20\x34\x35\x2e\x37\x2c\x37\x35\x2e\x34\x20\x35\x33\x2c\x35\
+\x36\x2e\x32\x20\x37\x35\x2e\x32\x2c\x34\x36\x2e\x38\x20\x22\x2f\
+\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x04\x73\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x32\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x34\x34\x30\x20\x34\x34\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x34\x34\x30\x20\
+\x34\x34\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\
+\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x33\
+\x37\x33\x2e\x31\x2c\x33\x34\x34\x2e\x34\x56\x32\x37\x33\x63\x2d\
+\x33\x31\x2d\x32\x37\x2e\x34\x2d\x35\x30\x2e\x33\x2d\x34\x34\x2e\
+\x35\x2d\x35\x38\x2d\x35\x31\x2e\x33\x63\x2d\x37\x2e\x35\x2d\x36\
+\x2e\x36\x2d\x31\x38\x2e\x31\x2d\x36\x2d\x32\x34\x2e\x39\x2c\x31\
+\x2e\x34\x63\x2d\x31\x33\x2e\x33\x2c\x31\x34\x2e\x34\x2d\x34\x37\
+\x2c\x35\x31\x2e\x31\x2d\x36\x31\x2e\x37\x2c\x36\x37\x2e\x31\x0a\
+\x09\x63\x2d\x32\x2e\x36\x2c\x32\x2e\x38\x2d\x36\x2e\x37\x2c\x33\
+\x2d\x39\x2e\x35\x2c\x30\x2e\x33\x63\x2d\x37\x2d\x36\x2e\x38\x2d\
+\x31\x37\x2e\x34\x2d\x31\x36\x2e\x39\x2d\x32\x32\x2e\x39\x2d\x32\
+\x32\x2e\x33\x63\x2d\x36\x2e\x38\x2d\x36\x2e\x36\x2d\x31\x37\x2d\
+\x36\x2e\x34\x2d\x32\x33\x2e\x35\x2c\x30\x2e\x36\x63\x2d\x31\x30\
+\x2e\x34\x2c\x31\x31\x2e\x31\x2d\x33\x36\x2e\x33\x2c\x33\x38\x2e\
+\x38\x2d\x37\x37\x2e\x39\x2c\x38\x33\x2e\x31\x4c\x33\x37\x33\x2e\
+\x31\x2c\x33\x34\x34\x2e\x34\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\x74\
+\x68\x20\x64\x3d\x22\x4d\x33\x35\x38\x2e\x34\x2c\x37\x37\x2e\x38\
+\x48\x38\x31\x2e\x36\x63\x2d\x31\x37\x2c\x30\x2d\x33\x30\x2e\x38\
+\x2c\x31\x33\x2e\x38\x2d\x33\x30\x2e\x38\x2c\x33\x30\x2e\x38\x76\
+\x32\x32\x32\x2e\x39\x63\x30\x2c\x31\x37\x2c\x31\x33\x2e\x38\x2c\
+\x33\x30\x2e\x38\x2c\x33\x30\x2e\x38\x2c\x33\x30\x2e\x38\x68\x32\
+\x37\x36\x2e\x39\x63\x31\x37\x2c\x30\x2c\x33\x30\x2e\x38\x2d\x31\
+\x33\x2e\x38\x2c\x33\x30\x2e\x38\x2d\x33\x30\x2e\x38\x56\x31\x30\
+\x38\x2e\x36\x0a\x09\x43\x33\x38\x39\x2e\x32\x2c\x39\x31\x2e\x36\
+\x2c\x33\x37\x35\x2e\x35\x2c\x37\x37\x2e\x38\x2c\x33\x35\x38\x2e\
+\x34\x2c\x37\x37\x2e\x38\x7a\x20\x4d\x33\x36\x35\x2e\x36\x2c\x33\
+\x32\x31\x2e\x32\x63\x30\x2c\x31\x31\x2e\x31\x2d\x39\x2c\x32\x30\
+\x2e\x31\x2d\x32\x30\x2e\x31\x2c\x32\x30\x2e\x31\x48\x39\x34\x2e\
+\x38\x63\x2d\x31\x31\x2e\x31\x2c\x30\x2d\x32\x30\x2e\x31\x2d\x39\
+\x2d\x32\x30\x2e\x31\x2d\x32\x30\x2e\x31\x76\x2d\x32\x30\x32\x0a\
+\x09\x63\x30\x2d\x31\x31\x2e\x31\x2c\x39\x2d\x32\x30\x2e\x31\x2c\
+\x32\x30\x2e\x31\x2d\x32\x30\x2e\x31\x68\x32\x35\x30\x2e\x37\x63\
+\x31\x31\x2e\x31\x2c\x30\x2c\x32\x30\x2e\x31\x2c\x39\x2c\x32\x30\
+\x2e\x31\x2c\x32\x30\x2e\x31\x56\x33\x32\x31\x2e\x32\x7a\x22\x2f\
+\x3e\x0a\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x31\x35\
+\x37\x2e\x31\x22\x20\x63\x79\x3d\x22\x31\x36\x34\x2e\x32\x22\x20\
+\x72\x3d\x22\x33\x30\x2e\x34\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\
+\x3e\x0a\
+\x00\x00\x03\x97\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\
+\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x67\x20\
+\x69\x64\x3d\x22\x4f\x75\x74\x6c\x69\x6e\x65\x22\x3e\x0a\x09\x3c\
+\x67\x3e\x0a\x09\x09\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x34\
+\x37\x2e\x32\x2c\x38\x36\x2e\x39\x63\x2d\x31\x2e\x34\x2c\x30\x2d\
+\x32\x2e\x37\x2d\x30\x2e\x39\x2d\x33\x2e\x33\x2d\x32\x2e\x32\x6c\
+\x2d\x32\x35\x2d\x36\x30\x2e\x36\x63\x2d\x30\x2e\x36\x2d\x31\x2e\
+\x33\x2d\x30\x2e\x32\x2d\x32\x2e\x39\x2c\x30\x2e\x38\x2d\x33\x2e\
+\x39\x73\x32\x2e\x35\x2d\x31\x2e\x33\x2c\x33\x2e\x39\x2d\x30\x2e\
+\x38\x6c\x36\x30\x2e\x36\x2c\x32\x35\x63\x31\x2e\x34\x2c\x30\x2e\
+\x36\x2c\x32\x2e\x33\x2c\x32\x2c\x32\x2e\x32\x2c\x33\x2e\x36\x0a\
+\x09\x09\x09\x63\x2d\x30\x2e\x31\x2c\x31\x2e\x35\x2d\x31\x2e\x32\
+\x2c\x32\x2e\x38\x2d\x32\x2e\x37\x2c\x33\x2e\x32\x6c\x2d\x32\x36\
+\x2e\x34\x2c\x36\x2e\x36\x6c\x2d\x36\x2e\x36\x2c\x32\x36\x2e\x34\
+\x63\x2d\x30\x2e\x34\x2c\x31\x2e\x35\x2d\x31\x2e\x37\x2c\x32\x2e\
+\x36\x2d\x33\x2e\x32\x2c\x32\x2e\x37\x43\x34\x37\x2e\x33\x2c\x38\
+\x36\x2e\x39\x2c\x34\x37\x2e\x32\x2c\x38\x36\x2e\x39\x2c\x34\x37\
+\x2e\x32\x2c\x38\x36\x2e\x39\x7a\x20\x4d\x32\x38\x2e\x37\x2c\x32\
+\x39\x2e\x33\x4c\x34\x36\x2e\x33\x2c\x37\x32\x0a\x09\x09\x09\x6c\
+\x34\x2e\x35\x2d\x31\x38\x63\x30\x2e\x33\x2d\x31\x2e\x33\x2c\x31\
+\x2e\x33\x2d\x32\x2e\x33\x2c\x32\x2e\x36\x2d\x32\x2e\x36\x6c\x31\
+\x38\x2d\x34\x2e\x35\x4c\x32\x38\x2e\x37\x2c\x32\x39\x2e\x33\x7a\
+\x22\x2f\x3e\x0a\x09\x3c\x2f\x67\x3e\x0a\x3c\x2f\x67\x3e\x0a\x3c\
+\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x02\xa9\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x32\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x37\x37\x2e\x36\x20\x39\x34\x2e\x38\x22\x20\x73\x74\
+\x79\x6c\x65\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\
+\x67\x72\x6f\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\
+\x37\x37\x2e\x36\x20\x39\x34\x2e\x38\x3b\x22\x20\x78\x6d\x6c\x3a\
+\x73\x70\x61\x63\x65\x3d\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\
+\x3e\x3c\x73\x74\x79\x6c\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\
+\x78\x74\x2f\x63\x73\x73\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\
+\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\
+\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\
+\x3a\x20\x31\x3b\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\
+\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\
+\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\
+\x3a\x20\x31\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\
+\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\
+\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\
+\x20\x31\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\
+\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x6f\x6c\x79\
+\x67\x6f\x6e\x20\x70\x6f\x69\x6e\x74\x73\x3d\x22\x31\x37\x37\x2e\
+\x36\x2c\x34\x37\x2e\x34\x20\x31\x31\x39\x2e\x34\x2c\x30\x20\x31\
+\x31\x39\x2e\x34\x2c\x39\x34\x2e\x38\x20\x22\x2f\x3e\x0a\x3c\x72\
+\x65\x63\x74\x20\x78\x3d\x22\x30\x2e\x35\x22\x20\x79\x3d\x22\x33\
+\x31\x2e\x32\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x31\x39\x22\
+\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x33\x32\x2e\x34\x22\x2f\x3e\
+\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x01\xb1\
+\x3c\
+\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\x31\
+\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\x72\x5f\x31\x22\x20\x0a\
+\x20\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x0a\x20\x20\x20\x20\x78\x6d\x6c\x6e\
+\x73\x3a\x78\x6c\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\
+\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\
+\x78\x6c\x69\x6e\x6b\x22\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\
+\x30\x20\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x3e\x3c\x73\x74\
+\x79\x6c\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\
+\x73\x73\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\
+\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\
+\x6c\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\
+\x20\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\
+\x30\x2e\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\
+\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\
+\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\
+\x20\x30\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\
+\x6c\x3a\x20\x72\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\
+\x20\x31\x30\x33\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\
+\x30\x2e\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x20\
+\x20\x20\x20\x3c\x67\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x3c\
+\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x35\x30\x22\x20\x63\
+\x79\x3d\x22\x35\x30\x22\x20\x72\x3d\x22\x35\x30\x22\x2f\x3e\x0a\
+\x20\x20\x20\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\
+\x00\x00\x02\x71\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\
+\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x33\x2e\
+\x34\x22\x20\x79\x3d\x22\x34\x30\x2e\x36\x22\x20\x77\x69\x64\x74\
+\x68\x3d\x22\x39\x32\x2e\x39\x22\x20\x68\x65\x69\x67\x68\x74\x3d\
+\x22\x31\x38\x2e\x36\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\
+\x00\x00\x05\xd1\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x31\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\
+\x30\x37\x2c\x20\x31\x30\x35\x2c\x20\x31\x30\x33\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x67\x20\x69\x64\x3d\x22\x53\x6f\x6c\x69\
+\x64\x5f\x31\x5f\x22\x3e\x0a\x09\x3c\x70\x61\x74\x68\x20\x64\x3d\
+\x22\x4d\x37\x32\x2e\x39\x2c\x36\x31\x2e\x31\x56\x33\x37\x2e\x33\
+\x63\x33\x2e\x33\x2d\x31\x2e\x32\x2c\x35\x2e\x37\x2d\x34\x2e\x33\
+\x2c\x35\x2e\x37\x2d\x38\x63\x30\x2d\x34\x2e\x37\x2d\x33\x2e\x38\
+\x2d\x38\x2e\x35\x2d\x38\x2e\x35\x2d\x38\x2e\x35\x63\x2d\x33\x2e\
+\x37\x2c\x30\x2d\x36\x2e\x38\x2c\x32\x2e\x34\x2d\x38\x2c\x35\x2e\
+\x37\x48\x33\x38\x2e\x32\x63\x2d\x31\x2e\x32\x2d\x33\x2e\x33\x2d\
+\x34\x2e\x33\x2d\x35\x2e\x37\x2d\x38\x2d\x35\x2e\x37\x0a\x09\x09\
+\x63\x2d\x34\x2e\x37\x2c\x30\x2d\x38\x2e\x35\x2c\x33\x2e\x38\x2d\
+\x38\x2e\x35\x2c\x38\x2e\x35\x63\x30\x2c\x33\x2e\x37\x2c\x32\x2e\
+\x34\x2c\x36\x2e\x38\x2c\x35\x2e\x37\x2c\x38\x76\x32\x33\x2e\x38\
+\x63\x2d\x33\x2e\x33\x2c\x31\x2e\x32\x2d\x35\x2e\x37\x2c\x34\x2e\
+\x33\x2d\x35\x2e\x37\x2c\x38\x63\x30\x2c\x34\x2e\x37\x2c\x33\x2e\
+\x38\x2c\x38\x2e\x35\x2c\x38\x2e\x35\x2c\x38\x2e\x35\x63\x33\x2e\
+\x37\x2c\x30\x2c\x36\x2e\x38\x2d\x32\x2e\x34\x2c\x38\x2d\x35\x2e\
+\x37\x48\x36\x32\x0a\x09\x09\x63\x31\x2e\x32\x2c\x33\x2e\x33\x2c\
+\x34\x2e\x33\x2c\x35\x2e\x37\x2c\x38\x2c\x35\x2e\x37\x63\x34\x2e\
+\x37\x2c\x30\x2c\x38\x2e\x35\x2d\x33\x2e\x38\x2c\x38\x2e\x35\x2d\
+\x38\x2e\x35\x43\x37\x38\x2e\x36\x2c\x36\x35\x2e\x34\x2c\x37\x36\
+\x2e\x32\x2c\x36\x32\x2e\x32\x2c\x37\x32\x2e\x39\x2c\x36\x31\x2e\
+\x31\x7a\x20\x4d\x37\x30\x2e\x31\x2c\x32\x36\x2e\x34\x63\x31\x2e\
+\x36\x2c\x30\x2c\x32\x2e\x38\x2c\x31\x2e\x33\x2c\x32\x2e\x38\x2c\
+\x32\x2e\x38\x0a\x09\x09\x63\x30\x2c\x31\x2e\x36\x2d\x31\x2e\x33\
+\x2c\x32\x2e\x38\x2d\x32\x2e\x38\x2c\x32\x2e\x38\x63\x2d\x31\x2e\
+\x36\x2c\x30\x2d\x32\x2e\x38\x2d\x31\x2e\x33\x2d\x32\x2e\x38\x2d\
+\x32\x2e\x38\x43\x36\x37\x2e\x32\x2c\x32\x37\x2e\x37\x2c\x36\x38\
+\x2e\x35\x2c\x32\x36\x2e\x34\x2c\x37\x30\x2e\x31\x2c\x32\x36\x2e\
+\x34\x7a\x20\x4d\x33\x30\x2e\x32\x2c\x32\x36\x2e\x34\x63\x31\x2e\
+\x36\x2c\x30\x2c\x32\x2e\x38\x2c\x31\x2e\x33\x2c\x32\x2e\x38\x2c\
+\x32\x2e\x38\x0a\x09\x09\x63\x30\x2c\x31\x2e\x36\x2d\x31\x2e\x33\
+\x2c\x32\x2e\x38\x2d\x32\x2e\x38\x2c\x32\x2e\x38\x63\x2d\x31\x2e\
+\x36\x2c\x30\x2d\x32\x2e\x38\x2d\x31\x2e\x33\x2d\x32\x2e\x38\x2d\
+\x32\x2e\x38\x43\x32\x37\x2e\x34\x2c\x32\x37\x2e\x37\x2c\x32\x38\
+\x2e\x37\x2c\x32\x36\x2e\x34\x2c\x33\x30\x2e\x32\x2c\x32\x36\x2e\
+\x34\x7a\x20\x4d\x33\x30\x2e\x32\x2c\x37\x31\x2e\x39\x63\x2d\x31\
+\x2e\x36\x2c\x30\x2d\x32\x2e\x38\x2d\x31\x2e\x33\x2d\x32\x2e\x38\
+\x2d\x32\x2e\x38\x0a\x09\x09\x63\x30\x2d\x31\x2e\x36\x2c\x31\x2e\
+\x33\x2d\x32\x2e\x38\x2c\x32\x2e\x38\x2d\x32\x2e\x38\x63\x31\x2e\
+\x36\x2c\x30\x2c\x32\x2e\x38\x2c\x31\x2e\x33\x2c\x32\x2e\x38\x2c\
+\x32\x2e\x38\x43\x33\x33\x2e\x31\x2c\x37\x30\x2e\x36\x2c\x33\x31\
+\x2e\x38\x2c\x37\x31\x2e\x39\x2c\x33\x30\x2e\x32\x2c\x37\x31\x2e\
+\x39\x7a\x20\x4d\x36\x32\x2e\x31\x2c\x36\x36\x2e\x32\x48\x33\x38\
+\x2e\x32\x63\x2d\x30\x2e\x39\x2d\x32\x2e\x34\x2d\x32\x2e\x38\x2d\
+\x34\x2e\x33\x2d\x35\x2e\x32\x2d\x35\x2e\x32\x56\x33\x37\x2e\x33\
+\x0a\x09\x09\x63\x32\x2e\x34\x2d\x30\x2e\x39\x2c\x34\x2e\x33\x2d\
+\x32\x2e\x38\x2c\x35\x2e\x32\x2d\x35\x2e\x32\x48\x36\x32\x63\x30\
+\x2e\x39\x2c\x32\x2e\x34\x2c\x32\x2e\x38\x2c\x34\x2e\x33\x2c\x35\
+\x2e\x32\x2c\x35\x2e\x32\x76\x32\x33\x2e\x38\x43\x36\x34\x2e\x38\
+\x2c\x36\x31\x2e\x39\x2c\x36\x32\x2e\x39\x2c\x36\x33\x2e\x38\x2c\
+\x36\x32\x2e\x31\x2c\x36\x36\x2e\x32\x7a\x20\x4d\x37\x30\x2e\x31\
+\x2c\x37\x31\x2e\x39\x63\x2d\x31\x2e\x36\x2c\x30\x2d\x32\x2e\x38\
+\x2d\x31\x2e\x33\x2d\x32\x2e\x38\x2d\x32\x2e\x38\x0a\x09\x09\x63\
+\x30\x2d\x31\x2e\x36\x2c\x31\x2e\x33\x2d\x32\x2e\x38\x2c\x32\x2e\
+\x38\x2d\x32\x2e\x38\x63\x31\x2e\x36\x2c\x30\x2c\x32\x2e\x38\x2c\
+\x31\x2e\x33\x2c\x32\x2e\x38\x2c\x32\x2e\x38\x53\x37\x31\x2e\x36\
+\x2c\x37\x31\x2e\x39\x2c\x37\x30\x2e\x31\x2c\x37\x31\x2e\x39\x7a\
+\x22\x2f\x3e\x0a\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\
+\x00\x00\x01\xc4\
+\x3c\
+\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\x31\
+\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\x72\x5f\x31\x22\x20\x0a\
+\x20\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x0a\x20\x20\x20\x20\x78\x6d\x6c\x6e\
+\x73\x3a\x78\x6c\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\
+\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\
+\x78\x6c\x69\x6e\x6b\x22\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\
+\x30\x20\x30\x20\x31\x32\x20\x31\x36\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\
+\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x20\x20\x20\
+\x20\x3c\x67\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x31\x32\x20\x35\x6c\x2d\x38\x20\x38\
+\x2d\x34\x2d\x34\x20\x31\x2e\x35\x2d\x31\x2e\x35\x4c\x34\x20\x31\
+\x30\x6c\x36\x2e\x35\x2d\x36\x2e\x35\x4c\x31\x32\x20\x35\x7a\x22\
+\x2f\x3e\x0a\x20\x20\x20\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\
+\x67\x3e\x0a\
+\x00\x00\x02\x9e\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x38\
+\x30\x2e\x36\x32\x6d\x6d\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\
+\x31\x38\x30\x2e\x36\x32\x6d\x6d\x22\x20\x76\x69\x65\x77\x42\x6f\
+\x78\x3d\x22\x30\x20\x30\x20\x35\x31\x32\x20\x35\x31\x32\x22\x3e\
+\x3c\x73\x74\x79\x6c\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\
+\x74\x2f\x63\x73\x73\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\
+\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\
+\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\
+\x20\x31\x3b\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\
+\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\
+\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\
+\x20\x31\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\
+\x6c\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\
+\x20\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\
+\x31\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\
+\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\
+\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\
+\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x20\x20\x3c\x74\x69\x74\
+\x6c\x65\x3e\x41\x72\x74\x62\x6f\x61\x72\x64\x20\x31\x3c\x2f\x74\
+\x69\x74\x6c\x65\x3e\x0a\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\
+\x22\x4d\x34\x32\x34\x2e\x39\x34\x2c\x32\x37\x31\x2e\x33\x36\x61\
+\x33\x35\x2e\x33\x34\x2c\x33\x35\x2e\x33\x34\x2c\x30\x2c\x30\x2c\
+\x30\x2c\x30\x2d\x35\x30\x4c\x33\x30\x37\x2e\x31\x35\x2c\x31\x30\
+\x33\x2e\x36\x61\x33\x35\x2e\x33\x32\x2c\x33\x35\x2e\x33\x32\x2c\
+\x30\x2c\x30\x2c\x30\x2d\x35\x30\x2c\x30\x4c\x36\x38\x2e\x37\x32\
+\x2c\x32\x39\x32\x2e\x30\x36\x61\x33\x35\x2e\x33\x33\x2c\x33\x35\
+\x2e\x33\x33\x2c\x30\x2c\x30\x2c\x30\x2c\x30\x2c\x35\x30\x6c\x37\
+\x30\x2e\x36\x37\x2c\x37\x30\x2e\x36\x37\x61\x33\x35\x2e\x33\x34\
+\x2c\x33\x35\x2e\x33\x34\x2c\x30\x2c\x30\x2c\x30\x2c\x32\x35\x2c\
+\x31\x30\x2e\x33\x35\x48\x34\x32\x36\x2e\x34\x36\x61\x38\x2e\x38\
+\x33\x2c\x38\x2e\x38\x33\x2c\x30\x2c\x30\x2c\x30\x2c\x38\x2e\x38\
+\x33\x2d\x38\x2e\x38\x33\x56\x33\x39\x38\x2e\x31\x37\x63\x30\x2d\
+\x34\x2e\x38\x38\x2d\x34\x2d\x35\x2e\x38\x39\x2d\x38\x2e\x38\x33\
+\x2d\x35\x2e\x38\x39\x48\x33\x30\x32\x2e\x36\x39\x4c\x34\x32\x34\
+\x2e\x39\x34\x2c\x32\x37\x31\x2e\x33\x36\x5a\x4d\x32\x30\x35\x2e\
+\x31\x2c\x31\x39\x38\x2e\x37\x35\x2c\x33\x32\x37\x2e\x32\x39\x2c\
+\x33\x32\x33\x2e\x38\x31\x6c\x2d\x36\x38\x2e\x34\x37\x2c\x36\x38\
+\x2e\x34\x37\x48\x31\x35\x39\x2e\x36\x39\x4c\x38\x39\x2c\x33\x31\
+\x34\x2e\x38\x33\x2c\x32\x30\x35\x2e\x31\x2c\x31\x39\x38\x2e\x37\
+\x35\x5a\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x03\x7b\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\
+\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x35\
+\x30\x2e\x35\x2c\x37\x37\x2e\x33\x43\x32\x36\x2e\x37\x2c\x37\x37\
+\x2e\x33\x2c\x38\x2e\x31\x2c\x35\x32\x2e\x31\x2c\x37\x2e\x33\x2c\
+\x35\x31\x4c\x36\x2c\x34\x39\x2e\x32\x6c\x31\x2e\x33\x2d\x31\x2e\
+\x38\x43\x38\x2e\x31\x2c\x34\x36\x2e\x33\x2c\x32\x36\x2e\x37\x2c\
+\x32\x31\x2c\x35\x30\x2e\x35\x2c\x32\x31\x73\x34\x32\x2e\x34\x2c\
+\x32\x35\x2e\x33\x2c\x34\x33\x2e\x32\x2c\x32\x36\x2e\x33\x6c\x31\
+\x2e\x33\x2c\x31\x2e\x38\x4c\x39\x33\x2e\x37\x2c\x35\x31\x0a\x09\
+\x43\x39\x32\x2e\x39\x2c\x35\x32\x2e\x31\x2c\x37\x34\x2e\x33\x2c\
+\x37\x37\x2e\x33\x2c\x35\x30\x2e\x35\x2c\x37\x37\x2e\x33\x7a\x20\
+\x4d\x31\x33\x2e\x38\x2c\x34\x39\x2e\x32\x63\x34\x2e\x36\x2c\x35\
+\x2e\x36\x2c\x31\x39\x2e\x35\x2c\x32\x31\x2e\x39\x2c\x33\x36\x2e\
+\x37\x2c\x32\x31\x2e\x39\x73\x33\x32\x2e\x31\x2d\x31\x36\x2e\x34\
+\x2c\x33\x36\x2e\x37\x2d\x32\x31\x2e\x39\x63\x2d\x34\x2e\x36\x2d\
+\x35\x2e\x36\x2d\x31\x39\x2e\x35\x2d\x32\x31\x2e\x39\x2d\x33\x36\
+\x2e\x37\x2d\x32\x31\x2e\x39\x0a\x09\x43\x33\x33\x2e\x33\x2c\x32\
+\x37\x2e\x32\x2c\x31\x38\x2e\x34\x2c\x34\x33\x2e\x36\x2c\x31\x33\
+\x2e\x38\x2c\x34\x39\x2e\x32\x7a\x22\x2f\x3e\x0a\x3c\x63\x69\x72\
+\x63\x6c\x65\x20\x63\x78\x3d\x22\x35\x30\x2e\x35\x22\x20\x63\x79\
+\x3d\x22\x34\x39\x2e\x32\x22\x20\x72\x3d\x22\x31\x37\x2e\x33\x22\
+\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x02\xb8\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\
+\x30\x20\x30\x20\x35\x31\x32\x20\x35\x31\x32\x22\x3e\x3c\x73\x74\
+\x79\x6c\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\
+\x73\x73\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\
+\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\
+\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\
+\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\
+\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\
+\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\
+\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\
+\x73\x74\x79\x6c\x65\x3e\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\
+\x32\x35\x36\x20\x38\x43\x31\x31\x39\x2e\x30\x34\x33\x20\x38\x20\
+\x38\x20\x31\x31\x39\x2e\x30\x38\x33\x20\x38\x20\x32\x35\x36\x63\
+\x30\x20\x31\x33\x36\x2e\x39\x39\x37\x20\x31\x31\x31\x2e\x30\x34\
+\x33\x20\x32\x34\x38\x20\x32\x34\x38\x20\x32\x34\x38\x73\x32\x34\
+\x38\x2d\x31\x31\x31\x2e\x30\x30\x33\x20\x32\x34\x38\x2d\x32\x34\
+\x38\x43\x35\x30\x34\x20\x31\x31\x39\x2e\x30\x38\x33\x20\x33\x39\
+\x32\x2e\x39\x35\x37\x20\x38\x20\x32\x35\x36\x20\x38\x7a\x6d\x30\
+\x20\x31\x31\x30\x63\x32\x33\x2e\x31\x39\x36\x20\x30\x20\x34\x32\
+\x20\x31\x38\x2e\x38\x30\x34\x20\x34\x32\x20\x34\x32\x73\x2d\x31\
+\x38\x2e\x38\x30\x34\x20\x34\x32\x2d\x34\x32\x20\x34\x32\x2d\x34\
+\x32\x2d\x31\x38\x2e\x38\x30\x34\x2d\x34\x32\x2d\x34\x32\x20\x31\
+\x38\x2e\x38\x30\x34\x2d\x34\x32\x20\x34\x32\x2d\x34\x32\x7a\x6d\
+\x35\x36\x20\x32\x35\x34\x63\x30\x20\x36\x2e\x36\x32\x37\x2d\x35\
+\x2e\x33\x37\x33\x20\x31\x32\x2d\x31\x32\x20\x31\x32\x68\x2d\x38\
+\x38\x63\x2d\x36\x2e\x36\x32\x37\x20\x30\x2d\x31\x32\x2d\x35\x2e\
+\x33\x37\x33\x2d\x31\x32\x2d\x31\x32\x76\x2d\x32\x34\x63\x30\x2d\
+\x36\x2e\x36\x32\x37\x20\x35\x2e\x33\x37\x33\x2d\x31\x32\x20\x31\
+\x32\x2d\x31\x32\x68\x31\x32\x76\x2d\x36\x34\x68\x2d\x31\x32\x63\
+\x2d\x36\x2e\x36\x32\x37\x20\x30\x2d\x31\x32\x2d\x35\x2e\x33\x37\
+\x33\x2d\x31\x32\x2d\x31\x32\x76\x2d\x32\x34\x63\x30\x2d\x36\x2e\
+\x36\x32\x37\x20\x35\x2e\x33\x37\x33\x2d\x31\x32\x20\x31\x32\x2d\
+\x31\x32\x68\x36\x34\x63\x36\x2e\x36\x32\x37\x20\x30\x20\x31\x32\
+\x20\x35\x2e\x33\x37\x33\x20\x31\x32\x20\x31\x32\x76\x31\x30\x30\
+\x68\x31\x32\x63\x36\x2e\x36\x32\x37\x20\x30\x20\x31\x32\x20\x35\
+\x2e\x33\x37\x33\x20\x31\x32\x20\x31\x32\x76\x32\x34\x7a\x22\x2f\
+\x3e\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x02\xe9\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\
+\x30\x20\x30\x20\x35\x37\x36\x20\x35\x31\x32\x22\x3e\x3c\x73\x74\
+\x79\x6c\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\
+\x73\x73\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x35\x33\x2c\x20\x31\x38\x2c\x20\x33\x31\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x35\x33\x2c\x20\x31\x38\x2c\x20\x33\x31\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\
+\x72\x67\x62\x28\x31\x35\x33\x2c\x20\x31\x38\x2c\x20\x33\x31\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\x7d\
+\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\
+\x28\x31\x35\x33\x2c\x20\x31\x38\x2c\x20\x33\x31\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\x7d\x0a\x3c\x2f\
+\x73\x74\x79\x6c\x65\x3e\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\
+\x35\x36\x39\x2e\x35\x31\x37\x20\x34\x34\x30\x2e\x30\x31\x33\x43\
+\x35\x38\x37\x2e\x39\x37\x35\x20\x34\x37\x32\x2e\x30\x30\x37\x20\
+\x35\x36\x34\x2e\x38\x30\x36\x20\x35\x31\x32\x20\x35\x32\x37\x2e\
+\x39\x34\x20\x35\x31\x32\x48\x34\x38\x2e\x30\x35\x34\x63\x2d\x33\
+\x36\x2e\x39\x33\x37\x20\x30\x2d\x35\x39\x2e\x39\x39\x39\x2d\x34\
+\x30\x2e\x30\x35\x35\x2d\x34\x31\x2e\x35\x37\x37\x2d\x37\x31\x2e\
+\x39\x38\x37\x4c\x32\x34\x36\x2e\x34\x32\x33\x20\x32\x33\x2e\x39\
+\x38\x35\x63\x31\x38\x2e\x34\x36\x37\x2d\x33\x32\x2e\x30\x30\x39\
+\x20\x36\x34\x2e\x37\x32\x2d\x33\x31\x2e\x39\x35\x31\x20\x38\x33\
+\x2e\x31\x35\x34\x20\x30\x6c\x32\x33\x39\x2e\x39\x34\x20\x34\x31\
+\x36\x2e\x30\x32\x38\x7a\x4d\x32\x38\x38\x20\x33\x35\x34\x63\x2d\
+\x32\x35\x2e\x34\x30\x35\x20\x30\x2d\x34\x36\x20\x32\x30\x2e\x35\
+\x39\x35\x2d\x34\x36\x20\x34\x36\x73\x32\x30\x2e\x35\x39\x35\x20\
+\x34\x36\x20\x34\x36\x20\x34\x36\x20\x34\x36\x2d\x32\x30\x2e\x35\
+\x39\x35\x20\x34\x36\x2d\x34\x36\x2d\x32\x30\x2e\x35\x39\x35\x2d\
+\x34\x36\x2d\x34\x36\x2d\x34\x36\x7a\x6d\x2d\x34\x33\x2e\x36\x37\
+\x33\x2d\x31\x36\x35\x2e\x33\x34\x36\x6c\x37\x2e\x34\x31\x38\x20\
+\x31\x33\x36\x63\x2e\x33\x34\x37\x20\x36\x2e\x33\x36\x34\x20\x35\
+\x2e\x36\x30\x39\x20\x31\x31\x2e\x33\x34\x36\x20\x31\x31\x2e\x39\
+\x38\x32\x20\x31\x31\x2e\x33\x34\x36\x68\x34\x38\x2e\x35\x34\x36\
+\x63\x36\x2e\x33\x37\x33\x20\x30\x20\x31\x31\x2e\x36\x33\x35\x2d\
+\x34\x2e\x39\x38\x32\x20\x31\x31\x2e\x39\x38\x32\x2d\x31\x31\x2e\
+\x33\x34\x36\x6c\x37\x2e\x34\x31\x38\x2d\x31\x33\x36\x63\x2e\x33\
+\x37\x35\x2d\x36\x2e\x38\x37\x34\x2d\x35\x2e\x30\x39\x38\x2d\x31\
+\x32\x2e\x36\x35\x34\x2d\x31\x31\x2e\x39\x38\x32\x2d\x31\x32\x2e\
+\x36\x35\x34\x68\x2d\x36\x33\x2e\x33\x38\x33\x63\x2d\x36\x2e\x38\
+\x38\x34\x20\x30\x2d\x31\x32\x2e\x33\x35\x36\x20\x35\x2e\x37\x38\
+\x2d\x31\x31\x2e\x39\x38\x31\x20\x31\x32\x2e\x36\x35\x34\x7a\x22\
+\x2f\x3e\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x03\x2c\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\
+\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x72\x65\
+\x63\x74\x20\x78\x3d\x22\x34\x35\x22\x20\x79\x3d\x22\x32\x31\x2e\
+\x33\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\
+\x74\x72\x69\x78\x28\x30\x2e\x37\x31\x31\x32\x20\x2d\x30\x2e\x37\
+\x30\x32\x39\x20\x30\x2e\x37\x30\x32\x39\x20\x30\x2e\x37\x31\x31\
+\x32\x20\x2d\x32\x31\x2e\x36\x37\x39\x31\x20\x35\x30\x2e\x30\x32\
+\x34\x29\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x30\x22\x20\x68\
+\x65\x69\x67\x68\x74\x3d\x22\x36\x30\x2e\x32\x22\x2f\x3e\x0a\x3c\
+\x72\x65\x63\x74\x20\x78\x3d\x22\x31\x39\x2e\x39\x22\x20\x79\x3d\
+\x22\x34\x36\x2e\x34\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\
+\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\x30\x2e\x37\x31\x31\x33\x20\
+\x2d\x30\x2e\x37\x30\x32\x39\x20\x30\x2e\x37\x30\x32\x39\x20\x30\
+\x2e\x37\x31\x31\x33\x20\x2d\x32\x31\x2e\x37\x32\x38\x34\x20\x34\
+\x39\x2e\x39\x39\x38\x38\x29\x22\x20\x77\x69\x64\x74\x68\x3d\x22\
+\x36\x30\x2e\x32\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x30\
+\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x01\xa9\
+\x3c\
+\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\x31\
+\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\x72\x5f\x31\x22\x20\x0a\
+\x20\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x0a\x20\x20\x20\x20\x78\x6d\x6c\x6e\
+\x73\x3a\x78\x6c\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\
+\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\
+\x78\x6c\x69\x6e\x6b\x22\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\
+\x30\x20\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x3e\x3c\x73\x74\
+\x79\x6c\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\
+\x73\x73\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\
+\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\
+\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\
+\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\
+\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\
+\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\
+\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\
+\x73\x74\x79\x6c\x65\x3e\x0a\x20\x20\x20\x20\x3c\x67\x3e\x0a\x20\
+\x20\x20\x20\x20\x20\x20\x20\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\
+\x78\x3d\x22\x35\x30\x22\x20\x63\x79\x3d\x22\x35\x30\x22\x20\x72\
+\x3d\x22\x35\x30\x22\x2f\x3e\x0a\x20\x20\x20\x20\x3c\x2f\x67\x3e\
+\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x03\x83\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x36\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\
+\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x67\x3e\
+\x0a\x09\x3c\x67\x20\x69\x64\x3d\x22\x72\x65\x70\x6c\x79\x22\x3e\
+\x0a\x09\x09\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x36\x38\x2e\
+\x38\x2c\x31\x35\x2e\x37\x6c\x33\x2e\x34\x2d\x38\x2e\x38\x6c\x2d\
+\x32\x31\x2e\x34\x2c\x39\x2e\x36\x6c\x39\x2e\x36\x2c\x32\x31\x2e\
+\x34\x6c\x33\x2e\x35\x2d\x39\x2e\x31\x63\x31\x31\x2e\x31\x2c\x34\
+\x2e\x32\x2c\x31\x37\x2e\x34\x2c\x31\x30\x2e\x37\x2c\x32\x30\x2c\
+\x32\x30\x2e\x36\x43\x38\x35\x2e\x39\x2c\x33\x37\x2e\x34\x2c\x38\
+\x33\x2e\x35\x2c\x32\x33\x2e\x38\x2c\x36\x38\x2e\x38\x2c\x31\x35\
+\x2e\x37\x7a\x22\x2f\x3e\x0a\x09\x3c\x2f\x67\x3e\x0a\x3c\x2f\x67\
+\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x35\x32\x2c\x39\
+\x31\x2e\x39\x48\x31\x37\x2e\x35\x63\x2d\x34\x2e\x39\x2c\x30\x2d\
+\x38\x2e\x37\x2d\x33\x2e\x38\x2d\x38\x2e\x37\x2d\x38\x2e\x37\x56\
+\x34\x38\x2e\x36\x63\x30\x2d\x34\x2e\x39\x2c\x33\x2e\x38\x2d\x38\
+\x2e\x37\x2c\x38\x2e\x37\x2d\x38\x2e\x37\x68\x33\x34\x2e\x34\x63\
+\x34\x2e\x39\x2c\x30\x2c\x38\x2e\x37\x2c\x33\x2e\x38\x2c\x38\x2e\
+\x37\x2c\x38\x2e\x37\x76\x33\x34\x2e\x34\x0a\x09\x43\x36\x30\x2e\
+\x37\x2c\x38\x38\x2c\x35\x36\x2e\x39\x2c\x39\x31\x2e\x39\x2c\x35\
+\x32\x2c\x39\x31\x2e\x39\x7a\x20\x4d\x31\x39\x2e\x33\x2c\x38\x31\
+\x2e\x33\x68\x33\x30\x2e\x39\x56\x35\x30\x2e\x34\x48\x31\x39\x2e\
+\x33\x56\x38\x31\x2e\x33\x7a\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\
+\x3e\x0a\
+\x00\x00\x03\x7b\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x36\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\
+\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x67\x3e\x0a\x09\x3c\x67\x20\x69\x64\x3d\
+\x22\x72\x65\x70\x6c\x79\x22\x3e\x0a\x09\x09\x3c\x70\x61\x74\x68\
+\x20\x64\x3d\x22\x4d\x36\x38\x2e\x38\x2c\x31\x35\x2e\x37\x6c\x33\
+\x2e\x34\x2d\x38\x2e\x38\x6c\x2d\x32\x31\x2e\x34\x2c\x39\x2e\x36\
+\x6c\x39\x2e\x36\x2c\x32\x31\x2e\x34\x6c\x33\x2e\x35\x2d\x39\x2e\
+\x31\x63\x31\x31\x2e\x31\x2c\x34\x2e\x32\x2c\x31\x37\x2e\x34\x2c\
+\x31\x30\x2e\x37\x2c\x32\x30\x2c\x32\x30\x2e\x36\x43\x38\x35\x2e\
+\x39\x2c\x33\x37\x2e\x34\x2c\x38\x33\x2e\x35\x2c\x32\x33\x2e\x38\
+\x2c\x36\x38\x2e\x38\x2c\x31\x35\x2e\x37\x7a\x22\x2f\x3e\x0a\x09\
+\x3c\x2f\x67\x3e\x0a\x3c\x2f\x67\x3e\x0a\x3c\x70\x61\x74\x68\x20\
+\x64\x3d\x22\x4d\x35\x32\x2c\x39\x31\x2e\x39\x48\x31\x37\x2e\x35\
+\x63\x2d\x34\x2e\x39\x2c\x30\x2d\x38\x2e\x37\x2d\x33\x2e\x38\x2d\
+\x38\x2e\x37\x2d\x38\x2e\x37\x56\x34\x38\x2e\x36\x63\x30\x2d\x34\
+\x2e\x39\x2c\x33\x2e\x38\x2d\x38\x2e\x37\x2c\x38\x2e\x37\x2d\x38\
+\x2e\x37\x68\x33\x34\x2e\x34\x63\x34\x2e\x39\x2c\x30\x2c\x38\x2e\
+\x37\x2c\x33\x2e\x38\x2c\x38\x2e\x37\x2c\x38\x2e\x37\x76\x33\x34\
+\x2e\x34\x0a\x09\x43\x36\x30\x2e\x37\x2c\x38\x38\x2c\x35\x36\x2e\
+\x39\x2c\x39\x31\x2e\x39\x2c\x35\x32\x2c\x39\x31\x2e\x39\x7a\x20\
+\x4d\x31\x39\x2e\x33\x2c\x38\x31\x2e\x33\x68\x33\x30\x2e\x39\x56\
+\x35\x30\x2e\x34\x48\x31\x39\x2e\x33\x56\x38\x31\x2e\x33\x7a\x22\
+\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x02\xe9\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x32\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x37\x37\x2e\x36\x20\x39\x34\x2e\x38\x22\x20\x73\x74\
+\x79\x6c\x65\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\
+\x67\x72\x6f\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\
+\x37\x37\x2e\x36\x20\x39\x34\x2e\x38\x3b\x22\x20\x78\x6d\x6c\x3a\
+\x73\x70\x61\x63\x65\x3d\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\
+\x3e\x3c\x73\x74\x79\x6c\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\
+\x78\x74\x2f\x63\x73\x73\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\
+\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\
+\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\
+\x3a\x20\x31\x3b\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\
+\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\
+\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\
+\x3a\x20\x31\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\
+\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\
+\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\
+\x20\x31\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\
+\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x6f\x6c\x79\
+\x67\x6f\x6e\x20\x70\x6f\x69\x6e\x74\x73\x3d\x22\x30\x2e\x35\x2c\
+\x34\x37\x2e\x34\x20\x35\x38\x2e\x37\x2c\x39\x34\x2e\x38\x20\x35\
+\x38\x2e\x37\x2c\x30\x20\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\
+\x78\x3d\x22\x35\x38\x2e\x36\x22\x20\x79\x3d\x22\x33\x31\x2e\x32\
+\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\x74\
+\x72\x69\x78\x28\x2d\x31\x20\x2d\x31\x2e\x32\x32\x34\x36\x34\x37\
+\x65\x2d\x31\x36\x20\x31\x2e\x32\x32\x34\x36\x34\x37\x65\x2d\x31\
+\x36\x20\x2d\x31\x20\x32\x33\x36\x2e\x31\x36\x38\x37\x20\x39\x34\
+\x2e\x38\x29\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x31\x39\x22\
+\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x33\x32\x2e\x34\x22\x2f\x3e\
+\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x03\x8b\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x32\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\
+\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x35\x31\x2e\x34\x2c\x32\x37\x2e\x39\
+\x63\x31\x2e\x39\x2c\x30\x2c\x33\x2e\x38\x2c\x30\x2e\x38\x2c\x35\
+\x2c\x32\x2e\x34\x6c\x32\x38\x2e\x32\x2c\x33\x35\x2e\x31\x63\x32\
+\x2e\x32\x2c\x32\x2e\x38\x2c\x31\x2e\x38\x2c\x36\x2e\x39\x2d\x31\
+\x2c\x39\x2e\x31\x63\x2d\x32\x2e\x38\x2c\x32\x2e\x32\x2d\x36\x2e\
+\x39\x2c\x31\x2e\x38\x2d\x39\x2e\x31\x2d\x31\x4c\x34\x36\x2e\x33\
+\x2c\x33\x38\x2e\x34\x63\x2d\x32\x2e\x32\x2d\x32\x2e\x38\x2d\x31\
+\x2e\x38\x2d\x36\x2e\x39\x2c\x31\x2d\x39\x2e\x31\x0a\x09\x43\x34\
+\x38\x2e\x35\x2c\x32\x38\x2e\x33\x2c\x35\x30\x2c\x32\x37\x2e\x39\
+\x2c\x35\x31\x2e\x34\x2c\x32\x37\x2e\x39\x7a\x22\x2f\x3e\x0a\x3c\
+\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x35\x31\x2e\x34\x2c\x32\x37\
+\x2e\x39\x63\x31\x2e\x34\x2c\x30\x2c\x32\x2e\x39\x2c\x30\x2e\x35\
+\x2c\x34\x2c\x31\x2e\x34\x63\x32\x2e\x38\x2c\x32\x2e\x32\x2c\x33\
+\x2e\x32\x2c\x36\x2e\x33\x2c\x31\x2c\x39\x2e\x31\x4c\x32\x38\x2e\
+\x32\x2c\x37\x33\x2e\x35\x63\x2d\x32\x2e\x32\x2c\x32\x2e\x38\x2d\
+\x36\x2e\x33\x2c\x33\x2e\x32\x2d\x39\x2e\x31\x2c\x31\x63\x2d\x32\
+\x2e\x38\x2d\x32\x2e\x32\x2d\x33\x2e\x32\x2d\x36\x2e\x33\x2d\x31\
+\x2d\x39\x2e\x31\x6c\x32\x38\x2e\x32\x2d\x33\x35\x2e\x31\x0a\x09\
+\x43\x34\x37\x2e\x36\x2c\x32\x38\x2e\x37\x2c\x34\x39\x2e\x35\x2c\
+\x32\x37\x2e\x39\x2c\x35\x31\x2e\x34\x2c\x32\x37\x2e\x39\x7a\x22\
+\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x02\xfd\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x36\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\
+\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x37\x34\x2e\x37\x2c\x38\x36\x2e\x39\
+\x48\x32\x36\x2e\x34\x63\x2d\x36\x2e\x39\x2c\x30\x2d\x31\x32\x2e\
+\x32\x2d\x35\x2e\x34\x2d\x31\x32\x2e\x32\x2d\x31\x32\x2e\x32\x56\
+\x32\x36\x2e\x34\x63\x30\x2d\x36\x2e\x39\x2c\x35\x2e\x34\x2d\x31\
+\x32\x2e\x32\x2c\x31\x32\x2e\x32\x2d\x31\x32\x2e\x32\x68\x34\x38\
+\x2e\x31\x63\x36\x2e\x39\x2c\x30\x2c\x31\x32\x2e\x32\x2c\x35\x2e\
+\x34\x2c\x31\x32\x2e\x32\x2c\x31\x32\x2e\x32\x76\x34\x38\x2e\x31\
+\x0a\x09\x43\x38\x36\x2e\x39\x2c\x38\x31\x2e\x35\x2c\x38\x31\x2e\
+\x35\x2c\x38\x36\x2e\x39\x2c\x37\x34\x2e\x37\x2c\x38\x36\x2e\x39\
+\x7a\x20\x4d\x32\x38\x2e\x39\x2c\x37\x32\x2e\x31\x68\x34\x33\x2e\
+\x32\x56\x32\x38\x2e\x39\x48\x32\x38\x2e\x39\x56\x37\x32\x2e\x31\
+\x7a\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x01\xbc\
+\x3c\
+\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\x31\
+\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\x72\x5f\x31\x22\x20\x0a\
+\x20\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x0a\x20\x20\x20\x20\x78\x6d\x6c\x6e\
+\x73\x3a\x78\x6c\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\
+\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\
+\x78\x6c\x69\x6e\x6b\x22\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\
+\x30\x20\x30\x20\x31\x32\x20\x31\x36\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\
+\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x20\x20\x20\x20\x3c\x67\x3e\x0a\x20\x20\x20\
+\x20\x20\x20\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\
+\x32\x20\x35\x6c\x2d\x38\x20\x38\x2d\x34\x2d\x34\x20\x31\x2e\x35\
+\x2d\x31\x2e\x35\x4c\x34\x20\x31\x30\x6c\x36\x2e\x35\x2d\x36\x2e\
+\x35\x4c\x31\x32\x20\x35\x7a\x22\x2f\x3e\x0a\x20\x20\x20\x20\x3c\
+\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x08\x0f\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x36\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x32\x30\x30\x20\x32\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x32\x30\x30\x20\
+\x32\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x33\x38\x2c\x20\x34\x31\x2c\x20\x34\x38\x29\x3b\x20\
+\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x70\x6f\x6c\
+\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\
+\x33\x38\x2c\x20\x34\x31\x2c\x20\x34\x38\x29\x3b\x20\x6f\x70\x61\
+\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\
+\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x33\x38\x2c\x20\
+\x34\x31\x2c\x20\x34\x38\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\
+\x3a\x20\x31\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x33\x38\x2c\x20\x34\x31\x2c\x20\x34\x38\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\
+\x3d\x22\x6d\x20\x30\x2c\x30\x20\x63\x20\x2d\x31\x2e\x32\x30\x33\
+\x30\x37\x38\x35\x2c\x36\x33\x2e\x31\x31\x35\x32\x32\x33\x20\x30\
+\x2c\x32\x30\x30\x20\x30\x2c\x32\x30\x30\x20\x7a\x20\x6d\x20\x36\
+\x37\x2e\x32\x30\x38\x39\x38\x34\x2c\x32\x38\x2e\x36\x36\x34\x30\
+\x36\x32\x20\x63\x20\x2d\x32\x2e\x39\x34\x30\x36\x2c\x30\x2e\x30\
+\x32\x37\x32\x20\x2d\x36\x2e\x31\x38\x37\x38\x37\x31\x2c\x30\x2e\
+\x32\x36\x38\x32\x31\x37\x20\x2d\x37\x2e\x36\x30\x37\x34\x32\x32\
+\x2c\x30\x2e\x36\x34\x32\x35\x37\x39\x20\x2d\x38\x2e\x31\x38\x38\
+\x37\x37\x37\x2c\x32\x2e\x31\x35\x39\x35\x33\x31\x20\x2d\x31\x37\
+\x2e\x37\x39\x39\x38\x39\x36\x2c\x31\x30\x2e\x32\x39\x30\x36\x32\
+\x34\x20\x2d\x32\x32\x2e\x32\x30\x31\x31\x37\x31\x2c\x31\x38\x2e\
+\x37\x38\x31\x32\x35\x20\x2d\x32\x2e\x35\x30\x39\x31\x32\x31\x2c\
+\x34\x2e\x38\x34\x30\x34\x31\x38\x20\x2d\x35\x2e\x33\x37\x36\x33\
+\x33\x36\x2c\x31\x32\x2e\x38\x34\x37\x39\x34\x37\x20\x2d\x36\x2e\
+\x34\x39\x34\x31\x34\x31\x2c\x31\x38\x2e\x31\x34\x32\x35\x37\x38\
+\x20\x2d\x30\x2e\x35\x32\x30\x36\x34\x38\x2c\x32\x2e\x34\x36\x36\
+\x31\x33\x20\x2d\x30\x2e\x36\x31\x32\x34\x31\x33\x2c\x33\x2e\x34\
+\x38\x37\x38\x36\x33\x20\x2d\x30\x2e\x36\x31\x39\x31\x34\x31\x2c\
+\x36\x2e\x38\x34\x31\x37\x39\x37\x20\x2d\x30\x2e\x30\x30\x36\x38\
+\x2c\x33\x2e\x33\x31\x30\x38\x35\x31\x20\x30\x2e\x30\x37\x32\x39\
+\x39\x2c\x34\x2e\x32\x37\x31\x31\x38\x38\x20\x30\x2e\x35\x30\x31\
+\x39\x35\x33\x2c\x35\x2e\x39\x38\x30\x34\x36\x38\x20\x31\x2e\x35\
+\x38\x34\x36\x33\x2c\x36\x2e\x33\x31\x34\x32\x32\x33\x20\x35\x2e\
+\x32\x31\x35\x38\x33\x31\x2c\x31\x31\x2e\x38\x31\x36\x39\x34\x37\
+\x20\x31\x31\x2e\x37\x33\x30\x34\x36\x39\x2c\x31\x37\x2e\x37\x37\
+\x35\x33\x39\x31\x20\x31\x2e\x31\x37\x31\x37\x39\x34\x2c\x31\x2e\
+\x30\x37\x31\x37\x34\x39\x20\x34\x2e\x33\x32\x32\x37\x31\x34\x2c\
+\x33\x2e\x37\x38\x35\x37\x30\x35\x20\x37\x2e\x30\x30\x31\x39\x35\
+\x33\x2c\x36\x2e\x30\x33\x31\x32\x35\x35\x20\x39\x2e\x35\x32\x39\
+\x30\x31\x33\x2c\x37\x2e\x39\x38\x36\x35\x20\x31\x32\x2e\x36\x35\
+\x38\x33\x38\x36\x2c\x31\x31\x2e\x38\x31\x33\x31\x34\x20\x31\x37\
+\x2e\x31\x38\x31\x36\x34\x31\x2c\x32\x31\x2e\x30\x31\x37\x35\x37\
+\x20\x32\x2e\x35\x36\x32\x34\x39\x37\x2c\x35\x2e\x32\x31\x34\x34\
+\x20\x34\x2e\x34\x34\x36\x31\x2c\x39\x2e\x39\x32\x32\x33\x33\x20\
+\x37\x2e\x31\x39\x33\x33\x35\x39\x2c\x31\x37\x2e\x39\x37\x38\x35\
+\x32\x20\x31\x2e\x31\x30\x39\x35\x2c\x33\x2e\x32\x35\x33\x35\x20\
+\x32\x2e\x35\x30\x39\x31\x39\x37\x2c\x36\x2e\x39\x35\x38\x34\x39\
+\x20\x33\x2e\x31\x31\x31\x33\x32\x38\x2c\x38\x2e\x32\x33\x34\x33\
+\x37\x20\x35\x2e\x31\x37\x30\x38\x38\x32\x2c\x31\x30\x2e\x39\x35\
+\x36\x37\x37\x20\x31\x35\x2e\x34\x37\x39\x35\x34\x39\x2c\x32\x30\
+\x2e\x37\x34\x38\x39\x36\x20\x32\x34\x2e\x36\x32\x34\x39\x39\x38\
+\x2c\x32\x33\x2e\x33\x39\x30\x36\x33\x20\x31\x2e\x37\x30\x34\x31\
+\x36\x2c\x30\x2e\x34\x39\x32\x32\x34\x20\x35\x2e\x34\x31\x35\x39\
+\x32\x2c\x31\x2e\x31\x30\x39\x33\x39\x20\x38\x2e\x34\x36\x32\x38\
+\x39\x2c\x31\x2e\x34\x30\x38\x32\x20\x30\x2e\x35\x31\x30\x35\x39\
+\x2c\x30\x2e\x30\x35\x30\x31\x20\x33\x2e\x38\x30\x30\x34\x33\x2c\
+\x30\x2e\x30\x35\x37\x39\x20\x37\x2e\x33\x31\x30\x35\x35\x2c\x30\
+\x2e\x30\x31\x35\x36\x20\x34\x2e\x37\x36\x39\x39\x33\x2c\x2d\x30\
+\x2e\x30\x35\x37\x37\x20\x37\x2e\x32\x36\x39\x32\x36\x2c\x2d\x30\
+\x2e\x31\x39\x37\x39\x32\x20\x39\x2e\x38\x39\x36\x34\x38\x2c\x2d\
+\x30\x2e\x35\x35\x32\x37\x34\x20\x31\x30\x2e\x36\x37\x33\x36\x33\
+\x2c\x2d\x31\x2e\x34\x34\x31\x34\x39\x20\x31\x39\x2e\x34\x32\x34\
+\x37\x35\x2c\x2d\x34\x2e\x34\x32\x36\x30\x37\x20\x32\x36\x2e\x30\
+\x32\x33\x34\x34\x2c\x2d\x38\x2e\x38\x37\x36\x39\x35\x20\x35\x2e\
+\x34\x32\x30\x32\x39\x2c\x2d\x33\x2e\x36\x35\x36\x30\x34\x20\x31\
+\x30\x2e\x39\x34\x31\x30\x34\x2c\x2d\x38\x2e\x32\x35\x30\x36\x35\
+\x20\x31\x33\x2e\x37\x35\x2c\x2d\x31\x31\x2e\x34\x34\x31\x34\x31\
+\x20\x37\x2e\x34\x37\x37\x31\x2c\x2d\x38\x2e\x34\x39\x33\x33\x20\
+\x39\x2e\x36\x36\x37\x30\x31\x2c\x2d\x31\x37\x2e\x37\x33\x38\x38\
+\x32\x20\x37\x2e\x39\x38\x38\x32\x38\x2c\x2d\x33\x33\x2e\x37\x32\
+\x30\x37\x20\x2d\x31\x2e\x30\x32\x31\x32\x38\x2c\x2d\x39\x2e\x37\
+\x32\x32\x38\x32\x20\x2d\x33\x2e\x33\x37\x32\x32\x36\x2c\x2d\x31\
+\x36\x2e\x30\x34\x33\x38\x20\x2d\x37\x2e\x34\x35\x31\x31\x37\x2c\
+\x2d\x32\x30\x2e\x30\x32\x39\x33\x20\x2d\x31\x2e\x36\x37\x34\x37\
+\x39\x2c\x2d\x31\x2e\x36\x33\x36\x34\x31\x39\x20\x2d\x32\x2e\x31\
+\x37\x39\x39\x32\x2c\x2d\x32\x2e\x30\x32\x33\x35\x35\x39\x20\x2d\
+\x33\x2e\x37\x39\x31\x30\x31\x2c\x2d\x32\x2e\x39\x31\x30\x31\x35\
+\x33\x20\x2d\x34\x2e\x31\x36\x39\x38\x37\x2c\x2d\x32\x2e\x32\x39\
+\x34\x36\x35\x37\x20\x2d\x39\x2e\x38\x36\x34\x36\x36\x2c\x2d\x32\
+\x2e\x38\x33\x35\x36\x30\x31\x20\x2d\x32\x31\x2e\x33\x35\x31\x35\
+\x37\x2c\x2d\x32\x2e\x30\x32\x35\x33\x39\x31\x20\x2d\x31\x31\x2e\
+\x37\x39\x36\x31\x31\x2c\x30\x2e\x38\x33\x32\x30\x31\x38\x20\x2d\
+\x31\x38\x2e\x30\x39\x36\x33\x35\x2c\x30\x2e\x32\x34\x39\x31\x34\
+\x37\x20\x2d\x32\x36\x2e\x32\x32\x34\x36\x31\x2c\x2d\x32\x2e\x34\
+\x32\x37\x37\x33\x34\x20\x43\x20\x31\x30\x34\x2e\x35\x30\x38\x30\
+\x37\x2c\x38\x39\x2e\x30\x35\x34\x32\x36\x36\x20\x39\x37\x2e\x31\
+\x34\x39\x30\x30\x33\x2c\x38\x31\x2e\x39\x39\x37\x39\x39\x39\x20\
+\x39\x34\x2e\x39\x30\x36\x32\x35\x2c\x37\x32\x2e\x34\x35\x37\x30\
+\x33\x31\x20\x39\x34\x2e\x36\x35\x35\x39\x33\x32\x2c\x37\x31\x2e\
+\x33\x39\x32\x39\x35\x38\x20\x39\x34\x2e\x31\x32\x35\x36\x35\x37\
+\x2c\x36\x37\x2e\x39\x36\x33\x37\x39\x38\x20\x39\x33\x2e\x37\x32\
+\x38\x35\x31\x36\x2c\x36\x34\x2e\x38\x33\x37\x38\x39\x31\x20\x39\
+\x31\x2e\x32\x39\x39\x34\x38\x39\x2c\x34\x35\x2e\x37\x31\x39\x37\
+\x31\x37\x20\x38\x39\x2e\x34\x39\x36\x38\x33\x2c\x33\x39\x2e\x32\
+\x35\x33\x37\x37\x35\x20\x38\x35\x2e\x35\x30\x33\x39\x30\x36\x2c\
+\x33\x35\x2e\x33\x32\x38\x31\x32\x35\x20\x38\x32\x2e\x31\x30\x33\
+\x36\x31\x36\x2c\x33\x31\x2e\x39\x38\x35\x31\x32\x39\x20\x37\x37\
+\x2e\x30\x36\x35\x32\x33\x32\x2c\x32\x39\x2e\x36\x32\x31\x31\x38\
+\x20\x37\x31\x2e\x37\x31\x30\x39\x33\x38\x2c\x32\x38\x2e\x38\x36\
+\x31\x33\x32\x38\x20\x63\x20\x2d\x31\x2e\x30\x38\x33\x30\x35\x39\
+\x2c\x2d\x30\x2e\x31\x35\x33\x37\x20\x2d\x32\x2e\x37\x33\x37\x35\
+\x39\x33\x2c\x2d\x30\x2e\x32\x31\x33\x35\x38\x35\x20\x2d\x34\x2e\
+\x35\x30\x31\x39\x35\x34\x2c\x2d\x30\x2e\x31\x39\x37\x32\x36\x36\
+\x20\x7a\x22\x20\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x03\x8d\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\
+\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x35\x31\x2e\x33\x2c\x37\x35\x2e\x39\
+\x63\x2d\x31\x2e\x39\x2c\x30\x2d\x33\x2e\x38\x2d\x30\x2e\x38\x2d\
+\x35\x2d\x32\x2e\x34\x4c\x31\x38\x2e\x31\x2c\x33\x38\x2e\x34\x63\
+\x2d\x32\x2e\x32\x2d\x32\x2e\x38\x2d\x31\x2e\x38\x2d\x36\x2e\x39\
+\x2c\x31\x2d\x39\x2e\x31\x63\x32\x2e\x38\x2d\x32\x2e\x32\x2c\x36\
+\x2e\x39\x2d\x31\x2e\x38\x2c\x39\x2e\x31\x2c\x31\x6c\x32\x38\x2e\
+\x32\x2c\x33\x35\x2e\x31\x63\x32\x2e\x32\x2c\x32\x2e\x38\x2c\x31\
+\x2e\x38\x2c\x36\x2e\x39\x2d\x31\x2c\x39\x2e\x31\x0a\x09\x43\x35\
+\x34\x2e\x32\x2c\x37\x35\x2e\x35\x2c\x35\x32\x2e\x37\x2c\x37\x35\
+\x2e\x39\x2c\x35\x31\x2e\x33\x2c\x37\x35\x2e\x39\x7a\x22\x2f\x3e\
+\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x35\x31\x2e\x33\x2c\
+\x37\x35\x2e\x39\x63\x2d\x31\x2e\x34\x2c\x30\x2d\x32\x2e\x39\x2d\
+\x30\x2e\x35\x2d\x34\x2d\x31\x2e\x34\x63\x2d\x32\x2e\x38\x2d\x32\
+\x2e\x32\x2d\x33\x2e\x32\x2d\x36\x2e\x33\x2d\x31\x2d\x39\x2e\x31\
+\x6c\x32\x38\x2e\x32\x2d\x33\x35\x2e\x31\x63\x32\x2e\x32\x2d\x32\
+\x2e\x38\x2c\x36\x2e\x33\x2d\x33\x2e\x32\x2c\x39\x2e\x31\x2d\x31\
+\x63\x32\x2e\x38\x2c\x32\x2e\x32\x2c\x33\x2e\x32\x2c\x36\x2e\x33\
+\x2c\x31\x2c\x39\x2e\x31\x4c\x35\x36\x2e\x34\x2c\x37\x33\x2e\x35\
+\x0a\x09\x43\x35\x35\x2e\x31\x2c\x37\x35\x2e\x31\x2c\x35\x33\x2e\
+\x32\x2c\x37\x35\x2e\x39\x2c\x35\x31\x2e\x33\x2c\x37\x35\x2e\x39\
+\x7a\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x02\xc0\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\
+\x30\x20\x30\x20\x35\x31\x32\x20\x35\x31\x32\x22\x3e\x3c\x73\x74\
+\x79\x6c\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\
+\x73\x73\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\
+\x6c\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\
+\x20\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\
+\x30\x2e\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\
+\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\
+\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\
+\x20\x30\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\
+\x6c\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\
+\x20\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\
+\x30\x2e\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x3c\x70\
+\x61\x74\x68\x20\x64\x3d\x22\x4d\x32\x35\x36\x20\x38\x43\x31\x31\
+\x39\x2e\x30\x34\x33\x20\x38\x20\x38\x20\x31\x31\x39\x2e\x30\x38\
+\x33\x20\x38\x20\x32\x35\x36\x63\x30\x20\x31\x33\x36\x2e\x39\x39\
+\x37\x20\x31\x31\x31\x2e\x30\x34\x33\x20\x32\x34\x38\x20\x32\x34\
+\x38\x20\x32\x34\x38\x73\x32\x34\x38\x2d\x31\x31\x31\x2e\x30\x30\
+\x33\x20\x32\x34\x38\x2d\x32\x34\x38\x43\x35\x30\x34\x20\x31\x31\
+\x39\x2e\x30\x38\x33\x20\x33\x39\x32\x2e\x39\x35\x37\x20\x38\x20\
+\x32\x35\x36\x20\x38\x7a\x6d\x30\x20\x31\x31\x30\x63\x32\x33\x2e\
+\x31\x39\x36\x20\x30\x20\x34\x32\x20\x31\x38\x2e\x38\x30\x34\x20\
+\x34\x32\x20\x34\x32\x73\x2d\x31\x38\x2e\x38\x30\x34\x20\x34\x32\
+\x2d\x34\x32\x20\x34\x32\x2d\x34\x32\x2d\x31\x38\x2e\x38\x30\x34\
+\x2d\x34\x32\x2d\x34\x32\x20\x31\x38\x2e\x38\x30\x34\x2d\x34\x32\
+\x20\x34\x32\x2d\x34\x32\x7a\x6d\x35\x36\x20\x32\x35\x34\x63\x30\
+\x20\x36\x2e\x36\x32\x37\x2d\x35\x2e\x33\x37\x33\x20\x31\x32\x2d\
+\x31\x32\x20\x31\x32\x68\x2d\x38\x38\x63\x2d\x36\x2e\x36\x32\x37\
+\x20\x30\x2d\x31\x32\x2d\x35\x2e\x33\x37\x33\x2d\x31\x32\x2d\x31\
+\x32\x76\x2d\x32\x34\x63\x30\x2d\x36\x2e\x36\x32\x37\x20\x35\x2e\
+\x33\x37\x33\x2d\x31\x32\x20\x31\x32\x2d\x31\x32\x68\x31\x32\x76\
+\x2d\x36\x34\x68\x2d\x31\x32\x63\x2d\x36\x2e\x36\x32\x37\x20\x30\
+\x2d\x31\x32\x2d\x35\x2e\x33\x37\x33\x2d\x31\x32\x2d\x31\x32\x76\
+\x2d\x32\x34\x63\x30\x2d\x36\x2e\x36\x32\x37\x20\x35\x2e\x33\x37\
+\x33\x2d\x31\x32\x20\x31\x32\x2d\x31\x32\x68\x36\x34\x63\x36\x2e\
+\x36\x32\x37\x20\x30\x20\x31\x32\x20\x35\x2e\x33\x37\x33\x20\x31\
+\x32\x20\x31\x32\x76\x31\x30\x30\x68\x31\x32\x63\x36\x2e\x36\x32\
+\x37\x20\x30\x20\x31\x32\x20\x35\x2e\x33\x37\x33\x20\x31\x32\x20\
+\x31\x32\x76\x32\x34\x7a\x22\x2f\x3e\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x04\x29\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x34\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\
+\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x34\
+\x32\x2e\x31\x2c\x35\x31\x6c\x2d\x32\x39\x2d\x32\x33\x2e\x32\x63\
+\x2d\x32\x2e\x33\x2d\x31\x2e\x38\x2d\x32\x2e\x36\x2d\x35\x2e\x32\
+\x2d\x30\x2e\x38\x2d\x37\x2e\x35\x63\x31\x2e\x38\x2d\x32\x2e\x33\
+\x2c\x35\x2e\x32\x2d\x32\x2e\x36\x2c\x37\x2e\x35\x2d\x30\x2e\x38\
+\x6c\x32\x38\x2e\x39\x2c\x32\x33\x2e\x32\x63\x32\x2e\x33\x2c\x31\
+\x2e\x38\x2c\x32\x2e\x36\x2c\x35\x2e\x32\x2c\x30\x2e\x38\x2c\x37\
+\x2e\x35\x63\x2d\x31\x2c\x31\x2e\x33\x2d\x32\x2e\x36\x2c\x32\x2d\
+\x34\x2e\x31\x2c\x32\x0a\x09\x43\x34\x34\x2e\x33\x2c\x35\x32\x2e\
+\x32\x2c\x34\x33\x2e\x31\x2c\x35\x31\x2e\x38\x2c\x34\x32\x2e\x31\
+\x2c\x35\x31\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\
+\x22\x4d\x31\x32\x2e\x34\x2c\x37\x33\x2e\x34\x63\x2d\x31\x2e\x38\
+\x2d\x32\x2e\x33\x2d\x31\x2e\x35\x2d\x35\x2e\x37\x2c\x30\x2e\x38\
+\x2d\x37\x2e\x35\x6c\x32\x38\x2e\x39\x2d\x32\x33\x2e\x32\x63\x32\
+\x2e\x33\x2d\x31\x2e\x38\x2c\x35\x2e\x37\x2d\x31\x2e\x35\x2c\x37\
+\x2e\x35\x2c\x30\x2e\x38\x73\x31\x2e\x35\x2c\x35\x2e\x37\x2d\x30\
+\x2e\x38\x2c\x37\x2e\x35\x6c\x2d\x32\x39\x2c\x32\x33\x2e\x33\x63\
+\x2d\x30\x2e\x39\x2c\x30\x2e\x37\x2d\x32\x2e\x31\x2c\x31\x2e\x32\
+\x2d\x33\x2e\x33\x2c\x31\x2e\x32\x0a\x09\x43\x31\x34\x2e\x39\x2c\
+\x37\x35\x2e\x35\x2c\x31\x33\x2e\x35\x2c\x37\x34\x2e\x38\x2c\x31\
+\x32\x2e\x34\x2c\x37\x33\x2e\x34\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x34\x31\x2e\x34\x2c\x37\x35\x2e\x33\
+\x63\x30\x2d\x32\x2e\x39\x2c\x32\x2e\x33\x2d\x35\x2e\x34\x2c\x35\
+\x2e\x33\x2d\x35\x2e\x34\x6c\x33\x37\x2e\x31\x2d\x30\x2e\x35\x63\
+\x32\x2e\x39\x2c\x30\x2c\x35\x2e\x34\x2c\x32\x2e\x33\x2c\x35\x2e\
+\x34\x2c\x35\x2e\x33\x63\x30\x2c\x32\x2e\x39\x2d\x32\x2e\x33\x2c\
+\x35\x2e\x34\x2d\x35\x2e\x33\x2c\x35\x2e\x34\x6c\x2d\x33\x37\x2e\
+\x32\x2c\x30\x2e\x35\x63\x2d\x31\x2e\x32\x2c\x30\x2d\x32\x2e\x34\
+\x2d\x30\x2e\x34\x2d\x33\x2e\x33\x2d\x31\x2e\x31\x0a\x09\x43\x34\
+\x32\x2e\x32\x2c\x37\x38\x2e\x35\x2c\x34\x31\x2e\x34\x2c\x37\x37\
+\x2e\x31\x2c\x34\x31\x2e\x34\x2c\x37\x35\x2e\x33\x7a\x22\x2f\x3e\
+\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x03\x91\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\
+\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\
+\x22\x35\x39\x2e\x36\x22\x20\x63\x79\x3d\x22\x34\x32\x2e\x37\x22\
+\x20\x72\x3d\x22\x34\x2e\x39\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\
+\x20\x64\x3d\x22\x4d\x34\x31\x2e\x31\x2c\x38\x34\x2e\x32\x63\x2d\
+\x31\x2c\x30\x2d\x32\x2d\x30\x2e\x34\x2d\x32\x2e\x37\x2d\x31\x2e\
+\x33\x6c\x2d\x32\x32\x2d\x32\x36\x2e\x37\x63\x2d\x31\x2e\x32\x2d\
+\x31\x2e\x35\x2d\x31\x2d\x33\x2e\x37\x2c\x30\x2e\x35\x2d\x34\x2e\
+\x39\x6c\x33\x31\x2e\x39\x2d\x32\x36\x2e\x34\x63\x30\x2e\x36\x2d\
+\x30\x2e\x35\x2c\x31\x2e\x34\x2d\x30\x2e\x38\x2c\x32\x2e\x32\x2d\
+\x30\x2e\x38\x63\x30\x2c\x30\x2c\x30\x2c\x30\x2c\x30\x2c\x30\x6c\
+\x32\x37\x2e\x31\x2c\x30\x2e\x31\x0a\x09\x63\x31\x2c\x30\x2c\x32\
+\x2c\x30\x2e\x35\x2c\x32\x2e\x37\x2c\x31\x2e\x33\x63\x30\x2e\x37\
+\x2c\x30\x2e\x38\x2c\x30\x2e\x39\x2c\x31\x2e\x39\x2c\x30\x2e\x37\
+\x2c\x32\x2e\x39\x4c\x37\x36\x2e\x35\x2c\x35\x35\x63\x2d\x30\x2e\
+\x32\x2c\x30\x2e\x38\x2d\x30\x2e\x36\x2c\x31\x2e\x35\x2d\x31\x2e\
+\x32\x2c\x32\x4c\x34\x33\x2e\x33\x2c\x38\x33\x2e\x34\x43\x34\x32\
+\x2e\x37\x2c\x38\x33\x2e\x39\x2c\x34\x31\x2e\x39\x2c\x38\x34\x2e\
+\x32\x2c\x34\x31\x2e\x31\x2c\x38\x34\x2e\x32\x7a\x20\x4d\x32\x34\
+\x2c\x35\x34\x2e\x35\x0a\x09\x6c\x31\x37\x2e\x36\x2c\x32\x31\x2e\
+\x33\x6c\x32\x38\x2e\x33\x2d\x32\x33\x2e\x33\x6c\x34\x2d\x32\x31\
+\x2e\x32\x6c\x2d\x32\x31\x2e\x36\x2d\x30\x2e\x31\x4c\x32\x34\x2c\
+\x35\x34\x2e\x35\x7a\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\
+\x00\x00\x03\x28\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\x69\
+\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\
+\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\x6b\
+\x22\x20\x66\x6f\x63\x75\x73\x61\x62\x6c\x65\x3d\x22\x66\x61\x6c\
+\x73\x65\x22\x20\x70\x72\x65\x73\x65\x72\x76\x65\x41\x73\x70\x65\
+\x63\x74\x52\x61\x74\x69\x6f\x3d\x22\x78\x4d\x69\x64\x59\x4d\x69\
+\x64\x20\x6d\x65\x65\x74\x22\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\
+\x22\x30\x20\x30\x20\x31\x34\x20\x31\x36\x22\x3e\x3c\x73\x74\x79\
+\x6c\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\
+\x73\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\
+\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\
+\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\
+\x3b\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\
+\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\
+\x6c\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\
+\x20\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\
+\x30\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\
+\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x21\
+\x2d\x2d\x46\x72\x6f\x6d\x20\x47\x69\x74\x48\x75\x62\x27\x73\x20\
+\x4f\x63\x74\x6f\x69\x63\x6f\x6e\x73\x2d\x2d\x3e\x0a\x3c\x21\x2d\
+\x2d\x65\x78\x74\x72\x61\x20\x6c\x69\x6e\x65\x2d\x2d\x3e\x0a\x3c\
+\x21\x2d\x2d\x65\x78\x74\x72\x61\x20\x6c\x69\x6e\x65\x32\x2d\x2d\
+\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x32\x20\x31\x33\
+\x68\x34\x76\x31\x48\x32\x76\x2d\x31\x7a\x6d\x35\x2d\x36\x48\x32\
+\x76\x31\x68\x35\x56\x37\x7a\x6d\x32\x20\x33\x56\x38\x6c\x2d\x33\
+\x20\x33\x6c\x33\x20\x33\x76\x2d\x32\x68\x35\x76\x2d\x32\x48\x39\
+\x7a\x4d\x34\x2e\x35\x20\x39\x48\x32\x76\x31\x68\x32\x2e\x35\x56\
+\x39\x7a\x4d\x32\x20\x31\x32\x68\x32\x2e\x35\x76\x2d\x31\x48\x32\
+\x76\x31\x7a\x6d\x39\x20\x31\x68\x31\x76\x32\x63\x2d\x2e\x30\x32\
+\x2e\x32\x38\x2d\x2e\x31\x31\x2e\x35\x32\x2d\x2e\x33\x2e\x37\x63\
+\x2d\x2e\x31\x39\x2e\x31\x38\x2d\x2e\x34\x32\x2e\x32\x38\x2d\x2e\
+\x37\x2e\x33\x48\x31\x63\x2d\x2e\x35\x35\x20\x30\x2d\x31\x2d\x2e\
+\x34\x35\x2d\x31\x2d\x31\x56\x34\x63\x30\x2d\x2e\x35\x35\x2e\x34\
+\x35\x2d\x31\x20\x31\x2d\x31\x68\x33\x63\x30\x2d\x31\x2e\x31\x31\
+\x2e\x38\x39\x2d\x32\x20\x32\x2d\x32\x63\x31\x2e\x31\x31\x20\x30\
+\x20\x32\x20\x2e\x38\x39\x20\x32\x20\x32\x68\x33\x63\x2e\x35\x35\
+\x20\x30\x20\x31\x20\x2e\x34\x35\x20\x31\x20\x31\x76\x35\x68\x2d\
+\x31\x56\x36\x48\x31\x76\x39\x68\x31\x30\x76\x2d\x32\x7a\x4d\x32\
+\x20\x35\x68\x38\x63\x30\x2d\x2e\x35\x35\x2d\x2e\x34\x35\x2d\x31\
+\x2d\x31\x2d\x31\x48\x38\x63\x2d\x2e\x35\x35\x20\x30\x2d\x31\x2d\
+\x2e\x34\x35\x2d\x31\x2d\x31\x73\x2d\x2e\x34\x35\x2d\x31\x2d\x31\
+\x2d\x31\x73\x2d\x31\x20\x2e\x34\x35\x2d\x31\x20\x31\x73\x2d\x2e\
+\x34\x35\x20\x31\x2d\x31\x20\x31\x48\x33\x63\x2d\x2e\x35\x35\x20\
+\x30\x2d\x31\x20\x2e\x34\x35\x2d\x31\x20\x31\x7a\x22\x20\x2f\x3e\
+\x0a\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x04\x74\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x36\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\
+\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x67\x3e\x0a\x09\x3c\x70\x61\x74\x68\x20\
+\x64\x3d\x22\x4d\x35\x37\x2e\x33\x2c\x38\x34\x2e\x37\x68\x2d\x33\
+\x32\x63\x2d\x34\x2e\x36\x2c\x30\x2d\x38\x2e\x32\x2d\x33\x2e\x36\
+\x2d\x38\x2e\x32\x2d\x38\x2e\x32\x76\x2d\x33\x32\x63\x30\x2d\x34\
+\x2e\x36\x2c\x33\x2e\x36\x2d\x38\x2e\x32\x2c\x38\x2e\x32\x2d\x38\
+\x2e\x32\x68\x33\x32\x63\x34\x2e\x36\x2c\x30\x2c\x38\x2e\x32\x2c\
+\x33\x2e\x36\x2c\x38\x2e\x32\x2c\x38\x2e\x32\x76\x33\x32\x0a\x09\
+\x09\x43\x36\x35\x2e\x34\x2c\x38\x31\x2e\x32\x2c\x36\x31\x2e\x39\
+\x2c\x38\x34\x2e\x37\x2c\x35\x37\x2e\x33\x2c\x38\x34\x2e\x37\x7a\
+\x20\x4d\x32\x36\x2e\x39\x2c\x37\x34\x2e\x39\x68\x32\x38\x2e\x37\
+\x56\x34\x36\x2e\x32\x48\x32\x36\x2e\x39\x56\x37\x34\x2e\x39\x7a\
+\x22\x2f\x3e\x0a\x09\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x37\
+\x34\x2e\x37\x2c\x36\x33\x2e\x36\x68\x2d\x33\x32\x63\x2d\x34\x2e\
+\x36\x2c\x30\x2d\x38\x2e\x32\x2d\x33\x2e\x36\x2d\x38\x2e\x32\x2d\
+\x38\x2e\x32\x76\x2d\x33\x32\x63\x30\x2d\x34\x2e\x36\x2c\x33\x2e\
+\x36\x2d\x38\x2e\x32\x2c\x38\x2e\x32\x2d\x38\x2e\x32\x68\x33\x32\
+\x63\x34\x2e\x36\x2c\x30\x2c\x38\x2e\x32\x2c\x33\x2e\x36\x2c\x38\
+\x2e\x32\x2c\x38\x2e\x32\x76\x33\x32\x0a\x09\x09\x43\x38\x32\x2e\
+\x39\x2c\x36\x30\x2c\x37\x39\x2e\x33\x2c\x36\x33\x2e\x36\x2c\x37\
+\x34\x2e\x37\x2c\x36\x33\x2e\x36\x7a\x20\x4d\x34\x34\x2e\x33\x2c\
+\x35\x33\x2e\x38\x68\x32\x38\x2e\x37\x56\x32\x35\x2e\x31\x48\x34\
+\x34\x2e\x33\x56\x35\x33\x2e\x38\x7a\x22\x2f\x3e\x0a\x09\x3c\x70\
+\x61\x74\x68\x20\x64\x3d\x22\x4d\x38\x31\x2e\x31\x2c\x36\x30\x2e\
+\x36\x4c\x36\x32\x2e\x37\x2c\x38\x32\x2e\x37\x6c\x2d\x36\x2e\x39\
+\x2d\x36\x2e\x39\x6c\x31\x33\x2e\x38\x2d\x31\x35\x2e\x33\x6c\x35\
+\x2d\x33\x2e\x35\x22\x2f\x3e\x0a\x09\x3c\x70\x61\x74\x68\x20\x64\
+\x3d\x22\x4d\x38\x32\x2c\x32\x36\x2e\x38\x4c\x36\x31\x2e\x39\x2c\
+\x34\x36\x2e\x39\x6c\x2d\x36\x2e\x39\x2d\x37\x6c\x32\x30\x2e\x34\
+\x2d\x32\x30\x2e\x34\x6c\x30\x2c\x30\x22\x2f\x3e\x0a\x09\x3c\x70\
+\x61\x74\x68\x20\x64\x3d\x22\x4d\x34\x34\x2e\x37\x2c\x36\x30\x2e\
+\x36\x4c\x32\x34\x2e\x38\x2c\x38\x33\x2e\x31\x6c\x2d\x36\x2e\x39\
+\x2d\x36\x2e\x39\x6c\x31\x38\x2e\x38\x2d\x32\x32\x2e\x32\x68\x31\
+\x2e\x36\x22\x2f\x3e\x0a\x09\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\
+\x4d\x31\x39\x2c\x33\x39\x2e\x34\x4c\x33\x36\x2c\x31\x38\x2e\x37\
+\x6c\x31\x30\x2e\x33\x2c\x33\x4c\x32\x39\x2e\x32\x2c\x34\x32\x6c\
+\x30\x2c\x30\x22\x2f\x3e\x0a\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\
+\x67\x3e\x0a\
+\x00\x00\x03\x66\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x38\
+\x30\x2e\x36\x32\x6d\x6d\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\
+\x31\x38\x30\x2e\x36\x32\x6d\x6d\x22\x20\x76\x69\x65\x77\x42\x6f\
+\x78\x3d\x22\x30\x20\x30\x20\x35\x31\x32\x20\x35\x31\x32\x22\x3e\
+\x3c\x73\x74\x79\x6c\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\
+\x74\x2f\x63\x73\x73\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\
+\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\
+\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\
+\x20\x31\x3b\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\
+\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\
+\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\
+\x20\x31\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\
+\x6c\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\
+\x20\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\
+\x31\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\
+\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\
+\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\
+\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x20\x20\x3c\x74\x69\x74\
+\x6c\x65\x3e\x41\x72\x74\x62\x6f\x61\x72\x64\x20\x31\x3c\x2f\x74\
+\x69\x74\x6c\x65\x3e\x0a\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\
+\x22\x4d\x33\x39\x34\x2e\x35\x36\x2c\x32\x39\x38\x2e\x34\x34\x73\
+\x2d\x33\x38\x2e\x34\x35\x2c\x35\x35\x2e\x36\x36\x2d\x33\x38\x2e\
+\x34\x35\x2c\x37\x36\x2e\x38\x39\x61\x33\x38\x2e\x34\x35\x2c\x33\
+\x38\x2e\x34\x35\x2c\x30\x2c\x31\x2c\x30\x2c\x37\x36\x2e\x38\x39\
+\x2c\x30\x43\x34\x33\x33\x2c\x33\x35\x34\x2e\x31\x2c\x33\x39\x34\
+\x2e\x35\x36\x2c\x32\x39\x38\x2e\x34\x34\x2c\x33\x39\x34\x2e\x35\
+\x36\x2c\x32\x39\x38\x2e\x34\x34\x5a\x6d\x2d\x35\x2e\x36\x33\x2d\
+\x36\x31\x2e\x38\x33\x4c\x32\x36\x34\x2e\x31\x37\x2c\x31\x31\x31\
+\x2e\x38\x35\x61\x31\x39\x2e\x32\x32\x2c\x31\x39\x2e\x32\x32\x2c\
+\x30\x2c\x30\x2c\x30\x2d\x32\x37\x2e\x31\x38\x2c\x30\x6c\x2d\x34\
+\x39\x2c\x34\x39\x2d\x35\x31\x2e\x37\x37\x2d\x35\x31\x2e\x37\x37\
+\x61\x39\x2e\x36\x2c\x39\x2e\x36\x2c\x30\x2c\x30\x2c\x30\x2d\x31\
+\x33\x2e\x35\x38\x2c\x30\x4c\x31\x30\x39\x2c\x31\x32\x32\x2e\x36\
+\x37\x61\x39\x2e\x36\x31\x2c\x39\x2e\x36\x31\x2c\x30\x2c\x30\x2c\
+\x30\x2c\x30\x2c\x31\x33\x2e\x35\x39\x4c\x31\x36\x30\x2e\x38\x31\
+\x2c\x31\x38\x38\x2c\x31\x30\x33\x2e\x38\x39\x2c\x32\x34\x35\x61\
+\x35\x37\x2e\x36\x35\x2c\x35\x37\x2e\x36\x35\x2c\x30\x2c\x30\x2c\
+\x30\x2c\x30\x2c\x38\x31\x2e\x35\x34\x6c\x37\x30\x2e\x34\x2c\x37\
+\x30\x2e\x34\x61\x35\x37\x2e\x36\x35\x2c\x35\x37\x2e\x36\x35\x2c\
+\x30\x2c\x30\x2c\x30\x2c\x38\x31\x2e\x35\x34\x2c\x30\x6c\x31\x33\
+\x33\x2e\x30\x39\x2d\x31\x33\x33\x2e\x31\x41\x31\x39\x2e\x32\x32\
+\x2c\x31\x39\x2e\x32\x32\x2c\x30\x2c\x30\x2c\x30\x2c\x33\x38\x38\
+\x2e\x39\x33\x2c\x32\x33\x36\x2e\x36\x31\x5a\x6d\x2d\x36\x39\x2e\
+\x38\x31\x2c\x34\x32\x2e\x36\x33\x48\x31\x32\x36\x2e\x36\x61\x31\
+\x38\x2e\x37\x34\x2c\x31\x38\x2e\x37\x34\x2c\x30\x2c\x30\x2c\x31\
+\x2c\x34\x2e\x34\x37\x2d\x37\x2e\x31\x31\x6c\x37\x2e\x39\x2d\x37\
+\x2e\x39\x2c\x34\x39\x2d\x34\x39\x2c\x33\x35\x2e\x32\x2c\x33\x35\
+\x2e\x32\x61\x31\x39\x2e\x32\x32\x2c\x31\x39\x2e\x32\x32\x2c\x30\
+\x2c\x30\x2c\x30\x2c\x32\x37\x2e\x31\x38\x2d\x32\x37\x2e\x31\x37\
+\x4c\x32\x31\x35\x2e\x31\x36\x2c\x31\x38\x38\x6c\x33\x35\x2e\x34\
+\x32\x2d\x33\x35\x2e\x34\x32\x2c\x39\x37\x2e\x35\x37\x2c\x39\x37\
+\x2e\x35\x38\x2d\x32\x39\x2c\x32\x39\x5a\x22\x2f\x3e\x0a\x3c\x2f\
+\x73\x76\x67\x3e\x0a\
+\x00\x00\x06\x43\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\
+\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x35\x30\x2c\x33\x30\x63\x2d\x34\x2e\
+\x37\x2c\x30\x2d\x38\x2e\x36\x2d\x33\x2e\x39\x2d\x38\x2e\x36\x2d\
+\x38\x2e\x36\x73\x33\x2e\x39\x2d\x38\x2e\x36\x2c\x38\x2e\x36\x2d\
+\x38\x2e\x36\x73\x38\x2e\x36\x2c\x33\x2e\x39\x2c\x38\x2e\x36\x2c\
+\x38\x2e\x36\x53\x35\x34\x2e\x37\x2c\x33\x30\x2c\x35\x30\x2c\x33\
+\x30\x7a\x20\x4d\x35\x30\x2c\x31\x38\x2e\x34\x63\x2d\x31\x2e\x37\
+\x2c\x30\x2d\x33\x2c\x31\x2e\x33\x2d\x33\x2c\x33\x73\x31\x2e\x33\
+\x2c\x33\x2c\x33\x2c\x33\x0a\x09\x73\x33\x2d\x31\x2e\x33\x2c\x33\
+\x2d\x33\x53\x35\x31\x2e\x37\x2c\x31\x38\x2e\x34\x2c\x35\x30\x2c\
+\x31\x38\x2e\x34\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\
+\x3d\x22\x4d\x37\x37\x2e\x38\x2c\x35\x38\x2e\x39\x63\x2d\x34\x2e\
+\x37\x2c\x30\x2d\x38\x2e\x36\x2d\x33\x2e\x39\x2d\x38\x2e\x36\x2d\
+\x38\x2e\x36\x73\x33\x2e\x39\x2d\x38\x2e\x36\x2c\x38\x2e\x36\x2d\
+\x38\x2e\x36\x73\x38\x2e\x36\x2c\x33\x2e\x39\x2c\x38\x2e\x36\x2c\
+\x38\x2e\x36\x53\x38\x32\x2e\x35\x2c\x35\x38\x2e\x39\x2c\x37\x37\
+\x2e\x38\x2c\x35\x38\x2e\x39\x7a\x20\x4d\x37\x37\x2e\x38\x2c\x34\
+\x37\x2e\x33\x63\x2d\x31\x2e\x37\x2c\x30\x2d\x33\x2c\x31\x2e\x33\
+\x2d\x33\x2c\x33\x0a\x09\x73\x31\x2e\x33\x2c\x33\x2c\x33\x2c\x33\
+\x73\x33\x2d\x31\x2e\x33\x2c\x33\x2d\x33\x53\x37\x39\x2e\x35\x2c\
+\x34\x37\x2e\x33\x2c\x37\x37\x2e\x38\x2c\x34\x37\x2e\x33\x7a\x22\
+\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x35\x30\x2c\
+\x38\x35\x2e\x36\x63\x2d\x34\x2e\x37\x2c\x30\x2d\x38\x2e\x36\x2d\
+\x33\x2e\x39\x2d\x38\x2e\x36\x2d\x38\x2e\x36\x73\x33\x2e\x39\x2d\
+\x38\x2e\x36\x2c\x38\x2e\x36\x2d\x38\x2e\x36\x73\x38\x2e\x36\x2c\
+\x33\x2e\x39\x2c\x38\x2e\x36\x2c\x38\x2e\x36\x53\x35\x34\x2e\x37\
+\x2c\x38\x35\x2e\x36\x2c\x35\x30\x2c\x38\x35\x2e\x36\x7a\x20\x4d\
+\x35\x30\x2c\x37\x34\x63\x2d\x31\x2e\x37\x2c\x30\x2d\x33\x2c\x31\
+\x2e\x33\x2d\x33\x2c\x33\x73\x31\x2e\x33\x2c\x33\x2c\x33\x2c\x33\
+\x0a\x09\x73\x33\x2d\x31\x2e\x33\x2c\x33\x2d\x33\x53\x35\x31\x2e\
+\x37\x2c\x37\x34\x2c\x35\x30\x2c\x37\x34\x7a\x22\x2f\x3e\x0a\x3c\
+\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x32\x32\x2e\x32\x2c\x35\x38\
+\x2e\x36\x63\x2d\x34\x2e\x37\x2c\x30\x2d\x38\x2e\x36\x2d\x33\x2e\
+\x39\x2d\x38\x2e\x36\x2d\x38\x2e\x36\x73\x33\x2e\x39\x2d\x38\x2e\
+\x36\x2c\x38\x2e\x36\x2d\x38\x2e\x36\x73\x38\x2e\x36\x2c\x33\x2e\
+\x39\x2c\x38\x2e\x36\x2c\x38\x2e\x36\x53\x32\x36\x2e\x39\x2c\x35\
+\x38\x2e\x36\x2c\x32\x32\x2e\x32\x2c\x35\x38\x2e\x36\x7a\x20\x4d\
+\x32\x32\x2e\x32\x2c\x34\x37\x63\x2d\x31\x2e\x37\x2c\x30\x2d\x33\
+\x2c\x31\x2e\x33\x2d\x33\x2c\x33\x0a\x09\x73\x31\x2e\x33\x2c\x33\
+\x2c\x33\x2c\x33\x73\x33\x2d\x31\x2e\x33\x2c\x33\x2d\x33\x53\x32\
+\x33\x2e\x39\x2c\x34\x37\x2c\x32\x32\x2e\x32\x2c\x34\x37\x7a\x22\
+\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x32\x36\x2e\
+\x34\x2c\x34\x34\x2e\x35\x4c\x32\x31\x2c\x34\x33\x2e\x35\x63\x32\
+\x2e\x32\x2d\x31\x31\x2e\x32\x2c\x31\x30\x2e\x37\x2d\x32\x30\x2e\
+\x32\x2c\x32\x31\x2e\x37\x2d\x32\x33\x6c\x31\x2e\x34\x2c\x35\x2e\
+\x34\x43\x33\x35\x2e\x31\x2c\x32\x38\x2e\x32\x2c\x32\x38\x2e\x32\
+\x2c\x33\x35\x2e\x35\x2c\x32\x36\x2e\x34\x2c\x34\x34\x2e\x35\x7a\
+\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x34\x33\
+\x2e\x36\x2c\x37\x38\x63\x2d\x31\x31\x2e\x35\x2d\x32\x2e\x35\x2d\
+\x32\x30\x2e\x37\x2d\x31\x32\x2d\x32\x32\x2e\x38\x2d\x32\x33\x2e\
+\x36\x6c\x35\x2e\x35\x2d\x31\x63\x31\x2e\x37\x2c\x39\x2e\x34\x2c\
+\x39\x2e\x31\x2c\x31\x37\x2e\x31\x2c\x31\x38\x2e\x34\x2c\x31\x39\
+\x2e\x32\x4c\x34\x33\x2e\x36\x2c\x37\x38\x7a\x22\x2f\x3e\x0a\x3c\
+\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x35\x36\x2e\x36\x2c\x37\x38\
+\x6c\x2d\x31\x2e\x33\x2d\x35\x2e\x35\x63\x39\x2e\x33\x2d\x32\x2e\
+\x32\x2c\x31\x36\x2e\x34\x2d\x39\x2e\x36\x2c\x31\x38\x2e\x32\x2d\
+\x31\x38\x2e\x39\x6c\x35\x2e\x35\x2c\x31\x2e\x31\x43\x37\x36\x2e\
+\x38\x2c\x36\x36\x2e\x32\x2c\x36\x38\x2c\x37\x35\x2e\x34\x2c\x35\
+\x36\x2e\x36\x2c\x37\x38\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\
+\x20\x64\x3d\x22\x4d\x37\x33\x2e\x39\x2c\x34\x36\x2e\x36\x63\x2d\
+\x31\x2e\x31\x2d\x39\x2e\x38\x2d\x37\x2e\x39\x2d\x31\x37\x2e\x39\
+\x2d\x31\x37\x2e\x34\x2d\x32\x30\x2e\x35\x6c\x31\x2e\x35\x2d\x35\
+\x2e\x34\x43\x36\x39\x2e\x38\x2c\x32\x34\x2c\x37\x38\x2e\x32\x2c\
+\x33\x33\x2e\x39\x2c\x37\x39\x2e\x35\x2c\x34\x36\x4c\x37\x33\x2e\
+\x39\x2c\x34\x36\x2e\x36\x7a\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\
+\x3e\x0a\
+\x00\x00\x02\x6d\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x30\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\
+\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x70\x6f\
+\x69\x6e\x74\x73\x3d\x22\x35\x30\x2c\x37\x39\x2e\x31\x20\x39\x37\
+\x2e\x34\x2c\x32\x30\x2e\x39\x20\x32\x2e\x36\x2c\x32\x30\x2e\x39\
+\x20\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x03\xa9\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\
+\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x67\x20\x69\x64\x3d\x22\x4f\x75\x74\x6c\
+\x69\x6e\x65\x22\x3e\x0a\x09\x3c\x67\x3e\x0a\x09\x09\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x32\x36\x2e\x35\x2c\x37\x34\x2e\x32\
+\x63\x30\x2c\x33\x2e\x37\x2c\x33\x2c\x36\x2e\x38\x2c\x36\x2e\x38\
+\x2c\x36\x2e\x38\x68\x33\x33\x2e\x38\x63\x33\x2e\x37\x2c\x30\x2c\
+\x36\x2e\x38\x2d\x33\x2c\x36\x2e\x38\x2d\x36\x2e\x38\x56\x33\x33\
+\x2e\x37\x48\x32\x36\x2e\x35\x56\x37\x34\x2e\x32\x7a\x20\x4d\x33\
+\x33\x2e\x33\x2c\x34\x30\x2e\x34\x68\x33\x33\x2e\x38\x76\x33\x33\
+\x2e\x38\x48\x33\x33\x2e\x33\x56\x34\x30\x2e\x34\x7a\x22\x2f\x3e\
+\x0a\x09\x09\x3c\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x70\x6f\x69\x6e\
+\x74\x73\x3d\x22\x36\x30\x2e\x33\x2c\x32\x33\x2e\x35\x20\x36\x30\
+\x2e\x33\x2c\x31\x36\x2e\x38\x20\x34\x30\x2e\x31\x2c\x31\x36\x2e\
+\x38\x20\x34\x30\x2e\x31\x2c\x32\x33\x2e\x35\x20\x31\x39\x2e\x38\
+\x2c\x32\x33\x2e\x35\x20\x31\x39\x2e\x38\x2c\x33\x30\x2e\x33\x20\
+\x38\x30\x2e\x36\x2c\x33\x30\x2e\x33\x20\x38\x30\x2e\x36\x2c\x32\
+\x33\x2e\x35\x20\x09\x09\x22\x2f\x3e\x0a\x09\x09\x3c\x72\x65\x63\
+\x74\x20\x78\x3d\x22\x34\x30\x2e\x31\x22\x20\x79\x3d\x22\x34\x37\
+\x2e\x32\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x36\x2e\x38\x22\x20\
+\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x30\x2e\x33\x22\x2f\x3e\x0a\
+\x09\x09\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x35\x33\x2e\x36\x22\
+\x20\x79\x3d\x22\x34\x37\x2e\x32\x22\x20\x77\x69\x64\x74\x68\x3d\
+\x22\x36\x2e\x38\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x30\
+\x2e\x33\x22\x2f\x3e\x0a\x09\x3c\x2f\x67\x3e\x0a\x3c\x2f\x67\x3e\
+\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x02\x82\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\
+\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x6f\
+\x6c\x79\x67\x6f\x6e\x20\x70\x6f\x69\x6e\x74\x73\x3d\x22\x32\x32\
+\x2e\x38\x2c\x36\x35\x2e\x38\x20\x32\x39\x2e\x39\x2c\x31\x38\x2e\
+\x31\x20\x38\x35\x2e\x37\x2c\x36\x37\x2e\x34\x20\x35\x31\x2e\x39\
+\x2c\x37\x39\x2e\x35\x20\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\
+\x0a\
+\x00\x00\x02\x75\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x34\x2e\x30\x2e\x30\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\
+\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x6f\
+\x6c\x79\x67\x6f\x6e\x20\x70\x6f\x69\x6e\x74\x73\x3d\x22\x35\x30\
+\x2c\x37\x39\x2e\x31\x20\x39\x37\x2e\x34\x2c\x32\x30\x2e\x39\x20\
+\x32\x2e\x36\x2c\x32\x30\x2e\x39\x20\x22\x2f\x3e\x0a\x3c\x2f\x73\
+\x76\x67\x3e\x0a\
+\x00\x00\x03\x83\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\
+\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x35\x30\x2e\x35\x2c\x37\x37\x2e\x33\
+\x43\x32\x36\x2e\x37\x2c\x37\x37\x2e\x33\x2c\x38\x2e\x31\x2c\x35\
+\x32\x2e\x31\x2c\x37\x2e\x33\x2c\x35\x31\x4c\x36\x2c\x34\x39\x2e\
+\x32\x6c\x31\x2e\x33\x2d\x31\x2e\x38\x43\x38\x2e\x31\x2c\x34\x36\
+\x2e\x33\x2c\x32\x36\x2e\x37\x2c\x32\x31\x2c\x35\x30\x2e\x35\x2c\
+\x32\x31\x73\x34\x32\x2e\x34\x2c\x32\x35\x2e\x33\x2c\x34\x33\x2e\
+\x32\x2c\x32\x36\x2e\x33\x6c\x31\x2e\x33\x2c\x31\x2e\x38\x4c\x39\
+\x33\x2e\x37\x2c\x35\x31\x0a\x09\x43\x39\x32\x2e\x39\x2c\x35\x32\
+\x2e\x31\x2c\x37\x34\x2e\x33\x2c\x37\x37\x2e\x33\x2c\x35\x30\x2e\
+\x35\x2c\x37\x37\x2e\x33\x7a\x20\x4d\x31\x33\x2e\x38\x2c\x34\x39\
+\x2e\x32\x63\x34\x2e\x36\x2c\x35\x2e\x36\x2c\x31\x39\x2e\x35\x2c\
+\x32\x31\x2e\x39\x2c\x33\x36\x2e\x37\x2c\x32\x31\x2e\x39\x73\x33\
+\x32\x2e\x31\x2d\x31\x36\x2e\x34\x2c\x33\x36\x2e\x37\x2d\x32\x31\
+\x2e\x39\x63\x2d\x34\x2e\x36\x2d\x35\x2e\x36\x2d\x31\x39\x2e\x35\
+\x2d\x32\x31\x2e\x39\x2d\x33\x36\x2e\x37\x2d\x32\x31\x2e\x39\x0a\
+\x09\x43\x33\x33\x2e\x33\x2c\x32\x37\x2e\x32\x2c\x31\x38\x2e\x34\
+\x2c\x34\x33\x2e\x36\x2c\x31\x33\x2e\x38\x2c\x34\x39\x2e\x32\x7a\
+\x22\x2f\x3e\x0a\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\
+\x35\x30\x2e\x35\x22\x20\x63\x79\x3d\x22\x34\x39\x2e\x32\x22\x20\
+\x72\x3d\x22\x31\x37\x2e\x33\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\
+\x3e\x0a\
+\x00\x00\x03\x8f\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\
+\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x67\x20\x69\x64\x3d\x22\x4f\x75\x74\x6c\
+\x69\x6e\x65\x22\x3e\x0a\x09\x3c\x67\x3e\x0a\x09\x09\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x34\x37\x2e\x32\x2c\x38\x36\x2e\x39\
+\x63\x2d\x31\x2e\x34\x2c\x30\x2d\x32\x2e\x37\x2d\x30\x2e\x39\x2d\
+\x33\x2e\x33\x2d\x32\x2e\x32\x6c\x2d\x32\x35\x2d\x36\x30\x2e\x36\
+\x63\x2d\x30\x2e\x36\x2d\x31\x2e\x33\x2d\x30\x2e\x32\x2d\x32\x2e\
+\x39\x2c\x30\x2e\x38\x2d\x33\x2e\x39\x73\x32\x2e\x35\x2d\x31\x2e\
+\x33\x2c\x33\x2e\x39\x2d\x30\x2e\x38\x6c\x36\x30\x2e\x36\x2c\x32\
+\x35\x63\x31\x2e\x34\x2c\x30\x2e\x36\x2c\x32\x2e\x33\x2c\x32\x2c\
+\x32\x2e\x32\x2c\x33\x2e\x36\x0a\x09\x09\x09\x63\x2d\x30\x2e\x31\
+\x2c\x31\x2e\x35\x2d\x31\x2e\x32\x2c\x32\x2e\x38\x2d\x32\x2e\x37\
+\x2c\x33\x2e\x32\x6c\x2d\x32\x36\x2e\x34\x2c\x36\x2e\x36\x6c\x2d\
+\x36\x2e\x36\x2c\x32\x36\x2e\x34\x63\x2d\x30\x2e\x34\x2c\x31\x2e\
+\x35\x2d\x31\x2e\x37\x2c\x32\x2e\x36\x2d\x33\x2e\x32\x2c\x32\x2e\
+\x37\x43\x34\x37\x2e\x33\x2c\x38\x36\x2e\x39\x2c\x34\x37\x2e\x32\
+\x2c\x38\x36\x2e\x39\x2c\x34\x37\x2e\x32\x2c\x38\x36\x2e\x39\x7a\
+\x20\x4d\x32\x38\x2e\x37\x2c\x32\x39\x2e\x33\x4c\x34\x36\x2e\x33\
+\x2c\x37\x32\x0a\x09\x09\x09\x6c\x34\x2e\x35\x2d\x31\x38\x63\x30\
+\x2e\x33\x2d\x31\x2e\x33\x2c\x31\x2e\x33\x2d\x32\x2e\x33\x2c\x32\
+\x2e\x36\x2d\x32\x2e\x36\x6c\x31\x38\x2d\x34\x2e\x35\x4c\x32\x38\
+\x2e\x37\x2c\x32\x39\x2e\x33\x7a\x22\x2f\x3e\x0a\x09\x3c\x2f\x67\
+\x3e\x0a\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x05\x58\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\
+\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x37\
+\x38\x2e\x39\x2c\x38\x32\x2e\x37\x63\x2d\x34\x2e\x37\x2c\x30\x2d\
+\x38\x2e\x36\x2d\x33\x2e\x39\x2d\x38\x2e\x36\x2d\x38\x2e\x36\x73\
+\x33\x2e\x39\x2d\x38\x2e\x36\x2c\x38\x2e\x36\x2d\x38\x2e\x36\x73\
+\x38\x2e\x36\x2c\x33\x2e\x39\x2c\x38\x2e\x36\x2c\x38\x2e\x36\x53\
+\x38\x33\x2e\x36\x2c\x38\x32\x2e\x37\x2c\x37\x38\x2e\x39\x2c\x38\
+\x32\x2e\x37\x7a\x20\x4d\x37\x38\x2e\x39\x2c\x37\x31\x2e\x31\x63\
+\x2d\x31\x2e\x37\x2c\x30\x2d\x33\x2c\x31\x2e\x33\x2d\x33\x2c\x33\
+\x0a\x09\x73\x31\x2e\x33\x2c\x33\x2c\x33\x2c\x33\x73\x33\x2d\x31\
+\x2e\x33\x2c\x33\x2d\x33\x53\x38\x30\x2e\x36\x2c\x37\x31\x2e\x31\
+\x2c\x37\x38\x2e\x39\x2c\x37\x31\x2e\x31\x7a\x22\x2f\x3e\x0a\x3c\
+\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x34\x39\x2e\x31\x2c\x33\x31\
+\x63\x2d\x34\x2e\x37\x2c\x30\x2d\x38\x2e\x36\x2d\x33\x2e\x39\x2d\
+\x38\x2e\x36\x2d\x38\x2e\x36\x73\x33\x2e\x39\x2d\x38\x2e\x36\x2c\
+\x38\x2e\x36\x2d\x38\x2e\x36\x63\x34\x2e\x37\x2c\x30\x2c\x38\x2e\
+\x36\x2c\x33\x2e\x39\x2c\x38\x2e\x36\x2c\x38\x2e\x36\x53\x35\x33\
+\x2e\x38\x2c\x33\x31\x2c\x34\x39\x2e\x31\x2c\x33\x31\x7a\x20\x4d\
+\x34\x39\x2e\x31\x2c\x31\x39\x2e\x34\x63\x2d\x31\x2e\x37\x2c\x30\
+\x2d\x33\x2c\x31\x2e\x33\x2d\x33\x2c\x33\x0a\x09\x73\x31\x2e\x33\
+\x2c\x33\x2c\x33\x2c\x33\x73\x33\x2d\x31\x2e\x33\x2c\x33\x2d\x33\
+\x53\x35\x30\x2e\x38\x2c\x31\x39\x2e\x34\x2c\x34\x39\x2e\x31\x2c\
+\x31\x39\x2e\x34\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\
+\x3d\x22\x4d\x31\x39\x2e\x37\x2c\x38\x32\x2e\x37\x63\x2d\x34\x2e\
+\x37\x2c\x30\x2d\x38\x2e\x36\x2d\x33\x2e\x39\x2d\x38\x2e\x36\x2d\
+\x38\x2e\x36\x73\x33\x2e\x39\x2d\x38\x2e\x36\x2c\x38\x2e\x36\x2d\
+\x38\x2e\x36\x73\x38\x2e\x36\x2c\x33\x2e\x39\x2c\x38\x2e\x36\x2c\
+\x38\x2e\x36\x53\x32\x34\x2e\x34\x2c\x38\x32\x2e\x37\x2c\x31\x39\
+\x2e\x37\x2c\x38\x32\x2e\x37\x7a\x20\x4d\x31\x39\x2e\x37\x2c\x37\
+\x31\x2e\x31\x63\x2d\x31\x2e\x37\x2c\x30\x2d\x33\x2c\x31\x2e\x33\
+\x2d\x33\x2c\x33\x0a\x09\x73\x31\x2e\x33\x2c\x33\x2c\x33\x2c\x33\
+\x73\x33\x2d\x31\x2e\x33\x2c\x33\x2d\x33\x53\x32\x31\x2e\x34\x2c\
+\x37\x31\x2e\x31\x2c\x31\x39\x2e\x37\x2c\x37\x31\x2e\x31\x7a\x22\
+\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x32\x36\x2e\x37\
+\x22\x20\x79\x3d\x22\x37\x31\x2e\x33\x22\x20\x77\x69\x64\x74\x68\
+\x3d\x22\x34\x35\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x35\x2e\
+\x36\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x31\x31\
+\x2e\x34\x22\x20\x79\x3d\x22\x34\x34\x2e\x35\x22\x20\x74\x72\x61\
+\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\x30\
+\x2e\x34\x39\x39\x35\x20\x2d\x30\x2e\x38\x36\x36\x33\x20\x30\x2e\
+\x38\x36\x36\x33\x20\x30\x2e\x34\x39\x39\x35\x20\x2d\x32\x33\x2e\
+\x35\x38\x34\x34\x20\x35\x33\x2e\x37\x37\x37\x29\x22\x20\x77\x69\
+\x64\x74\x68\x3d\x22\x34\x36\x2e\x36\x22\x20\x68\x65\x69\x67\x68\
+\x74\x3d\x22\x35\x2e\x36\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\
+\x78\x3d\x22\x36\x31\x2e\x31\x22\x20\x79\x3d\x22\x32\x34\x2e\x32\
+\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\x74\
+\x72\x69\x78\x28\x30\x2e\x38\x36\x36\x38\x20\x2d\x30\x2e\x34\x39\
+\x38\x36\x20\x30\x2e\x34\x39\x38\x36\x20\x30\x2e\x38\x36\x36\x38\
+\x20\x2d\x31\x35\x2e\x34\x33\x30\x33\x20\x33\x38\x2e\x32\x33\x31\
+\x31\x29\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x35\x2e\x36\x22\x20\
+\x68\x65\x69\x67\x68\x74\x3d\x22\x34\x37\x2e\x35\x22\x2f\x3e\x0a\
+\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x05\x60\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\
+\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x37\x38\x2e\x39\x2c\x38\x32\x2e\x37\
+\x63\x2d\x34\x2e\x37\x2c\x30\x2d\x38\x2e\x36\x2d\x33\x2e\x39\x2d\
+\x38\x2e\x36\x2d\x38\x2e\x36\x73\x33\x2e\x39\x2d\x38\x2e\x36\x2c\
+\x38\x2e\x36\x2d\x38\x2e\x36\x73\x38\x2e\x36\x2c\x33\x2e\x39\x2c\
+\x38\x2e\x36\x2c\x38\x2e\x36\x53\x38\x33\x2e\x36\x2c\x38\x32\x2e\
+\x37\x2c\x37\x38\x2e\x39\x2c\x38\x32\x2e\x37\x7a\x20\x4d\x37\x38\
+\x2e\x39\x2c\x37\x31\x2e\x31\x63\x2d\x31\x2e\x37\x2c\x30\x2d\x33\
+\x2c\x31\x2e\x33\x2d\x33\x2c\x33\x0a\x09\x73\x31\x2e\x33\x2c\x33\
+\x2c\x33\x2c\x33\x73\x33\x2d\x31\x2e\x33\x2c\x33\x2d\x33\x53\x38\
+\x30\x2e\x36\x2c\x37\x31\x2e\x31\x2c\x37\x38\x2e\x39\x2c\x37\x31\
+\x2e\x31\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\
+\x4d\x34\x39\x2e\x31\x2c\x33\x31\x63\x2d\x34\x2e\x37\x2c\x30\x2d\
+\x38\x2e\x36\x2d\x33\x2e\x39\x2d\x38\x2e\x36\x2d\x38\x2e\x36\x73\
+\x33\x2e\x39\x2d\x38\x2e\x36\x2c\x38\x2e\x36\x2d\x38\x2e\x36\x63\
+\x34\x2e\x37\x2c\x30\x2c\x38\x2e\x36\x2c\x33\x2e\x39\x2c\x38\x2e\
+\x36\x2c\x38\x2e\x36\x53\x35\x33\x2e\x38\x2c\x33\x31\x2c\x34\x39\
+\x2e\x31\x2c\x33\x31\x7a\x20\x4d\x34\x39\x2e\x31\x2c\x31\x39\x2e\
+\x34\x63\x2d\x31\x2e\x37\x2c\x30\x2d\x33\x2c\x31\x2e\x33\x2d\x33\
+\x2c\x33\x0a\x09\x73\x31\x2e\x33\x2c\x33\x2c\x33\x2c\x33\x73\x33\
+\x2d\x31\x2e\x33\x2c\x33\x2d\x33\x53\x35\x30\x2e\x38\x2c\x31\x39\
+\x2e\x34\x2c\x34\x39\x2e\x31\x2c\x31\x39\x2e\x34\x7a\x22\x2f\x3e\
+\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x39\x2e\x37\x2c\
+\x38\x32\x2e\x37\x63\x2d\x34\x2e\x37\x2c\x30\x2d\x38\x2e\x36\x2d\
+\x33\x2e\x39\x2d\x38\x2e\x36\x2d\x38\x2e\x36\x73\x33\x2e\x39\x2d\
+\x38\x2e\x36\x2c\x38\x2e\x36\x2d\x38\x2e\x36\x73\x38\x2e\x36\x2c\
+\x33\x2e\x39\x2c\x38\x2e\x36\x2c\x38\x2e\x36\x53\x32\x34\x2e\x34\
+\x2c\x38\x32\x2e\x37\x2c\x31\x39\x2e\x37\x2c\x38\x32\x2e\x37\x7a\
+\x20\x4d\x31\x39\x2e\x37\x2c\x37\x31\x2e\x31\x63\x2d\x31\x2e\x37\
+\x2c\x30\x2d\x33\x2c\x31\x2e\x33\x2d\x33\x2c\x33\x0a\x09\x73\x31\
+\x2e\x33\x2c\x33\x2c\x33\x2c\x33\x73\x33\x2d\x31\x2e\x33\x2c\x33\
+\x2d\x33\x53\x32\x31\x2e\x34\x2c\x37\x31\x2e\x31\x2c\x31\x39\x2e\
+\x37\x2c\x37\x31\x2e\x31\x7a\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\
+\x20\x78\x3d\x22\x32\x36\x2e\x37\x22\x20\x79\x3d\x22\x37\x31\x2e\
+\x33\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x34\x35\x22\x20\x68\x65\
+\x69\x67\x68\x74\x3d\x22\x35\x2e\x36\x22\x2f\x3e\x0a\x3c\x72\x65\
+\x63\x74\x20\x78\x3d\x22\x31\x31\x2e\x34\x22\x20\x79\x3d\x22\x34\
+\x34\x2e\x35\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\
+\x6d\x61\x74\x72\x69\x78\x28\x30\x2e\x34\x39\x39\x35\x20\x2d\x30\
+\x2e\x38\x36\x36\x33\x20\x30\x2e\x38\x36\x36\x33\x20\x30\x2e\x34\
+\x39\x39\x35\x20\x2d\x32\x33\x2e\x35\x38\x34\x34\x20\x35\x33\x2e\
+\x37\x37\x37\x29\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x34\x36\x2e\
+\x36\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x35\x2e\x36\x22\x2f\
+\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x36\x31\x2e\x31\x22\
+\x20\x79\x3d\x22\x32\x34\x2e\x32\x22\x20\x74\x72\x61\x6e\x73\x66\
+\x6f\x72\x6d\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\x30\x2e\x38\x36\
+\x36\x38\x20\x2d\x30\x2e\x34\x39\x38\x36\x20\x30\x2e\x34\x39\x38\
+\x36\x20\x30\x2e\x38\x36\x36\x38\x20\x2d\x31\x35\x2e\x34\x33\x30\
+\x33\x20\x33\x38\x2e\x32\x33\x31\x31\x29\x22\x20\x77\x69\x64\x74\
+\x68\x3d\x22\x35\x2e\x36\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\
+\x34\x37\x2e\x35\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x09\xdb\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\
+\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x67\x20\
+\x69\x64\x3d\x22\x4c\x61\x79\x65\x72\x5f\x31\x37\x22\x3e\x0a\x09\
+\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x34\x38\x2e\x34\x2c\x33\
+\x34\x2e\x39\x63\x31\x2e\x34\x2d\x31\x2e\x34\x2c\x33\x2e\x38\x2d\
+\x31\x2e\x34\x2c\x35\x2e\x32\x2c\x30\x6c\x31\x2e\x31\x2c\x31\x2e\
+\x31\x6c\x31\x30\x2e\x34\x2d\x31\x30\x2e\x33\x63\x32\x2e\x39\x2d\
+\x32\x2e\x39\x2c\x37\x2e\x36\x2d\x32\x2e\x39\x2c\x31\x30\x2e\x35\
+\x2c\x30\x63\x32\x2e\x39\x2c\x32\x2e\x39\x2c\x32\x2e\x39\x2c\x37\
+\x2e\x36\x2c\x30\x2c\x31\x30\x2e\x35\x4c\x36\x35\x2e\x32\x2c\x34\
+\x36\x2e\x35\x6c\x31\x2e\x31\x2c\x31\x2e\x31\x0a\x09\x09\x63\x31\
+\x2e\x34\x2c\x31\x2e\x34\x2c\x31\x2e\x34\x2c\x33\x2e\x38\x2c\x30\
+\x2c\x35\x2e\x32\x63\x2d\x31\x2e\x34\x2c\x31\x2e\x34\x2d\x33\x2e\
+\x38\x2c\x31\x2e\x34\x2d\x35\x2e\x32\x2c\x30\x4c\x34\x38\x2e\x34\
+\x2c\x34\x30\x2e\x32\x43\x34\x36\x2e\x39\x2c\x33\x38\x2e\x37\x2c\
+\x34\x36\x2e\x39\x2c\x33\x36\x2e\x34\x2c\x34\x38\x2e\x34\x2c\x33\
+\x34\x2e\x39\x7a\x22\x2f\x3e\x0a\x09\x3c\x70\x6f\x6c\x79\x67\x6f\
+\x6e\x20\x70\x6f\x69\x6e\x74\x73\x3d\x22\x34\x37\x2e\x34\x2c\x36\
+\x34\x2e\x33\x20\x33\x36\x2e\x32\x2c\x37\x35\x2e\x34\x20\x32\x35\
+\x2e\x38\x2c\x37\x35\x2e\x34\x20\x32\x35\x2e\x38\x2c\x36\x35\x20\
+\x32\x36\x2e\x35\x2c\x36\x34\x2e\x33\x20\x32\x36\x2e\x35\x2c\x36\
+\x34\x2e\x33\x20\x09\x22\x2f\x3e\x0a\x09\x3c\x70\x61\x74\x68\x20\
+\x64\x3d\x22\x4d\x37\x36\x2e\x38\x2c\x33\x37\x2e\x34\x63\x31\x2e\
+\x38\x2d\x31\x2e\x38\x2c\x32\x2e\x38\x2d\x34\x2e\x32\x2c\x32\x2e\
+\x37\x2d\x36\x2e\x35\x63\x30\x2d\x32\x2e\x34\x2d\x30\x2e\x39\x2d\
+\x34\x2e\x37\x2d\x32\x2e\x37\x2d\x36\x2e\x35\x6c\x30\x2c\x30\x63\
+\x30\x2c\x30\x2c\x30\x2c\x30\x2c\x30\x2c\x30\x63\x30\x2c\x30\x2c\
+\x30\x2c\x30\x2c\x30\x2c\x30\x6c\x30\x2c\x30\x63\x2d\x31\x2e\x38\
+\x2d\x31\x2e\x38\x2d\x34\x2e\x32\x2d\x32\x2e\x37\x2d\x36\x2e\x35\
+\x2d\x32\x2e\x37\x0a\x09\x09\x63\x2d\x32\x2e\x34\x2c\x30\x2d\x34\
+\x2e\x37\x2c\x30\x2e\x39\x2d\x36\x2e\x35\x2c\x32\x2e\x37\x6c\x30\
+\x2c\x30\x6c\x2d\x39\x2e\x31\x2c\x39\x2e\x31\x63\x2d\x31\x2d\x30\
+\x2e\x39\x2d\x32\x2e\x34\x2d\x31\x2e\x34\x2d\x33\x2e\x37\x2d\x31\
+\x2e\x34\x63\x2d\x31\x2e\x34\x2c\x30\x2d\x32\x2e\x38\x2c\x30\x2e\
+\x35\x2d\x33\x2e\x39\x2c\x31\x2e\x36\x63\x2d\x31\x2e\x31\x2c\x31\
+\x2e\x31\x2d\x31\x2e\x36\x2c\x32\x2e\x35\x2d\x31\x2e\x36\x2c\x33\
+\x2e\x39\x0a\x09\x09\x63\x30\x2c\x31\x2e\x33\x2c\x30\x2e\x35\x2c\
+\x32\x2e\x36\x2c\x31\x2e\x34\x2c\x33\x2e\x37\x4c\x32\x35\x2e\x32\
+\x2c\x36\x32\x2e\x39\x63\x30\x2c\x30\x2d\x30\x2e\x31\x2c\x30\x2d\
+\x30\x2e\x31\x2c\x30\x2e\x31\x6c\x30\x2c\x30\x6c\x2d\x30\x2e\x37\
+\x2c\x30\x2e\x37\x43\x32\x34\x2e\x31\x2c\x36\x34\x2c\x32\x34\x2c\
+\x36\x34\x2e\x35\x2c\x32\x34\x2c\x36\x35\x76\x39\x2e\x37\x6c\x2d\
+\x33\x2e\x32\x2c\x33\x2e\x32\x63\x2d\x30\x2e\x37\x2c\x30\x2e\x37\
+\x2d\x30\x2e\x37\x2c\x31\x2e\x39\x2c\x30\x2c\x32\x2e\x36\x0a\x09\
+\x09\x63\x30\x2e\x37\x2c\x30\x2e\x37\x2c\x31\x2e\x39\x2c\x30\x2e\
+\x37\x2c\x32\x2e\x36\x2c\x30\x6c\x33\x2e\x31\x2d\x33\x2e\x31\x6c\
+\x39\x2e\x37\x2c\x30\x63\x30\x2e\x35\x2c\x30\x2c\x31\x2d\x30\x2e\
+\x32\x2c\x31\x2e\x33\x2d\x30\x2e\x35\x6c\x31\x31\x2e\x32\x2d\x31\
+\x31\x2e\x31\x4c\x36\x30\x2c\x35\x34\x2e\x33\x63\x31\x2c\x30\x2e\
+\x39\x2c\x32\x2e\x34\x2c\x31\x2e\x34\x2c\x33\x2e\x37\x2c\x31\x2e\
+\x34\x63\x31\x2e\x34\x2c\x30\x2c\x32\x2e\x38\x2d\x30\x2e\x35\x2c\
+\x33\x2e\x39\x2d\x31\x2e\x36\x0a\x09\x09\x63\x31\x2e\x31\x2d\x31\
+\x2e\x31\x2c\x31\x2e\x36\x2d\x32\x2e\x35\x2c\x31\x2e\x36\x2d\x33\
+\x2e\x39\x63\x30\x2d\x31\x2e\x33\x2d\x30\x2e\x35\x2d\x32\x2e\x36\
+\x2d\x31\x2e\x34\x2d\x33\x2e\x37\x4c\x37\x36\x2e\x38\x2c\x33\x37\
+\x2e\x34\x4c\x37\x36\x2e\x38\x2c\x33\x37\x2e\x34\x7a\x20\x4d\x34\
+\x36\x2e\x31\x2c\x36\x33\x4c\x33\x35\x2e\x35\x2c\x37\x33\x2e\x35\
+\x6c\x2d\x37\x2e\x38\x2c\x30\x76\x2d\x37\x2e\x39\x6c\x30\x2e\x31\
+\x2d\x30\x2e\x31\x63\x30\x2c\x30\x2c\x30\x2e\x31\x2c\x30\x2c\x30\
+\x2e\x31\x2d\x30\x2e\x31\x0a\x09\x09\x4c\x34\x39\x2e\x33\x2c\x34\
+\x34\x6c\x37\x2e\x39\x2c\x37\x2e\x39\x4c\x34\x36\x2e\x31\x2c\x36\
+\x33\x7a\x20\x4d\x37\x34\x2e\x32\x2c\x33\x34\x2e\x38\x4c\x37\x34\
+\x2e\x32\x2c\x33\x34\x2e\x38\x4c\x36\x33\x2e\x39\x2c\x34\x35\x2e\
+\x32\x63\x2d\x30\x2e\x37\x2c\x30\x2e\x37\x2d\x30\x2e\x37\x2c\x31\
+\x2e\x39\x2c\x30\x2c\x32\x2e\x36\x63\x30\x2e\x32\x2c\x30\x2e\x32\
+\x2c\x30\x2e\x34\x2c\x30\x2e\x33\x2c\x30\x2e\x37\x2c\x30\x2e\x34\
+\x0a\x09\x09\x63\x30\x2e\x31\x2c\x30\x2e\x32\x2c\x30\x2e\x32\x2c\
+\x30\x2e\x35\x2c\x30\x2e\x34\x2c\x30\x2e\x37\x63\x30\x2e\x34\x2c\
+\x30\x2e\x34\x2c\x30\x2e\x35\x2c\x30\x2e\x38\x2c\x30\x2e\x35\x2c\
+\x31\x2e\x33\x63\x30\x2c\x30\x2e\x35\x2d\x30\x2e\x32\x2c\x30\x2e\
+\x39\x2d\x30\x2e\x35\x2c\x31\x2e\x33\x63\x2d\x30\x2e\x34\x2c\x30\
+\x2e\x34\x2d\x30\x2e\x38\x2c\x30\x2e\x35\x2d\x31\x2e\x33\x2c\x30\
+\x2e\x35\x63\x2d\x30\x2e\x35\x2c\x30\x2d\x30\x2e\x39\x2d\x30\x2e\
+\x32\x2d\x31\x2e\x33\x2d\x30\x2e\x35\x0a\x09\x09\x4c\x34\x39\x2e\
+\x37\x2c\x33\x38\x2e\x39\x63\x2d\x30\x2e\x34\x2d\x30\x2e\x34\x2d\
+\x30\x2e\x35\x2d\x30\x2e\x38\x2d\x30\x2e\x35\x2d\x31\x2e\x33\x63\
+\x30\x2d\x30\x2e\x35\x2c\x30\x2e\x32\x2d\x30\x2e\x39\x2c\x30\x2e\
+\x35\x2d\x31\x2e\x33\x63\x30\x2e\x34\x2d\x30\x2e\x34\x2c\x30\x2e\
+\x38\x2d\x30\x2e\x35\x2c\x31\x2e\x33\x2d\x30\x2e\x35\x63\x30\x2e\
+\x35\x2c\x30\x2c\x30\x2e\x39\x2c\x30\x2e\x32\x2c\x31\x2e\x33\x2c\
+\x30\x2e\x35\x0a\x09\x09\x63\x30\x2e\x32\x2c\x30\x2e\x32\x2c\x30\
+\x2e\x34\x2c\x30\x2e\x33\x2c\x30\x2e\x37\x2c\x30\x2e\x34\x63\x30\
+\x2e\x31\x2c\x30\x2e\x32\x2c\x30\x2e\x32\x2c\x30\x2e\x35\x2c\x30\
+\x2e\x34\x2c\x30\x2e\x37\x63\x30\x2e\x37\x2c\x30\x2e\x37\x2c\x31\
+\x2e\x39\x2c\x30\x2e\x37\x2c\x32\x2e\x36\x2c\x30\x4c\x36\x36\x2e\
+\x34\x2c\x32\x37\x6c\x30\x2c\x30\x63\x31\x2e\x31\x2d\x31\x2e\x31\
+\x2c\x32\x2e\x35\x2d\x31\x2e\x36\x2c\x33\x2e\x39\x2d\x31\x2e\x36\
+\x0a\x09\x09\x63\x31\x2e\x34\x2c\x30\x2c\x32\x2e\x38\x2c\x30\x2e\
+\x35\x2c\x33\x2e\x39\x2c\x31\x2e\x36\x6c\x30\x2c\x30\x63\x31\x2e\
+\x31\x2c\x31\x2e\x31\x2c\x31\x2e\x36\x2c\x32\x2e\x35\x2c\x31\x2e\
+\x36\x2c\x33\x2e\x39\x43\x37\x35\x2e\x39\x2c\x33\x32\x2e\x33\x2c\
+\x37\x35\x2e\x33\x2c\x33\x33\x2e\x37\x2c\x37\x34\x2e\x32\x2c\x33\
+\x34\x2e\x38\x7a\x22\x2f\x3e\x0a\x09\x3c\x70\x61\x74\x68\x20\x64\
+\x3d\x22\x4d\x36\x31\x2e\x38\x2c\x34\x35\x2e\x37\x6c\x32\x2e\x31\
+\x2c\x32\x2e\x31\x6c\x31\x2e\x31\x2c\x31\x2e\x31\x63\x30\x2e\x37\
+\x2c\x30\x2e\x37\x2c\x31\x2e\x39\x2c\x30\x2e\x37\x2c\x32\x2e\x36\
+\x2c\x30\x63\x30\x2e\x37\x2d\x30\x2e\x37\x2c\x30\x2e\x37\x2d\x31\
+\x2e\x39\x2c\x30\x2d\x32\x2e\x36\x6c\x2d\x31\x2e\x31\x2d\x31\x2e\
+\x31\x6c\x2d\x32\x2e\x31\x2d\x32\x2e\x31\x63\x2d\x30\x2e\x37\x2d\
+\x30\x2e\x37\x2d\x31\x2e\x39\x2d\x30\x2e\x37\x2d\x32\x2e\x36\x2c\
+\x30\x0a\x09\x09\x43\x36\x31\x2e\x31\x2c\x34\x33\x2e\x38\x2c\x36\
+\x31\x2e\x31\x2c\x34\x35\x2c\x36\x31\x2e\x38\x2c\x34\x35\x2e\x37\
+\x4c\x36\x31\x2e\x38\x2c\x34\x35\x2e\x37\x7a\x22\x2f\x3e\x0a\x09\
+\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x35\x32\x2e\x33\x2c\x33\
+\x36\x2e\x32\x6c\x31\x2e\x31\x2c\x31\x2e\x31\x6c\x32\x2e\x31\x2c\
+\x32\x2e\x31\x63\x30\x2e\x37\x2c\x30\x2e\x37\x2c\x31\x2e\x39\x2c\
+\x30\x2e\x37\x2c\x32\x2e\x36\x2c\x30\x63\x30\x2e\x37\x2d\x30\x2e\
+\x37\x2c\x30\x2e\x37\x2d\x31\x2e\x39\x2c\x30\x2d\x32\x2e\x36\x4c\
+\x35\x36\x2c\x33\x34\x2e\x37\x6c\x2d\x31\x2e\x31\x2d\x31\x2e\x31\
+\x63\x2d\x30\x2e\x37\x2d\x30\x2e\x37\x2d\x31\x2e\x39\x2d\x30\x2e\
+\x37\x2d\x32\x2e\x36\x2c\x30\x0a\x09\x09\x43\x35\x31\x2e\x36\x2c\
+\x33\x34\x2e\x33\x2c\x35\x31\x2e\x36\x2c\x33\x35\x2e\x35\x2c\x35\
+\x32\x2e\x33\x2c\x33\x36\x2e\x32\x4c\x35\x32\x2e\x33\x2c\x33\x36\
+\x2e\x32\x7a\x22\x2f\x3e\x0a\x09\x3c\x70\x61\x74\x68\x20\x64\x3d\
+\x22\x4d\x32\x36\x2e\x35\x2c\x36\x36\x2e\x31\x4c\x32\x36\x2e\x35\
+\x2c\x36\x36\x2e\x31\x68\x32\x30\x2e\x39\x63\x31\x2c\x30\x2c\x31\
+\x2e\x39\x2d\x30\x2e\x38\x2c\x31\x2e\x39\x2d\x31\x2e\x39\x63\x30\
+\x2d\x31\x2d\x30\x2e\x38\x2d\x31\x2e\x39\x2d\x31\x2e\x39\x2d\x31\
+\x2e\x39\x48\x32\x36\x2e\x35\x68\x30\x63\x2d\x31\x2c\x30\x2d\x31\
+\x2e\x39\x2c\x30\x2e\x38\x2d\x31\x2e\x39\x2c\x31\x2e\x39\x0a\x09\
+\x09\x43\x32\x34\x2e\x36\x2c\x36\x35\x2e\x33\x2c\x32\x35\x2e\x35\
+\x2c\x36\x36\x2e\x31\x2c\x32\x36\x2e\x35\x2c\x36\x36\x2e\x31\x4c\
+\x32\x36\x2e\x35\x2c\x36\x36\x2e\x31\x7a\x22\x2f\x3e\x0a\x3c\x2f\
+\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x03\xd0\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\
+\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x33\
+\x32\x2e\x34\x2c\x35\x33\x2e\x35\x48\x32\x33\x63\x2d\x32\x2e\x38\
+\x2c\x30\x2d\x35\x2d\x32\x2e\x32\x2d\x35\x2d\x35\x56\x32\x33\x63\
+\x30\x2d\x32\x2e\x38\x2c\x32\x2e\x32\x2d\x35\x2c\x35\x2d\x35\x68\
+\x32\x35\x2e\x35\x63\x32\x2e\x38\x2c\x30\x2c\x35\x2c\x32\x2e\x32\
+\x2c\x35\x2c\x35\x76\x31\x30\x2e\x33\x68\x2d\x36\x56\x32\x34\x48\
+\x32\x34\x76\x32\x33\x2e\x35\x68\x38\x2e\x34\x56\x35\x33\x2e\x35\
+\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x37\
+\x35\x2e\x37\x2c\x38\x31\x2e\x33\x48\x35\x30\x2e\x31\x63\x2d\x32\
+\x2e\x38\x2c\x30\x2d\x35\x2d\x32\x2e\x32\x2d\x35\x2d\x35\x56\x36\
+\x35\x2e\x32\x68\x36\x76\x31\x30\x2e\x31\x68\x32\x33\x2e\x36\x56\
+\x35\x31\x2e\x38\x68\x2d\x39\x2e\x35\x76\x2d\x36\x68\x31\x30\x2e\
+\x35\x63\x32\x2e\x38\x2c\x30\x2c\x35\x2c\x32\x2e\x32\x2c\x35\x2c\
+\x35\x76\x32\x35\x2e\x35\x43\x38\x30\x2e\x37\x2c\x37\x39\x2e\x31\
+\x2c\x37\x38\x2e\x35\x2c\x38\x31\x2e\x33\x2c\x37\x35\x2e\x37\x2c\
+\x38\x31\x2e\x33\x7a\x0a\x09\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\
+\x20\x64\x3d\x22\x4d\x36\x31\x2e\x38\x2c\x36\x37\x2e\x34\x48\x33\
+\x36\x2e\x33\x63\x2d\x32\x2e\x38\x2c\x30\x2d\x35\x2d\x32\x2e\x32\
+\x2d\x35\x2d\x35\x56\x33\x36\x2e\x39\x63\x30\x2d\x32\x2e\x38\x2c\
+\x32\x2e\x32\x2d\x35\x2c\x35\x2d\x35\x68\x32\x35\x2e\x35\x63\x32\
+\x2e\x38\x2c\x30\x2c\x35\x2c\x32\x2e\x32\x2c\x35\x2c\x35\x76\x32\
+\x35\x2e\x35\x43\x36\x36\x2e\x38\x2c\x36\x35\x2e\x32\x2c\x36\x34\
+\x2e\x36\x2c\x36\x37\x2e\x34\x2c\x36\x31\x2e\x38\x2c\x36\x37\x2e\
+\x34\x7a\x0a\x09\x20\x4d\x33\x37\x2e\x33\x2c\x36\x31\x2e\x34\x68\
+\x32\x33\x2e\x35\x56\x33\x37\x2e\x39\x48\x33\x37\x2e\x33\x56\x36\
+\x31\x2e\x34\x7a\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x02\x6d\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x34\x2e\x30\x2e\x30\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\
+\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x70\x6f\
+\x69\x6e\x74\x73\x3d\x22\x35\x30\x2c\x37\x39\x2e\x31\x20\x39\x37\
+\x2e\x34\x2c\x32\x30\x2e\x39\x20\x32\x2e\x36\x2c\x32\x30\x2e\x39\
+\x20\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x04\x53\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\
+\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x67\x20\x69\x64\x3d\x22\x53\x6f\x6c\x69\
+\x64\x22\x3e\x0a\x09\x3c\x67\x3e\x0a\x09\x09\x3c\x70\x6f\x6c\x79\
+\x67\x6f\x6e\x20\x70\x6f\x69\x6e\x74\x73\x3d\x22\x37\x30\x2e\x37\
+\x2c\x33\x36\x2e\x35\x20\x38\x35\x2e\x33\x2c\x33\x36\x2e\x35\x20\
+\x38\x35\x2e\x33\x2c\x32\x39\x2e\x32\x20\x37\x30\x2e\x37\x2c\x32\
+\x39\x2e\x32\x20\x36\x33\x2e\x35\x2c\x32\x39\x2e\x32\x20\x34\x38\
+\x2e\x39\x2c\x32\x39\x2e\x32\x20\x34\x38\x2e\x39\x2c\x33\x36\x2e\
+\x35\x20\x36\x33\x2e\x35\x2c\x33\x36\x2e\x35\x20\x09\x09\x22\x2f\
+\x3e\x0a\x09\x3c\x2f\x67\x3e\x0a\x3c\x2f\x67\x3e\x0a\x3c\x67\x20\
+\x69\x64\x3d\x22\x4f\x75\x74\x6c\x69\x6e\x65\x22\x3e\x0a\x09\x3c\
+\x67\x3e\x0a\x09\x09\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x33\
+\x35\x2e\x34\x2c\x38\x35\x2e\x39\x63\x2d\x30\x2e\x39\x2c\x30\x2d\
+\x31\x2e\x38\x2d\x30\x2e\x36\x2d\x32\x2e\x32\x2d\x31\x2e\x35\x4c\
+\x31\x36\x2e\x38\x2c\x34\x34\x2e\x35\x63\x2d\x30\x2e\x34\x2d\x30\
+\x2e\x39\x2d\x30\x2e\x32\x2d\x31\x2e\x39\x2c\x30\x2e\x35\x2d\x32\
+\x2e\x36\x63\x30\x2e\x37\x2d\x30\x2e\x37\x2c\x31\x2e\x37\x2d\x30\
+\x2e\x39\x2c\x32\x2e\x36\x2d\x30\x2e\x35\x6c\x33\x39\x2e\x39\x2c\
+\x31\x36\x2e\x34\x0a\x09\x09\x09\x63\x30\x2e\x39\x2c\x30\x2e\x34\
+\x2c\x31\x2e\x35\x2c\x31\x2e\x33\x2c\x31\x2e\x34\x2c\x32\x2e\x33\
+\x73\x2d\x30\x2e\x38\x2c\x31\x2e\x39\x2d\x31\x2e\x38\x2c\x32\x2e\
+\x31\x4c\x34\x32\x2c\x36\x36\x2e\x36\x4c\x33\x37\x2e\x36\x2c\x38\
+\x34\x63\x2d\x30\x2e\x32\x2c\x31\x2d\x31\x2e\x31\x2c\x31\x2e\x37\
+\x2d\x32\x2e\x31\x2c\x31\x2e\x38\x43\x33\x35\x2e\x35\x2c\x38\x35\
+\x2e\x39\x2c\x33\x35\x2e\x35\x2c\x38\x35\x2e\x39\x2c\x33\x35\x2e\
+\x34\x2c\x38\x35\x2e\x39\x7a\x20\x4d\x32\x33\x2e\x33\x2c\x34\x37\
+\x2e\x39\x0a\x09\x09\x09\x4c\x33\x34\x2e\x39\x2c\x37\x36\x6c\x33\
+\x2d\x31\x31\x2e\x39\x63\x30\x2e\x32\x2d\x30\x2e\x38\x2c\x30\x2e\
+\x39\x2d\x31\x2e\x35\x2c\x31\x2e\x37\x2d\x31\x2e\x37\x6c\x31\x31\
+\x2e\x39\x2d\x33\x4c\x32\x33\x2e\x33\x2c\x34\x37\x2e\x39\x7a\x22\
+\x2f\x3e\x0a\x09\x3c\x2f\x67\x3e\x0a\x3c\x2f\x67\x3e\x0a\x3c\x70\
+\x6f\x6c\x79\x67\x6f\x6e\x20\x70\x6f\x69\x6e\x74\x73\x3d\x22\x32\
+\x31\x2e\x37\x2c\x34\x36\x2e\x36\x20\x33\x34\x2e\x35\x2c\x37\x38\
+\x2e\x33\x20\x33\x39\x2e\x33\x2c\x36\x35\x2e\x37\x20\x35\x33\x2e\
+\x39\x2c\x35\x39\x2e\x35\x20\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\
+\x3e\x0a\
+\x00\x00\x03\xc5\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x36\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\
+\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x38\x34\x2e\x39\x2c\x34\x35\x2e\x33\
+\x6c\x2d\x36\x2e\x38\x2d\x36\x2e\x38\x56\x32\x31\x2e\x39\x63\x30\
+\x2d\x32\x2e\x36\x2d\x32\x2e\x31\x2d\x34\x2e\x37\x2d\x34\x2e\x37\
+\x2d\x34\x2e\x37\x68\x2d\x34\x2e\x37\x63\x2d\x32\x2e\x36\x2c\x30\
+\x2d\x34\x2e\x37\x2c\x32\x2e\x31\x2d\x34\x2e\x37\x2c\x34\x2e\x37\
+\x76\x32\x2e\x36\x6c\x2d\x39\x2e\x34\x2d\x39\x2e\x34\x63\x2d\x31\
+\x2e\x33\x2d\x31\x2e\x32\x2d\x32\x2e\x35\x2d\x32\x2e\x36\x2d\x34\
+\x2e\x37\x2d\x32\x2e\x36\x0a\x09\x73\x2d\x33\x2e\x34\x2c\x31\x2e\
+\x34\x2d\x34\x2e\x37\x2c\x32\x2e\x36\x4c\x31\x35\x2e\x31\x2c\x34\
+\x35\x2e\x33\x63\x2d\x31\x2e\x35\x2c\x31\x2e\x35\x2d\x32\x2e\x36\
+\x2c\x32\x2e\x36\x2d\x32\x2e\x36\x2c\x34\x2e\x37\x63\x30\x2c\x32\
+\x2e\x36\x2c\x32\x2c\x34\x2e\x37\x2c\x34\x2e\x37\x2c\x34\x2e\x37\
+\x68\x34\x2e\x37\x76\x32\x38\x2e\x31\x63\x30\x2c\x32\x2e\x36\x2c\
+\x32\x2e\x31\x2c\x34\x2e\x37\x2c\x34\x2e\x37\x2c\x34\x2e\x37\x68\
+\x31\x34\x2e\x31\x56\x36\x34\x2e\x31\x0a\x09\x63\x30\x2d\x32\x2e\
+\x36\x2c\x32\x2e\x31\x2d\x34\x2e\x37\x2c\x34\x2e\x37\x2d\x34\x2e\
+\x37\x68\x39\x2e\x34\x63\x32\x2e\x36\x2c\x30\x2c\x34\x2e\x37\x2c\
+\x32\x2e\x31\x2c\x34\x2e\x37\x2c\x34\x2e\x37\x76\x32\x33\x2e\x34\
+\x68\x31\x34\x2e\x31\x63\x32\x2e\x36\x2c\x30\x2c\x34\x2e\x37\x2d\
+\x32\x2e\x31\x2c\x34\x2e\x37\x2d\x34\x2e\x37\x56\x35\x34\x2e\x37\
+\x68\x34\x2e\x37\x63\x32\x2e\x37\x2c\x30\x2c\x34\x2e\x37\x2d\x32\
+\x2c\x34\x2e\x37\x2d\x34\x2e\x37\x0a\x09\x43\x38\x37\x2e\x35\x2c\
+\x34\x37\x2e\x39\x2c\x38\x36\x2e\x34\x2c\x34\x36\x2e\x38\x2c\x38\
+\x34\x2e\x39\x2c\x34\x35\x2e\x33\x7a\x22\x2f\x3e\x0a\x3c\x2f\x73\
+\x76\x67\x3e\x0a\
+\x00\x00\x06\xb6\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x36\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\
+\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x67\x3e\x0a\x09\x3c\x70\x61\x74\x68\x20\
+\x64\x3d\x22\x4d\x33\x34\x2e\x36\x2c\x31\x36\x2e\x35\x6c\x2d\x31\
+\x32\x2e\x33\x2d\x35\x2e\x31\x63\x2d\x30\x2e\x33\x2d\x30\x2e\x31\
+\x2d\x30\x2e\x36\x2d\x30\x2e\x32\x2d\x30\x2e\x39\x2c\x30\x63\x2d\
+\x30\x2e\x33\x2c\x30\x2e\x31\x2d\x30\x2e\x35\x2c\x30\x2e\x33\x2d\
+\x30\x2e\x36\x2c\x30\x2e\x36\x73\x2d\x30\x2e\x32\x2c\x30\x2e\x36\
+\x2c\x30\x2c\x30\x2e\x39\x6c\x31\x2e\x38\x2c\x34\x2e\x33\x6c\x2d\
+\x33\x2e\x38\x2c\x31\x2e\x35\x0a\x09\x09\x63\x2d\x38\x2c\x33\x2e\
+\x33\x2d\x31\x32\x2e\x31\x2c\x37\x2e\x37\x2d\x31\x32\x2c\x31\x33\
+\x63\x30\x2c\x31\x2e\x38\x2c\x30\x2e\x35\x2c\x33\x2e\x38\x2c\x31\
+\x2e\x35\x2c\x36\x63\x30\x2e\x38\x2c\x31\x2e\x39\x2c\x32\x2e\x35\
+\x2c\x34\x2e\x32\x2c\x35\x2e\x34\x2c\x36\x2e\x38\x63\x30\x2e\x31\
+\x2c\x30\x2e\x31\x2c\x30\x2e\x32\x2c\x30\x2e\x32\x2c\x30\x2e\x33\
+\x2c\x30\x2e\x34\x63\x30\x2e\x31\x2c\x30\x2e\x31\x2c\x30\x2e\x33\
+\x2c\x30\x2e\x33\x2c\x30\x2e\x34\x2c\x30\x2e\x34\x0a\x09\x09\x63\
+\x30\x2e\x31\x2c\x30\x2e\x31\x2c\x30\x2e\x33\x2c\x30\x2e\x33\x2c\
+\x30\x2e\x34\x2c\x30\x2e\x33\x63\x30\x2e\x32\x2c\x30\x2e\x32\x2c\
+\x30\x2e\x34\x2c\x30\x2e\x32\x2c\x30\x2e\x36\x2c\x30\x2e\x31\x63\
+\x30\x2e\x32\x2c\x30\x2c\x30\x2e\x33\x2d\x30\x2e\x32\x2c\x30\x2e\
+\x34\x2d\x30\x2e\x33\x63\x30\x2d\x30\x2e\x32\x2c\x30\x2d\x30\x2e\
+\x34\x2d\x30\x2e\x31\x2d\x30\x2e\x35\x73\x2d\x30\x2e\x31\x2d\x30\
+\x2e\x32\x2d\x30\x2e\x32\x2d\x30\x2e\x34\x0a\x09\x09\x63\x2d\x30\
+\x2e\x31\x2d\x30\x2e\x32\x2d\x30\x2e\x32\x2d\x30\x2e\x33\x2d\x30\
+\x2e\x32\x2d\x30\x2e\x34\x63\x2d\x30\x2e\x34\x2d\x30\x2e\x37\x2d\
+\x30\x2e\x37\x2d\x31\x2e\x34\x2d\x31\x2d\x32\x63\x2d\x30\x2e\x35\
+\x2d\x31\x2e\x31\x2d\x30\x2e\x38\x2d\x32\x2e\x32\x2d\x31\x2d\x33\
+\x2e\x32\x73\x2d\x30\x2e\x32\x2d\x31\x2e\x39\x2d\x30\x2e\x31\x2d\
+\x32\x2e\x37\x63\x30\x2d\x30\x2e\x38\x2c\x30\x2e\x33\x2d\x31\x2e\
+\x36\x2c\x30\x2e\x36\x2d\x32\x2e\x33\x0a\x09\x09\x63\x30\x2e\x34\
+\x2d\x30\x2e\x37\x2c\x30\x2e\x38\x2d\x31\x2e\x34\x2c\x31\x2e\x33\
+\x2d\x32\x63\x30\x2e\x35\x2d\x30\x2e\x36\x2c\x31\x2e\x32\x2d\x31\
+\x2e\x31\x2c\x32\x2d\x31\x2e\x37\x63\x30\x2e\x38\x2d\x30\x2e\x35\
+\x2c\x31\x2e\x36\x2d\x31\x2c\x32\x2e\x34\x2d\x31\x2e\x35\x63\x30\
+\x2e\x38\x2d\x30\x2e\x34\x2c\x31\x2e\x38\x2d\x30\x2e\x38\x2c\x32\
+\x2e\x39\x2d\x31\x2e\x33\x6c\x33\x2e\x38\x2d\x31\x2e\x35\x6c\x31\
+\x2e\x38\x2c\x34\x2e\x33\x0a\x09\x09\x63\x30\x2e\x31\x2c\x30\x2e\
+\x33\x2c\x30\x2e\x33\x2c\x30\x2e\x35\x2c\x30\x2e\x36\x2c\x30\x2e\
+\x36\x63\x30\x2e\x33\x2c\x30\x2e\x31\x2c\x30\x2e\x36\x2c\x30\x2e\
+\x32\x2c\x30\x2e\x39\x2c\x30\x63\x30\x2e\x33\x2d\x30\x2e\x31\x2c\
+\x30\x2e\x35\x2d\x30\x2e\x33\x2c\x30\x2e\x36\x2d\x30\x2e\x36\x6c\
+\x35\x2e\x31\x2d\x31\x32\x2e\x33\x63\x30\x2e\x31\x2d\x30\x2e\x33\
+\x2c\x30\x2e\x32\x2d\x30\x2e\x36\x2c\x30\x2d\x30\x2e\x39\x0a\x09\
+\x09\x43\x33\x35\x2e\x32\x2c\x31\x36\x2e\x38\x2c\x33\x35\x2c\x31\
+\x36\x2e\x36\x2c\x33\x34\x2e\x36\x2c\x31\x36\x2e\x35\x7a\x22\x2f\
+\x3e\x0a\x3c\x2f\x67\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\
+\x4d\x36\x30\x2e\x31\x2c\x38\x38\x2e\x36\x6c\x32\x35\x2e\x34\x2d\
+\x31\x33\x2e\x38\x56\x34\x39\x2e\x35\x6c\x2d\x32\x35\x2e\x34\x2c\
+\x39\x2e\x32\x56\x38\x38\x2e\x36\x7a\x20\x4d\x35\x37\x2e\x36\x2c\
+\x35\x34\x2e\x33\x6c\x32\x37\x2e\x37\x2d\x31\x30\x2e\x31\x4c\x35\
+\x37\x2e\x36\x2c\x33\x34\x2e\x32\x4c\x32\x39\x2e\x39\x2c\x34\x34\
+\x2e\x32\x4c\x35\x37\x2e\x36\x2c\x35\x34\x2e\x33\x7a\x20\x4d\x39\
+\x30\x2e\x35\x2c\x34\x34\x2e\x33\x76\x33\x30\x2e\x34\x0a\x09\x63\
+\x30\x2c\x30\x2e\x39\x2d\x30\x2e\x32\x2c\x31\x2e\x38\x2d\x30\x2e\
+\x37\x2c\x32\x2e\x36\x63\x2d\x30\x2e\x35\x2c\x30\x2e\x38\x2d\x31\
+\x2e\x31\x2c\x31\x2e\x34\x2d\x31\x2e\x39\x2c\x31\x2e\x39\x4c\x36\
+\x30\x2c\x39\x34\x2e\x34\x63\x2d\x30\x2e\x37\x2c\x30\x2e\x34\x2d\
+\x31\x2e\x35\x2c\x30\x2e\x36\x2d\x32\x2e\x34\x2c\x30\x2e\x36\x63\
+\x2d\x30\x2e\x39\x2c\x30\x2d\x31\x2e\x37\x2d\x30\x2e\x32\x2d\x32\
+\x2e\x34\x2d\x30\x2e\x36\x4c\x32\x37\x2e\x33\x2c\x37\x39\x2e\x32\
+\x0a\x09\x63\x2d\x30\x2e\x38\x2d\x30\x2e\x34\x2d\x31\x2e\x35\x2d\
+\x31\x2e\x31\x2d\x31\x2e\x39\x2d\x31\x2e\x39\x63\x2d\x30\x2e\x35\
+\x2d\x30\x2e\x38\x2d\x30\x2e\x37\x2d\x31\x2e\x37\x2d\x30\x2e\x37\
+\x2d\x32\x2e\x36\x56\x34\x34\x2e\x33\x63\x30\x2d\x31\x2e\x31\x2c\
+\x30\x2e\x33\x2d\x32\x2c\x30\x2e\x39\x2d\x32\x2e\x39\x73\x31\x2e\
+\x34\x2d\x31\x2e\x35\x2c\x32\x2e\x34\x2d\x31\x2e\x39\x6c\x32\x37\
+\x2e\x39\x2d\x31\x30\x2e\x31\x63\x30\x2e\x36\x2d\x30\x2e\x32\x2c\
+\x31\x2e\x32\x2d\x30\x2e\x33\x2c\x31\x2e\x37\x2d\x30\x2e\x33\x0a\
+\x09\x63\x30\x2e\x36\x2c\x30\x2c\x31\x2e\x32\x2c\x30\x2e\x31\x2c\
+\x31\x2e\x37\x2c\x30\x2e\x33\x6c\x32\x37\x2e\x39\x2c\x31\x30\x2e\
+\x31\x63\x31\x2c\x30\x2e\x34\x2c\x31\x2e\x38\x2c\x31\x2c\x32\x2e\
+\x34\x2c\x31\x2e\x39\x53\x39\x30\x2e\x35\x2c\x34\x33\x2e\x32\x2c\
+\x39\x30\x2e\x35\x2c\x34\x34\x2e\x33\x7a\x22\x2f\x3e\x0a\x3c\x2f\
+\x73\x76\x67\x3e\x0a\
+\x00\x00\x03\x1f\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\
+\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\
+\x22\x35\x38\x2e\x31\x22\x20\x63\x79\x3d\x22\x32\x33\x2e\x35\x22\
+\x20\x72\x3d\x22\x36\x2e\x39\x22\x2f\x3e\x0a\x3c\x63\x69\x72\x63\
+\x6c\x65\x20\x63\x78\x3d\x22\x35\x35\x2e\x38\x22\x20\x63\x79\x3d\
+\x22\x35\x32\x2e\x35\x22\x20\x72\x3d\x22\x36\x2e\x39\x22\x2f\x3e\
+\x0a\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x33\x30\x22\
+\x20\x63\x79\x3d\x22\x33\x39\x2e\x38\x22\x20\x72\x3d\x22\x36\x2e\
+\x39\x22\x2f\x3e\x0a\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\
+\x22\x32\x33\x2e\x31\x22\x20\x63\x79\x3d\x22\x36\x32\x2e\x36\x22\
+\x20\x72\x3d\x22\x36\x2e\x39\x22\x2f\x3e\x0a\x3c\x63\x69\x72\x63\
+\x6c\x65\x20\x63\x78\x3d\x22\x35\x35\x2e\x38\x22\x20\x63\x79\x3d\
+\x22\x37\x37\x2e\x36\x22\x20\x72\x3d\x22\x36\x2e\x39\x22\x2f\x3e\
+\x0a\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x37\x37\x2e\
+\x32\x22\x20\x63\x79\x3d\x22\x34\x36\x2e\x37\x22\x20\x72\x3d\x22\
+\x36\x2e\x39\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x03\xe9\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\
+\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x67\x20\x69\x64\x3d\x22\x53\x6f\x6c\x69\
+\x64\x22\x3e\x0a\x09\x3c\x67\x3e\x0a\x09\x09\x3c\x70\x61\x74\x68\
+\x20\x63\x6c\x61\x73\x73\x3d\x22\x73\x74\x30\x22\x20\x64\x3d\x22\
+\x4d\x35\x30\x2c\x31\x33\x2e\x36\x63\x2d\x32\x30\x2c\x30\x2d\x33\
+\x36\x2e\x33\x2c\x31\x36\x2e\x33\x2d\x33\x36\x2e\x33\x2c\x33\x36\
+\x2e\x33\x63\x30\x2c\x32\x30\x2c\x31\x36\x2e\x33\x2c\x33\x36\x2e\
+\x33\x2c\x33\x36\x2e\x33\x2c\x33\x36\x2e\x33\x43\x37\x30\x2c\x38\
+\x36\x2e\x33\x2c\x38\x36\x2e\x33\x2c\x37\x30\x2c\x38\x36\x2e\x33\
+\x2c\x35\x30\x0a\x09\x09\x09\x43\x38\x36\x2e\x33\x2c\x32\x39\x2e\
+\x39\x2c\x37\x30\x2c\x31\x33\x2e\x36\x2c\x35\x30\x2c\x31\x33\x2e\
+\x36\x7a\x20\x4d\x35\x30\x2c\x37\x39\x63\x2d\x31\x36\x2c\x30\x2d\
+\x32\x39\x2e\x31\x2d\x31\x33\x2d\x32\x39\x2e\x31\x2d\x32\x39\x2e\
+\x31\x63\x30\x2d\x31\x36\x2c\x31\x33\x2d\x32\x39\x2e\x31\x2c\x32\
+\x39\x2e\x31\x2d\x32\x39\x2e\x31\x43\x36\x36\x2c\x32\x30\x2e\x39\
+\x2c\x37\x39\x2c\x33\x33\x2e\x39\x2c\x37\x39\x2c\x35\x30\x43\x37\
+\x39\x2c\x36\x36\x2c\x36\x36\x2c\x37\x39\x2c\x35\x30\x2c\x37\x39\
+\x7a\x22\x2f\x3e\x0a\x09\x09\x3c\x70\x6f\x6c\x79\x67\x6f\x6e\x20\
+\x63\x6c\x61\x73\x73\x3d\x22\x73\x74\x30\x22\x20\x70\x6f\x69\x6e\
+\x74\x73\x3d\x22\x35\x33\x2e\x36\x2c\x33\x31\x2e\x38\x20\x34\x36\
+\x2e\x33\x2c\x33\x31\x2e\x38\x20\x34\x36\x2e\x33\x2c\x34\x36\x2e\
+\x33\x20\x33\x31\x2e\x38\x2c\x34\x36\x2e\x33\x20\x33\x31\x2e\x38\
+\x2c\x35\x33\x2e\x36\x20\x34\x36\x2e\x33\x2c\x35\x33\x2e\x36\x20\
+\x34\x36\x2e\x33\x2c\x36\x38\x2e\x31\x20\x35\x33\x2e\x36\x2c\x36\
+\x38\x2e\x31\x20\x35\x33\x2e\x36\x2c\x35\x33\x2e\x36\x20\x0a\x09\
+\x09\x09\x36\x38\x2e\x31\x2c\x35\x33\x2e\x36\x20\x36\x38\x2e\x31\
+\x2c\x34\x36\x2e\x33\x20\x35\x33\x2e\x36\x2c\x34\x36\x2e\x33\x20\
+\x09\x09\x22\x2f\x3e\x0a\x09\x3c\x2f\x67\x3e\x0a\x3c\x2f\x67\x3e\
+\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x03\x24\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\
+\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x34\x35\
+\x22\x20\x79\x3d\x22\x32\x31\x2e\x33\x22\x20\x74\x72\x61\x6e\x73\
+\x66\x6f\x72\x6d\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\x30\x2e\x37\
+\x31\x31\x32\x20\x2d\x30\x2e\x37\x30\x32\x39\x20\x30\x2e\x37\x30\
+\x32\x39\x20\x30\x2e\x37\x31\x31\x32\x20\x2d\x32\x31\x2e\x36\x37\
+\x39\x31\x20\x35\x30\x2e\x30\x32\x34\x29\x22\x20\x77\x69\x64\x74\
+\x68\x3d\x22\x31\x30\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x36\
+\x30\x2e\x32\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\
+\x31\x39\x2e\x39\x22\x20\x79\x3d\x22\x34\x36\x2e\x34\x22\x20\x74\
+\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\x74\x72\x69\x78\
+\x28\x30\x2e\x37\x31\x31\x33\x20\x2d\x30\x2e\x37\x30\x32\x39\x20\
+\x30\x2e\x37\x30\x32\x39\x20\x30\x2e\x37\x31\x31\x33\x20\x2d\x32\
+\x31\x2e\x37\x32\x38\x34\x20\x34\x39\x2e\x39\x39\x38\x38\x29\x22\
+\x20\x77\x69\x64\x74\x68\x3d\x22\x36\x30\x2e\x32\x22\x20\x68\x65\
+\x69\x67\x68\x74\x3d\x22\x31\x30\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\
+\x67\x3e\x0a\
+\x00\x00\x04\x01\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\
+\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x36\x36\x2e\x37\x2c\x35\x34\x2e\x34\
+\x68\x2d\x36\x56\x33\x37\x2e\x39\x48\x34\x35\x2e\x34\x76\x2d\x36\
+\x68\x31\x36\x2e\x33\x63\x32\x2e\x38\x2c\x30\x2c\x35\x2c\x32\x2e\
+\x32\x2c\x35\x2c\x35\x56\x35\x34\x2e\x34\x7a\x22\x2f\x3e\x0a\x3c\
+\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x35\x33\x2e\x34\x2c\x36\x37\
+\x2e\x34\x48\x33\x36\x2e\x33\x63\x2d\x32\x2e\x38\x2c\x30\x2d\x35\
+\x2d\x32\x2e\x32\x2d\x35\x2d\x35\x56\x34\x35\x2e\x31\x68\x36\x76\
+\x31\x36\x2e\x33\x68\x31\x36\x2e\x31\x56\x36\x37\x2e\x34\x7a\x22\
+\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x34\x32\x2e\
+\x35\x2c\x34\x37\x2e\x36\x48\x32\x32\x2e\x39\x63\x2d\x32\x2e\x38\
+\x2c\x30\x2d\x35\x2d\x32\x2e\x32\x2d\x35\x2d\x35\x56\x32\x33\x63\
+\x30\x2d\x32\x2e\x38\x2c\x32\x2e\x32\x2d\x35\x2c\x35\x2d\x35\x68\
+\x31\x39\x2e\x36\x63\x32\x2e\x38\x2c\x30\x2c\x35\x2c\x32\x2e\x32\
+\x2c\x35\x2c\x35\x76\x31\x39\x2e\x36\x43\x34\x37\x2e\x35\x2c\x34\
+\x35\x2e\x34\x2c\x34\x35\x2e\x33\x2c\x34\x37\x2e\x36\x2c\x34\x32\
+\x2e\x35\x2c\x34\x37\x2e\x36\x7a\x20\x4d\x32\x33\x2e\x39\x2c\x34\
+\x31\x2e\x36\x0a\x09\x68\x31\x37\x2e\x36\x56\x32\x34\x48\x32\x33\
+\x2e\x39\x56\x34\x31\x2e\x36\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\x74\
+\x68\x20\x64\x3d\x22\x4d\x37\x35\x2e\x37\x2c\x38\x31\x2e\x33\x48\
+\x35\x36\x2e\x31\x63\x2d\x32\x2e\x38\x2c\x30\x2d\x35\x2d\x32\x2e\
+\x32\x2d\x35\x2d\x35\x56\x35\x36\x2e\x38\x63\x30\x2d\x32\x2e\x38\
+\x2c\x32\x2e\x32\x2d\x35\x2c\x35\x2d\x35\x68\x31\x39\x2e\x36\x63\
+\x32\x2e\x38\x2c\x30\x2c\x35\x2c\x32\x2e\x32\x2c\x35\x2c\x35\x76\
+\x31\x39\x2e\x36\x43\x38\x30\x2e\x37\x2c\x37\x39\x2e\x31\x2c\x37\
+\x38\x2e\x35\x2c\x38\x31\x2e\x33\x2c\x37\x35\x2e\x37\x2c\x38\x31\
+\x2e\x33\x7a\x0a\x09\x20\x4d\x35\x37\x2e\x31\x2c\x37\x35\x2e\x33\
+\x68\x31\x37\x2e\x36\x56\x35\x37\x2e\x38\x48\x35\x37\x2e\x31\x56\
+\x37\x35\x2e\x33\x7a\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\
+\x00\x00\x06\x56\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x36\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\
+\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x31\x33\
+\x2e\x31\x22\x20\x79\x3d\x22\x32\x33\x2e\x31\x22\x20\x74\x72\x61\
+\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\x30\
+\x2e\x37\x30\x37\x31\x20\x2d\x30\x2e\x37\x30\x37\x31\x20\x30\x2e\
+\x37\x30\x37\x31\x20\x30\x2e\x37\x30\x37\x31\x20\x2d\x31\x30\x2e\
+\x30\x35\x34\x36\x20\x32\x36\x2e\x30\x35\x38\x31\x29\x22\x20\x77\
+\x69\x64\x74\x68\x3d\x22\x32\x36\x2e\x37\x22\x20\x68\x65\x69\x67\
+\x68\x74\x3d\x22\x34\x2e\x31\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\
+\x20\x78\x3d\x22\x33\x33\x2e\x39\x22\x20\x79\x3d\x22\x32\x33\x2e\
+\x31\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\
+\x74\x72\x69\x78\x28\x30\x2e\x38\x34\x37\x31\x20\x2d\x30\x2e\x35\
+\x33\x31\x35\x20\x30\x2e\x35\x33\x31\x35\x20\x30\x2e\x38\x34\x37\
+\x31\x20\x2d\x36\x2e\x31\x35\x33\x36\x20\x32\x38\x2e\x39\x34\x36\
+\x31\x29\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x36\x2e\x37\x22\
+\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x34\x2e\x31\x22\x2f\x3e\x0a\
+\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x35\x36\x2e\x37\x22\x20\x79\
+\x3d\x22\x32\x33\x2e\x31\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\
+\x6d\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\x30\x2e\x39\x33\x34\x35\
+\x20\x2d\x30\x2e\x33\x35\x36\x20\x30\x2e\x33\x35\x36\x20\x30\x2e\
+\x39\x33\x34\x35\x20\x2d\x34\x2e\x33\x37\x32\x33\x20\x32\x36\x2e\
+\x35\x37\x35\x32\x29\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x36\
+\x2e\x37\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x34\x2e\x31\x22\
+\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x31\x33\x2e\x31\
+\x22\x20\x79\x3d\x22\x34\x37\x2e\x33\x22\x20\x74\x72\x61\x6e\x73\
+\x66\x6f\x72\x6d\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\x30\x2e\x37\
+\x30\x37\x31\x20\x2d\x30\x2e\x37\x30\x37\x31\x20\x30\x2e\x37\x30\
+\x37\x31\x20\x30\x2e\x37\x30\x37\x31\x20\x2d\x32\x37\x2e\x31\x35\
+\x34\x36\x20\x33\x33\x2e\x31\x34\x31\x32\x29\x22\x20\x77\x69\x64\
+\x74\x68\x3d\x22\x32\x36\x2e\x37\x22\x20\x68\x65\x69\x67\x68\x74\
+\x3d\x22\x34\x2e\x31\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\
+\x3d\x22\x33\x33\x2e\x39\x22\x20\x79\x3d\x22\x34\x37\x2e\x33\x22\
+\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\x74\x72\
+\x69\x78\x28\x30\x2e\x38\x32\x30\x39\x20\x2d\x30\x2e\x35\x37\x31\
+\x31\x20\x30\x2e\x35\x37\x31\x31\x20\x30\x2e\x38\x32\x30\x39\x20\
+\x2d\x31\x39\x2e\x37\x32\x35\x20\x33\x35\x2e\x38\x30\x38\x34\x29\
+\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x36\x2e\x37\x22\x20\x68\
+\x65\x69\x67\x68\x74\x3d\x22\x34\x2e\x31\x22\x2f\x3e\x0a\x3c\x72\
+\x65\x63\x74\x20\x78\x3d\x22\x35\x36\x2e\x37\x22\x20\x79\x3d\x22\
+\x34\x37\x2e\x33\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\
+\x22\x6d\x61\x74\x72\x69\x78\x28\x30\x2e\x39\x36\x38\x39\x20\x2d\
+\x30\x2e\x32\x34\x37\x36\x20\x30\x2e\x32\x34\x37\x36\x20\x30\x2e\
+\x39\x36\x38\x39\x20\x2d\x31\x30\x2e\x30\x33\x37\x38\x20\x31\x38\
+\x2e\x38\x36\x38\x36\x29\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\
+\x36\x2e\x37\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x34\x2e\x31\
+\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x31\x33\x2e\
+\x31\x22\x20\x79\x3d\x22\x37\x34\x22\x20\x74\x72\x61\x6e\x73\x66\
+\x6f\x72\x6d\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\x30\x2e\x38\x32\
+\x30\x39\x20\x2d\x30\x2e\x35\x37\x31\x31\x20\x30\x2e\x35\x37\x31\
+\x31\x20\x30\x2e\x38\x32\x30\x39\x20\x2d\x33\x38\x2e\x37\x30\x37\
+\x31\x20\x32\x38\x2e\x37\x31\x37\x39\x29\x22\x20\x77\x69\x64\x74\
+\x68\x3d\x22\x32\x36\x2e\x37\x22\x20\x68\x65\x69\x67\x68\x74\x3d\
+\x22\x34\x2e\x31\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\
+\x22\x33\x33\x2e\x39\x22\x20\x79\x3d\x22\x37\x34\x22\x20\x74\x72\
+\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\
+\x30\x2e\x38\x34\x37\x31\x20\x2d\x30\x2e\x35\x33\x31\x35\x20\x30\
+\x2e\x35\x33\x31\x35\x20\x30\x2e\x38\x34\x37\x31\x20\x2d\x33\x33\
+\x2e\x32\x30\x35\x31\x20\x33\x36\x2e\x37\x32\x39\x39\x29\x22\x20\
+\x77\x69\x64\x74\x68\x3d\x22\x32\x36\x2e\x37\x22\x20\x68\x65\x69\
+\x67\x68\x74\x3d\x22\x34\x2e\x31\x22\x2f\x3e\x0a\x3c\x72\x65\x63\
+\x74\x20\x78\x3d\x22\x35\x36\x2e\x37\x22\x20\x79\x3d\x22\x37\x34\
+\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\x74\
+\x72\x69\x78\x28\x30\x2e\x39\x39\x34\x36\x20\x2d\x30\x2e\x31\x30\
+\x33\x35\x20\x30\x2e\x31\x30\x33\x35\x20\x30\x2e\x39\x39\x34\x36\
+\x20\x2d\x37\x2e\x34\x39\x39\x35\x20\x37\x2e\x36\x35\x37\x39\x29\
+\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x36\x2e\x37\x22\x20\x68\
+\x65\x69\x67\x68\x74\x3d\x22\x34\x2e\x31\x22\x2f\x3e\x0a\x3c\x2f\
+\x73\x76\x67\x3e\x0a\
+\x00\x00\x08\x17\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x36\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x32\x30\x30\x20\x32\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x32\x30\x30\x20\
+\x32\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x33\x38\x2c\x20\x34\x31\x2c\x20\x34\x38\x29\x3b\x20\
+\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\x7d\x0a\x70\
+\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x33\x38\x2c\x20\x34\x31\x2c\x20\x34\x38\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\x7d\x0a\x63\x69\
+\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\
+\x33\x38\x2c\x20\x34\x31\x2c\x20\x34\x38\x29\x3b\x20\x6f\x70\x61\
+\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\
+\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x33\x38\x2c\x20\
+\x34\x31\x2c\x20\x34\x38\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\
+\x3a\x20\x30\x2e\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\
+\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x6d\x20\x30\x2c\x30\x20\
+\x63\x20\x2d\x31\x2e\x32\x30\x33\x30\x37\x38\x35\x2c\x36\x33\x2e\
+\x31\x31\x35\x32\x32\x33\x20\x30\x2c\x32\x30\x30\x20\x30\x2c\x32\
+\x30\x30\x20\x7a\x20\x6d\x20\x36\x37\x2e\x32\x30\x38\x39\x38\x34\
+\x2c\x32\x38\x2e\x36\x36\x34\x30\x36\x32\x20\x63\x20\x2d\x32\x2e\
+\x39\x34\x30\x36\x2c\x30\x2e\x30\x32\x37\x32\x20\x2d\x36\x2e\x31\
+\x38\x37\x38\x37\x31\x2c\x30\x2e\x32\x36\x38\x32\x31\x37\x20\x2d\
+\x37\x2e\x36\x30\x37\x34\x32\x32\x2c\x30\x2e\x36\x34\x32\x35\x37\
+\x39\x20\x2d\x38\x2e\x31\x38\x38\x37\x37\x37\x2c\x32\x2e\x31\x35\
+\x39\x35\x33\x31\x20\x2d\x31\x37\x2e\x37\x39\x39\x38\x39\x36\x2c\
+\x31\x30\x2e\x32\x39\x30\x36\x32\x34\x20\x2d\x32\x32\x2e\x32\x30\
+\x31\x31\x37\x31\x2c\x31\x38\x2e\x37\x38\x31\x32\x35\x20\x2d\x32\
+\x2e\x35\x30\x39\x31\x32\x31\x2c\x34\x2e\x38\x34\x30\x34\x31\x38\
+\x20\x2d\x35\x2e\x33\x37\x36\x33\x33\x36\x2c\x31\x32\x2e\x38\x34\
+\x37\x39\x34\x37\x20\x2d\x36\x2e\x34\x39\x34\x31\x34\x31\x2c\x31\
+\x38\x2e\x31\x34\x32\x35\x37\x38\x20\x2d\x30\x2e\x35\x32\x30\x36\
+\x34\x38\x2c\x32\x2e\x34\x36\x36\x31\x33\x20\x2d\x30\x2e\x36\x31\
+\x32\x34\x31\x33\x2c\x33\x2e\x34\x38\x37\x38\x36\x33\x20\x2d\x30\
+\x2e\x36\x31\x39\x31\x34\x31\x2c\x36\x2e\x38\x34\x31\x37\x39\x37\
+\x20\x2d\x30\x2e\x30\x30\x36\x38\x2c\x33\x2e\x33\x31\x30\x38\x35\
+\x31\x20\x30\x2e\x30\x37\x32\x39\x39\x2c\x34\x2e\x32\x37\x31\x31\
+\x38\x38\x20\x30\x2e\x35\x30\x31\x39\x35\x33\x2c\x35\x2e\x39\x38\
+\x30\x34\x36\x38\x20\x31\x2e\x35\x38\x34\x36\x33\x2c\x36\x2e\x33\
+\x31\x34\x32\x32\x33\x20\x35\x2e\x32\x31\x35\x38\x33\x31\x2c\x31\
+\x31\x2e\x38\x31\x36\x39\x34\x37\x20\x31\x31\x2e\x37\x33\x30\x34\
+\x36\x39\x2c\x31\x37\x2e\x37\x37\x35\x33\x39\x31\x20\x31\x2e\x31\
+\x37\x31\x37\x39\x34\x2c\x31\x2e\x30\x37\x31\x37\x34\x39\x20\x34\
+\x2e\x33\x32\x32\x37\x31\x34\x2c\x33\x2e\x37\x38\x35\x37\x30\x35\
+\x20\x37\x2e\x30\x30\x31\x39\x35\x33\x2c\x36\x2e\x30\x33\x31\x32\
+\x35\x35\x20\x39\x2e\x35\x32\x39\x30\x31\x33\x2c\x37\x2e\x39\x38\
+\x36\x35\x20\x31\x32\x2e\x36\x35\x38\x33\x38\x36\x2c\x31\x31\x2e\
+\x38\x31\x33\x31\x34\x20\x31\x37\x2e\x31\x38\x31\x36\x34\x31\x2c\
+\x32\x31\x2e\x30\x31\x37\x35\x37\x20\x32\x2e\x35\x36\x32\x34\x39\
+\x37\x2c\x35\x2e\x32\x31\x34\x34\x20\x34\x2e\x34\x34\x36\x31\x2c\
+\x39\x2e\x39\x32\x32\x33\x33\x20\x37\x2e\x31\x39\x33\x33\x35\x39\
+\x2c\x31\x37\x2e\x39\x37\x38\x35\x32\x20\x31\x2e\x31\x30\x39\x35\
+\x2c\x33\x2e\x32\x35\x33\x35\x20\x32\x2e\x35\x30\x39\x31\x39\x37\
+\x2c\x36\x2e\x39\x35\x38\x34\x39\x20\x33\x2e\x31\x31\x31\x33\x32\
+\x38\x2c\x38\x2e\x32\x33\x34\x33\x37\x20\x35\x2e\x31\x37\x30\x38\
+\x38\x32\x2c\x31\x30\x2e\x39\x35\x36\x37\x37\x20\x31\x35\x2e\x34\
+\x37\x39\x35\x34\x39\x2c\x32\x30\x2e\x37\x34\x38\x39\x36\x20\x32\
+\x34\x2e\x36\x32\x34\x39\x39\x38\x2c\x32\x33\x2e\x33\x39\x30\x36\
+\x33\x20\x31\x2e\x37\x30\x34\x31\x36\x2c\x30\x2e\x34\x39\x32\x32\
+\x34\x20\x35\x2e\x34\x31\x35\x39\x32\x2c\x31\x2e\x31\x30\x39\x33\
+\x39\x20\x38\x2e\x34\x36\x32\x38\x39\x2c\x31\x2e\x34\x30\x38\x32\
+\x20\x30\x2e\x35\x31\x30\x35\x39\x2c\x30\x2e\x30\x35\x30\x31\x20\
+\x33\x2e\x38\x30\x30\x34\x33\x2c\x30\x2e\x30\x35\x37\x39\x20\x37\
+\x2e\x33\x31\x30\x35\x35\x2c\x30\x2e\x30\x31\x35\x36\x20\x34\x2e\
+\x37\x36\x39\x39\x33\x2c\x2d\x30\x2e\x30\x35\x37\x37\x20\x37\x2e\
+\x32\x36\x39\x32\x36\x2c\x2d\x30\x2e\x31\x39\x37\x39\x32\x20\x39\
+\x2e\x38\x39\x36\x34\x38\x2c\x2d\x30\x2e\x35\x35\x32\x37\x34\x20\
+\x31\x30\x2e\x36\x37\x33\x36\x33\x2c\x2d\x31\x2e\x34\x34\x31\x34\
+\x39\x20\x31\x39\x2e\x34\x32\x34\x37\x35\x2c\x2d\x34\x2e\x34\x32\
+\x36\x30\x37\x20\x32\x36\x2e\x30\x32\x33\x34\x34\x2c\x2d\x38\x2e\
+\x38\x37\x36\x39\x35\x20\x35\x2e\x34\x32\x30\x32\x39\x2c\x2d\x33\
+\x2e\x36\x35\x36\x30\x34\x20\x31\x30\x2e\x39\x34\x31\x30\x34\x2c\
+\x2d\x38\x2e\x32\x35\x30\x36\x35\x20\x31\x33\x2e\x37\x35\x2c\x2d\
+\x31\x31\x2e\x34\x34\x31\x34\x31\x20\x37\x2e\x34\x37\x37\x31\x2c\
+\x2d\x38\x2e\x34\x39\x33\x33\x20\x39\x2e\x36\x36\x37\x30\x31\x2c\
+\x2d\x31\x37\x2e\x37\x33\x38\x38\x32\x20\x37\x2e\x39\x38\x38\x32\
+\x38\x2c\x2d\x33\x33\x2e\x37\x32\x30\x37\x20\x2d\x31\x2e\x30\x32\
+\x31\x32\x38\x2c\x2d\x39\x2e\x37\x32\x32\x38\x32\x20\x2d\x33\x2e\
+\x33\x37\x32\x32\x36\x2c\x2d\x31\x36\x2e\x30\x34\x33\x38\x20\x2d\
+\x37\x2e\x34\x35\x31\x31\x37\x2c\x2d\x32\x30\x2e\x30\x32\x39\x33\
+\x20\x2d\x31\x2e\x36\x37\x34\x37\x39\x2c\x2d\x31\x2e\x36\x33\x36\
+\x34\x31\x39\x20\x2d\x32\x2e\x31\x37\x39\x39\x32\x2c\x2d\x32\x2e\
+\x30\x32\x33\x35\x35\x39\x20\x2d\x33\x2e\x37\x39\x31\x30\x31\x2c\
+\x2d\x32\x2e\x39\x31\x30\x31\x35\x33\x20\x2d\x34\x2e\x31\x36\x39\
+\x38\x37\x2c\x2d\x32\x2e\x32\x39\x34\x36\x35\x37\x20\x2d\x39\x2e\
+\x38\x36\x34\x36\x36\x2c\x2d\x32\x2e\x38\x33\x35\x36\x30\x31\x20\
+\x2d\x32\x31\x2e\x33\x35\x31\x35\x37\x2c\x2d\x32\x2e\x30\x32\x35\
+\x33\x39\x31\x20\x2d\x31\x31\x2e\x37\x39\x36\x31\x31\x2c\x30\x2e\
+\x38\x33\x32\x30\x31\x38\x20\x2d\x31\x38\x2e\x30\x39\x36\x33\x35\
+\x2c\x30\x2e\x32\x34\x39\x31\x34\x37\x20\x2d\x32\x36\x2e\x32\x32\
+\x34\x36\x31\x2c\x2d\x32\x2e\x34\x32\x37\x37\x33\x34\x20\x43\x20\
+\x31\x30\x34\x2e\x35\x30\x38\x30\x37\x2c\x38\x39\x2e\x30\x35\x34\
+\x32\x36\x36\x20\x39\x37\x2e\x31\x34\x39\x30\x30\x33\x2c\x38\x31\
+\x2e\x39\x39\x37\x39\x39\x39\x20\x39\x34\x2e\x39\x30\x36\x32\x35\
+\x2c\x37\x32\x2e\x34\x35\x37\x30\x33\x31\x20\x39\x34\x2e\x36\x35\
+\x35\x39\x33\x32\x2c\x37\x31\x2e\x33\x39\x32\x39\x35\x38\x20\x39\
+\x34\x2e\x31\x32\x35\x36\x35\x37\x2c\x36\x37\x2e\x39\x36\x33\x37\
+\x39\x38\x20\x39\x33\x2e\x37\x32\x38\x35\x31\x36\x2c\x36\x34\x2e\
+\x38\x33\x37\x38\x39\x31\x20\x39\x31\x2e\x32\x39\x39\x34\x38\x39\
+\x2c\x34\x35\x2e\x37\x31\x39\x37\x31\x37\x20\x38\x39\x2e\x34\x39\
+\x36\x38\x33\x2c\x33\x39\x2e\x32\x35\x33\x37\x37\x35\x20\x38\x35\
+\x2e\x35\x30\x33\x39\x30\x36\x2c\x33\x35\x2e\x33\x32\x38\x31\x32\
+\x35\x20\x38\x32\x2e\x31\x30\x33\x36\x31\x36\x2c\x33\x31\x2e\x39\
+\x38\x35\x31\x32\x39\x20\x37\x37\x2e\x30\x36\x35\x32\x33\x32\x2c\
+\x32\x39\x2e\x36\x32\x31\x31\x38\x20\x37\x31\x2e\x37\x31\x30\x39\
+\x33\x38\x2c\x32\x38\x2e\x38\x36\x31\x33\x32\x38\x20\x63\x20\x2d\
+\x31\x2e\x30\x38\x33\x30\x35\x39\x2c\x2d\x30\x2e\x31\x35\x33\x37\
+\x20\x2d\x32\x2e\x37\x33\x37\x35\x39\x33\x2c\x2d\x30\x2e\x32\x31\
+\x33\x35\x38\x35\x20\x2d\x34\x2e\x35\x30\x31\x39\x35\x34\x2c\x2d\
+\x30\x2e\x31\x39\x37\x32\x36\x36\x20\x7a\x22\x20\x2f\x3e\x0a\x3c\
+\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x02\x9d\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x32\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\
+\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x70\x6f\
+\x69\x6e\x74\x73\x3d\x22\x37\x32\x2c\x35\x30\x20\x31\x33\x2e\x38\
+\x2c\x32\x2e\x36\x20\x31\x33\x2e\x38\x2c\x39\x37\x2e\x34\x20\x22\
+\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x37\x31\x22\x20\
+\x79\x3d\x22\x32\x2e\x36\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\
+\x32\x2e\x35\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x39\x34\x2e\
+\x38\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x03\x7f\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x32\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\
+\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x38\
+\x32\x2e\x31\x2c\x38\x39\x2e\x36\x48\x33\x34\x2e\x35\x63\x2d\x35\
+\x2e\x32\x2c\x30\x2d\x39\x2e\x33\x2d\x33\x2e\x39\x2d\x39\x2e\x33\
+\x2d\x38\x2e\x39\x76\x2d\x37\x2e\x33\x68\x31\x31\x2e\x32\x76\x35\
+\x2e\x35\x68\x34\x33\x2e\x39\x56\x33\x37\x2e\x32\x68\x2d\x35\x2e\
+\x36\x56\x32\x36\x2e\x35\x68\x37\x2e\x35\x63\x35\x2e\x32\x2c\x30\
+\x2c\x39\x2e\x33\x2c\x33\x2e\x39\x2c\x39\x2e\x33\x2c\x38\x2e\x39\
+\x76\x34\x35\x2e\x33\x0a\x09\x43\x39\x31\x2e\x34\x2c\x38\x35\x2e\
+\x37\x2c\x38\x37\x2e\x33\x2c\x38\x39\x2e\x36\x2c\x38\x32\x2e\x31\
+\x2c\x38\x39\x2e\x36\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\
+\x64\x3d\x22\x4d\x36\x35\x2e\x33\x2c\x37\x33\x2e\x35\x48\x31\x37\
+\x2e\x39\x63\x2d\x35\x2e\x32\x2c\x30\x2d\x39\x2e\x33\x2d\x33\x2e\
+\x39\x2d\x39\x2e\x33\x2d\x38\x2e\x39\x56\x31\x39\x2e\x33\x63\x30\
+\x2d\x35\x2c\x34\x2e\x31\x2d\x38\x2e\x39\x2c\x39\x2e\x33\x2d\x38\
+\x2e\x39\x68\x34\x37\x2e\x35\x63\x35\x2e\x32\x2c\x30\x2c\x39\x2e\
+\x33\x2c\x33\x2e\x39\x2c\x39\x2e\x33\x2c\x38\x2e\x39\x76\x34\x35\
+\x2e\x33\x0a\x09\x43\x37\x34\x2e\x37\x2c\x36\x39\x2e\x36\x2c\x37\
+\x30\x2e\x36\x2c\x37\x33\x2e\x35\x2c\x36\x35\x2e\x33\x2c\x37\x33\
+\x2e\x35\x7a\x20\x4d\x31\x39\x2e\x38\x2c\x36\x32\x2e\x38\x68\x34\
+\x33\x2e\x37\x56\x32\x31\x2e\x31\x48\x31\x39\x2e\x38\x56\x36\x32\
+\x2e\x38\x7a\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x02\x7a\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\
+\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x70\x6f\
+\x69\x6e\x74\x73\x3d\x22\x32\x32\x2e\x38\x2c\x36\x35\x2e\x38\x20\
+\x32\x39\x2e\x39\x2c\x31\x38\x2e\x31\x20\x38\x35\x2e\x37\x2c\x36\
+\x37\x2e\x34\x20\x35\x31\x2e\x39\x2c\x37\x39\x2e\x35\x20\x22\x2f\
+\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x03\x8d\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\
+\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x33\x31\x2e\x38\x2c\x35\x36\x2e\x34\
+\x63\x2d\x31\x2e\x39\x2c\x30\x2d\x33\x2e\x38\x2d\x30\x2e\x38\x2d\
+\x35\x2d\x32\x2e\x34\x63\x2d\x32\x2e\x32\x2d\x32\x2e\x38\x2d\x31\
+\x2e\x38\x2d\x36\x2e\x39\x2c\x31\x2d\x39\x2e\x31\x6c\x33\x35\x2e\
+\x31\x2d\x32\x38\x2e\x32\x63\x32\x2e\x38\x2d\x32\x2e\x32\x2c\x36\
+\x2e\x39\x2d\x31\x2e\x38\x2c\x39\x2e\x31\x2c\x31\x63\x32\x2e\x32\
+\x2c\x32\x2e\x38\x2c\x31\x2e\x38\x2c\x36\x2e\x39\x2d\x31\x2c\x39\
+\x2e\x31\x4c\x33\x35\x2e\x38\x2c\x35\x34\x2e\x39\x0a\x09\x43\x33\
+\x34\x2e\x36\x2c\x35\x35\x2e\x39\x2c\x33\x33\x2e\x32\x2c\x35\x36\
+\x2e\x34\x2c\x33\x31\x2e\x38\x2c\x35\x36\x2e\x34\x7a\x22\x2f\x3e\
+\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x36\x36\x2e\x39\x2c\
+\x38\x34\x2e\x36\x63\x2d\x31\x2e\x34\x2c\x30\x2d\x32\x2e\x39\x2d\
+\x30\x2e\x35\x2d\x34\x2d\x31\x2e\x34\x4c\x32\x37\x2e\x37\x2c\x35\
+\x34\x2e\x39\x63\x2d\x32\x2e\x38\x2d\x32\x2e\x32\x2d\x33\x2e\x32\
+\x2d\x36\x2e\x33\x2d\x31\x2d\x39\x2e\x31\x63\x32\x2e\x32\x2d\x32\
+\x2e\x38\x2c\x36\x2e\x33\x2d\x33\x2e\x32\x2c\x39\x2e\x31\x2d\x31\
+\x6c\x33\x35\x2e\x31\x2c\x32\x38\x2e\x32\x63\x32\x2e\x38\x2c\x32\
+\x2e\x32\x2c\x33\x2e\x32\x2c\x36\x2e\x33\x2c\x31\x2c\x39\x2e\x31\
+\x0a\x09\x43\x37\x30\x2e\x36\x2c\x38\x33\x2e\x38\x2c\x36\x38\x2e\
+\x38\x2c\x38\x34\x2e\x36\x2c\x36\x36\x2e\x39\x2c\x38\x34\x2e\x36\
+\x7a\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x04\x12\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x31\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\
+\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x72\x65\
+\x63\x74\x20\x78\x3d\x22\x31\x33\x22\x20\x79\x3d\x22\x31\x32\x22\
+\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\x2e\x38\x22\x20\x68\x65\
+\x69\x67\x68\x74\x3d\x22\x31\x36\x2e\x38\x22\x2f\x3e\x0a\x3c\x72\
+\x65\x63\x74\x20\x78\x3d\x22\x34\x31\x2e\x37\x22\x20\x79\x3d\x22\
+\x31\x32\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\x2e\x38\x22\
+\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x2e\x38\x22\x2f\x3e\
+\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x37\x30\x2e\x34\x22\x20\
+\x79\x3d\x22\x31\x32\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\
+\x2e\x38\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x2e\x38\
+\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x31\x33\x22\
+\x20\x79\x3d\x22\x34\x31\x2e\x35\x22\x20\x77\x69\x64\x74\x68\x3d\
+\x22\x31\x36\x2e\x38\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\
+\x36\x2e\x38\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\
+\x34\x31\x2e\x37\x22\x20\x79\x3d\x22\x34\x31\x2e\x35\x22\x20\x77\
+\x69\x64\x74\x68\x3d\x22\x31\x36\x2e\x38\x22\x20\x68\x65\x69\x67\
+\x68\x74\x3d\x22\x31\x36\x2e\x38\x22\x2f\x3e\x0a\x3c\x72\x65\x63\
+\x74\x20\x78\x3d\x22\x37\x30\x2e\x34\x22\x20\x79\x3d\x22\x34\x31\
+\x2e\x35\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\x2e\x38\x22\
+\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x2e\x38\x22\x2f\x3e\
+\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x31\x32\x2e\x39\x22\x20\
+\x79\x3d\x22\x37\x31\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\
+\x2e\x38\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x2e\x38\
+\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x34\x31\x2e\
+\x36\x22\x20\x79\x3d\x22\x37\x31\x22\x20\x77\x69\x64\x74\x68\x3d\
+\x22\x31\x36\x2e\x38\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\
+\x36\x2e\x38\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\
+\x37\x30\x2e\x33\x22\x20\x79\x3d\x22\x37\x31\x22\x20\x77\x69\x64\
+\x74\x68\x3d\x22\x31\x36\x2e\x38\x22\x20\x68\x65\x69\x67\x68\x74\
+\x3d\x22\x31\x36\x2e\x38\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\
+\x0a\
+\x00\x00\x02\x75\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x36\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\
+\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x6f\
+\x6c\x79\x67\x6f\x6e\x20\x70\x6f\x69\x6e\x74\x73\x3d\x22\x37\x39\
+\x2e\x31\x2c\x35\x30\x20\x32\x30\x2e\x39\x2c\x32\x2e\x36\x20\x32\
+\x30\x2e\x39\x2c\x39\x37\x2e\x34\x20\x22\x2f\x3e\x0a\x3c\x2f\x73\
+\x76\x67\x3e\x0a\
+\x00\x00\x03\x99\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\
+\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x63\x69\
+\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x35\x39\x2e\x36\x22\x20\x63\
+\x79\x3d\x22\x34\x32\x2e\x37\x22\x20\x72\x3d\x22\x34\x2e\x39\x22\
+\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x34\x31\x2e\
+\x31\x2c\x38\x34\x2e\x32\x63\x2d\x31\x2c\x30\x2d\x32\x2d\x30\x2e\
+\x34\x2d\x32\x2e\x37\x2d\x31\x2e\x33\x6c\x2d\x32\x32\x2d\x32\x36\
+\x2e\x37\x63\x2d\x31\x2e\x32\x2d\x31\x2e\x35\x2d\x31\x2d\x33\x2e\
+\x37\x2c\x30\x2e\x35\x2d\x34\x2e\x39\x6c\x33\x31\x2e\x39\x2d\x32\
+\x36\x2e\x34\x63\x30\x2e\x36\x2d\x30\x2e\x35\x2c\x31\x2e\x34\x2d\
+\x30\x2e\x38\x2c\x32\x2e\x32\x2d\x30\x2e\x38\x63\x30\x2c\x30\x2c\
+\x30\x2c\x30\x2c\x30\x2c\x30\x6c\x32\x37\x2e\x31\x2c\x30\x2e\x31\
+\x0a\x09\x63\x31\x2c\x30\x2c\x32\x2c\x30\x2e\x35\x2c\x32\x2e\x37\
+\x2c\x31\x2e\x33\x63\x30\x2e\x37\x2c\x30\x2e\x38\x2c\x30\x2e\x39\
+\x2c\x31\x2e\x39\x2c\x30\x2e\x37\x2c\x32\x2e\x39\x4c\x37\x36\x2e\
+\x35\x2c\x35\x35\x63\x2d\x30\x2e\x32\x2c\x30\x2e\x38\x2d\x30\x2e\
+\x36\x2c\x31\x2e\x35\x2d\x31\x2e\x32\x2c\x32\x4c\x34\x33\x2e\x33\
+\x2c\x38\x33\x2e\x34\x43\x34\x32\x2e\x37\x2c\x38\x33\x2e\x39\x2c\
+\x34\x31\x2e\x39\x2c\x38\x34\x2e\x32\x2c\x34\x31\x2e\x31\x2c\x38\
+\x34\x2e\x32\x7a\x20\x4d\x32\x34\x2c\x35\x34\x2e\x35\x0a\x09\x6c\
+\x31\x37\x2e\x36\x2c\x32\x31\x2e\x33\x6c\x32\x38\x2e\x33\x2d\x32\
+\x33\x2e\x33\x6c\x34\x2d\x32\x31\x2e\x32\x6c\x2d\x32\x31\x2e\x36\
+\x2d\x30\x2e\x31\x4c\x32\x34\x2c\x35\x34\x2e\x35\x7a\x22\x2f\x3e\
+\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x02\x79\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\
+\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x72\x65\
+\x63\x74\x20\x78\x3d\x22\x33\x2e\x34\x22\x20\x79\x3d\x22\x34\x30\
+\x2e\x36\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x32\x2e\x39\x22\
+\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x38\x2e\x36\x22\x2f\x3e\
+\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x04\x05\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\
+\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x33\
+\x30\x2e\x32\x2c\x37\x37\x2e\x37\x63\x2d\x34\x2e\x37\x2c\x30\x2d\
+\x38\x2e\x36\x2d\x33\x2e\x39\x2d\x38\x2e\x36\x2d\x38\x2e\x36\x73\
+\x33\x2e\x39\x2d\x38\x2e\x36\x2c\x38\x2e\x36\x2d\x38\x2e\x36\x73\
+\x38\x2e\x36\x2c\x33\x2e\x39\x2c\x38\x2e\x36\x2c\x38\x2e\x36\x53\
+\x33\x34\x2e\x39\x2c\x37\x37\x2e\x37\x2c\x33\x30\x2e\x32\x2c\x37\
+\x37\x2e\x37\x7a\x20\x4d\x33\x30\x2e\x32\x2c\x36\x36\x2e\x31\x63\
+\x2d\x31\x2e\x37\x2c\x30\x2d\x33\x2c\x31\x2e\x33\x2d\x33\x2c\x33\
+\x0a\x09\x73\x31\x2e\x33\x2c\x33\x2c\x33\x2c\x33\x73\x33\x2d\x31\
+\x2e\x33\x2c\x33\x2d\x33\x53\x33\x31\x2e\x39\x2c\x36\x36\x2e\x31\
+\x2c\x33\x30\x2e\x32\x2c\x36\x36\x2e\x31\x7a\x22\x2f\x3e\x0a\x3c\
+\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x37\x30\x2e\x31\x2c\x33\x37\
+\x2e\x38\x63\x2d\x34\x2e\x37\x2c\x30\x2d\x38\x2e\x36\x2d\x33\x2e\
+\x39\x2d\x38\x2e\x36\x2d\x38\x2e\x36\x73\x33\x2e\x39\x2d\x38\x2e\
+\x36\x2c\x38\x2e\x36\x2d\x38\x2e\x36\x73\x38\x2e\x36\x2c\x33\x2e\
+\x39\x2c\x38\x2e\x36\x2c\x38\x2e\x36\x53\x37\x34\x2e\x38\x2c\x33\
+\x37\x2e\x38\x2c\x37\x30\x2e\x31\x2c\x33\x37\x2e\x38\x7a\x20\x4d\
+\x37\x30\x2e\x31\x2c\x32\x36\x2e\x32\x63\x2d\x31\x2e\x37\x2c\x30\
+\x2d\x33\x2c\x31\x2e\x33\x2d\x33\x2c\x33\x0a\x09\x73\x31\x2e\x33\
+\x2c\x33\x2c\x33\x2c\x33\x73\x33\x2d\x31\x2e\x33\x2c\x33\x2d\x33\
+\x53\x37\x31\x2e\x38\x2c\x32\x36\x2e\x32\x2c\x37\x30\x2e\x31\x2c\
+\x32\x36\x2e\x32\x7a\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\
+\x3d\x22\x32\x38\x22\x20\x79\x3d\x22\x34\x36\x2e\x37\x22\x20\x74\
+\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\x74\x72\x69\x78\
+\x28\x30\x2e\x37\x30\x32\x37\x20\x2d\x30\x2e\x37\x31\x31\x35\x20\
+\x30\x2e\x37\x31\x31\x35\x20\x30\x2e\x37\x30\x32\x37\x20\x2d\x32\
+\x30\x2e\x31\x38\x34\x33\x20\x35\x30\x2e\x35\x39\x32\x38\x29\x22\
+\x20\x77\x69\x64\x74\x68\x3d\x22\x34\x34\x2e\x38\x22\x20\x68\x65\
+\x69\x67\x68\x74\x3d\x22\x35\x2e\x36\x22\x2f\x3e\x0a\x3c\x2f\x73\
+\x76\x67\x3e\x0a\
+\x00\x00\x02\x7a\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x36\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\
+\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x72\x65\
+\x63\x74\x20\x78\x3d\x22\x32\x32\x2e\x32\x22\x20\x79\x3d\x22\x32\
+\x32\x2e\x32\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x35\x35\x2e\x35\
+\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x35\x35\x2e\x35\x22\x2f\
+\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x02\x6d\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x36\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\
+\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x70\x6f\
+\x69\x6e\x74\x73\x3d\x22\x37\x39\x2e\x31\x2c\x35\x30\x20\x32\x30\
+\x2e\x39\x2c\x32\x2e\x36\x20\x32\x30\x2e\x39\x2c\x39\x37\x2e\x34\
+\x20\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x03\xbd\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x36\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\
+\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x38\
+\x34\x2e\x39\x2c\x34\x35\x2e\x33\x6c\x2d\x36\x2e\x38\x2d\x36\x2e\
+\x38\x56\x32\x31\x2e\x39\x63\x30\x2d\x32\x2e\x36\x2d\x32\x2e\x31\
+\x2d\x34\x2e\x37\x2d\x34\x2e\x37\x2d\x34\x2e\x37\x68\x2d\x34\x2e\
+\x37\x63\x2d\x32\x2e\x36\x2c\x30\x2d\x34\x2e\x37\x2c\x32\x2e\x31\
+\x2d\x34\x2e\x37\x2c\x34\x2e\x37\x76\x32\x2e\x36\x6c\x2d\x39\x2e\
+\x34\x2d\x39\x2e\x34\x63\x2d\x31\x2e\x33\x2d\x31\x2e\x32\x2d\x32\
+\x2e\x35\x2d\x32\x2e\x36\x2d\x34\x2e\x37\x2d\x32\x2e\x36\x0a\x09\
+\x73\x2d\x33\x2e\x34\x2c\x31\x2e\x34\x2d\x34\x2e\x37\x2c\x32\x2e\
+\x36\x4c\x31\x35\x2e\x31\x2c\x34\x35\x2e\x33\x63\x2d\x31\x2e\x35\
+\x2c\x31\x2e\x35\x2d\x32\x2e\x36\x2c\x32\x2e\x36\x2d\x32\x2e\x36\
+\x2c\x34\x2e\x37\x63\x30\x2c\x32\x2e\x36\x2c\x32\x2c\x34\x2e\x37\
+\x2c\x34\x2e\x37\x2c\x34\x2e\x37\x68\x34\x2e\x37\x76\x32\x38\x2e\
+\x31\x63\x30\x2c\x32\x2e\x36\x2c\x32\x2e\x31\x2c\x34\x2e\x37\x2c\
+\x34\x2e\x37\x2c\x34\x2e\x37\x68\x31\x34\x2e\x31\x56\x36\x34\x2e\
+\x31\x0a\x09\x63\x30\x2d\x32\x2e\x36\x2c\x32\x2e\x31\x2d\x34\x2e\
+\x37\x2c\x34\x2e\x37\x2d\x34\x2e\x37\x68\x39\x2e\x34\x63\x32\x2e\
+\x36\x2c\x30\x2c\x34\x2e\x37\x2c\x32\x2e\x31\x2c\x34\x2e\x37\x2c\
+\x34\x2e\x37\x76\x32\x33\x2e\x34\x68\x31\x34\x2e\x31\x63\x32\x2e\
+\x36\x2c\x30\x2c\x34\x2e\x37\x2d\x32\x2e\x31\x2c\x34\x2e\x37\x2d\
+\x34\x2e\x37\x56\x35\x34\x2e\x37\x68\x34\x2e\x37\x63\x32\x2e\x37\
+\x2c\x30\x2c\x34\x2e\x37\x2d\x32\x2c\x34\x2e\x37\x2d\x34\x2e\x37\
+\x0a\x09\x43\x38\x37\x2e\x35\x2c\x34\x37\x2e\x39\x2c\x38\x36\x2e\
+\x34\x2c\x34\x36\x2e\x38\x2c\x38\x34\x2e\x39\x2c\x34\x35\x2e\x33\
+\x7a\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x03\x87\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x32\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\
+\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x38\x32\x2e\x31\x2c\x38\x39\x2e\x36\
+\x48\x33\x34\x2e\x35\x63\x2d\x35\x2e\x32\x2c\x30\x2d\x39\x2e\x33\
+\x2d\x33\x2e\x39\x2d\x39\x2e\x33\x2d\x38\x2e\x39\x76\x2d\x37\x2e\
+\x33\x68\x31\x31\x2e\x32\x76\x35\x2e\x35\x68\x34\x33\x2e\x39\x56\
+\x33\x37\x2e\x32\x68\x2d\x35\x2e\x36\x56\x32\x36\x2e\x35\x68\x37\
+\x2e\x35\x63\x35\x2e\x32\x2c\x30\x2c\x39\x2e\x33\x2c\x33\x2e\x39\
+\x2c\x39\x2e\x33\x2c\x38\x2e\x39\x76\x34\x35\x2e\x33\x0a\x09\x43\
+\x39\x31\x2e\x34\x2c\x38\x35\x2e\x37\x2c\x38\x37\x2e\x33\x2c\x38\
+\x39\x2e\x36\x2c\x38\x32\x2e\x31\x2c\x38\x39\x2e\x36\x7a\x22\x2f\
+\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x36\x35\x2e\x33\
+\x2c\x37\x33\x2e\x35\x48\x31\x37\x2e\x39\x63\x2d\x35\x2e\x32\x2c\
+\x30\x2d\x39\x2e\x33\x2d\x33\x2e\x39\x2d\x39\x2e\x33\x2d\x38\x2e\
+\x39\x56\x31\x39\x2e\x33\x63\x30\x2d\x35\x2c\x34\x2e\x31\x2d\x38\
+\x2e\x39\x2c\x39\x2e\x33\x2d\x38\x2e\x39\x68\x34\x37\x2e\x35\x63\
+\x35\x2e\x32\x2c\x30\x2c\x39\x2e\x33\x2c\x33\x2e\x39\x2c\x39\x2e\
+\x33\x2c\x38\x2e\x39\x76\x34\x35\x2e\x33\x0a\x09\x43\x37\x34\x2e\
+\x37\x2c\x36\x39\x2e\x36\x2c\x37\x30\x2e\x36\x2c\x37\x33\x2e\x35\
+\x2c\x36\x35\x2e\x33\x2c\x37\x33\x2e\x35\x7a\x20\x4d\x31\x39\x2e\
+\x38\x2c\x36\x32\x2e\x38\x68\x34\x33\x2e\x37\x56\x32\x31\x2e\x31\
+\x48\x31\x39\x2e\x38\x56\x36\x32\x2e\x38\x7a\x22\x2f\x3e\x0a\x3c\
+\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x03\xe0\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x38\
+\x30\x2e\x36\x32\x6d\x6d\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\
+\x31\x38\x30\x2e\x36\x32\x6d\x6d\x22\x20\x76\x69\x65\x77\x42\x6f\
+\x78\x3d\x22\x30\x20\x30\x20\x35\x31\x32\x20\x35\x31\x32\x22\x3e\
+\x3c\x73\x74\x79\x6c\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\
+\x74\x2f\x63\x73\x73\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\
+\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\
+\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\
+\x20\x30\x2e\x35\x3b\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\
+\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\
+\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\
+\x79\x3a\x20\x30\x2e\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\
+\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\
+\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\
+\x74\x79\x3a\x20\x30\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\
+\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\
+\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\
+\x79\x3a\x20\x30\x2e\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\
+\x3e\x0a\x20\x20\x3c\x74\x69\x74\x6c\x65\x3e\x41\x72\x74\x62\x6f\
+\x61\x72\x64\x20\x31\x3c\x2f\x74\x69\x74\x6c\x65\x3e\x0a\x20\x20\
+\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x34\x35\x30\x2e\x31\x38\
+\x2c\x33\x33\x35\x2e\x39\x34\x61\x31\x38\x2e\x36\x31\x2c\x31\x38\
+\x2e\x36\x31\x2c\x30\x2c\x30\x2c\x31\x2c\x30\x2c\x32\x36\x2e\x33\
+\x34\x6c\x2d\x36\x32\x2e\x30\x37\x2c\x36\x32\x2e\x30\x36\x63\x2d\
+\x31\x31\x2e\x36\x35\x2c\x31\x31\x2e\x36\x35\x2d\x33\x31\x2e\x37\
+\x39\x2c\x33\x2e\x34\x38\x2d\x33\x31\x2e\x37\x39\x2d\x31\x33\x2e\
+\x31\x37\x76\x2d\x33\x31\x48\x33\x31\x30\x2e\x37\x31\x61\x39\x2e\
+\x32\x39\x2c\x39\x2e\x32\x39\x2c\x30\x2c\x30\x2c\x31\x2d\x36\x2e\
+\x38\x31\x2d\x33\x6c\x2d\x35\x34\x2e\x37\x35\x2d\x35\x38\x2e\x36\
+\x36\x2c\x34\x31\x2e\x33\x38\x2d\x34\x34\x2e\x33\x34\x2c\x34\x31\
+\x2c\x34\x33\x2e\x38\x38\x68\x32\x34\x2e\x38\x33\x76\x2d\x33\x31\
+\x63\x30\x2d\x31\x36\x2e\x36\x33\x2c\x32\x30\x2e\x31\x33\x2d\x32\
+\x34\x2e\x38\x33\x2c\x33\x31\x2e\x37\x39\x2d\x31\x33\x2e\x31\x37\
+\x5a\x6d\x2d\x33\x38\x32\x2e\x35\x31\x2d\x31\x34\x32\x68\x36\x35\
+\x2e\x31\x38\x6c\x34\x31\x2c\x34\x33\x2e\x38\x38\x2c\x34\x31\x2e\
+\x33\x38\x2d\x34\x34\x2e\x33\x34\x2d\x35\x34\x2e\x37\x35\x2d\x35\
+\x38\x2e\x36\x36\x61\x39\x2e\x32\x39\x2c\x39\x2e\x32\x39\x2c\x30\
+\x2c\x30\x2c\x30\x2d\x36\x2e\x38\x2d\x33\x68\x2d\x38\x36\x61\x39\
+\x2e\x33\x31\x2c\x39\x2e\x33\x31\x2c\x30\x2c\x30\x2c\x30\x2d\x39\
+\x2e\x33\x31\x2c\x39\x2e\x33\x31\x76\x34\x33\x2e\x34\x35\x41\x39\
+\x2e\x33\x31\x2c\x39\x2e\x33\x31\x2c\x30\x2c\x30\x2c\x30\x2c\x36\
+\x37\x2e\x36\x37\x2c\x31\x39\x33\x2e\x39\x33\x5a\x6d\x32\x38\x38\
+\x2e\x36\x35\x2c\x30\x76\x33\x31\x63\x30\x2c\x31\x36\x2e\x36\x35\
+\x2c\x32\x30\x2e\x31\x34\x2c\x32\x34\x2e\x38\x31\x2c\x33\x31\x2e\
+\x37\x39\x2c\x31\x33\x2e\x31\x37\x6c\x36\x32\x2e\x30\x37\x2d\x36\
+\x32\x2e\x30\x36\x61\x31\x38\x2e\x36\x31\x2c\x31\x38\x2e\x36\x31\
+\x2c\x30\x2c\x30\x2c\x30\x2c\x30\x2d\x32\x36\x2e\x33\x34\x4c\x33\
+\x38\x38\x2e\x31\x31\x2c\x38\x37\x2e\x36\x36\x43\x33\x37\x36\x2e\
+\x34\x35\x2c\x37\x36\x2c\x33\x35\x36\x2e\x33\x32\x2c\x38\x34\x2e\
+\x32\x2c\x33\x35\x36\x2e\x33\x32\x2c\x31\x30\x30\x2e\x38\x33\x76\
+\x33\x31\x48\x33\x31\x30\x2e\x37\x31\x61\x39\x2e\x32\x39\x2c\x39\
+\x2e\x32\x39\x2c\x30\x2c\x30\x2c\x30\x2d\x36\x2e\x38\x31\x2c\x33\
+\x6c\x2d\x31\x37\x31\x2c\x31\x38\x33\x2e\x32\x36\x48\x36\x37\x2e\
+\x36\x37\x61\x39\x2e\x33\x31\x2c\x39\x2e\x33\x31\x2c\x30\x2c\x30\
+\x2c\x30\x2d\x39\x2e\x33\x31\x2c\x39\x2e\x33\x32\x76\x34\x33\x2e\
+\x34\x35\x61\x39\x2e\x33\x31\x2c\x39\x2e\x33\x31\x2c\x30\x2c\x30\
+\x2c\x30\x2c\x39\x2e\x33\x31\x2c\x39\x2e\x33\x31\x68\x38\x36\x61\
+\x39\x2e\x32\x39\x2c\x39\x2e\x32\x39\x2c\x30\x2c\x30\x2c\x30\x2c\
+\x36\x2e\x38\x2d\x33\x4c\x33\x33\x31\x2e\x34\x39\x2c\x31\x39\x33\
+\x2e\x39\x33\x5a\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x04\x31\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x34\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\
+\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x34\x32\x2e\x31\x2c\x35\x31\x6c\x2d\
+\x32\x39\x2d\x32\x33\x2e\x32\x63\x2d\x32\x2e\x33\x2d\x31\x2e\x38\
+\x2d\x32\x2e\x36\x2d\x35\x2e\x32\x2d\x30\x2e\x38\x2d\x37\x2e\x35\
+\x63\x31\x2e\x38\x2d\x32\x2e\x33\x2c\x35\x2e\x32\x2d\x32\x2e\x36\
+\x2c\x37\x2e\x35\x2d\x30\x2e\x38\x6c\x32\x38\x2e\x39\x2c\x32\x33\
+\x2e\x32\x63\x32\x2e\x33\x2c\x31\x2e\x38\x2c\x32\x2e\x36\x2c\x35\
+\x2e\x32\x2c\x30\x2e\x38\x2c\x37\x2e\x35\x63\x2d\x31\x2c\x31\x2e\
+\x33\x2d\x32\x2e\x36\x2c\x32\x2d\x34\x2e\x31\x2c\x32\x0a\x09\x43\
+\x34\x34\x2e\x33\x2c\x35\x32\x2e\x32\x2c\x34\x33\x2e\x31\x2c\x35\
+\x31\x2e\x38\x2c\x34\x32\x2e\x31\x2c\x35\x31\x7a\x22\x2f\x3e\x0a\
+\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x32\x2e\x34\x2c\x37\
+\x33\x2e\x34\x63\x2d\x31\x2e\x38\x2d\x32\x2e\x33\x2d\x31\x2e\x35\
+\x2d\x35\x2e\x37\x2c\x30\x2e\x38\x2d\x37\x2e\x35\x6c\x32\x38\x2e\
+\x39\x2d\x32\x33\x2e\x32\x63\x32\x2e\x33\x2d\x31\x2e\x38\x2c\x35\
+\x2e\x37\x2d\x31\x2e\x35\x2c\x37\x2e\x35\x2c\x30\x2e\x38\x73\x31\
+\x2e\x35\x2c\x35\x2e\x37\x2d\x30\x2e\x38\x2c\x37\x2e\x35\x6c\x2d\
+\x32\x39\x2c\x32\x33\x2e\x33\x63\x2d\x30\x2e\x39\x2c\x30\x2e\x37\
+\x2d\x32\x2e\x31\x2c\x31\x2e\x32\x2d\x33\x2e\x33\x2c\x31\x2e\x32\
+\x0a\x09\x43\x31\x34\x2e\x39\x2c\x37\x35\x2e\x35\x2c\x31\x33\x2e\
+\x35\x2c\x37\x34\x2e\x38\x2c\x31\x32\x2e\x34\x2c\x37\x33\x2e\x34\
+\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x34\
+\x31\x2e\x34\x2c\x37\x35\x2e\x33\x63\x30\x2d\x32\x2e\x39\x2c\x32\
+\x2e\x33\x2d\x35\x2e\x34\x2c\x35\x2e\x33\x2d\x35\x2e\x34\x6c\x33\
+\x37\x2e\x31\x2d\x30\x2e\x35\x63\x32\x2e\x39\x2c\x30\x2c\x35\x2e\
+\x34\x2c\x32\x2e\x33\x2c\x35\x2e\x34\x2c\x35\x2e\x33\x63\x30\x2c\
+\x32\x2e\x39\x2d\x32\x2e\x33\x2c\x35\x2e\x34\x2d\x35\x2e\x33\x2c\
+\x35\x2e\x34\x6c\x2d\x33\x37\x2e\x32\x2c\x30\x2e\x35\x63\x2d\x31\
+\x2e\x32\x2c\x30\x2d\x32\x2e\x34\x2d\x30\x2e\x34\x2d\x33\x2e\x33\
+\x2d\x31\x2e\x31\x0a\x09\x43\x34\x32\x2e\x32\x2c\x37\x38\x2e\x35\
+\x2c\x34\x31\x2e\x34\x2c\x37\x37\x2e\x31\x2c\x34\x31\x2e\x34\x2c\
+\x37\x35\x2e\x33\x7a\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\
+\x00\x00\x02\xa6\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x38\
+\x30\x2e\x36\x32\x6d\x6d\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\
+\x31\x38\x30\x2e\x36\x32\x6d\x6d\x22\x20\x76\x69\x65\x77\x42\x6f\
+\x78\x3d\x22\x30\x20\x30\x20\x35\x31\x32\x20\x35\x31\x32\x22\x3e\
+\x3c\x73\x74\x79\x6c\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\
+\x74\x2f\x63\x73\x73\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\
+\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\
+\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\
+\x20\x30\x2e\x35\x3b\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\
+\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\
+\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\
+\x79\x3a\x20\x30\x2e\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\
+\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\
+\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\
+\x74\x79\x3a\x20\x30\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\
+\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\
+\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\
+\x79\x3a\x20\x30\x2e\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\
+\x3e\x0a\x20\x20\x3c\x74\x69\x74\x6c\x65\x3e\x41\x72\x74\x62\x6f\
+\x61\x72\x64\x20\x31\x3c\x2f\x74\x69\x74\x6c\x65\x3e\x0a\x20\x20\
+\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x34\x32\x34\x2e\x39\x34\
+\x2c\x32\x37\x31\x2e\x33\x36\x61\x33\x35\x2e\x33\x34\x2c\x33\x35\
+\x2e\x33\x34\x2c\x30\x2c\x30\x2c\x30\x2c\x30\x2d\x35\x30\x4c\x33\
+\x30\x37\x2e\x31\x35\x2c\x31\x30\x33\x2e\x36\x61\x33\x35\x2e\x33\
+\x32\x2c\x33\x35\x2e\x33\x32\x2c\x30\x2c\x30\x2c\x30\x2d\x35\x30\
+\x2c\x30\x4c\x36\x38\x2e\x37\x32\x2c\x32\x39\x32\x2e\x30\x36\x61\
+\x33\x35\x2e\x33\x33\x2c\x33\x35\x2e\x33\x33\x2c\x30\x2c\x30\x2c\
+\x30\x2c\x30\x2c\x35\x30\x6c\x37\x30\x2e\x36\x37\x2c\x37\x30\x2e\
+\x36\x37\x61\x33\x35\x2e\x33\x34\x2c\x33\x35\x2e\x33\x34\x2c\x30\
+\x2c\x30\x2c\x30\x2c\x32\x35\x2c\x31\x30\x2e\x33\x35\x48\x34\x32\
+\x36\x2e\x34\x36\x61\x38\x2e\x38\x33\x2c\x38\x2e\x38\x33\x2c\x30\
+\x2c\x30\x2c\x30\x2c\x38\x2e\x38\x33\x2d\x38\x2e\x38\x33\x56\x33\
+\x39\x38\x2e\x31\x37\x63\x30\x2d\x34\x2e\x38\x38\x2d\x34\x2d\x35\
+\x2e\x38\x39\x2d\x38\x2e\x38\x33\x2d\x35\x2e\x38\x39\x48\x33\x30\
+\x32\x2e\x36\x39\x4c\x34\x32\x34\x2e\x39\x34\x2c\x32\x37\x31\x2e\
+\x33\x36\x5a\x4d\x32\x30\x35\x2e\x31\x2c\x31\x39\x38\x2e\x37\x35\
+\x2c\x33\x32\x37\x2e\x32\x39\x2c\x33\x32\x33\x2e\x38\x31\x6c\x2d\
+\x36\x38\x2e\x34\x37\x2c\x36\x38\x2e\x34\x37\x48\x31\x35\x39\x2e\
+\x36\x39\x4c\x38\x39\x2c\x33\x31\x34\x2e\x38\x33\x2c\x32\x30\x35\
+\x2e\x31\x2c\x31\x39\x38\x2e\x37\x35\x5a\x22\x2f\x3e\x0a\x3c\x2f\
+\x73\x76\x67\x3e\x0a\
+\x00\x00\x04\x89\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\
+\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x67\x20\
+\x69\x64\x3d\x22\x53\x6f\x6c\x69\x64\x22\x3e\x0a\x09\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x37\x39\x2e\x34\x2c\x33\x30\x2e\x31\
+\x63\x30\x2d\x32\x2e\x34\x2d\x30\x2e\x39\x2d\x34\x2e\x36\x2d\x32\
+\x2e\x36\x2d\x36\x2e\x33\x63\x2d\x33\x2e\x34\x2d\x33\x2e\x34\x2d\
+\x39\x2e\x32\x2d\x33\x2e\x34\x2d\x31\x32\x2e\x36\x2c\x30\x4c\x33\
+\x33\x2e\x39\x2c\x35\x34\x2e\x32\x63\x2d\x32\x2e\x38\x2c\x30\x2e\
+\x32\x2d\x35\x2e\x35\x2c\x31\x2e\x33\x2d\x37\x2e\x35\x2c\x33\x2e\
+\x33\x63\x2d\x34\x2e\x32\x2c\x34\x2e\x32\x2d\x34\x2c\x37\x2e\x37\
+\x2d\x33\x2e\x39\x2c\x31\x30\x2e\x36\x0a\x09\x09\x63\x30\x2e\x31\
+\x2c\x32\x2e\x34\x2c\x30\x2e\x32\x2c\x34\x2e\x32\x2d\x32\x2e\x37\
+\x2c\x37\x2e\x32\x6c\x2d\x34\x2e\x33\x2c\x34\x2e\x33\x63\x35\x2e\
+\x34\x2c\x30\x2e\x37\x2c\x36\x2e\x37\x2c\x31\x2c\x39\x2e\x36\x2c\
+\x31\x6c\x30\x2c\x30\x63\x34\x2e\x34\x2c\x30\x2c\x31\x32\x2e\x37\
+\x2d\x30\x2e\x38\x2c\x31\x38\x2e\x31\x2d\x36\x2e\x32\x63\x32\x2e\
+\x31\x2d\x32\x2e\x31\x2c\x33\x2e\x32\x2d\x34\x2e\x37\x2c\x33\x2e\
+\x34\x2d\x37\x2e\x36\x6c\x33\x30\x2e\x32\x2d\x33\x30\x2e\x32\x0a\
+\x09\x09\x43\x37\x38\x2e\x35\x2c\x33\x34\x2e\x37\x2c\x37\x39\x2e\
+\x34\x2c\x33\x32\x2e\x35\x2c\x37\x39\x2e\x34\x2c\x33\x30\x2e\x31\
+\x7a\x20\x4d\x33\x39\x2c\x37\x30\x63\x2d\x33\x2e\x31\x2c\x33\x2e\
+\x31\x2d\x37\x2e\x39\x2c\x34\x2e\x31\x2d\x31\x31\x2e\x35\x2c\x34\
+\x2e\x33\x63\x31\x2e\x31\x2d\x32\x2e\x36\x2c\x31\x2d\x34\x2e\x38\
+\x2c\x30\x2e\x39\x2d\x36\x2e\x37\x63\x2d\x30\x2e\x33\x2d\x35\x2e\
+\x32\x2c\x33\x2e\x32\x2d\x37\x2e\x38\x2c\x36\x2e\x34\x2d\x37\x2e\
+\x38\x0a\x09\x09\x63\x31\x2e\x36\x2c\x30\x2c\x33\x2e\x31\x2c\x30\
+\x2e\x36\x2c\x34\x2e\x32\x2c\x31\x2e\x37\x43\x34\x31\x2e\x33\x2c\
+\x36\x34\x2c\x34\x31\x2e\x33\x2c\x36\x37\x2e\x37\x2c\x33\x39\x2c\
+\x37\x30\x7a\x20\x4d\x37\x32\x2e\x36\x2c\x33\x32\x2e\x32\x4c\x34\
+\x35\x2c\x35\x39\x2e\x38\x63\x2d\x30\x2e\x35\x2d\x30\x2e\x39\x2d\
+\x31\x2e\x31\x2d\x31\x2e\x37\x2d\x31\x2e\x38\x2d\x32\x2e\x34\x73\
+\x2d\x31\x2e\x36\x2d\x31\x2e\x33\x2d\x32\x2e\x34\x2d\x31\x2e\x38\
+\x4c\x36\x38\x2e\x34\x2c\x32\x38\x0a\x09\x09\x63\x31\x2e\x31\x2d\
+\x31\x2e\x31\x2c\x33\x2e\x31\x2d\x31\x2e\x31\x2c\x34\x2e\x32\x2c\
+\x30\x63\x30\x2e\x36\x2c\x30\x2e\x36\x2c\x30\x2e\x39\x2c\x31\x2e\
+\x33\x2c\x30\x2e\x39\x2c\x32\x2e\x31\x43\x37\x33\x2e\x35\x2c\x33\
+\x30\x2e\x39\x2c\x37\x33\x2e\x32\x2c\x33\x31\x2e\x37\x2c\x37\x32\
+\x2e\x36\x2c\x33\x32\x2e\x32\x7a\x22\x2f\x3e\x0a\x3c\x2f\x67\x3e\
+\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x02\xa5\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x32\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\
+\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x6f\
+\x6c\x79\x67\x6f\x6e\x20\x70\x6f\x69\x6e\x74\x73\x3d\x22\x37\x32\
+\x2c\x35\x30\x20\x31\x33\x2e\x38\x2c\x32\x2e\x36\x20\x31\x33\x2e\
+\x38\x2c\x39\x37\x2e\x34\x20\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\
+\x20\x78\x3d\x22\x37\x31\x22\x20\x79\x3d\x22\x32\x2e\x36\x22\x20\
+\x77\x69\x64\x74\x68\x3d\x22\x31\x32\x2e\x35\x22\x20\x68\x65\x69\
+\x67\x68\x74\x3d\x22\x39\x34\x2e\x38\x22\x2f\x3e\x0a\x3c\x2f\x73\
+\x76\x67\x3e\x0a\
+\x00\x00\x05\xd9\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\
+\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x67\x20\
+\x69\x64\x3d\x22\x53\x6f\x6c\x69\x64\x5f\x31\x5f\x22\x3e\x0a\x09\
+\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x37\x32\x2e\x39\x2c\x36\
+\x31\x2e\x31\x56\x33\x37\x2e\x33\x63\x33\x2e\x33\x2d\x31\x2e\x32\
+\x2c\x35\x2e\x37\x2d\x34\x2e\x33\x2c\x35\x2e\x37\x2d\x38\x63\x30\
+\x2d\x34\x2e\x37\x2d\x33\x2e\x38\x2d\x38\x2e\x35\x2d\x38\x2e\x35\
+\x2d\x38\x2e\x35\x63\x2d\x33\x2e\x37\x2c\x30\x2d\x36\x2e\x38\x2c\
+\x32\x2e\x34\x2d\x38\x2c\x35\x2e\x37\x48\x33\x38\x2e\x32\x63\x2d\
+\x31\x2e\x32\x2d\x33\x2e\x33\x2d\x34\x2e\x33\x2d\x35\x2e\x37\x2d\
+\x38\x2d\x35\x2e\x37\x0a\x09\x09\x63\x2d\x34\x2e\x37\x2c\x30\x2d\
+\x38\x2e\x35\x2c\x33\x2e\x38\x2d\x38\x2e\x35\x2c\x38\x2e\x35\x63\
+\x30\x2c\x33\x2e\x37\x2c\x32\x2e\x34\x2c\x36\x2e\x38\x2c\x35\x2e\
+\x37\x2c\x38\x76\x32\x33\x2e\x38\x63\x2d\x33\x2e\x33\x2c\x31\x2e\
+\x32\x2d\x35\x2e\x37\x2c\x34\x2e\x33\x2d\x35\x2e\x37\x2c\x38\x63\
+\x30\x2c\x34\x2e\x37\x2c\x33\x2e\x38\x2c\x38\x2e\x35\x2c\x38\x2e\
+\x35\x2c\x38\x2e\x35\x63\x33\x2e\x37\x2c\x30\x2c\x36\x2e\x38\x2d\
+\x32\x2e\x34\x2c\x38\x2d\x35\x2e\x37\x48\x36\x32\x0a\x09\x09\x63\
+\x31\x2e\x32\x2c\x33\x2e\x33\x2c\x34\x2e\x33\x2c\x35\x2e\x37\x2c\
+\x38\x2c\x35\x2e\x37\x63\x34\x2e\x37\x2c\x30\x2c\x38\x2e\x35\x2d\
+\x33\x2e\x38\x2c\x38\x2e\x35\x2d\x38\x2e\x35\x43\x37\x38\x2e\x36\
+\x2c\x36\x35\x2e\x34\x2c\x37\x36\x2e\x32\x2c\x36\x32\x2e\x32\x2c\
+\x37\x32\x2e\x39\x2c\x36\x31\x2e\x31\x7a\x20\x4d\x37\x30\x2e\x31\
+\x2c\x32\x36\x2e\x34\x63\x31\x2e\x36\x2c\x30\x2c\x32\x2e\x38\x2c\
+\x31\x2e\x33\x2c\x32\x2e\x38\x2c\x32\x2e\x38\x0a\x09\x09\x63\x30\
+\x2c\x31\x2e\x36\x2d\x31\x2e\x33\x2c\x32\x2e\x38\x2d\x32\x2e\x38\
+\x2c\x32\x2e\x38\x63\x2d\x31\x2e\x36\x2c\x30\x2d\x32\x2e\x38\x2d\
+\x31\x2e\x33\x2d\x32\x2e\x38\x2d\x32\x2e\x38\x43\x36\x37\x2e\x32\
+\x2c\x32\x37\x2e\x37\x2c\x36\x38\x2e\x35\x2c\x32\x36\x2e\x34\x2c\
+\x37\x30\x2e\x31\x2c\x32\x36\x2e\x34\x7a\x20\x4d\x33\x30\x2e\x32\
+\x2c\x32\x36\x2e\x34\x63\x31\x2e\x36\x2c\x30\x2c\x32\x2e\x38\x2c\
+\x31\x2e\x33\x2c\x32\x2e\x38\x2c\x32\x2e\x38\x0a\x09\x09\x63\x30\
+\x2c\x31\x2e\x36\x2d\x31\x2e\x33\x2c\x32\x2e\x38\x2d\x32\x2e\x38\
+\x2c\x32\x2e\x38\x63\x2d\x31\x2e\x36\x2c\x30\x2d\x32\x2e\x38\x2d\
+\x31\x2e\x33\x2d\x32\x2e\x38\x2d\x32\x2e\x38\x43\x32\x37\x2e\x34\
+\x2c\x32\x37\x2e\x37\x2c\x32\x38\x2e\x37\x2c\x32\x36\x2e\x34\x2c\
+\x33\x30\x2e\x32\x2c\x32\x36\x2e\x34\x7a\x20\x4d\x33\x30\x2e\x32\
+\x2c\x37\x31\x2e\x39\x63\x2d\x31\x2e\x36\x2c\x30\x2d\x32\x2e\x38\
+\x2d\x31\x2e\x33\x2d\x32\x2e\x38\x2d\x32\x2e\x38\x0a\x09\x09\x63\
+\x30\x2d\x31\x2e\x36\x2c\x31\x2e\x33\x2d\x32\x2e\x38\x2c\x32\x2e\
+\x38\x2d\x32\x2e\x38\x63\x31\x2e\x36\x2c\x30\x2c\x32\x2e\x38\x2c\
+\x31\x2e\x33\x2c\x32\x2e\x38\x2c\x32\x2e\x38\x43\x33\x33\x2e\x31\
+\x2c\x37\x30\x2e\x36\x2c\x33\x31\x2e\x38\x2c\x37\x31\x2e\x39\x2c\
+\x33\x30\x2e\x32\x2c\x37\x31\x2e\x39\x7a\x20\x4d\x36\x32\x2e\x31\
+\x2c\x36\x36\x2e\x32\x48\x33\x38\x2e\x32\x63\x2d\x30\x2e\x39\x2d\
+\x32\x2e\x34\x2d\x32\x2e\x38\x2d\x34\x2e\x33\x2d\x35\x2e\x32\x2d\
+\x35\x2e\x32\x56\x33\x37\x2e\x33\x0a\x09\x09\x63\x32\x2e\x34\x2d\
+\x30\x2e\x39\x2c\x34\x2e\x33\x2d\x32\x2e\x38\x2c\x35\x2e\x32\x2d\
+\x35\x2e\x32\x48\x36\x32\x63\x30\x2e\x39\x2c\x32\x2e\x34\x2c\x32\
+\x2e\x38\x2c\x34\x2e\x33\x2c\x35\x2e\x32\x2c\x35\x2e\x32\x76\x32\
+\x33\x2e\x38\x43\x36\x34\x2e\x38\x2c\x36\x31\x2e\x39\x2c\x36\x32\
+\x2e\x39\x2c\x36\x33\x2e\x38\x2c\x36\x32\x2e\x31\x2c\x36\x36\x2e\
+\x32\x7a\x20\x4d\x37\x30\x2e\x31\x2c\x37\x31\x2e\x39\x63\x2d\x31\
+\x2e\x36\x2c\x30\x2d\x32\x2e\x38\x2d\x31\x2e\x33\x2d\x32\x2e\x38\
+\x2d\x32\x2e\x38\x0a\x09\x09\x63\x30\x2d\x31\x2e\x36\x2c\x31\x2e\
+\x33\x2d\x32\x2e\x38\x2c\x32\x2e\x38\x2d\x32\x2e\x38\x63\x31\x2e\
+\x36\x2c\x30\x2c\x32\x2e\x38\x2c\x31\x2e\x33\x2c\x32\x2e\x38\x2c\
+\x32\x2e\x38\x53\x37\x31\x2e\x36\x2c\x37\x31\x2e\x39\x2c\x37\x30\
+\x2e\x31\x2c\x37\x31\x2e\x39\x7a\x22\x2f\x3e\x0a\x3c\x2f\x67\x3e\
+\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x02\x75\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x30\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\
+\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x6f\
+\x6c\x79\x67\x6f\x6e\x20\x70\x6f\x69\x6e\x74\x73\x3d\x22\x35\x30\
+\x2c\x37\x39\x2e\x31\x20\x39\x37\x2e\x34\x2c\x32\x30\x2e\x39\x20\
+\x32\x2e\x36\x2c\x32\x30\x2e\x39\x20\x22\x2f\x3e\x0a\x3c\x2f\x73\
+\x76\x67\x3e\x0a\
+\x00\x00\x06\xbe\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x36\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\
+\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x67\x3e\
+\x0a\x09\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x33\x34\x2e\x36\
+\x2c\x31\x36\x2e\x35\x6c\x2d\x31\x32\x2e\x33\x2d\x35\x2e\x31\x63\
+\x2d\x30\x2e\x33\x2d\x30\x2e\x31\x2d\x30\x2e\x36\x2d\x30\x2e\x32\
+\x2d\x30\x2e\x39\x2c\x30\x63\x2d\x30\x2e\x33\x2c\x30\x2e\x31\x2d\
+\x30\x2e\x35\x2c\x30\x2e\x33\x2d\x30\x2e\x36\x2c\x30\x2e\x36\x73\
+\x2d\x30\x2e\x32\x2c\x30\x2e\x36\x2c\x30\x2c\x30\x2e\x39\x6c\x31\
+\x2e\x38\x2c\x34\x2e\x33\x6c\x2d\x33\x2e\x38\x2c\x31\x2e\x35\x0a\
+\x09\x09\x63\x2d\x38\x2c\x33\x2e\x33\x2d\x31\x32\x2e\x31\x2c\x37\
+\x2e\x37\x2d\x31\x32\x2c\x31\x33\x63\x30\x2c\x31\x2e\x38\x2c\x30\
+\x2e\x35\x2c\x33\x2e\x38\x2c\x31\x2e\x35\x2c\x36\x63\x30\x2e\x38\
+\x2c\x31\x2e\x39\x2c\x32\x2e\x35\x2c\x34\x2e\x32\x2c\x35\x2e\x34\
+\x2c\x36\x2e\x38\x63\x30\x2e\x31\x2c\x30\x2e\x31\x2c\x30\x2e\x32\
+\x2c\x30\x2e\x32\x2c\x30\x2e\x33\x2c\x30\x2e\x34\x63\x30\x2e\x31\
+\x2c\x30\x2e\x31\x2c\x30\x2e\x33\x2c\x30\x2e\x33\x2c\x30\x2e\x34\
+\x2c\x30\x2e\x34\x0a\x09\x09\x63\x30\x2e\x31\x2c\x30\x2e\x31\x2c\
+\x30\x2e\x33\x2c\x30\x2e\x33\x2c\x30\x2e\x34\x2c\x30\x2e\x33\x63\
+\x30\x2e\x32\x2c\x30\x2e\x32\x2c\x30\x2e\x34\x2c\x30\x2e\x32\x2c\
+\x30\x2e\x36\x2c\x30\x2e\x31\x63\x30\x2e\x32\x2c\x30\x2c\x30\x2e\
+\x33\x2d\x30\x2e\x32\x2c\x30\x2e\x34\x2d\x30\x2e\x33\x63\x30\x2d\
+\x30\x2e\x32\x2c\x30\x2d\x30\x2e\x34\x2d\x30\x2e\x31\x2d\x30\x2e\
+\x35\x73\x2d\x30\x2e\x31\x2d\x30\x2e\x32\x2d\x30\x2e\x32\x2d\x30\
+\x2e\x34\x0a\x09\x09\x63\x2d\x30\x2e\x31\x2d\x30\x2e\x32\x2d\x30\
+\x2e\x32\x2d\x30\x2e\x33\x2d\x30\x2e\x32\x2d\x30\x2e\x34\x63\x2d\
+\x30\x2e\x34\x2d\x30\x2e\x37\x2d\x30\x2e\x37\x2d\x31\x2e\x34\x2d\
+\x31\x2d\x32\x63\x2d\x30\x2e\x35\x2d\x31\x2e\x31\x2d\x30\x2e\x38\
+\x2d\x32\x2e\x32\x2d\x31\x2d\x33\x2e\x32\x73\x2d\x30\x2e\x32\x2d\
+\x31\x2e\x39\x2d\x30\x2e\x31\x2d\x32\x2e\x37\x63\x30\x2d\x30\x2e\
+\x38\x2c\x30\x2e\x33\x2d\x31\x2e\x36\x2c\x30\x2e\x36\x2d\x32\x2e\
+\x33\x0a\x09\x09\x63\x30\x2e\x34\x2d\x30\x2e\x37\x2c\x30\x2e\x38\
+\x2d\x31\x2e\x34\x2c\x31\x2e\x33\x2d\x32\x63\x30\x2e\x35\x2d\x30\
+\x2e\x36\x2c\x31\x2e\x32\x2d\x31\x2e\x31\x2c\x32\x2d\x31\x2e\x37\
+\x63\x30\x2e\x38\x2d\x30\x2e\x35\x2c\x31\x2e\x36\x2d\x31\x2c\x32\
+\x2e\x34\x2d\x31\x2e\x35\x63\x30\x2e\x38\x2d\x30\x2e\x34\x2c\x31\
+\x2e\x38\x2d\x30\x2e\x38\x2c\x32\x2e\x39\x2d\x31\x2e\x33\x6c\x33\
+\x2e\x38\x2d\x31\x2e\x35\x6c\x31\x2e\x38\x2c\x34\x2e\x33\x0a\x09\
+\x09\x63\x30\x2e\x31\x2c\x30\x2e\x33\x2c\x30\x2e\x33\x2c\x30\x2e\
+\x35\x2c\x30\x2e\x36\x2c\x30\x2e\x36\x63\x30\x2e\x33\x2c\x30\x2e\
+\x31\x2c\x30\x2e\x36\x2c\x30\x2e\x32\x2c\x30\x2e\x39\x2c\x30\x63\
+\x30\x2e\x33\x2d\x30\x2e\x31\x2c\x30\x2e\x35\x2d\x30\x2e\x33\x2c\
+\x30\x2e\x36\x2d\x30\x2e\x36\x6c\x35\x2e\x31\x2d\x31\x32\x2e\x33\
+\x63\x30\x2e\x31\x2d\x30\x2e\x33\x2c\x30\x2e\x32\x2d\x30\x2e\x36\
+\x2c\x30\x2d\x30\x2e\x39\x0a\x09\x09\x43\x33\x35\x2e\x32\x2c\x31\
+\x36\x2e\x38\x2c\x33\x35\x2c\x31\x36\x2e\x36\x2c\x33\x34\x2e\x36\
+\x2c\x31\x36\x2e\x35\x7a\x22\x2f\x3e\x0a\x3c\x2f\x67\x3e\x0a\x3c\
+\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x36\x30\x2e\x31\x2c\x38\x38\
+\x2e\x36\x6c\x32\x35\x2e\x34\x2d\x31\x33\x2e\x38\x56\x34\x39\x2e\
+\x35\x6c\x2d\x32\x35\x2e\x34\x2c\x39\x2e\x32\x56\x38\x38\x2e\x36\
+\x7a\x20\x4d\x35\x37\x2e\x36\x2c\x35\x34\x2e\x33\x6c\x32\x37\x2e\
+\x37\x2d\x31\x30\x2e\x31\x4c\x35\x37\x2e\x36\x2c\x33\x34\x2e\x32\
+\x4c\x32\x39\x2e\x39\x2c\x34\x34\x2e\x32\x4c\x35\x37\x2e\x36\x2c\
+\x35\x34\x2e\x33\x7a\x20\x4d\x39\x30\x2e\x35\x2c\x34\x34\x2e\x33\
+\x76\x33\x30\x2e\x34\x0a\x09\x63\x30\x2c\x30\x2e\x39\x2d\x30\x2e\
+\x32\x2c\x31\x2e\x38\x2d\x30\x2e\x37\x2c\x32\x2e\x36\x63\x2d\x30\
+\x2e\x35\x2c\x30\x2e\x38\x2d\x31\x2e\x31\x2c\x31\x2e\x34\x2d\x31\
+\x2e\x39\x2c\x31\x2e\x39\x4c\x36\x30\x2c\x39\x34\x2e\x34\x63\x2d\
+\x30\x2e\x37\x2c\x30\x2e\x34\x2d\x31\x2e\x35\x2c\x30\x2e\x36\x2d\
+\x32\x2e\x34\x2c\x30\x2e\x36\x63\x2d\x30\x2e\x39\x2c\x30\x2d\x31\
+\x2e\x37\x2d\x30\x2e\x32\x2d\x32\x2e\x34\x2d\x30\x2e\x36\x4c\x32\
+\x37\x2e\x33\x2c\x37\x39\x2e\x32\x0a\x09\x63\x2d\x30\x2e\x38\x2d\
+\x30\x2e\x34\x2d\x31\x2e\x35\x2d\x31\x2e\x31\x2d\x31\x2e\x39\x2d\
+\x31\x2e\x39\x63\x2d\x30\x2e\x35\x2d\x30\x2e\x38\x2d\x30\x2e\x37\
+\x2d\x31\x2e\x37\x2d\x30\x2e\x37\x2d\x32\x2e\x36\x56\x34\x34\x2e\
+\x33\x63\x30\x2d\x31\x2e\x31\x2c\x30\x2e\x33\x2d\x32\x2c\x30\x2e\
+\x39\x2d\x32\x2e\x39\x73\x31\x2e\x34\x2d\x31\x2e\x35\x2c\x32\x2e\
+\x34\x2d\x31\x2e\x39\x6c\x32\x37\x2e\x39\x2d\x31\x30\x2e\x31\x63\
+\x30\x2e\x36\x2d\x30\x2e\x32\x2c\x31\x2e\x32\x2d\x30\x2e\x33\x2c\
+\x31\x2e\x37\x2d\x30\x2e\x33\x0a\x09\x63\x30\x2e\x36\x2c\x30\x2c\
+\x31\x2e\x32\x2c\x30\x2e\x31\x2c\x31\x2e\x37\x2c\x30\x2e\x33\x6c\
+\x32\x37\x2e\x39\x2c\x31\x30\x2e\x31\x63\x31\x2c\x30\x2e\x34\x2c\
+\x31\x2e\x38\x2c\x31\x2c\x32\x2e\x34\x2c\x31\x2e\x39\x53\x39\x30\
+\x2e\x35\x2c\x34\x33\x2e\x32\x2c\x39\x30\x2e\x35\x2c\x34\x34\x2e\
+\x33\x7a\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x02\x6d\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x34\x2e\x30\x2e\x30\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\
+\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x70\x6f\
+\x69\x6e\x74\x73\x3d\x22\x35\x30\x2c\x32\x30\x2e\x39\x20\x32\x2e\
+\x36\x2c\x37\x39\x2e\x31\x20\x39\x37\x2e\x34\x2c\x37\x39\x2e\x31\
+\x20\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x02\xf5\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x36\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\
+\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x37\
+\x34\x2e\x37\x2c\x38\x36\x2e\x39\x48\x32\x36\x2e\x34\x63\x2d\x36\
+\x2e\x39\x2c\x30\x2d\x31\x32\x2e\x32\x2d\x35\x2e\x34\x2d\x31\x32\
+\x2e\x32\x2d\x31\x32\x2e\x32\x56\x32\x36\x2e\x34\x63\x30\x2d\x36\
+\x2e\x39\x2c\x35\x2e\x34\x2d\x31\x32\x2e\x32\x2c\x31\x32\x2e\x32\
+\x2d\x31\x32\x2e\x32\x68\x34\x38\x2e\x31\x63\x36\x2e\x39\x2c\x30\
+\x2c\x31\x32\x2e\x32\x2c\x35\x2e\x34\x2c\x31\x32\x2e\x32\x2c\x31\
+\x32\x2e\x32\x76\x34\x38\x2e\x31\x0a\x09\x43\x38\x36\x2e\x39\x2c\
+\x38\x31\x2e\x35\x2c\x38\x31\x2e\x35\x2c\x38\x36\x2e\x39\x2c\x37\
+\x34\x2e\x37\x2c\x38\x36\x2e\x39\x7a\x20\x4d\x32\x38\x2e\x39\x2c\
+\x37\x32\x2e\x31\x68\x34\x33\x2e\x32\x56\x32\x38\x2e\x39\x48\x32\
+\x38\x2e\x39\x56\x37\x32\x2e\x31\x7a\x22\x2f\x3e\x0a\x3c\x2f\x73\
+\x76\x67\x3e\x0a\
+\x00\x00\x04\x0d\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\
+\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x33\x30\x2e\x32\x2c\x37\x37\x2e\x37\
+\x63\x2d\x34\x2e\x37\x2c\x30\x2d\x38\x2e\x36\x2d\x33\x2e\x39\x2d\
+\x38\x2e\x36\x2d\x38\x2e\x36\x73\x33\x2e\x39\x2d\x38\x2e\x36\x2c\
+\x38\x2e\x36\x2d\x38\x2e\x36\x73\x38\x2e\x36\x2c\x33\x2e\x39\x2c\
+\x38\x2e\x36\x2c\x38\x2e\x36\x53\x33\x34\x2e\x39\x2c\x37\x37\x2e\
+\x37\x2c\x33\x30\x2e\x32\x2c\x37\x37\x2e\x37\x7a\x20\x4d\x33\x30\
+\x2e\x32\x2c\x36\x36\x2e\x31\x63\x2d\x31\x2e\x37\x2c\x30\x2d\x33\
+\x2c\x31\x2e\x33\x2d\x33\x2c\x33\x0a\x09\x73\x31\x2e\x33\x2c\x33\
+\x2c\x33\x2c\x33\x73\x33\x2d\x31\x2e\x33\x2c\x33\x2d\x33\x53\x33\
+\x31\x2e\x39\x2c\x36\x36\x2e\x31\x2c\x33\x30\x2e\x32\x2c\x36\x36\
+\x2e\x31\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\
+\x4d\x37\x30\x2e\x31\x2c\x33\x37\x2e\x38\x63\x2d\x34\x2e\x37\x2c\
+\x30\x2d\x38\x2e\x36\x2d\x33\x2e\x39\x2d\x38\x2e\x36\x2d\x38\x2e\
+\x36\x73\x33\x2e\x39\x2d\x38\x2e\x36\x2c\x38\x2e\x36\x2d\x38\x2e\
+\x36\x73\x38\x2e\x36\x2c\x33\x2e\x39\x2c\x38\x2e\x36\x2c\x38\x2e\
+\x36\x53\x37\x34\x2e\x38\x2c\x33\x37\x2e\x38\x2c\x37\x30\x2e\x31\
+\x2c\x33\x37\x2e\x38\x7a\x20\x4d\x37\x30\x2e\x31\x2c\x32\x36\x2e\
+\x32\x63\x2d\x31\x2e\x37\x2c\x30\x2d\x33\x2c\x31\x2e\x33\x2d\x33\
+\x2c\x33\x0a\x09\x73\x31\x2e\x33\x2c\x33\x2c\x33\x2c\x33\x73\x33\
+\x2d\x31\x2e\x33\x2c\x33\x2d\x33\x53\x37\x31\x2e\x38\x2c\x32\x36\
+\x2e\x32\x2c\x37\x30\x2e\x31\x2c\x32\x36\x2e\x32\x7a\x22\x2f\x3e\
+\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x32\x38\x22\x20\x79\x3d\
+\x22\x34\x36\x2e\x37\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\
+\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\x30\x2e\x37\x30\x32\x37\x20\
+\x2d\x30\x2e\x37\x31\x31\x35\x20\x30\x2e\x37\x31\x31\x35\x20\x30\
+\x2e\x37\x30\x32\x37\x20\x2d\x32\x30\x2e\x31\x38\x34\x33\x20\x35\
+\x30\x2e\x35\x39\x32\x38\x29\x22\x20\x77\x69\x64\x74\x68\x3d\x22\
+\x34\x34\x2e\x38\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x35\x2e\
+\x36\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x03\xb4\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\
+\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x34\
+\x31\x2e\x35\x2c\x36\x37\x2e\x36\x63\x2d\x31\x34\x2e\x34\x2c\x30\
+\x2d\x32\x36\x2e\x31\x2d\x31\x31\x2e\x37\x2d\x32\x36\x2e\x31\x2d\
+\x32\x36\x2e\x31\x73\x31\x31\x2e\x37\x2d\x32\x36\x2e\x31\x2c\x32\
+\x36\x2e\x31\x2d\x32\x36\x2e\x31\x73\x32\x36\x2e\x31\x2c\x31\x31\
+\x2e\x37\x2c\x32\x36\x2e\x31\x2c\x32\x36\x2e\x31\x53\x35\x35\x2e\
+\x39\x2c\x36\x37\x2e\x36\x2c\x34\x31\x2e\x35\x2c\x36\x37\x2e\x36\
+\x7a\x20\x4d\x34\x31\x2e\x35\x2c\x32\x32\x2e\x34\x0a\x09\x43\x33\
+\x31\x2c\x32\x32\x2e\x34\x2c\x32\x32\x2e\x34\x2c\x33\x31\x2c\x32\
+\x32\x2e\x34\x2c\x34\x31\x2e\x35\x63\x30\x2c\x31\x30\x2e\x35\x2c\
+\x38\x2e\x36\x2c\x31\x39\x2e\x31\x2c\x31\x39\x2e\x31\x2c\x31\x39\
+\x2e\x31\x63\x31\x30\x2e\x35\x2c\x30\x2c\x31\x39\x2e\x31\x2d\x38\
+\x2e\x36\x2c\x31\x39\x2e\x31\x2d\x31\x39\x2e\x31\x43\x36\x30\x2e\
+\x36\x2c\x33\x31\x2c\x35\x32\x2c\x32\x32\x2e\x34\x2c\x34\x31\x2e\
+\x35\x2c\x32\x32\x2e\x34\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\
+\x20\x64\x3d\x22\x4d\x38\x34\x2e\x34\x2c\x37\x39\x2e\x38\x4c\x36\
+\x34\x2e\x32\x2c\x36\x30\x2e\x36\x63\x2d\x31\x2e\x34\x2c\x31\x2e\
+\x37\x2d\x33\x2e\x31\x2c\x33\x2e\x32\x2d\x34\x2e\x38\x2c\x34\x2e\
+\x36\x6c\x32\x30\x2e\x35\x2c\x31\x39\x2e\x34\x63\x30\x2e\x36\x2c\
+\x30\x2e\x36\x2c\x31\x2e\x35\x2c\x30\x2e\x39\x2c\x32\x2e\x33\x2c\
+\x30\x2e\x39\x63\x30\x2e\x39\x2c\x30\x2c\x31\x2e\x38\x2d\x30\x2e\
+\x33\x2c\x32\x2e\x34\x2d\x31\x0a\x09\x43\x38\x35\x2e\x38\x2c\x38\
+\x33\x2e\x32\x2c\x38\x35\x2e\x37\x2c\x38\x31\x2e\x31\x2c\x38\x34\
+\x2e\x34\x2c\x37\x39\x2e\x38\x7a\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\
+\x67\x3e\x0a\
+\x00\x00\x02\xb4\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x36\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\
+\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x70\x6f\
+\x69\x6e\x74\x73\x3d\x22\x36\x37\x2e\x33\x2c\x37\x33\x2e\x36\x20\
+\x35\x30\x2e\x36\x2c\x36\x34\x2e\x37\x20\x33\x33\x2e\x37\x2c\x37\
+\x33\x2e\x34\x20\x33\x37\x2c\x35\x34\x2e\x38\x20\x32\x33\x2e\x35\
+\x2c\x34\x31\x2e\x35\x20\x34\x32\x2e\x33\x2c\x33\x38\x2e\x38\x20\
+\x35\x30\x2e\x38\x2c\x32\x31\x2e\x39\x20\x35\x39\x2e\x31\x2c\x33\
+\x38\x2e\x39\x20\x37\x37\x2e\x38\x2c\x34\x31\x2e\x37\x20\x36\x34\
+\x2e\x32\x2c\x35\x34\x2e\x39\x20\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\
+\x67\x3e\x0a\
+\x00\x00\x06\x3b\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\
+\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x35\
+\x30\x2c\x33\x30\x63\x2d\x34\x2e\x37\x2c\x30\x2d\x38\x2e\x36\x2d\
+\x33\x2e\x39\x2d\x38\x2e\x36\x2d\x38\x2e\x36\x73\x33\x2e\x39\x2d\
+\x38\x2e\x36\x2c\x38\x2e\x36\x2d\x38\x2e\x36\x73\x38\x2e\x36\x2c\
+\x33\x2e\x39\x2c\x38\x2e\x36\x2c\x38\x2e\x36\x53\x35\x34\x2e\x37\
+\x2c\x33\x30\x2c\x35\x30\x2c\x33\x30\x7a\x20\x4d\x35\x30\x2c\x31\
+\x38\x2e\x34\x63\x2d\x31\x2e\x37\x2c\x30\x2d\x33\x2c\x31\x2e\x33\
+\x2d\x33\x2c\x33\x73\x31\x2e\x33\x2c\x33\x2c\x33\x2c\x33\x0a\x09\
+\x73\x33\x2d\x31\x2e\x33\x2c\x33\x2d\x33\x53\x35\x31\x2e\x37\x2c\
+\x31\x38\x2e\x34\x2c\x35\x30\x2c\x31\x38\x2e\x34\x7a\x22\x2f\x3e\
+\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x37\x37\x2e\x38\x2c\
+\x35\x38\x2e\x39\x63\x2d\x34\x2e\x37\x2c\x30\x2d\x38\x2e\x36\x2d\
+\x33\x2e\x39\x2d\x38\x2e\x36\x2d\x38\x2e\x36\x73\x33\x2e\x39\x2d\
+\x38\x2e\x36\x2c\x38\x2e\x36\x2d\x38\x2e\x36\x73\x38\x2e\x36\x2c\
+\x33\x2e\x39\x2c\x38\x2e\x36\x2c\x38\x2e\x36\x53\x38\x32\x2e\x35\
+\x2c\x35\x38\x2e\x39\x2c\x37\x37\x2e\x38\x2c\x35\x38\x2e\x39\x7a\
+\x20\x4d\x37\x37\x2e\x38\x2c\x34\x37\x2e\x33\x63\x2d\x31\x2e\x37\
+\x2c\x30\x2d\x33\x2c\x31\x2e\x33\x2d\x33\x2c\x33\x0a\x09\x73\x31\
+\x2e\x33\x2c\x33\x2c\x33\x2c\x33\x73\x33\x2d\x31\x2e\x33\x2c\x33\
+\x2d\x33\x53\x37\x39\x2e\x35\x2c\x34\x37\x2e\x33\x2c\x37\x37\x2e\
+\x38\x2c\x34\x37\x2e\x33\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\
+\x20\x64\x3d\x22\x4d\x35\x30\x2c\x38\x35\x2e\x36\x63\x2d\x34\x2e\
+\x37\x2c\x30\x2d\x38\x2e\x36\x2d\x33\x2e\x39\x2d\x38\x2e\x36\x2d\
+\x38\x2e\x36\x73\x33\x2e\x39\x2d\x38\x2e\x36\x2c\x38\x2e\x36\x2d\
+\x38\x2e\x36\x73\x38\x2e\x36\x2c\x33\x2e\x39\x2c\x38\x2e\x36\x2c\
+\x38\x2e\x36\x53\x35\x34\x2e\x37\x2c\x38\x35\x2e\x36\x2c\x35\x30\
+\x2c\x38\x35\x2e\x36\x7a\x20\x4d\x35\x30\x2c\x37\x34\x63\x2d\x31\
+\x2e\x37\x2c\x30\x2d\x33\x2c\x31\x2e\x33\x2d\x33\x2c\x33\x73\x31\
+\x2e\x33\x2c\x33\x2c\x33\x2c\x33\x0a\x09\x73\x33\x2d\x31\x2e\x33\
+\x2c\x33\x2d\x33\x53\x35\x31\x2e\x37\x2c\x37\x34\x2c\x35\x30\x2c\
+\x37\x34\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\
+\x4d\x32\x32\x2e\x32\x2c\x35\x38\x2e\x36\x63\x2d\x34\x2e\x37\x2c\
+\x30\x2d\x38\x2e\x36\x2d\x33\x2e\x39\x2d\x38\x2e\x36\x2d\x38\x2e\
+\x36\x73\x33\x2e\x39\x2d\x38\x2e\x36\x2c\x38\x2e\x36\x2d\x38\x2e\
+\x36\x73\x38\x2e\x36\x2c\x33\x2e\x39\x2c\x38\x2e\x36\x2c\x38\x2e\
+\x36\x53\x32\x36\x2e\x39\x2c\x35\x38\x2e\x36\x2c\x32\x32\x2e\x32\
+\x2c\x35\x38\x2e\x36\x7a\x20\x4d\x32\x32\x2e\x32\x2c\x34\x37\x63\
+\x2d\x31\x2e\x37\x2c\x30\x2d\x33\x2c\x31\x2e\x33\x2d\x33\x2c\x33\
+\x0a\x09\x73\x31\x2e\x33\x2c\x33\x2c\x33\x2c\x33\x73\x33\x2d\x31\
+\x2e\x33\x2c\x33\x2d\x33\x53\x32\x33\x2e\x39\x2c\x34\x37\x2c\x32\
+\x32\x2e\x32\x2c\x34\x37\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\
+\x20\x64\x3d\x22\x4d\x32\x36\x2e\x34\x2c\x34\x34\x2e\x35\x4c\x32\
+\x31\x2c\x34\x33\x2e\x35\x63\x32\x2e\x32\x2d\x31\x31\x2e\x32\x2c\
+\x31\x30\x2e\x37\x2d\x32\x30\x2e\x32\x2c\x32\x31\x2e\x37\x2d\x32\
+\x33\x6c\x31\x2e\x34\x2c\x35\x2e\x34\x43\x33\x35\x2e\x31\x2c\x32\
+\x38\x2e\x32\x2c\x32\x38\x2e\x32\x2c\x33\x35\x2e\x35\x2c\x32\x36\
+\x2e\x34\x2c\x34\x34\x2e\x35\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\x74\
+\x68\x20\x64\x3d\x22\x4d\x34\x33\x2e\x36\x2c\x37\x38\x63\x2d\x31\
+\x31\x2e\x35\x2d\x32\x2e\x35\x2d\x32\x30\x2e\x37\x2d\x31\x32\x2d\
+\x32\x32\x2e\x38\x2d\x32\x33\x2e\x36\x6c\x35\x2e\x35\x2d\x31\x63\
+\x31\x2e\x37\x2c\x39\x2e\x34\x2c\x39\x2e\x31\x2c\x31\x37\x2e\x31\
+\x2c\x31\x38\x2e\x34\x2c\x31\x39\x2e\x32\x4c\x34\x33\x2e\x36\x2c\
+\x37\x38\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\
+\x4d\x35\x36\x2e\x36\x2c\x37\x38\x6c\x2d\x31\x2e\x33\x2d\x35\x2e\
+\x35\x63\x39\x2e\x33\x2d\x32\x2e\x32\x2c\x31\x36\x2e\x34\x2d\x39\
+\x2e\x36\x2c\x31\x38\x2e\x32\x2d\x31\x38\x2e\x39\x6c\x35\x2e\x35\
+\x2c\x31\x2e\x31\x43\x37\x36\x2e\x38\x2c\x36\x36\x2e\x32\x2c\x36\
+\x38\x2c\x37\x35\x2e\x34\x2c\x35\x36\x2e\x36\x2c\x37\x38\x7a\x22\
+\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x37\x33\x2e\
+\x39\x2c\x34\x36\x2e\x36\x63\x2d\x31\x2e\x31\x2d\x39\x2e\x38\x2d\
+\x37\x2e\x39\x2d\x31\x37\x2e\x39\x2d\x31\x37\x2e\x34\x2d\x32\x30\
+\x2e\x35\x6c\x31\x2e\x35\x2d\x35\x2e\x34\x43\x36\x39\x2e\x38\x2c\
+\x32\x34\x2c\x37\x38\x2e\x32\x2c\x33\x33\x2e\x39\x2c\x37\x39\x2e\
+\x35\x2c\x34\x36\x4c\x37\x33\x2e\x39\x2c\x34\x36\x2e\x36\x7a\x22\
+\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x02\xbc\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x36\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\
+\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x6f\
+\x6c\x79\x67\x6f\x6e\x20\x70\x6f\x69\x6e\x74\x73\x3d\x22\x36\x37\
+\x2e\x33\x2c\x37\x33\x2e\x36\x20\x35\x30\x2e\x36\x2c\x36\x34\x2e\
+\x37\x20\x33\x33\x2e\x37\x2c\x37\x33\x2e\x34\x20\x33\x37\x2c\x35\
+\x34\x2e\x38\x20\x32\x33\x2e\x35\x2c\x34\x31\x2e\x35\x20\x34\x32\
+\x2e\x33\x2c\x33\x38\x2e\x38\x20\x35\x30\x2e\x38\x2c\x32\x31\x2e\
+\x39\x20\x35\x39\x2e\x31\x2c\x33\x38\x2e\x39\x20\x37\x37\x2e\x38\
+\x2c\x34\x31\x2e\x37\x20\x36\x34\x2e\x32\x2c\x35\x34\x2e\x39\x20\
+\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x06\x3f\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\
+\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x35\x38\x2e\x38\x2c\x38\x32\x2e\x36\
+\x63\x2d\x34\x2e\x37\x2c\x30\x2d\x38\x2e\x36\x2d\x33\x2e\x39\x2d\
+\x38\x2e\x36\x2d\x38\x2e\x36\x73\x33\x2e\x39\x2d\x38\x2e\x36\x2c\
+\x38\x2e\x36\x2d\x38\x2e\x36\x73\x38\x2e\x36\x2c\x33\x2e\x39\x2c\
+\x38\x2e\x36\x2c\x38\x2e\x36\x53\x36\x33\x2e\x35\x2c\x38\x32\x2e\
+\x36\x2c\x35\x38\x2e\x38\x2c\x38\x32\x2e\x36\x7a\x20\x4d\x35\x38\
+\x2e\x38\x2c\x37\x31\x63\x2d\x31\x2e\x37\x2c\x30\x2d\x33\x2c\x31\
+\x2e\x33\x2d\x33\x2c\x33\x0a\x09\x73\x31\x2e\x33\x2c\x33\x2c\x33\
+\x2c\x33\x73\x33\x2d\x31\x2e\x33\x2c\x33\x2d\x33\x53\x36\x30\x2e\
+\x35\x2c\x37\x31\x2c\x35\x38\x2e\x38\x2c\x37\x31\x7a\x22\x2f\x3e\
+\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x33\x39\x2e\x35\x2c\
+\x33\x39\x2e\x38\x63\x2d\x34\x2e\x37\x2c\x30\x2d\x38\x2e\x36\x2d\
+\x33\x2e\x39\x2d\x38\x2e\x36\x2d\x38\x2e\x36\x73\x33\x2e\x39\x2d\
+\x38\x2e\x36\x2c\x38\x2e\x36\x2d\x38\x2e\x36\x73\x38\x2e\x36\x2c\
+\x33\x2e\x39\x2c\x38\x2e\x36\x2c\x38\x2e\x36\x53\x34\x34\x2e\x32\
+\x2c\x33\x39\x2e\x38\x2c\x33\x39\x2e\x35\x2c\x33\x39\x2e\x38\x7a\
+\x20\x4d\x33\x39\x2e\x35\x2c\x32\x38\x2e\x32\x63\x2d\x31\x2e\x37\
+\x2c\x30\x2d\x33\x2c\x31\x2e\x33\x2d\x33\x2c\x33\x0a\x09\x73\x31\
+\x2e\x33\x2c\x33\x2c\x33\x2c\x33\x73\x33\x2d\x31\x2e\x33\x2c\x33\
+\x2d\x33\x53\x34\x31\x2e\x32\x2c\x32\x38\x2e\x32\x2c\x33\x39\x2e\
+\x35\x2c\x32\x38\x2e\x32\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\
+\x20\x64\x3d\x22\x4d\x31\x39\x2e\x32\x2c\x38\x32\x2e\x36\x63\x2d\
+\x34\x2e\x37\x2c\x30\x2d\x38\x2e\x36\x2d\x33\x2e\x39\x2d\x38\x2e\
+\x36\x2d\x38\x2e\x36\x73\x33\x2e\x39\x2d\x38\x2e\x36\x2c\x38\x2e\
+\x36\x2d\x38\x2e\x36\x73\x38\x2e\x36\x2c\x33\x2e\x39\x2c\x38\x2e\
+\x36\x2c\x38\x2e\x36\x53\x32\x33\x2e\x39\x2c\x38\x32\x2e\x36\x2c\
+\x31\x39\x2e\x32\x2c\x38\x32\x2e\x36\x7a\x20\x4d\x31\x39\x2e\x32\
+\x2c\x37\x31\x63\x2d\x31\x2e\x37\x2c\x30\x2d\x33\x2c\x31\x2e\x33\
+\x2d\x33\x2c\x33\x0a\x09\x73\x31\x2e\x33\x2c\x33\x2c\x33\x2c\x33\
+\x73\x33\x2d\x31\x2e\x33\x2c\x33\x2d\x33\x53\x32\x30\x2e\x39\x2c\
+\x37\x31\x2c\x31\x39\x2e\x32\x2c\x37\x31\x7a\x22\x2f\x3e\x0a\x3c\
+\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x38\x33\x2e\x31\x2c\x33\x39\
+\x2e\x38\x63\x2d\x34\x2e\x37\x2c\x30\x2d\x38\x2e\x36\x2d\x33\x2e\
+\x39\x2d\x38\x2e\x36\x2d\x38\x2e\x36\x73\x33\x2e\x39\x2d\x38\x2e\
+\x36\x2c\x38\x2e\x36\x2d\x38\x2e\x36\x73\x38\x2e\x36\x2c\x33\x2e\
+\x39\x2c\x38\x2e\x36\x2c\x38\x2e\x36\x53\x38\x37\x2e\x38\x2c\x33\
+\x39\x2e\x38\x2c\x38\x33\x2e\x31\x2c\x33\x39\x2e\x38\x7a\x20\x4d\
+\x38\x33\x2e\x31\x2c\x32\x38\x2e\x32\x63\x2d\x31\x2e\x37\x2c\x30\
+\x2d\x33\x2c\x31\x2e\x33\x2d\x33\x2c\x33\x0a\x09\x73\x31\x2e\x33\
+\x2c\x33\x2c\x33\x2c\x33\x73\x33\x2d\x31\x2e\x33\x2c\x33\x2d\x33\
+\x53\x38\x34\x2e\x38\x2c\x32\x38\x2e\x32\x2c\x38\x33\x2e\x31\x2c\
+\x32\x38\x2e\x32\x7a\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\
+\x3d\x22\x35\x31\x2e\x31\x22\x20\x79\x3d\x22\x34\x39\x2e\x32\x22\
+\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\x74\x72\
+\x69\x78\x28\x30\x2e\x35\x33\x35\x35\x20\x2d\x30\x2e\x38\x34\x34\
+\x35\x20\x30\x2e\x38\x34\x34\x35\x20\x30\x2e\x35\x33\x35\x35\x20\
+\x2d\x31\x31\x2e\x32\x31\x39\x20\x38\x33\x2e\x35\x30\x32\x39\x29\
+\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x33\x38\x2e\x35\x22\x20\x68\
+\x65\x69\x67\x68\x74\x3d\x22\x35\x2e\x35\x22\x2f\x3e\x0a\x3c\x72\
+\x65\x63\x74\x20\x78\x3d\x22\x34\x36\x2e\x34\x22\x20\x79\x3d\x22\
+\x33\x35\x2e\x33\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\
+\x22\x6d\x61\x74\x72\x69\x78\x28\x30\x2e\x39\x30\x30\x31\x20\x2d\
+\x30\x2e\x34\x33\x35\x36\x20\x30\x2e\x34\x33\x35\x36\x20\x30\x2e\
+\x39\x30\x30\x31\x20\x2d\x31\x38\x2e\x30\x30\x35\x39\x20\x32\x36\
+\x2e\x36\x36\x36\x29\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x35\x2e\
+\x35\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x33\x34\x2e\x37\x22\
+\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x31\x30\x22\x20\
+\x79\x3d\x22\x35\x31\x2e\x33\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\
+\x72\x6d\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\x30\x2e\x34\x36\x31\
+\x35\x20\x2d\x30\x2e\x38\x38\x37\x32\x20\x30\x2e\x38\x38\x37\x32\
+\x20\x30\x2e\x34\x36\x31\x35\x20\x2d\x33\x32\x2e\x31\x30\x30\x36\
+\x20\x35\x35\x2e\x31\x31\x38\x38\x29\x22\x20\x77\x69\x64\x74\x68\
+\x3d\x22\x33\x38\x2e\x38\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\
+\x35\x2e\x35\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x02\xed\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\
+\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x67\x20\x69\x64\x3d\x22\x53\x6f\x6c\x69\
+\x64\x22\x3e\x0a\x09\x3c\x67\x3e\x0a\x09\x09\x3c\x70\x6f\x6c\x79\
+\x67\x6f\x6e\x20\x70\x6f\x69\x6e\x74\x73\x3d\x22\x35\x39\x2e\x31\
+\x2c\x33\x2e\x34\x20\x34\x30\x2e\x36\x2c\x33\x2e\x34\x20\x34\x30\
+\x2e\x36\x2c\x34\x30\x2e\x36\x20\x33\x2e\x34\x2c\x34\x30\x2e\x36\
+\x20\x33\x2e\x34\x2c\x35\x39\x2e\x31\x20\x34\x30\x2e\x36\x2c\x35\
+\x39\x2e\x31\x20\x34\x30\x2e\x36\x2c\x39\x36\x2e\x33\x20\x35\x39\
+\x2e\x31\x2c\x39\x36\x2e\x33\x20\x35\x39\x2e\x31\x2c\x35\x39\x2e\
+\x31\x20\x39\x36\x2e\x33\x2c\x35\x39\x2e\x31\x20\x39\x36\x2e\x33\
+\x2c\x34\x30\x2e\x36\x20\x0a\x09\x09\x09\x35\x39\x2e\x31\x2c\x34\
+\x30\x2e\x36\x20\x09\x09\x22\x2f\x3e\x0a\x09\x3c\x2f\x67\x3e\x0a\
+\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x03\x83\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x32\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\
+\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x35\
+\x31\x2e\x34\x2c\x32\x37\x2e\x39\x63\x31\x2e\x39\x2c\x30\x2c\x33\
+\x2e\x38\x2c\x30\x2e\x38\x2c\x35\x2c\x32\x2e\x34\x6c\x32\x38\x2e\
+\x32\x2c\x33\x35\x2e\x31\x63\x32\x2e\x32\x2c\x32\x2e\x38\x2c\x31\
+\x2e\x38\x2c\x36\x2e\x39\x2d\x31\x2c\x39\x2e\x31\x63\x2d\x32\x2e\
+\x38\x2c\x32\x2e\x32\x2d\x36\x2e\x39\x2c\x31\x2e\x38\x2d\x39\x2e\
+\x31\x2d\x31\x4c\x34\x36\x2e\x33\x2c\x33\x38\x2e\x34\x63\x2d\x32\
+\x2e\x32\x2d\x32\x2e\x38\x2d\x31\x2e\x38\x2d\x36\x2e\x39\x2c\x31\
+\x2d\x39\x2e\x31\x0a\x09\x43\x34\x38\x2e\x35\x2c\x32\x38\x2e\x33\
+\x2c\x35\x30\x2c\x32\x37\x2e\x39\x2c\x35\x31\x2e\x34\x2c\x32\x37\
+\x2e\x39\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\
+\x4d\x35\x31\x2e\x34\x2c\x32\x37\x2e\x39\x63\x31\x2e\x34\x2c\x30\
+\x2c\x32\x2e\x39\x2c\x30\x2e\x35\x2c\x34\x2c\x31\x2e\x34\x63\x32\
+\x2e\x38\x2c\x32\x2e\x32\x2c\x33\x2e\x32\x2c\x36\x2e\x33\x2c\x31\
+\x2c\x39\x2e\x31\x4c\x32\x38\x2e\x32\x2c\x37\x33\x2e\x35\x63\x2d\
+\x32\x2e\x32\x2c\x32\x2e\x38\x2d\x36\x2e\x33\x2c\x33\x2e\x32\x2d\
+\x39\x2e\x31\x2c\x31\x63\x2d\x32\x2e\x38\x2d\x32\x2e\x32\x2d\x33\
+\x2e\x32\x2d\x36\x2e\x33\x2d\x31\x2d\x39\x2e\x31\x6c\x32\x38\x2e\
+\x32\x2d\x33\x35\x2e\x31\x0a\x09\x43\x34\x37\x2e\x36\x2c\x32\x38\
+\x2e\x37\x2c\x34\x39\x2e\x35\x2c\x32\x37\x2e\x39\x2c\x35\x31\x2e\
+\x34\x2c\x32\x37\x2e\x39\x7a\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\
+\x3e\x0a\
+\x00\x00\x03\xf9\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\
+\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x36\
+\x36\x2e\x37\x2c\x35\x34\x2e\x34\x68\x2d\x36\x56\x33\x37\x2e\x39\
+\x48\x34\x35\x2e\x34\x76\x2d\x36\x68\x31\x36\x2e\x33\x63\x32\x2e\
+\x38\x2c\x30\x2c\x35\x2c\x32\x2e\x32\x2c\x35\x2c\x35\x56\x35\x34\
+\x2e\x34\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\
+\x4d\x35\x33\x2e\x34\x2c\x36\x37\x2e\x34\x48\x33\x36\x2e\x33\x63\
+\x2d\x32\x2e\x38\x2c\x30\x2d\x35\x2d\x32\x2e\x32\x2d\x35\x2d\x35\
+\x56\x34\x35\x2e\x31\x68\x36\x76\x31\x36\x2e\x33\x68\x31\x36\x2e\
+\x31\x56\x36\x37\x2e\x34\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\
+\x20\x64\x3d\x22\x4d\x34\x32\x2e\x35\x2c\x34\x37\x2e\x36\x48\x32\
+\x32\x2e\x39\x63\x2d\x32\x2e\x38\x2c\x30\x2d\x35\x2d\x32\x2e\x32\
+\x2d\x35\x2d\x35\x56\x32\x33\x63\x30\x2d\x32\x2e\x38\x2c\x32\x2e\
+\x32\x2d\x35\x2c\x35\x2d\x35\x68\x31\x39\x2e\x36\x63\x32\x2e\x38\
+\x2c\x30\x2c\x35\x2c\x32\x2e\x32\x2c\x35\x2c\x35\x76\x31\x39\x2e\
+\x36\x43\x34\x37\x2e\x35\x2c\x34\x35\x2e\x34\x2c\x34\x35\x2e\x33\
+\x2c\x34\x37\x2e\x36\x2c\x34\x32\x2e\x35\x2c\x34\x37\x2e\x36\x7a\
+\x20\x4d\x32\x33\x2e\x39\x2c\x34\x31\x2e\x36\x0a\x09\x68\x31\x37\
+\x2e\x36\x56\x32\x34\x48\x32\x33\x2e\x39\x56\x34\x31\x2e\x36\x7a\
+\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x37\x35\
+\x2e\x37\x2c\x38\x31\x2e\x33\x48\x35\x36\x2e\x31\x63\x2d\x32\x2e\
+\x38\x2c\x30\x2d\x35\x2d\x32\x2e\x32\x2d\x35\x2d\x35\x56\x35\x36\
+\x2e\x38\x63\x30\x2d\x32\x2e\x38\x2c\x32\x2e\x32\x2d\x35\x2c\x35\
+\x2d\x35\x68\x31\x39\x2e\x36\x63\x32\x2e\x38\x2c\x30\x2c\x35\x2c\
+\x32\x2e\x32\x2c\x35\x2c\x35\x76\x31\x39\x2e\x36\x43\x38\x30\x2e\
+\x37\x2c\x37\x39\x2e\x31\x2c\x37\x38\x2e\x35\x2c\x38\x31\x2e\x33\
+\x2c\x37\x35\x2e\x37\x2c\x38\x31\x2e\x33\x7a\x0a\x09\x20\x4d\x35\
+\x37\x2e\x31\x2c\x37\x35\x2e\x33\x68\x31\x37\x2e\x36\x56\x35\x37\
+\x2e\x38\x48\x35\x37\x2e\x31\x56\x37\x35\x2e\x33\x7a\x22\x2f\x3e\
+\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x04\x7b\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x32\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x34\x34\x30\x20\x34\x34\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x34\x34\x30\x20\
+\x34\x34\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\
+\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x33\x37\x33\x2e\x31\x2c\x33\x34\x34\
+\x2e\x34\x56\x32\x37\x33\x63\x2d\x33\x31\x2d\x32\x37\x2e\x34\x2d\
+\x35\x30\x2e\x33\x2d\x34\x34\x2e\x35\x2d\x35\x38\x2d\x35\x31\x2e\
+\x33\x63\x2d\x37\x2e\x35\x2d\x36\x2e\x36\x2d\x31\x38\x2e\x31\x2d\
+\x36\x2d\x32\x34\x2e\x39\x2c\x31\x2e\x34\x63\x2d\x31\x33\x2e\x33\
+\x2c\x31\x34\x2e\x34\x2d\x34\x37\x2c\x35\x31\x2e\x31\x2d\x36\x31\
+\x2e\x37\x2c\x36\x37\x2e\x31\x0a\x09\x63\x2d\x32\x2e\x36\x2c\x32\
+\x2e\x38\x2d\x36\x2e\x37\x2c\x33\x2d\x39\x2e\x35\x2c\x30\x2e\x33\
+\x63\x2d\x37\x2d\x36\x2e\x38\x2d\x31\x37\x2e\x34\x2d\x31\x36\x2e\
+\x39\x2d\x32\x32\x2e\x39\x2d\x32\x32\x2e\x33\x63\x2d\x36\x2e\x38\
+\x2d\x36\x2e\x36\x2d\x31\x37\x2d\x36\x2e\x34\x2d\x32\x33\x2e\x35\
+\x2c\x30\x2e\x36\x63\x2d\x31\x30\x2e\x34\x2c\x31\x31\x2e\x31\x2d\
+\x33\x36\x2e\x33\x2c\x33\x38\x2e\x38\x2d\x37\x37\x2e\x39\x2c\x38\
+\x33\x2e\x31\x4c\x33\x37\x33\x2e\x31\x2c\x33\x34\x34\x2e\x34\x7a\
+\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x33\x35\
+\x38\x2e\x34\x2c\x37\x37\x2e\x38\x48\x38\x31\x2e\x36\x63\x2d\x31\
+\x37\x2c\x30\x2d\x33\x30\x2e\x38\x2c\x31\x33\x2e\x38\x2d\x33\x30\
+\x2e\x38\x2c\x33\x30\x2e\x38\x76\x32\x32\x32\x2e\x39\x63\x30\x2c\
+\x31\x37\x2c\x31\x33\x2e\x38\x2c\x33\x30\x2e\x38\x2c\x33\x30\x2e\
+\x38\x2c\x33\x30\x2e\x38\x68\x32\x37\x36\x2e\x39\x63\x31\x37\x2c\
+\x30\x2c\x33\x30\x2e\x38\x2d\x31\x33\x2e\x38\x2c\x33\x30\x2e\x38\
+\x2d\x33\x30\x2e\x38\x56\x31\x30\x38\x2e\x36\x0a\x09\x43\x33\x38\
+\x39\x2e\x32\x2c\x39\x31\x2e\x36\x2c\x33\x37\x35\x2e\x35\x2c\x37\
+\x37\x2e\x38\x2c\x33\x35\x38\x2e\x34\x2c\x37\x37\x2e\x38\x7a\x20\
+\x4d\x33\x36\x35\x2e\x36\x2c\x33\x32\x31\x2e\x32\x63\x30\x2c\x31\
+\x31\x2e\x31\x2d\x39\x2c\x32\x30\x2e\x31\x2d\x32\x30\x2e\x31\x2c\
+\x32\x30\x2e\x31\x48\x39\x34\x2e\x38\x63\x2d\x31\x31\x2e\x31\x2c\
+\x30\x2d\x32\x30\x2e\x31\x2d\x39\x2d\x32\x30\x2e\x31\x2d\x32\x30\
+\x2e\x31\x76\x2d\x32\x30\x32\x0a\x09\x63\x30\x2d\x31\x31\x2e\x31\
+\x2c\x39\x2d\x32\x30\x2e\x31\x2c\x32\x30\x2e\x31\x2d\x32\x30\x2e\
+\x31\x68\x32\x35\x30\x2e\x37\x63\x31\x31\x2e\x31\x2c\x30\x2c\x32\
+\x30\x2e\x31\x2c\x39\x2c\x32\x30\x2e\x31\x2c\x32\x30\x2e\x31\x56\
+\x33\x32\x31\x2e\x32\x7a\x22\x2f\x3e\x0a\x3c\x63\x69\x72\x63\x6c\
+\x65\x20\x63\x78\x3d\x22\x31\x35\x37\x2e\x31\x22\x20\x63\x79\x3d\
+\x22\x31\x36\x34\x2e\x32\x22\x20\x72\x3d\x22\x33\x30\x2e\x34\x22\
+\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x03\x6e\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x38\
+\x30\x2e\x36\x32\x6d\x6d\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\
+\x31\x38\x30\x2e\x36\x32\x6d\x6d\x22\x20\x76\x69\x65\x77\x42\x6f\
+\x78\x3d\x22\x30\x20\x30\x20\x35\x31\x32\x20\x35\x31\x32\x22\x3e\
+\x3c\x73\x74\x79\x6c\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\
+\x74\x2f\x63\x73\x73\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\
+\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\
+\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\
+\x20\x30\x2e\x35\x3b\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\
+\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\
+\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\
+\x79\x3a\x20\x30\x2e\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\
+\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\
+\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\
+\x74\x79\x3a\x20\x30\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\
+\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\
+\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\
+\x79\x3a\x20\x30\x2e\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\
+\x3e\x0a\x20\x20\x3c\x74\x69\x74\x6c\x65\x3e\x41\x72\x74\x62\x6f\
+\x61\x72\x64\x20\x31\x3c\x2f\x74\x69\x74\x6c\x65\x3e\x0a\x20\x20\
+\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x33\x39\x34\x2e\x35\x36\
+\x2c\x32\x39\x38\x2e\x34\x34\x73\x2d\x33\x38\x2e\x34\x35\x2c\x35\
+\x35\x2e\x36\x36\x2d\x33\x38\x2e\x34\x35\x2c\x37\x36\x2e\x38\x39\
+\x61\x33\x38\x2e\x34\x35\x2c\x33\x38\x2e\x34\x35\x2c\x30\x2c\x31\
+\x2c\x30\x2c\x37\x36\x2e\x38\x39\x2c\x30\x43\x34\x33\x33\x2c\x33\
+\x35\x34\x2e\x31\x2c\x33\x39\x34\x2e\x35\x36\x2c\x32\x39\x38\x2e\
+\x34\x34\x2c\x33\x39\x34\x2e\x35\x36\x2c\x32\x39\x38\x2e\x34\x34\
+\x5a\x6d\x2d\x35\x2e\x36\x33\x2d\x36\x31\x2e\x38\x33\x4c\x32\x36\
+\x34\x2e\x31\x37\x2c\x31\x31\x31\x2e\x38\x35\x61\x31\x39\x2e\x32\
+\x32\x2c\x31\x39\x2e\x32\x32\x2c\x30\x2c\x30\x2c\x30\x2d\x32\x37\
+\x2e\x31\x38\x2c\x30\x6c\x2d\x34\x39\x2c\x34\x39\x2d\x35\x31\x2e\
+\x37\x37\x2d\x35\x31\x2e\x37\x37\x61\x39\x2e\x36\x2c\x39\x2e\x36\
+\x2c\x30\x2c\x30\x2c\x30\x2d\x31\x33\x2e\x35\x38\x2c\x30\x4c\x31\
+\x30\x39\x2c\x31\x32\x32\x2e\x36\x37\x61\x39\x2e\x36\x31\x2c\x39\
+\x2e\x36\x31\x2c\x30\x2c\x30\x2c\x30\x2c\x30\x2c\x31\x33\x2e\x35\
+\x39\x4c\x31\x36\x30\x2e\x38\x31\x2c\x31\x38\x38\x2c\x31\x30\x33\
+\x2e\x38\x39\x2c\x32\x34\x35\x61\x35\x37\x2e\x36\x35\x2c\x35\x37\
+\x2e\x36\x35\x2c\x30\x2c\x30\x2c\x30\x2c\x30\x2c\x38\x31\x2e\x35\
+\x34\x6c\x37\x30\x2e\x34\x2c\x37\x30\x2e\x34\x61\x35\x37\x2e\x36\
+\x35\x2c\x35\x37\x2e\x36\x35\x2c\x30\x2c\x30\x2c\x30\x2c\x38\x31\
+\x2e\x35\x34\x2c\x30\x6c\x31\x33\x33\x2e\x30\x39\x2d\x31\x33\x33\
+\x2e\x31\x41\x31\x39\x2e\x32\x32\x2c\x31\x39\x2e\x32\x32\x2c\x30\
+\x2c\x30\x2c\x30\x2c\x33\x38\x38\x2e\x39\x33\x2c\x32\x33\x36\x2e\
+\x36\x31\x5a\x6d\x2d\x36\x39\x2e\x38\x31\x2c\x34\x32\x2e\x36\x33\
+\x48\x31\x32\x36\x2e\x36\x61\x31\x38\x2e\x37\x34\x2c\x31\x38\x2e\
+\x37\x34\x2c\x30\x2c\x30\x2c\x31\x2c\x34\x2e\x34\x37\x2d\x37\x2e\
+\x31\x31\x6c\x37\x2e\x39\x2d\x37\x2e\x39\x2c\x34\x39\x2d\x34\x39\
+\x2c\x33\x35\x2e\x32\x2c\x33\x35\x2e\x32\x61\x31\x39\x2e\x32\x32\
+\x2c\x31\x39\x2e\x32\x32\x2c\x30\x2c\x30\x2c\x30\x2c\x32\x37\x2e\
+\x31\x38\x2d\x32\x37\x2e\x31\x37\x4c\x32\x31\x35\x2e\x31\x36\x2c\
+\x31\x38\x38\x6c\x33\x35\x2e\x34\x32\x2d\x33\x35\x2e\x34\x32\x2c\
+\x39\x37\x2e\x35\x37\x2c\x39\x37\x2e\x35\x38\x2d\x32\x39\x2c\x32\
+\x39\x5a\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x02\xf5\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\
+\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x67\x20\
+\x69\x64\x3d\x22\x53\x6f\x6c\x69\x64\x22\x3e\x0a\x09\x3c\x67\x3e\
+\x0a\x09\x09\x3c\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x70\x6f\x69\x6e\
+\x74\x73\x3d\x22\x35\x39\x2e\x31\x2c\x33\x2e\x34\x20\x34\x30\x2e\
+\x36\x2c\x33\x2e\x34\x20\x34\x30\x2e\x36\x2c\x34\x30\x2e\x36\x20\
+\x33\x2e\x34\x2c\x34\x30\x2e\x36\x20\x33\x2e\x34\x2c\x35\x39\x2e\
+\x31\x20\x34\x30\x2e\x36\x2c\x35\x39\x2e\x31\x20\x34\x30\x2e\x36\
+\x2c\x39\x36\x2e\x33\x20\x35\x39\x2e\x31\x2c\x39\x36\x2e\x33\x20\
+\x35\x39\x2e\x31\x2c\x35\x39\x2e\x31\x20\x39\x36\x2e\x33\x2c\x35\
+\x39\x2e\x31\x20\x39\x36\x2e\x33\x2c\x34\x30\x2e\x36\x20\x0a\x09\
+\x09\x09\x35\x39\x2e\x31\x2c\x34\x30\x2e\x36\x20\x09\x09\x22\x2f\
+\x3e\x0a\x09\x3c\x2f\x67\x3e\x0a\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\
+\x76\x67\x3e\x0a\
+\x00\x00\x03\x27\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\
+\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x63\x69\
+\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x35\x38\x2e\x31\x22\x20\x63\
+\x79\x3d\x22\x32\x33\x2e\x35\x22\x20\x72\x3d\x22\x36\x2e\x39\x22\
+\x2f\x3e\x0a\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x35\
+\x35\x2e\x38\x22\x20\x63\x79\x3d\x22\x35\x32\x2e\x35\x22\x20\x72\
+\x3d\x22\x36\x2e\x39\x22\x2f\x3e\x0a\x3c\x63\x69\x72\x63\x6c\x65\
+\x20\x63\x78\x3d\x22\x33\x30\x22\x20\x63\x79\x3d\x22\x33\x39\x2e\
+\x38\x22\x20\x72\x3d\x22\x36\x2e\x39\x22\x2f\x3e\x0a\x3c\x63\x69\
+\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x32\x33\x2e\x31\x22\x20\x63\
+\x79\x3d\x22\x36\x32\x2e\x36\x22\x20\x72\x3d\x22\x36\x2e\x39\x22\
+\x2f\x3e\x0a\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x35\
+\x35\x2e\x38\x22\x20\x63\x79\x3d\x22\x37\x37\x2e\x36\x22\x20\x72\
+\x3d\x22\x36\x2e\x39\x22\x2f\x3e\x0a\x3c\x63\x69\x72\x63\x6c\x65\
+\x20\x63\x78\x3d\x22\x37\x37\x2e\x32\x22\x20\x63\x79\x3d\x22\x34\
+\x36\x2e\x37\x22\x20\x72\x3d\x22\x36\x2e\x39\x22\x2f\x3e\x0a\x3c\
+\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x02\xf1\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x32\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x37\x37\x2e\x36\x20\x39\x34\x2e\x38\x22\x20\x73\x74\
+\x79\x6c\x65\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\
+\x67\x72\x6f\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\
+\x37\x37\x2e\x36\x20\x39\x34\x2e\x38\x3b\x22\x20\x78\x6d\x6c\x3a\
+\x73\x70\x61\x63\x65\x3d\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\
+\x3e\x3c\x73\x74\x79\x6c\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\
+\x78\x74\x2f\x63\x73\x73\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\
+\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\
+\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\
+\x3a\x20\x30\x2e\x35\x3b\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\
+\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\
+\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\
+\x74\x79\x3a\x20\x30\x2e\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\
+\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\
+\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\
+\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\
+\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\
+\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\
+\x74\x79\x3a\x20\x30\x2e\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\
+\x65\x3e\x0a\x3c\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x70\x6f\x69\x6e\
+\x74\x73\x3d\x22\x30\x2e\x35\x2c\x34\x37\x2e\x34\x20\x35\x38\x2e\
+\x37\x2c\x39\x34\x2e\x38\x20\x35\x38\x2e\x37\x2c\x30\x20\x22\x2f\
+\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x35\x38\x2e\x36\x22\
+\x20\x79\x3d\x22\x33\x31\x2e\x32\x22\x20\x74\x72\x61\x6e\x73\x66\
+\x6f\x72\x6d\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\x2d\x31\x20\x2d\
+\x31\x2e\x32\x32\x34\x36\x34\x37\x65\x2d\x31\x36\x20\x31\x2e\x32\
+\x32\x34\x36\x34\x37\x65\x2d\x31\x36\x20\x2d\x31\x20\x32\x33\x36\
+\x2e\x31\x36\x38\x37\x20\x39\x34\x2e\x38\x29\x22\x20\x77\x69\x64\
+\x74\x68\x3d\x22\x31\x31\x39\x22\x20\x68\x65\x69\x67\x68\x74\x3d\
+\x22\x33\x32\x2e\x34\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\
+\x00\x00\x02\xea\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x32\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\
+\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x6f\
+\x6c\x79\x67\x6f\x6e\x20\x70\x6f\x69\x6e\x74\x73\x3d\x22\x32\x35\
+\x2e\x34\x2c\x35\x30\x20\x38\x33\x2e\x36\x2c\x39\x37\x2e\x34\x20\
+\x38\x33\x2e\x36\x2c\x32\x2e\x36\x20\x22\x2f\x3e\x0a\x3c\x72\x65\
+\x63\x74\x20\x78\x3d\x22\x31\x33\x2e\x38\x22\x20\x79\x3d\x22\x32\
+\x2e\x36\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\
+\x61\x74\x72\x69\x78\x28\x2d\x31\x20\x2d\x31\x2e\x32\x32\x34\x36\
+\x34\x37\x65\x2d\x31\x36\x20\x31\x2e\x32\x32\x34\x36\x34\x37\x65\
+\x2d\x31\x36\x20\x2d\x31\x20\x34\x30\x2e\x31\x38\x32\x36\x20\x31\
+\x30\x30\x29\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x32\x2e\x35\
+\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x39\x34\x2e\x38\x22\x2f\
+\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x03\xd8\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x38\
+\x30\x2e\x36\x32\x6d\x6d\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\
+\x31\x38\x30\x2e\x36\x32\x6d\x6d\x22\x20\x76\x69\x65\x77\x42\x6f\
+\x78\x3d\x22\x30\x20\x30\x20\x35\x31\x32\x20\x35\x31\x32\x22\x3e\
+\x3c\x73\x74\x79\x6c\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\
+\x74\x2f\x63\x73\x73\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\
+\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\
+\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\
+\x20\x31\x3b\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\
+\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\
+\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\
+\x20\x31\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\
+\x6c\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\
+\x20\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\
+\x31\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\
+\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\
+\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\
+\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x20\x20\x3c\x74\x69\x74\
+\x6c\x65\x3e\x41\x72\x74\x62\x6f\x61\x72\x64\x20\x31\x3c\x2f\x74\
+\x69\x74\x6c\x65\x3e\x0a\x20\x20\x3c\x70\x61\x74\x68\x20\x64\x3d\
+\x22\x4d\x34\x35\x30\x2e\x31\x38\x2c\x33\x33\x35\x2e\x39\x34\x61\
+\x31\x38\x2e\x36\x31\x2c\x31\x38\x2e\x36\x31\x2c\x30\x2c\x30\x2c\
+\x31\x2c\x30\x2c\x32\x36\x2e\x33\x34\x6c\x2d\x36\x32\x2e\x30\x37\
+\x2c\x36\x32\x2e\x30\x36\x63\x2d\x31\x31\x2e\x36\x35\x2c\x31\x31\
+\x2e\x36\x35\x2d\x33\x31\x2e\x37\x39\x2c\x33\x2e\x34\x38\x2d\x33\
+\x31\x2e\x37\x39\x2d\x31\x33\x2e\x31\x37\x76\x2d\x33\x31\x48\x33\
+\x31\x30\x2e\x37\x31\x61\x39\x2e\x32\x39\x2c\x39\x2e\x32\x39\x2c\
+\x30\x2c\x30\x2c\x31\x2d\x36\x2e\x38\x31\x2d\x33\x6c\x2d\x35\x34\
+\x2e\x37\x35\x2d\x35\x38\x2e\x36\x36\x2c\x34\x31\x2e\x33\x38\x2d\
+\x34\x34\x2e\x33\x34\x2c\x34\x31\x2c\x34\x33\x2e\x38\x38\x68\x32\
+\x34\x2e\x38\x33\x76\x2d\x33\x31\x63\x30\x2d\x31\x36\x2e\x36\x33\
+\x2c\x32\x30\x2e\x31\x33\x2d\x32\x34\x2e\x38\x33\x2c\x33\x31\x2e\
+\x37\x39\x2d\x31\x33\x2e\x31\x37\x5a\x6d\x2d\x33\x38\x32\x2e\x35\
+\x31\x2d\x31\x34\x32\x68\x36\x35\x2e\x31\x38\x6c\x34\x31\x2c\x34\
+\x33\x2e\x38\x38\x2c\x34\x31\x2e\x33\x38\x2d\x34\x34\x2e\x33\x34\
+\x2d\x35\x34\x2e\x37\x35\x2d\x35\x38\x2e\x36\x36\x61\x39\x2e\x32\
+\x39\x2c\x39\x2e\x32\x39\x2c\x30\x2c\x30\x2c\x30\x2d\x36\x2e\x38\
+\x2d\x33\x68\x2d\x38\x36\x61\x39\x2e\x33\x31\x2c\x39\x2e\x33\x31\
+\x2c\x30\x2c\x30\x2c\x30\x2d\x39\x2e\x33\x31\x2c\x39\x2e\x33\x31\
+\x76\x34\x33\x2e\x34\x35\x41\x39\x2e\x33\x31\x2c\x39\x2e\x33\x31\
+\x2c\x30\x2c\x30\x2c\x30\x2c\x36\x37\x2e\x36\x37\x2c\x31\x39\x33\
+\x2e\x39\x33\x5a\x6d\x32\x38\x38\x2e\x36\x35\x2c\x30\x76\x33\x31\
+\x63\x30\x2c\x31\x36\x2e\x36\x35\x2c\x32\x30\x2e\x31\x34\x2c\x32\
+\x34\x2e\x38\x31\x2c\x33\x31\x2e\x37\x39\x2c\x31\x33\x2e\x31\x37\
+\x6c\x36\x32\x2e\x30\x37\x2d\x36\x32\x2e\x30\x36\x61\x31\x38\x2e\
+\x36\x31\x2c\x31\x38\x2e\x36\x31\x2c\x30\x2c\x30\x2c\x30\x2c\x30\
+\x2d\x32\x36\x2e\x33\x34\x4c\x33\x38\x38\x2e\x31\x31\x2c\x38\x37\
+\x2e\x36\x36\x43\x33\x37\x36\x2e\x34\x35\x2c\x37\x36\x2c\x33\x35\
+\x36\x2e\x33\x32\x2c\x38\x34\x2e\x32\x2c\x33\x35\x36\x2e\x33\x32\
+\x2c\x31\x30\x30\x2e\x38\x33\x76\x33\x31\x48\x33\x31\x30\x2e\x37\
+\x31\x61\x39\x2e\x32\x39\x2c\x39\x2e\x32\x39\x2c\x30\x2c\x30\x2c\
+\x30\x2d\x36\x2e\x38\x31\x2c\x33\x6c\x2d\x31\x37\x31\x2c\x31\x38\
+\x33\x2e\x32\x36\x48\x36\x37\x2e\x36\x37\x61\x39\x2e\x33\x31\x2c\
+\x39\x2e\x33\x31\x2c\x30\x2c\x30\x2c\x30\x2d\x39\x2e\x33\x31\x2c\
+\x39\x2e\x33\x32\x76\x34\x33\x2e\x34\x35\x61\x39\x2e\x33\x31\x2c\
+\x39\x2e\x33\x31\x2c\x30\x2c\x30\x2c\x30\x2c\x39\x2e\x33\x31\x2c\
+\x39\x2e\x33\x31\x68\x38\x36\x61\x39\x2e\x32\x39\x2c\x39\x2e\x32\
+\x39\x2c\x30\x2c\x30\x2c\x30\x2c\x36\x2e\x38\x2d\x33\x4c\x33\x33\
+\x31\x2e\x34\x39\x2c\x31\x39\x33\x2e\x39\x33\x5a\x22\x2f\x3e\x0a\
+\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x03\xf1\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\
+\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x67\x20\
+\x69\x64\x3d\x22\x53\x6f\x6c\x69\x64\x22\x3e\x0a\x09\x3c\x67\x3e\
+\x0a\x09\x09\x3c\x70\x61\x74\x68\x20\x63\x6c\x61\x73\x73\x3d\x22\
+\x73\x74\x30\x22\x20\x64\x3d\x22\x4d\x35\x30\x2c\x31\x33\x2e\x36\
+\x63\x2d\x32\x30\x2c\x30\x2d\x33\x36\x2e\x33\x2c\x31\x36\x2e\x33\
+\x2d\x33\x36\x2e\x33\x2c\x33\x36\x2e\x33\x63\x30\x2c\x32\x30\x2c\
+\x31\x36\x2e\x33\x2c\x33\x36\x2e\x33\x2c\x33\x36\x2e\x33\x2c\x33\
+\x36\x2e\x33\x43\x37\x30\x2c\x38\x36\x2e\x33\x2c\x38\x36\x2e\x33\
+\x2c\x37\x30\x2c\x38\x36\x2e\x33\x2c\x35\x30\x0a\x09\x09\x09\x43\
+\x38\x36\x2e\x33\x2c\x32\x39\x2e\x39\x2c\x37\x30\x2c\x31\x33\x2e\
+\x36\x2c\x35\x30\x2c\x31\x33\x2e\x36\x7a\x20\x4d\x35\x30\x2c\x37\
+\x39\x63\x2d\x31\x36\x2c\x30\x2d\x32\x39\x2e\x31\x2d\x31\x33\x2d\
+\x32\x39\x2e\x31\x2d\x32\x39\x2e\x31\x63\x30\x2d\x31\x36\x2c\x31\
+\x33\x2d\x32\x39\x2e\x31\x2c\x32\x39\x2e\x31\x2d\x32\x39\x2e\x31\
+\x43\x36\x36\x2c\x32\x30\x2e\x39\x2c\x37\x39\x2c\x33\x33\x2e\x39\
+\x2c\x37\x39\x2c\x35\x30\x43\x37\x39\x2c\x36\x36\x2c\x36\x36\x2c\
+\x37\x39\x2c\x35\x30\x2c\x37\x39\x7a\x22\x2f\x3e\x0a\x09\x09\x3c\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x63\x6c\x61\x73\x73\x3d\x22\x73\
+\x74\x30\x22\x20\x70\x6f\x69\x6e\x74\x73\x3d\x22\x35\x33\x2e\x36\
+\x2c\x33\x31\x2e\x38\x20\x34\x36\x2e\x33\x2c\x33\x31\x2e\x38\x20\
+\x34\x36\x2e\x33\x2c\x34\x36\x2e\x33\x20\x33\x31\x2e\x38\x2c\x34\
+\x36\x2e\x33\x20\x33\x31\x2e\x38\x2c\x35\x33\x2e\x36\x20\x34\x36\
+\x2e\x33\x2c\x35\x33\x2e\x36\x20\x34\x36\x2e\x33\x2c\x36\x38\x2e\
+\x31\x20\x35\x33\x2e\x36\x2c\x36\x38\x2e\x31\x20\x35\x33\x2e\x36\
+\x2c\x35\x33\x2e\x36\x20\x0a\x09\x09\x09\x36\x38\x2e\x31\x2c\x35\
+\x33\x2e\x36\x20\x36\x38\x2e\x31\x2c\x34\x36\x2e\x33\x20\x35\x33\
+\x2e\x36\x2c\x34\x36\x2e\x33\x20\x09\x09\x22\x2f\x3e\x0a\x09\x3c\
+\x2f\x67\x3e\x0a\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\
+\x00\x00\x03\x85\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\
+\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x33\
+\x31\x2e\x38\x2c\x35\x36\x2e\x34\x63\x2d\x31\x2e\x39\x2c\x30\x2d\
+\x33\x2e\x38\x2d\x30\x2e\x38\x2d\x35\x2d\x32\x2e\x34\x63\x2d\x32\
+\x2e\x32\x2d\x32\x2e\x38\x2d\x31\x2e\x38\x2d\x36\x2e\x39\x2c\x31\
+\x2d\x39\x2e\x31\x6c\x33\x35\x2e\x31\x2d\x32\x38\x2e\x32\x63\x32\
+\x2e\x38\x2d\x32\x2e\x32\x2c\x36\x2e\x39\x2d\x31\x2e\x38\x2c\x39\
+\x2e\x31\x2c\x31\x63\x32\x2e\x32\x2c\x32\x2e\x38\x2c\x31\x2e\x38\
+\x2c\x36\x2e\x39\x2d\x31\x2c\x39\x2e\x31\x4c\x33\x35\x2e\x38\x2c\
+\x35\x34\x2e\x39\x0a\x09\x43\x33\x34\x2e\x36\x2c\x35\x35\x2e\x39\
+\x2c\x33\x33\x2e\x32\x2c\x35\x36\x2e\x34\x2c\x33\x31\x2e\x38\x2c\
+\x35\x36\x2e\x34\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\
+\x3d\x22\x4d\x36\x36\x2e\x39\x2c\x38\x34\x2e\x36\x63\x2d\x31\x2e\
+\x34\x2c\x30\x2d\x32\x2e\x39\x2d\x30\x2e\x35\x2d\x34\x2d\x31\x2e\
+\x34\x4c\x32\x37\x2e\x37\x2c\x35\x34\x2e\x39\x63\x2d\x32\x2e\x38\
+\x2d\x32\x2e\x32\x2d\x33\x2e\x32\x2d\x36\x2e\x33\x2d\x31\x2d\x39\
+\x2e\x31\x63\x32\x2e\x32\x2d\x32\x2e\x38\x2c\x36\x2e\x33\x2d\x33\
+\x2e\x32\x2c\x39\x2e\x31\x2d\x31\x6c\x33\x35\x2e\x31\x2c\x32\x38\
+\x2e\x32\x63\x32\x2e\x38\x2c\x32\x2e\x32\x2c\x33\x2e\x32\x2c\x36\
+\x2e\x33\x2c\x31\x2c\x39\x2e\x31\x0a\x09\x43\x37\x30\x2e\x36\x2c\
+\x38\x33\x2e\x38\x2c\x36\x38\x2e\x38\x2c\x38\x34\x2e\x36\x2c\x36\
+\x36\x2e\x39\x2c\x38\x34\x2e\x36\x7a\x22\x2f\x3e\x0a\x3c\x2f\x73\
+\x76\x67\x3e\x0a\
+\x00\x00\x03\xed\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\
+\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x35\
+\x30\x2e\x35\x2c\x37\x37\x2e\x33\x43\x32\x36\x2e\x37\x2c\x37\x37\
+\x2e\x33\x2c\x38\x2e\x31\x2c\x35\x32\x2e\x31\x2c\x37\x2e\x33\x2c\
+\x35\x31\x4c\x36\x2c\x34\x39\x2e\x32\x6c\x31\x2e\x33\x2d\x31\x2e\
+\x38\x43\x38\x2e\x31\x2c\x34\x36\x2e\x33\x2c\x32\x36\x2e\x37\x2c\
+\x32\x31\x2c\x35\x30\x2e\x35\x2c\x32\x31\x73\x34\x32\x2e\x34\x2c\
+\x32\x35\x2e\x33\x2c\x34\x33\x2e\x32\x2c\x32\x36\x2e\x33\x6c\x31\
+\x2e\x33\x2c\x31\x2e\x38\x4c\x39\x33\x2e\x37\x2c\x35\x31\x0a\x09\
+\x43\x39\x32\x2e\x39\x2c\x35\x32\x2e\x31\x2c\x37\x34\x2e\x33\x2c\
+\x37\x37\x2e\x33\x2c\x35\x30\x2e\x35\x2c\x37\x37\x2e\x33\x7a\x20\
+\x4d\x31\x33\x2e\x38\x2c\x34\x39\x2e\x32\x63\x34\x2e\x36\x2c\x35\
+\x2e\x36\x2c\x31\x39\x2e\x35\x2c\x32\x31\x2e\x39\x2c\x33\x36\x2e\
+\x37\x2c\x32\x31\x2e\x39\x73\x33\x32\x2e\x31\x2d\x31\x36\x2e\x34\
+\x2c\x33\x36\x2e\x37\x2d\x32\x31\x2e\x39\x63\x2d\x34\x2e\x36\x2d\
+\x35\x2e\x36\x2d\x31\x39\x2e\x35\x2d\x32\x31\x2e\x39\x2d\x33\x36\
+\x2e\x37\x2d\x32\x31\x2e\x39\x0a\x09\x43\x33\x33\x2e\x33\x2c\x32\
+\x37\x2e\x32\x2c\x31\x38\x2e\x34\x2c\x34\x33\x2e\x36\x2c\x31\x33\
+\x2e\x38\x2c\x34\x39\x2e\x32\x7a\x22\x2f\x3e\x0a\x3c\x63\x69\x72\
+\x63\x6c\x65\x20\x63\x78\x3d\x22\x35\x30\x2e\x35\x22\x20\x63\x79\
+\x3d\x22\x34\x39\x2e\x32\x22\x20\x72\x3d\x22\x31\x37\x2e\x33\x22\
+\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x31\x2e\x31\x22\
+\x20\x79\x3d\x22\x34\x34\x2e\x36\x22\x20\x74\x72\x61\x6e\x73\x66\
+\x6f\x72\x6d\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\x30\x2e\x38\x31\
+\x38\x38\x20\x2d\x30\x2e\x35\x37\x34\x31\x20\x30\x2e\x35\x37\x34\
+\x31\x20\x30\x2e\x38\x31\x38\x38\x20\x2d\x31\x39\x2e\x31\x32\x39\
+\x31\x20\x33\x37\x2e\x36\x39\x38\x29\x22\x20\x77\x69\x64\x74\x68\
+\x3d\x22\x39\x38\x2e\x31\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\
+\x39\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x02\xb1\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x32\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x37\x37\x2e\x36\x20\x39\x34\x2e\x38\x22\x20\x73\x74\
+\x79\x6c\x65\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\
+\x67\x72\x6f\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\
+\x37\x37\x2e\x36\x20\x39\x34\x2e\x38\x3b\x22\x20\x78\x6d\x6c\x3a\
+\x73\x70\x61\x63\x65\x3d\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\
+\x3e\x3c\x73\x74\x79\x6c\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\
+\x78\x74\x2f\x63\x73\x73\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\
+\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\
+\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\
+\x3a\x20\x30\x2e\x35\x3b\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\
+\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\
+\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\
+\x74\x79\x3a\x20\x30\x2e\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\
+\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\
+\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\
+\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\
+\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\
+\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\
+\x74\x79\x3a\x20\x30\x2e\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\
+\x65\x3e\x0a\x3c\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x70\x6f\x69\x6e\
+\x74\x73\x3d\x22\x31\x37\x37\x2e\x36\x2c\x34\x37\x2e\x34\x20\x31\
+\x31\x39\x2e\x34\x2c\x30\x20\x31\x31\x39\x2e\x34\x2c\x39\x34\x2e\
+\x38\x20\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x30\
+\x2e\x35\x22\x20\x79\x3d\x22\x33\x31\x2e\x32\x22\x20\x77\x69\x64\
+\x74\x68\x3d\x22\x31\x31\x39\x22\x20\x68\x65\x69\x67\x68\x74\x3d\
+\x22\x33\x32\x2e\x34\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\
+\x00\x00\x02\x75\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x36\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\
+\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x6f\
+\x6c\x79\x67\x6f\x6e\x20\x70\x6f\x69\x6e\x74\x73\x3d\x22\x32\x30\
+\x2e\x39\x2c\x35\x30\x20\x37\x39\x2e\x31\x2c\x39\x37\x2e\x34\x20\
+\x37\x39\x2e\x31\x2c\x32\x2e\x36\x20\x22\x2f\x3e\x0a\x3c\x2f\x73\
+\x76\x67\x3e\x0a\
+\x00\x00\x03\xb1\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\
+\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x67\x20\
+\x69\x64\x3d\x22\x4f\x75\x74\x6c\x69\x6e\x65\x22\x3e\x0a\x09\x3c\
+\x67\x3e\x0a\x09\x09\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x32\
+\x36\x2e\x35\x2c\x37\x34\x2e\x32\x63\x30\x2c\x33\x2e\x37\x2c\x33\
+\x2c\x36\x2e\x38\x2c\x36\x2e\x38\x2c\x36\x2e\x38\x68\x33\x33\x2e\
+\x38\x63\x33\x2e\x37\x2c\x30\x2c\x36\x2e\x38\x2d\x33\x2c\x36\x2e\
+\x38\x2d\x36\x2e\x38\x56\x33\x33\x2e\x37\x48\x32\x36\x2e\x35\x56\
+\x37\x34\x2e\x32\x7a\x20\x4d\x33\x33\x2e\x33\x2c\x34\x30\x2e\x34\
+\x68\x33\x33\x2e\x38\x76\x33\x33\x2e\x38\x48\x33\x33\x2e\x33\x56\
+\x34\x30\x2e\x34\x7a\x22\x2f\x3e\x0a\x09\x09\x3c\x70\x6f\x6c\x79\
+\x67\x6f\x6e\x20\x70\x6f\x69\x6e\x74\x73\x3d\x22\x36\x30\x2e\x33\
+\x2c\x32\x33\x2e\x35\x20\x36\x30\x2e\x33\x2c\x31\x36\x2e\x38\x20\
+\x34\x30\x2e\x31\x2c\x31\x36\x2e\x38\x20\x34\x30\x2e\x31\x2c\x32\
+\x33\x2e\x35\x20\x31\x39\x2e\x38\x2c\x32\x33\x2e\x35\x20\x31\x39\
+\x2e\x38\x2c\x33\x30\x2e\x33\x20\x38\x30\x2e\x36\x2c\x33\x30\x2e\
+\x33\x20\x38\x30\x2e\x36\x2c\x32\x33\x2e\x35\x20\x09\x09\x22\x2f\
+\x3e\x0a\x09\x09\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x34\x30\x2e\
+\x31\x22\x20\x79\x3d\x22\x34\x37\x2e\x32\x22\x20\x77\x69\x64\x74\
+\x68\x3d\x22\x36\x2e\x38\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\
+\x32\x30\x2e\x33\x22\x2f\x3e\x0a\x09\x09\x3c\x72\x65\x63\x74\x20\
+\x78\x3d\x22\x35\x33\x2e\x36\x22\x20\x79\x3d\x22\x34\x37\x2e\x32\
+\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x36\x2e\x38\x22\x20\x68\x65\
+\x69\x67\x68\x74\x3d\x22\x32\x30\x2e\x33\x22\x2f\x3e\x0a\x09\x3c\
+\x2f\x67\x3e\x0a\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\
+\x00\x00\x02\xe1\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\
+\x30\x20\x30\x20\x35\x37\x36\x20\x35\x31\x32\x22\x3e\x3c\x73\x74\
+\x79\x6c\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\
+\x73\x73\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x31\x35\x33\x2c\x20\x31\x38\x2c\x20\x33\x31\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x31\x35\x33\x2c\x20\x31\x38\x2c\x20\x33\x31\x29\x3b\
+\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x63\x69\
+\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\
+\x31\x35\x33\x2c\x20\x31\x38\x2c\x20\x33\x31\x29\x3b\x20\x6f\x70\
+\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\x65\x63\x74\x20\
+\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x31\x35\x33\x2c\x20\
+\x31\x38\x2c\x20\x33\x31\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\
+\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x3c\x70\
+\x61\x74\x68\x20\x64\x3d\x22\x4d\x35\x36\x39\x2e\x35\x31\x37\x20\
+\x34\x34\x30\x2e\x30\x31\x33\x43\x35\x38\x37\x2e\x39\x37\x35\x20\
+\x34\x37\x32\x2e\x30\x30\x37\x20\x35\x36\x34\x2e\x38\x30\x36\x20\
+\x35\x31\x32\x20\x35\x32\x37\x2e\x39\x34\x20\x35\x31\x32\x48\x34\
+\x38\x2e\x30\x35\x34\x63\x2d\x33\x36\x2e\x39\x33\x37\x20\x30\x2d\
+\x35\x39\x2e\x39\x39\x39\x2d\x34\x30\x2e\x30\x35\x35\x2d\x34\x31\
+\x2e\x35\x37\x37\x2d\x37\x31\x2e\x39\x38\x37\x4c\x32\x34\x36\x2e\
+\x34\x32\x33\x20\x32\x33\x2e\x39\x38\x35\x63\x31\x38\x2e\x34\x36\
+\x37\x2d\x33\x32\x2e\x30\x30\x39\x20\x36\x34\x2e\x37\x32\x2d\x33\
+\x31\x2e\x39\x35\x31\x20\x38\x33\x2e\x31\x35\x34\x20\x30\x6c\x32\
+\x33\x39\x2e\x39\x34\x20\x34\x31\x36\x2e\x30\x32\x38\x7a\x4d\x32\
+\x38\x38\x20\x33\x35\x34\x63\x2d\x32\x35\x2e\x34\x30\x35\x20\x30\
+\x2d\x34\x36\x20\x32\x30\x2e\x35\x39\x35\x2d\x34\x36\x20\x34\x36\
+\x73\x32\x30\x2e\x35\x39\x35\x20\x34\x36\x20\x34\x36\x20\x34\x36\
+\x20\x34\x36\x2d\x32\x30\x2e\x35\x39\x35\x20\x34\x36\x2d\x34\x36\
+\x2d\x32\x30\x2e\x35\x39\x35\x2d\x34\x36\x2d\x34\x36\x2d\x34\x36\
+\x7a\x6d\x2d\x34\x33\x2e\x36\x37\x33\x2d\x31\x36\x35\x2e\x33\x34\
+\x36\x6c\x37\x2e\x34\x31\x38\x20\x31\x33\x36\x63\x2e\x33\x34\x37\
+\x20\x36\x2e\x33\x36\x34\x20\x35\x2e\x36\x30\x39\x20\x31\x31\x2e\
+\x33\x34\x36\x20\x31\x31\x2e\x39\x38\x32\x20\x31\x31\x2e\x33\x34\
+\x36\x68\x34\x38\x2e\x35\x34\x36\x63\x36\x2e\x33\x37\x33\x20\x30\
+\x20\x31\x31\x2e\x36\x33\x35\x2d\x34\x2e\x39\x38\x32\x20\x31\x31\
+\x2e\x39\x38\x32\x2d\x31\x31\x2e\x33\x34\x36\x6c\x37\x2e\x34\x31\
+\x38\x2d\x31\x33\x36\x63\x2e\x33\x37\x35\x2d\x36\x2e\x38\x37\x34\
+\x2d\x35\x2e\x30\x39\x38\x2d\x31\x32\x2e\x36\x35\x34\x2d\x31\x31\
+\x2e\x39\x38\x32\x2d\x31\x32\x2e\x36\x35\x34\x68\x2d\x36\x33\x2e\
+\x33\x38\x33\x63\x2d\x36\x2e\x38\x38\x34\x20\x30\x2d\x31\x32\x2e\
+\x33\x35\x36\x20\x35\x2e\x37\x38\x2d\x31\x31\x2e\x39\x38\x31\x20\
+\x31\x32\x2e\x36\x35\x34\x7a\x22\x2f\x3e\x3c\x2f\x73\x76\x67\x3e\
+\
+\x00\x00\x06\x5e\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x36\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\
+\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x72\x65\
+\x63\x74\x20\x78\x3d\x22\x31\x33\x2e\x31\x22\x20\x79\x3d\x22\x32\
+\x33\x2e\x31\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\
+\x6d\x61\x74\x72\x69\x78\x28\x30\x2e\x37\x30\x37\x31\x20\x2d\x30\
+\x2e\x37\x30\x37\x31\x20\x30\x2e\x37\x30\x37\x31\x20\x30\x2e\x37\
+\x30\x37\x31\x20\x2d\x31\x30\x2e\x30\x35\x34\x36\x20\x32\x36\x2e\
+\x30\x35\x38\x31\x29\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x36\
+\x2e\x37\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x34\x2e\x31\x22\
+\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x33\x33\x2e\x39\
+\x22\x20\x79\x3d\x22\x32\x33\x2e\x31\x22\x20\x74\x72\x61\x6e\x73\
+\x66\x6f\x72\x6d\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\x30\x2e\x38\
+\x34\x37\x31\x20\x2d\x30\x2e\x35\x33\x31\x35\x20\x30\x2e\x35\x33\
+\x31\x35\x20\x30\x2e\x38\x34\x37\x31\x20\x2d\x36\x2e\x31\x35\x33\
+\x36\x20\x32\x38\x2e\x39\x34\x36\x31\x29\x22\x20\x77\x69\x64\x74\
+\x68\x3d\x22\x32\x36\x2e\x37\x22\x20\x68\x65\x69\x67\x68\x74\x3d\
+\x22\x34\x2e\x31\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\
+\x22\x35\x36\x2e\x37\x22\x20\x79\x3d\x22\x32\x33\x2e\x31\x22\x20\
+\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\x74\x72\x69\
+\x78\x28\x30\x2e\x39\x33\x34\x35\x20\x2d\x30\x2e\x33\x35\x36\x20\
+\x30\x2e\x33\x35\x36\x20\x30\x2e\x39\x33\x34\x35\x20\x2d\x34\x2e\
+\x33\x37\x32\x33\x20\x32\x36\x2e\x35\x37\x35\x32\x29\x22\x20\x77\
+\x69\x64\x74\x68\x3d\x22\x32\x36\x2e\x37\x22\x20\x68\x65\x69\x67\
+\x68\x74\x3d\x22\x34\x2e\x31\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\
+\x20\x78\x3d\x22\x31\x33\x2e\x31\x22\x20\x79\x3d\x22\x34\x37\x2e\
+\x33\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\
+\x74\x72\x69\x78\x28\x30\x2e\x37\x30\x37\x31\x20\x2d\x30\x2e\x37\
+\x30\x37\x31\x20\x30\x2e\x37\x30\x37\x31\x20\x30\x2e\x37\x30\x37\
+\x31\x20\x2d\x32\x37\x2e\x31\x35\x34\x36\x20\x33\x33\x2e\x31\x34\
+\x31\x32\x29\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x36\x2e\x37\
+\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x34\x2e\x31\x22\x2f\x3e\
+\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x33\x33\x2e\x39\x22\x20\
+\x79\x3d\x22\x34\x37\x2e\x33\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\
+\x72\x6d\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\x30\x2e\x38\x32\x30\
+\x39\x20\x2d\x30\x2e\x35\x37\x31\x31\x20\x30\x2e\x35\x37\x31\x31\
+\x20\x30\x2e\x38\x32\x30\x39\x20\x2d\x31\x39\x2e\x37\x32\x35\x20\
+\x33\x35\x2e\x38\x30\x38\x34\x29\x22\x20\x77\x69\x64\x74\x68\x3d\
+\x22\x32\x36\x2e\x37\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x34\
+\x2e\x31\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x35\
+\x36\x2e\x37\x22\x20\x79\x3d\x22\x34\x37\x2e\x33\x22\x20\x74\x72\
+\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\
+\x30\x2e\x39\x36\x38\x39\x20\x2d\x30\x2e\x32\x34\x37\x36\x20\x30\
+\x2e\x32\x34\x37\x36\x20\x30\x2e\x39\x36\x38\x39\x20\x2d\x31\x30\
+\x2e\x30\x33\x37\x38\x20\x31\x38\x2e\x38\x36\x38\x36\x29\x22\x20\
+\x77\x69\x64\x74\x68\x3d\x22\x32\x36\x2e\x37\x22\x20\x68\x65\x69\
+\x67\x68\x74\x3d\x22\x34\x2e\x31\x22\x2f\x3e\x0a\x3c\x72\x65\x63\
+\x74\x20\x78\x3d\x22\x31\x33\x2e\x31\x22\x20\x79\x3d\x22\x37\x34\
+\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\x74\
+\x72\x69\x78\x28\x30\x2e\x38\x32\x30\x39\x20\x2d\x30\x2e\x35\x37\
+\x31\x31\x20\x30\x2e\x35\x37\x31\x31\x20\x30\x2e\x38\x32\x30\x39\
+\x20\x2d\x33\x38\x2e\x37\x30\x37\x31\x20\x32\x38\x2e\x37\x31\x37\
+\x39\x29\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x36\x2e\x37\x22\
+\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x34\x2e\x31\x22\x2f\x3e\x0a\
+\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x33\x33\x2e\x39\x22\x20\x79\
+\x3d\x22\x37\x34\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\
+\x22\x6d\x61\x74\x72\x69\x78\x28\x30\x2e\x38\x34\x37\x31\x20\x2d\
+\x30\x2e\x35\x33\x31\x35\x20\x30\x2e\x35\x33\x31\x35\x20\x30\x2e\
+\x38\x34\x37\x31\x20\x2d\x33\x33\x2e\x32\x30\x35\x31\x20\x33\x36\
+\x2e\x37\x32\x39\x39\x29\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\
+\x36\x2e\x37\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x34\x2e\x31\
+\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x35\x36\x2e\
+\x37\x22\x20\x79\x3d\x22\x37\x34\x22\x20\x74\x72\x61\x6e\x73\x66\
+\x6f\x72\x6d\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\x30\x2e\x39\x39\
+\x34\x36\x20\x2d\x30\x2e\x31\x30\x33\x35\x20\x30\x2e\x31\x30\x33\
+\x35\x20\x30\x2e\x39\x39\x34\x36\x20\x2d\x37\x2e\x34\x39\x39\x35\
+\x20\x37\x2e\x36\x35\x37\x39\x29\x22\x20\x77\x69\x64\x74\x68\x3d\
+\x22\x32\x36\x2e\x37\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x34\
+\x2e\x31\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x03\xbc\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\
+\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x34\x31\x2e\x35\x2c\x36\x37\x2e\x36\
+\x63\x2d\x31\x34\x2e\x34\x2c\x30\x2d\x32\x36\x2e\x31\x2d\x31\x31\
+\x2e\x37\x2d\x32\x36\x2e\x31\x2d\x32\x36\x2e\x31\x73\x31\x31\x2e\
+\x37\x2d\x32\x36\x2e\x31\x2c\x32\x36\x2e\x31\x2d\x32\x36\x2e\x31\
+\x73\x32\x36\x2e\x31\x2c\x31\x31\x2e\x37\x2c\x32\x36\x2e\x31\x2c\
+\x32\x36\x2e\x31\x53\x35\x35\x2e\x39\x2c\x36\x37\x2e\x36\x2c\x34\
+\x31\x2e\x35\x2c\x36\x37\x2e\x36\x7a\x20\x4d\x34\x31\x2e\x35\x2c\
+\x32\x32\x2e\x34\x0a\x09\x43\x33\x31\x2c\x32\x32\x2e\x34\x2c\x32\
+\x32\x2e\x34\x2c\x33\x31\x2c\x32\x32\x2e\x34\x2c\x34\x31\x2e\x35\
+\x63\x30\x2c\x31\x30\x2e\x35\x2c\x38\x2e\x36\x2c\x31\x39\x2e\x31\
+\x2c\x31\x39\x2e\x31\x2c\x31\x39\x2e\x31\x63\x31\x30\x2e\x35\x2c\
+\x30\x2c\x31\x39\x2e\x31\x2d\x38\x2e\x36\x2c\x31\x39\x2e\x31\x2d\
+\x31\x39\x2e\x31\x43\x36\x30\x2e\x36\x2c\x33\x31\x2c\x35\x32\x2c\
+\x32\x32\x2e\x34\x2c\x34\x31\x2e\x35\x2c\x32\x32\x2e\x34\x7a\x22\
+\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x38\x34\x2e\
+\x34\x2c\x37\x39\x2e\x38\x4c\x36\x34\x2e\x32\x2c\x36\x30\x2e\x36\
+\x63\x2d\x31\x2e\x34\x2c\x31\x2e\x37\x2d\x33\x2e\x31\x2c\x33\x2e\
+\x32\x2d\x34\x2e\x38\x2c\x34\x2e\x36\x6c\x32\x30\x2e\x35\x2c\x31\
+\x39\x2e\x34\x63\x30\x2e\x36\x2c\x30\x2e\x36\x2c\x31\x2e\x35\x2c\
+\x30\x2e\x39\x2c\x32\x2e\x33\x2c\x30\x2e\x39\x63\x30\x2e\x39\x2c\
+\x30\x2c\x31\x2e\x38\x2d\x30\x2e\x33\x2c\x32\x2e\x34\x2d\x31\x0a\
+\x09\x43\x38\x35\x2e\x38\x2c\x38\x33\x2e\x32\x2c\x38\x35\x2e\x37\
+\x2c\x38\x31\x2e\x31\x2c\x38\x34\x2e\x34\x2c\x37\x39\x2e\x38\x7a\
+\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x04\x7c\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x36\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\
+\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x67\x3e\
+\x0a\x09\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x35\x37\x2e\x33\
+\x2c\x38\x34\x2e\x37\x68\x2d\x33\x32\x63\x2d\x34\x2e\x36\x2c\x30\
+\x2d\x38\x2e\x32\x2d\x33\x2e\x36\x2d\x38\x2e\x32\x2d\x38\x2e\x32\
+\x76\x2d\x33\x32\x63\x30\x2d\x34\x2e\x36\x2c\x33\x2e\x36\x2d\x38\
+\x2e\x32\x2c\x38\x2e\x32\x2d\x38\x2e\x32\x68\x33\x32\x63\x34\x2e\
+\x36\x2c\x30\x2c\x38\x2e\x32\x2c\x33\x2e\x36\x2c\x38\x2e\x32\x2c\
+\x38\x2e\x32\x76\x33\x32\x0a\x09\x09\x43\x36\x35\x2e\x34\x2c\x38\
+\x31\x2e\x32\x2c\x36\x31\x2e\x39\x2c\x38\x34\x2e\x37\x2c\x35\x37\
+\x2e\x33\x2c\x38\x34\x2e\x37\x7a\x20\x4d\x32\x36\x2e\x39\x2c\x37\
+\x34\x2e\x39\x68\x32\x38\x2e\x37\x56\x34\x36\x2e\x32\x48\x32\x36\
+\x2e\x39\x56\x37\x34\x2e\x39\x7a\x22\x2f\x3e\x0a\x09\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x37\x34\x2e\x37\x2c\x36\x33\x2e\x36\
+\x68\x2d\x33\x32\x63\x2d\x34\x2e\x36\x2c\x30\x2d\x38\x2e\x32\x2d\
+\x33\x2e\x36\x2d\x38\x2e\x32\x2d\x38\x2e\x32\x76\x2d\x33\x32\x63\
+\x30\x2d\x34\x2e\x36\x2c\x33\x2e\x36\x2d\x38\x2e\x32\x2c\x38\x2e\
+\x32\x2d\x38\x2e\x32\x68\x33\x32\x63\x34\x2e\x36\x2c\x30\x2c\x38\
+\x2e\x32\x2c\x33\x2e\x36\x2c\x38\x2e\x32\x2c\x38\x2e\x32\x76\x33\
+\x32\x0a\x09\x09\x43\x38\x32\x2e\x39\x2c\x36\x30\x2c\x37\x39\x2e\
+\x33\x2c\x36\x33\x2e\x36\x2c\x37\x34\x2e\x37\x2c\x36\x33\x2e\x36\
+\x7a\x20\x4d\x34\x34\x2e\x33\x2c\x35\x33\x2e\x38\x68\x32\x38\x2e\
+\x37\x56\x32\x35\x2e\x31\x48\x34\x34\x2e\x33\x56\x35\x33\x2e\x38\
+\x7a\x22\x2f\x3e\x0a\x09\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\
+\x38\x31\x2e\x31\x2c\x36\x30\x2e\x36\x4c\x36\x32\x2e\x37\x2c\x38\
+\x32\x2e\x37\x6c\x2d\x36\x2e\x39\x2d\x36\x2e\x39\x6c\x31\x33\x2e\
+\x38\x2d\x31\x35\x2e\x33\x6c\x35\x2d\x33\x2e\x35\x22\x2f\x3e\x0a\
+\x09\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x38\x32\x2c\x32\x36\
+\x2e\x38\x4c\x36\x31\x2e\x39\x2c\x34\x36\x2e\x39\x6c\x2d\x36\x2e\
+\x39\x2d\x37\x6c\x32\x30\x2e\x34\x2d\x32\x30\x2e\x34\x6c\x30\x2c\
+\x30\x22\x2f\x3e\x0a\x09\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\
+\x34\x34\x2e\x37\x2c\x36\x30\x2e\x36\x4c\x32\x34\x2e\x38\x2c\x38\
+\x33\x2e\x31\x6c\x2d\x36\x2e\x39\x2d\x36\x2e\x39\x6c\x31\x38\x2e\
+\x38\x2d\x32\x32\x2e\x32\x68\x31\x2e\x36\x22\x2f\x3e\x0a\x09\x3c\
+\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x39\x2c\x33\x39\x2e\x34\
+\x4c\x33\x36\x2c\x31\x38\x2e\x37\x6c\x31\x30\x2e\x33\x2c\x33\x4c\
+\x32\x39\x2e\x32\x2c\x34\x32\x6c\x30\x2c\x30\x22\x2f\x3e\x0a\x3c\
+\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x09\xd3\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\
+\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x67\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x37\x22\x3e\x0a\x09\x3c\x70\x61\x74\x68\x20\x64\x3d\
+\x22\x4d\x34\x38\x2e\x34\x2c\x33\x34\x2e\x39\x63\x31\x2e\x34\x2d\
+\x31\x2e\x34\x2c\x33\x2e\x38\x2d\x31\x2e\x34\x2c\x35\x2e\x32\x2c\
+\x30\x6c\x31\x2e\x31\x2c\x31\x2e\x31\x6c\x31\x30\x2e\x34\x2d\x31\
+\x30\x2e\x33\x63\x32\x2e\x39\x2d\x32\x2e\x39\x2c\x37\x2e\x36\x2d\
+\x32\x2e\x39\x2c\x31\x30\x2e\x35\x2c\x30\x63\x32\x2e\x39\x2c\x32\
+\x2e\x39\x2c\x32\x2e\x39\x2c\x37\x2e\x36\x2c\x30\x2c\x31\x30\x2e\
+\x35\x4c\x36\x35\x2e\x32\x2c\x34\x36\x2e\x35\x6c\x31\x2e\x31\x2c\
+\x31\x2e\x31\x0a\x09\x09\x63\x31\x2e\x34\x2c\x31\x2e\x34\x2c\x31\
+\x2e\x34\x2c\x33\x2e\x38\x2c\x30\x2c\x35\x2e\x32\x63\x2d\x31\x2e\
+\x34\x2c\x31\x2e\x34\x2d\x33\x2e\x38\x2c\x31\x2e\x34\x2d\x35\x2e\
+\x32\x2c\x30\x4c\x34\x38\x2e\x34\x2c\x34\x30\x2e\x32\x43\x34\x36\
+\x2e\x39\x2c\x33\x38\x2e\x37\x2c\x34\x36\x2e\x39\x2c\x33\x36\x2e\
+\x34\x2c\x34\x38\x2e\x34\x2c\x33\x34\x2e\x39\x7a\x22\x2f\x3e\x0a\
+\x09\x3c\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x70\x6f\x69\x6e\x74\x73\
+\x3d\x22\x34\x37\x2e\x34\x2c\x36\x34\x2e\x33\x20\x33\x36\x2e\x32\
+\x2c\x37\x35\x2e\x34\x20\x32\x35\x2e\x38\x2c\x37\x35\x2e\x34\x20\
+\x32\x35\x2e\x38\x2c\x36\x35\x20\x32\x36\x2e\x35\x2c\x36\x34\x2e\
+\x33\x20\x32\x36\x2e\x35\x2c\x36\x34\x2e\x33\x20\x09\x22\x2f\x3e\
+\x0a\x09\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x37\x36\x2e\x38\
+\x2c\x33\x37\x2e\x34\x63\x31\x2e\x38\x2d\x31\x2e\x38\x2c\x32\x2e\
+\x38\x2d\x34\x2e\x32\x2c\x32\x2e\x37\x2d\x36\x2e\x35\x63\x30\x2d\
+\x32\x2e\x34\x2d\x30\x2e\x39\x2d\x34\x2e\x37\x2d\x32\x2e\x37\x2d\
+\x36\x2e\x35\x6c\x30\x2c\x30\x63\x30\x2c\x30\x2c\x30\x2c\x30\x2c\
+\x30\x2c\x30\x63\x30\x2c\x30\x2c\x30\x2c\x30\x2c\x30\x2c\x30\x6c\
+\x30\x2c\x30\x63\x2d\x31\x2e\x38\x2d\x31\x2e\x38\x2d\x34\x2e\x32\
+\x2d\x32\x2e\x37\x2d\x36\x2e\x35\x2d\x32\x2e\x37\x0a\x09\x09\x63\
+\x2d\x32\x2e\x34\x2c\x30\x2d\x34\x2e\x37\x2c\x30\x2e\x39\x2d\x36\
+\x2e\x35\x2c\x32\x2e\x37\x6c\x30\x2c\x30\x6c\x2d\x39\x2e\x31\x2c\
+\x39\x2e\x31\x63\x2d\x31\x2d\x30\x2e\x39\x2d\x32\x2e\x34\x2d\x31\
+\x2e\x34\x2d\x33\x2e\x37\x2d\x31\x2e\x34\x63\x2d\x31\x2e\x34\x2c\
+\x30\x2d\x32\x2e\x38\x2c\x30\x2e\x35\x2d\x33\x2e\x39\x2c\x31\x2e\
+\x36\x63\x2d\x31\x2e\x31\x2c\x31\x2e\x31\x2d\x31\x2e\x36\x2c\x32\
+\x2e\x35\x2d\x31\x2e\x36\x2c\x33\x2e\x39\x0a\x09\x09\x63\x30\x2c\
+\x31\x2e\x33\x2c\x30\x2e\x35\x2c\x32\x2e\x36\x2c\x31\x2e\x34\x2c\
+\x33\x2e\x37\x4c\x32\x35\x2e\x32\x2c\x36\x32\x2e\x39\x63\x30\x2c\
+\x30\x2d\x30\x2e\x31\x2c\x30\x2d\x30\x2e\x31\x2c\x30\x2e\x31\x6c\
+\x30\x2c\x30\x6c\x2d\x30\x2e\x37\x2c\x30\x2e\x37\x43\x32\x34\x2e\
+\x31\x2c\x36\x34\x2c\x32\x34\x2c\x36\x34\x2e\x35\x2c\x32\x34\x2c\
+\x36\x35\x76\x39\x2e\x37\x6c\x2d\x33\x2e\x32\x2c\x33\x2e\x32\x63\
+\x2d\x30\x2e\x37\x2c\x30\x2e\x37\x2d\x30\x2e\x37\x2c\x31\x2e\x39\
+\x2c\x30\x2c\x32\x2e\x36\x0a\x09\x09\x63\x30\x2e\x37\x2c\x30\x2e\
+\x37\x2c\x31\x2e\x39\x2c\x30\x2e\x37\x2c\x32\x2e\x36\x2c\x30\x6c\
+\x33\x2e\x31\x2d\x33\x2e\x31\x6c\x39\x2e\x37\x2c\x30\x63\x30\x2e\
+\x35\x2c\x30\x2c\x31\x2d\x30\x2e\x32\x2c\x31\x2e\x33\x2d\x30\x2e\
+\x35\x6c\x31\x31\x2e\x32\x2d\x31\x31\x2e\x31\x4c\x36\x30\x2c\x35\
+\x34\x2e\x33\x63\x31\x2c\x30\x2e\x39\x2c\x32\x2e\x34\x2c\x31\x2e\
+\x34\x2c\x33\x2e\x37\x2c\x31\x2e\x34\x63\x31\x2e\x34\x2c\x30\x2c\
+\x32\x2e\x38\x2d\x30\x2e\x35\x2c\x33\x2e\x39\x2d\x31\x2e\x36\x0a\
+\x09\x09\x63\x31\x2e\x31\x2d\x31\x2e\x31\x2c\x31\x2e\x36\x2d\x32\
+\x2e\x35\x2c\x31\x2e\x36\x2d\x33\x2e\x39\x63\x30\x2d\x31\x2e\x33\
+\x2d\x30\x2e\x35\x2d\x32\x2e\x36\x2d\x31\x2e\x34\x2d\x33\x2e\x37\
+\x4c\x37\x36\x2e\x38\x2c\x33\x37\x2e\x34\x4c\x37\x36\x2e\x38\x2c\
+\x33\x37\x2e\x34\x7a\x20\x4d\x34\x36\x2e\x31\x2c\x36\x33\x4c\x33\
+\x35\x2e\x35\x2c\x37\x33\x2e\x35\x6c\x2d\x37\x2e\x38\x2c\x30\x76\
+\x2d\x37\x2e\x39\x6c\x30\x2e\x31\x2d\x30\x2e\x31\x63\x30\x2c\x30\
+\x2c\x30\x2e\x31\x2c\x30\x2c\x30\x2e\x31\x2d\x30\x2e\x31\x0a\x09\
+\x09\x4c\x34\x39\x2e\x33\x2c\x34\x34\x6c\x37\x2e\x39\x2c\x37\x2e\
+\x39\x4c\x34\x36\x2e\x31\x2c\x36\x33\x7a\x20\x4d\x37\x34\x2e\x32\
+\x2c\x33\x34\x2e\x38\x4c\x37\x34\x2e\x32\x2c\x33\x34\x2e\x38\x4c\
+\x36\x33\x2e\x39\x2c\x34\x35\x2e\x32\x63\x2d\x30\x2e\x37\x2c\x30\
+\x2e\x37\x2d\x30\x2e\x37\x2c\x31\x2e\x39\x2c\x30\x2c\x32\x2e\x36\
+\x63\x30\x2e\x32\x2c\x30\x2e\x32\x2c\x30\x2e\x34\x2c\x30\x2e\x33\
+\x2c\x30\x2e\x37\x2c\x30\x2e\x34\x0a\x09\x09\x63\x30\x2e\x31\x2c\
+\x30\x2e\x32\x2c\x30\x2e\x32\x2c\x30\x2e\x35\x2c\x30\x2e\x34\x2c\
+\x30\x2e\x37\x63\x30\x2e\x34\x2c\x30\x2e\x34\x2c\x30\x2e\x35\x2c\
+\x30\x2e\x38\x2c\x30\x2e\x35\x2c\x31\x2e\x33\x63\x30\x2c\x30\x2e\
+\x35\x2d\x30\x2e\x32\x2c\x30\x2e\x39\x2d\x30\x2e\x35\x2c\x31\x2e\
+\x33\x63\x2d\x30\x2e\x34\x2c\x30\x2e\x34\x2d\x30\x2e\x38\x2c\x30\
+\x2e\x35\x2d\x31\x2e\x33\x2c\x30\x2e\x35\x63\x2d\x30\x2e\x35\x2c\
+\x30\x2d\x30\x2e\x39\x2d\x30\x2e\x32\x2d\x31\x2e\x33\x2d\x30\x2e\
+\x35\x0a\x09\x09\x4c\x34\x39\x2e\x37\x2c\x33\x38\x2e\x39\x63\x2d\
+\x30\x2e\x34\x2d\x30\x2e\x34\x2d\x30\x2e\x35\x2d\x30\x2e\x38\x2d\
+\x30\x2e\x35\x2d\x31\x2e\x33\x63\x30\x2d\x30\x2e\x35\x2c\x30\x2e\
+\x32\x2d\x30\x2e\x39\x2c\x30\x2e\x35\x2d\x31\x2e\x33\x63\x30\x2e\
+\x34\x2d\x30\x2e\x34\x2c\x30\x2e\x38\x2d\x30\x2e\x35\x2c\x31\x2e\
+\x33\x2d\x30\x2e\x35\x63\x30\x2e\x35\x2c\x30\x2c\x30\x2e\x39\x2c\
+\x30\x2e\x32\x2c\x31\x2e\x33\x2c\x30\x2e\x35\x0a\x09\x09\x63\x30\
+\x2e\x32\x2c\x30\x2e\x32\x2c\x30\x2e\x34\x2c\x30\x2e\x33\x2c\x30\
+\x2e\x37\x2c\x30\x2e\x34\x63\x30\x2e\x31\x2c\x30\x2e\x32\x2c\x30\
+\x2e\x32\x2c\x30\x2e\x35\x2c\x30\x2e\x34\x2c\x30\x2e\x37\x63\x30\
+\x2e\x37\x2c\x30\x2e\x37\x2c\x31\x2e\x39\x2c\x30\x2e\x37\x2c\x32\
+\x2e\x36\x2c\x30\x4c\x36\x36\x2e\x34\x2c\x32\x37\x6c\x30\x2c\x30\
+\x63\x31\x2e\x31\x2d\x31\x2e\x31\x2c\x32\x2e\x35\x2d\x31\x2e\x36\
+\x2c\x33\x2e\x39\x2d\x31\x2e\x36\x0a\x09\x09\x63\x31\x2e\x34\x2c\
+\x30\x2c\x32\x2e\x38\x2c\x30\x2e\x35\x2c\x33\x2e\x39\x2c\x31\x2e\
+\x36\x6c\x30\x2c\x30\x63\x31\x2e\x31\x2c\x31\x2e\x31\x2c\x31\x2e\
+\x36\x2c\x32\x2e\x35\x2c\x31\x2e\x36\x2c\x33\x2e\x39\x43\x37\x35\
+\x2e\x39\x2c\x33\x32\x2e\x33\x2c\x37\x35\x2e\x33\x2c\x33\x33\x2e\
+\x37\x2c\x37\x34\x2e\x32\x2c\x33\x34\x2e\x38\x7a\x22\x2f\x3e\x0a\
+\x09\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x36\x31\x2e\x38\x2c\
+\x34\x35\x2e\x37\x6c\x32\x2e\x31\x2c\x32\x2e\x31\x6c\x31\x2e\x31\
+\x2c\x31\x2e\x31\x63\x30\x2e\x37\x2c\x30\x2e\x37\x2c\x31\x2e\x39\
+\x2c\x30\x2e\x37\x2c\x32\x2e\x36\x2c\x30\x63\x30\x2e\x37\x2d\x30\
+\x2e\x37\x2c\x30\x2e\x37\x2d\x31\x2e\x39\x2c\x30\x2d\x32\x2e\x36\
+\x6c\x2d\x31\x2e\x31\x2d\x31\x2e\x31\x6c\x2d\x32\x2e\x31\x2d\x32\
+\x2e\x31\x63\x2d\x30\x2e\x37\x2d\x30\x2e\x37\x2d\x31\x2e\x39\x2d\
+\x30\x2e\x37\x2d\x32\x2e\x36\x2c\x30\x0a\x09\x09\x43\x36\x31\x2e\
+\x31\x2c\x34\x33\x2e\x38\x2c\x36\x31\x2e\x31\x2c\x34\x35\x2c\x36\
+\x31\x2e\x38\x2c\x34\x35\x2e\x37\x4c\x36\x31\x2e\x38\x2c\x34\x35\
+\x2e\x37\x7a\x22\x2f\x3e\x0a\x09\x3c\x70\x61\x74\x68\x20\x64\x3d\
+\x22\x4d\x35\x32\x2e\x33\x2c\x33\x36\x2e\x32\x6c\x31\x2e\x31\x2c\
+\x31\x2e\x31\x6c\x32\x2e\x31\x2c\x32\x2e\x31\x63\x30\x2e\x37\x2c\
+\x30\x2e\x37\x2c\x31\x2e\x39\x2c\x30\x2e\x37\x2c\x32\x2e\x36\x2c\
+\x30\x63\x30\x2e\x37\x2d\x30\x2e\x37\x2c\x30\x2e\x37\x2d\x31\x2e\
+\x39\x2c\x30\x2d\x32\x2e\x36\x4c\x35\x36\x2c\x33\x34\x2e\x37\x6c\
+\x2d\x31\x2e\x31\x2d\x31\x2e\x31\x63\x2d\x30\x2e\x37\x2d\x30\x2e\
+\x37\x2d\x31\x2e\x39\x2d\x30\x2e\x37\x2d\x32\x2e\x36\x2c\x30\x0a\
+\x09\x09\x43\x35\x31\x2e\x36\x2c\x33\x34\x2e\x33\x2c\x35\x31\x2e\
+\x36\x2c\x33\x35\x2e\x35\x2c\x35\x32\x2e\x33\x2c\x33\x36\x2e\x32\
+\x4c\x35\x32\x2e\x33\x2c\x33\x36\x2e\x32\x7a\x22\x2f\x3e\x0a\x09\
+\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x32\x36\x2e\x35\x2c\x36\
+\x36\x2e\x31\x4c\x32\x36\x2e\x35\x2c\x36\x36\x2e\x31\x68\x32\x30\
+\x2e\x39\x63\x31\x2c\x30\x2c\x31\x2e\x39\x2d\x30\x2e\x38\x2c\x31\
+\x2e\x39\x2d\x31\x2e\x39\x63\x30\x2d\x31\x2d\x30\x2e\x38\x2d\x31\
+\x2e\x39\x2d\x31\x2e\x39\x2d\x31\x2e\x39\x48\x32\x36\x2e\x35\x68\
+\x30\x63\x2d\x31\x2c\x30\x2d\x31\x2e\x39\x2c\x30\x2e\x38\x2d\x31\
+\x2e\x39\x2c\x31\x2e\x39\x0a\x09\x09\x43\x32\x34\x2e\x36\x2c\x36\
+\x35\x2e\x33\x2c\x32\x35\x2e\x35\x2c\x36\x36\x2e\x31\x2c\x32\x36\
+\x2e\x35\x2c\x36\x36\x2e\x31\x4c\x32\x36\x2e\x35\x2c\x36\x36\x2e\
+\x31\x7a\x22\x2f\x3e\x0a\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\
+\x3e\x0a\
+\x00\x00\x04\x7b\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\
+\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x67\x20\x69\x64\x3d\x22\x53\x6f\x6c\x69\
+\x64\x22\x3e\x0a\x09\x3c\x67\x3e\x0a\x09\x09\x3c\x70\x6f\x6c\x79\
+\x67\x6f\x6e\x20\x70\x6f\x69\x6e\x74\x73\x3d\x22\x37\x30\x2e\x37\
+\x2c\x31\x34\x2e\x37\x20\x36\x33\x2e\x35\x2c\x31\x34\x2e\x37\x20\
+\x36\x33\x2e\x35\x2c\x32\x39\x2e\x32\x20\x34\x38\x2e\x39\x2c\x32\
+\x39\x2e\x32\x20\x34\x38\x2e\x39\x2c\x33\x36\x2e\x35\x20\x36\x33\
+\x2e\x35\x2c\x33\x36\x2e\x35\x20\x36\x33\x2e\x35\x2c\x35\x31\x20\
+\x37\x30\x2e\x37\x2c\x35\x31\x20\x37\x30\x2e\x37\x2c\x33\x36\x2e\
+\x35\x20\x38\x35\x2e\x33\x2c\x33\x36\x2e\x35\x20\x38\x35\x2e\x33\
+\x2c\x32\x39\x2e\x32\x20\x0a\x09\x09\x09\x37\x30\x2e\x37\x2c\x32\
+\x39\x2e\x32\x20\x09\x09\x22\x2f\x3e\x0a\x09\x3c\x2f\x67\x3e\x0a\
+\x3c\x2f\x67\x3e\x0a\x3c\x67\x20\x69\x64\x3d\x22\x4f\x75\x74\x6c\
+\x69\x6e\x65\x22\x3e\x0a\x09\x3c\x67\x3e\x0a\x09\x09\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x33\x35\x2e\x34\x2c\x38\x35\x2e\x39\
+\x63\x2d\x30\x2e\x39\x2c\x30\x2d\x31\x2e\x38\x2d\x30\x2e\x36\x2d\
+\x32\x2e\x32\x2d\x31\x2e\x35\x4c\x31\x36\x2e\x38\x2c\x34\x34\x2e\
+\x35\x63\x2d\x30\x2e\x34\x2d\x30\x2e\x39\x2d\x30\x2e\x32\x2d\x31\
+\x2e\x39\x2c\x30\x2e\x35\x2d\x32\x2e\x36\x63\x30\x2e\x37\x2d\x30\
+\x2e\x37\x2c\x31\x2e\x37\x2d\x30\x2e\x39\x2c\x32\x2e\x36\x2d\x30\
+\x2e\x35\x6c\x33\x39\x2e\x39\x2c\x31\x36\x2e\x34\x0a\x09\x09\x09\
+\x63\x30\x2e\x39\x2c\x30\x2e\x34\x2c\x31\x2e\x35\x2c\x31\x2e\x33\
+\x2c\x31\x2e\x34\x2c\x32\x2e\x33\x73\x2d\x30\x2e\x38\x2c\x31\x2e\
+\x39\x2d\x31\x2e\x38\x2c\x32\x2e\x31\x4c\x34\x32\x2c\x36\x36\x2e\
+\x36\x4c\x33\x37\x2e\x36\x2c\x38\x34\x63\x2d\x30\x2e\x32\x2c\x31\
+\x2d\x31\x2e\x31\x2c\x31\x2e\x37\x2d\x32\x2e\x31\x2c\x31\x2e\x38\
+\x43\x33\x35\x2e\x35\x2c\x38\x35\x2e\x39\x2c\x33\x35\x2e\x35\x2c\
+\x38\x35\x2e\x39\x2c\x33\x35\x2e\x34\x2c\x38\x35\x2e\x39\x7a\x20\
+\x4d\x32\x33\x2e\x33\x2c\x34\x37\x2e\x39\x0a\x09\x09\x09\x4c\x33\
+\x34\x2e\x39\x2c\x37\x36\x6c\x33\x2d\x31\x31\x2e\x39\x63\x30\x2e\
+\x32\x2d\x30\x2e\x38\x2c\x30\x2e\x39\x2d\x31\x2e\x35\x2c\x31\x2e\
+\x37\x2d\x31\x2e\x37\x6c\x31\x31\x2e\x39\x2d\x33\x4c\x32\x33\x2e\
+\x33\x2c\x34\x37\x2e\x39\x7a\x22\x2f\x3e\x0a\x09\x3c\x2f\x67\x3e\
+\x0a\x3c\x2f\x67\x3e\x0a\x3c\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x70\
+\x6f\x69\x6e\x74\x73\x3d\x22\x32\x31\x2e\x37\x2c\x34\x36\x2e\x36\
+\x20\x33\x34\x2e\x35\x2c\x37\x38\x2e\x33\x20\x33\x39\x2e\x33\x2c\
+\x36\x35\x2e\x37\x20\x35\x33\x2e\x39\x2c\x35\x39\x2e\x35\x20\x22\
+\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x03\xd2\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\
+\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x67\x20\
+\x69\x64\x3d\x22\x4f\x75\x74\x6c\x69\x6e\x65\x22\x3e\x0a\x09\x3c\
+\x67\x3e\x0a\x09\x09\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x34\
+\x37\x2e\x32\x2c\x38\x36\x2e\x39\x63\x2d\x31\x2e\x34\x2c\x30\x2d\
+\x32\x2e\x37\x2d\x30\x2e\x39\x2d\x33\x2e\x33\x2d\x32\x2e\x32\x6c\
+\x2d\x32\x35\x2d\x36\x30\x2e\x36\x63\x2d\x30\x2e\x36\x2d\x31\x2e\
+\x33\x2d\x30\x2e\x32\x2d\x32\x2e\x39\x2c\x30\x2e\x38\x2d\x33\x2e\
+\x39\x73\x32\x2e\x35\x2d\x31\x2e\x33\x2c\x33\x2e\x39\x2d\x30\x2e\
+\x38\x6c\x36\x30\x2e\x36\x2c\x32\x35\x63\x31\x2e\x34\x2c\x30\x2e\
+\x36\x2c\x32\x2e\x33\x2c\x32\x2c\x32\x2e\x32\x2c\x33\x2e\x36\x0a\
+\x09\x09\x09\x63\x2d\x30\x2e\x31\x2c\x31\x2e\x35\x2d\x31\x2e\x32\
+\x2c\x32\x2e\x38\x2d\x32\x2e\x37\x2c\x33\x2e\x32\x6c\x2d\x32\x36\
+\x2e\x34\x2c\x36\x2e\x36\x6c\x2d\x36\x2e\x36\x2c\x32\x36\x2e\x34\
+\x63\x2d\x30\x2e\x34\x2c\x31\x2e\x35\x2d\x31\x2e\x37\x2c\x32\x2e\
+\x36\x2d\x33\x2e\x32\x2c\x32\x2e\x37\x43\x34\x37\x2e\x33\x2c\x38\
+\x36\x2e\x39\x2c\x34\x37\x2e\x32\x2c\x38\x36\x2e\x39\x2c\x34\x37\
+\x2e\x32\x2c\x38\x36\x2e\x39\x7a\x20\x4d\x32\x38\x2e\x37\x2c\x32\
+\x39\x2e\x33\x4c\x34\x36\x2e\x33\x2c\x37\x32\x0a\x09\x09\x09\x6c\
+\x34\x2e\x35\x2d\x31\x38\x63\x30\x2e\x33\x2d\x31\x2e\x33\x2c\x31\
+\x2e\x33\x2d\x32\x2e\x33\x2c\x32\x2e\x36\x2d\x32\x2e\x36\x6c\x31\
+\x38\x2d\x34\x2e\x35\x4c\x32\x38\x2e\x37\x2c\x32\x39\x2e\x33\x7a\
+\x22\x2f\x3e\x0a\x09\x3c\x2f\x67\x3e\x0a\x3c\x2f\x67\x3e\x0a\x3c\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x70\x6f\x69\x6e\x74\x73\x3d\x22\
+\x32\x36\x2e\x33\x2c\x32\x37\x2e\x32\x20\x34\x35\x2e\x37\x2c\x37\
+\x35\x2e\x34\x20\x35\x33\x2c\x35\x36\x2e\x32\x20\x37\x35\x2e\x32\
+\x2c\x34\x36\x2e\x38\x20\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\
+\x0a\
+\x00\x00\x03\x20\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\x69\
+\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\
+\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\x6b\
+\x22\x20\x66\x6f\x63\x75\x73\x61\x62\x6c\x65\x3d\x22\x66\x61\x6c\
+\x73\x65\x22\x20\x70\x72\x65\x73\x65\x72\x76\x65\x41\x73\x70\x65\
+\x63\x74\x52\x61\x74\x69\x6f\x3d\x22\x78\x4d\x69\x64\x59\x4d\x69\
+\x64\x20\x6d\x65\x65\x74\x22\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\
+\x22\x30\x20\x30\x20\x31\x34\x20\x31\x36\x22\x3e\x3c\x73\x74\x79\
+\x6c\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\
+\x73\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\
+\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\
+\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\
+\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\
+\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\
+\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\
+\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\
+\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\
+\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\
+\x74\x79\x6c\x65\x3e\x0a\x3c\x21\x2d\x2d\x46\x72\x6f\x6d\x20\x47\
+\x69\x74\x48\x75\x62\x27\x73\x20\x4f\x63\x74\x6f\x69\x63\x6f\x6e\
+\x73\x2d\x2d\x3e\x0a\x3c\x21\x2d\x2d\x65\x78\x74\x72\x61\x20\x6c\
+\x69\x6e\x65\x2d\x2d\x3e\x0a\x3c\x21\x2d\x2d\x65\x78\x74\x72\x61\
+\x20\x6c\x69\x6e\x65\x32\x2d\x2d\x3e\x0a\x3c\x70\x61\x74\x68\x20\
+\x64\x3d\x22\x4d\x32\x20\x31\x33\x68\x34\x76\x31\x48\x32\x76\x2d\
+\x31\x7a\x6d\x35\x2d\x36\x48\x32\x76\x31\x68\x35\x56\x37\x7a\x6d\
+\x32\x20\x33\x56\x38\x6c\x2d\x33\x20\x33\x6c\x33\x20\x33\x76\x2d\
+\x32\x68\x35\x76\x2d\x32\x48\x39\x7a\x4d\x34\x2e\x35\x20\x39\x48\
+\x32\x76\x31\x68\x32\x2e\x35\x56\x39\x7a\x4d\x32\x20\x31\x32\x68\
+\x32\x2e\x35\x76\x2d\x31\x48\x32\x76\x31\x7a\x6d\x39\x20\x31\x68\
+\x31\x76\x32\x63\x2d\x2e\x30\x32\x2e\x32\x38\x2d\x2e\x31\x31\x2e\
+\x35\x32\x2d\x2e\x33\x2e\x37\x63\x2d\x2e\x31\x39\x2e\x31\x38\x2d\
+\x2e\x34\x32\x2e\x32\x38\x2d\x2e\x37\x2e\x33\x48\x31\x63\x2d\x2e\
+\x35\x35\x20\x30\x2d\x31\x2d\x2e\x34\x35\x2d\x31\x2d\x31\x56\x34\
+\x63\x30\x2d\x2e\x35\x35\x2e\x34\x35\x2d\x31\x20\x31\x2d\x31\x68\
+\x33\x63\x30\x2d\x31\x2e\x31\x31\x2e\x38\x39\x2d\x32\x20\x32\x2d\
+\x32\x63\x31\x2e\x31\x31\x20\x30\x20\x32\x20\x2e\x38\x39\x20\x32\
+\x20\x32\x68\x33\x63\x2e\x35\x35\x20\x30\x20\x31\x20\x2e\x34\x35\
+\x20\x31\x20\x31\x76\x35\x68\x2d\x31\x56\x36\x48\x31\x76\x39\x68\
+\x31\x30\x76\x2d\x32\x7a\x4d\x32\x20\x35\x68\x38\x63\x30\x2d\x2e\
+\x35\x35\x2d\x2e\x34\x35\x2d\x31\x2d\x31\x2d\x31\x48\x38\x63\x2d\
+\x2e\x35\x35\x20\x30\x2d\x31\x2d\x2e\x34\x35\x2d\x31\x2d\x31\x73\
+\x2d\x2e\x34\x35\x2d\x31\x2d\x31\x2d\x31\x73\x2d\x31\x20\x2e\x34\
+\x35\x2d\x31\x20\x31\x73\x2d\x2e\x34\x35\x20\x31\x2d\x31\x20\x31\
+\x48\x33\x63\x2d\x2e\x35\x35\x20\x30\x2d\x31\x20\x2e\x34\x35\x2d\
+\x31\x20\x31\x7a\x22\x20\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x03\x85\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\
+\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x35\
+\x31\x2e\x33\x2c\x37\x35\x2e\x39\x63\x2d\x31\x2e\x39\x2c\x30\x2d\
+\x33\x2e\x38\x2d\x30\x2e\x38\x2d\x35\x2d\x32\x2e\x34\x4c\x31\x38\
+\x2e\x31\x2c\x33\x38\x2e\x34\x63\x2d\x32\x2e\x32\x2d\x32\x2e\x38\
+\x2d\x31\x2e\x38\x2d\x36\x2e\x39\x2c\x31\x2d\x39\x2e\x31\x63\x32\
+\x2e\x38\x2d\x32\x2e\x32\x2c\x36\x2e\x39\x2d\x31\x2e\x38\x2c\x39\
+\x2e\x31\x2c\x31\x6c\x32\x38\x2e\x32\x2c\x33\x35\x2e\x31\x63\x32\
+\x2e\x32\x2c\x32\x2e\x38\x2c\x31\x2e\x38\x2c\x36\x2e\x39\x2d\x31\
+\x2c\x39\x2e\x31\x0a\x09\x43\x35\x34\x2e\x32\x2c\x37\x35\x2e\x35\
+\x2c\x35\x32\x2e\x37\x2c\x37\x35\x2e\x39\x2c\x35\x31\x2e\x33\x2c\
+\x37\x35\x2e\x39\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\
+\x3d\x22\x4d\x35\x31\x2e\x33\x2c\x37\x35\x2e\x39\x63\x2d\x31\x2e\
+\x34\x2c\x30\x2d\x32\x2e\x39\x2d\x30\x2e\x35\x2d\x34\x2d\x31\x2e\
+\x34\x63\x2d\x32\x2e\x38\x2d\x32\x2e\x32\x2d\x33\x2e\x32\x2d\x36\
+\x2e\x33\x2d\x31\x2d\x39\x2e\x31\x6c\x32\x38\x2e\x32\x2d\x33\x35\
+\x2e\x31\x63\x32\x2e\x32\x2d\x32\x2e\x38\x2c\x36\x2e\x33\x2d\x33\
+\x2e\x32\x2c\x39\x2e\x31\x2d\x31\x63\x32\x2e\x38\x2c\x32\x2e\x32\
+\x2c\x33\x2e\x32\x2c\x36\x2e\x33\x2c\x31\x2c\x39\x2e\x31\x4c\x35\
+\x36\x2e\x34\x2c\x37\x33\x2e\x35\x0a\x09\x43\x35\x35\x2e\x31\x2c\
+\x37\x35\x2e\x31\x2c\x35\x33\x2e\x32\x2c\x37\x35\x2e\x39\x2c\x35\
+\x31\x2e\x33\x2c\x37\x35\x2e\x39\x7a\x22\x2f\x3e\x0a\x3c\x2f\x73\
+\x76\x67\x3e\x0a\
+\x00\x00\x03\xf5\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\
+\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x35\x30\x2e\x35\x2c\x37\x37\x2e\x33\
+\x43\x32\x36\x2e\x37\x2c\x37\x37\x2e\x33\x2c\x38\x2e\x31\x2c\x35\
+\x32\x2e\x31\x2c\x37\x2e\x33\x2c\x35\x31\x4c\x36\x2c\x34\x39\x2e\
+\x32\x6c\x31\x2e\x33\x2d\x31\x2e\x38\x43\x38\x2e\x31\x2c\x34\x36\
+\x2e\x33\x2c\x32\x36\x2e\x37\x2c\x32\x31\x2c\x35\x30\x2e\x35\x2c\
+\x32\x31\x73\x34\x32\x2e\x34\x2c\x32\x35\x2e\x33\x2c\x34\x33\x2e\
+\x32\x2c\x32\x36\x2e\x33\x6c\x31\x2e\x33\x2c\x31\x2e\x38\x4c\x39\
+\x33\x2e\x37\x2c\x35\x31\x0a\x09\x43\x39\x32\x2e\x39\x2c\x35\x32\
+\x2e\x31\x2c\x37\x34\x2e\x33\x2c\x37\x37\x2e\x33\x2c\x35\x30\x2e\
+\x35\x2c\x37\x37\x2e\x33\x7a\x20\x4d\x31\x33\x2e\x38\x2c\x34\x39\
+\x2e\x32\x63\x34\x2e\x36\x2c\x35\x2e\x36\x2c\x31\x39\x2e\x35\x2c\
+\x32\x31\x2e\x39\x2c\x33\x36\x2e\x37\x2c\x32\x31\x2e\x39\x73\x33\
+\x32\x2e\x31\x2d\x31\x36\x2e\x34\x2c\x33\x36\x2e\x37\x2d\x32\x31\
+\x2e\x39\x63\x2d\x34\x2e\x36\x2d\x35\x2e\x36\x2d\x31\x39\x2e\x35\
+\x2d\x32\x31\x2e\x39\x2d\x33\x36\x2e\x37\x2d\x32\x31\x2e\x39\x0a\
+\x09\x43\x33\x33\x2e\x33\x2c\x32\x37\x2e\x32\x2c\x31\x38\x2e\x34\
+\x2c\x34\x33\x2e\x36\x2c\x31\x33\x2e\x38\x2c\x34\x39\x2e\x32\x7a\
+\x22\x2f\x3e\x0a\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\
+\x35\x30\x2e\x35\x22\x20\x63\x79\x3d\x22\x34\x39\x2e\x32\x22\x20\
+\x72\x3d\x22\x31\x37\x2e\x33\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\
+\x20\x78\x3d\x22\x31\x2e\x31\x22\x20\x79\x3d\x22\x34\x34\x2e\x36\
+\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\x74\
+\x72\x69\x78\x28\x30\x2e\x38\x31\x38\x38\x20\x2d\x30\x2e\x35\x37\
+\x34\x31\x20\x30\x2e\x35\x37\x34\x31\x20\x30\x2e\x38\x31\x38\x38\
+\x20\x2d\x31\x39\x2e\x31\x32\x39\x31\x20\x33\x37\x2e\x36\x39\x38\
+\x29\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x39\x38\x2e\x31\x22\x20\
+\x68\x65\x69\x67\x68\x74\x3d\x22\x39\x22\x2f\x3e\x0a\x3c\x2f\x73\
+\x76\x67\x3e\x0a\
+\x00\x00\x02\x72\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x36\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\
+\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x32\x32\
+\x2e\x32\x22\x20\x79\x3d\x22\x32\x32\x2e\x32\x22\x20\x77\x69\x64\
+\x74\x68\x3d\x22\x35\x35\x2e\x35\x22\x20\x68\x65\x69\x67\x68\x74\
+\x3d\x22\x35\x35\x2e\x35\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\
+\x0a\
+\x00\x00\x06\x37\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\
+\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x35\
+\x38\x2e\x38\x2c\x38\x32\x2e\x36\x63\x2d\x34\x2e\x37\x2c\x30\x2d\
+\x38\x2e\x36\x2d\x33\x2e\x39\x2d\x38\x2e\x36\x2d\x38\x2e\x36\x73\
+\x33\x2e\x39\x2d\x38\x2e\x36\x2c\x38\x2e\x36\x2d\x38\x2e\x36\x73\
+\x38\x2e\x36\x2c\x33\x2e\x39\x2c\x38\x2e\x36\x2c\x38\x2e\x36\x53\
+\x36\x33\x2e\x35\x2c\x38\x32\x2e\x36\x2c\x35\x38\x2e\x38\x2c\x38\
+\x32\x2e\x36\x7a\x20\x4d\x35\x38\x2e\x38\x2c\x37\x31\x63\x2d\x31\
+\x2e\x37\x2c\x30\x2d\x33\x2c\x31\x2e\x33\x2d\x33\x2c\x33\x0a\x09\
+\x73\x31\x2e\x33\x2c\x33\x2c\x33\x2c\x33\x73\x33\x2d\x31\x2e\x33\
+\x2c\x33\x2d\x33\x53\x36\x30\x2e\x35\x2c\x37\x31\x2c\x35\x38\x2e\
+\x38\x2c\x37\x31\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\
+\x3d\x22\x4d\x33\x39\x2e\x35\x2c\x33\x39\x2e\x38\x63\x2d\x34\x2e\
+\x37\x2c\x30\x2d\x38\x2e\x36\x2d\x33\x2e\x39\x2d\x38\x2e\x36\x2d\
+\x38\x2e\x36\x73\x33\x2e\x39\x2d\x38\x2e\x36\x2c\x38\x2e\x36\x2d\
+\x38\x2e\x36\x73\x38\x2e\x36\x2c\x33\x2e\x39\x2c\x38\x2e\x36\x2c\
+\x38\x2e\x36\x53\x34\x34\x2e\x32\x2c\x33\x39\x2e\x38\x2c\x33\x39\
+\x2e\x35\x2c\x33\x39\x2e\x38\x7a\x20\x4d\x33\x39\x2e\x35\x2c\x32\
+\x38\x2e\x32\x63\x2d\x31\x2e\x37\x2c\x30\x2d\x33\x2c\x31\x2e\x33\
+\x2d\x33\x2c\x33\x0a\x09\x73\x31\x2e\x33\x2c\x33\x2c\x33\x2c\x33\
+\x73\x33\x2d\x31\x2e\x33\x2c\x33\x2d\x33\x53\x34\x31\x2e\x32\x2c\
+\x32\x38\x2e\x32\x2c\x33\x39\x2e\x35\x2c\x32\x38\x2e\x32\x7a\x22\
+\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x39\x2e\
+\x32\x2c\x38\x32\x2e\x36\x63\x2d\x34\x2e\x37\x2c\x30\x2d\x38\x2e\
+\x36\x2d\x33\x2e\x39\x2d\x38\x2e\x36\x2d\x38\x2e\x36\x73\x33\x2e\
+\x39\x2d\x38\x2e\x36\x2c\x38\x2e\x36\x2d\x38\x2e\x36\x73\x38\x2e\
+\x36\x2c\x33\x2e\x39\x2c\x38\x2e\x36\x2c\x38\x2e\x36\x53\x32\x33\
+\x2e\x39\x2c\x38\x32\x2e\x36\x2c\x31\x39\x2e\x32\x2c\x38\x32\x2e\
+\x36\x7a\x20\x4d\x31\x39\x2e\x32\x2c\x37\x31\x63\x2d\x31\x2e\x37\
+\x2c\x30\x2d\x33\x2c\x31\x2e\x33\x2d\x33\x2c\x33\x0a\x09\x73\x31\
+\x2e\x33\x2c\x33\x2c\x33\x2c\x33\x73\x33\x2d\x31\x2e\x33\x2c\x33\
+\x2d\x33\x53\x32\x30\x2e\x39\x2c\x37\x31\x2c\x31\x39\x2e\x32\x2c\
+\x37\x31\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\
+\x4d\x38\x33\x2e\x31\x2c\x33\x39\x2e\x38\x63\x2d\x34\x2e\x37\x2c\
+\x30\x2d\x38\x2e\x36\x2d\x33\x2e\x39\x2d\x38\x2e\x36\x2d\x38\x2e\
+\x36\x73\x33\x2e\x39\x2d\x38\x2e\x36\x2c\x38\x2e\x36\x2d\x38\x2e\
+\x36\x73\x38\x2e\x36\x2c\x33\x2e\x39\x2c\x38\x2e\x36\x2c\x38\x2e\
+\x36\x53\x38\x37\x2e\x38\x2c\x33\x39\x2e\x38\x2c\x38\x33\x2e\x31\
+\x2c\x33\x39\x2e\x38\x7a\x20\x4d\x38\x33\x2e\x31\x2c\x32\x38\x2e\
+\x32\x63\x2d\x31\x2e\x37\x2c\x30\x2d\x33\x2c\x31\x2e\x33\x2d\x33\
+\x2c\x33\x0a\x09\x73\x31\x2e\x33\x2c\x33\x2c\x33\x2c\x33\x73\x33\
+\x2d\x31\x2e\x33\x2c\x33\x2d\x33\x53\x38\x34\x2e\x38\x2c\x32\x38\
+\x2e\x32\x2c\x38\x33\x2e\x31\x2c\x32\x38\x2e\x32\x7a\x22\x2f\x3e\
+\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x35\x31\x2e\x31\x22\x20\
+\x79\x3d\x22\x34\x39\x2e\x32\x22\x20\x74\x72\x61\x6e\x73\x66\x6f\
+\x72\x6d\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\x30\x2e\x35\x33\x35\
+\x35\x20\x2d\x30\x2e\x38\x34\x34\x35\x20\x30\x2e\x38\x34\x34\x35\
+\x20\x30\x2e\x35\x33\x35\x35\x20\x2d\x31\x31\x2e\x32\x31\x39\x20\
+\x38\x33\x2e\x35\x30\x32\x39\x29\x22\x20\x77\x69\x64\x74\x68\x3d\
+\x22\x33\x38\x2e\x35\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x35\
+\x2e\x35\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x34\
+\x36\x2e\x34\x22\x20\x79\x3d\x22\x33\x35\x2e\x33\x22\x20\x74\x72\
+\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\
+\x30\x2e\x39\x30\x30\x31\x20\x2d\x30\x2e\x34\x33\x35\x36\x20\x30\
+\x2e\x34\x33\x35\x36\x20\x30\x2e\x39\x30\x30\x31\x20\x2d\x31\x38\
+\x2e\x30\x30\x35\x39\x20\x32\x36\x2e\x36\x36\x36\x29\x22\x20\x77\
+\x69\x64\x74\x68\x3d\x22\x35\x2e\x35\x22\x20\x68\x65\x69\x67\x68\
+\x74\x3d\x22\x33\x34\x2e\x37\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\
+\x20\x78\x3d\x22\x31\x30\x22\x20\x79\x3d\x22\x35\x31\x2e\x33\x22\
+\x20\x74\x72\x61\x6e\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\x74\x72\
+\x69\x78\x28\x30\x2e\x34\x36\x31\x35\x20\x2d\x30\x2e\x38\x38\x37\
+\x32\x20\x30\x2e\x38\x38\x37\x32\x20\x30\x2e\x34\x36\x31\x35\x20\
+\x2d\x33\x32\x2e\x31\x30\x30\x36\x20\x35\x35\x2e\x31\x31\x38\x38\
+\x29\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x33\x38\x2e\x38\x22\x20\
+\x68\x65\x69\x67\x68\x74\x3d\x22\x35\x2e\x35\x22\x2f\x3e\x0a\x3c\
+\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x04\x83\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\
+\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x67\x20\
+\x69\x64\x3d\x22\x53\x6f\x6c\x69\x64\x22\x3e\x0a\x09\x3c\x67\x3e\
+\x0a\x09\x09\x3c\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x70\x6f\x69\x6e\
+\x74\x73\x3d\x22\x37\x30\x2e\x37\x2c\x31\x34\x2e\x37\x20\x36\x33\
+\x2e\x35\x2c\x31\x34\x2e\x37\x20\x36\x33\x2e\x35\x2c\x32\x39\x2e\
+\x32\x20\x34\x38\x2e\x39\x2c\x32\x39\x2e\x32\x20\x34\x38\x2e\x39\
+\x2c\x33\x36\x2e\x35\x20\x36\x33\x2e\x35\x2c\x33\x36\x2e\x35\x20\
+\x36\x33\x2e\x35\x2c\x35\x31\x20\x37\x30\x2e\x37\x2c\x35\x31\x20\
+\x37\x30\x2e\x37\x2c\x33\x36\x2e\x35\x20\x38\x35\x2e\x33\x2c\x33\
+\x36\x2e\x35\x20\x38\x35\x2e\x33\x2c\x32\x39\x2e\x32\x20\x0a\x09\
+\x09\x09\x37\x30\x2e\x37\x2c\x32\x39\x2e\x32\x20\x09\x09\x22\x2f\
+\x3e\x0a\x09\x3c\x2f\x67\x3e\x0a\x3c\x2f\x67\x3e\x0a\x3c\x67\x20\
+\x69\x64\x3d\x22\x4f\x75\x74\x6c\x69\x6e\x65\x22\x3e\x0a\x09\x3c\
+\x67\x3e\x0a\x09\x09\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x33\
+\x35\x2e\x34\x2c\x38\x35\x2e\x39\x63\x2d\x30\x2e\x39\x2c\x30\x2d\
+\x31\x2e\x38\x2d\x30\x2e\x36\x2d\x32\x2e\x32\x2d\x31\x2e\x35\x4c\
+\x31\x36\x2e\x38\x2c\x34\x34\x2e\x35\x63\x2d\x30\x2e\x34\x2d\x30\
+\x2e\x39\x2d\x30\x2e\x32\x2d\x31\x2e\x39\x2c\x30\x2e\x35\x2d\x32\
+\x2e\x36\x63\x30\x2e\x37\x2d\x30\x2e\x37\x2c\x31\x2e\x37\x2d\x30\
+\x2e\x39\x2c\x32\x2e\x36\x2d\x30\x2e\x35\x6c\x33\x39\x2e\x39\x2c\
+\x31\x36\x2e\x34\x0a\x09\x09\x09\x63\x30\x2e\x39\x2c\x30\x2e\x34\
+\x2c\x31\x2e\x35\x2c\x31\x2e\x33\x2c\x31\x2e\x34\x2c\x32\x2e\x33\
+\x73\x2d\x30\x2e\x38\x2c\x31\x2e\x39\x2d\x31\x2e\x38\x2c\x32\x2e\
+\x31\x4c\x34\x32\x2c\x36\x36\x2e\x36\x4c\x33\x37\x2e\x36\x2c\x38\
+\x34\x63\x2d\x30\x2e\x32\x2c\x31\x2d\x31\x2e\x31\x2c\x31\x2e\x37\
+\x2d\x32\x2e\x31\x2c\x31\x2e\x38\x43\x33\x35\x2e\x35\x2c\x38\x35\
+\x2e\x39\x2c\x33\x35\x2e\x35\x2c\x38\x35\x2e\x39\x2c\x33\x35\x2e\
+\x34\x2c\x38\x35\x2e\x39\x7a\x20\x4d\x32\x33\x2e\x33\x2c\x34\x37\
+\x2e\x39\x0a\x09\x09\x09\x4c\x33\x34\x2e\x39\x2c\x37\x36\x6c\x33\
+\x2d\x31\x31\x2e\x39\x63\x30\x2e\x32\x2d\x30\x2e\x38\x2c\x30\x2e\
+\x39\x2d\x31\x2e\x35\x2c\x31\x2e\x37\x2d\x31\x2e\x37\x6c\x31\x31\
+\x2e\x39\x2d\x33\x4c\x32\x33\x2e\x33\x2c\x34\x37\x2e\x39\x7a\x22\
+\x2f\x3e\x0a\x09\x3c\x2f\x67\x3e\x0a\x3c\x2f\x67\x3e\x0a\x3c\x70\
+\x6f\x6c\x79\x67\x6f\x6e\x20\x70\x6f\x69\x6e\x74\x73\x3d\x22\x32\
+\x31\x2e\x37\x2c\x34\x36\x2e\x36\x20\x33\x34\x2e\x35\x2c\x37\x38\
+\x2e\x33\x20\x33\x39\x2e\x33\x2c\x36\x35\x2e\x37\x20\x35\x33\x2e\
+\x39\x2c\x35\x39\x2e\x35\x20\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\
+\x3e\x0a\
+\x00\x00\x02\x6d\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x36\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\
+\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x70\x6f\
+\x69\x6e\x74\x73\x3d\x22\x32\x30\x2e\x39\x2c\x35\x30\x20\x37\x39\
+\x2e\x31\x2c\x39\x37\x2e\x34\x20\x37\x39\x2e\x31\x2c\x32\x2e\x36\
+\x20\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x04\x81\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\
+\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x67\x20\x69\x64\x3d\x22\x53\x6f\x6c\x69\
+\x64\x22\x3e\x0a\x09\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x37\
+\x39\x2e\x34\x2c\x33\x30\x2e\x31\x63\x30\x2d\x32\x2e\x34\x2d\x30\
+\x2e\x39\x2d\x34\x2e\x36\x2d\x32\x2e\x36\x2d\x36\x2e\x33\x63\x2d\
+\x33\x2e\x34\x2d\x33\x2e\x34\x2d\x39\x2e\x32\x2d\x33\x2e\x34\x2d\
+\x31\x32\x2e\x36\x2c\x30\x4c\x33\x33\x2e\x39\x2c\x35\x34\x2e\x32\
+\x63\x2d\x32\x2e\x38\x2c\x30\x2e\x32\x2d\x35\x2e\x35\x2c\x31\x2e\
+\x33\x2d\x37\x2e\x35\x2c\x33\x2e\x33\x63\x2d\x34\x2e\x32\x2c\x34\
+\x2e\x32\x2d\x34\x2c\x37\x2e\x37\x2d\x33\x2e\x39\x2c\x31\x30\x2e\
+\x36\x0a\x09\x09\x63\x30\x2e\x31\x2c\x32\x2e\x34\x2c\x30\x2e\x32\
+\x2c\x34\x2e\x32\x2d\x32\x2e\x37\x2c\x37\x2e\x32\x6c\x2d\x34\x2e\
+\x33\x2c\x34\x2e\x33\x63\x35\x2e\x34\x2c\x30\x2e\x37\x2c\x36\x2e\
+\x37\x2c\x31\x2c\x39\x2e\x36\x2c\x31\x6c\x30\x2c\x30\x63\x34\x2e\
+\x34\x2c\x30\x2c\x31\x32\x2e\x37\x2d\x30\x2e\x38\x2c\x31\x38\x2e\
+\x31\x2d\x36\x2e\x32\x63\x32\x2e\x31\x2d\x32\x2e\x31\x2c\x33\x2e\
+\x32\x2d\x34\x2e\x37\x2c\x33\x2e\x34\x2d\x37\x2e\x36\x6c\x33\x30\
+\x2e\x32\x2d\x33\x30\x2e\x32\x0a\x09\x09\x43\x37\x38\x2e\x35\x2c\
+\x33\x34\x2e\x37\x2c\x37\x39\x2e\x34\x2c\x33\x32\x2e\x35\x2c\x37\
+\x39\x2e\x34\x2c\x33\x30\x2e\x31\x7a\x20\x4d\x33\x39\x2c\x37\x30\
+\x63\x2d\x33\x2e\x31\x2c\x33\x2e\x31\x2d\x37\x2e\x39\x2c\x34\x2e\
+\x31\x2d\x31\x31\x2e\x35\x2c\x34\x2e\x33\x63\x31\x2e\x31\x2d\x32\
+\x2e\x36\x2c\x31\x2d\x34\x2e\x38\x2c\x30\x2e\x39\x2d\x36\x2e\x37\
+\x63\x2d\x30\x2e\x33\x2d\x35\x2e\x32\x2c\x33\x2e\x32\x2d\x37\x2e\
+\x38\x2c\x36\x2e\x34\x2d\x37\x2e\x38\x0a\x09\x09\x63\x31\x2e\x36\
+\x2c\x30\x2c\x33\x2e\x31\x2c\x30\x2e\x36\x2c\x34\x2e\x32\x2c\x31\
+\x2e\x37\x43\x34\x31\x2e\x33\x2c\x36\x34\x2c\x34\x31\x2e\x33\x2c\
+\x36\x37\x2e\x37\x2c\x33\x39\x2c\x37\x30\x7a\x20\x4d\x37\x32\x2e\
+\x36\x2c\x33\x32\x2e\x32\x4c\x34\x35\x2c\x35\x39\x2e\x38\x63\x2d\
+\x30\x2e\x35\x2d\x30\x2e\x39\x2d\x31\x2e\x31\x2d\x31\x2e\x37\x2d\
+\x31\x2e\x38\x2d\x32\x2e\x34\x73\x2d\x31\x2e\x36\x2d\x31\x2e\x33\
+\x2d\x32\x2e\x34\x2d\x31\x2e\x38\x4c\x36\x38\x2e\x34\x2c\x32\x38\
+\x0a\x09\x09\x63\x31\x2e\x31\x2d\x31\x2e\x31\x2c\x33\x2e\x31\x2d\
+\x31\x2e\x31\x2c\x34\x2e\x32\x2c\x30\x63\x30\x2e\x36\x2c\x30\x2e\
+\x36\x2c\x30\x2e\x39\x2c\x31\x2e\x33\x2c\x30\x2e\x39\x2c\x32\x2e\
+\x31\x43\x37\x33\x2e\x35\x2c\x33\x30\x2e\x39\x2c\x37\x33\x2e\x32\
+\x2c\x33\x31\x2e\x37\x2c\x37\x32\x2e\x36\x2c\x33\x32\x2e\x32\x7a\
+\x22\x2f\x3e\x0a\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\
+\x00\x00\x04\x0a\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x31\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\
+\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x31\x33\
+\x22\x20\x79\x3d\x22\x31\x32\x22\x20\x77\x69\x64\x74\x68\x3d\x22\
+\x31\x36\x2e\x38\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x36\
+\x2e\x38\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x34\
+\x31\x2e\x37\x22\x20\x79\x3d\x22\x31\x32\x22\x20\x77\x69\x64\x74\
+\x68\x3d\x22\x31\x36\x2e\x38\x22\x20\x68\x65\x69\x67\x68\x74\x3d\
+\x22\x31\x36\x2e\x38\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\
+\x3d\x22\x37\x30\x2e\x34\x22\x20\x79\x3d\x22\x31\x32\x22\x20\x77\
+\x69\x64\x74\x68\x3d\x22\x31\x36\x2e\x38\x22\x20\x68\x65\x69\x67\
+\x68\x74\x3d\x22\x31\x36\x2e\x38\x22\x2f\x3e\x0a\x3c\x72\x65\x63\
+\x74\x20\x78\x3d\x22\x31\x33\x22\x20\x79\x3d\x22\x34\x31\x2e\x35\
+\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\x2e\x38\x22\x20\x68\
+\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x2e\x38\x22\x2f\x3e\x0a\x3c\
+\x72\x65\x63\x74\x20\x78\x3d\x22\x34\x31\x2e\x37\x22\x20\x79\x3d\
+\x22\x34\x31\x2e\x35\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\
+\x2e\x38\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x2e\x38\
+\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x37\x30\x2e\
+\x34\x22\x20\x79\x3d\x22\x34\x31\x2e\x35\x22\x20\x77\x69\x64\x74\
+\x68\x3d\x22\x31\x36\x2e\x38\x22\x20\x68\x65\x69\x67\x68\x74\x3d\
+\x22\x31\x36\x2e\x38\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\
+\x3d\x22\x31\x32\x2e\x39\x22\x20\x79\x3d\x22\x37\x31\x22\x20\x77\
+\x69\x64\x74\x68\x3d\x22\x31\x36\x2e\x38\x22\x20\x68\x65\x69\x67\
+\x68\x74\x3d\x22\x31\x36\x2e\x38\x22\x2f\x3e\x0a\x3c\x72\x65\x63\
+\x74\x20\x78\x3d\x22\x34\x31\x2e\x36\x22\x20\x79\x3d\x22\x37\x31\
+\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\x2e\x38\x22\x20\x68\
+\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x2e\x38\x22\x2f\x3e\x0a\x3c\
+\x72\x65\x63\x74\x20\x78\x3d\x22\x37\x30\x2e\x33\x22\x20\x79\x3d\
+\x22\x37\x31\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\x2e\x38\
+\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x2e\x38\x22\x2f\
+\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x02\xe2\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x32\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\
+\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x70\x6f\
+\x69\x6e\x74\x73\x3d\x22\x32\x35\x2e\x34\x2c\x35\x30\x20\x38\x33\
+\x2e\x36\x2c\x39\x37\x2e\x34\x20\x38\x33\x2e\x36\x2c\x32\x2e\x36\
+\x20\x22\x2f\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x31\x33\
+\x2e\x38\x22\x20\x79\x3d\x22\x32\x2e\x36\x22\x20\x74\x72\x61\x6e\
+\x73\x66\x6f\x72\x6d\x3d\x22\x6d\x61\x74\x72\x69\x78\x28\x2d\x31\
+\x20\x2d\x31\x2e\x32\x32\x34\x36\x34\x37\x65\x2d\x31\x36\x20\x31\
+\x2e\x32\x32\x34\x36\x34\x37\x65\x2d\x31\x36\x20\x2d\x31\x20\x34\
+\x30\x2e\x31\x38\x32\x36\x20\x31\x30\x30\x29\x22\x20\x77\x69\x64\
+\x74\x68\x3d\x22\x31\x32\x2e\x35\x22\x20\x68\x65\x69\x67\x68\x74\
+\x3d\x22\x39\x34\x2e\x38\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\
+\x0a\
+\x00\x00\x02\x75\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x34\x2e\x30\x2e\x30\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\
+\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x6f\
+\x6c\x79\x67\x6f\x6e\x20\x70\x6f\x69\x6e\x74\x73\x3d\x22\x35\x30\
+\x2c\x32\x30\x2e\x39\x20\x32\x2e\x36\x2c\x37\x39\x2e\x31\x20\x39\
+\x37\x2e\x34\x2c\x37\x39\x2e\x31\x20\x22\x2f\x3e\x0a\x3c\x2f\x73\
+\x76\x67\x3e\x0a\
+\x00\x00\x04\x5b\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\
+\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x67\x20\
+\x69\x64\x3d\x22\x53\x6f\x6c\x69\x64\x22\x3e\x0a\x09\x3c\x67\x3e\
+\x0a\x09\x09\x3c\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x70\x6f\x69\x6e\
+\x74\x73\x3d\x22\x37\x30\x2e\x37\x2c\x33\x36\x2e\x35\x20\x38\x35\
+\x2e\x33\x2c\x33\x36\x2e\x35\x20\x38\x35\x2e\x33\x2c\x32\x39\x2e\
+\x32\x20\x37\x30\x2e\x37\x2c\x32\x39\x2e\x32\x20\x36\x33\x2e\x35\
+\x2c\x32\x39\x2e\x32\x20\x34\x38\x2e\x39\x2c\x32\x39\x2e\x32\x20\
+\x34\x38\x2e\x39\x2c\x33\x36\x2e\x35\x20\x36\x33\x2e\x35\x2c\x33\
+\x36\x2e\x35\x20\x09\x09\x22\x2f\x3e\x0a\x09\x3c\x2f\x67\x3e\x0a\
+\x3c\x2f\x67\x3e\x0a\x3c\x67\x20\x69\x64\x3d\x22\x4f\x75\x74\x6c\
+\x69\x6e\x65\x22\x3e\x0a\x09\x3c\x67\x3e\x0a\x09\x09\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x33\x35\x2e\x34\x2c\x38\x35\x2e\x39\
+\x63\x2d\x30\x2e\x39\x2c\x30\x2d\x31\x2e\x38\x2d\x30\x2e\x36\x2d\
+\x32\x2e\x32\x2d\x31\x2e\x35\x4c\x31\x36\x2e\x38\x2c\x34\x34\x2e\
+\x35\x63\x2d\x30\x2e\x34\x2d\x30\x2e\x39\x2d\x30\x2e\x32\x2d\x31\
+\x2e\x39\x2c\x30\x2e\x35\x2d\x32\x2e\x36\x63\x30\x2e\x37\x2d\x30\
+\x2e\x37\x2c\x31\x2e\x37\x2d\x30\x2e\x39\x2c\x32\x2e\x36\x2d\x30\
+\x2e\x35\x6c\x33\x39\x2e\x39\x2c\x31\x36\x2e\x34\x0a\x09\x09\x09\
+\x63\x30\x2e\x39\x2c\x30\x2e\x34\x2c\x31\x2e\x35\x2c\x31\x2e\x33\
+\x2c\x31\x2e\x34\x2c\x32\x2e\x33\x73\x2d\x30\x2e\x38\x2c\x31\x2e\
+\x39\x2d\x31\x2e\x38\x2c\x32\x2e\x31\x4c\x34\x32\x2c\x36\x36\x2e\
+\x36\x4c\x33\x37\x2e\x36\x2c\x38\x34\x63\x2d\x30\x2e\x32\x2c\x31\
+\x2d\x31\x2e\x31\x2c\x31\x2e\x37\x2d\x32\x2e\x31\x2c\x31\x2e\x38\
+\x43\x33\x35\x2e\x35\x2c\x38\x35\x2e\x39\x2c\x33\x35\x2e\x35\x2c\
+\x38\x35\x2e\x39\x2c\x33\x35\x2e\x34\x2c\x38\x35\x2e\x39\x7a\x20\
+\x4d\x32\x33\x2e\x33\x2c\x34\x37\x2e\x39\x0a\x09\x09\x09\x4c\x33\
+\x34\x2e\x39\x2c\x37\x36\x6c\x33\x2d\x31\x31\x2e\x39\x63\x30\x2e\
+\x32\x2d\x30\x2e\x38\x2c\x30\x2e\x39\x2d\x31\x2e\x35\x2c\x31\x2e\
+\x37\x2d\x31\x2e\x37\x6c\x31\x31\x2e\x39\x2d\x33\x4c\x32\x33\x2e\
+\x33\x2c\x34\x37\x2e\x39\x7a\x22\x2f\x3e\x0a\x09\x3c\x2f\x67\x3e\
+\x0a\x3c\x2f\x67\x3e\x0a\x3c\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x70\
+\x6f\x69\x6e\x74\x73\x3d\x22\x32\x31\x2e\x37\x2c\x34\x36\x2e\x36\
+\x20\x33\x34\x2e\x35\x2c\x37\x38\x2e\x33\x20\x33\x39\x2e\x33\x2c\
+\x36\x35\x2e\x37\x20\x35\x33\x2e\x39\x2c\x35\x39\x2e\x35\x20\x22\
+\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x03\xd8\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\
+\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x33\x32\x2e\x34\x2c\x35\x33\x2e\x35\
+\x48\x32\x33\x63\x2d\x32\x2e\x38\x2c\x30\x2d\x35\x2d\x32\x2e\x32\
+\x2d\x35\x2d\x35\x56\x32\x33\x63\x30\x2d\x32\x2e\x38\x2c\x32\x2e\
+\x32\x2d\x35\x2c\x35\x2d\x35\x68\x32\x35\x2e\x35\x63\x32\x2e\x38\
+\x2c\x30\x2c\x35\x2c\x32\x2e\x32\x2c\x35\x2c\x35\x76\x31\x30\x2e\
+\x33\x68\x2d\x36\x56\x32\x34\x48\x32\x34\x76\x32\x33\x2e\x35\x68\
+\x38\x2e\x34\x56\x35\x33\x2e\x35\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x37\x35\x2e\x37\x2c\x38\x31\x2e\x33\
+\x48\x35\x30\x2e\x31\x63\x2d\x32\x2e\x38\x2c\x30\x2d\x35\x2d\x32\
+\x2e\x32\x2d\x35\x2d\x35\x56\x36\x35\x2e\x32\x68\x36\x76\x31\x30\
+\x2e\x31\x68\x32\x33\x2e\x36\x56\x35\x31\x2e\x38\x68\x2d\x39\x2e\
+\x35\x76\x2d\x36\x68\x31\x30\x2e\x35\x63\x32\x2e\x38\x2c\x30\x2c\
+\x35\x2c\x32\x2e\x32\x2c\x35\x2c\x35\x76\x32\x35\x2e\x35\x43\x38\
+\x30\x2e\x37\x2c\x37\x39\x2e\x31\x2c\x37\x38\x2e\x35\x2c\x38\x31\
+\x2e\x33\x2c\x37\x35\x2e\x37\x2c\x38\x31\x2e\x33\x7a\x0a\x09\x22\
+\x2f\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x36\x31\x2e\
+\x38\x2c\x36\x37\x2e\x34\x48\x33\x36\x2e\x33\x63\x2d\x32\x2e\x38\
+\x2c\x30\x2d\x35\x2d\x32\x2e\x32\x2d\x35\x2d\x35\x56\x33\x36\x2e\
+\x39\x63\x30\x2d\x32\x2e\x38\x2c\x32\x2e\x32\x2d\x35\x2c\x35\x2d\
+\x35\x68\x32\x35\x2e\x35\x63\x32\x2e\x38\x2c\x30\x2c\x35\x2c\x32\
+\x2e\x32\x2c\x35\x2c\x35\x76\x32\x35\x2e\x35\x43\x36\x36\x2e\x38\
+\x2c\x36\x35\x2e\x32\x2c\x36\x34\x2e\x36\x2c\x36\x37\x2e\x34\x2c\
+\x36\x31\x2e\x38\x2c\x36\x37\x2e\x34\x7a\x0a\x09\x20\x4d\x33\x37\
+\x2e\x33\x2c\x36\x31\x2e\x34\x68\x32\x33\x2e\x35\x56\x33\x37\x2e\
+\x39\x48\x33\x37\x2e\x33\x56\x36\x31\x2e\x34\x7a\x22\x2f\x3e\x0a\
+\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x03\xca\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\
+\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x67\x20\x69\x64\x3d\x22\x4f\x75\x74\x6c\
+\x69\x6e\x65\x22\x3e\x0a\x09\x3c\x67\x3e\x0a\x09\x09\x3c\x70\x61\
+\x74\x68\x20\x64\x3d\x22\x4d\x34\x37\x2e\x32\x2c\x38\x36\x2e\x39\
+\x63\x2d\x31\x2e\x34\x2c\x30\x2d\x32\x2e\x37\x2d\x30\x2e\x39\x2d\
+\x33\x2e\x33\x2d\x32\x2e\x32\x6c\x2d\x32\x35\x2d\x36\x30\x2e\x36\
+\x63\x2d\x30\x2e\x36\x2d\x31\x2e\x33\x2d\x30\x2e\x32\x2d\x32\x2e\
+\x39\x2c\x30\x2e\x38\x2d\x33\x2e\x39\x73\x32\x2e\x35\x2d\x31\x2e\
+\x33\x2c\x33\x2e\x39\x2d\x30\x2e\x38\x6c\x36\x30\x2e\x36\x2c\x32\
+\x35\x63\x31\x2e\x34\x2c\x30\x2e\x36\x2c\x32\x2e\x33\x2c\x32\x2c\
+\x32\x2e\x32\x2c\x33\x2e\x36\x0a\x09\x09\x09\x63\x2d\x30\x2e\x31\
+\x2c\x31\x2e\x35\x2d\x31\x2e\x32\x2c\x32\x2e\x38\x2d\x32\x2e\x37\
+\x2c\x33\x2e\x32\x6c\x2d\x32\x36\x2e\x34\x2c\x36\x2e\x36\x6c\x2d\
+\x36\x2e\x36\x2c\x32\x36\x2e\x34\x63\x2d\x30\x2e\x34\x2c\x31\x2e\
+\x35\x2d\x31\x2e\x37\x2c\x32\x2e\x36\x2d\x33\x2e\x32\x2c\x32\x2e\
+\x37\x43\x34\x37\x2e\x33\x2c\x38\x36\x2e\x39\x2c\x34\x37\x2e\x32\
+\x2c\x38\x36\x2e\x39\x2c\x34\x37\x2e\x32\x2c\x38\x36\x2e\x39\x7a\
+\x20\x4d\x32\x38\x2e\x37\x2c\x32\x39\x2e\x33\x4c\x34\x36\x2e\x33\
+\x2c\x37\x32\x0a\x09\x09\x09\x6c\x34\x2e\x35\x2d\x31\x38\x63\x30\
+\x2e\x33\x2d\x31\x2e\x33\x2c\x31\x2e\x33\x2d\x32\x2e\x33\x2c\x32\
+\x2e\x36\x2d\x32\x2e\x36\x6c\x31\x38\x2d\x34\x2e\x35\x4c\x32\x38\
+\x2e\x37\x2c\x32\x39\x2e\x33\x7a\x22\x2f\x3e\x0a\x09\x3c\x2f\x67\
+\x3e\x0a\x3c\x2f\x67\x3e\x0a\x3c\x70\x6f\x6c\x79\x67\x6f\x6e\x20\
+\x70\x6f\x69\x6e\x74\x73\x3d\x22\x32\x36\x2e\x33\x2c\x32\x37\x2e\
+\x32\x20\x34\x35\x2e\x37\x2c\x37\x35\x2e\x34\x20\x35\x33\x2c\x35\
+\x36\x2e\x32\x20\x37\x35\x2e\x32\x2c\x34\x36\x2e\x38\x20\x22\x2f\
+\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x04\x73\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x32\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x34\x34\x30\x20\x34\x34\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x34\x34\x30\x20\
+\x34\x34\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\
+\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x33\
+\x37\x33\x2e\x31\x2c\x33\x34\x34\x2e\x34\x56\x32\x37\x33\x63\x2d\
+\x33\x31\x2d\x32\x37\x2e\x34\x2d\x35\x30\x2e\x33\x2d\x34\x34\x2e\
+\x35\x2d\x35\x38\x2d\x35\x31\x2e\x33\x63\x2d\x37\x2e\x35\x2d\x36\
+\x2e\x36\x2d\x31\x38\x2e\x31\x2d\x36\x2d\x32\x34\x2e\x39\x2c\x31\
+\x2e\x34\x63\x2d\x31\x33\x2e\x33\x2c\x31\x34\x2e\x34\x2d\x34\x37\
+\x2c\x35\x31\x2e\x31\x2d\x36\x31\x2e\x37\x2c\x36\x37\x2e\x31\x0a\
+\x09\x63\x2d\x32\x2e\x36\x2c\x32\x2e\x38\x2d\x36\x2e\x37\x2c\x33\
+\x2d\x39\x2e\x35\x2c\x30\x2e\x33\x63\x2d\x37\x2d\x36\x2e\x38\x2d\
+\x31\x37\x2e\x34\x2d\x31\x36\x2e\x39\x2d\x32\x32\x2e\x39\x2d\x32\
+\x32\x2e\x33\x63\x2d\x36\x2e\x38\x2d\x36\x2e\x36\x2d\x31\x37\x2d\
+\x36\x2e\x34\x2d\x32\x33\x2e\x35\x2c\x30\x2e\x36\x63\x2d\x31\x30\
+\x2e\x34\x2c\x31\x31\x2e\x31\x2d\x33\x36\x2e\x33\x2c\x33\x38\x2e\
+\x38\x2d\x37\x37\x2e\x39\x2c\x38\x33\x2e\x31\x4c\x33\x37\x33\x2e\
+\x31\x2c\x33\x34\x34\x2e\x34\x7a\x22\x2f\x3e\x0a\x3c\x70\x61\x74\
+\x68\x20\x64\x3d\x22\x4d\x33\x35\x38\x2e\x34\x2c\x37\x37\x2e\x38\
+\x48\x38\x31\x2e\x36\x63\x2d\x31\x37\x2c\x30\x2d\x33\x30\x2e\x38\
+\x2c\x31\x33\x2e\x38\x2d\x33\x30\x2e\x38\x2c\x33\x30\x2e\x38\x76\
+\x32\x32\x32\x2e\x39\x63\x30\x2c\x31\x37\x2c\x31\x33\x2e\x38\x2c\
+\x33\x30\x2e\x38\x2c\x33\x30\x2e\x38\x2c\x33\x30\x2e\x38\x68\x32\
+\x37\x36\x2e\x39\x63\x31\x37\x2c\x30\x2c\x33\x30\x2e\x38\x2d\x31\
+\x33\x2e\x38\x2c\x33\x30\x2e\x38\x2d\x33\x30\x2e\x38\x56\x31\x30\
+\x38\x2e\x36\x0a\x09\x43\x33\x38\x39\x2e\x32\x2c\x39\x31\x2e\x36\
+\x2c\x33\x37\x35\x2e\x35\x2c\x37\x37\x2e\x38\x2c\x33\x35\x38\x2e\
+\x34\x2c\x37\x37\x2e\x38\x7a\x20\x4d\x33\x36\x35\x2e\x36\x2c\x33\
+\x32\x31\x2e\x32\x63\x30\x2c\x31\x31\x2e\x31\x2d\x39\x2c\x32\x30\
+\x2e\x31\x2d\x32\x30\x2e\x31\x2c\x32\x30\x2e\x31\x48\x39\x34\x2e\
+\x38\x63\x2d\x31\x31\x2e\x31\x2c\x30\x2d\x32\x30\x2e\x31\x2d\x39\
+\x2d\x32\x30\x2e\x31\x2d\x32\x30\x2e\x31\x76\x2d\x32\x30\x32\x0a\
+\x09\x63\x30\x2d\x31\x31\x2e\x31\x2c\x39\x2d\x32\x30\x2e\x31\x2c\
+\x32\x30\x2e\x31\x2d\x32\x30\x2e\x31\x68\x32\x35\x30\x2e\x37\x63\
+\x31\x31\x2e\x31\x2c\x30\x2c\x32\x30\x2e\x31\x2c\x39\x2c\x32\x30\
+\x2e\x31\x2c\x32\x30\x2e\x31\x56\x33\x32\x31\x2e\x32\x7a\x22\x2f\
+\x3e\x0a\x3c\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x31\x35\
+\x37\x2e\x31\x22\x20\x63\x79\x3d\x22\x31\x36\x34\x2e\x32\x22\x20\
+\x72\x3d\x22\x33\x30\x2e\x34\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\
+\x3e\x0a\
+\x00\x00\x03\x97\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\x35\x3b\
+\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\
+\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\
+\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\
+\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x67\x20\
+\x69\x64\x3d\x22\x4f\x75\x74\x6c\x69\x6e\x65\x22\x3e\x0a\x09\x3c\
+\x67\x3e\x0a\x09\x09\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x34\
+\x37\x2e\x32\x2c\x38\x36\x2e\x39\x63\x2d\x31\x2e\x34\x2c\x30\x2d\
+\x32\x2e\x37\x2d\x30\x2e\x39\x2d\x33\x2e\x33\x2d\x32\x2e\x32\x6c\
+\x2d\x32\x35\x2d\x36\x30\x2e\x36\x63\x2d\x30\x2e\x36\x2d\x31\x2e\
+\x33\x2d\x30\x2e\x32\x2d\x32\x2e\x39\x2c\x30\x2e\x38\x2d\x33\x2e\
+\x39\x73\x32\x2e\x35\x2d\x31\x2e\x33\x2c\x33\x2e\x39\x2d\x30\x2e\
+\x38\x6c\x36\x30\x2e\x36\x2c\x32\x35\x63\x31\x2e\x34\x2c\x30\x2e\
+\x36\x2c\x32\x2e\x33\x2c\x32\x2c\x32\x2e\x32\x2c\x33\x2e\x36\x0a\
+\x09\x09\x09\x63\x2d\x30\x2e\x31\x2c\x31\x2e\x35\x2d\x31\x2e\x32\
+\x2c\x32\x2e\x38\x2d\x32\x2e\x37\x2c\x33\x2e\x32\x6c\x2d\x32\x36\
+\x2e\x34\x2c\x36\x2e\x36\x6c\x2d\x36\x2e\x36\x2c\x32\x36\x2e\x34\
+\x63\x2d\x30\x2e\x34\x2c\x31\x2e\x35\x2d\x31\x2e\x37\x2c\x32\x2e\
+\x36\x2d\x33\x2e\x32\x2c\x32\x2e\x37\x43\x34\x37\x2e\x33\x2c\x38\
+\x36\x2e\x39\x2c\x34\x37\x2e\x32\x2c\x38\x36\x2e\x39\x2c\x34\x37\
+\x2e\x32\x2c\x38\x36\x2e\x39\x7a\x20\x4d\x32\x38\x2e\x37\x2c\x32\
+\x39\x2e\x33\x4c\x34\x36\x2e\x33\x2c\x37\x32\x0a\x09\x09\x09\x6c\
+\x34\x2e\x35\x2d\x31\x38\x63\x30\x2e\x33\x2d\x31\x2e\x33\x2c\x31\
+\x2e\x33\x2d\x32\x2e\x33\x2c\x32\x2e\x36\x2d\x32\x2e\x36\x6c\x31\
+\x38\x2d\x34\x2e\x35\x4c\x32\x38\x2e\x37\x2c\x32\x39\x2e\x33\x7a\
+\x22\x2f\x3e\x0a\x09\x3c\x2f\x67\x3e\x0a\x3c\x2f\x67\x3e\x0a\x3c\
+\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x02\xa9\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x32\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x37\x37\x2e\x36\x20\x39\x34\x2e\x38\x22\x20\x73\x74\
+\x79\x6c\x65\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\
+\x67\x72\x6f\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\
+\x37\x37\x2e\x36\x20\x39\x34\x2e\x38\x3b\x22\x20\x78\x6d\x6c\x3a\
+\x73\x70\x61\x63\x65\x3d\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\
+\x3e\x3c\x73\x74\x79\x6c\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\
+\x78\x74\x2f\x63\x73\x73\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\
+\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\
+\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\
+\x3a\x20\x31\x3b\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\
+\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\
+\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\
+\x3a\x20\x31\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\
+\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\
+\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\
+\x20\x31\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\
+\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x3c\x70\x6f\x6c\x79\
+\x67\x6f\x6e\x20\x70\x6f\x69\x6e\x74\x73\x3d\x22\x31\x37\x37\x2e\
+\x36\x2c\x34\x37\x2e\x34\x20\x31\x31\x39\x2e\x34\x2c\x30\x20\x31\
+\x31\x39\x2e\x34\x2c\x39\x34\x2e\x38\x20\x22\x2f\x3e\x0a\x3c\x72\
+\x65\x63\x74\x20\x78\x3d\x22\x30\x2e\x35\x22\x20\x79\x3d\x22\x33\
+\x31\x2e\x32\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x31\x39\x22\
+\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x33\x32\x2e\x34\x22\x2f\x3e\
+\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x01\xb1\
+\x3c\
+\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\x31\
+\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\x72\x5f\x31\x22\x20\x0a\
+\x20\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x0a\x20\x20\x20\x20\x78\x6d\x6c\x6e\
+\x73\x3a\x78\x6c\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\
+\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\
+\x78\x6c\x69\x6e\x6b\x22\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\
+\x30\x20\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x3e\x3c\x73\x74\
+\x79\x6c\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\
+\x73\x73\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\
+\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\
+\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x30\x2e\
+\x35\x3b\x7d\x0a\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\
+\x6c\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\
+\x20\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\
+\x30\x2e\x35\x3b\x7d\x0a\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\
+\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\
+\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\
+\x20\x30\x2e\x35\x3b\x7d\x0a\x72\x65\x63\x74\x20\x7b\x66\x69\x6c\
+\x6c\x3a\x20\x72\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\
+\x20\x32\x31\x32\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\
+\x30\x2e\x35\x3b\x7d\x0a\x3c\x2f\x73\x74\x79\x6c\x65\x3e\x0a\x20\
+\x20\x20\x20\x3c\x67\x3e\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x3c\
+\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x35\x30\x22\x20\x63\
+\x79\x3d\x22\x35\x30\x22\x20\x72\x3d\x22\x35\x30\x22\x2f\x3e\x0a\
+\x20\x20\x20\x20\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\
+\x00\x00\x02\x71\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\
+\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x33\x2e\
+\x34\x22\x20\x79\x3d\x22\x34\x30\x2e\x36\x22\x20\x77\x69\x64\x74\
+\x68\x3d\x22\x39\x32\x2e\x39\x22\x20\x68\x65\x69\x67\x68\x74\x3d\
+\x22\x31\x38\x2e\x36\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\
+\x00\x00\x05\xd1\
+\x3c\
+\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
+\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x75\x74\x66\
+\x2d\x38\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x47\x65\x6e\x65\x72\
+\x61\x74\x6f\x72\x3a\x20\x41\x64\x6f\x62\x65\x20\x49\x6c\x6c\x75\
+\x73\x74\x72\x61\x74\x6f\x72\x20\x32\x33\x2e\x30\x2e\x31\x2c\x20\
+\x53\x56\x47\x20\x45\x78\x70\x6f\x72\x74\x20\x50\x6c\x75\x67\x2d\
+\x49\x6e\x20\x2e\x20\x53\x56\x47\x20\x56\x65\x72\x73\x69\x6f\x6e\
+\x3a\x20\x36\x2e\x30\x30\x20\x42\x75\x69\x6c\x64\x20\x30\x29\x20\
+\x20\x2d\x2d\x3e\x0a\x3c\x73\x76\x67\x20\x76\x65\x72\x73\x69\x6f\
+\x6e\x3d\x22\x31\x2e\x31\x22\x20\x69\x64\x3d\x22\x4c\x61\x79\x65\
+\x72\x5f\x31\x22\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\
+\x30\x30\x2f\x73\x76\x67\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6c\
+\x69\x6e\x6b\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\
+\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\x39\x2f\x78\x6c\x69\x6e\
+\x6b\x22\x20\x78\x3d\x22\x30\x70\x78\x22\x20\x79\x3d\x22\x30\x70\
+\x78\x22\x0a\x09\x20\x76\x69\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\
+\x30\x20\x31\x30\x30\x20\x31\x30\x30\x22\x20\x73\x74\x79\x6c\x65\
+\x3d\x22\x65\x6e\x61\x62\x6c\x65\x2d\x62\x61\x63\x6b\x67\x72\x6f\
+\x75\x6e\x64\x3a\x6e\x65\x77\x20\x30\x20\x30\x20\x31\x30\x30\x20\
+\x31\x30\x30\x3b\x22\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\
+\x22\x70\x72\x65\x73\x65\x72\x76\x65\x22\x3e\x3c\x73\x74\x79\x6c\
+\x65\x20\x74\x79\x70\x65\x3d\x22\x74\x65\x78\x74\x2f\x63\x73\x73\
+\x22\x3e\x0a\x70\x61\x74\x68\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x70\x6f\x6c\x79\x67\x6f\x6e\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\
+\x67\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\
+\x29\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\
+\x63\x69\x72\x63\x6c\x65\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\
+\x62\x28\x32\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\
+\x3b\x20\x6f\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x72\
+\x65\x63\x74\x20\x7b\x66\x69\x6c\x6c\x3a\x20\x72\x67\x62\x28\x32\
+\x30\x39\x2c\x20\x32\x31\x30\x2c\x20\x32\x31\x32\x29\x3b\x20\x6f\
+\x70\x61\x63\x69\x74\x79\x3a\x20\x31\x3b\x7d\x0a\x3c\x2f\x73\x74\
+\x79\x6c\x65\x3e\x0a\x3c\x67\x20\x69\x64\x3d\x22\x53\x6f\x6c\x69\
+\x64\x5f\x31\x5f\x22\x3e\x0a\x09\x3c\x70\x61\x74\x68\x20\x64\x3d\
+\x22\x4d\x37\x32\x2e\x39\x2c\x36\x31\x2e\x31\x56\x33\x37\x2e\x33\
+\x63\x33\x2e\x33\x2d\x31\x2e\x32\x2c\x35\x2e\x37\x2d\x34\x2e\x33\
+\x2c\x35\x2e\x37\x2d\x38\x63\x30\x2d\x34\x2e\x37\x2d\x33\x2e\x38\
+\x2d\x38\x2e\x35\x2d\x38\x2e\x35\x2d\x38\x2e\x35\x63\x2d\x33\x2e\
+\x37\x2c\x30\x2d\x36\x2e\x38\x2c\x32\x2e\x34\x2d\x38\x2c\x35\x2e\
+\x37\x48\x33\x38\x2e\x32\x63\x2d\x31\x2e\x32\x2d\x33\x2e\x33\x2d\
+\x34\x2e\x33\x2d\x35\x2e\x37\x2d\x38\x2d\x35\x2e\x37\x0a\x09\x09\
+\x63\x2d\x34\x2e\x37\x2c\x30\x2d\x38\x2e\x35\x2c\x33\x2e\x38\x2d\
+\x38\x2e\x35\x2c\x38\x2e\x35\x63\x30\x2c\x33\x2e\x37\x2c\x32\x2e\
+\x34\x2c\x36\x2e\x38\x2c\x35\x2e\x37\x2c\x38\x76\x32\x33\x2e\x38\
+\x63\x2d\x33\x2e\x33\x2c\x31\x2e\x32\x2d\x35\x2e\x37\x2c\x34\x2e\
+\x33\x2d\x35\x2e\x37\x2c\x38\x63\x30\x2c\x34\x2e\x37\x2c\x33\x2e\
+\x38\x2c\x38\x2e\x35\x2c\x38\x2e\x35\x2c\x38\x2e\x35\x63\x33\x2e\
+\x37\x2c\x30\x2c\x36\x2e\x38\x2d\x32\x2e\x34\x2c\x38\x2d\x35\x2e\
+\x37\x48\x36\x32\x0a\x09\x09\x63\x31\x2e\x32\x2c\x33\x2e\x33\x2c\
+\x34\x2e\x33\x2c\x35\x2e\x37\x2c\x38\x2c\x35\x2e\x37\x63\x34\x2e\
+\x37\x2c\x30\x2c\x38\x2e\x35\x2d\x33\x2e\x38\x2c\x38\x2e\x35\x2d\
+\x38\x2e\x35\x43\x37\x38\x2e\x36\x2c\x36\x35\x2e\x34\x2c\x37\x36\
+\x2e\x32\x2c\x36\x32\x2e\x32\x2c\x37\x32\x2e\x39\x2c\x36\x31\x2e\
+\x31\x7a\x20\x4d\x37\x30\x2e\x31\x2c\x32\x36\x2e\x34\x63\x31\x2e\
+\x36\x2c\x30\x2c\x32\x2e\x38\x2c\x31\x2e\x33\x2c\x32\x2e\x38\x2c\
+\x32\x2e\x38\x0a\x09\x09\x63\x30\x2c\x31\x2e\x36\x2d\x31\x2e\x33\
+\x2c\x32\x2e\x38\x2d\x32\x2e\x38\x2c\x32\x2e\x38\x63\x2d\x31\x2e\
+\x36\x2c\x30\x2d\x32\x2e\x38\x2d\x31\x2e\x33\x2d\x32\x2e\x38\x2d\
+\x32\x2e\x38\x43\x36\x37\x2e\x32\x2c\x32\x37\x2e\x37\x2c\x36\x38\
+\x2e\x35\x2c\x32\x36\x2e\x34\x2c\x37\x30\x2e\x31\x2c\x32\x36\x2e\
+\x34\x7a\x20\x4d\x33\x30\x2e\x32\x2c\x32\x36\x2e\x34\x63\x31\x2e\
+\x36\x2c\x30\x2c\x32\x2e\x38\x2c\x31\x2e\x33\x2c\x32\x2e\x38\x2c\
+\x32\x2e\x38\x0a\x09\x09\x63\x30\x2c\x31\x2e\x36\x2d\x31\x2e\x33\
+\x2c\x32\x2e\x38\x2d\x32\x2e\x38\x2c\x32\x2e\x38\x63\x2d\x31\x2e\
+\x36\x2c\x30\x2d\x32\x2e\x38\x2d\x31\x2e\x33\x2d\x32\x2e\x38\x2d\
+\x32\x2e\x38\x43\x32\x37\x2e\x34\x2c\x32\x37\x2e\x37\x2c\x32\x38\
+\x2e\x37\x2c\x32\x36\x2e\x34\x2c\x33\x30\x2e\x32\x2c\x32\x36\x2e\
+\x34\x7a\x20\x4d\x33\x30\x2e\x32\x2c\x37\x31\x2e\x39\x63\x2d\x31\
+\x2e\x36\x2c\x30\x2d\x32\x2e\x38\x2d\x31\x2e\x33\x2d\x32\x2e\x38\
+\x2d\x32\x2e\x38\x0a\x09\x09\x63\x30\x2d\x31\x2e\x36\x2c\x31\x2e\
+\x33\x2d\x32\x2e\x38\x2c\x32\x2e\x38\x2d\x32\x2e\x38\x63\x31\x2e\
+\x36\x2c\x30\x2c\x32\x2e\x38\x2c\x31\x2e\x33\x2c\x32\x2e\x38\x2c\
+\x32\x2e\x38\x43\x33\x33\x2e\x31\x2c\x37\x30\x2e\x36\x2c\x33\x31\
+\x2e\x38\x2c\x37\x31\x2e\x39\x2c\x33\x30\x2e\x32\x2c\x37\x31\x2e\
+\x39\x7a\x20\x4d\x36\x32\x2e\x31\x2c\x36\x36\x2e\x32\x48\x33\x38\
+\x2e\x32\x63\x2d\x30\x2e\x39\x2d\x32\x2e\x34\x2d\x32\x2e\x38\x2d\
+\x34\x2e\x33\x2d\x35\x2e\x32\x2d\x35\x2e\x32\x56\x33\x37\x2e\x33\
+\x0a\x09\x09\x63\x32\x2e\x34\x2d\x30\x2e\x39\x2c\x34\x2e\x33\x2d\
+\x32\x2e\x38\x2c\x35\x2e\x32\x2d\x35\x2e\x32\x48\x36\x32\x63\x30\
+\x2e\x39\x2c\x32\x2e\x34\x2c\x32\x2e\x38\x2c\x34\x2e\x33\x2c\x35\
+\x2e\x32\x2c\x35\x2e\x32\x76\x32\x33\x2e\x38\x43\x36\x34\x2e\x38\
+\x2c\x36\x31\x2e\x39\x2c\x36\x32\x2e\x39\x2c\x36\x33\x2e\x38\x2c\
+\x36\x32\x2e\x31\x2c\x36\x36\x2e\x32\x7a\x20\x4d\x37\x30\x2e\x31\
+\x2c\x37\x31\x2e\x39\x63\x2d\x31\x2e\x36\x2c\x30\x2d\x32\x2e\x38\
+\x2d\x31\x2e\x33\x2d\x32\x2e\x38\x2d\x32\x2e\x38\x0a\x09\x09\x63\
+\x30\x2d\x31\x2e\x36\x2c\x31\x2e\x33\x2d\x32\x2e\x38\x2c\x32\x2e\
+\x38\x2d\x32\x2e\x38\x63\x31\x2e\x36\x2c\x30\x2c\x32\x2e\x38\x2c\
+\x31\x2e\x33\x2c\x32\x2e\x38\x2c\x32\x2e\x38\x53\x37\x31\x2e\x36\
+\x2c\x37\x31\x2e\x39\x2c\x37\x30\x2e\x31\x2c\x37\x31\x2e\x39\x7a\
+\x22\x2f\x3e\x0a\x3c\x2f\x67\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
+\
+"
+
+qt_resource_name = b"\
+\x00\x06\
+\x07\xae\xc3\xc3\
+\x00\x74\
+\x00\x68\x00\x65\x00\x6d\x00\x65\x00\x73\
+\x00\x04\
+\x00\x06\xa8\x8b\
+\x00\x64\
+\x00\x61\x00\x72\x00\x6b\
+\x00\x05\
+\x00\x72\xfd\xf4\
+\x00\x6c\
+\x00\x69\x00\x67\x00\x68\x00\x74\
+\x00\x0c\
+\x0f\xbe\x2e\xe7\
+\x00\x63\
+\x00\x68\x00\x65\x00\x63\x00\x6b\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x09\
+\x08\x98\x83\xc7\
+\x00\x65\
+\x00\x72\x00\x61\x00\x73\x00\x65\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0e\
+\x01\x87\x5d\xe7\
+\x00\x76\
+\x00\x69\x00\x73\x00\x69\x00\x62\x00\x69\x00\x6c\x00\x69\x00\x74\x00\x79\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x08\
+\x04\xd2\x54\xc7\
+\x00\x69\
+\x00\x6e\x00\x66\x00\x6f\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0e\
+\x03\xa9\x4c\x07\
+\x00\x77\
+\x00\x61\x00\x72\x00\x6e\x00\x69\x00\x6e\x00\x67\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x13\
+\x04\xb5\x7e\x27\
+\x00\x64\
+\x00\x65\x00\x6c\x00\x65\x00\x74\x00\x65\x00\x5f\x00\x73\x00\x68\x00\x61\x00\x70\x00\x65\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\
+\x00\x76\x00\x67\
+\x00\x0a\
+\x0a\x2d\x1b\xc7\
+\x00\x63\
+\x00\x69\x00\x72\x00\x63\x00\x6c\x00\x65\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x10\
+\x09\xd3\x6b\xa7\
+\x00\x74\
+\x00\x72\x00\x61\x00\x6e\x00\x73\x00\x70\x00\x6f\x00\x73\x00\x65\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0d\
+\x01\x88\xef\xc7\
+\x00\x74\
+\x00\x72\x00\x61\x00\x6e\x00\x73\x00\x70\x00\x6f\x00\x73\x00\x65\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x13\
+\x03\x51\xb0\xc7\
+\x00\x6c\
+\x00\x6f\x00\x6e\x00\x67\x00\x5f\x00\x6c\x00\x65\x00\x66\x00\x74\x00\x5f\x00\x61\x00\x72\x00\x72\x00\x6f\x00\x77\x00\x2e\x00\x73\
+\x00\x76\x00\x67\
+\x00\x11\
+\x01\xe4\x36\xe7\
+\x00\x63\
+\x00\x68\x00\x65\x00\x76\x00\x72\x00\x6f\x00\x6e\x00\x5f\x00\x75\x00\x70\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\x00\x76\x00\x67\
+\
+\x00\x09\
+\x02\x83\x37\x87\
+\x00\x32\
+\x00\x44\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x09\
+\x0b\x9e\x89\x07\
+\x00\x63\
+\x00\x68\x00\x65\x00\x63\x00\x6b\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x13\
+\x0e\x83\xd4\xa7\
+\x00\x6c\
+\x00\x6f\x00\x67\x00\x6f\x00\x5f\x00\x73\x00\x69\x00\x6c\x00\x68\x00\x6f\x00\x75\x00\x65\x00\x74\x00\x74\x00\x65\x00\x2e\x00\x73\
+\x00\x76\x00\x67\
+\x00\x13\
+\x05\x86\x98\x07\
+\x00\x63\
+\x00\x68\x00\x65\x00\x76\x00\x72\x00\x6f\x00\x6e\x00\x5f\x00\x64\x00\x6f\x00\x77\x00\x6e\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\
+\x00\x76\x00\x67\
+\x00\x0b\
+\x02\x63\xc0\x67\
+\x00\x69\
+\x00\x6e\x00\x66\x00\x6f\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0b\
+\x06\xf4\x91\x87\
+\x00\x63\
+\x00\x6f\x00\x6e\x00\x73\x00\x6f\x00\x6c\x00\x65\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0e\
+\x05\x9a\x08\xe7\
+\x00\x6e\
+\x00\x65\x00\x77\x00\x5f\x00\x6c\x00\x61\x00\x62\x00\x65\x00\x6c\x00\x73\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x18\
+\x07\xce\x3c\xa7\
+\x00\x63\
+\x00\x6f\x00\x70\x00\x79\x00\x5f\x00\x74\x00\x6f\x00\x5f\x00\x63\x00\x6c\x00\x69\x00\x70\x00\x62\x00\x6f\x00\x61\x00\x72\x00\x64\
+\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x06\
+\x03\x77\x5a\xc7\
+\x00\x33\
+\x00\x44\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x08\
+\x00\x2f\x57\x67\
+\x00\x66\
+\x00\x69\x00\x6c\x00\x6c\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0e\
+\x04\xe3\xb2\xa7\
+\x00\x65\
+\x00\x6c\x00\x6c\x00\x69\x00\x70\x00\x73\x00\x65\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0d\
+\x02\x0d\x90\x07\
+\x00\x64\
+\x00\x72\x00\x6f\x00\x70\x00\x5f\x00\x64\x00\x6f\x00\x77\x00\x6e\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0a\
+\x0c\xad\x02\x87\
+\x00\x64\
+\x00\x65\x00\x6c\x00\x65\x00\x74\x00\x65\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x11\
+\x00\x80\xb6\x47\
+\x00\x6e\
+\x00\x65\x00\x77\x00\x5f\x00\x73\x00\x68\x00\x61\x00\x70\x00\x65\x00\x73\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\x00\x76\x00\x67\
+\
+\x00\x11\
+\x08\x3d\xce\x67\
+\x00\x64\
+\x00\x6f\x00\x77\x00\x6e\x00\x5f\x00\x61\x00\x72\x00\x72\x00\x6f\x00\x77\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\x00\x76\x00\x67\
+\
+\x00\x11\
+\x02\xf1\x6a\xc7\
+\x00\x76\
+\x00\x69\x00\x73\x00\x69\x00\x62\x00\x69\x00\x6c\x00\x69\x00\x74\x00\x79\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\x00\x76\x00\x67\
+\
+\x00\x0a\
+\x0b\xa8\x62\x87\
+\x00\x73\
+\x00\x65\x00\x6c\x00\x65\x00\x63\x00\x74\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0b\
+\x0e\xcf\x9d\x27\
+\x00\x70\
+\x00\x6f\x00\x6c\x00\x79\x00\x67\x00\x6f\x00\x6e\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0e\
+\x0e\xfc\x83\x07\
+\x00\x70\
+\x00\x6f\x00\x6c\x00\x79\x00\x67\x00\x6f\x00\x6e\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0d\
+\x0f\x77\x63\x87\
+\x00\x70\
+\x00\x69\x00\x63\x00\x6b\x00\x65\x00\x72\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0e\
+\x0b\xc1\xfc\xe7\
+\x00\x6d\
+\x00\x6f\x00\x76\x00\x65\x00\x5f\x00\x66\x00\x72\x00\x6f\x00\x6e\x00\x74\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0e\
+\x04\xa2\xf1\x27\
+\x00\x64\
+\x00\x6f\x00\x77\x00\x6e\x00\x5f\x00\x61\x00\x72\x00\x72\x00\x6f\x00\x77\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x11\
+\x0e\x7a\x6d\xe7\
+\x00\x76\
+\x00\x65\x00\x72\x00\x74\x00\x65\x00\x78\x00\x5f\x00\x72\x00\x65\x00\x6d\x00\x6f\x00\x76\x00\x65\x00\x2e\x00\x73\x00\x76\x00\x67\
+\
+\x00\x0b\
+\x02\x5d\x9d\xa7\
+\x00\x68\
+\x00\x6f\x00\x6d\x00\x65\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x08\
+\x06\x2f\x55\xe7\
+\x00\x72\
+\x00\x6f\x00\x6c\x00\x6c\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0e\
+\x0c\x1a\xad\xe7\
+\x00\x6e\
+\x00\x65\x00\x77\x00\x5f\x00\x70\x00\x6f\x00\x69\x00\x6e\x00\x74\x00\x73\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x07\
+\x07\xa7\x5a\x07\
+\x00\x61\
+\x00\x64\x00\x64\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x10\
+\x01\x2c\x39\xa7\
+\x00\x64\
+\x00\x65\x00\x6c\x00\x65\x00\x74\x00\x65\x00\x5f\x00\x73\x00\x68\x00\x61\x00\x70\x00\x65\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x10\
+\x04\x2e\xb5\xc7\
+\x00\x6d\
+\x00\x6f\x00\x76\x00\x65\x00\x5f\x00\x62\x00\x61\x00\x63\x00\x6b\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0f\
+\x0c\x4e\xfc\x87\
+\x00\x6e\
+\x00\x65\x00\x77\x00\x5f\x00\x76\x00\x65\x00\x63\x00\x74\x00\x6f\x00\x72\x00\x73\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x16\
+\x0a\x64\x8b\x47\
+\x00\x6c\
+\x00\x6f\x00\x67\x00\x6f\x00\x5f\x00\x73\x00\x69\x00\x6c\x00\x68\x00\x6f\x00\x75\x00\x65\x00\x74\x00\x74\x00\x65\x00\x5f\x00\x35\
+\x00\x30\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0e\
+\x08\x7b\x95\x87\
+\x00\x73\
+\x00\x74\x00\x65\x00\x70\x00\x5f\x00\x72\x00\x69\x00\x67\x00\x68\x00\x74\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0b\
+\x06\x29\x96\x07\
+\x00\x70\
+\x00\x6f\x00\x70\x00\x5f\x00\x6f\x00\x75\x00\x74\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0e\
+\x0f\x6b\x7a\xe7\
+\x00\x6e\
+\x00\x65\x00\x77\x00\x5f\x00\x73\x00\x68\x00\x61\x00\x70\x00\x65\x00\x73\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x13\
+\x05\xf5\x44\xc7\
+\x00\x63\
+\x00\x68\x00\x65\x00\x76\x00\x72\x00\x6f\x00\x6e\x00\x5f\x00\x6c\x00\x65\x00\x66\x00\x74\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\
+\x00\x76\x00\x67\
+\x00\x0b\
+\x02\x5e\x45\x87\
+\x00\x67\
+\x00\x72\x00\x69\x00\x64\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x12\
+\x07\xaf\x09\xc7\
+\x00\x72\
+\x00\x69\x00\x67\x00\x68\x00\x74\x00\x5f\x00\x61\x00\x72\x00\x72\x00\x6f\x00\x77\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\x00\x76\
+\x00\x67\
+\x00\x11\
+\x07\xa1\xe8\x67\
+\x00\x6e\
+\x00\x65\x00\x77\x00\x5f\x00\x6c\x00\x61\x00\x62\x00\x65\x00\x6c\x00\x73\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\x00\x76\x00\x67\
+\
+\x00\x0c\
+\x0c\x03\xe3\xe7\
+\x00\x6d\
+\x00\x69\x00\x6e\x00\x75\x00\x73\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x08\
+\x00\x48\x54\xa7\
+\x00\x6c\
+\x00\x69\x00\x6e\x00\x65\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0d\
+\x07\x94\x4a\x47\
+\x00\x73\
+\x00\x71\x00\x75\x00\x61\x00\x72\x00\x65\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0f\
+\x02\x9f\x08\x07\
+\x00\x72\
+\x00\x69\x00\x67\x00\x68\x00\x74\x00\x5f\x00\x61\x00\x72\x00\x72\x00\x6f\x00\x77\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x08\
+\x06\x38\x57\x27\
+\x00\x68\
+\x00\x6f\x00\x6d\x00\x65\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0e\
+\x0e\x4f\x9f\xc7\
+\x00\x70\
+\x00\x6f\x00\x70\x00\x5f\x00\x6f\x00\x75\x00\x74\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0e\
+\x0d\xfa\xe1\xc7\
+\x00\x73\
+\x00\x68\x00\x75\x00\x66\x00\x66\x00\x6c\x00\x65\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0e\
+\x0e\x37\x85\x27\
+\x00\x63\
+\x00\x6f\x00\x6e\x00\x73\x00\x6f\x00\x6c\x00\x65\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0c\
+\x0f\x12\x49\xa7\
+\x00\x65\
+\x00\x72\x00\x61\x00\x73\x00\x65\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0c\
+\x0c\x53\x51\x87\
+\x00\x70\
+\x00\x61\x00\x69\x00\x6e\x00\x74\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x11\
+\x0e\x76\x54\x07\
+\x00\x73\
+\x00\x74\x00\x65\x00\x70\x00\x5f\x00\x72\x00\x69\x00\x67\x00\x68\x00\x74\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\x00\x76\x00\x67\
+\
+\x00\x10\
+\x07\x94\xb1\x07\
+\x00\x72\
+\x00\x65\x00\x63\x00\x74\x00\x61\x00\x6e\x00\x67\x00\x6c\x00\x65\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x10\
+\x0e\x2f\x18\xc7\
+\x00\x64\
+\x00\x72\x00\x6f\x00\x70\x00\x5f\x00\x64\x00\x6f\x00\x77\x00\x6e\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0b\
+\x02\x71\x9c\x87\
+\x00\x72\
+\x00\x6f\x00\x6c\x00\x6c\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0c\
+\x06\xe6\xeb\xe7\
+\x00\x75\
+\x00\x70\x00\x5f\x00\x61\x00\x72\x00\x72\x00\x6f\x00\x77\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x06\
+\x03\x67\x5a\xc7\
+\x00\x32\
+\x00\x44\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0b\
+\x02\x65\x53\xa7\
+\x00\x6c\
+\x00\x69\x00\x6e\x00\x65\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x08\
+\x06\x60\x4a\xe7\
+\x00\x7a\
+\x00\x6f\x00\x6f\x00\x6d\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0f\
+\x0d\x44\x18\x67\
+\x00\x6e\
+\x00\x65\x00\x77\x00\x5f\x00\x73\x00\x75\x00\x72\x00\x66\x00\x61\x00\x63\x00\x65\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0b\
+\x07\x50\x3c\xc7\
+\x00\x65\
+\x00\x6c\x00\x6c\x00\x69\x00\x70\x00\x73\x00\x65\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x12\
+\x06\xa8\xf3\x27\
+\x00\x6e\
+\x00\x65\x00\x77\x00\x5f\x00\x73\x00\x75\x00\x72\x00\x66\x00\x61\x00\x63\x00\x65\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\x00\x76\
+\x00\x67\
+\x00\x0b\
+\x02\x6e\x4f\x07\
+\x00\x70\
+\x00\x61\x00\x74\x00\x68\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x08\
+\x03\xc6\x54\x27\
+\x00\x70\
+\x00\x6c\x00\x75\x00\x73\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0e\
+\x0b\x58\x6c\xa7\
+\x00\x63\
+\x00\x68\x00\x65\x00\x76\x00\x72\x00\x6f\x00\x6e\x00\x5f\x00\x75\x00\x70\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0d\
+\x0f\x47\x30\x07\
+\x00\x6d\
+\x00\x6f\x00\x76\x00\x65\x00\x5f\x00\x62\x00\x61\x00\x63\x00\x6b\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x10\
+\x0e\x98\x92\xe7\
+\x00\x6e\
+\x00\x65\x00\x77\x00\x5f\x00\x69\x00\x6d\x00\x61\x00\x67\x00\x65\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0b\
+\x02\x59\x5c\x87\
+\x00\x66\
+\x00\x69\x00\x6c\x00\x6c\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0b\
+\x02\x6d\x23\xe7\
+\x00\x70\
+\x00\x6c\x00\x75\x00\x73\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x11\
+\x0d\xf0\xd8\x67\
+\x00\x6e\
+\x00\x65\x00\x77\x00\x5f\x00\x70\x00\x6f\x00\x69\x00\x6e\x00\x74\x00\x73\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\x00\x76\x00\x67\
+\
+\x00\x16\
+\x0c\x23\x33\x87\
+\x00\x6c\
+\x00\x6f\x00\x6e\x00\x67\x00\x5f\x00\x6c\x00\x65\x00\x66\x00\x74\x00\x5f\x00\x61\x00\x72\x00\x72\x00\x6f\x00\x77\x00\x5f\x00\x35\
+\x00\x30\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x10\
+\x0e\x58\x8a\x87\
+\x00\x73\
+\x00\x74\x00\x65\x00\x70\x00\x5f\x00\x6c\x00\x65\x00\x66\x00\x74\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0b\
+\x0d\xd7\xad\x47\
+\x00\x73\
+\x00\x68\x00\x75\x00\x66\x00\x66\x00\x6c\x00\x65\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0a\
+\x02\x8f\xaf\x87\
+\x00\x61\
+\x00\x64\x00\x64\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x10\
+\x00\xe1\x2d\xa7\
+\x00\x63\
+\x00\x68\x00\x65\x00\x76\x00\x72\x00\x6f\x00\x6e\x00\x5f\x00\x6c\x00\x65\x00\x66\x00\x74\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x12\
+\x02\xea\x5a\x07\
+\x00\x76\
+\x00\x69\x00\x73\x00\x69\x00\x62\x00\x69\x00\x6c\x00\x69\x00\x74\x00\x79\x00\x5f\x00\x6f\x00\x66\x00\x66\x00\x2e\x00\x73\x00\x76\
+\x00\x67\
+\x00\x17\
+\x00\x34\x2e\x47\
+\x00\x6c\
+\x00\x6f\x00\x6e\x00\x67\x00\x5f\x00\x72\x00\x69\x00\x67\x00\x68\x00\x74\x00\x5f\x00\x61\x00\x72\x00\x72\x00\x6f\x00\x77\x00\x5f\
+\x00\x35\x00\x30\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x11\
+\x08\x5a\x81\xe7\
+\x00\x6c\
+\x00\x65\x00\x66\x00\x74\x00\x5f\x00\x61\x00\x72\x00\x72\x00\x6f\x00\x77\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\x00\x76\x00\x67\
+\
+\x00\x0d\
+\x07\x06\xce\x07\
+\x00\x64\
+\x00\x65\x00\x6c\x00\x65\x00\x74\x00\x65\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0b\
+\x00\xb5\x48\x67\
+\x00\x77\
+\x00\x61\x00\x72\x00\x6e\x00\x69\x00\x6e\x00\x67\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x12\
+\x08\xe6\xd2\xe7\
+\x00\x6e\
+\x00\x65\x00\x77\x00\x5f\x00\x76\x00\x65\x00\x63\x00\x74\x00\x6f\x00\x72\x00\x73\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\x00\x76\
+\x00\x67\
+\x00\x0b\
+\x03\x81\x96\xa7\
+\x00\x7a\
+\x00\x6f\x00\x6f\x00\x6d\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x09\
+\x02\x83\x35\x87\
+\x00\x33\
+\x00\x44\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0a\
+\x01\xcb\x85\x87\
+\x00\x70\
+\x00\x69\x00\x63\x00\x6b\x00\x65\x00\x72\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x11\
+\x04\x2e\x77\x47\
+\x00\x76\
+\x00\x65\x00\x72\x00\x74\x00\x65\x00\x78\x00\x5f\x00\x69\x00\x6e\x00\x73\x00\x65\x00\x72\x00\x74\x00\x2e\x00\x73\x00\x76\x00\x67\
+\
+\x00\x0d\
+\x04\x92\x2e\x27\
+\x00\x64\
+\x00\x69\x00\x72\x00\x65\x00\x63\x00\x74\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x15\
+\x0b\x3e\x0e\x07\
+\x00\x63\
+\x00\x6f\x00\x70\x00\x79\x00\x5f\x00\x74\x00\x6f\x00\x5f\x00\x63\x00\x6c\x00\x69\x00\x70\x00\x62\x00\x6f\x00\x61\x00\x72\x00\x64\
+\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x10\
+\x0e\x17\x2a\x87\
+\x00\x63\
+\x00\x68\x00\x65\x00\x76\x00\x72\x00\x6f\x00\x6e\x00\x5f\x00\x64\x00\x6f\x00\x77\x00\x6e\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x15\
+\x02\x8f\x07\xa7\
+\x00\x76\
+\x00\x69\x00\x73\x00\x69\x00\x62\x00\x69\x00\x6c\x00\x69\x00\x74\x00\x79\x00\x5f\x00\x6f\x00\x66\x00\x66\x00\x5f\x00\x35\x00\x30\
+\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0a\
+\x08\x8b\x0b\xa7\
+\x00\x73\
+\x00\x71\x00\x75\x00\x61\x00\x72\x00\x65\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x08\
+\x08\xab\x54\x07\
+\x00\x70\
+\x00\x61\x00\x74\x00\x68\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x14\
+\x00\x5b\xde\xa7\
+\x00\x76\
+\x00\x65\x00\x72\x00\x74\x00\x65\x00\x78\x00\x5f\x00\x69\x00\x6e\x00\x73\x00\x65\x00\x72\x00\x74\x00\x5f\x00\x35\x00\x30\x00\x2e\
+\x00\x73\x00\x76\x00\x67\
+\x00\x0e\
+\x0e\xde\xf7\x47\
+\x00\x6c\
+\x00\x65\x00\x66\x00\x74\x00\x5f\x00\x61\x00\x72\x00\x72\x00\x6f\x00\x77\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x09\
+\x00\x57\xb7\xc7\
+\x00\x70\
+\x00\x61\x00\x69\x00\x6e\x00\x74\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x08\
+\x08\xf7\x57\x07\
+\x00\x67\
+\x00\x72\x00\x69\x00\x64\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0d\
+\x0e\x8f\x97\x67\
+\x00\x73\
+\x00\x74\x00\x65\x00\x70\x00\x5f\x00\x6c\x00\x65\x00\x66\x00\x74\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0f\
+\x09\x91\x86\xe7\
+\x00\x75\
+\x00\x70\x00\x5f\x00\x61\x00\x72\x00\x72\x00\x6f\x00\x77\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x14\
+\x01\xf0\x94\x67\
+\x00\x76\
+\x00\x65\x00\x72\x00\x74\x00\x65\x00\x78\x00\x5f\x00\x72\x00\x65\x00\x6d\x00\x6f\x00\x76\x00\x65\x00\x5f\x00\x35\x00\x30\x00\x2e\
+\x00\x73\x00\x76\x00\x67\
+\x00\x11\
+\x08\xe0\x20\xc7\
+\x00\x6d\
+\x00\x6f\x00\x76\x00\x65\x00\x5f\x00\x66\x00\x72\x00\x6f\x00\x6e\x00\x74\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\x00\x76\x00\x67\
+\
+\x00\x0a\
+\x0b\xaa\x3b\xc7\
+\x00\x64\
+\x00\x69\x00\x72\x00\x65\x00\x63\x00\x74\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0d\
+\x0e\x4e\x9b\x67\
+\x00\x6e\
+\x00\x65\x00\x77\x00\x5f\x00\x69\x00\x6d\x00\x61\x00\x67\x00\x65\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0d\
+\x01\x06\x2f\xe7\
+\x00\x73\
+\x00\x65\x00\x6c\x00\x65\x00\x63\x00\x74\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x14\
+\x0b\xa3\x71\xa7\
+\x00\x6c\
+\x00\x6f\x00\x6e\x00\x67\x00\x5f\x00\x72\x00\x69\x00\x67\x00\x68\x00\x74\x00\x5f\x00\x61\x00\x72\x00\x72\x00\x6f\x00\x77\x00\x2e\
+\x00\x73\x00\x76\x00\x67\
+\x00\x0d\
+\x06\x92\x1e\x07\
+\x00\x63\
+\x00\x69\x00\x72\x00\x63\x00\x6c\x00\x65\x00\x5f\x00\x35\x00\x30\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x09\
+\x05\xc6\xb2\xc7\
+\x00\x6d\
+\x00\x69\x00\x6e\x00\x75\x00\x73\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0d\
+\x0f\x55\x0b\xa7\
+\x00\x72\
+\x00\x65\x00\x63\x00\x74\x00\x61\x00\x6e\x00\x67\x00\x6c\x00\x65\x00\x2e\x00\x73\x00\x76\x00\x67\
+"
+
+qt_resource_struct_v1 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x02\
+\x00\x00\x00\x12\x00\x02\x00\x00\x00\x72\x00\x00\x00\x76\
+\x00\x00\x00\x20\x00\x02\x00\x00\x00\x72\x00\x00\x00\x04\
+\x00\x00\x02\xca\x00\x00\x00\x00\x00\x01\x00\x00\x42\x8c\
+\x00\x00\x0b\x00\x00\x00\x00\x00\x00\x01\x00\x01\x3c\x06\
+\x00\x00\x06\xba\x00\x00\x00\x00\x00\x01\x00\x00\xbd\xcc\
+\x00\x00\x0d\x5e\x00\x00\x00\x00\x00\x01\x00\x01\x82\xeb\
+\x00\x00\x0d\x0e\x00\x00\x00\x00\x00\x01\x00\x01\x7b\xf3\
+\x00\x00\x03\x3c\x00\x00\x00\x00\x00\x01\x00\x00\x52\x5b\
+\x00\x00\x0b\x7c\x00\x00\x00\x00\x00\x01\x00\x01\x44\xe9\
+\x00\x00\x0a\xb0\x00\x00\x00\x00\x00\x01\x00\x01\x34\x8c\
+\x00\x00\x0e\x60\x00\x00\x00\x00\x00\x01\x00\x01\xa1\x5d\
+\x00\x00\x05\x00\x00\x00\x00\x00\x00\x01\x00\x00\x8f\x42\
+\x00\x00\x00\x66\x00\x00\x00\x00\x00\x01\x00\x00\x04\x6a\
+\x00\x00\x01\x2c\x00\x00\x00\x00\x00\x01\x00\x00\x15\xf6\
+\x00\x00\x0b\xf6\x00\x00\x00\x00\x00\x01\x00\x01\x56\x70\
+\x00\x00\x01\x78\x00\x00\x00\x00\x00\x01\x00\x00\x1c\x62\
+\x00\x00\x0d\xd0\x00\x00\x00\x00\x00\x01\x00\x01\x90\xdd\
+\x00\x00\x03\x02\x00\x00\x00\x00\x00\x01\x00\x00\x4c\x3d\
+\x00\x00\x09\xc2\x00\x00\x00\x00\x00\x01\x00\x01\x1d\x42\
+\x00\x00\x04\x98\x00\x00\x00\x00\x00\x01\x00\x00\x7d\xaf\
+\x00\x00\x06\x2e\x00\x00\x00\x00\x00\x01\x00\x00\xb1\x23\
+\x00\x00\x02\x28\x00\x00\x00\x00\x00\x01\x00\x00\x30\x62\
+\x00\x00\x08\x8c\x00\x00\x00\x00\x00\x01\x00\x00\xf4\x8b\
+\x00\x00\x09\xde\x00\x00\x00\x00\x00\x01\x00\x01\x20\xb4\
+\x00\x00\x09\x28\x00\x00\x00\x00\x00\x01\x00\x01\x08\x0b\
+\x00\x00\x08\x40\x00\x00\x00\x00\x00\x01\x00\x00\xe8\x5f\
+\x00\x00\x0b\xde\x00\x00\x00\x00\x00\x01\x00\x01\x51\xf0\
+\x00\x00\x01\xa0\x00\x00\x00\x00\x00\x01\x00\x00\x1f\xf1\
+\x00\x00\x0c\xae\x00\x00\x00\x00\x00\x01\x00\x01\x6f\x49\
+\x00\x00\x0a\x96\x00\x00\x00\x00\x00\x01\x00\x01\x30\x97\
+\x00\x00\x06\xf0\x00\x00\x00\x00\x00\x01\x00\x00\xc4\x53\
+\x00\x00\x0a\xd6\x00\x00\x00\x00\x00\x01\x00\x01\x38\x15\
+\x00\x00\x03\x8c\x00\x00\x00\x00\x00\x01\x00\x00\x57\x5a\
+\x00\x00\x01\x4c\x00\x00\x00\x00\x00\x01\x00\x00\x19\x75\
+\x00\x00\x08\x7a\x00\x00\x00\x00\x00\x01\x00\x00\xf1\x92\
+\x00\x00\x02\xb8\x00\x00\x00\x00\x00\x01\x00\x00\x3e\x14\
+\x00\x00\x0b\xc2\x00\x00\x00\x00\x00\x01\x00\x01\x4e\x30\
+\x00\x00\x00\x9e\x00\x00\x00\x00\x00\x01\x00\x00\x0a\xa5\
+\x00\x00\x09\x44\x00\x00\x00\x00\x00\x01\x00\x01\x0e\x4e\
+\x00\x00\x0c\x10\x00\x00\x00\x00\x00\x01\x00\x01\x60\x47\
+\x00\x00\x05\x26\x00\x00\x00\x00\x00\x01\x00\x00\x92\x6a\
+\x00\x00\x0c\x38\x00\x00\x00\x00\x00\x01\x00\x01\x64\xc6\
+\x00\x00\x04\x4e\x00\x00\x00\x00\x00\x01\x00\x00\x76\xe7\
+\x00\x00\x00\xc0\x00\x00\x00\x00\x00\x01\x00\x00\x0d\x92\
+\x00\x00\x00\x88\x00\x00\x00\x00\x00\x01\x00\x00\x07\xe9\
+\x00\x00\x02\xe0\x00\x00\x00\x00\x00\x01\x00\x00\x45\xf6\
+\x00\x00\x01\xfc\x00\x00\x00\x00\x00\x01\x00\x00\x2c\xd1\
+\x00\x00\x02\x60\x00\x00\x00\x00\x00\x01\x00\x00\x37\x53\
+\x00\x00\x0e\xce\x00\x00\x00\x00\x00\x01\x00\x01\xa9\x5a\
+\x00\x00\x06\x02\x00\x00\x00\x00\x00\x01\x00\x00\xad\x92\
+\x00\x00\x05\xc4\x00\x00\x00\x00\x00\x01\x00\x00\xa7\x91\
+\x00\x00\x04\xb4\x00\x00\x00\x00\x00\x01\x00\x00\x81\x78\
+\x00\x00\x07\x14\x00\x00\x00\x00\x00\x01\x00\x00\xc6\xc4\
+\x00\x00\x08\xa8\x00\x00\x00\x00\x00\x01\x00\x00\xf8\x9c\
+\x00\x00\x0e\xae\x00\x00\x00\x00\x00\x01\x00\x01\xa7\xa5\
+\x00\x00\x08\xfe\x00\x00\x00\x00\x00\x01\x00\x01\x05\x4b\
+\x00\x00\x08\x5c\x00\x00\x00\x00\x00\x01\x00\x00\xef\x21\
+\x00\x00\x02\x44\x00\x00\x00\x00\x00\x01\x00\x00\x33\x26\
+\x00\x00\x0b\x5c\x00\x00\x00\x00\x00\x01\x00\x01\x41\x34\
+\x00\x00\x08\xe2\x00\x00\x00\x00\x00\x01\x00\x00\xff\x0c\
+\x00\x00\x06\xd0\x00\x00\x00\x00\x00\x01\x00\x00\xc1\xd5\
+\x00\x00\x07\xf4\x00\x00\x00\x00\x00\x01\x00\x00\xe0\x09\
+\x00\x00\x06\x74\x00\x00\x00\x00\x00\x01\x00\x00\xb7\xb2\
+\x00\x00\x04\xec\x00\x00\x00\x00\x00\x01\x00\x00\x8b\x55\
+\x00\x00\x06\x4a\x00\x00\x00\x00\x00\x01\x00\x00\xb5\x39\
+\x00\x00\x02\x82\x00\x00\x00\x00\x00\x01\x00\x00\x3a\xe8\
+\x00\x00\x03\x64\x00\x00\x00\x00\x00\x01\x00\x00\x54\xe1\
+\x00\x00\x0b\x34\x00\x00\x00\x00\x00\x01\x00\x01\x3e\xbb\
+\x00\x00\x05\xa2\x00\x00\x00\x00\x00\x01\x00\x00\xa4\xf0\
+\x00\x00\x0c\xde\x00\x00\x00\x00\x00\x01\x00\x01\x73\x42\
+\x00\x00\x00\x4e\x00\x00\x00\x00\x00\x01\x00\x00\x01\xc8\
+\x00\x00\x0c\xf8\x00\x00\x00\x00\x00\x01\x00\x01\x75\xb8\
+\x00\x00\x0d\xfe\x00\x00\x00\x00\x00\x01\x00\x01\x95\x3c\
+\x00\x00\x0b\x98\x00\x00\x00\x00\x00\x01\x00\x01\x47\xce\
+\x00\x00\x0d\x76\x00\x00\x00\x00\x00\x01\x00\x01\x87\x70\
+\x00\x00\x0d\xac\x00\x00\x00\x00\x00\x01\x00\x01\x8e\x64\
+\x00\x00\x01\x06\x00\x00\x00\x00\x00\x01\x00\x00\x12\x6f\
+\x00\x00\x00\xec\x00\x00\x00\x00\x00\x01\x00\x00\x10\xc2\
+\x00\x00\x05\x70\x00\x00\x00\x00\x00\x01\x00\x00\x9c\xc9\
+\x00\x00\x0c\x58\x00\x00\x00\x00\x00\x01\x00\x01\x68\x9c\
+\x00\x00\x09\x5a\x00\x00\x00\x00\x00\x01\x00\x01\x11\x3f\
+\x00\x00\x01\xb8\x00\x00\x00\x00\x00\x01\x00\x00\x22\xf2\
+\x00\x00\x0e\x80\x00\x00\x00\x00\x00\x01\x00\x01\xa4\xf8\
+\x00\x00\x03\xb4\x00\x00\x00\x00\x00\x01\x00\x00\x5a\xe1\
+\x00\x00\x0e\x26\x00\x00\x00\x00\x00\x01\x00\x01\x99\x18\
+\x00\x00\x04\x2c\x00\x00\x00\x00\x00\x01\x00\x00\x73\x13\
+\x00\x00\x06\x9c\x00\x00\x00\x00\x00\x01\x00\x00\xbb\x4f\
+\x00\x00\x04\xca\x00\x00\x00\x00\x00\x01\x00\x00\x88\x32\
+\x00\x00\x0a\x22\x00\x00\x00\x00\x00\x01\x00\x01\x26\xd8\
+\x00\x00\x05\x4c\x00\x00\x00\x00\x00\x01\x00\x00\x96\x6f\
+\x00\x00\x07\xae\x00\x00\x00\x00\x00\x01\x00\x00\xd8\xd3\
+\x00\x00\x03\x22\x00\x00\x00\x00\x00\x01\x00\x00\x4e\xae\
+\x00\x00\x08\xbe\x00\x00\x00\x00\x00\x01\x00\x00\xfc\x54\
+\x00\x00\x0a\x7a\x00\x00\x00\x00\x00\x01\x00\x01\x2c\xbb\
+\x00\x00\x09\xfa\x00\x00\x00\x00\x00\x01\x00\x01\x23\xad\
+\x00\x00\x07\x4c\x00\x00\x00\x00\x00\x01\x00\x00\xce\x10\
+\x00\x00\x0c\x88\x00\x00\x00\x00\x00\x01\x00\x01\x6b\xc0\
+\x00\x00\x08\x1a\x00\x00\x00\x00\x00\x01\x00\x00\xe5\xe6\
+\x00\x00\x07\x6e\x00\x00\x00\x00\x00\x01\x00\x00\xd1\xf4\
+\x00\x00\x0e\x40\x00\x00\x00\x00\x00\x01\x00\x01\x9c\xe6\
+\x00\x00\x07\x2a\x00\x00\x00\x00\x00\x01\x00\x00\xca\x85\
+\x00\x00\x0a\x54\x00\x00\x00\x00\x00\x01\x00\x01\x29\xcd\
+\x00\x00\x07\xcc\x00\x00\x00\x00\x00\x01\x00\x00\xdd\x60\
+\x00\x00\x04\x70\x00\x00\x00\x00\x00\x01\x00\x00\x79\x58\
+\x00\x00\x01\xd0\x00\x00\x00\x00\x00\x01\x00\x00\x24\xb2\
+\x00\x00\x0d\x8c\x00\x00\x00\x00\x00\x01\x00\x01\x8b\x7e\
+\x00\x00\x09\x9c\x00\x00\x00\x00\x00\x01\x00\x01\x18\xc3\
+\x00\x00\x03\xce\x00\x00\x00\x00\x00\x01\x00\x00\x5e\x74\
+\x00\x00\x0d\x3c\x00\x00\x00\x00\x00\x01\x00\x01\x80\x7a\
+\x00\x00\x03\xea\x00\x00\x00\x00\x00\x01\x00\x00\x63\xd0\
+\x00\x00\x07\x90\x00\x00\x00\x00\x00\x01\x00\x00\xd6\x29\
+\x00\x00\x09\x7c\x00\x00\x00\x00\x00\x01\x00\x01\x14\xc6\
+\x00\x00\x0e\xe6\x00\x00\x00\x00\x00\x01\x00\x01\xab\xcf\
+\x00\x00\x05\xe0\x00\x00\x00\x00\x00\x01\x00\x00\xab\x14\
+\x00\x00\x04\x0c\x00\x00\x00\x00\x00\x01\x00\x00\x69\x34\
+\x00\x00\x00\x30\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x02\xca\x00\x00\x00\x00\x00\x01\x00\x01\xf4\x24\
+\x00\x00\x0b\x00\x00\x00\x00\x00\x00\x01\x00\x02\xed\x92\
+\x00\x00\x06\xba\x00\x00\x00\x00\x00\x01\x00\x02\x6f\x58\
+\x00\x00\x0d\x5e\x00\x00\x00\x00\x00\x01\x00\x03\x34\x77\
+\x00\x00\x0d\x0e\x00\x00\x00\x00\x00\x01\x00\x03\x2d\x7f\
+\x00\x00\x03\x3c\x00\x00\x00\x00\x00\x01\x00\x02\x03\xf3\
+\x00\x00\x0b\x7c\x00\x00\x00\x00\x00\x01\x00\x02\xf6\x75\
+\x00\x00\x0a\xb0\x00\x00\x00\x00\x00\x01\x00\x02\xe6\x18\
+\x00\x00\x0e\x60\x00\x00\x00\x00\x00\x01\x00\x03\x52\xe9\
+\x00\x00\x05\x00\x00\x00\x00\x00\x00\x01\x00\x02\x40\xda\
+\x00\x00\x00\x66\x00\x00\x00\x00\x00\x01\x00\x01\xb6\x0e\
+\x00\x00\x01\x2c\x00\x00\x00\x00\x00\x01\x00\x01\xc7\x9a\
+\x00\x00\x0b\xf6\x00\x00\x00\x00\x00\x01\x00\x03\x07\xfc\
+\x00\x00\x01\x78\x00\x00\x00\x00\x00\x01\x00\x01\xce\x06\
+\x00\x00\x0d\xd0\x00\x00\x00\x00\x00\x01\x00\x03\x42\x69\
+\x00\x00\x03\x02\x00\x00\x00\x00\x00\x01\x00\x01\xfd\xd5\
+\x00\x00\x09\xc2\x00\x00\x00\x00\x00\x01\x00\x02\xce\xce\
+\x00\x00\x04\x98\x00\x00\x00\x00\x00\x01\x00\x02\x2f\x47\
+\x00\x00\x06\x2e\x00\x00\x00\x00\x00\x01\x00\x02\x62\xaf\
+\x00\x00\x02\x28\x00\x00\x00\x00\x00\x01\x00\x01\xe1\xfa\
+\x00\x00\x08\x8c\x00\x00\x00\x00\x00\x01\x00\x02\xa6\x17\
+\x00\x00\x09\xde\x00\x00\x00\x00\x00\x01\x00\x02\xd2\x40\
+\x00\x00\x09\x28\x00\x00\x00\x00\x00\x01\x00\x02\xb9\x97\
+\x00\x00\x08\x40\x00\x00\x00\x00\x00\x01\x00\x02\x99\xeb\
+\x00\x00\x0b\xde\x00\x00\x00\x00\x00\x01\x00\x03\x03\x7c\
+\x00\x00\x01\xa0\x00\x00\x00\x00\x00\x01\x00\x01\xd1\x95\
+\x00\x00\x0c\xae\x00\x00\x00\x00\x00\x01\x00\x03\x20\xd5\
+\x00\x00\x0a\x96\x00\x00\x00\x00\x00\x01\x00\x02\xe2\x23\
+\x00\x00\x06\xf0\x00\x00\x00\x00\x00\x01\x00\x02\x75\xdf\
+\x00\x00\x0a\xd6\x00\x00\x00\x00\x00\x01\x00\x02\xe9\xa1\
+\x00\x00\x03\x8c\x00\x00\x00\x00\x00\x01\x00\x02\x08\xf2\
+\x00\x00\x01\x4c\x00\x00\x00\x00\x00\x01\x00\x01\xcb\x19\
+\x00\x00\x08\x7a\x00\x00\x00\x00\x00\x01\x00\x02\xa3\x1e\
+\x00\x00\x02\xb8\x00\x00\x00\x00\x00\x01\x00\x01\xef\xac\
+\x00\x00\x0b\xc2\x00\x00\x00\x00\x00\x01\x00\x02\xff\xbc\
+\x00\x00\x00\x9e\x00\x00\x00\x00\x00\x01\x00\x01\xbc\x49\
+\x00\x00\x09\x44\x00\x00\x00\x00\x00\x01\x00\x02\xbf\xda\
+\x00\x00\x0c\x10\x00\x00\x00\x00\x00\x01\x00\x03\x11\xd3\
+\x00\x00\x05\x26\x00\x00\x00\x00\x00\x01\x00\x02\x44\x02\
+\x00\x00\x0c\x38\x00\x00\x00\x00\x00\x01\x00\x03\x16\x52\
+\x00\x00\x04\x4e\x00\x00\x00\x00\x00\x01\x00\x02\x28\x7f\
+\x00\x00\x00\xc0\x00\x00\x00\x00\x00\x01\x00\x01\xbf\x36\
+\x00\x00\x00\x88\x00\x00\x00\x00\x00\x01\x00\x01\xb9\x8d\
+\x00\x00\x02\xe0\x00\x00\x00\x00\x00\x01\x00\x01\xf7\x8e\
+\x00\x00\x01\xfc\x00\x00\x00\x00\x00\x01\x00\x01\xde\x69\
+\x00\x00\x02\x60\x00\x00\x00\x00\x00\x01\x00\x01\xe8\xeb\
+\x00\x00\x0e\xce\x00\x00\x00\x00\x00\x01\x00\x03\x5a\xe6\
+\x00\x00\x06\x02\x00\x00\x00\x00\x00\x01\x00\x02\x5f\x1e\
+\x00\x00\x05\xc4\x00\x00\x00\x00\x00\x01\x00\x02\x59\x1d\
+\x00\x00\x04\xb4\x00\x00\x00\x00\x00\x01\x00\x02\x33\x10\
+\x00\x00\x07\x14\x00\x00\x00\x00\x00\x01\x00\x02\x78\x50\
+\x00\x00\x08\xa8\x00\x00\x00\x00\x00\x01\x00\x02\xaa\x28\
+\x00\x00\x0e\xae\x00\x00\x00\x00\x00\x01\x00\x03\x59\x31\
+\x00\x00\x08\xfe\x00\x00\x00\x00\x00\x01\x00\x02\xb6\xd7\
+\x00\x00\x08\x5c\x00\x00\x00\x00\x00\x01\x00\x02\xa0\xad\
+\x00\x00\x02\x44\x00\x00\x00\x00\x00\x01\x00\x01\xe4\xbe\
+\x00\x00\x0b\x5c\x00\x00\x00\x00\x00\x01\x00\x02\xf2\xc0\
+\x00\x00\x08\xe2\x00\x00\x00\x00\x00\x01\x00\x02\xb0\x98\
+\x00\x00\x06\xd0\x00\x00\x00\x00\x00\x01\x00\x02\x73\x61\
+\x00\x00\x07\xf4\x00\x00\x00\x00\x00\x01\x00\x02\x91\x95\
+\x00\x00\x06\x74\x00\x00\x00\x00\x00\x01\x00\x02\x69\x3e\
+\x00\x00\x04\xec\x00\x00\x00\x00\x00\x01\x00\x02\x3c\xed\
+\x00\x00\x06\x4a\x00\x00\x00\x00\x00\x01\x00\x02\x66\xc5\
+\x00\x00\x02\x82\x00\x00\x00\x00\x00\x01\x00\x01\xec\x80\
+\x00\x00\x03\x64\x00\x00\x00\x00\x00\x01\x00\x02\x06\x79\
+\x00\x00\x0b\x34\x00\x00\x00\x00\x00\x01\x00\x02\xf0\x47\
+\x00\x00\x05\xa2\x00\x00\x00\x00\x00\x01\x00\x02\x56\x7c\
+\x00\x00\x0c\xde\x00\x00\x00\x00\x00\x01\x00\x03\x24\xce\
+\x00\x00\x00\x4e\x00\x00\x00\x00\x00\x01\x00\x01\xb3\x6c\
+\x00\x00\x0c\xf8\x00\x00\x00\x00\x00\x01\x00\x03\x27\x44\
+\x00\x00\x0d\xfe\x00\x00\x00\x00\x00\x01\x00\x03\x46\xc8\
+\x00\x00\x0b\x98\x00\x00\x00\x00\x00\x01\x00\x02\xf9\x5a\
+\x00\x00\x0d\x76\x00\x00\x00\x00\x00\x01\x00\x03\x38\xfc\
+\x00\x00\x0d\xac\x00\x00\x00\x00\x00\x01\x00\x03\x3f\xf0\
+\x00\x00\x01\x06\x00\x00\x00\x00\x00\x01\x00\x01\xc4\x13\
+\x00\x00\x00\xec\x00\x00\x00\x00\x00\x01\x00\x01\xc2\x66\
+\x00\x00\x05\x70\x00\x00\x00\x00\x00\x01\x00\x02\x4e\x61\
+\x00\x00\x0c\x58\x00\x00\x00\x00\x00\x01\x00\x03\x1a\x28\
+\x00\x00\x09\x5a\x00\x00\x00\x00\x00\x01\x00\x02\xc2\xcb\
+\x00\x00\x01\xb8\x00\x00\x00\x00\x00\x01\x00\x01\xd4\x96\
+\x00\x00\x0e\x80\x00\x00\x00\x00\x00\x01\x00\x03\x56\x84\
+\x00\x00\x03\xb4\x00\x00\x00\x00\x00\x01\x00\x02\x0c\x79\
+\x00\x00\x0e\x26\x00\x00\x00\x00\x00\x01\x00\x03\x4a\xa4\
+\x00\x00\x04\x2c\x00\x00\x00\x00\x00\x01\x00\x02\x24\xab\
+\x00\x00\x06\x9c\x00\x00\x00\x00\x00\x01\x00\x02\x6c\xdb\
+\x00\x00\x04\xca\x00\x00\x00\x00\x00\x01\x00\x02\x39\xca\
+\x00\x00\x0a\x22\x00\x00\x00\x00\x00\x01\x00\x02\xd8\x64\
+\x00\x00\x05\x4c\x00\x00\x00\x00\x00\x01\x00\x02\x48\x07\
+\x00\x00\x07\xae\x00\x00\x00\x00\x00\x01\x00\x02\x8a\x5f\
+\x00\x00\x03\x22\x00\x00\x00\x00\x00\x01\x00\x02\x00\x46\
+\x00\x00\x08\xbe\x00\x00\x00\x00\x00\x01\x00\x02\xad\xe0\
+\x00\x00\x0a\x7a\x00\x00\x00\x00\x00\x01\x00\x02\xde\x47\
+\x00\x00\x09\xfa\x00\x00\x00\x00\x00\x01\x00\x02\xd5\x39\
+\x00\x00\x07\x4c\x00\x00\x00\x00\x00\x01\x00\x02\x7f\x9c\
+\x00\x00\x0c\x88\x00\x00\x00\x00\x00\x01\x00\x03\x1d\x4c\
+\x00\x00\x08\x1a\x00\x00\x00\x00\x00\x01\x00\x02\x97\x72\
+\x00\x00\x07\x6e\x00\x00\x00\x00\x00\x01\x00\x02\x83\x80\
+\x00\x00\x0e\x40\x00\x00\x00\x00\x00\x01\x00\x03\x4e\x72\
+\x00\x00\x07\x2a\x00\x00\x00\x00\x00\x01\x00\x02\x7c\x11\
+\x00\x00\x0a\x54\x00\x00\x00\x00\x00\x01\x00\x02\xdb\x59\
+\x00\x00\x07\xcc\x00\x00\x00\x00\x00\x01\x00\x02\x8e\xec\
+\x00\x00\x04\x70\x00\x00\x00\x00\x00\x01\x00\x02\x2a\xf0\
+\x00\x00\x01\xd0\x00\x00\x00\x00\x00\x01\x00\x01\xd6\x56\
+\x00\x00\x0d\x8c\x00\x00\x00\x00\x00\x01\x00\x03\x3d\x0a\
+\x00\x00\x09\x9c\x00\x00\x00\x00\x00\x01\x00\x02\xca\x4f\
+\x00\x00\x03\xce\x00\x00\x00\x00\x00\x01\x00\x02\x10\x0c\
+\x00\x00\x0d\x3c\x00\x00\x00\x00\x00\x01\x00\x03\x32\x06\
+\x00\x00\x03\xea\x00\x00\x00\x00\x00\x01\x00\x02\x15\x68\
+\x00\x00\x07\x90\x00\x00\x00\x00\x00\x01\x00\x02\x87\xb5\
+\x00\x00\x09\x7c\x00\x00\x00\x00\x00\x01\x00\x02\xc6\x52\
+\x00\x00\x0e\xe6\x00\x00\x00\x00\x00\x01\x00\x03\x5d\x5b\
+\x00\x00\x05\xe0\x00\x00\x00\x00\x00\x01\x00\x02\x5c\xa0\
+\x00\x00\x04\x0c\x00\x00\x00\x00\x00\x01\x00\x02\x1a\xcc\
+\x00\x00\x00\x30\x00\x00\x00\x00\x00\x01\x00\x01\xb1\xa4\
+"
+
+qt_resource_struct_v2 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x12\x00\x02\x00\x00\x00\x72\x00\x00\x00\x76\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x20\x00\x02\x00\x00\x00\x72\x00\x00\x00\x04\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x02\xca\x00\x00\x00\x00\x00\x01\x00\x00\x42\x8c\
+\x00\x00\x01\xa1\x41\xcc\x41\xb8\
+\x00\x00\x0b\x00\x00\x00\x00\x00\x00\x01\x00\x01\x3c\x06\
+\x00\x00\x01\xa1\x41\xcc\x41\xb6\
+\x00\x00\x06\xba\x00\x00\x00\x00\x00\x01\x00\x00\xbd\xcc\
+\x00\x00\x01\xa1\x41\xcc\x41\xb7\
+\x00\x00\x0d\x5e\x00\x00\x00\x00\x00\x01\x00\x01\x82\xeb\
+\x00\x00\x01\xa1\x41\xcc\x41\xb0\
+\x00\x00\x0d\x0e\x00\x00\x00\x00\x00\x01\x00\x01\x7b\xf3\
+\x00\x00\x01\xa1\x41\xcc\x41\xb7\
+\x00\x00\x03\x3c\x00\x00\x00\x00\x00\x01\x00\x00\x52\x5b\
+\x00\x00\x01\xa1\x41\xcc\x41\xba\
+\x00\x00\x0b\x7c\x00\x00\x00\x00\x00\x01\x00\x01\x44\xe9\
+\x00\x00\x01\xa1\x41\xcc\x41\xb0\
+\x00\x00\x0a\xb0\x00\x00\x00\x00\x00\x01\x00\x01\x34\x8c\
+\x00\x00\x01\xa1\x41\xcc\x41\xb4\
+\x00\x00\x0e\x60\x00\x00\x00\x00\x00\x01\x00\x01\xa1\x5d\
+\x00\x00\x01\xa1\x41\xcc\x41\xbb\
+\x00\x00\x05\x00\x00\x00\x00\x00\x00\x01\x00\x00\x8f\x42\
+\x00\x00\x01\xa1\x41\xcc\x41\xb1\
+\x00\x00\x00\x66\x00\x00\x00\x00\x00\x01\x00\x00\x04\x6a\
+\x00\x00\x01\xa1\x41\xcc\x41\xb5\
+\x00\x00\x01\x2c\x00\x00\x00\x00\x00\x01\x00\x00\x15\xf6\
+\x00\x00\x01\xa1\x41\xcc\x41\xbb\
+\x00\x00\x0b\xf6\x00\x00\x00\x00\x00\x01\x00\x01\x56\x70\
+\x00\x00\x01\xa1\x41\xcc\x41\xb4\
+\x00\x00\x01\x78\x00\x00\x00\x00\x00\x01\x00\x00\x1c\x62\
+\x00\x00\x01\xa1\x41\xcc\x41\xb5\
+\x00\x00\x0d\xd0\x00\x00\x00\x00\x00\x01\x00\x01\x90\xdd\
+\x00\x00\x01\xa1\x41\xcc\x41\xaf\
+\x00\x00\x03\x02\x00\x00\x00\x00\x00\x01\x00\x00\x4c\x3d\
+\x00\x00\x01\xa1\x41\xcc\x41\xaf\
+\x00\x00\x09\xc2\x00\x00\x00\x00\x00\x01\x00\x01\x1d\x42\
+\x00\x00\x01\xa1\x41\xcc\x41\xb8\
+\x00\x00\x04\x98\x00\x00\x00\x00\x00\x01\x00\x00\x7d\xaf\
+\x00\x00\x01\xa1\x41\xcc\x41\xae\
+\x00\x00\x06\x2e\x00\x00\x00\x00\x00\x01\x00\x00\xb1\x23\
+\x00\x00\x01\xa1\x41\xcc\x41\xbb\
+\x00\x00\x02\x28\x00\x00\x00\x00\x00\x01\x00\x00\x30\x62\
+\x00\x00\x01\xa1\x41\xcc\x41\xaf\
+\x00\x00\x08\x8c\x00\x00\x00\x00\x00\x01\x00\x00\xf4\x8b\
+\x00\x00\x01\xa1\x41\xcc\x41\xb6\
+\x00\x00\x09\xde\x00\x00\x00\x00\x00\x01\x00\x01\x20\xb4\
+\x00\x00\x01\xa1\x41\xcc\x41\xb4\
+\x00\x00\x09\x28\x00\x00\x00\x00\x00\x01\x00\x01\x08\x0b\
+\x00\x00\x01\xa1\x41\xcc\x41\xb3\
+\x00\x00\x08\x40\x00\x00\x00\x00\x00\x01\x00\x00\xe8\x5f\
+\x00\x00\x01\xa1\x41\xcc\x41\xb7\
+\x00\x00\x0b\xde\x00\x00\x00\x00\x00\x01\x00\x01\x51\xf0\
+\x00\x00\x01\xa1\x41\xcc\x41\xb8\
+\x00\x00\x01\xa0\x00\x00\x00\x00\x00\x01\x00\x00\x1f\xf1\
+\x00\x00\x01\xa1\x41\xcc\x41\xbc\
+\x00\x00\x0c\xae\x00\x00\x00\x00\x00\x01\x00\x01\x6f\x49\
+\x00\x00\x01\xa1\x41\xcc\x41\xb4\
+\x00\x00\x0a\x96\x00\x00\x00\x00\x00\x01\x00\x01\x30\x97\
+\x00\x00\x01\xa1\x41\xcc\x41\xae\
+\x00\x00\x06\xf0\x00\x00\x00\x00\x00\x01\x00\x00\xc4\x53\
+\x00\x00\x01\xa1\x41\xcc\x41\xbb\
+\x00\x00\x0a\xd6\x00\x00\x00\x00\x00\x01\x00\x01\x38\x15\
+\x00\x00\x01\xa1\x41\xcc\x41\xb4\
+\x00\x00\x03\x8c\x00\x00\x00\x00\x00\x01\x00\x00\x57\x5a\
+\x00\x00\x01\xa1\x41\xcc\x41\xb5\
+\x00\x00\x01\x4c\x00\x00\x00\x00\x00\x01\x00\x00\x19\x75\
+\x00\x00\x01\xa1\x41\xcc\x41\xb9\
+\x00\x00\x08\x7a\x00\x00\x00\x00\x00\x01\x00\x00\xf1\x92\
+\x00\x00\x01\xa1\x41\xcc\x41\xbc\
+\x00\x00\x02\xb8\x00\x00\x00\x00\x00\x01\x00\x00\x3e\x14\
+\x00\x00\x01\xa1\x41\xcc\x41\xb8\
+\x00\x00\x0b\xc2\x00\x00\x00\x00\x00\x01\x00\x01\x4e\x30\
+\x00\x00\x01\xa1\x41\xcc\x41\xb1\
+\x00\x00\x00\x9e\x00\x00\x00\x00\x00\x01\x00\x00\x0a\xa5\
+\x00\x00\x01\xa1\x41\xcc\x41\xb0\
+\x00\x00\x09\x44\x00\x00\x00\x00\x00\x01\x00\x01\x0e\x4e\
+\x00\x00\x01\xa1\x41\xcc\x41\xb4\
+\x00\x00\x0c\x10\x00\x00\x00\x00\x00\x01\x00\x01\x60\x47\
+\x00\x00\x01\xa1\x41\xcc\x41\xb8\
+\x00\x00\x05\x26\x00\x00\x00\x00\x00\x01\x00\x00\x92\x6a\
+\x00\x00\x01\xa1\x41\xcc\x41\xb6\
+\x00\x00\x0c\x38\x00\x00\x00\x00\x00\x01\x00\x01\x64\xc6\
+\x00\x00\x01\xa1\x41\xcc\x41\xb1\
+\x00\x00\x04\x4e\x00\x00\x00\x00\x00\x01\x00\x00\x76\xe7\
+\x00\x00\x01\xa1\x41\xcc\x41\xb2\
+\x00\x00\x00\xc0\x00\x00\x00\x00\x00\x01\x00\x00\x0d\x92\
+\x00\x00\x01\xa1\x41\xcc\x41\xb1\
+\x00\x00\x00\x88\x00\x00\x00\x00\x00\x01\x00\x00\x07\xe9\
+\x00\x00\x01\xa1\x41\xcc\x41\xaf\
+\x00\x00\x02\xe0\x00\x00\x00\x00\x00\x01\x00\x00\x45\xf6\
+\x00\x00\x01\xa1\x41\xcc\x41\xb3\
+\x00\x00\x01\xfc\x00\x00\x00\x00\x00\x01\x00\x00\x2c\xd1\
+\x00\x00\x01\xa1\x41\xcc\x41\xb4\
+\x00\x00\x02\x60\x00\x00\x00\x00\x00\x01\x00\x00\x37\x53\
+\x00\x00\x01\xa1\x41\xcc\x41\xb5\
+\x00\x00\x0e\xce\x00\x00\x00\x00\x00\x01\x00\x01\xa9\x5a\
+\x00\x00\x01\xa1\x41\xcc\x41\xb3\
+\x00\x00\x06\x02\x00\x00\x00\x00\x00\x01\x00\x00\xad\x92\
+\x00\x00\x01\xa1\x41\xcc\x41\xb3\
+\x00\x00\x05\xc4\x00\x00\x00\x00\x00\x01\x00\x00\xa7\x91\
+\x00\x00\x01\xa1\x41\xcc\x41\xb7\
+\x00\x00\x04\xb4\x00\x00\x00\x00\x00\x01\x00\x00\x81\x78\
+\x00\x00\x01\xa1\x41\xcc\x41\xb7\
+\x00\x00\x07\x14\x00\x00\x00\x00\x00\x01\x00\x00\xc6\xc4\
+\x00\x00\x01\xa1\x41\xcc\x41\xae\
+\x00\x00\x08\xa8\x00\x00\x00\x00\x00\x01\x00\x00\xf8\x9c\
+\x00\x00\x01\xa1\x41\xcc\x41\xb1\
+\x00\x00\x0e\xae\x00\x00\x00\x00\x00\x01\x00\x01\xa7\xa5\
+\x00\x00\x01\xa1\x41\xcc\x41\xb2\
+\x00\x00\x08\xfe\x00\x00\x00\x00\x00\x01\x00\x01\x05\x4b\
+\x00\x00\x01\xa1\x41\xcc\x41\xb8\
+\x00\x00\x08\x5c\x00\x00\x00\x00\x00\x01\x00\x00\xef\x21\
+\x00\x00\x01\xa1\x41\xcc\x41\xb7\
+\x00\x00\x02\x44\x00\x00\x00\x00\x00\x01\x00\x00\x33\x26\
+\x00\x00\x01\xa1\x41\xcc\x41\xb2\
+\x00\x00\x0b\x5c\x00\x00\x00\x00\x00\x01\x00\x01\x41\x34\
+\x00\x00\x01\xa1\x41\xcc\x41\xb6\
+\x00\x00\x08\xe2\x00\x00\x00\x00\x00\x01\x00\x00\xff\x0c\
+\x00\x00\x01\xa1\x41\xcc\x41\xb3\
+\x00\x00\x06\xd0\x00\x00\x00\x00\x00\x01\x00\x00\xc1\xd5\
+\x00\x00\x01\xa1\x41\xcc\x41\xb2\
+\x00\x00\x07\xf4\x00\x00\x00\x00\x00\x01\x00\x00\xe0\x09\
+\x00\x00\x01\xa1\x41\xcc\x41\xb9\
+\x00\x00\x06\x74\x00\x00\x00\x00\x00\x01\x00\x00\xb7\xb2\
+\x00\x00\x01\xa1\x41\xcc\x41\xb5\
+\x00\x00\x04\xec\x00\x00\x00\x00\x00\x01\x00\x00\x8b\x55\
+\x00\x00\x01\xa1\x41\xcc\x41\xae\
+\x00\x00\x06\x4a\x00\x00\x00\x00\x00\x01\x00\x00\xb5\x39\
+\x00\x00\x01\xa1\x41\xcc\x41\xbb\
+\x00\x00\x02\x82\x00\x00\x00\x00\x00\x01\x00\x00\x3a\xe8\
+\x00\x00\x01\xa1\x41\xcc\x41\xb9\
+\x00\x00\x03\x64\x00\x00\x00\x00\x00\x01\x00\x00\x54\xe1\
+\x00\x00\x01\xa1\x41\xcc\x41\xb2\
+\x00\x00\x0b\x34\x00\x00\x00\x00\x00\x01\x00\x01\x3e\xbb\
+\x00\x00\x01\xa1\x41\xcc\x41\xba\
+\x00\x00\x05\xa2\x00\x00\x00\x00\x00\x01\x00\x00\xa4\xf0\
+\x00\x00\x01\xa1\x41\xcc\x41\xb6\
+\x00\x00\x0c\xde\x00\x00\x00\x00\x00\x01\x00\x01\x73\x42\
+\x00\x00\x01\xa1\x41\xcc\x41\xb2\
+\x00\x00\x00\x4e\x00\x00\x00\x00\x00\x01\x00\x00\x01\xc8\
+\x00\x00\x01\xa1\x41\xcc\x41\xaf\
+\x00\x00\x0c\xf8\x00\x00\x00\x00\x00\x01\x00\x01\x75\xb8\
+\x00\x00\x01\xa1\x41\xcc\x41\xb3\
+\x00\x00\x0d\xfe\x00\x00\x00\x00\x00\x01\x00\x01\x95\x3c\
+\x00\x00\x01\xa1\x41\xcc\x41\xba\
+\x00\x00\x0b\x98\x00\x00\x00\x00\x00\x01\x00\x01\x47\xce\
+\x00\x00\x01\xa1\x41\xcc\x41\xb8\
+\x00\x00\x0d\x76\x00\x00\x00\x00\x00\x01\x00\x01\x87\x70\
+\x00\x00\x01\xa1\x41\xcc\x41\xbb\
+\x00\x00\x0d\xac\x00\x00\x00\x00\x00\x01\x00\x01\x8e\x64\
+\x00\x00\x01\xa1\x41\xcc\x41\xb7\
+\x00\x00\x01\x06\x00\x00\x00\x00\x00\x01\x00\x00\x12\x6f\
+\x00\x00\x01\xa1\x41\xcc\x41\xbb\
+\x00\x00\x00\xec\x00\x00\x00\x00\x00\x01\x00\x00\x10\xc2\
+\x00\x00\x01\xa1\x41\xcc\x41\xb3\
+\x00\x00\x05\x70\x00\x00\x00\x00\x00\x01\x00\x00\x9c\xc9\
+\x00\x00\x01\xa1\x41\xcc\x41\xba\
+\x00\x00\x0c\x58\x00\x00\x00\x00\x00\x01\x00\x01\x68\x9c\
+\x00\x00\x01\xa1\x41\xcc\x41\xb9\
+\x00\x00\x09\x5a\x00\x00\x00\x00\x00\x01\x00\x01\x11\x3f\
+\x00\x00\x01\xa1\x41\xcc\x41\xb5\
+\x00\x00\x01\xb8\x00\x00\x00\x00\x00\x01\x00\x00\x22\xf2\
+\x00\x00\x01\xa1\x41\xcc\x41\xb0\
+\x00\x00\x0e\x80\x00\x00\x00\x00\x00\x01\x00\x01\xa4\xf8\
+\x00\x00\x01\xa1\x41\xcc\x41\xb6\
+\x00\x00\x03\xb4\x00\x00\x00\x00\x00\x01\x00\x00\x5a\xe1\
+\x00\x00\x01\xa1\x41\xcc\x41\xbb\
+\x00\x00\x0e\x26\x00\x00\x00\x00\x00\x01\x00\x01\x99\x18\
+\x00\x00\x01\xa1\x41\xcc\x41\xb2\
+\x00\x00\x04\x2c\x00\x00\x00\x00\x00\x01\x00\x00\x73\x13\
+\x00\x00\x01\xa1\x41\xcc\x41\xba\
+\x00\x00\x06\x9c\x00\x00\x00\x00\x00\x01\x00\x00\xbb\x4f\
+\x00\x00\x01\xa1\x41\xcc\x41\xb3\
+\x00\x00\x04\xca\x00\x00\x00\x00\x00\x01\x00\x00\x88\x32\
+\x00\x00\x01\xa1\x41\xcc\x41\xb5\
+\x00\x00\x0a\x22\x00\x00\x00\x00\x00\x01\x00\x01\x26\xd8\
+\x00\x00\x01\xa1\x41\xcc\x41\xb9\
+\x00\x00\x05\x4c\x00\x00\x00\x00\x00\x01\x00\x00\x96\x6f\
+\x00\x00\x01\xa1\x41\xcc\x41\xb8\
+\x00\x00\x07\xae\x00\x00\x00\x00\x00\x01\x00\x00\xd8\xd3\
+\x00\x00\x01\xa1\x41\xcc\x41\xb0\
+\x00\x00\x03\x22\x00\x00\x00\x00\x00\x01\x00\x00\x4e\xae\
+\x00\x00\x01\xa1\x41\xcc\x41\xb6\
+\x00\x00\x08\xbe\x00\x00\x00\x00\x00\x01\x00\x00\xfc\x54\
+\x00\x00\x01\xa1\x41\xcc\x41\xb8\
+\x00\x00\x0a\x7a\x00\x00\x00\x00\x00\x01\x00\x01\x2c\xbb\
+\x00\x00\x01\xa1\x41\xcc\x41\xb9\
+\x00\x00\x09\xfa\x00\x00\x00\x00\x00\x01\x00\x01\x23\xad\
+\x00\x00\x01\xa1\x41\xcc\x41\xb5\
+\x00\x00\x07\x4c\x00\x00\x00\x00\x00\x01\x00\x00\xce\x10\
+\x00\x00\x01\xa1\x41\xcc\x41\xb9\
+\x00\x00\x0c\x88\x00\x00\x00\x00\x00\x01\x00\x01\x6b\xc0\
+\x00\x00\x01\xa1\x41\xcc\x41\xb4\
+\x00\x00\x08\x1a\x00\x00\x00\x00\x00\x01\x00\x00\xe5\xe6\
+\x00\x00\x01\xa1\x41\xcc\x41\xaf\
+\x00\x00\x07\x6e\x00\x00\x00\x00\x00\x01\x00\x00\xd1\xf4\
+\x00\x00\x01\xa1\x41\xcc\x41\xb2\
+\x00\x00\x0e\x40\x00\x00\x00\x00\x00\x01\x00\x01\x9c\xe6\
+\x00\x00\x01\xa1\x41\xcc\x41\xb0\
+\x00\x00\x07\x2a\x00\x00\x00\x00\x00\x01\x00\x00\xca\x85\
+\x00\x00\x01\xa1\x41\xcc\x41\xb7\
+\x00\x00\x0a\x54\x00\x00\x00\x00\x00\x01\x00\x01\x29\xcd\
+\x00\x00\x01\xa1\x41\xcc\x41\xb1\
+\x00\x00\x07\xcc\x00\x00\x00\x00\x00\x01\x00\x00\xdd\x60\
+\x00\x00\x01\xa1\x41\xcc\x41\xb6\
+\x00\x00\x04\x70\x00\x00\x00\x00\x00\x01\x00\x00\x79\x58\
+\x00\x00\x01\xa1\x41\xcc\x41\xaf\
+\x00\x00\x01\xd0\x00\x00\x00\x00\x00\x01\x00\x00\x24\xb2\
+\x00\x00\x01\xa1\x41\xcc\x41\xba\
+\x00\x00\x0d\x8c\x00\x00\x00\x00\x00\x01\x00\x01\x8b\x7e\
+\x00\x00\x01\xa1\x41\xcc\x41\xb1\
+\x00\x00\x09\x9c\x00\x00\x00\x00\x00\x01\x00\x01\x18\xc3\
+\x00\x00\x01\xa1\x41\xcc\x41\xb0\
+\x00\x00\x03\xce\x00\x00\x00\x00\x00\x01\x00\x00\x5e\x74\
+\x00\x00\x01\xa1\x41\xcc\x41\xb1\
+\x00\x00\x0d\x3c\x00\x00\x00\x00\x00\x01\x00\x01\x80\x7a\
+\x00\x00\x01\xa1\x41\xcc\x41\xba\
+\x00\x00\x03\xea\x00\x00\x00\x00\x00\x01\x00\x00\x63\xd0\
+\x00\x00\x01\xa1\x41\xcc\x41\xb1\
+\x00\x00\x07\x90\x00\x00\x00\x00\x00\x01\x00\x00\xd6\x29\
+\x00\x00\x01\xa1\x41\xcc\x41\xaf\
+\x00\x00\x09\x7c\x00\x00\x00\x00\x00\x01\x00\x01\x14\xc6\
+\x00\x00\x01\xa1\x41\xcc\x41\xb6\
+\x00\x00\x0e\xe6\x00\x00\x00\x00\x00\x01\x00\x01\xab\xcf\
+\x00\x00\x01\xa1\x41\xcc\x41\xb9\
+\x00\x00\x05\xe0\x00\x00\x00\x00\x00\x01\x00\x00\xab\x14\
+\x00\x00\x01\xa1\x41\xcc\x41\xba\
+\x00\x00\x04\x0c\x00\x00\x00\x00\x00\x01\x00\x00\x69\x34\
+\x00\x00\x01\xa1\x41\xcc\x41\xb4\
+\x00\x00\x00\x30\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\xa1\x41\xcc\x41\xb0\
+\x00\x00\x02\xca\x00\x00\x00\x00\x00\x01\x00\x01\xf4\x24\
+\x00\x00\x01\xa1\x41\xcc\x41\xa9\
+\x00\x00\x0b\x00\x00\x00\x00\x00\x00\x01\x00\x02\xed\x92\
+\x00\x00\x01\xa1\x41\xcc\x41\xa7\
+\x00\x00\x06\xba\x00\x00\x00\x00\x00\x01\x00\x02\x6f\x58\
+\x00\x00\x01\xa1\x41\xcc\x41\xa7\
+\x00\x00\x0d\x5e\x00\x00\x00\x00\x00\x01\x00\x03\x34\x77\
+\x00\x00\x01\xa1\x41\xcc\x41\xa0\
+\x00\x00\x0d\x0e\x00\x00\x00\x00\x00\x01\x00\x03\x2d\x7f\
+\x00\x00\x01\xa1\x41\xcc\x41\xa8\
+\x00\x00\x03\x3c\x00\x00\x00\x00\x00\x01\x00\x02\x03\xf3\
+\x00\x00\x01\xa1\x41\xcc\x41\xaa\
+\x00\x00\x0b\x7c\x00\x00\x00\x00\x00\x01\x00\x02\xf6\x75\
+\x00\x00\x01\xa1\x41\xcc\x41\xa1\
+\x00\x00\x0a\xb0\x00\x00\x00\x00\x00\x01\x00\x02\xe6\x18\
+\x00\x00\x01\xa1\x41\xcc\x41\xa4\
+\x00\x00\x0e\x60\x00\x00\x00\x00\x00\x01\x00\x03\x52\xe9\
+\x00\x00\x01\xa1\x41\xcc\x41\xac\
+\x00\x00\x05\x00\x00\x00\x00\x00\x00\x01\x00\x02\x40\xda\
+\x00\x00\x01\xa1\x41\xcc\x41\xa2\
+\x00\x00\x00\x66\x00\x00\x00\x00\x00\x01\x00\x01\xb6\x0e\
+\x00\x00\x01\xa1\x41\xcc\x41\xa6\
+\x00\x00\x01\x2c\x00\x00\x00\x00\x00\x01\x00\x01\xc7\x9a\
+\x00\x00\x01\xa1\x41\xcc\x41\xad\
+\x00\x00\x0b\xf6\x00\x00\x00\x00\x00\x01\x00\x03\x07\xfc\
+\x00\x00\x01\xa1\x41\xcc\x41\xa4\
+\x00\x00\x01\x78\x00\x00\x00\x00\x00\x01\x00\x01\xce\x06\
+\x00\x00\x01\xa1\x41\xcc\x41\xa5\
+\x00\x00\x0d\xd0\x00\x00\x00\x00\x00\x01\x00\x03\x42\x69\
+\x00\x00\x01\xa1\x41\xcc\x41\x9f\
+\x00\x00\x03\x02\x00\x00\x00\x00\x00\x01\x00\x01\xfd\xd5\
+\x00\x00\x01\xa1\x41\xcc\x41\xa0\
+\x00\x00\x09\xc2\x00\x00\x00\x00\x00\x01\x00\x02\xce\xce\
+\x00\x00\x01\xa1\x41\xcc\x41\xa9\
+\x00\x00\x04\x98\x00\x00\x00\x00\x00\x01\x00\x02\x2f\x47\
+\x00\x00\x01\xa1\x41\xcc\x41\x9e\
+\x00\x00\x06\x2e\x00\x00\x00\x00\x00\x01\x00\x02\x62\xaf\
+\x00\x00\x01\xa1\x41\xcc\x41\xad\
+\x00\x00\x02\x28\x00\x00\x00\x00\x00\x01\x00\x01\xe1\xfa\
+\x00\x00\x01\xa1\x41\xcc\x41\xa0\
+\x00\x00\x08\x8c\x00\x00\x00\x00\x00\x01\x00\x02\xa6\x17\
+\x00\x00\x01\xa1\x41\xcc\x41\xa7\
+\x00\x00\x09\xde\x00\x00\x00\x00\x00\x01\x00\x02\xd2\x40\
+\x00\x00\x01\xa1\x41\xcc\x41\xa5\
+\x00\x00\x09\x28\x00\x00\x00\x00\x00\x01\x00\x02\xb9\x97\
+\x00\x00\x01\xa1\x41\xcc\x41\xa4\
+\x00\x00\x08\x40\x00\x00\x00\x00\x00\x01\x00\x02\x99\xeb\
+\x00\x00\x01\xa1\x41\xcc\x41\xa7\
+\x00\x00\x0b\xde\x00\x00\x00\x00\x00\x01\x00\x03\x03\x7c\
+\x00\x00\x01\xa1\x41\xcc\x41\xa8\
+\x00\x00\x01\xa0\x00\x00\x00\x00\x00\x01\x00\x01\xd1\x95\
+\x00\x00\x01\xa1\x41\xcc\x41\xae\
+\x00\x00\x0c\xae\x00\x00\x00\x00\x00\x01\x00\x03\x20\xd5\
+\x00\x00\x01\xa1\x41\xcc\x41\xa5\
+\x00\x00\x0a\x96\x00\x00\x00\x00\x00\x01\x00\x02\xe2\x23\
+\x00\x00\x01\xa1\x41\xcc\x41\x9f\
+\x00\x00\x06\xf0\x00\x00\x00\x00\x00\x01\x00\x02\x75\xdf\
+\x00\x00\x01\xa1\x41\xcc\x41\xad\
+\x00\x00\x0a\xd6\x00\x00\x00\x00\x00\x01\x00\x02\xe9\xa1\
+\x00\x00\x01\xa1\x41\xcc\x41\xa5\
+\x00\x00\x03\x8c\x00\x00\x00\x00\x00\x01\x00\x02\x08\xf2\
+\x00\x00\x01\xa1\x41\xcc\x41\xa6\
+\x00\x00\x01\x4c\x00\x00\x00\x00\x00\x01\x00\x01\xcb\x19\
+\x00\x00\x01\xa1\x41\xcc\x41\xaa\
+\x00\x00\x08\x7a\x00\x00\x00\x00\x00\x01\x00\x02\xa3\x1e\
+\x00\x00\x01\xa1\x41\xcc\x41\xae\
+\x00\x00\x02\xb8\x00\x00\x00\x00\x00\x01\x00\x01\xef\xac\
+\x00\x00\x01\xa1\x41\xcc\x41\xa9\
+\x00\x00\x0b\xc2\x00\x00\x00\x00\x00\x01\x00\x02\xff\xbc\
+\x00\x00\x01\xa1\x41\xcc\x41\xa2\
+\x00\x00\x00\x9e\x00\x00\x00\x00\x00\x01\x00\x01\xbc\x49\
+\x00\x00\x01\xa1\x41\xcc\x41\xa1\
+\x00\x00\x09\x44\x00\x00\x00\x00\x00\x01\x00\x02\xbf\xda\
+\x00\x00\x01\xa1\x41\xcc\x41\xa5\
+\x00\x00\x0c\x10\x00\x00\x00\x00\x00\x01\x00\x03\x11\xd3\
+\x00\x00\x01\xa1\x41\xcc\x41\xa8\
+\x00\x00\x05\x26\x00\x00\x00\x00\x00\x01\x00\x02\x44\x02\
+\x00\x00\x01\xa1\x41\xcc\x41\xa7\
+\x00\x00\x0c\x38\x00\x00\x00\x00\x00\x01\x00\x03\x16\x52\
+\x00\x00\x01\xa1\x41\xcc\x41\xa2\
+\x00\x00\x04\x4e\x00\x00\x00\x00\x00\x01\x00\x02\x28\x7f\
+\x00\x00\x01\xa1\x41\xcc\x41\xa3\
+\x00\x00\x00\xc0\x00\x00\x00\x00\x00\x01\x00\x01\xbf\x36\
+\x00\x00\x01\xa1\x41\xcc\x41\xa1\
+\x00\x00\x00\x88\x00\x00\x00\x00\x00\x01\x00\x01\xb9\x8d\
+\x00\x00\x01\xa1\x41\xcc\x41\xa0\
+\x00\x00\x02\xe0\x00\x00\x00\x00\x00\x01\x00\x01\xf7\x8e\
+\x00\x00\x01\xa1\x41\xcc\x41\xa3\
+\x00\x00\x01\xfc\x00\x00\x00\x00\x00\x01\x00\x01\xde\x69\
+\x00\x00\x01\xa1\x41\xcc\x41\xa5\
+\x00\x00\x02\x60\x00\x00\x00\x00\x00\x01\x00\x01\xe8\xeb\
+\x00\x00\x01\xa1\x41\xcc\x41\xa6\
+\x00\x00\x0e\xce\x00\x00\x00\x00\x00\x01\x00\x03\x5a\xe6\
+\x00\x00\x01\xa1\x41\xcc\x41\xa4\
+\x00\x00\x06\x02\x00\x00\x00\x00\x00\x01\x00\x02\x5f\x1e\
+\x00\x00\x01\xa1\x41\xcc\x41\xa4\
+\x00\x00\x05\xc4\x00\x00\x00\x00\x00\x01\x00\x02\x59\x1d\
+\x00\x00\x01\xa1\x41\xcc\x41\xa8\
+\x00\x00\x04\xb4\x00\x00\x00\x00\x00\x01\x00\x02\x33\x10\
+\x00\x00\x01\xa1\x41\xcc\x41\xa8\
+\x00\x00\x07\x14\x00\x00\x00\x00\x00\x01\x00\x02\x78\x50\
+\x00\x00\x01\xa1\x41\xcc\x41\x9f\
+\x00\x00\x08\xa8\x00\x00\x00\x00\x00\x01\x00\x02\xaa\x28\
+\x00\x00\x01\xa1\x41\xcc\x41\xa2\
+\x00\x00\x0e\xae\x00\x00\x00\x00\x00\x01\x00\x03\x59\x31\
+\x00\x00\x01\xa1\x41\xcc\x41\xa3\
+\x00\x00\x08\xfe\x00\x00\x00\x00\x00\x01\x00\x02\xb6\xd7\
+\x00\x00\x01\xa1\x41\xcc\x41\xa9\
+\x00\x00\x08\x5c\x00\x00\x00\x00\x00\x01\x00\x02\xa0\xad\
+\x00\x00\x01\xa1\x41\xcc\x41\xa8\
+\x00\x00\x02\x44\x00\x00\x00\x00\x00\x01\x00\x01\xe4\xbe\
+\x00\x00\x01\xa1\x41\xcc\x41\xa3\
+\x00\x00\x0b\x5c\x00\x00\x00\x00\x00\x01\x00\x02\xf2\xc0\
+\x00\x00\x01\xa1\x41\xcc\x41\xa7\
+\x00\x00\x08\xe2\x00\x00\x00\x00\x00\x01\x00\x02\xb0\x98\
+\x00\x00\x01\xa1\x41\xcc\x41\xa3\
+\x00\x00\x06\xd0\x00\x00\x00\x00\x00\x01\x00\x02\x73\x61\
+\x00\x00\x01\xa1\x41\xcc\x41\xa3\
+\x00\x00\x07\xf4\x00\x00\x00\x00\x00\x01\x00\x02\x91\x95\
+\x00\x00\x01\xa1\x41\xcc\x41\xaa\
+\x00\x00\x06\x74\x00\x00\x00\x00\x00\x01\x00\x02\x69\x3e\
+\x00\x00\x01\xa1\x41\xcc\x41\xa6\
+\x00\x00\x04\xec\x00\x00\x00\x00\x00\x01\x00\x02\x3c\xed\
+\x00\x00\x01\xa1\x41\xcc\x41\x9f\
+\x00\x00\x06\x4a\x00\x00\x00\x00\x00\x01\x00\x02\x66\xc5\
+\x00\x00\x01\xa1\x41\xcc\x41\xad\
+\x00\x00\x02\x82\x00\x00\x00\x00\x00\x01\x00\x01\xec\x80\
+\x00\x00\x01\xa1\x41\xcc\x41\xa9\
+\x00\x00\x03\x64\x00\x00\x00\x00\x00\x01\x00\x02\x06\x79\
+\x00\x00\x01\xa1\x41\xcc\x41\xa2\
+\x00\x00\x0b\x34\x00\x00\x00\x00\x00\x01\x00\x02\xf0\x47\
+\x00\x00\x01\xa1\x41\xcc\x41\xab\
+\x00\x00\x05\xa2\x00\x00\x00\x00\x00\x01\x00\x02\x56\x7c\
+\x00\x00\x01\xa1\x41\xcc\x41\xa6\
+\x00\x00\x0c\xde\x00\x00\x00\x00\x00\x01\x00\x03\x24\xce\
+\x00\x00\x01\xa1\x41\xcc\x41\xa3\
+\x00\x00\x00\x4e\x00\x00\x00\x00\x00\x01\x00\x01\xb3\x6c\
+\x00\x00\x01\xa1\x41\xcc\x41\x9f\
+\x00\x00\x0c\xf8\x00\x00\x00\x00\x00\x01\x00\x03\x27\x44\
+\x00\x00\x01\xa1\x41\xcc\x41\xa4\
+\x00\x00\x0d\xfe\x00\x00\x00\x00\x00\x01\x00\x03\x46\xc8\
+\x00\x00\x01\xa1\x41\xcc\x41\xab\
+\x00\x00\x0b\x98\x00\x00\x00\x00\x00\x01\x00\x02\xf9\x5a\
+\x00\x00\x01\xa1\x41\xcc\x41\xa9\
+\x00\x00\x0d\x76\x00\x00\x00\x00\x00\x01\x00\x03\x38\xfc\
+\x00\x00\x01\xa1\x41\xcc\x41\xae\
+\x00\x00\x0d\xac\x00\x00\x00\x00\x00\x01\x00\x03\x3f\xf0\
+\x00\x00\x01\xa1\x41\xcc\x41\xa8\
+\x00\x00\x01\x06\x00\x00\x00\x00\x00\x01\x00\x01\xc4\x13\
+\x00\x00\x01\xa1\x41\xcc\x41\xad\
+\x00\x00\x00\xec\x00\x00\x00\x00\x00\x01\x00\x01\xc2\x66\
+\x00\x00\x01\xa1\x41\xcc\x41\xa3\
+\x00\x00\x05\x70\x00\x00\x00\x00\x00\x01\x00\x02\x4e\x61\
+\x00\x00\x01\xa1\x41\xcc\x41\xab\
+\x00\x00\x0c\x58\x00\x00\x00\x00\x00\x01\x00\x03\x1a\x28\
+\x00\x00\x01\xa1\x41\xcc\x41\xaa\
+\x00\x00\x09\x5a\x00\x00\x00\x00\x00\x01\x00\x02\xc2\xcb\
+\x00\x00\x01\xa1\x41\xcc\x41\xa5\
+\x00\x00\x01\xb8\x00\x00\x00\x00\x00\x01\x00\x01\xd4\x96\
+\x00\x00\x01\xa1\x41\xcc\x41\xa0\
+\x00\x00\x0e\x80\x00\x00\x00\x00\x00\x01\x00\x03\x56\x84\
+\x00\x00\x01\xa1\x41\xcc\x41\xa7\
+\x00\x00\x03\xb4\x00\x00\x00\x00\x00\x01\x00\x02\x0c\x79\
+\x00\x00\x01\xa1\x41\xcc\x41\xac\
+\x00\x00\x0e\x26\x00\x00\x00\x00\x00\x01\x00\x03\x4a\xa4\
+\x00\x00\x01\xa1\x41\xcc\x41\xa2\
+\x00\x00\x04\x2c\x00\x00\x00\x00\x00\x01\x00\x02\x24\xab\
+\x00\x00\x01\xa1\x41\xcc\x41\xab\
+\x00\x00\x06\x9c\x00\x00\x00\x00\x00\x01\x00\x02\x6c\xdb\
+\x00\x00\x01\xa1\x41\xcc\x41\xa4\
+\x00\x00\x04\xca\x00\x00\x00\x00\x00\x01\x00\x02\x39\xca\
+\x00\x00\x01\xa1\x41\xcc\x41\xa6\
+\x00\x00\x0a\x22\x00\x00\x00\x00\x00\x01\x00\x02\xd8\x64\
+\x00\x00\x01\xa1\x41\xcc\x41\xaa\
+\x00\x00\x05\x4c\x00\x00\x00\x00\x00\x01\x00\x02\x48\x07\
+\x00\x00\x01\xa1\x41\xcc\x41\xa9\
+\x00\x00\x07\xae\x00\x00\x00\x00\x00\x01\x00\x02\x8a\x5f\
+\x00\x00\x01\xa1\x41\xcc\x41\xa0\
+\x00\x00\x03\x22\x00\x00\x00\x00\x00\x01\x00\x02\x00\x46\
+\x00\x00\x01\xa1\x41\xcc\x41\xa7\
+\x00\x00\x08\xbe\x00\x00\x00\x00\x00\x01\x00\x02\xad\xe0\
+\x00\x00\x01\xa1\x41\xcc\x41\xa9\
+\x00\x00\x0a\x7a\x00\x00\x00\x00\x00\x01\x00\x02\xde\x47\
+\x00\x00\x01\xa1\x41\xcc\x41\xaa\
+\x00\x00\x09\xfa\x00\x00\x00\x00\x00\x01\x00\x02\xd5\x39\
+\x00\x00\x01\xa1\x41\xcc\x41\xa6\
+\x00\x00\x07\x4c\x00\x00\x00\x00\x00\x01\x00\x02\x7f\x9c\
+\x00\x00\x01\xa1\x41\xcc\x41\xaa\
+\x00\x00\x0c\x88\x00\x00\x00\x00\x00\x01\x00\x03\x1d\x4c\
+\x00\x00\x01\xa1\x41\xcc\x41\xa5\
+\x00\x00\x08\x1a\x00\x00\x00\x00\x00\x01\x00\x02\x97\x72\
+\x00\x00\x01\xa1\x41\xcc\x41\xa0\
+\x00\x00\x07\x6e\x00\x00\x00\x00\x00\x01\x00\x02\x83\x80\
+\x00\x00\x01\xa1\x41\xcc\x41\xa3\
+\x00\x00\x0e\x40\x00\x00\x00\x00\x00\x01\x00\x03\x4e\x72\
+\x00\x00\x01\xa1\x41\xcc\x41\xa1\
+\x00\x00\x07\x2a\x00\x00\x00\x00\x00\x01\x00\x02\x7c\x11\
+\x00\x00\x01\xa1\x41\xcc\x41\xa8\
+\x00\x00\x0a\x54\x00\x00\x00\x00\x00\x01\x00\x02\xdb\x59\
+\x00\x00\x01\xa1\x41\xcc\x41\xa1\
+\x00\x00\x07\xcc\x00\x00\x00\x00\x00\x01\x00\x02\x8e\xec\
+\x00\x00\x01\xa1\x41\xcc\x41\xa6\
+\x00\x00\x04\x70\x00\x00\x00\x00\x00\x01\x00\x02\x2a\xf0\
+\x00\x00\x01\xa1\x41\xcc\x41\x9f\
+\x00\x00\x01\xd0\x00\x00\x00\x00\x00\x01\x00\x01\xd6\x56\
+\x00\x00\x01\xa1\x41\xcc\x41\xac\
+\x00\x00\x0d\x8c\x00\x00\x00\x00\x00\x01\x00\x03\x3d\x0a\
+\x00\x00\x01\xa1\x41\xcc\x41\xa1\
+\x00\x00\x09\x9c\x00\x00\x00\x00\x00\x01\x00\x02\xca\x4f\
+\x00\x00\x01\xa1\x41\xcc\x41\xa1\
+\x00\x00\x03\xce\x00\x00\x00\x00\x00\x01\x00\x02\x10\x0c\
+\x00\x00\x01\xa1\x41\xcc\x41\xa2\
+\x00\x00\x0d\x3c\x00\x00\x00\x00\x00\x01\x00\x03\x32\x06\
+\x00\x00\x01\xa1\x41\xcc\x41\xab\
+\x00\x00\x03\xea\x00\x00\x00\x00\x00\x01\x00\x02\x15\x68\
+\x00\x00\x01\xa1\x41\xcc\x41\xa2\
+\x00\x00\x07\x90\x00\x00\x00\x00\x00\x01\x00\x02\x87\xb5\
+\x00\x00\x01\xa1\x41\xcc\x41\x9f\
+\x00\x00\x09\x7c\x00\x00\x00\x00\x00\x01\x00\x02\xc6\x52\
+\x00\x00\x01\xa1\x41\xcc\x41\xa7\
+\x00\x00\x0e\xe6\x00\x00\x00\x00\x00\x01\x00\x03\x5d\x5b\
+\x00\x00\x01\xa1\x41\xcc\x41\xaa\
+\x00\x00\x05\xe0\x00\x00\x00\x00\x00\x01\x00\x02\x5c\xa0\
+\x00\x00\x01\xa1\x41\xcc\x41\xaa\
+\x00\x00\x04\x0c\x00\x00\x00\x00\x00\x01\x00\x02\x1a\xcc\
+\x00\x00\x01\xa1\x41\xcc\x41\xa4\
+\x00\x00\x00\x30\x00\x00\x00\x00\x00\x01\x00\x01\xb1\xa4\
+\x00\x00\x01\xa1\x41\xcc\x41\xa0\
+"
+
+qt_version = [int(v) for v in QtCore.qVersion().split('.')]
+if qt_version < [5, 8, 0]:
+    rcc_version = 1
+    qt_resource_struct = qt_resource_struct_v1
+else:
+    rcc_version = 2
+    qt_resource_struct = qt_resource_struct_v2
+
+def qInitResources():
+    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
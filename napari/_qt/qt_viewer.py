@@ -99,6 +99,10 @@ class QtViewer(QSplitter):
         Button controls for the napari viewer.
     """
 
+    # shared by all viewers, built on first use since a QCursor needs a
+    # QApplication to exist
+    _cursors_cache = None
+
     def __init__(self, viewer: Viewer, show_welcome_screen: bool = False):
         # Avoid circular import.
         from .layer_controls import QtLayerControlsContainer
@@ -216,13 +220,6 @@ class QtViewer(QSplitter):
         self.setOrientation(Qt.Vertical)
         self.addWidget(main_widget)
 
-        self._cursors = {
-            'cross': Qt.CrossCursor,
-            'forbidden': Qt.ForbiddenCursor,
-            'pointing': Qt.PointingHandCursor,
-            'standard': QCursor(),
-        }
-
         self._on_active_change()
         self.viewer.layers.events.inserted.connect(self._update_welcome_screen)
         self.viewer.layers.events.removed.connect(self._update_welcome_screen)
@@ -427,6 +424,7 @@ class QtViewer(QSplitter):
             # polled to load it, even if the camera is not moving.
             if vispy_layer.events is not None:
                 vispy_layer.events.loaded.connect(self._qt_poll.wake_up)
+                vispy_layer.polled = True
 
         vispy_layer.node.parent = self.view.scene
         vispy_layer.order = len(self.viewer.layers) - 1
@@ -640,6 +638,24 @@ class QtViewer(QSplitter):
         """
         self.view.interactive = self.viewer.camera.interactive
 
+    @classmethod
+    def _get_cursors(cls):
+        """Return the fixed-shape cursors, building them on first call.
+
+        Returns
+        -------
+        dict
+            Mapping of cursor style name to QCursor.
+        """
+        if cls._cursors_cache is None:
+            cls._cursors_cache = {
+                'cross': QCursor(Qt.CrossCursor),
+                'forbidden': QCursor(Qt.ForbiddenCursor),
+                'pointing': QCursor(Qt.PointingHandCursor),
+                'standard': QCursor(),
+            }
+        return cls._cursors_cache
+
     def _on_cursor(self, event):
         """Set the appearance of the mouse cursor.
 
@@ -654,19 +670,20 @@ class QtViewer(QSplitter):
             size = self.viewer.cursor.size * self.viewer.camera.zoom
         else:
             size = self.viewer.cursor.size
+        # pixmaps are drawn at integer sizes; rounding here lets the cached
+        # pixmap be reused across small zoom changes
+        size = max(int(size), 1)
 
         if cursor == 'square':
             # make sure the square fits within the current canvas
-            if size < 8 or size > (
-                min(*self.viewer.window.qt_viewer.canvas.size) - 4
-            ):
-                q_cursor = self._cursors['cross']
+            if size < 8 or size > (min(*self.canvas.size) - 4):
+                q_cursor = self._get_cursors()['cross']
             else:
                 q_cursor = QCursor(square_pixmap(size))
         elif cursor == 'circle':
             q_cursor = QCursor(circle_pixmap(size))
         else:
-            q_cursor = self._cursors[cursor]
+            q_cursor = self._get_cursors()[cursor]
 
         self.canvas.native.setCursor(q_cursor)
 
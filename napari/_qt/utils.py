@@ -192,16 +192,17 @@ def drag_with_pixmap(list_widget: QListWidget) -> QDrag:
     """
     drag = QDrag(list_widget)
     drag.setMimeData(list_widget.mimeData(list_widget.selectedItems()))
-    size = list_widget.viewport().visibleRegion().boundingRect().size()
+    viewport = list_widget.viewport()
+    size = viewport.visibleRegion().boundingRect().size()
     pixmap = QPixmap(size)
     pixmap.fill(Qt.transparent)
     painter = QPainter(pixmap)
     for index in list_widget.selectedIndexes():
         rect = list_widget.visualRect(index)
-        painter.drawPixmap(rect, list_widget.viewport().grab(rect))
+        painter.drawPixmap(rect, viewport.grab(rect))
     painter.end()
     drag.setPixmap(pixmap)
-    drag.setHotSpot(list_widget.viewport().mapFromGlobal(QCursor.pos()))
+    drag.setHotSpot(viewport.mapFromGlobal(QCursor.pos()))
     return drag
 
 
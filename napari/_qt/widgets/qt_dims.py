@@ -153,13 +153,19 @@ class QtDims(QWidget):
         event : napari.utils.event.Event, optional
             The napari event that triggered this method, by default None.
         """
-        self._trim_sliders(0)
-        self._create_sliders(self.dims.ndim)
-        self._update_display()
-        for i in range(self.dims.ndim):
-            self._update_range(i)
-            if self._displayed_sliders[i]:
-                self._update_slider(i)
+        # rebuilding the sliders adds and removes one widget at a time, so
+        # suspend repaints until they are all in place
+        self.setUpdatesEnabled(False)
+        try:
+            self._trim_sliders(0)
+            self._create_sliders(self.dims.ndim)
+            self._update_display()
+            # both of these update every slider widget, so only call them once
+            self._update_range(None)
+            if any(self._displayed_sliders):
+                self._update_slider(None)
+        finally:
+            self.setUpdatesEnabled(True)
 
     def _resize_axis_labels(self):
         """When any of the labels get updated, this method updates all label
@@ -214,8 +220,8 @@ class QtDims(QWidget):
             self.layout().addWidget(slider_widget)
             self.slider_widgets.insert(0, slider_widget)
             self._displayed_sliders.insert(0, True)
-            nsliders = np.sum(self._displayed_sliders)
-            self.setMinimumHeight(nsliders * self.SLIDERHEIGHT)
+        nsliders = np.sum(self._displayed_sliders)
+        self.setMinimumHeight(nsliders * self.SLIDERHEIGHT)
         self._resize_axis_labels()
 
     def _trim_sliders(self, number_of_sliders):
@@ -131,6 +131,10 @@ class QtDimSliderWidget(QWidget):
         """
         self.dims.set_current_step(self.axis, value)
 
+    def _on_slider_pressed(self):
+        """Mark this axis as the last used when its slider is pressed."""
+        self.dims.last_used = self.axis
+
     def _create_range_slider_widget(self):
         """Creates a range slider widget for a given axis."""
         # Set the maximum values of the range slider to be one step less than
@@ -147,11 +151,8 @@ class QtDimSliderWidget(QWidget):
         # Listener to be used for sending events back to model:
         slider.valueChanged.connect(self._value_changed)
 
-        def slider_focused_listener():
-            self.dims.last_used = self.axis
-
         # linking focus listener to the last used:
-        slider.sliderPressed.connect(slider_focused_listener)
+        slider.sliderPressed.connect(self._on_slider_pressed)
         self.slider = slider
 
     def _create_play_button_widget(self):
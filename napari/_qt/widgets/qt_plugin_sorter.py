@@ -122,16 +122,18 @@ class ImplementationListItem(QFrame):
         self.opacity.setOpacity(1 if state else 0.5)
         self.on_changed.emit()
 
-    def update_position_label(self, order=None):
+    def update_position_label(self, position: Optional[int] = None):
         """Update the label showing the position of this item in the list.
 
         Parameters
         ----------
-        order : list, optional
-            A HookOrderType list ... unused by this function, but here for ease
-            of signal connection, by default None.
+        position : int, optional
+            The 1-based position of this item in the list.  If not provided,
+            it is looked up from the list widget, by default None.
         """
-        position = self.item.listWidget().indexFromItem(self.item).row() + 1
+        if position is None:
+            list_widget = self.item.listWidget()
+            position = list_widget.indexFromItem(self.item).row() + 1
         self.position_label.setText(str(position))
 
 
@@ -172,6 +174,9 @@ class QtHookImplementationListWidget(QListWidget):
         self.setAcceptDrops(True)
         self.setSpacing(1)
         self.setMinimumHeight(1)
+        # every row shows the same widget layout, so let Qt skip per-item
+        # size queries when laying out, scrolling and hit-testing drops
+        self.setUniformItemSizes(True)
         self.setSizePolicy(
             QSizePolicy.MinimumExpanding, QSizePolicy.MinimumExpanding
         )
@@ -196,8 +201,14 @@ class QtHookImplementationListWidget(QListWidget):
         # _nonwrappers returns hook implementations in REVERSE call order
         # so we reverse them here to show them in the list in the order in
         # which they get called.
-        for hook_implementation in reversed(hook_caller._nonwrappers):
-            self.append_hook_implementation(hook_implementation)
+        # Suspend repaints while adding the item widgets, so the list is laid
+        # out once rather than once per implementation.
+        self.setUpdatesEnabled(False)
+        try:
+            for hook_implementation in reversed(hook_caller._nonwrappers):
+                self.append_hook_implementation(hook_implementation)
+        finally:
+            self.setUpdatesEnabled(True)
 
     def append_hook_implementation(
         self, hook_implementation: HookImplementation
@@ -215,7 +226,6 @@ class QtHookImplementationListWidget(QListWidget):
         widg = ImplementationListItem(item, parent=self)
         widg.on_changed.connect(self.on_changed.emit)
         item.setSizeHint(widg.sizeHint())
-        self.order_changed.connect(widg.update_position_label)
         self.setItemWidget(item, widg)
 
     def dropEvent(self, event: QEvent):
@@ -227,7 +237,15 @@ class QtHookImplementationListWidget(QListWidget):
             The event that triggered the dropEvent.
         """
         super().dropEvent(event)
-        order = [self.item(r).hook_implementation for r in range(self.count())]
+        # relabel every item in a single pass, rather than having each item
+        # look up its own row in the list
+        order = []
+        for row in range(self.count()):
+            item = self.item(row)
+            widg = self.itemWidget(item)
+            if widg is not None:
+                widg.update_position_label(row + 1)
+            order.append(item.hook_implementation)
         self.order_changed.emit(order)
 
     def startDrag(self, supportedActions: Qt.DropActions):
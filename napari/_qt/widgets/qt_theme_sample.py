@@ -147,10 +147,10 @@ class SampleWidget(QWidget):
         lay.addWidget(groupBox)
 
     def screenshot(self, path=None):
-        img = self.grab().toImage()
+        img = QImg2array(self.grab().toImage())
         if path is not None:
-            imsave(path, QImg2array(img))
-        return QImg2array(img)
+            imsave(path, img)
+        return img
 
 
 if __name__ == "__main__":
@@ -173,9 +173,7 @@ class QtViewerButtons(QFrame):
         sld = QSlider(Qt.Horizontal, self)
         sld.setRange(0, max(90, self.viewer.camera.perspective))
         sld.setValue(self.viewer.camera.perspective)
-        sld.valueChanged.connect(
-            lambda v: setattr(self.viewer.camera, 'perspective', v)
-        )
+        sld.valueChanged.connect(self._on_perspective_slider_change)
 
         # make layout
         layout = QHBoxLayout()
@@ -187,6 +185,16 @@ class QtViewerButtons(QFrame):
         pop.frame.setLayout(layout)
         pop.show_above_mouse()
 
+    def _on_perspective_slider_change(self, value):
+        """Set the viewer `camera.perspective` from the popup slider.
+
+        Parameters
+        ----------
+        value : int
+            Perspective (field of view) value from the slider.
+        """
+        self.viewer.camera.perspective = value
+
 
 class QtDeleteButton(QPushButton):
     """Delete button to remove selected layers.
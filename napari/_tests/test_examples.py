@@ -8,17 +8,24 @@ import napari
 from napari.utils.notifications import notification_manager
 
 # not testing these examples
-skip = [
+skip = {
     'surface_timeseries.py',  # needs nilearn
     '3d_kymograph.py',  # needs tqdm
     'live_tiffs.py',  # requires files
     'live_tiffs_generator.py',
     'embed_ipython.py',  # fails without monkeypatch
-]
+}
+# these examples only build their viewer under `if __name__ == '__main__'`
+run_as_main = {
+    'mgui_with_threading.py',  # its worker processes re-import the script
+}
 EXAMPLE_DIR = Path(napari.__file__).parent.parent / 'examples'
 # using f.name here and re-joining at `run_path()` for test key presentation
 # (works even if the examples list is empty, as opposed to using an ids lambda)
-examples = [f.name for f in EXAMPLE_DIR.glob("*.py") if f.name not in skip]
+# sorted, so that the test ids are collected in a stable order
+examples = sorted(
+    f.name for f in EXAMPLE_DIR.glob("*.py") if f.name not in skip
+)
 
 
 @pytest.fixture
@@ -32,8 +39,9 @@ def qapp():
     app = get_app()
 
     # quit examples that explicitly start the event loop with `napari.run()`
-    # so that tests aren't waiting on a manual exit
-    QTimer.singleShot(100, app.quit)
+    # so that tests aren't waiting on a manual exit.  A zero timeout fires as
+    # soon as the loop starts, rather than idling for a fixed delay.
+    QTimer.singleShot(0, app.quit)
 
     yield app
 
@@ -57,4 +65,7 @@ def test_examples(qapp, fname, monkeypatch, capsys):
     monkeypatch.setattr(notification_manager, 'receive_error', raise_errors)
 
     # run the example!
-    runpy.run_path(str(EXAMPLE_DIR / fname))
+    if fname in run_as_main:
+        runpy.run_path(str(EXAMPLE_DIR / fname), run_name='__main__')
+    else:
+        runpy.run_path(str(EXAMPLE_DIR / fname))
@@ -91,6 +91,12 @@ EXPECTED_NUMBER_OF_LAYER_METHODS = {
 # other.
 
 
+# short, stable test ids, e.g. "Image-2d"
+layer_test_ids = [
+    f'{layer_class.__name__}-{ndim}d'
+    for layer_class, _, ndim in layer_test_data
+]
+
 unrolled_layer_data = []
 for layer_class, data, ndim in layer_test_data:
     methods = _get_all_keybinding_methods(layer_class)
@@ -116,7 +122,9 @@ def test_add_layer(
     assert Nmeth == EXPECTED_NUMBER_OF_LAYER_METHODS[layer_class.__name__]
 
 
-@pytest.mark.parametrize('layer_class, a_unique_name, ndim', layer_test_data)
+@pytest.mark.parametrize(
+    'layer_class, a_unique_name, ndim', layer_test_data, ids=layer_test_ids
+)
 def test_add_layer_magic_name(
     make_napari_viewer, layer_class, a_unique_name, ndim
 ):
@@ -188,7 +196,9 @@ def test_changing_theme(make_napari_viewer):
         viewer.theme = 'nonexistent_theme'
 
 
-@pytest.mark.parametrize('layer_class, data, ndim', layer_test_data)
+@pytest.mark.parametrize(
+    'layer_class, data, ndim', layer_test_data, ids=layer_test_ids
+)
 def test_roll_traspose_update(make_napari_viewer, layer_class, data, ndim):
     """Check that transpose and roll preserve correct transform sequence."""
 
@@ -7,6 +7,7 @@ import pytest
 from napari._vispy.experimental.vispy_tiled_image_layer import (
     VispyTiledImageLayer,
 )
+from napari.utils.events import EmitterGroup
 
 skip_on_win_ci = pytest.mark.skipif(
     sys.platform.startswith('win') and os.getenv('CI', '0') != '0',
@@ -68,7 +69,7 @@ def test_tiled_screenshot(qtbot, monkeypatch, make_napari_viewer, dtype):
 
     # Take the screenshot
     screenshot = viewer.screenshot(canvas_only=True)
-    center_coord = np.round(np.array(screenshot.shape[:2]) / 2).astype(np.int)
+    center_coord = np.round(np.array(screenshot.shape[:2]) / 2).astype(int)
     target_center = np.array([0, 0, 128, 255], dtype='uint8')
     target_edge = np.array([0, 0, 0, 255], dtype='uint8')
     screen_offset = 3  # Offset is needed as our screenshots have black borders
@@ -109,7 +110,7 @@ def test_tiled_rgb(qtbot, monkeypatch, make_napari_viewer):
 
     # Take the screenshot
     screenshot = viewer.screenshot(canvas_only=True)
-    center_coord = np.round(np.array(screenshot.shape[:2]) / 2).astype(np.int)
+    center_coord = np.round(np.array(screenshot.shape[:2]) / 2).astype(int)
     target_center = np.array([128, 128, 128, 255], dtype='uint8')
     target_edge = np.array([0, 0, 0, 255], dtype='uint8')
     screen_offset = 3  # Offset is needed as our screenshots have black borders
@@ -155,7 +156,7 @@ def test_tiled_changing_contrast_limits(
 
     # Take the screenshot
     screenshot = viewer.screenshot(canvas_only=True)
-    center_coord = np.round(np.array(screenshot.shape[:2]) / 2).astype(np.int)
+    center_coord = np.round(np.array(screenshot.shape[:2]) / 2).astype(int)
     target_center = np.array([0, 0, 255, 255], dtype='uint8')
     target_edge = np.array([0, 0, 0, 255], dtype='uint8')
     screen_offset = 3  # Offset is needed as our screenshots have black borders
@@ -209,7 +210,7 @@ def test_tiled_single_scale(qtbot, monkeypatch, make_napari_viewer):
 
     # Take the screenshot
     screenshot = viewer.screenshot(canvas_only=True)
-    center_coord = np.round(np.array(screenshot.shape[:2]) / 2).astype(np.int)
+    center_coord = np.round(np.array(screenshot.shape[:2]) / 2).astype(int)
     target_center = np.array([128, 128, 128, 255], dtype='uint8')
     screen_offset = 3  # Offset is needed as our screenshots have black borders
 
@@ -250,7 +251,7 @@ def test_tiled_labels(qtbot, monkeypatch, make_napari_viewer):
 
     # Take the screenshot
     screenshot = viewer.screenshot(canvas_only=True)
-    center_coord = np.round(np.array(screenshot.shape[:2]) / 2).astype(np.int)
+    center_coord = np.round(np.array(screenshot.shape[:2]) / 2).astype(int)
     col = layer.get_color(1)
     target_center = np.array([c * 255 for c in col], dtype='uint8')
     target_edge = np.array([0, 0, 0, 255], dtype='uint8')
@@ -266,3 +267,25 @@ def test_tiled_labels(qtbot, monkeypatch, make_napari_viewer):
     np.testing.assert_allclose(
         screenshot[-screen_offset, -screen_offset], target_edge
     )
+
+
+@pytest.mark.parametrize('polled', [False, True])
+def test_tiled_loaded_with_other_listener(polled):
+    """Test loaded bursts are only coalesced when QtPoll is polling us."""
+    # Skip the real __init__, it needs an octree layer and a GL context.
+    visual = VispyTiledImageLayer.__new__(VispyTiledImageLayer)
+    visual.events = EmitterGroup(source=visual, loaded=None)
+    visual.polled = polled
+    visual._poll_pending = False
+    updates = []
+    visual._update_view = lambda: updates.append(1)
+
+    # A listener that is not QtPoll, so it never calls _on_poll().
+    visual.events.loaded.connect(lambda event: None)
+
+    for _ in range(3):
+        visual._on_loaded(None)
+
+    # Without QtPoll every load must update the view, otherwise the view
+    # would stop updating after the first chunk.
+    assert len(updates) == (1 if polled else 3)
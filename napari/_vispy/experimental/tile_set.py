@@ -130,7 +130,7 @@ class TileSet:
         """
         return sorted(
             self._tiles.values(),
-            key=lambda x: x.octree_chunk.location.level_index,
+            key=lambda x: x.octree_chunk.level_index,
             reverse=True,
         )
 
@@ -98,6 +98,13 @@ class VispyTiledImageLayer(VispyImageLayer):
         # An optional grid that shows tile borders.
         self.grid = TileGrid(self.node)
 
+        # True if QtPoll is polling us. QtViewer sets this when it connects
+        # our loaded event to QtPoll.wake_up().
+        self.polled = False
+
+        # True if we asked QtPoll to poll us and it has not done so yet.
+        self._poll_pending = False
+
         # So we redraw when the layer loads new data.
         self.layer.events.loaded.connect(self._on_loaded)
 
@@ -145,6 +152,7 @@ class VispyTiledImageLayer(VispyImageLayer):
         which chunks are currently drawable.
         """
         super()._on_poll()
+        self._poll_pending = False
 
         # Mark the event "handled" if we have more chunks to load.
         #
@@ -299,6 +307,18 @@ class VispyTiledImageLayer(VispyImageLayer):
         return self.node.add_chunks(drawable_chunks)
 
     def _on_loaded(self, _event) -> None:
-        """The layer loaded new data, so update our view."""
+        """The layer loaded new data, so update our view.
+
+        Chunks often load in bursts, and the layer emits loaded for each one.
+        If we already asked QtPoll to poll us, the pending poll will add all
+        the chunks that loaded in the meantime, so there is nothing to do.
+        """
+        if self._poll_pending:
+            return
+
         self._update_view()
+
+        # Only rely on a pending poll if QtPoll is going to poll us, other
+        # listeners to loaded would never clear the flag.
+        self._poll_pending = self.polled
         self.events.loaded()
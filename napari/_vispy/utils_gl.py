@@ -18,6 +18,12 @@ texture_dtypes = [
     np.dtype(np.uint16),
     np.dtype(np.float32),
 ]
+_TEXTURE_DTYPES = frozenset(texture_dtypes)
+
+# texture dtype to convert to, by the kind of an unsupported dtype
+_TEXTURE_DTYPE_BY_KIND = dict(
+    i=np.int16, f=np.float32, u=np.uint16, b=np.uint8
+)
 
 
 @contextmanager
@@ -83,13 +89,11 @@ def fix_data_dtype(data):
     """
 
     dtype = np.dtype(data.dtype)
-    if dtype in texture_dtypes:
+    if dtype in _TEXTURE_DTYPES:
         return data
     else:
         try:
-            dtype = dict(i=np.int16, f=np.float32, u=np.uint16, b=np.uint8)[
-                dtype.kind
-            ]
+            dtype = _TEXTURE_DTYPE_BY_KIND[dtype.kind]
         except KeyError:  # not an int or float
             raise TypeError(
                 trans._(
@@ -149,7 +149,12 @@ class VispyBaseLayer(ABC):
             affine_offset = np.eye(4)
             affine_offset[-1, : len(offset)] = offset[::-1]
             affine_matrix = affine_matrix @ affine_offset
-        self._master_transform.matrix = affine_matrix
+
+        # setting the matrix makes vispy update the transform chain and
+        # redraw, so skip it when e.g. only the slice data changed
+        master_transform = self._master_transform
+        if not np.array_equal(master_transform.matrix, affine_matrix):
+            master_transform.matrix = affine_matrix
 
     def _reset_base(self):
         self._on_visible_change()
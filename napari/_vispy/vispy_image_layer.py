@@ -86,10 +86,8 @@ class VispyImageLayer(VispyBaseLayer):
     def _set_node_data(self, node, data):
         """Our self.layer._data_view has been updated, update our node."""
 
-        data = fix_data_dtype(data)
-
         if self.layer._ndisplay == 3 and self.layer.ndim == 2:
-            data = np.expand_dims(data, axis=0)
+            data = data[np.newaxis]
 
         # Check if data exceeds MAX_TEXTURE_SIZE and downsample
         if self.MAX_TEXTURE_SIZE_2D is not None and self.layer._ndisplay == 2:
@@ -99,6 +97,10 @@ class VispyImageLayer(VispyBaseLayer):
         ):
             data = self.downsample_texture(data, self.MAX_TEXTURE_SIZE_3D)
 
+        # convert after downsampling, so that only the (strided view of the)
+        # data that is actually uploaded gets copied
+        data = fix_data_dtype(data)
+
         # Check if ndisplay has changed current node type needs updating
         if (
             self.layer._ndisplay == 3 and not isinstance(node, VolumeNode)
@@ -166,7 +168,7 @@ class VispyImageLayer(VispyBaseLayer):
         data : array
             Data that now fits inside texture.
         """
-        if np.any(np.greater(data.shape, MAX_TEXTURE_SIZE)):
+        if any(size > MAX_TEXTURE_SIZE for size in data.shape):
             if self.layer.multiscale:
                 raise ValueError(
                     trans._(
@@ -186,9 +188,8 @@ class VispyImageLayer(VispyBaseLayer):
                     ndisplay=self.layer._ndisplay,
                 )
             )
-            downsample = np.ceil(
-                np.divide(data.shape, MAX_TEXTURE_SIZE)
-            ).astype(int)
+            # integer ceiling division of each axis by the texture size
+            downsample = [-(-size // MAX_TEXTURE_SIZE) for size in data.shape]
             scale = np.ones(self.layer.ndim)
             for i, d in enumerate(self.layer._dims_displayed):
                 scale[d] = downsample[i]
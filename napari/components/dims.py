@@ -181,9 +181,9 @@ class Dims(EventedModel):
     @property
     def displayed_order(self) -> Tuple[int, ...]:
         """Tuple: Order of only displayed dimensions."""
-        order = np.array(self.displayed)
-        order[np.argsort(order)] = list(range(len(order)))
-        return tuple(order)
+        displayed = self.displayed
+        rank = {axis: i for i, axis in enumerate(sorted(displayed))}
+        return tuple(rank[axis] for axis in displayed)
 
     def set_range(self, axis: int, _range: Sequence[Union[int, float]]):
         """Sets the range (min, max, step) for a given dimension.
@@ -25,7 +25,7 @@ class QueueEntry(NamedTuple):
     request : ChunkRequest
         The request to submit.
     submit_time : float
-        The time to submit the request in time.time() seconds.
+        The time to submit the request in time.perf_counter() seconds.
     """
 
     request: ChunkRequest
@@ -108,7 +108,7 @@ class DelayQueue(threading.Thread):
         LOGGER.info("DelayQueue.add: %s", request.location)
 
         # Create entry with the time to submit it.
-        submit_time = time.time() + self.delay_seconds
+        submit_time = time.perf_counter() + self.delay_seconds
         entry = QueueEntry(request, submit_time)
 
         with self._lock:
@@ -176,7 +176,7 @@ class DelayQueue(threading.Thread):
         for new entries.
         """
         while self._shutdown is False:
-            now = time.time()
+            now = time.perf_counter()
 
             with self._lock:
                 seconds = self._submit_due_entries(now)
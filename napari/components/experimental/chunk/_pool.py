@@ -100,17 +100,23 @@ class LoaderPool:
         cancelled = self._delay_queue.cancel_requests(should_cancel)
 
         num_before = len(self._futures)
+        num_cancelled = 0
 
-        # Cancelling futures may or may not work. Future.cancel() will
-        # return False if the worker is already loading the request and it
-        # cannot be cancelled.
-        for request in list(self._futures.keys()):
-            if self._futures[request].cancel():
+        # Snapshot the items since _submit() runs in the DelayQueue thread.
+        for request, future in list(self._futures.items()):
+            if future.done():
+                # Finished loads are dropped here, so the dict does not
+                # keep growing and slow down every later cancel.
+                del self._futures[request]
+            # Cancelling futures may or may not work. Future.cancel() will
+            # return False if the worker is already loading the request and
+            # it cannot be cancelled.
+            elif should_cancel(request) and future.cancel():
                 del self._futures[request]
                 cancelled.append(request)
+                num_cancelled += 1
 
         num_after = len(self._futures)
-        num_cancelled = num_before - num_after
 
         LOGGER.debug(
             "cancel_requests: %d -> %d futures (cancelled %d)",
@@ -84,7 +84,7 @@ class ChunkRequest:
     chunks : Dict[str, ArrayLike]
         One or more arrays that we need to load.
     create_time : float
-        The time the request was created.
+        The time the request was created, in time.perf_counter() seconds.
     _timers : Dict[str, PerfEvent]
         Timing information about chunk load time.
     """
@@ -103,7 +103,7 @@ class ChunkRequest:
         self.location = location
         self.chunks = chunks
 
-        self.create_time = time.time()
+        self.create_time = time.perf_counter()
         self._timers: Dict[str, PerfEvent] = {}
 
         self.priority = priority
@@ -117,7 +117,7 @@ class ChunkRequest:
         float
             The total time elapsed since the chunk was created.
         """
-        return (time.time() - self.create_time) * 1000
+        return (time.perf_counter() - self.create_time) * 1000
 
     @property
     def load_ms(self) -> float:
@@ -1,6 +1,9 @@
-"""Test _get_loader_configs() function."""
+"""Test _get_loader_configs() function and LoaderPool."""
+from concurrent.futures import Future
+
 import pytest
 
+from napari.components.experimental.chunk._pool import LoaderPool
 from napari.components.experimental.chunk._pool_group import (
     _get_loader_configs,
 )
@@ -77,3 +80,27 @@ def test_loader_pool_group():
     assert group._get_loader_priority(3) == 3
     assert group._get_loader_priority(4) == 3
     assert group._get_loader_priority(5) == 3
+
+
+def test_cancel_requests():
+    """Test only matching requests are cancelled and done ones are dropped."""
+    pool = LoaderPool({"num_workers": 1, "delay_queue_ms": 0})
+    try:
+        in_view, out_of_view, done = Future(), Future(), Future()
+        done.set_result("done")
+        pool._futures = {
+            "in_view": in_view,
+            "out_of_view": out_of_view,
+            "done": done,
+        }
+
+        cancelled = pool.cancel_requests(lambda request: request != "in_view")
+
+        # The finished future is dropped from the tracking dict, but it was
+        # not cancelled, so it's not reported.
+        assert cancelled == ["out_of_view"]
+        assert out_of_view.cancelled()
+        assert not in_view.cancelled()
+        assert pool._futures == {"in_view": in_view}
+    finally:
+        pool.shutdown()
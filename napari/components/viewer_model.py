@@ -274,10 +274,15 @@ class ViewerModel(KeymapProvider, MousemapProvider, EventedModel):
             List of layers to update. If none provided updates all.
         """
         layers = layers or self.layers
+        # dims.point is recomputed on every access, so read the slicing
+        # parameters once rather than once per layer
+        point, ndisplay, order = (
+            self.dims.point,
+            self.dims.ndisplay,
+            self.dims.order,
+        )
         for layer in layers:
-            layer._slice_dims(
-                self.dims.point, self.dims.ndisplay, self.dims.order
-            )
+            layer._slice_dims(point, ndisplay, order)
 
     def _on_active_layer(self, event):
         """Update viewer state for a new active layer."""
@@ -349,21 +354,17 @@ class ViewerModel(KeymapProvider, MousemapProvider, EventedModel):
 
     def _on_cursor_position_change(self, event):
         """Set the layer cursor position."""
-        with warnings.catch_warnings():
-            # Catch the deprecation warning on layer.position
-            warnings.filterwarnings(
-                'ignore',
-                message=str(
-                    trans._('layer.position is deprecated', deferred=True)
-                ),
-            )
-            for layer in self.layers:
-                layer.position = self.cursor.position
+        position = self.cursor.position
+        for layer in self.layers:
+            # Set the private attribute directly rather than going through the
+            # deprecated ``layer.position`` setter, which would emit (and then
+            # require filtering) one warning per layer on every mouse move.
+            layer._position = position[-layer.ndim :]
 
         # Update status and help bar based on active layer
         active = self.layers.selection.active
         if active is not None:
-            self.status = active.get_status(self.cursor.position, world=True)
+            self.status = active.get_status(position, world=True)
             self.help = active.help
 
     def _on_grid_change(self, event):
@@ -539,9 +539,9 @@ class Layer(KeymapProvider, MousemapProvider, ABC):
         # itself so that layers can be sliced in different ways for multiple
         # canvas. See https://github.com/napari/napari/pull/1919#issuecomment-738585093
         # for additional discussion.
-        order = np.array(self._dims_displayed)
-        order[np.argsort(order)] = list(range(len(order)))
-        return tuple(order)
+        displayed = self._dims_displayed
+        rank = {axis: i for i, axis in enumerate(sorted(displayed))}
+        return tuple(rank[axis] for axis in displayed)
 
     def _update_dims(self, event=None):
         """Updates dims model, which is useful after data has been changed."""
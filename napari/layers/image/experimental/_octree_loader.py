@@ -182,7 +182,7 @@ class OctreeLoader:
         # Load everything in seen if needed.
         for chunk in seen.chunks():
             # The ideal level is priority 0, 1 is one level above idea, etc.
-            priority = chunk.location.level_index - ideal_level
+            priority = chunk.level_index - ideal_level
 
             if chunk.in_memory:
                 drawable.append(chunk)
@@ -223,7 +223,7 @@ class OctreeLoader:
         if len(common_ancestors) > 0:
             # Find the common ancestor with the smallest level, i.e. the highest
             # resolution
-            level_indices = [c.location.level_index for c in common_ancestors]
+            level_indices = [c.level_index for c in common_ancestors]
             best_ancestor_index = level_indices.index(min(level_indices))
             # Take the last common ancestor which will be the most recent
             return [common_ancestors[best_ancestor_index]]
@@ -289,16 +289,19 @@ class OctreeLoader:
             The chunks that should be drawn to cover this one ideal chunk.
         """
 
+        # in_memory is a property that checks the data type, read it once.
+        in_memory = ideal_chunk.in_memory
+
         # If the ideal chunk is already being drawn, that's all we need,
         # there is no point in returning more than that.
-        if ideal_chunk.in_memory and ideal_chunk in drawn_set:
+        if in_memory and ideal_chunk in drawn_set:
             return [ideal_chunk]
 
         # If not, get alternates for this chunk, from other levels.
 
         # If the ideal chunk is in memory then we'll want to draw that one
         # too though
-        if ideal_chunk.in_memory:
+        if in_memory:
             best_in_memory_chunk = [ideal_chunk]
         else:
             best_in_memory_chunk = []
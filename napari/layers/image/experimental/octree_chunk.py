@@ -94,6 +94,8 @@ class OctreeChunk:
     ----------
     _orig_data : ArrayLike
         The original unloaded data that we use to implement OctreeChunk.clear().
+    level_index : int
+        The octree level of this chunk, the same as location.level_index.
     loading : bool
         If True the chunk has been queued to be loaded.
     """
@@ -103,6 +105,7 @@ class OctreeChunk:
     ):
         self._data = data
         self.location = location
+        self.level_index = location.level_index  # Read on every frame.
         self.geom = geom
 
         self.loading = False  # Are we currently being loaded.
@@ -200,6 +203,11 @@ def log_chunks(
     location : Optional[OctreeLocation]
         Append the log message with this location.
     """
+    # Logging each chunk reads its in_memory property, skip all that work
+    # unless the messages will actually be emitted.
+    if not LOGGER.isEnabledFor(logging.DEBUG):
+        return
+
     if location is None:
         LOGGER.debug("%s has %d chunks:", label, len(chunks))
     else:
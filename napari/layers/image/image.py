@@ -729,7 +729,11 @@ class _ImageBase(IntensityVisualizationMixin, Layer):
         else:
             coord = position
 
-        coord = np.round(coord).astype(int)
+        # this runs on every mouse move, so only round and convert the
+        # displayed coordinates, and only index them once
+        displayed = tuple(
+            int(c) for c in np.round(np.asarray(coord)[self._dims_displayed])
+        )
 
         raw = self._slice.image.raw
         if self.rgb:
@@ -737,8 +741,8 @@ class _ImageBase(IntensityVisualizationMixin, Layer):
         else:
             shape = raw.shape
 
-        if all(0 <= c < s for c, s in zip(coord[self._dims_displayed], shape)):
-            value = raw[tuple(coord[self._dims_displayed])]
+        if all(0 <= c < s for c, s in zip(displayed, shape)):
+            value = raw[displayed]
         else:
             value = None
 
@@ -123,3 +123,49 @@ def fix_data_points(
             )
         ndim = data_ndim
     return points, ndim
+
+
+def _append_rows(
+    buffer: Optional[np.ndarray], array: np.ndarray, rows: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Append rows to an array using an over-allocated buffer.
+
+    If ``array`` is a prefix view of ``buffer`` with room to spare, the new
+    rows are written in place. Otherwise a new buffer with geometric spare
+    capacity is allocated, so appending one row at a time is amortized O(1)
+    instead of copying the whole array each time.
+
+    Parameters
+    ----------
+    buffer : (M, ...) array or None
+        Storage previously returned by this function, if any.
+    array : (N, ...) array
+        Current values.
+    rows : (K, ...) array
+        Values to append.
+
+    Returns
+    -------
+    buffer : (M', ...) array
+        Storage backing the result, to be passed to the next call.
+    appended : (N + K, ...) array
+        View on ``buffer`` holding the values of ``array`` then ``rows``.
+    """
+    n_old = len(array)
+    n_new = n_old + len(rows)
+    dtype = np.result_type(array, rows)
+    if (
+        buffer is None
+        or array.base is not buffer
+        or array.ctypes.data != buffer.ctypes.data
+        or array.strides != buffer.strides
+        or buffer.dtype != dtype
+        or buffer.shape[1:] != rows.shape[1:]
+        or len(buffer) < n_new
+    ):
+        # array is not a prefix of the buffer (or it is full), so allocate
+        # a new one with room to grow
+        buffer = np.empty((max(2 * n_new, 16),) + rows.shape[1:], dtype)
+        buffer[:n_old] = array
+    buffer[n_old:n_new] = rows
+    return buffer, buffer[:n_new]
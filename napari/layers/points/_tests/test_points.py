@@ -298,6 +298,47 @@ def test_adding_points():
     np.testing.assert_equal(layer.data, np.vstack((data, coord)))
 
 
+def test_adding_points_one_at_a_time():
+    """Test adding many Points one by one keeps data consistent."""
+    data = np.array([[0, 0]])
+    layer = Points(data)
+    for i in range(1, 50):
+        layer.add([i, 2 * i])
+    assert layer.data.shape == (50, 2)
+    np.testing.assert_array_equal(layer.data[:, 0], np.arange(50))
+    np.testing.assert_array_equal(layer.data[:, 1], 2 * np.arange(50))
+    assert len(layer.size) == 50
+    np.testing.assert_array_equal(layer.size[-1], [layer.current_size] * 2)
+    # a slice assigned back as data must not be written into by later
+    # additions, since the previously returned array still sees its rows
+    held = layer.data
+    held_values = held.copy()
+    layer.data = layer.data[:-1]
+    layer.add([100, 100])
+    np.testing.assert_array_equal(held, held_values)
+    np.testing.assert_array_equal(layer.data[-1], [100, 100])
+
+    # float coordinates upcast integer data
+    layer.add([0.5, 0.5])
+    assert layer.data.dtype.kind == 'f'
+    np.testing.assert_array_equal(layer.data[-1], [0.5, 0.5])
+
+
+def test_adding_points_after_shrinking_keeps_held_sizes():
+    """Test growing sizes after a shrink leaves earlier size arrays intact."""
+    layer = Points(np.zeros((1, 2)))
+    layer.add([1, 1])
+    held = layer.size
+    held_values = held.copy()
+
+    layer.data = layer.data[:-1]
+    layer.selected_data = set()
+    layer.current_size = 3
+    layer.add([2, 2])
+    np.testing.assert_array_equal(held, held_values)
+    np.testing.assert_array_equal(layer.size[-1], [3, 3])
+
+
 def test_adding_points_to_empty():
     """Test adding Points data to empty."""
     shape = (0, 2)
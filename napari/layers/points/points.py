@@ -21,7 +21,12 @@ from ..utils.layer_utils import dataframe_to_properties
 from ..utils.text import TextManager
 from ._points_constants import SYMBOL_ALIAS, Mode, Symbol
 from ._points_mouse_bindings import add, highlight, select
-from ._points_utils import create_box, fix_data_points, points_to_squares
+from ._points_utils import (
+    _append_rows,
+    create_box,
+    fix_data_points,
+    points_to_squares,
+)
 
 DEFAULT_COLOR_CYCLE = np.array([[1, 0, 1, 1], [0, 1, 0, 1]])
 
@@ -294,6 +299,11 @@ class Points(Layer):
 
         # Save the point coordinates
         self._data = np.asarray(data)
+        # Over-allocated storage for coordinates and sizes that grows
+        # geometrically, so that adding points one at a time is amortized
+        # O(1) instead of copying all existing values on every call
+        self._data_buffer = None
+        self._size_buffer = None
 
         # Save the properties
         if properties is None:
@@ -418,6 +428,10 @@ class Points(Layer):
         data, _ = fix_data_points(data, self.ndim)
         cur_npoints = len(self._data)
         self._data = data
+        # data assigned from outside may be a slice of the buffer that is
+        # still visible to the user, so stop appending into it. add()
+        # restores the buffer after this setter returns.
+        self._data_buffer = None
 
         # Adjust the size array when the number of points has changed
         with self.events.blocker_all():
@@ -435,6 +449,9 @@ class Points(Layer):
                                 np.arange(len(data), len(self._face.colors))
                             )
                         self._size = self._size[: len(data)]
+                        # earlier references to size may still see the
+                        # dropped rows, so don't reuse them when growing
+                        self._size_buffer = None
 
                         for k in self.properties:
                             self.properties[k] = self.properties[k][
@@ -468,7 +485,13 @@ class Points(Layer):
                         self._edge._add(n_colors=adding)
                         self._face._add(n_colors=adding)
 
-                        self.size = np.concatenate((self._size, size), axis=0)
+                        # the new sizes already have the right shape, so
+                        # bypass the size setter, which would copy them
+                        # again and trigger a full refresh before the data
+                        # update below has finished
+                        self._size_buffer, self._size = _append_rows(
+                            self._size_buffer, self._size, size
+                        )
                         self.selected_data = set(
                             np.arange(cur_npoints, len(data))
                         )
@@ -654,6 +677,7 @@ class Points(Layer):
 
     @size.setter
     def size(self, size: Union[int, float, np.ndarray, list]) -> None:
+        self._size_buffer = None
         try:
             self._size = np.broadcast_to(size, self.data.shape).copy()
         except Exception:
@@ -1426,7 +1450,11 @@ class Points(Layer):
         ----------
         coord : sequence of indices to add point at
         """
-        self.data = np.append(self.data, np.atleast_2d(coord), axis=0)
+        buffer, data = _append_rows(
+            self._data_buffer, self._data, np.atleast_2d(coord)
+        )
+        self.data = data
+        self._data_buffer = buffer
 
     def remove_selected(self):
         """Removes selected points if any."""
@@ -1459,16 +1487,15 @@ class Points(Layer):
             Coordinates to move points to
         """
         if len(index) > 0:
-            index = list(index)
             disp = list(self._dims_displayed)
+            # build the fancy index once and reuse it for the read and write
+            ix = np.ix_(list(index), disp)
+            selected = self.data[ix]
+            center = selected.mean(axis=0)
+            position = np.asarray(coord)[disp]
             if self._drag_start is None:
-                center = self.data[np.ix_(index, disp)].mean(axis=0)
-                self._drag_start = np.array(coord)[disp] - center
-            center = self.data[np.ix_(index, disp)].mean(axis=0)
-            shift = np.array(coord)[disp] - center - self._drag_start
-            self.data[np.ix_(index, disp)] = (
-                self.data[np.ix_(index, disp)] + shift
-            )
+                self._drag_start = position - center
+            self.data[ix] = selected + (position - center - self._drag_start)
             self.refresh()
 
     def _paste_data(self):
@@ -1,6 +1,8 @@
 import sys
 from enum import auto
 
+import numpy as np
+
 from ...utils.misc import StringEnum
 from ._shapes_models import Ellipse, Line, Path, Polygon, Rectangle
 
@@ -54,9 +56,10 @@ class ColorMode(StringEnum):
 class Box:
     """Box: Constants associated with the vertices of the interaction box"""
 
-    WITH_HANDLE = [0, 1, 2, 3, 4, 5, 6, 7, 9]
-    LINE_HANDLE = [7, 6, 4, 2, 0, 7, 8]
-    LINE = [0, 2, 4, 6, 0]
+    # index arrays, so fancy indexing the box does not convert a list
+    WITH_HANDLE = np.array([0, 1, 2, 3, 4, 5, 6, 7, 9])
+    LINE_HANDLE = np.array([7, 6, 4, 2, 0, 7, 8])
+    LINE = np.array([0, 2, 4, 6, 0])
     TOP_LEFT = 0
     TOP_CENTER = 7
     LEFT_CENTER = 1
@@ -60,7 +60,6 @@ class Rectangle(Shape):
             data = find_corners(data)
 
         if len(data) != 4:
-            print(data)
             raise ValueError(
                 trans._(
                     "Data shape does not match a rectangle. Rectangle expects four corner vertices, {number} provided.",
@@ -3,6 +3,7 @@
 Async/octree has its own little JSON config file. This is temporary
 until napari has a system-wide one.
 """
+import copy
 import json
 import logging
 import os
@@ -48,7 +49,7 @@ def _get_async_config() -> Optional[dict]:
 
     # If NAPARI_ASYNC is "1" use defaults but with octree disabled.
     if async_var == "1":
-        async_config = DEFAULT_OCTREE_CONFIG.copy()
+        async_config = copy.deepcopy(DEFAULT_OCTREE_CONFIG)
         async_config['octree']['enabled'] = False
         return async_config
 
@@ -56,6 +57,37 @@ def _get_async_config() -> Optional[dict]:
     return None
 
 
+def _apply_num_workers(config: Optional[dict]) -> Optional[dict]:
+    """Override the number of loader workers with NAPARI_ASYNC_WORKERS.
+
+    Parameters
+    ----------
+    config : Optional[dict]
+        The config to modify in place, or None if async is not enabled.
+
+    Returns
+    -------
+    Optional[dict]
+        The same config, with every loader using the requested number of
+        workers if NAPARI_ASYNC_WORKERS is set.
+    """
+    workers_var = os.getenv("NAPARI_ASYNC_WORKERS")
+    if config is None or workers_var is None:
+        return config
+
+    num_workers = int(workers_var)
+    if num_workers < 1:
+        raise ValueError('NAPARI_ASYNC_WORKERS must be a positive integer')
+
+    LOGGER.info("Using %d loader workers", num_workers)
+    if 'loader_defaults' in config:
+        config['loader_defaults']['num_workers'] = num_workers
+    loaders = config.get('octree', {}).get('loaders', {})
+    for loader_config in loaders.values():
+        loader_config['num_workers'] = num_workers
+    return config
+
+
 def get_octree_config() -> dict:
     """Return the config data from the user's file or the default data.
 
@@ -69,13 +101,13 @@ def get_octree_config() -> dict:
     # If NAPARI_OCTREE is not enabled, defer to NAPARI_ASYNC
     if octree_var in [None, "0"]:
         # This will return DEFAULT_ASYNC_CONFIG or None.
-        return _get_async_config()
+        return _apply_num_workers(_get_async_config())
 
     # If NAPARI_OCTREE is "1" then use default config.
     if octree_var == "1":
-        return DEFAULT_OCTREE_CONFIG
+        return _apply_num_workers(copy.deepcopy(DEFAULT_OCTREE_CONFIG))
 
     # NAPARI_OCTREE should be a config file path
     path = Path(octree_var).expanduser()
     with path.open() as infile:
-        return json.load(infile)
+        return _apply_num_workers(json.load(infile))
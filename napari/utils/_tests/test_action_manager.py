@@ -0,0 +1,28 @@
+import gc
+import weakref
+
+from ..action_manager import ActionManager
+
+
+class Owner:
+    def __init__(self):
+        self.calls = 0
+
+    def bump(self):
+        self.calls += 1
+
+
+def test_action_does_not_keep_owner_alive():
+    """Test a bound method's owner is collectable once its action is gone."""
+    action_manager = ActionManager()
+    owner = Owner()
+    action_manager.register_action(
+        'napari:bump', owner.bump, 'bump the counter', None
+    )
+    action_manager._actions['napari:bump'].callable(action_manager.context)()
+    assert owner.calls == 1
+
+    ref = weakref.ref(owner)
+    del owner, action_manager
+    gc.collect()
+    assert ref() is None
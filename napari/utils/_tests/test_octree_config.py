@@ -0,0 +1,34 @@
+import pytest
+
+from napari.utils._octree import DEFAULT_OCTREE_CONFIG, get_octree_config
+
+
+def test_async_config_does_not_modify_defaults(monkeypatch):
+    monkeypatch.delenv("NAPARI_OCTREE", raising=False)
+    monkeypatch.setenv("NAPARI_ASYNC", "1")
+    config = get_octree_config()
+    assert config['octree']['enabled'] is False
+    assert DEFAULT_OCTREE_CONFIG['octree']['enabled'] is True
+
+
+@pytest.mark.parametrize(
+    'env', [("NAPARI_ASYNC", "1"), ("NAPARI_OCTREE", "1")]
+)
+def test_async_workers(monkeypatch, env):
+    monkeypatch.delenv("NAPARI_OCTREE", raising=False)
+    monkeypatch.delenv("NAPARI_ASYNC", raising=False)
+    monkeypatch.setenv(*env)
+    monkeypatch.setenv("NAPARI_ASYNC_WORKERS", "3")
+    config = get_octree_config()
+    assert config['loader_defaults']['num_workers'] == 3
+    for loader_config in config['octree']['loaders'].values():
+        assert loader_config['num_workers'] == 3
+    assert DEFAULT_OCTREE_CONFIG['loader_defaults']['num_workers'] == 10
+
+
+def test_async_workers_invalid(monkeypatch):
+    monkeypatch.delenv("NAPARI_OCTREE", raising=False)
+    monkeypatch.setenv("NAPARI_ASYNC", "1")
+    monkeypatch.setenv("NAPARI_ASYNC_WORKERS", "0")
+    with pytest.raises(ValueError):
+        get_octree_config()
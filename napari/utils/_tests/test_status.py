@@ -22,6 +22,10 @@ NUMERIC = [
 NUMERIC_FORMATTED = (
     "[1, 10, 100, 1000, 1e+06, -6.28, 124, 1.12e+03, 6.28, 2.72]"
 )
+NUMERIC_ARRAY = np.array([1, 10, 100, 1000, 1e6, -6.283, 2 * np.pi])
+NUMERIC_ARRAY_FORMATTED = "[1, 10, 100, 1e+03, 1e+06, -6.28, 6.28]"
+INT_ARRAY = np.array([0, 128, 255], dtype=np.uint8)
+INT_ARRAY_FORMATTED = "[0, 128, 255]"
 COMBINED = [1e6, MISSING, STRING]
 COMBINED_FORMATTED = f"[1e+06, {MISSING_FORMATTED}, {STRING_FORMATTED}]"
 
@@ -33,6 +37,8 @@ COMBINED_FORMATTED = f"[1e+06, {MISSING_FORMATTED}, {STRING_FORMATTED}]"
         [STRING, STRING_FORMATTED],
         [MISSING, MISSING_FORMATTED],
         [COMBINED, COMBINED_FORMATTED],
+        [NUMERIC_ARRAY, NUMERIC_ARRAY_FORMATTED],
+        [INT_ARRAY, INT_ARRAY_FORMATTED],
     ],
 )
 def test_status_format(input, expected):
@@ -15,7 +15,16 @@ if TYPE_CHECKING:
     from napari.qt import QtStateButton
 
 
-def call_with_context(function, context):
+def _context_keys(function) -> List[str]:
+    """Return the names of the parameters `function` may take from context."""
+    return [
+        k
+        for k, v in signature(function).parameters.items()
+        if v.kind not in (v.VAR_POSITIONAL, v.VAR_KEYWORD)
+    ]
+
+
+def call_with_context(function, context, context_keys=None):
     """
     call function `function` with the corresponding value taken from context
 
@@ -31,13 +40,13 @@ def call_with_context(function, context):
     the action manager, and anything can tell the action manager "this is the
     current instance a key". When an action is triggered; we inspect the
     signature look at which instances it may need and pass this as parameters.
-    """
 
-    context_keys = [
-        k
-        for k, v in signature(function).parameters.items()
-        if v.kind not in (v.VAR_POSITIONAL, v.VAR_KEYWORD)
-    ]
+    inspect.signature is slow, so callers that call the same function
+    repeatedly (e.g. on every key press) can pass `context_keys`, as returned
+    by `_context_keys`, to skip it.
+    """
+    if context_keys is None:
+        context_keys = _context_keys(function)
     ctx = {k: v for k, v in context.items() if k in context_keys}
     return function(**ctx)
 
@@ -50,8 +59,9 @@ class Action:
 
     def callable(self, context):
         if not hasattr(self, '_command_with_context'):
+            context_keys = _context_keys(self.command)
             self._command_with_context = lambda: call_with_context(
-                self.command, context
+                self.command, context, context_keys
             )
         return self._command_with_context
 
@@ -29,6 +29,9 @@ GUI thread.
 
 Set NAPARI_ASYNC=1 to turn on async loading with default settings.
 
+Set NAPARI_ASYNC_WORKERS to bound the number of loader worker threads (or
+processes) used by every loader pool, for both async and octree loading.
+
 Octree Rendering
 ----------------
 Image layers use an octree for rendering. The octree organizes the image
@@ -554,6 +554,10 @@ class EventEmitter:
                 self._block_counter.update([None])
                 return event
 
+            # bind these once rather than looking them up for every callback
+            is_blocked = blocked.get
+            invoke = self._invoke_callback
+
             rem: List[CallbackRef] = []
             for cb in self._callbacks[:]:
                 if isinstance(cb, tuple):
@@ -566,11 +570,11 @@ class EventEmitter:
                         continue
                     cb = cast(Callback, cb)
 
-                if blocked.get(cb, 0) > 0:
+                if is_blocked(cb, 0) > 0:
                     self._block_counter.update([cb])
                     continue
 
-                self._invoke_callback(cb, event)
+                invoke(cb, event)
                 if event.blocked:
                     break
 
@@ -2,6 +2,10 @@ from collections.abc import Iterable
 
 import numpy as np
 
+# plain isinstance checks are much cheaper than np.issubdtype, and this is
+# called for every element of a value on every mouse move
+_FLOAT_TYPES = (float, np.floating)
+
 
 def format_float(value):
     """Nice float formatting into strings."""
@@ -30,15 +34,23 @@ def status_format(value):
     """
     if isinstance(value, str):
         return value
+    if (
+        isinstance(value, np.ndarray)
+        and value.ndim == 1
+        and value.dtype.kind in 'iuf'
+    ):
+        # numeric 1D arrays (e.g. RGB values) are the common case when
+        # hovering over an image, so pick the formatter once from the dtype
+        # instead of dispatching on the type of every element
+        fmt = format_float if value.dtype.kind == 'f' else str
+        return '[' + ', '.join(map(fmt, value.tolist())) + ']'
     if isinstance(value, Iterable):
         # FIMXE: use an f-string?
         return '[' + str.join(', ', [status_format(v) for v in value]) + ']'
     if value is None:
         return ''
-    if isinstance(value, float) or np.issubdtype(type(value), np.floating):
+    if isinstance(value, _FLOAT_TYPES):
         return format_float(value)
-    elif isinstance(value, int) or np.issubdtype(type(value), np.integer):
-        return str(value)
     else:
         return str(value)
 
@@ -62,15 +74,15 @@ def generate_layer_status(name, position, value):
     """
     full_coord = np.round(position).astype(int)
 
-    msg = f'{name} {full_coord}'
-
-    if value is not None:
-        if isinstance(value, tuple) and value != (None, None):
-            # it's a multiscale -> value = (data_level, value)
-            msg += f': {status_format(value[0])}'
-            if value[1] is not None:
-                msg += f', {status_format(value[1])}'
-        else:
-            # it's either a grayscale or rgb image (scalar or list)
-            msg += f': {status_format(value)}'
-    return msg
+    if value is None:
+        return f'{name} {full_coord}'
+    if isinstance(value, tuple) and value != (None, None):
+        # it's a multiscale -> value = (data_level, value)
+        if value[1] is None:
+            return f'{name} {full_coord}: {status_format(value[0])}'
+        return (
+            f'{name} {full_coord}: {status_format(value[0])}, '
+            f'{status_format(value[1])}'
+        )
+    # it's either a grayscale or rgb image (scalar or list)
+    return f'{name} {full_coord}: {status_format(value)}'